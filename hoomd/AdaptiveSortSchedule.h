@@ -0,0 +1,187 @@
+// Copyright (c) 2009-2021 The Regents of the University of Michigan
+// This file is part of the HOOMD-blue project, released under the BSD 3-Clause License.
+
+/*! \file AdaptiveSortSchedule.h
+    \brief Declares the AdaptiveSortSchedule class
+*/
+
+#ifdef __HIPCC__
+#error This header cannot be compiled by nvcc
+#endif
+
+#ifndef __ADAPTIVE_SORT_SCHEDULE_H__
+#define __ADAPTIVE_SORT_SCHEDULE_H__
+
+#include "ClockSource.h"
+
+#include <functional>
+#include <stdint.h>
+
+//! Decide when to sort particles from the measured wall clock time per step
+/*! Sorting restores the memory locality of the particles, which then decays as the particles move and slowly
+    increases the time per step. Sorting at a step n steps after the previous sort costs, averaged over those steps,
+
+        A(n) = (S + C(n)) / n
+
+    where S is the time the previous sort took and C(n) is the time taken by the n steps since. A(n) is minimal at the
+    step where the time per step first exceeds A(n), so the schedule sorts as soon as a smoothed time per step is larger
+    than the running average (or after max_candidates candidate steps).
+
+    The owner calls shouldSort() on the candidate steps (e.g. every step, or every collision step) and brackets each
+    sort with beginSort() and endSort() so that the time spent sorting is not counted as time per step. The first
+    candidate always sorts to measure S. In MPI simulations, the owner must reduce the decision over all ranks.
+
+    \ingroup utils
+*/
+class AdaptiveSortSchedule
+    {
+    public:
+        //! Constructor
+        /*! \param max_candidates Maximum number of candidate steps between sorts
+        */
+        AdaptiveSortSchedule(unsigned int max_candidates = 1000)
+            : m_max_candidates(max_candidates)
+            {
+            reset();
+            }
+
+        //! Forget all measurements and sort at the next candidate
+        void reset()
+            {
+            m_has_sorted = false;
+            m_last_time = 0;
+            m_last_step = 0;
+            m_sort_start = 0;
+            m_sort_time = 0.0;
+            m_cycle_time = 0.0;
+            m_cycle_steps = 0;
+            m_n_candidates = 0;
+            m_step_time = 0.0;
+            m_cycle_cost = 0.0;
+            m_last_interval = 0;
+            m_has_cycle_cost = false;
+            }
+
+        //! Decide whether to sort at a candidate step
+        /*! \param timestep Current time step
+            \returns true when the particles should be sorted now
+        */
+        bool shouldSort(uint64_t timestep)
+            {
+            int64_t now = getTime();
+            int64_t elapsed = now - m_last_time;
+            uint64_t n_steps = timestep > m_last_step ? timestep - m_last_step : 0;
+            m_last_time = now;
+            m_last_step = timestep;
+            m_has_cycle_cost = false;
+
+            if (!m_has_sorted)
+                return true;
+
+            // the time step did not advance (e.g. the state was reset to an earlier step), nothing to measure
+            if (n_steps == 0)
+                return false;
+
+            double step_time = double(elapsed) * 1e-9 / double(n_steps);
+            m_cycle_time += double(elapsed) * 1e-9;
+            m_cycle_steps += n_steps;
+
+            // smooth out the noise of the individual measurements
+            const double smoothing = 0.25;
+            if (m_n_candidates == 0)
+                m_step_time = step_time;
+            else
+                m_step_time = smoothing * step_time + (1.0 - smoothing) * m_step_time;
+            m_n_candidates++;
+
+            double average = (m_sort_time + m_cycle_time) / double(m_cycle_steps);
+            if (m_step_time > average || m_n_candidates >= m_max_candidates)
+                {
+                // the cycle since the previous sort is complete
+                m_cycle_cost = average;
+                m_last_interval = m_cycle_steps;
+                m_has_cycle_cost = true;
+                return true;
+                }
+            return false;
+            }
+
+        //! Notify the schedule that a sort starts
+        void beginSort()
+            {
+            m_sort_start = getTime();
+            }
+
+        //! Notify the schedule that a sort has finished
+        void endSort()
+            {
+            int64_t now = getTime();
+            m_sort_time = double(now - m_sort_start) * 1e-9;
+            m_last_time = now;
+            m_cycle_time = 0.0;
+            m_cycle_steps = 0;
+            m_n_candidates = 0;
+            m_has_sorted = true;
+            }
+
+        //! Check if the last call to shouldSort() completed a sort cycle
+        bool hasCycleCost() const
+            {
+            return m_has_cycle_cost;
+            }
+
+        //! Get the average wall clock time per step (in seconds) of the last complete sort cycle
+        double getCycleCost() const
+            {
+            return m_cycle_cost;
+            }
+
+        //! Get the number of steps between the last two sorts
+        uint64_t getLastInterval() const
+            {
+            return m_last_interval;
+            }
+
+        //! Set the maximum number of candidate steps between sorts
+        void setMaxCandidates(unsigned int max_candidates)
+            {
+            m_max_candidates = max_candidates;
+            }
+
+        //! Replace the wall clock
+        /*! \param time_source Function that returns the current time in nanoseconds, or an empty function to use the
+                wall clock again
+
+            Unit tests use this to drive the schedule with controlled step times.
+        */
+        void setTimeSource(std::function<int64_t ()> time_source)
+            {
+            m_time_source = time_source;
+            }
+
+    private:
+        ClockSource m_clock;            //!< Wall clock
+        std::function<int64_t ()> m_time_source;    //!< Replaces the wall clock when set
+        unsigned int m_max_candidates;  //!< Maximum number of candidate steps between sorts
+
+        bool m_has_sorted;              //!< True after the first sort
+        int64_t m_last_time;            //!< Time of the last candidate step or sort (ns)
+        uint64_t m_last_step;           //!< Last candidate step
+        int64_t m_sort_start;           //!< Time the current sort started (ns)
+        double m_sort_time;             //!< Duration of the previous sort (s)
+        double m_cycle_time;            //!< Time since the previous sort, excluding the sort (s)
+        uint64_t m_cycle_steps;         //!< Number of steps since the previous sort
+        unsigned int m_n_candidates;    //!< Number of candidate steps since the previous sort
+        double m_step_time;             //!< Moving average of the time per step (s)
+        double m_cycle_cost;            //!< Average time per step of the last complete cycle (s)
+        uint64_t m_last_interval;       //!< Number of steps between the last two sorts
+        bool m_has_cycle_cost;          //!< True when the last shouldSort() completed a cycle
+
+        //! Get the current time (ns)
+        int64_t getTime() const
+            {
+            return m_time_source ? m_time_source() : m_clock.getTime();
+            }
+    };
+
+#endif
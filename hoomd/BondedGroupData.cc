@@ -14,6 +14,8 @@
 
 #include <pybind11/numpy.h>
 
+#include <algorithm>
+
 #ifdef ENABLE_HIP
 #include "BondedGroupData.cuh"
 #include "CachedAllocator.h"
@@ -1190,6 +1192,166 @@ void BondedGroupData<group_size, Group, name, has_type_mapping>::moveParticleGro
     m_group_num_change_signal.emit();
     notifyGroupReorder();
     }
+
+/*! \param departures Tags (x) and new ranks (y) of the local particles that moved to other domains
+
+    Every rank that owns a member of a group holds the group. After particles moved, each rank sends the groups of its
+    departed particles to their new ranks in a single all-to-all exchange and then drops the groups that no longer
+    have local members. Group tags are preserved. Unlike moveParticleGroups(), the cost scales with the number of
+    groups of the moved particles, and observers are notified once. All ranks must call this method, after the
+    particles have been added to their new ranks.
+*/
+template<unsigned int group_size, typename Group, const char *name, bool has_type_mapping>
+void BondedGroupData<group_size, Group, name, has_type_mapping>::migrateParticleGroups(
+    const std::vector<uint2>& departures)
+    {
+    const MPI_Comm mpi_comm = m_exec_conf->getMPICommunicator();
+    unsigned int n_ranks = m_exec_conf->getNRanks();
+
+    // a group and its properties
+    struct group_element
+        {
+        unsigned int tag;
+        members_t members;
+        typeval_t typeval;
+        };
+
+        {
+        // wipe out reverse-lookup tag -> idx for ghost groups before removing them
+        ArrayHandle<unsigned int> h_group_tag(m_group_tag, access_location::host, access_mode::read);
+        ArrayHandle<unsigned int> h_group_rtag(m_group_rtag, access_location::host, access_mode::readwrite);
+        for (unsigned int i = 0; i < m_n_ghost; ++i)
+            h_group_rtag.data[h_group_tag.data[m_n_groups + i]] = GROUP_NOT_LOCAL;
+        }
+    removeAllGhostGroups();
+
+    std::map<unsigned int, unsigned int> new_rank;
+    for (const uint2& departure : departures)
+        new_rank[departure.x] = departure.y;
+
+    // send each group of a departed particle once to every new rank of its members
+    std::vector< std::vector<group_element> > send_groups(n_ranks);
+    if (!new_rank.empty())
+        {
+        ArrayHandle<members_t> h_groups(m_groups, access_location::host, access_mode::read);
+        ArrayHandle<typeval_t> h_typeval(m_group_typeval, access_location::host, access_mode::read);
+        ArrayHandle<unsigned int> h_group_tag(m_group_tag, access_location::host, access_mode::read);
+        for (unsigned int group_idx = 0; group_idx < m_n_groups; ++group_idx)
+            {
+            group_element element;
+            element.tag = h_group_tag.data[group_idx];
+            element.members = h_groups.data[group_idx];
+            element.typeval = h_typeval.data[group_idx];
+
+            unsigned int dest[group_size];
+            unsigned int n_dest = 0;
+            for (unsigned int i = 0; i < group_size; ++i)
+                {
+                auto it = new_rank.find(element.members.tag[i]);
+                if (it == new_rank.end() || std::find(dest, dest + n_dest, it->second) != dest + n_dest)
+                    continue;
+                dest[n_dest++] = it->second;
+                send_groups[it->second].push_back(element);
+                }
+            }
+        }
+
+    std::vector<int> send_counts(n_ranks, 0);
+    std::vector<int> send_displs(n_ranks, 0);
+    std::vector<group_element> send;
+    for (unsigned int rank = 0; rank < n_ranks; ++rank)
+        {
+        send_counts[rank] = (int)send_groups[rank].size();
+        send_displs[rank] = (int)send.size();
+        send.insert(send.end(), send_groups[rank].begin(), send_groups[rank].end());
+        }
+
+    std::vector<int> recv_counts(n_ranks, 0);
+    std::vector<int> recv_displs(n_ranks, 0);
+    MPI_Alltoall(&send_counts.front(), 1, MPI_INT, &recv_counts.front(), 1, MPI_INT, mpi_comm);
+    for (unsigned int rank = 1; rank < n_ranks; rank++)
+        recv_displs[rank] = recv_displs[rank-1] + recv_counts[rank-1];
+    std::vector<group_element> recv(recv_displs[n_ranks-1] + recv_counts[n_ranks-1]);
+
+    MPI_Datatype element_type;
+    MPI_Type_contiguous(sizeof(group_element), MPI_BYTE, &element_type);
+    MPI_Type_commit(&element_type);
+    MPI_Alltoallv(send.data(),
+                  &send_counts.front(),
+                  &send_displs.front(),
+                  element_type,
+                  recv.data(),
+                  &recv_counts.front(),
+                  &recv_displs.front(),
+                  element_type,
+                  mpi_comm);
+    MPI_Type_free(&element_type);
+
+    // append the received groups that are not local yet
+    std::vector<group_element> add;
+        {
+        ArrayHandle<unsigned int> h_group_rtag(m_group_rtag, access_location::host, access_mode::readwrite);
+        for (const group_element& element : recv)
+            {
+            if (h_group_rtag.data[element.tag] != GROUP_NOT_LOCAL)
+                continue;
+            h_group_rtag.data[element.tag] = m_n_groups + (unsigned int)add.size();
+            add.push_back(element);
+            }
+        }
+
+    unsigned int n_old = m_n_groups;
+    addGroups((unsigned int)add.size());
+
+    unsigned int n_remove = 0;
+        {
+        ArrayHandle<members_t> h_groups(m_groups, access_location::host, access_mode::readwrite);
+        ArrayHandle<typeval_t> h_typeval(m_group_typeval, access_location::host, access_mode::readwrite);
+        ArrayHandle<ranks_t> h_group_ranks(m_group_ranks, access_location::host, access_mode::readwrite);
+        ArrayHandle<unsigned int> h_group_tag(m_group_tag, access_location::host, access_mode::readwrite);
+        ArrayHandle<unsigned int> h_group_rtag(m_group_rtag, access_location::host, access_mode::readwrite);
+        ArrayHandle<unsigned int> h_rtag(m_pdata->getRTags(), access_location::host, access_mode::read);
+
+        for (unsigned int i = 0; i < add.size(); ++i)
+            {
+            h_groups.data[n_old + i] = add[i].members;
+            h_typeval.data[n_old + i] = add[i].typeval;
+            h_group_tag.data[n_old + i] = add[i].tag;
+            for (unsigned int j = 0; j < group_size; ++j)
+                h_group_ranks.data[n_old + i].idx[j] = 0;
+            }
+
+        // compact the groups that still have local members
+        unsigned int n_keep = 0;
+        for (unsigned int group_idx = 0; group_idx < m_n_groups; ++group_idx)
+            {
+            bool is_local = false;
+            for (unsigned int i = 0; i < group_size; ++i)
+                if (h_rtag.data[h_groups.data[group_idx].tag[i]] < m_pdata->getN())
+                    is_local = true;
+
+            unsigned int group_tag = h_group_tag.data[group_idx];
+            if (!is_local)
+                {
+                h_group_rtag.data[group_tag] = GROUP_NOT_LOCAL;
+                continue;
+                }
+
+            h_groups.data[n_keep] = h_groups.data[group_idx];
+            h_typeval.data[n_keep] = h_typeval.data[group_idx];
+            h_group_ranks.data[n_keep] = h_group_ranks.data[group_idx];
+            h_group_tag.data[n_keep] = group_tag;
+            h_group_rtag.data[group_tag] = n_keep;
+            n_keep++;
+            }
+        n_remove = m_n_groups - n_keep;
+        }
+    removeGroups(n_remove);
+
+    // the communicator refreshes the ranks of the group members when the groups changed
+    m_group_num_change_signal.emit();
+    notifyGroupReorder();
+    }
 #endif
 
 template<class T, typename Group>
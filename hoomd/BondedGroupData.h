@@ -615,6 +615,11 @@ class BondedGroupData
             m_groups_dirty = true;
             }
 
+        #ifdef ENABLE_MPI
+        //! Move the bonded groups of many particles that moved between domains
+        void migrateParticleGroups(const std::vector<uint2>& departures);
+        #endif
+
     protected:
         #ifdef ENABLE_MPI
         //! Helper function to transfer bonded groups connected to a single particle
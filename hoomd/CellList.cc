@@ -12,6 +12,7 @@
 #include "Communicator.h"
 
 #include <algorithm>
+#include <typeinfo>
 
 using namespace std;
 namespace py = pybind11;
@@ -643,6 +644,37 @@ uint3 CellList::readConditions()
     return *h_conditions.data;
     }
 
+/*! \param other Cell list requested by a consumer
+    \param width_tolerance Relative amount by which the cells in this list may be wider than those requested
+
+    This cell list can stand in for \a other when both are of the same type, bin the same per-particle data in the same
+    way, and the cells in this list are at least as wide as those in \a other but no wider than
+    (1 + \a width_tolerance) times that width. Wider cells still contain all neighbors within the requested width, at
+    the cost of more distance checks for the consumer.
+
+    The communicator is not compared: all operations on one SystemDefinition use the same communicator, which
+    consumers may set only after they request their cell list.
+*/
+bool CellList::isCompatible(const CellList& other, Scalar width_tolerance) const
+    {
+    if (typeid(*this) != typeid(other))
+        return false;
+
+    return m_radius == other.m_radius
+        && m_compute_xyzf == other.m_compute_xyzf
+        && m_compute_tdb == other.m_compute_tdb
+        && m_compute_orientation == other.m_compute_orientation
+        && m_compute_idx == other.m_compute_idx
+        && m_flag_charge == other.m_flag_charge
+        && m_flag_type == other.m_flag_type
+        && m_multiple == other.m_multiple
+        && m_sort_cell_list == other.m_sort_cell_list
+        && m_compute_adj_list == other.m_compute_adj_list
+        && getPerDevice() == other.getPerDevice()
+        && m_nominal_width >= other.m_nominal_width
+        && m_nominal_width <= other.m_nominal_width * (Scalar(1.0) + width_tolerance);
+    }
+
 void export_CellList(py::module& m)
     {
     py::class_<CellList, Compute, std::shared_ptr<CellList> >(m,"CellList")
@@ -236,6 +236,9 @@ class PYBIND11_EXPORT CellList : public Compute
             return m_nominal_width;
             }
 
+        //! Test whether this cell list can stand in for another
+        virtual bool isCompatible(const CellList& other, Scalar width_tolerance) const;
+
         //! Get the dimensions of the cell list
         const uint3& getDim() const
             {
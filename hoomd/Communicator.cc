@@ -1078,6 +1078,7 @@ Communicator::Communicator(std::shared_ptr<SystemDefinition> sysdef,
             m_nettorque_copybuf(m_exec_conf),
             m_netvirial_copybuf(m_exec_conf),
             m_netvirial_recvbuf(m_exec_conf),
+            m_scalar_copybuf(m_exec_conf),
             m_plan(m_exec_conf),
             m_plan_reverse(m_exec_conf),
             m_tag_reverse(m_exec_conf),
@@ -2821,6 +2822,75 @@ void Communicator::updateNetForce(uint64_t timestep)
             m_prof->pop();
     }
 
+void Communicator::updateGhostScalars(GlobalArray<Scalar>& data)
+    {
+    assert(data.getNumElements() >= m_pdata->getN() + m_pdata->getNGhosts());
+
+    if (m_prof)
+        m_prof->push("comm_ghost_scalar");
+
+    m_exec_conf->msg->notice(7) << "Communicator: update ghost scalars" << std::endl;
+
+    unsigned int num_tot_recv_ghosts = 0; // total number of ghosts received
+
+    for (unsigned int dir = 0; dir < 6; dir ++)
+        {
+        if (! isCommunicating(dir) ) continue;
+
+        m_scalar_copybuf.resize(m_num_copy_ghosts[dir]);
+
+            {
+            ArrayHandle<Scalar> h_data(data, access_location::host, access_mode::read);
+            ArrayHandle<Scalar> h_scalar_copybuf(m_scalar_copybuf, access_location::host, access_mode::overwrite);
+            ArrayHandle<unsigned int> h_copy_ghosts(m_copy_ghosts[dir], access_location::host, access_mode::read);
+            ArrayHandle<unsigned int> h_rtag(m_pdata->getRTags(), access_location::host, access_mode::read);
+
+            // ghosts received in a previous direction may be forwarded, they already hold current values
+            for (unsigned int ghost_idx = 0; ghost_idx < m_num_copy_ghosts[dir]; ghost_idx++)
+                {
+                unsigned int idx = h_rtag.data[h_copy_ghosts.data[ghost_idx]];
+
+                assert(idx < m_pdata->getN() + m_pdata->getNGhosts());
+
+                h_scalar_copybuf.data[ghost_idx] = h_data.data[idx];
+                }
+            }
+
+        unsigned int send_neighbor = m_decomposition->getNeighborRank(dir);
+
+        // we receive from the direction opposite to the one we send to
+        unsigned int recv_neighbor;
+        if (dir % 2 == 0)
+            recv_neighbor = m_decomposition->getNeighborRank(dir+1);
+        else
+            recv_neighbor = m_decomposition->getNeighborRank(dir-1);
+
+        unsigned int start_idx = m_pdata->getN() + num_tot_recv_ghosts;
+        num_tot_recv_ghosts += m_num_recv_ghosts[dir];
+
+        if (m_prof)
+            m_prof->push("MPI send/recv");
+
+            {
+            m_reqs.resize(2);
+            m_stats.resize(2);
+
+            ArrayHandle<Scalar> h_data(data, access_location::host, access_mode::readwrite);
+            ArrayHandle<Scalar> h_scalar_copybuf(m_scalar_copybuf, access_location::host, access_mode::read);
+
+            // write directly into the ghost elements of the array
+            MPI_Isend(h_scalar_copybuf.data, (unsigned int)(m_num_copy_ghosts[dir]*sizeof(Scalar)), MPI_BYTE, send_neighbor, 1, m_mpi_comm, &m_reqs[0]);
+            MPI_Irecv(h_data.data + start_idx, (unsigned int)(m_num_recv_ghosts[dir]*sizeof(Scalar)), MPI_BYTE, recv_neighbor, 1, m_mpi_comm, &m_reqs[1]);
+            MPI_Waitall(2, &m_reqs.front(), &m_stats.front());
+            }
+
+        if (m_prof)
+            m_prof->pop(0, (m_num_recv_ghosts[dir]+m_num_copy_ghosts[dir])*sizeof(Scalar));
+        } // end dir loop
+
+    if (m_prof)
+        m_prof->pop();
+    }
 
 void Communicator::removeGhostParticleTags()
     {
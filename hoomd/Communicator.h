@@ -323,6 +323,20 @@ class PYBIND11_EXPORT Communicator
          */
         virtual void updateNetForce(uint64_t timestep);
 
+        /*! Communicate a per-particle scalar to the ghost particles
+         *
+         * Force computes that evaluate a per-particle quantity in one pass and need it on the ghost
+         * particles in a later pass (such as the derivative of the embedding function in EAM) call this
+         * method in between. The ghosts are filled in the same order as the ghost particle data.
+         *
+         * \param data Array with one element per local and ghost particle, indexed like the particle data.
+         *
+         * \pre The ghost exchange list has been constructed with exchangeGhosts() since the last particle
+         *      sort or migration.
+         * \post The elements of \a data that belong to ghost particles hold the values of their owners.
+         */
+        virtual void updateGhostScalars(GlobalArray<Scalar>& data);
+
         /*! This methods finds all the particles that are no longer inside the domain
          * boundaries and transfers them to neighboring processors.
          *
@@ -491,6 +505,7 @@ class PYBIND11_EXPORT Communicator
         GlobalVector<Scalar4> m_nettorque_copybuf;   //!< Buffer for net torque
         GlobalVector<Scalar> m_netvirial_copybuf;   //!< Buffer for net virial
         GlobalVector<Scalar> m_netvirial_recvbuf;   //!< Buffer for net virial (receive)
+        GlobalVector<Scalar> m_scalar_copybuf;      //!< Buffer for per-particle scalars sent to ghosts
 
         GlobalVector<unsigned int> m_copy_ghosts[6]; //!< Per-direction list of indices of particles to send as ghosts
         unsigned int m_num_copy_ghosts[6];       //!< Number of local particles that are sent to neighboring processors
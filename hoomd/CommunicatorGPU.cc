@@ -133,6 +133,12 @@ void CommunicatorGPU::allocateBuffers()
     GlobalVector<Scalar4> netforce_ghost_recvbuf(m_exec_conf);
     m_netforce_ghost_recvbuf.swap(netforce_ghost_recvbuf);
 
+    GlobalVector<Scalar> scalar_ghost_sendbuf(m_exec_conf);
+    m_scalar_ghost_sendbuf.swap(scalar_ghost_sendbuf);
+
+    GlobalVector<Scalar> scalar_ghost_recvbuf(m_exec_conf);
+    m_scalar_ghost_recvbuf.swap(scalar_ghost_recvbuf);
+
     GlobalVector<Scalar4> nettorque_ghost_sendbuf(m_exec_conf);
     m_nettorque_ghost_sendbuf.swap(nettorque_ghost_sendbuf);
 
@@ -3097,6 +3103,128 @@ void CommunicatorGPU::updateNetForce(uint64_t timestep)
     if (m_prof) m_prof->pop(m_exec_conf);
     }
 
+void CommunicatorGPU::updateGhostScalars(GlobalArray<Scalar>& data)
+    {
+    assert(data.getNumElements() >= m_pdata->getN() + m_pdata->getNGhosts());
+
+    m_exec_conf->msg->notice(7) << "CommunicatorGPU: update ghost scalars" << std::endl;
+
+    if (m_prof) m_prof->push(m_exec_conf, "comm_ghost_scalar");
+
+    // main communication loop
+    for (unsigned int stage = 0; stage < m_num_stages; ++stage)
+        {
+        // compute maximum send buf size
+        unsigned int n_max = 0;
+        for (unsigned int istage = 0; istage <= stage; ++istage)
+            if (m_n_send_ghosts_tot[istage] > n_max) n_max = m_n_send_ghosts_tot[istage];
+
+        m_scalar_ghost_sendbuf.resize(n_max);
+
+            {
+            ArrayHandle<Scalar> d_data(data, access_location::device, access_mode::read);
+            ArrayHandle<uint2> d_ghost_idx_adj(m_ghost_idx_adj, access_location::device, access_mode::read);
+            ArrayHandle<Scalar> d_scalar_ghost_sendbuf(m_scalar_ghost_sendbuf, access_location::device, access_mode::overwrite);
+
+            // Pack ghosts into send buffers
+            gpu_exchange_ghosts_pack_scalar(
+                m_n_send_ghosts_tot[stage],
+                d_ghost_idx_adj.data + m_idx_offs[stage],
+                d_data.data,
+                d_scalar_ghost_sendbuf.data);
+
+            if (m_exec_conf->isCUDAErrorCheckingEnabled()) CHECK_CUDA_ERROR();
+            }
+
+        n_max = 0;
+        // compute maximum number of received ghosts
+        for (unsigned int istage = 0; istage <= stage; ++istage)
+            if (m_n_recv_ghosts_tot[istage] > n_max) n_max = m_n_recv_ghosts_tot[istage];
+
+        m_scalar_ghost_recvbuf.resize(n_max);
+
+        // first ghost ptl index
+        unsigned int first_idx = m_pdata->getN();
+
+        // total up ghosts received thus far
+        for (unsigned int istage = 0; istage < stage; ++istage)
+            {
+            first_idx += m_n_recv_ghosts_tot[istage];
+            }
+
+            {
+            unsigned int offs = 0;
+            ArrayHandle<Scalar> h_scalar_ghost_recvbuf(m_scalar_ghost_recvbuf, access_location::host, access_mode::overwrite);
+            ArrayHandle<Scalar> h_scalar_ghost_sendbuf(m_scalar_ghost_sendbuf, access_location::host, access_mode::read);
+
+            ArrayHandleAsync<unsigned int> h_unique_neighbors(m_unique_neighbors, access_location::host, access_mode::read);
+            ArrayHandleAsync<unsigned int> h_ghost_begin(m_ghost_begin, access_location::host, access_mode::read);
+
+            if (m_prof) m_prof->push(m_exec_conf, "MPI send/recv");
+
+            m_reqs.clear();
+            MPI_Request req;
+
+            unsigned int send_bytes = 0;
+            unsigned int recv_bytes = 0;
+
+            // loop over neighbors
+            for (unsigned int ineigh = 0; ineigh < m_n_unique_neigh; ineigh++)
+                {
+                // rank of neighbor processor
+                unsigned int neighbor = h_unique_neighbors.data[ineigh];
+
+                if (m_n_send_ghosts[stage][ineigh])
+                    {
+                    MPI_Isend(h_scalar_ghost_sendbuf.data+h_ghost_begin.data[ineigh + stage*m_n_unique_neigh],
+                        int(m_n_send_ghosts[stage][ineigh]*sizeof(Scalar)),
+                        MPI_BYTE,
+                        neighbor,
+                        2,
+                        m_mpi_comm,
+                        &req);
+                    m_reqs.push_back(req);
+                    }
+                send_bytes += (unsigned int)(m_n_send_ghosts[stage][ineigh]*sizeof(Scalar));
+
+                if (m_n_recv_ghosts[stage][ineigh])
+                    {
+                    MPI_Irecv(h_scalar_ghost_recvbuf.data + m_ghost_offs[stage][ineigh] + offs,
+                        int(m_n_recv_ghosts[stage][ineigh]*sizeof(Scalar)),
+                        MPI_BYTE,
+                        neighbor,
+                        2,
+                        m_mpi_comm,
+                        &req);
+                    m_reqs.push_back(req);
+                    }
+                recv_bytes += (unsigned int)(m_n_recv_ghosts[stage][ineigh]*sizeof(Scalar));
+                }
+
+            // complete communication
+            std::vector<MPI_Status> stats(m_reqs.size());
+            MPI_Waitall((unsigned int)m_reqs.size(), &m_reqs.front(), &stats.front());
+
+            if (m_prof) m_prof->pop(m_exec_conf,0,send_bytes+recv_bytes);
+            } // end ArrayHandle scope
+
+            {
+            ArrayHandle<Scalar> d_scalar_ghost_recvbuf(m_scalar_ghost_recvbuf, access_location::device, access_mode::read);
+            ArrayHandle<Scalar> d_data(data, access_location::device, access_mode::readwrite);
+
+            // copy recv buf into the ghost elements
+            gpu_exchange_ghosts_copy_scalar_buf(
+                m_n_recv_ghosts_tot[stage],
+                d_scalar_ghost_recvbuf.data,
+                d_data.data + first_idx);
+
+            if (m_exec_conf->isCUDAErrorCheckingEnabled()) CHECK_CUDA_ERROR();
+            }
+        } // end main communication loop
+
+    if (m_prof) m_prof->pop(m_exec_conf);
+    }
+
  //! Export CommunicatorGPU class to python
 void export_CommunicatorGPU(py::module& m)
     {
@@ -973,6 +973,22 @@ void gpu_exchange_ghosts_pack_netforce(
         n_out, d_ghost_idx_adj, d_netforce, d_netforce_sendbuf);
     }
 
+void gpu_exchange_ghosts_pack_scalar(
+    unsigned int n_out,
+    const uint2 *d_ghost_idx_adj,
+    const Scalar *d_data,
+    Scalar *d_scalar_sendbuf)
+    {
+    assert(d_ghost_idx_adj);
+    assert(d_data);
+    assert(d_scalar_sendbuf);
+
+    unsigned int block_size = 256;
+    unsigned int n_blocks = n_out/block_size + 1;
+    hipLaunchKernelGGL(gpu_pack_kernel, dim3(n_blocks), dim3(block_size), 0, 0,
+        n_out, d_ghost_idx_adj, d_data, d_scalar_sendbuf);
+    }
+
 __global__ void gpu_pack_netvirial_kernel(
     unsigned int n_out,
     const uint2 *d_ghost_idx_adj,
@@ -1156,6 +1172,20 @@ void gpu_exchange_ghosts_copy_netforce_buf(
         n_recv, d_netforce_recvbuf, d_netforce);
     }
 
+void gpu_exchange_ghosts_copy_scalar_buf(
+    unsigned int n_recv,
+    const Scalar *d_scalar_recvbuf,
+    Scalar *d_data)
+    {
+    assert(d_scalar_recvbuf);
+    assert(d_data);
+
+    unsigned int block_size = 256;
+    unsigned int n_blocks = n_recv/block_size + 1;
+    hipLaunchKernelGGL(HIP_KERNEL_NAME(gpu_unpack_kernel<Scalar>), dim3(n_blocks), dim3(block_size), 0, 0,
+        n_recv, d_scalar_recvbuf, d_data);
+    }
+
 __global__ void gpu_unpack_netvirial_kernel(
     unsigned int n_in,
     const Scalar *in,
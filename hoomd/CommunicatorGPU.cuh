@@ -348,6 +348,17 @@ void gpu_exchange_ghosts_copy_netforce_buf(
     const Scalar4 *d_netforce_recvbuf,
     Scalar4 *d_netforce);
 
+void gpu_exchange_ghosts_pack_scalar(
+    unsigned int n_out,
+    const uint2 *d_ghost_idx_adj,
+    const Scalar *d_data,
+    Scalar *d_scalar_sendbuf);
+
+void gpu_exchange_ghosts_copy_scalar_buf(
+    unsigned int n_recv,
+    const Scalar *d_scalar_recvbuf,
+    Scalar *d_data);
+
 void gpu_exchange_ghosts_pack_netvirial(
     unsigned int n_out,
     const uint2 *d_ghost_idx_adj,
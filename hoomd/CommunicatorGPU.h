@@ -69,6 +69,9 @@ class PYBIND11_EXPORT CommunicatorGPU : public Communicator
          * \parm timestep The time step
          */
         virtual void updateNetForce(uint64_t timestep);
+
+        //! Communicate a per-particle scalar to the ghost particles
+        virtual void updateGhostScalars(GlobalArray<Scalar>& data);
         //@}
 
         //! Set maximum number of communication stages
@@ -219,6 +222,9 @@ class PYBIND11_EXPORT CommunicatorGPU : public Communicator
         GlobalVector<Scalar> m_netvirial_ghost_sendbuf;    //!< Send buffer for netvirial
         GlobalVector<Scalar> m_netvirial_ghost_recvbuf;    //!< Recv buffer for netvirial
 
+        GlobalVector<Scalar> m_scalar_ghost_sendbuf;       //!< Send buffer for per-particle scalars
+        GlobalVector<Scalar> m_scalar_ghost_recvbuf;       //!< Recv buffer for per-particle scalars
+
         GlobalVector<unsigned int> m_ghost_begin;          //!< Begin index for every stage and neighbor in send buf
         GlobalVector<unsigned int> m_ghost_end;            //!< Begin index for every and neighbor in send buf
 
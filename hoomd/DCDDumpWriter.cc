@@ -146,10 +146,9 @@ void DCDDumpWriter::analyze(uint64_t timestep)
     if (m_prof)
         m_prof->push("Dump DCD");
 
-    // take particle data snapshot
-    SnapshotParticleData<Scalar> snapshot;
-
-    m_pdata->takeSnapshot(snapshot);
+    // take particle data snapshot, in full precision so that positions are unwrapped before rounding to float
+    std::shared_ptr< const SharedParticleSnapshot<Scalar> > particles = m_sysdef->getParticleSnapshot<Scalar>();
+    const SnapshotParticleData<Scalar>& snapshot = particles->snapshot;
 
 #ifdef ENABLE_MPI
     // if we are not the root processor, do not perform file I/O
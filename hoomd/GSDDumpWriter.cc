@@ -150,8 +150,9 @@ void GSDDumpWriter::analyze(uint64_t timestep)
 
     // take particle data snapshot
     m_exec_conf->msg->notice(10) << "GSD: taking particle data snapshot" << endl;
-    SnapshotParticleData<float> snapshot;
-    const std::map<unsigned int, unsigned int>& map = m_pdata->takeSnapshot<float>(snapshot);
+    std::shared_ptr< const SharedParticleSnapshot<float> > particles = m_sysdef->getParticleSnapshot<float>();
+    const SnapshotParticleData<float>& snapshot = particles->snapshot;
+    const std::map<unsigned int, unsigned int>& map = particles->map;
 
 #ifdef ENABLE_MPI
     // if we are not the root processor, do not perform file I/O
@@ -29,6 +29,7 @@
 #include <stdexcept>
 #include <sstream>
 #include <iomanip>
+#include <algorithm>
 
 using namespace std;
 
@@ -161,6 +162,43 @@ ParticleData::ParticleData(const SnapshotParticleData<Real>& snapshot,
     {
     m_exec_conf->msg->notice(5) << "Constructing ParticleData" << endl;
 
+    constructFromSnapshot(snapshot, global_box, decomposition);
+    }
+
+/*! Loads particle data from the arrays of the snapshot view into the internal arrays.
+ * \param snapshot The particle data snapshot view
+ * \param global_box The dimensions of the global simulation box
+ * \param exec_conf The execution configuration
+ * \param decomposition (optional) Domain decomposition layout
+ */
+ParticleData::ParticleData(const SnapshotParticleDataView& snapshot,
+                           const BoxDim& global_box,
+                           std::shared_ptr<ExecutionConfiguration> exec_conf,
+                           std::shared_ptr<DomainDecomposition> decomposition
+                          )
+    : m_exec_conf(exec_conf),
+      m_nparticles(0),
+      m_nghosts(0),
+      m_max_nparticles(0),
+      m_nglobal(0),
+      m_accel_set(false),
+      m_resize_factor(9./8.),
+      m_arrays_allocated(false)
+    {
+    m_exec_conf->msg->notice(5) << "Constructing ParticleData" << endl;
+
+    constructFromSnapshot(snapshot, global_box, decomposition);
+    }
+
+/*! \param snapshot The particle data snapshot or snapshot view
+ * \param global_box The dimensions of the global simulation box
+ * \param decomposition Domain decomposition layout (may be null)
+ */
+template <class Snapshot>
+void ParticleData::constructFromSnapshot(const Snapshot& snapshot,
+                                         const BoxDim& global_box,
+                                         std::shared_ptr<DomainDecomposition> decomposition)
+    {
     #ifdef ENABLE_MPI
     // Set up domain decomposition information
     if (decomposition) setDomainDecomposition(decomposition);
@@ -185,7 +223,7 @@ ParticleData::ParticleData(const SnapshotParticleData<Real>& snapshot,
     #endif
 
     // initialize rtag array
-    GlobalVector<unsigned int>(exec_conf).swap(m_rtag);
+    GlobalVector<unsigned int>(m_exec_conf).swap(m_rtag);
     TAG_ALLOCATION(m_rtag);
 
     // initialize particle data with snapshot contents
@@ -778,8 +816,8 @@ void ParticleData::maybe_rebuild_tag_cache()
 
 /*! \return true If and only if all particles are in the simulation box
 */
-template <class Real>
-bool ParticleData::inBox(const SnapshotParticleData<Real> &snap)
+template <class Snapshot>
+bool ParticleData::inBox(const Snapshot &snap)
     {
     bool in_box = true;
     if (m_exec_conf->getRank() == 0)
@@ -824,6 +862,50 @@ bool ParticleData::inBox(const SnapshotParticleData<Real> &snap)
  */
 template <class Real>
 void ParticleData::initializeFromSnapshot(const SnapshotParticleData<Real>& snapshot, bool ignore_bodies)
+    {
+    initializeFromParticles(snapshot, ignore_bodies);
+    }
+
+/*! \param snapshot The snapshot view of the initial particle data
+    \param ignore_bodies If True, ignore particles that have a body flag set
+
+    The arrays of the view are read in place, so the particle data is initialized without an intermediate
+    SnapshotParticleData.
+ */
+void ParticleData::initializeFromSnapshot(const SnapshotParticleDataView& snapshot, bool ignore_bodies)
+    {
+    initializeFromParticles(snapshot, ignore_bodies);
+    }
+
+#ifdef ENABLE_MPI
+namespace
+    {
+//! Particle of a snapshot packed for the scatter in ParticleData::initializeFromParticles()
+struct snapshot_element
+    {
+    Scalar4 pos;               //!< Position and type
+    Scalar4 vel;               //!< Velocity and mass
+    Scalar3 accel;             //!< Acceleration
+    Scalar charge;             //!< Charge
+    Scalar diameter;           //!< Diameter
+    int3 image;                //!< Image
+    unsigned int body;         //!< Body id
+    Scalar4 orientation;       //!< Orientation
+    Scalar4 angmom;            //!< Angular momentum
+    Scalar3 inertia;           //!< Principal moments of inertia
+    unsigned int tag;          //!< Global tag
+    };
+    } // end anonymous namespace
+#endif
+
+/*! \param snapshot SnapshotParticleData or SnapshotParticleDataView with the initial particle data
+    \param ignore_bodies If True, ignore particles that have a body flag set
+
+    In domain decomposition simulations, the root rank sorts the particles by destination rank into one buffer of
+    packed particles and scatters it with a single collective call.
+ */
+template <class Snapshot>
+void ParticleData::initializeFromParticles(const Snapshot& snapshot, bool ignore_bodies)
     {
     m_exec_conf->msg->notice(4) << "ParticleData: initializing from snapshot" << std::endl;
 
@@ -851,47 +933,17 @@ void ParticleData::initializeFromSnapshot(const SnapshotParticleData<Real>& snap
 #ifdef ENABLE_MPI
     if (m_decomposition)
         {
-        // gather box information from all processors
         unsigned int root = 0;
-
-        // Define per-processor particle data
-        std::vector< std::vector<Scalar3> > pos_proc;              // Position array of every processor
-        std::vector< std::vector<Scalar3> > vel_proc;              // Velocities array of every processor
-        std::vector< std::vector<Scalar3> > accel_proc;            // Accelerations array of every processor
-        std::vector< std::vector<unsigned int> > type_proc;        // Particle types array of every processor
-        std::vector< std::vector<Scalar > > mass_proc;             // Particle masses array of every processor
-        std::vector< std::vector<Scalar > > charge_proc;           // Particle charges array of every processor
-        std::vector< std::vector<Scalar > > diameter_proc;         // Particle diameters array of every processor
-        std::vector< std::vector<int3 > > image_proc;              // Particle images array of every processor
-        std::vector< std::vector<unsigned int > > body_proc;       // Body ids of every processor
-        std::vector< std::vector<Scalar4> > orientation_proc;      // Orientations of every processor
-        std::vector< std::vector<Scalar4> > angmom_proc;           // Angular momenta of every processor
-        std::vector< std::vector<Scalar3> > inertia_proc;           // Angular momenta of every processor
-        std::vector< std::vector<unsigned int > > tag_proc;         // Global tags of every processor
-        std::vector< unsigned int > N_proc;                        // Number of particles on every processor
-
-
-        // resize to number of ranks in communicator
         const MPI_Comm mpi_comm = m_exec_conf->getMPICommunicator();
         unsigned int size = m_exec_conf->getNRanks();
         unsigned int my_rank = m_exec_conf->getRank();
 
-        pos_proc.resize(size);
-        vel_proc.resize(size);
-        accel_proc.resize(size);
-        type_proc.resize(size);
-        mass_proc.resize(size);
-        charge_proc.resize(size);
-        diameter_proc.resize(size);
-        image_proc.resize(size);
-        body_proc.resize(size);
-        orientation_proc.resize(size);
-        angmom_proc.resize(size);
-        inertia_proc.resize(size);
-        tag_proc.resize(size);
-        N_proc.resize(size,0);
+        // packed particles sorted by destination rank (root only)
+        std::vector<snapshot_element> send_elements;
+        std::vector<int> send_counts(size, 0);
+        std::vector<int> send_displs(size, 0);
 
-        if (my_rank == 0)
+        if (my_rank == root)
             {
             ArrayHandle<unsigned int> h_cart_ranks(m_decomposition->getCartRanks(), access_location::host, access_mode::read);
 
@@ -907,19 +959,11 @@ void ParticleData::initializeFromSnapshot(const SnapshotParticleData<Real>& snap
 
             BoxDim global_box = m_global_box;
 
-            // loop over particles in snapshot, place them into domains
-            for (typename std::vector< vec3<Real> >::const_iterator it=snapshot.pos.begin(); it != snapshot.pos.end(); it++)
+            // place a particle into its domain, returns the rank and the wrapped position and image
+            auto place = [&](unsigned int snap_idx, Scalar3& pos, int3& img)
                 {
-                unsigned int snap_idx = (unsigned int)(it - snapshot.pos.begin());
-
-                // if requested, do not initialize constituent particles of bodies
-                if (ignore_bodies && snapshot.body[snap_idx] < MIN_FLOPPY)
-                    {
-                    continue;
-                    }
-
                 // determine domain the particle is placed into
-                Scalar3 pos = vec_to_scalar3(*it);
+                pos = vec_to_scalar3(snapshot.pos[snap_idx]);
                 Scalar3 f = m_global_box.makeFraction(pos);
                 int i= int(f.x * ((Scalar)di.getW()));
                 int j= int(f.y * ((Scalar)di.getH()));
@@ -947,7 +991,7 @@ void ParticleData::initializeFromSnapshot(const SnapshotParticleData<Real>& snap
                     flags.z = 1;
                     }
 
-                int3 img = snapshot.image[snap_idx];
+                img = snapshot.image[snap_idx];
 
                 // only wrap if the particles is on one of the boundaries
                 uchar3 periodic = make_uchar3(flags.x,flags.y,flags.z);
@@ -972,23 +1016,55 @@ void ParticleData::initializeFromSnapshot(const SnapshotParticleData<Real>& snap
                     throw std::runtime_error("Error initializing from snapshot.");
                     }
 
-                // fill up per-processor data structures
-                pos_proc[rank].push_back(pos);
-                image_proc[rank].push_back(img);
-                vel_proc[rank].push_back(vec_to_scalar3(snapshot.vel[snap_idx]));
-                accel_proc[rank].push_back(vec_to_scalar3(snapshot.accel[snap_idx]));
-                type_proc[rank].push_back(snapshot.type[snap_idx]);
-                mass_proc[rank].push_back(snapshot.mass[snap_idx]);
-                charge_proc[rank].push_back(snapshot.charge[snap_idx]);
-                diameter_proc[rank].push_back(snapshot.diameter[snap_idx]);
-                body_proc[rank].push_back(snapshot.body[snap_idx]);
-                orientation_proc[rank].push_back(quat_to_scalar4(snapshot.orientation[snap_idx]));
-                angmom_proc[rank].push_back(quat_to_scalar4(snapshot.angmom[snap_idx]));
-                inertia_proc[rank].push_back(vec_to_scalar3(snapshot.inertia[snap_idx]));
-                tag_proc[rank].push_back(nglobal++);
-                N_proc[rank]++;
+                return rank;
+                };
+
+            // if requested, do not initialize constituent particles of bodies
+            auto skip = [&](unsigned int snap_idx)
+                {
+                return ignore_bodies && snapshot.body[snap_idx] < MIN_FLOPPY;
+                };
+
+            // count the particles of each rank
+            for (unsigned int snap_idx = 0; snap_idx < snapshot.size; snap_idx++)
+                {
+                if (skip(snap_idx))
+                    continue;
+
+                Scalar3 pos;
+                int3 img;
+                send_counts[place(snap_idx, pos, img)]++;
                 }
 
+            for (unsigned int rank = 1; rank < size; rank++)
+                send_displs[rank] = send_displs[rank-1] + send_counts[rank-1];
+
+            // pack the particles in the order of their destination ranks
+            send_elements.resize(send_displs[size-1] + send_counts[size-1]);
+            std::vector<int> offset(send_displs);
+            for (unsigned int snap_idx = 0; snap_idx < snapshot.size; snap_idx++)
+                {
+                if (skip(snap_idx))
+                    continue;
+
+                Scalar3 pos;
+                int3 img;
+                unsigned int rank = place(snap_idx, pos, img);
+
+                snapshot_element& p = send_elements[offset[rank]++];
+                p.pos = make_scalar4(pos.x, pos.y, pos.z, __int_as_scalar(snapshot.type[snap_idx]));
+                vec3<Scalar> vel(snapshot.vel[snap_idx]);
+                p.vel = make_scalar4(vel.x, vel.y, vel.z, snapshot.mass[snap_idx]);
+                p.accel = vec_to_scalar3(snapshot.accel[snap_idx]);
+                p.charge = snapshot.charge[snap_idx];
+                p.diameter = snapshot.diameter[snap_idx];
+                p.image = img;
+                p.body = snapshot.body[snap_idx];
+                p.orientation = quat_to_scalar4(snapshot.orientation[snap_idx]);
+                p.angmom = quat_to_scalar4(snapshot.angmom[snap_idx]);
+                p.inertia = vec_to_scalar3(snapshot.inertia[snap_idx]);
+                p.tag = nglobal++;
+                }
             }
 
         // get type mapping
@@ -1005,42 +1081,33 @@ void ParticleData::initializeFromSnapshot(const SnapshotParticleData<Real>& snap
         // broadcast global number of particles
         bcast(nglobal, root, mpi_comm);
 
-        // resize array for reverse-lookup tags
-        m_rtag.resize(nglobal);
+        // distribute the packed particles with a single scatter
+        int recv_count = 0;
+        MPI_Scatter(&send_counts.front(), 1, MPI_INT, &recv_count, 1, MPI_INT, root, mpi_comm);
 
-        // Local particle data
-        std::vector<Scalar3> pos;
-        std::vector<Scalar3> vel;
-        std::vector<Scalar3> accel;
-        std::vector<unsigned int> type;
-        std::vector<Scalar> mass;
-        std::vector<Scalar> charge;
-        std::vector<Scalar> diameter;
-        std::vector<int3> image;
-        std::vector<unsigned int> body;
-        std::vector<Scalar4> orientation;
-        std::vector<Scalar4> angmom;
-        std::vector<Scalar3> inertia;
-        std::vector<unsigned int> tag;
-
-        // distribute particle data
-        scatter_v(pos_proc,pos,root, mpi_comm);
-        scatter_v(vel_proc,vel,root, mpi_comm);
-        scatter_v(accel_proc, accel, root, mpi_comm);
-        scatter_v(type_proc, type, root, mpi_comm);
-        scatter_v(mass_proc, mass, root, mpi_comm);
-        scatter_v(charge_proc, charge, root, mpi_comm);
-        scatter_v(diameter_proc, diameter, root, mpi_comm);
-        scatter_v(image_proc, image, root, mpi_comm);
-        scatter_v(body_proc, body, root, mpi_comm);
-        scatter_v(orientation_proc, orientation, root, mpi_comm);
-        scatter_v(angmom_proc, angmom, root, mpi_comm);
-        scatter_v(inertia_proc, inertia, root, mpi_comm);
-        scatter_v(tag_proc, tag, root, mpi_comm);
-
-        // distribute number of particles
-        scatter_v(N_proc, m_nparticles, root, mpi_comm);
+        MPI_Datatype element_type;
+        MPI_Type_contiguous(sizeof(snapshot_element), MPI_BYTE, &element_type);
+        MPI_Type_commit(&element_type);
+
+        std::vector<snapshot_element> elements(recv_count);
+        MPI_Scatterv(send_elements.data(),
+                     &send_counts.front(),
+                     &send_displs.front(),
+                     element_type,
+                     elements.data(),
+                     recv_count,
+                     element_type,
+                     root,
+                     mpi_comm);
+        MPI_Type_free(&element_type);
 
+        // free the send buffer before the particle data grows
+        std::vector<snapshot_element>().swap(send_elements);
+
+        m_nparticles = recv_count;
+
+        // resize array for reverse-lookup tags
+        m_rtag.resize(nglobal);
 
             {
             // reset all reverse lookup tags to NOT_LOCAL flag
@@ -1081,18 +1148,19 @@ void ParticleData::initializeFromSnapshot(const SnapshotParticleData<Real>& snap
 
         for (unsigned int idx = 0; idx < m_nparticles; idx++)
             {
-            h_pos.data[idx] = make_scalar4(pos[idx].x,pos[idx].y, pos[idx].z, __int_as_scalar(type[idx]));
-            h_vel.data[idx] = make_scalar4(vel[idx].x, vel[idx].y, vel[idx].z, mass[idx]);
-            h_accel.data[idx] = accel[idx];
-            h_charge.data[idx] = charge[idx];
-            h_diameter.data[idx] = diameter[idx];
-            h_image.data[idx] = image[idx];
-            h_tag.data[idx] = tag[idx];
-            h_rtag.data[tag[idx]] = idx;
-            h_body.data[idx] = body[idx];
-            h_orientation.data[idx] = orientation[idx];
-            h_angmom.data[idx] = angmom[idx];
-            h_inertia.data[idx] = inertia[idx];
+            const snapshot_element& p = elements[idx];
+            h_pos.data[idx] = p.pos;
+            h_vel.data[idx] = p.vel;
+            h_accel.data[idx] = p.accel;
+            h_charge.data[idx] = p.charge;
+            h_diameter.data[idx] = p.diameter;
+            h_image.data[idx] = p.image;
+            h_tag.data[idx] = p.tag;
+            h_rtag.data[p.tag] = idx;
+            h_body.data[idx] = p.body;
+            h_orientation.data[idx] = p.orientation;
+            h_angmom.data[idx] = p.angmom;
+            h_inertia.data[idx] = p.inertia;
 
             h_comm_flag.data[idx] = 0; // initialize with zero
             }
@@ -1137,14 +1205,10 @@ void ParticleData::initializeFromSnapshot(const SnapshotParticleData<Real>& snap
                 continue;
                 }
 
-            h_pos.data[nglobal] = make_scalar4(snapshot.pos[snap_idx].x,
-                                           snapshot.pos[snap_idx].y,
-                                           snapshot.pos[snap_idx].z,
-                                           __int_as_scalar(snapshot.type[snap_idx]));
-            h_vel.data[nglobal] = make_scalar4(snapshot.vel[snap_idx].x,
-                                             snapshot.vel[snap_idx].y,
-                                             snapshot.vel[snap_idx].z,
-                                             snapshot.mass[snap_idx]);
+            vec3<Scalar> pos(snapshot.pos[snap_idx]);
+            vec3<Scalar> vel(snapshot.vel[snap_idx]);
+            h_pos.data[nglobal] = make_scalar4(pos.x, pos.y, pos.z, __int_as_scalar(snapshot.type[snap_idx]));
+            h_vel.data[nglobal] = make_scalar4(vel.x, vel.y, vel.z, snapshot.mass[snap_idx]);
             h_accel.data[nglobal] = vec_to_scalar3(snapshot.accel[snap_idx]);
             h_charge.data[nglobal] = snapshot.charge[snap_idx];
             h_diameter.data[nglobal] = snapshot.diameter[snap_idx];
@@ -1428,6 +1492,619 @@ std::map<unsigned int, unsigned int> ParticleData::takeSnapshot(SnapshotParticle
     return index;
     }
 
+namespace
+    {
+//! Get the data of the array that receives a range of a snapshot field
+/*! \param out NumPy array to write
+    \param size Number of elements to write
+    \returns Pointer to the data of \a out
+*/
+template<class T>
+T* getSnapshotFieldBuffer(py::object out, size_t size)
+    {
+    typedef py::array_t<T, py::array::c_style> array_type;
+    if (!array_type::check_(out))
+        {
+        throw std::runtime_error("Snapshot field buffer has the wrong type or is not contiguous");
+        }
+    array_type array = py::reinterpret_borrow<array_type>(out);
+    if (size_t(array.size()) != size)
+        {
+        throw std::runtime_error("Snapshot field buffer has the wrong size");
+        }
+    return array.mutable_data();
+    }
+
+//! Gather a range of a snapshot field on the root rank
+/*! \param exec_conf Execution configuration
+    \param decomposed True when the particles are distributed over the ranks
+    \param tags Tags of the particles in the range, in snapshot order
+    \param n Number of particles in the range
+    \param rtag Local index of each tag
+    \param n_local Number of local particles
+    \param width Number of elements per particle
+    \param out NumPy array of n*width elements to write on the root rank
+    \param pack Functor that writes the \a width elements of a local particle index to a T*
+
+    Each rank only packs the particles of the range that it owns, so the memory used for the gather scales with the
+    size of the range and not with the number of particles.
+*/
+template<class T, class Pack>
+void gatherSnapshotRange(std::shared_ptr<ExecutionConfiguration> exec_conf,
+                         bool decomposed,
+                         const unsigned int* tags,
+                         unsigned int n,
+                         const unsigned int* rtag,
+                         unsigned int n_local,
+                         unsigned int width,
+                         py::object out,
+                         Pack pack)
+    {
+#ifdef ENABLE_MPI
+    if (decomposed)
+        {
+        // pack the local particles of the range with their position in the range
+        std::vector<unsigned int> range_idx;
+        std::vector<T> values;
+        for (unsigned int i = 0; i < n; ++i)
+            {
+            unsigned int idx = rtag[tags[i]];
+            if (idx < n_local)
+                {
+                range_idx.push_back(i);
+                values.resize(values.size() + width);
+                pack(idx, &values[values.size() - width]);
+                }
+            }
+
+        std::vector< std::vector<unsigned int> > range_idx_proc;
+        std::vector< std::vector<T> > values_proc;
+        const MPI_Comm mpi_comm = exec_conf->getMPICommunicator();
+        gather_v(range_idx, range_idx_proc, 0, mpi_comm);
+        gather_v(values, values_proc, 0, mpi_comm);
+
+        // validate the output on the root rank only after the collective calls
+        if (exec_conf->getRank() == 0)
+            {
+            T* dest = getSnapshotFieldBuffer<T>(out, size_t(n) * width);
+            unsigned int n_found = 0;
+            for (unsigned int irank = 0; irank < range_idx_proc.size(); ++irank)
+                {
+                const std::vector<unsigned int>& rank_idx = range_idx_proc[irank];
+                for (unsigned int j = 0; j < rank_idx.size(); ++j)
+                    {
+                    std::copy(values_proc[irank].begin() + size_t(j) * width,
+                              values_proc[irank].begin() + size_t(j + 1) * width,
+                              dest + size_t(rank_idx[j]) * width);
+                    }
+                n_found += (unsigned int)rank_idx.size();
+                }
+
+            if (n_found != n)
+                {
+                exec_conf->msg->error() << "Could not find " << n - n_found << " particles on any processor."
+                                        << std::endl;
+                throw std::runtime_error("Error gathering ParticleData");
+                }
+            }
+        }
+    else
+#endif
+        {
+        T* dest = getSnapshotFieldBuffer<T>(out, size_t(n) * width);
+        for (unsigned int i = 0; i < n; ++i)
+            {
+            unsigned int idx = rtag[tags[i]];
+            assert(idx < n_local);
+            pack(idx, dest + size_t(i) * width);
+            }
+        }
+    }
+    } // end anonymous namespace
+
+/*! \param field Name of the field, as in the double precision snapshot (e.g. "position")
+    \param first Index of the first particle in snapshot order
+    \param last Index past the last particle in snapshot order
+    \param out Contiguous NumPy array that receives the (last - first) particles on the root rank. It must have the
+        dtype and width of the field in the double precision snapshot. Ignored on other ranks.
+
+    gatherSnapshotField() writes the same values as takeSnapshot<double>() does for the particles [first, last) of the
+    snapshot, but for one field at a time. Callers can assemble a snapshot of a large system chunk by chunk without
+    the memory of a full snapshot on the root rank. All ranks must call gatherSnapshotField() with the same arguments.
+*/
+void ParticleData::gatherSnapshotField(const std::string& field,
+                                       unsigned int first,
+                                       unsigned int last,
+                                       py::object out)
+    {
+    if (first > last || last > getNGlobal())
+        {
+        m_exec_conf->msg->error() << "Invalid particle range [" << first << ", " << last << ") in a snapshot of "
+                                  << getNGlobal() << " particles" << std::endl;
+        throw std::runtime_error("Error gathering ParticleData");
+        }
+
+    m_exec_conf->msg->notice(8) << "ParticleData: gathering " << field << " of particles " << first << " to "
+                                << last << std::endl;
+
+    // the active tags in snapshot order
+    maybe_rebuild_tag_cache();
+    const unsigned int* tags = m_cached_tag_set.data() + first;
+    const unsigned int n = last - first;
+
+    bool decomposed = false;
+#ifdef ENABLE_MPI
+    decomposed = bool(m_decomposition);
+#endif
+
+    ArrayHandle<unsigned int> h_rtag(m_rtag, access_location::host, access_mode::read);
+    const unsigned int* rtag = h_rtag.data;
+
+    if (field == "position" || field == "image")
+        {
+        ArrayHandle<Scalar4> h_pos(m_pos, access_location::host, access_mode::read);
+        ArrayHandle<int3> h_image(m_image, access_location::host, access_mode::read);
+        const Scalar3 origin = m_origin;
+        const int3 o_image = m_o_image;
+        const BoxDim box = m_global_box;
+
+        // wrap the positions into the box as in takeSnapshot()
+        auto wrapped = [&](unsigned int idx, Scalar3& pos, int3& img)
+            {
+            pos = make_scalar3(h_pos.data[idx].x, h_pos.data[idx].y, h_pos.data[idx].z) - origin;
+            img = make_int3(h_image.data[idx].x - o_image.x,
+                            h_image.data[idx].y - o_image.y,
+                            h_image.data[idx].z - o_image.z);
+            box.wrap(pos, img);
+            };
+
+        if (field == "position")
+            {
+            gatherSnapshotRange<double>(m_exec_conf, decomposed, tags, n, rtag, m_nparticles, 3, out,
+                [&](unsigned int idx, double* dest)
+                {
+                Scalar3 pos;
+                int3 img;
+                wrapped(idx, pos, img);
+                dest[0] = pos.x;
+                dest[1] = pos.y;
+                dest[2] = pos.z;
+                });
+            }
+        else
+            {
+            gatherSnapshotRange<int>(m_exec_conf, decomposed, tags, n, rtag, m_nparticles, 3, out,
+                [&](unsigned int idx, int* dest)
+                {
+                Scalar3 pos;
+                int3 img;
+                wrapped(idx, pos, img);
+                dest[0] = img.x;
+                dest[1] = img.y;
+                dest[2] = img.z;
+                });
+            }
+        }
+    else if (field == "typeid")
+        {
+        ArrayHandle<Scalar4> h_pos(m_pos, access_location::host, access_mode::read);
+        gatherSnapshotRange<unsigned int>(m_exec_conf, decomposed, tags, n, rtag, m_nparticles, 1, out,
+            [&](unsigned int idx, unsigned int* dest)
+            {
+            dest[0] = __scalar_as_int(h_pos.data[idx].w);
+            });
+        }
+    else if (field == "velocity" || field == "mass")
+        {
+        ArrayHandle<Scalar4> h_vel(m_vel, access_location::host, access_mode::read);
+        if (field == "velocity")
+            {
+            gatherSnapshotRange<double>(m_exec_conf, decomposed, tags, n, rtag, m_nparticles, 3, out,
+                [&](unsigned int idx, double* dest)
+                {
+                dest[0] = h_vel.data[idx].x;
+                dest[1] = h_vel.data[idx].y;
+                dest[2] = h_vel.data[idx].z;
+                });
+            }
+        else
+            {
+            gatherSnapshotRange<double>(m_exec_conf, decomposed, tags, n, rtag, m_nparticles, 1, out,
+                [&](unsigned int idx, double* dest)
+                {
+                dest[0] = h_vel.data[idx].w;
+                });
+            }
+        }
+    else if (field == "acceleration" || field == "moment_inertia")
+        {
+        const GlobalArray<Scalar3>& array = (field == "acceleration") ? m_accel : m_inertia;
+        ArrayHandle<Scalar3> h_array(array, access_location::host, access_mode::read);
+        gatherSnapshotRange<double>(m_exec_conf, decomposed, tags, n, rtag, m_nparticles, 3, out,
+            [&](unsigned int idx, double* dest)
+            {
+            dest[0] = h_array.data[idx].x;
+            dest[1] = h_array.data[idx].y;
+            dest[2] = h_array.data[idx].z;
+            });
+        }
+    else if (field == "charge" || field == "diameter")
+        {
+        const GlobalArray<Scalar>& array = (field == "charge") ? m_charge : m_diameter;
+        ArrayHandle<Scalar> h_array(array, access_location::host, access_mode::read);
+        gatherSnapshotRange<double>(m_exec_conf, decomposed, tags, n, rtag, m_nparticles, 1, out,
+            [&](unsigned int idx, double* dest)
+            {
+            dest[0] = h_array.data[idx];
+            });
+        }
+    else if (field == "body")
+        {
+        ArrayHandle<unsigned int> h_body(m_body, access_location::host, access_mode::read);
+        gatherSnapshotRange<int>(m_exec_conf, decomposed, tags, n, rtag, m_nparticles, 1, out,
+            [&](unsigned int idx, int* dest)
+            {
+            dest[0] = int(h_body.data[idx]);
+            });
+        }
+    else if (field == "orientation" || field == "angmom")
+        {
+        const GlobalArray<Scalar4>& array = (field == "orientation") ? m_orientation : m_angmom;
+        ArrayHandle<Scalar4> h_array(array, access_location::host, access_mode::read);
+        gatherSnapshotRange<double>(m_exec_conf, decomposed, tags, n, rtag, m_nparticles, 4, out,
+            [&](unsigned int idx, double* dest)
+            {
+            dest[0] = h_array.data[idx].x;
+            dest[1] = h_array.data[idx].y;
+            dest[2] = h_array.data[idx].z;
+            dest[3] = h_array.data[idx].w;
+            });
+        }
+    else
+        {
+        m_exec_conf->msg->error() << "Unknown particle snapshot field " << field << std::endl;
+        throw std::runtime_error("Error gathering ParticleData");
+        }
+    }
+
+namespace
+    {
+//! Get the values of a snapshot field for the local particles
+/*! \param exec_conf Execution configuration
+    \param decomposed True when the particles are distributed over the ranks
+    \param snap_idx Snapshot index of each local particle
+    \param snap_idx_proc Snapshot indices of the local particles of each rank (root rank only)
+    \param get Functor that returns the value of a snapshot index (called on the root rank only when decomposed)
+    \returns The values of the local particles in local index order
+
+    The root rank packs the values of each rank in the order of its local particles, so a single scatter distributes
+    one field and no tags need to be sent along.
+*/
+template<class T, class Get>
+std::vector<T> getLocalSnapshotValues(std::shared_ptr<ExecutionConfiguration> exec_conf,
+                                      bool decomposed,
+                                      const std::vector<unsigned int>& snap_idx,
+                                      const std::vector< std::vector<unsigned int> >& snap_idx_proc,
+                                      Get get)
+    {
+    std::vector<T> values;
+#ifdef ENABLE_MPI
+    if (decomposed)
+        {
+        std::vector< std::vector<T> > values_proc;
+        if (exec_conf->getRank() == 0)
+            {
+            values_proc.resize(snap_idx_proc.size());
+            for (unsigned int irank = 0; irank < snap_idx_proc.size(); ++irank)
+                {
+                values_proc[irank].reserve(snap_idx_proc[irank].size());
+                for (unsigned int i : snap_idx_proc[irank])
+                    values_proc[irank].push_back(get(i));
+                }
+            }
+        scatter_v(values_proc, values, 0, exec_conf->getMPICommunicator());
+        }
+    else
+#endif
+        {
+        values.reserve(snap_idx.size());
+        for (unsigned int i : snap_idx)
+            values.push_back(get(i));
+        }
+    return values;
+    }
+    } // end anonymous namespace
+
+/*! \param snapshot Snapshot with the new values (only read on the root rank)
+    \param fields Names of the fields to update, as in the double precision snapshot (e.g. "position")
+    \param departures Set to the tags (x) and new ranks (y) of the local particles that moved to other domains
+
+    updateFromSnapshot() overwrites the given fields of each particle with the values at its index in \a snapshot,
+    which must hold the same number of particles as the system. Unlike initializeFromSnapshot(), it keeps the tags,
+    types, and bodies of the particles and their local order, so the bonded groups, particle groups, and neighbor list
+    exclusions remain valid and observers only get a single particle sort notification.
+
+    New positions are wrapped into the box, starting from the images in \a snapshot when "image" is also given and
+    from the current images otherwise. In MPI simulations, only the requested fields are scattered, and particles whose
+    new positions lie in another domain move there in a single all-to-all exchange. Accelerations that no longer
+    match the particle data are marked as not set. All ranks must call updateFromSnapshot() with the same fields.
+
+    \returns true on all ranks when particles moved to other domains. The bonded groups do not follow them; the caller
+    must move the groups with BondedGroupData::migrateParticleGroups() (SystemDefinition::updateFromSnapshot() does).
+*/
+template <class Real>
+bool ParticleData::updateFromSnapshot(const SnapshotParticleData<Real>& snapshot,
+                                      const std::vector<std::string>& fields,
+                                      std::vector<uint2>& departures)
+    {
+    departures.clear();
+
+    m_exec_conf->msg->notice(4) << "ParticleData: updating from snapshot" << std::endl;
+
+    bool set_pos = false, set_image = false, set_vel = false, set_accel = false, set_mass = false;
+    bool set_charge = false, set_diameter = false, set_orientation = false, set_angmom = false, set_inertia = false;
+    for (const std::string& field : fields)
+        {
+        if (field == "position")
+            set_pos = true;
+        else if (field == "image")
+            set_image = true;
+        else if (field == "velocity")
+            set_vel = true;
+        else if (field == "acceleration")
+            set_accel = true;
+        else if (field == "mass")
+            set_mass = true;
+        else if (field == "charge")
+            set_charge = true;
+        else if (field == "diameter")
+            set_diameter = true;
+        else if (field == "orientation")
+            set_orientation = true;
+        else if (field == "angmom")
+            set_angmom = true;
+        else if (field == "moment_inertia")
+            set_inertia = true;
+        else
+            {
+            m_exec_conf->msg->error() << "Cannot update the particle snapshot field " << field << std::endl;
+            throw std::runtime_error("Error updating ParticleData");
+            }
+        }
+
+    bool decomposed = false;
+#ifdef ENABLE_MPI
+    decomposed = bool(m_decomposition);
+#endif
+
+    // check the snapshot on the root rank and fail on all ranks together
+    bool valid = true;
+    bool is_accel_set = snapshot.is_accel_set;
+    if (m_exec_conf->getRank() == 0)
+        valid = snapshot.validate() && snapshot.size == getNGlobal();
+#ifdef ENABLE_MPI
+    if (decomposed)
+        {
+        bcast(valid, 0, m_exec_conf->getMPICommunicator());
+        bcast(is_accel_set, 0, m_exec_conf->getMPICommunicator());
+        }
+#endif
+    if (!valid)
+        {
+        m_exec_conf->msg->error() << "Updating the particle data requires a valid snapshot of " << getNGlobal()
+                                  << " particles." << std::endl;
+        throw std::runtime_error("Error updating ParticleData");
+        }
+
+    // the ghost particles would keep the old values
+    removeAllGhostParticles();
+
+    // the snapshot index of each local particle, the snapshot lists the particles in the order of their tags
+    maybe_rebuild_tag_cache();
+    std::vector<unsigned int> snap_idx(m_nparticles);
+        {
+        ArrayHandle<unsigned int> h_tag(m_tag, access_location::host, access_mode::read);
+        for (unsigned int idx = 0; idx < m_nparticles; ++idx)
+            {
+            snap_idx[idx] = (unsigned int)(std::lower_bound(m_cached_tag_set.begin(),
+                                                            m_cached_tag_set.end(),
+                                                            h_tag.data[idx]) - m_cached_tag_set.begin());
+            }
+        }
+
+    std::vector< std::vector<unsigned int> > snap_idx_proc;
+#ifdef ENABLE_MPI
+    if (decomposed)
+        gather_v(snap_idx, snap_idx_proc, 0, m_exec_conf->getMPICommunicator());
+#endif
+
+    if (set_pos || set_image)
+        {
+        std::vector<Scalar3> pos;
+        std::vector<int3> image;
+        if (set_pos)
+            pos = getLocalSnapshotValues<Scalar3>(m_exec_conf, decomposed, snap_idx, snap_idx_proc,
+                [&](unsigned int i) { return vec_to_scalar3(vec3<Scalar>(snapshot.pos[i])); });
+        if (set_image)
+            image = getLocalSnapshotValues<int3>(m_exec_conf, decomposed, snap_idx, snap_idx_proc,
+                [&](unsigned int i) { return snapshot.image[i]; });
+
+        ArrayHandle<Scalar4> h_pos(m_pos, access_location::host, access_mode::readwrite);
+        ArrayHandle<int3> h_image(m_image, access_location::host, access_mode::readwrite);
+        for (unsigned int idx = 0; idx < m_nparticles; ++idx)
+            {
+            int3 img = h_image.data[idx];
+            if (set_image)
+                img = make_int3(image[idx].x + m_o_image.x, image[idx].y + m_o_image.y, image[idx].z + m_o_image.z);
+
+            if (set_pos)
+                {
+                // shift into the current origin as in setPosition()
+                Scalar3 p = pos[idx] + m_origin;
+                m_global_box.wrap(p, img);
+                h_pos.data[idx].x = p.x;
+                h_pos.data[idx].y = p.y;
+                h_pos.data[idx].z = p.z;
+                }
+            h_image.data[idx] = img;
+            }
+        }
+
+    if (set_vel || set_mass)
+        {
+        std::vector<Scalar3> vel;
+        std::vector<Scalar> mass;
+        if (set_vel)
+            vel = getLocalSnapshotValues<Scalar3>(m_exec_conf, decomposed, snap_idx, snap_idx_proc,
+                [&](unsigned int i) { return vec_to_scalar3(vec3<Scalar>(snapshot.vel[i])); });
+        if (set_mass)
+            mass = getLocalSnapshotValues<Scalar>(m_exec_conf, decomposed, snap_idx, snap_idx_proc,
+                [&](unsigned int i) { return Scalar(snapshot.mass[i]); });
+
+        ArrayHandle<Scalar4> h_vel(m_vel, access_location::host, access_mode::readwrite);
+        for (unsigned int idx = 0; idx < m_nparticles; ++idx)
+            {
+            if (set_vel)
+                {
+                h_vel.data[idx].x = vel[idx].x;
+                h_vel.data[idx].y = vel[idx].y;
+                h_vel.data[idx].z = vel[idx].z;
+                }
+            if (set_mass)
+                h_vel.data[idx].w = mass[idx];
+            }
+        }
+
+    // update the Scalar3 arrays
+    auto update_vec3 = [&](bool set, GlobalArray<Scalar3>& array, const std::vector< vec3<Real> >& values)
+        {
+        if (!set)
+            return;
+        std::vector<Scalar3> local = getLocalSnapshotValues<Scalar3>(m_exec_conf, decomposed, snap_idx, snap_idx_proc,
+            [&](unsigned int i) { return vec_to_scalar3(vec3<Scalar>(values[i])); });
+        ArrayHandle<Scalar3> h_array(array, access_location::host, access_mode::readwrite);
+        std::copy(local.begin(), local.end(), h_array.data);
+        };
+    update_vec3(set_accel, m_accel, snapshot.accel);
+    update_vec3(set_inertia, m_inertia, snapshot.inertia);
+
+    // update the Scalar arrays
+    auto update_scalar = [&](bool set, GlobalArray<Scalar>& array, const std::vector<Real>& values)
+        {
+        if (!set)
+            return;
+        std::vector<Scalar> local = getLocalSnapshotValues<Scalar>(m_exec_conf, decomposed, snap_idx, snap_idx_proc,
+            [&](unsigned int i) { return Scalar(values[i]); });
+        ArrayHandle<Scalar> h_array(array, access_location::host, access_mode::readwrite);
+        std::copy(local.begin(), local.end(), h_array.data);
+        };
+    update_scalar(set_charge, m_charge, snapshot.charge);
+    update_scalar(set_diameter, m_diameter, snapshot.diameter);
+
+    // update the Scalar4 arrays
+    auto update_quat = [&](bool set, GlobalArray<Scalar4>& array, const std::vector< quat<Real> >& values)
+        {
+        if (!set)
+            return;
+        std::vector<Scalar4> local = getLocalSnapshotValues<Scalar4>(m_exec_conf, decomposed, snap_idx, snap_idx_proc,
+            [&](unsigned int i) { return quat_to_scalar4(quat<Scalar>(values[i])); });
+        ArrayHandle<Scalar4> h_array(array, access_location::host, access_mode::readwrite);
+        std::copy(local.begin(), local.end(), h_array.data);
+        };
+    update_quat(set_orientation, m_orientation, snapshot.orientation);
+    update_quat(set_angmom, m_angmom, snapshot.angmom);
+
+    // the accelerations are computed from the forces on the old particle data
+    if (set_accel)
+        m_accel_set = is_accel_set;
+    else if (set_pos || set_mass || set_charge || set_diameter || set_orientation || set_inertia)
+        m_accel_set = false;
+
+#ifdef ENABLE_MPI
+    if (decomposed && set_pos)
+        {
+        const MPI_Comm mpi_comm = m_exec_conf->getMPICommunicator();
+        unsigned int my_rank = m_exec_conf->getRank();
+        unsigned int n_ranks = m_exec_conf->getNRanks();
+        ArrayHandle<unsigned int> h_cart_ranks(m_decomposition->getCartRanks(), access_location::host, access_mode::read);
+
+        // mark the particles whose new positions lie in another domain
+        unsigned int n_move = 0;
+            {
+            ArrayHandle<Scalar4> h_pos(m_pos, access_location::host, access_mode::read);
+            ArrayHandle<unsigned int> h_comm_flag(m_comm_flags, access_location::host, access_mode::readwrite);
+            for (unsigned int idx = 0; idx < m_nparticles; ++idx)
+                {
+                Scalar3 pos = make_scalar3(h_pos.data[idx].x, h_pos.data[idx].y, h_pos.data[idx].z);
+                unsigned int rank = m_decomposition->placeParticle(m_global_box, pos, h_cart_ranks.data);
+                h_comm_flag.data[idx] = (rank != my_rank) ? 1 : 0;
+                if (rank != my_rank)
+                    n_move++;
+                }
+            }
+        MPI_Allreduce(MPI_IN_PLACE, &n_move, 1, MPI_UNSIGNED, MPI_SUM, mpi_comm);
+
+        if (n_move > 0)
+            {
+            m_exec_conf->msg->notice(6) << "Moving " << n_move << " particles to other domains" << std::endl;
+
+            std::vector<pdata_element> out;
+            std::vector<unsigned int> comm_flags; // not used here
+            removeParticles(out, comm_flags);
+
+            // sort the removed particles by their destination ranks
+            std::vector<unsigned int> dest(out.size());
+            std::vector<int> send_counts(n_ranks, 0);
+            std::vector<int> send_displs(n_ranks, 0);
+            for (unsigned int i = 0; i < out.size(); ++i)
+                {
+                Scalar3 pos = make_scalar3(out[i].pos.x, out[i].pos.y, out[i].pos.z);
+                dest[i] = m_decomposition->placeParticle(m_global_box, pos, h_cart_ranks.data);
+                send_counts[dest[i]]++;
+                departures.push_back(make_uint2(out[i].tag, dest[i]));
+                }
+            for (unsigned int rank = 1; rank < n_ranks; rank++)
+                send_displs[rank] = send_displs[rank-1] + send_counts[rank-1];
+
+            std::vector<pdata_element> send(out.size());
+            std::vector<int> offset(send_displs);
+            for (unsigned int i = 0; i < out.size(); ++i)
+                send[offset[dest[i]]++] = out[i];
+
+            std::vector<int> recv_counts(n_ranks, 0);
+            std::vector<int> recv_displs(n_ranks, 0);
+            MPI_Alltoall(&send_counts.front(), 1, MPI_INT, &recv_counts.front(), 1, MPI_INT, mpi_comm);
+            for (unsigned int rank = 1; rank < n_ranks; rank++)
+                recv_displs[rank] = recv_displs[rank-1] + recv_counts[rank-1];
+            std::vector<pdata_element> in(recv_displs[n_ranks-1] + recv_counts[n_ranks-1]);
+
+            MPI_Datatype element_type;
+            MPI_Type_contiguous(sizeof(pdata_element), MPI_BYTE, &element_type);
+            MPI_Type_commit(&element_type);
+            MPI_Alltoallv(send.data(),
+                          &send_counts.front(),
+                          &send_displs.front(),
+                          element_type,
+                          in.data(),
+                          &recv_counts.front(),
+                          &recv_displs.front(),
+                          element_type,
+                          mpi_comm);
+            MPI_Type_free(&element_type);
+
+            addParticles(in);
+
+            // addParticles() notified the observers
+            return true;
+            }
+        }
+#endif
+
+    // notify observers that the particle data changed
+    notifyParticleSort();
+    return false;
+    }
+
 //! Add ghost particles at the end of the local particle data
 /*! Ghost ptls are appended at the end of the particle data.
   Ghost particles have only incomplete particle information (position, charge, diameter) and
@@ -2512,6 +3189,9 @@ template ParticleData::ParticleData(const SnapshotParticleData<double>& snapshot
                                           );
 template void ParticleData::initializeFromSnapshot<double>(const SnapshotParticleData<double> & snapshot, bool ignore_bodies);
 template std::map<unsigned int, unsigned int> ParticleData::takeSnapshot<double>(SnapshotParticleData<double> &snapshot);
+template bool ParticleData::updateFromSnapshot<double>(const SnapshotParticleData<double>& snapshot,
+                                                     const std::vector<std::string>& fields,
+                                                     std::vector<uint2>& departures);
 
 
 template ParticleData::ParticleData(const SnapshotParticleData<float>& snapshot,
@@ -2521,6 +3201,9 @@ template ParticleData::ParticleData(const SnapshotParticleData<float>& snapshot,
                                           );
 template void ParticleData::initializeFromSnapshot<float>(const SnapshotParticleData<float> & snapshot, bool ignore_bodies);
 template std::map<unsigned int, unsigned int> ParticleData::takeSnapshot<float>(SnapshotParticleData<float> &snapshot);
+template bool ParticleData::updateFromSnapshot<float>(const SnapshotParticleData<float>& snapshot,
+                                                    const std::vector<std::string>& fields,
+                                                    std::vector<uint2>& departures);
 
 
 void export_ParticleData(py::module& m)
@@ -2573,6 +3256,7 @@ void export_ParticleData(py::module& m)
     .def("addParticle", &ParticleData::addParticle)
     .def("removeParticle", &ParticleData::removeParticle)
     .def("getNthTag", &ParticleData::getNthTag)
+    .def("gatherSnapshotField", &ParticleData::gatherSnapshotField)
 #ifdef ENABLE_MPI
     .def("setDomainDecomposition", &ParticleData::setDomainDecomposition)
     .def("getDomainDecomposition", &ParticleData::getDomainDecomposition)
@@ -3546,8 +4230,140 @@ void SnapshotParticleData<Real>::bcast(unsigned int root, MPI_Comm mpi_comm)
 template struct SnapshotParticleData<float>;
 template struct SnapshotParticleData<double>;
 
+namespace
+    {
+//! Set the buffer of a floating point array of a snapshot view
+/*! \param view Array of the snapshot view
+    \param array Contiguous float32 or float64 NumPy array
+    \param name Name of the array
+    \param N Number of particles
+*/
+template<class T>
+void setSnapshotViewBuffer(SnapshotRealView<T>& view, py::object array, const std::string& name, unsigned int N)
+    {
+    const unsigned int width = sizeof(T) / sizeof(double);
+    bool single;
+    if (py::array_t<float, py::array::c_style>::check_(array))
+        {
+        single = true;
+        }
+    else if (py::array_t<double, py::array::c_style>::check_(array))
+        {
+        single = false;
+        }
+    else
+        {
+        throw std::runtime_error("Particle array " + name + " must be a contiguous float32 or float64 array");
+        }
+
+    py::array a = py::reinterpret_borrow<py::array>(array);
+    if (size_t(a.size()) != size_t(N) * width)
+        {
+        throw std::runtime_error("Particle array " + name + " must have " + std::to_string(width) + " values for each of "
+                                 + std::to_string(N) + " particles");
+        }
+    view.setBuffer(a.data(), single);
+    }
+
+//! Set the buffer of an integer array of a snapshot view
+/*! \param view Array of the snapshot view
+    \param array Contiguous int32 or uint32 NumPy array
+    \param name Name of the array
+    \param N Number of particles
+*/
+template<class T>
+void setSnapshotViewBuffer(SnapshotIntView<T>& view, py::object array, const std::string& name, unsigned int N)
+    {
+    const unsigned int width = sizeof(T) / sizeof(int);
+    if (!py::array_t<int, py::array::c_style>::check_(array)
+        && !py::array_t<unsigned int, py::array::c_style>::check_(array))
+        {
+        throw std::runtime_error("Particle array " + name + " must be a contiguous int32 or uint32 array");
+        }
+
+    py::array a = py::reinterpret_borrow<py::array>(array);
+    if (size_t(a.size()) != size_t(N) * width)
+        {
+        throw std::runtime_error("Particle array " + name + " must have " + std::to_string(width) + " values for each of "
+                                 + std::to_string(N) + " particles");
+        }
+    view.setBuffer(a.data());
+    }
+    } // end anonymous namespace
+
+/*! \param N Number of particles
+    \param types Names of the particle types
+    \param arrays Per-particle arrays by the names of the SnapshotParticleData<double> properties (e.g. "position").
+        Missing and None arrays take the default values.
+*/
+SnapshotParticleDataView::SnapshotParticleDataView(unsigned int N, py::list types, py::dict arrays)
+    : pos(vec3<double>(0.0, 0.0, 0.0)),
+      vel(vec3<double>(0.0, 0.0, 0.0)),
+      accel(vec3<double>(0.0, 0.0, 0.0)),
+      type(0),
+      mass(1.0),
+      charge(0.0),
+      diameter(1.0),
+      image(make_int3(0, 0, 0)),
+      body(NO_BODY),
+      orientation(quat<double>(1.0, vec3<double>(0.0, 0.0, 0.0))),
+      angmom(quat<double>(0.0, vec3<double>(0.0, 0.0, 0.0))),
+      inertia(vec3<double>(0.0, 0.0, 0.0)),
+      size(N),
+      is_accel_set(false)
+    {
+    for (auto t : types)
+        type_mapping.push_back(py::cast<std::string>(t));
+
+    for (auto item : arrays)
+        {
+        std::string name = py::cast<std::string>(item.first);
+        py::object array = py::reinterpret_borrow<py::object>(item.second);
+        if (array.is_none())
+            continue;
+
+        if (name == "position")
+            setSnapshotViewBuffer(pos, array, name, N);
+        else if (name == "velocity")
+            setSnapshotViewBuffer(vel, array, name, N);
+        else if (name == "acceleration")
+            {
+            setSnapshotViewBuffer(accel, array, name, N);
+            is_accel_set = true;
+            }
+        else if (name == "typeid")
+            setSnapshotViewBuffer(type, array, name, N);
+        else if (name == "mass")
+            setSnapshotViewBuffer(mass, array, name, N);
+        else if (name == "charge")
+            setSnapshotViewBuffer(charge, array, name, N);
+        else if (name == "diameter")
+            setSnapshotViewBuffer(diameter, array, name, N);
+        else if (name == "image")
+            setSnapshotViewBuffer(image, array, name, N);
+        else if (name == "body")
+            setSnapshotViewBuffer(body, array, name, N);
+        else if (name == "orientation")
+            setSnapshotViewBuffer(orientation, array, name, N);
+        else if (name == "angmom")
+            setSnapshotViewBuffer(angmom, array, name, N);
+        else if (name == "moment_inertia")
+            setSnapshotViewBuffer(inertia, array, name, N);
+        else
+            throw std::runtime_error("Unknown particle array " + name);
+
+        // keep the array alive while it is viewed
+        m_arrays.push_back(array);
+        }
+    }
+
 void export_SnapshotParticleData(py::module& m)
     {
+    py::class_<SnapshotParticleDataView, std::shared_ptr<SnapshotParticleDataView> >(m,"SnapshotParticleDataView")
+    .def(py::init<unsigned int, py::list, py::dict>())
+    .def_readonly("N", &SnapshotParticleDataView::size)
+    ;
+
     py::class_<SnapshotParticleData<float>, std::shared_ptr<SnapshotParticleData<float> > >(m,"SnapshotParticleData_float")
     .def(py::init<unsigned int>())
     .def_property_readonly("position", &SnapshotParticleData<float>::getPosNP)
@@ -248,6 +248,161 @@ struct PYBIND11_EXPORT SnapshotParticleData {
     bool is_accel_set;                         //!< Flag indicating if accel is set
     };
 
+//! Read-only view of a per-particle array of floating point values in a caller-owned buffer
+/*! SnapshotRealView reads the elements of a contiguous buffer of single or double precision values with the layout
+    of the corresponding SnapshotParticleData<double> array (e.g. 3 values per particle for vec3<double>). Without a
+    buffer, every element has the default value.
+
+    \tparam T Element type: double, vec3<double>, or quat<double>
+*/
+template<class T>
+class SnapshotRealView
+    {
+    public:
+        //! Construct a view without a buffer
+        /*! \param value Default value of the elements
+         */
+        SnapshotRealView(const T& value)
+            : m_data(nullptr), m_single(false), m_value(value)
+            {
+            }
+
+        //! Set the buffer
+        /*! \param data Start of the buffer (not owned)
+            \param single True when the buffer stores single precision values
+         */
+        void setBuffer(const void* data, bool single)
+            {
+            m_data = data;
+            m_single = single;
+            }
+
+        //! Get an element
+        T operator[](unsigned int i) const
+            {
+            if (!m_data)
+                return m_value;
+
+            const unsigned int width = sizeof(T) / sizeof(double);
+            double v[4];
+            if (m_single)
+                {
+                const float* data = static_cast<const float*>(m_data) + size_t(i) * width;
+                for (unsigned int j = 0; j < width; ++j)
+                    v[j] = data[j];
+                }
+            else
+                {
+                const double* data = static_cast<const double*>(m_data) + size_t(i) * width;
+                for (unsigned int j = 0; j < width; ++j)
+                    v[j] = data[j];
+                }
+            return makeElement(v, (T*)nullptr);
+            }
+
+    private:
+        const void* m_data;     //!< Start of the buffer (may be null)
+        bool m_single;          //!< True when the buffer stores single precision values
+        T m_value;              //!< Value of the elements when there is no buffer
+
+        //! Construct the element from its values
+        static double makeElement(const double* v, double*)
+            {
+            return v[0];
+            }
+
+        //! Construct the element from its values
+        static vec3<double> makeElement(const double* v, vec3<double>*)
+            {
+            return vec3<double>(v[0], v[1], v[2]);
+            }
+
+        //! Construct the element from its values
+        static quat<double> makeElement(const double* v, quat<double>*)
+            {
+            return quat<double>(v[0], vec3<double>(v[1], v[2], v[3]));
+            }
+    };
+
+//! Read-only view of a per-particle array of 32-bit integers in a caller-owned buffer
+/*! \tparam T Element type: unsigned int or int3
+*/
+template<class T>
+class SnapshotIntView
+    {
+    public:
+        //! Construct a view without a buffer
+        /*! \param value Default value of the elements
+         */
+        SnapshotIntView(const T& value)
+            : m_data(nullptr), m_value(value)
+            {
+            }
+
+        //! Set the buffer
+        /*! \param data Start of the buffer (not owned)
+         */
+        void setBuffer(const void* data)
+            {
+            m_data = static_cast<const T*>(data);
+            }
+
+        //! Get an element
+        T operator[](unsigned int i) const
+            {
+            return m_data ? m_data[i] : m_value;
+            }
+
+    private:
+        const T* m_data;        //!< Start of the buffer (may be null)
+        T m_value;              //!< Value of the elements when there is no buffer
+    };
+
+//! Per-particle data in caller-owned buffers
+/*! SnapshotParticleDataView has the same members as SnapshotParticleData<double>, but its arrays read the contiguous
+    NumPy (or other buffer protocol) arrays given to the constructor in place. ParticleData initializes directly from
+    the view, so large systems can be set up from in-memory data (e.g. a gsd.hoomd.Snapshot) without first copying
+    every array into a SnapshotParticleData.
+
+    Floating point arrays may be single or double precision. Arrays that are not given take the same default values
+    as a resized SnapshotParticleData. The view keeps references to the arrays, which must not be resized while the
+    view exists.
+*/
+struct PYBIND11_EXPORT SnapshotParticleDataView
+    {
+    //! Construct a view of the given arrays
+    SnapshotParticleDataView(unsigned int N, pybind11::list types, pybind11::dict arrays);
+
+    //! Validate the view
+    /*! \returns true if there is a type mapping
+     */
+    bool validate() const
+        {
+        return type_mapping.size() > 0;
+        }
+
+    SnapshotRealView< vec3<double> > pos;      //!< positions
+    SnapshotRealView< vec3<double> > vel;      //!< velocities
+    SnapshotRealView< vec3<double> > accel;    //!< accelerations
+    SnapshotIntView<unsigned int> type;        //!< types
+    SnapshotRealView<double> mass;             //!< masses
+    SnapshotRealView<double> charge;           //!< charges
+    SnapshotRealView<double> diameter;         //!< diameters
+    SnapshotIntView<int3> image;               //!< images
+    SnapshotIntView<unsigned int> body;        //!< body ids
+    SnapshotRealView< quat<double> > orientation;  //!< orientations
+    SnapshotRealView< quat<double> > angmom;   //!< angular momentum quaternion
+    SnapshotRealView< vec3<double> > inertia;  //!< principal moments of inertia
+
+    unsigned int size;                         //!< number of particles in this snapshot
+    std::vector<std::string> type_mapping;     //!< Mapping between particle type ids and names
+
+    bool is_accel_set;                         //!< Flag indicating if accel is set
+
+    private:
+        std::vector<pybind11::object> m_arrays;    //!< References to the viewed arrays
+    };
+
 //! Structure to store packed particle data
 /* pdata_element is used for compact storage of particle data, mainly for communication.
  */
@@ -427,6 +582,14 @@ class PYBIND11_EXPORT ParticleData
                         = std::shared_ptr<DomainDecomposition>()
                      );
 
+        //! Construct from the arrays of a snapshot view
+        ParticleData(const SnapshotParticleDataView& snapshot,
+                     const BoxDim& global_box,
+                     std::shared_ptr<ExecutionConfiguration> exec_conf,
+                     std::shared_ptr<DomainDecomposition> decomposition
+                        = std::shared_ptr<DomainDecomposition>()
+                     );
+
         //! Destructor
         virtual ~ParticleData();
 
@@ -999,10 +1162,24 @@ class PYBIND11_EXPORT ParticleData
         template <class Real>
         void initializeFromSnapshot(const SnapshotParticleData<Real> & snapshot, bool ignore_bodies=false);
 
+        //! Initialize from the arrays of a snapshot view
+        void initializeFromSnapshot(const SnapshotParticleDataView& snapshot, bool ignore_bodies=false);
+
+        //! Update the given fields of all particles from a snapshot
+        template <class Real>
+        bool updateFromSnapshot(const SnapshotParticleData<Real>& snapshot, const std::vector<std::string>& fields,
+                                std::vector<uint2>& departures);
+
         //! Take a snapshot
         template <class Real>
         std::map<unsigned int, unsigned int> takeSnapshot(SnapshotParticleData<Real> &snapshot);
 
+        //! Gather one per-particle field of a range of particles in snapshot order on the root rank
+        void gatherSnapshotField(const std::string& field,
+                                 unsigned int first,
+                                 unsigned int last,
+                                 pybind11::object out);
+
         //! Add ghost particles at the end of the local particle data
         void addGhostParticles(const unsigned int nghosts);
 
@@ -1238,8 +1415,18 @@ class PYBIND11_EXPORT ParticleData
         /*! \return true If and only if all particles are in the simulation box
          * \param Snapshot to check
          */
-        template <class Real>
-        bool inBox(const SnapshotParticleData<Real>& snap);
+        template <class Snapshot>
+        bool inBox(const Snapshot& snap);
+
+        //! Helper function to construct the particle data from a snapshot or a snapshot view
+        template <class Snapshot>
+        void constructFromSnapshot(const Snapshot& snapshot,
+                                   const BoxDim& global_box,
+                                   std::shared_ptr<DomainDecomposition> decomposition);
+
+        //! Helper function to initialize from a snapshot or a snapshot view
+        template <class Snapshot>
+        void initializeFromParticles(const Snapshot& snapshot, bool ignore_bodies);
 
         //! Update the CUDA memory hints
         void setGPUAdvice();
@@ -250,6 +250,20 @@ class PYBIND11_EXPORT ParticleGroup
             return m_member_idx;
             }
 
+        //! Direct access to the membership flags
+        /*! \returns A GlobalArray indexed by particle index, with value 1 for members of the group and 0 otherwise
+            \note The caller \b must \b not write to or change the array.
+
+            \note This method CAN access the particle data tag array if the index is rebuilt.
+                  Hence, the tag array may not be accessed in the same scope in which this method is called.
+        */
+        const GlobalArray<unsigned int>& getMemberFlagArray() const
+            {
+            checkRebuild();
+
+            return m_is_member;
+            }
+
         #ifdef ENABLE_HIP
         //! Return the load balancing GPU partition
         const GPUPartition& getGPUPartition() const
@@ -24,7 +24,7 @@ namespace py = pybind11;
  */
 SFCPackTuner::SFCPackTuner(std::shared_ptr<SystemDefinition> sysdef,
                            std::shared_ptr<Trigger> trigger)
-        : Tuner(sysdef, trigger), m_last_grid(0), m_last_dim(0)
+        : Tuner(sysdef, trigger), m_last_grid(0), m_last_dim(0), m_adaptive(false)
     {
     m_exec_conf->msg->notice(5) << "Constructing SFCPackTuner" << endl;
 
@@ -41,6 +41,8 @@ SFCPackTuner::SFCPackTuner(std::shared_ptr<SystemDefinition> sysdef,
         m_grid = 4096;
     else
         m_grid = 256;
+    m_max_grid = m_grid;
+    resetGridScan();
 
     // register reallocate method with particle data maximum particle number change signal
     m_pdata->getMaxParticleNumberChangeSignal().connect<SFCPackTuner, &SFCPackTuner::reallocate>(this);
@@ -71,6 +73,16 @@ SFCPackTuner::~SFCPackTuner()
 void SFCPackTuner::update(uint64_t timestep)
     {
     Updater::update(timestep);
+
+    if (m_adaptive)
+        {
+        if (!checkAdaptiveSort(timestep))
+            return;
+
+        tuneGrid();
+        m_schedule.beginSort();
+        }
+
     m_exec_conf->msg->notice(6) << "SFCPackTuner: particle sort" << std::endl;
 
     #ifdef ENABLE_MPI
@@ -107,9 +119,92 @@ void SFCPackTuner::update(uint64_t timestep)
         }
     #endif
 
+    if (m_adaptive)
+        m_schedule.endSort();
+
     if (m_prof) m_prof->pop(m_exec_conf);
     }
 
+/*! \param timestep Current timestep of the simulation
+    \returns true when the particles should be sorted at this step
+
+    In MPI simulations, all ranks sort when any of them decides to.
+*/
+bool SFCPackTuner::checkAdaptiveSort(uint64_t timestep)
+    {
+    bool sort = m_schedule.shouldSort(timestep);
+
+    #ifdef ENABLE_MPI
+    if (m_comm)
+        {
+        int sort_any = sort;
+        MPI_Allreduce(MPI_IN_PLACE, &sort_any, 1, MPI_INT, MPI_MAX, m_exec_conf->getMPICommunicator());
+        sort = sort_any;
+        }
+    #endif
+
+    return sort;
+    }
+
+/*! Each candidate grid dimension is used for two sort cycles. Only the second one is measured, because the first
+    includes generating the traversal order of the new grid. After the scan, the grid with the lowest average time per
+    step is kept.
+
+    In MPI simulations, the root rank decides whether the scan advances and all ranks use the largest cycle cost, so
+    that every rank selects the same grid.
+*/
+void SFCPackTuner::tuneGrid()
+    {
+    if (m_grid_scan >= m_grid_candidates.size())
+        return;
+
+    bool has_cycle_cost = m_schedule.hasCycleCost();
+    double cycle_cost = has_cycle_cost ? m_schedule.getCycleCost() : 0.0;
+
+    #ifdef ENABLE_MPI
+    if (m_comm)
+        {
+        MPI_Allreduce(MPI_IN_PLACE, &cycle_cost, 1, MPI_DOUBLE, MPI_MAX, m_exec_conf->getMPICommunicator());
+        bcast(has_cycle_cost, 0, m_exec_conf->getMPICommunicator());
+        }
+    #endif
+
+    if (has_cycle_cost)
+        {
+        m_grid_scan_cycles++;
+        if (m_grid_scan_cycles == 2)
+            {
+            m_grid_cost[m_grid_scan] = cycle_cost;
+            m_grid_scan++;
+            m_grid_scan_cycles = 0;
+            }
+        }
+
+    if (m_grid_scan < m_grid_candidates.size())
+        {
+        m_grid = m_grid_candidates[m_grid_scan];
+        }
+    else
+        {
+        unsigned int best = (unsigned int)(std::min_element(m_grid_cost.begin(), m_grid_cost.end())
+                                           - m_grid_cost.begin());
+        m_grid = m_grid_candidates[best];
+        m_exec_conf->msg->notice(4) << "SFCPackTuner: selected grid " << m_grid << endl;
+        }
+    }
+
+void SFCPackTuner::resetGridScan()
+    {
+    m_grid_candidates.clear();
+    for (unsigned int grid = std::max(m_max_grid / 4, 1u); grid <= m_max_grid; grid *= 2)
+        {
+        m_grid_candidates.push_back(grid);
+        }
+    m_grid_cost.assign(m_grid_candidates.size(), 0.0);
+    m_grid_scan = 0;
+    m_grid_scan_cycles = 0;
+    }
+
 void SFCPackTuner::applySortOrder()
     {
     assert(m_pdata);
@@ -622,5 +717,8 @@ void export_SFCPackTuner(py::module& m)
                    std::shared_ptr<Trigger> >())
     .def_property("grid", &SFCPackTuner::getGrid,
                           &SFCPackTuner::setGridPython)
+    .def_property("adaptive", &SFCPackTuner::getAdaptive,
+                              &SFCPackTuner::setAdaptive)
+    .def_property_readonly("sort_interval", &SFCPackTuner::getSortInterval)
     ;
     }
@@ -14,6 +14,7 @@
 
 #include "Tuner.h"
 #include "GPUVector.h"
+#include "AdaptiveSortSchedule.h"
 
 #include <memory>
 #include <vector>
@@ -39,6 +40,13 @@
     defaults, which is as high as it can possibly go without consuming a significant amount of memory. The grid
     dimension can be changed by calling setGrid().
 
+    Adaptive sorting:<br>
+    When adaptive sorting is enabled with setAdaptive(), the steps selected by the trigger are only candidates and an
+    AdaptiveSortSchedule decides on which of them to sort from the measured time per step. After the first sort, the
+    tuner also scans the grid dimensions grid/4, grid/2, and grid (two sort cycles each, the first of which is
+    discarded because it includes generating the traversal order) and keeps the one with the lowest average time per
+    step.
+
     Implementation details:<br>
     The rearranging is done by computing bins for the particles, and then ordering the particles based on the order in
     which those bins appear along a hilbert curve. It is very efficient, even when the box size changes often as the
@@ -66,6 +74,8 @@ class PYBIND11_EXPORT SFCPackTuner : public Tuner
         void setGrid(unsigned int grid)
             {
             m_grid = (unsigned int)pow(2.0, ceil(log(double(grid)) / log(2.0)));;
+            m_max_grid = m_grid;
+            resetGridScan();
             }
 
         void setGridPython(pybind11::object grid)
@@ -81,8 +91,32 @@ class PYBIND11_EXPORT SFCPackTuner : public Tuner
             return m_grid;
             }
 
+        //! Set whether the sort steps are chosen adaptively among the steps selected by the trigger
+        void setAdaptive(bool adaptive)
+            {
+            if (adaptive && !m_adaptive)
+                {
+                m_schedule.reset();
+                resetGridScan();
+                }
+            m_adaptive = adaptive;
+            }
+
+        //! Get whether the sort steps are chosen adaptively
+        bool getAdaptive()
+            {
+            return m_adaptive;
+            }
+
+        //! Get the number of steps between the last two adaptive sorts
+        uint64_t getSortInterval()
+            {
+            return m_schedule.getLastInterval();
+            }
+
     protected:
         unsigned int m_grid;        //!< Grid dimension to use
+        unsigned int m_max_grid;    //!< Largest grid dimension tried in adaptive mode
         unsigned int m_last_grid;   //!< The last value of MMax
         unsigned int m_last_dim;    //!< Check the last dimension we ran at
         GPUArray< unsigned int > m_traversal_order;      //!< Generated traversal order of bins
@@ -104,11 +138,27 @@ class PYBIND11_EXPORT SFCPackTuner : public Tuner
         //! Reallocate internal arrays
         virtual void reallocate();
 
+        //! Decide whether to sort at this step in adaptive mode
+        bool checkAdaptiveSort(uint64_t timestep);
+
+        //! Choose the grid dimension for the next adaptive sort
+        void tuneGrid();
+
+        //! Restart the scan of grid dimensions
+        void resetGridScan();
+
     private:
         std::vector<unsigned int> m_sort_order;             //!< Generated sort order of the particles
         std::vector< std::pair<unsigned int, unsigned int> > m_particle_bins;    //!< Binned particles
         std::shared_ptr<Trigger> m_trigger;
 
+        bool m_adaptive;                                    //!< True when sorting adaptively
+        AdaptiveSortSchedule m_schedule;                    //!< Chooses the sort steps in adaptive mode
+        std::vector<unsigned int> m_grid_candidates;        //!< Grid dimensions to scan
+        std::vector<double> m_grid_cost;                    //!< Measured time per step of each candidate
+        unsigned int m_grid_scan;                           //!< Index of the candidate in use
+        unsigned int m_grid_scan_cycles;                    //!< Sort cycles completed with the candidate in use
+
    };
 
 //! Export the SFCPackTuner class to python
@@ -0,0 +1,77 @@
+// Copyright (c) 2009-2021 The Regents of the University of Michigan
+// This file is part of the HOOMD-blue project, released under the BSD 3-Clause License.
+
+#pragma once
+
+/*! \file SharedMemoryFrame.h
+    \brief Declares the layout of the shared memory ring buffer written by SharedMemoryWriter
+
+    This header only depends on the standard library so that reader processes can include it without HOOMD.
+
+    A segment starts with a SharedMemoryHeader, followed by n_fields SharedMemoryField descriptors and n_log log
+    quantity names of SHARED_MEMORY_NAME_LENGTH characters each. The n_frames frames start at frame_offset and are
+    frame_size bytes apart. Each frame starts with a SharedMemoryFrameHeader, followed by the n_log log quantities
+    (double) and the per-particle arrays at the offsets given by the field descriptors.
+
+    The writer protects each frame with a sequence counter. The counter is odd while the frame is written and even
+    once it is complete. A reader takes the latest frame, (n_written - 1) % n_frames, reads the counter, reads the
+    data, and reads the counter again. The data is consistent when both values are equal and even. The writer never
+    waits for the readers: a frame remains valid until the writer wraps around the ring buffer to it again.
+*/
+
+#include <atomic>
+#include <cstdint>
+
+//! Identifies a HOOMD shared memory segment
+const char SHARED_MEMORY_MAGIC[8] = "HOOMDSM";
+
+//! Version of the shared memory layout
+const uint32_t SHARED_MEMORY_VERSION = 1;
+
+//! Maximum length of the names in the shared memory segment (including the terminating null)
+const unsigned int SHARED_MEMORY_NAME_LENGTH = 64;
+
+//! Alignment of the frames and per-particle arrays in the shared memory segment
+const uint64_t SHARED_MEMORY_ALIGNMENT = 64;
+
+static_assert(sizeof(std::atomic<uint64_t>) == sizeof(uint64_t), "std::atomic<uint64_t> must not have a lock");
+
+//! Header at the start of the shared memory segment
+/*! magic is written last when the segment is created. Readers must not use a segment until it matches
+    SHARED_MEMORY_MAGIC.
+*/
+struct SharedMemoryHeader
+    {
+    char magic[8];                      //!< SHARED_MEMORY_MAGIC
+    uint32_t version;                   //!< SHARED_MEMORY_VERSION
+    uint32_t n_frames;                  //!< Number of frames in the ring buffer
+    uint64_t N;                         //!< Number of particles in each frame
+    uint64_t frame_offset;              //!< Offset of the first frame from the start of the segment
+    uint64_t frame_size;                //!< Distance between two frames
+    uint32_t n_fields;                  //!< Number of per-particle arrays in each frame
+    uint32_t n_log;                     //!< Number of log quantities in each frame
+    std::atomic<uint64_t> n_written;    //!< Number of frames written so far
+    };
+
+//! Descriptor of a per-particle array in each frame
+struct SharedMemoryField
+    {
+    char name[SHARED_MEMORY_NAME_LENGTH];   //!< Name of the array (e.g. "position")
+    char dtype[8];                          //!< NumPy type string of the elements (e.g. "<f4")
+    uint32_t width;                         //!< Number of elements per particle
+    uint32_t item_size;                     //!< Size of each element
+    uint64_t offset;                        //!< Offset of the array from the start of the frame
+    };
+
+//! Header at the start of each frame
+struct SharedMemoryFrameHeader
+    {
+    std::atomic<uint64_t> sequence;     //!< Odd while the frame is written, even when complete
+    uint64_t timestep;                  //!< Time step of the frame
+    double box[6];                      //!< Box of the frame (Lx, Ly, Lz, xy, xz, yz)
+    };
+
+// the readers rely on the sizes of the structures, so pin them
+static_assert(sizeof(SharedMemoryHeader) == 56, "Unexpected size of SharedMemoryHeader");
+static_assert(sizeof(SharedMemoryField) == 88, "Unexpected size of SharedMemoryField");
+static_assert(sizeof(SharedMemoryFrameHeader) == 64, "Unexpected size of SharedMemoryFrameHeader");
@@ -0,0 +1,430 @@
+// Copyright (c) 2009-2021 The Regents of the University of Michigan
+// This file is part of the HOOMD-blue project, released under the BSD 3-Clause License.
+
+/*! \file SharedMemoryWriter.cc
+    \brief Defines the SharedMemoryWriter class
+*/
+
+#include "SharedMemoryWriter.h"
+
+#ifdef ENABLE_MPI
+#include "HOOMDMPI.h"
+#endif
+
+#include <pybind11/stl.h>
+
+#include <cerrno>
+#include <cmath>
+#include <cstring>
+#include <fcntl.h>
+#include <limits>
+#include <stdexcept>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+
+namespace py = pybind11;
+
+using namespace std;
+
+//! Description of a per-particle array that SharedMemoryWriter can write
+struct SharedMemoryFieldSpec
+    {
+    const char* name;       //!< Name of the array
+    const char* dtype;      //!< NumPy type string of the elements
+    uint32_t width;         //!< Number of elements per particle
+    uint32_t item_size;     //!< Size of each element
+    };
+
+//! Per-particle arrays that SharedMemoryWriter can write
+static const SharedMemoryFieldSpec shared_memory_field_specs[] = {
+    {"position", "<f4", 3, 4},
+    {"image", "<i4", 3, 4},
+    {"velocity", "<f4", 3, 4},
+    {"orientation", "<f4", 4, 4},
+    {"angmom", "<f4", 4, 4},
+    {"typeid", "<u4", 1, 4},
+    };
+
+//! Round \a x up to a multiple of SHARED_MEMORY_ALIGNMENT
+static uint64_t align_shared_memory(uint64_t x)
+    {
+    return (x + SHARED_MEMORY_ALIGNMENT - 1) / SHARED_MEMORY_ALIGNMENT * SHARED_MEMORY_ALIGNMENT;
+    }
+
+/*! \param sysdef SystemDefinition containing the ParticleData to write
+    \param name Name of the shared memory segment (without the leading slash)
+    \param group Group of particles to include in the output
+    \param fields Per-particle arrays to include in each frame
+    \param n_frames Number of frames in the ring buffer
+    \param replace Replace an existing segment with the same name
+
+    The segment is not created until analyze() is called.
+*/
+SharedMemoryWriter::SharedMemoryWriter(std::shared_ptr<SystemDefinition> sysdef,
+                                       const std::string& name,
+                                       std::shared_ptr<ParticleGroup> group,
+                                       const std::vector<std::string>& fields,
+                                       unsigned int n_frames,
+                                       bool replace)
+    : Analyzer(sysdef), m_name(name), m_group(group), m_fields(fields), m_n_frames(n_frames), m_replace(replace),
+      m_is_initialized(false), m_N(0), m_n_written(0), m_frame_size(0), m_segment(nullptr), m_segment_size(0),
+      m_segment_dev(0), m_segment_ino(0)
+    {
+    m_exec_conf->msg->notice(5) << "Constructing SharedMemoryWriter: " << name << " " << n_frames << endl;
+
+    if (m_name.empty() || m_name.find('/') != string::npos || m_name.size() >= 255)
+        {
+        throw std::invalid_argument("Invalid shared memory name: " + m_name);
+        }
+    if (m_n_frames == 0)
+        {
+        throw std::invalid_argument("The shared memory ring buffer needs at least one frame");
+        }
+    for (const auto& field : m_fields)
+        {
+        bool found = false;
+        for (const auto& spec : shared_memory_field_specs)
+            found = found || (field == spec.name);
+        if (!found)
+            {
+            throw std::invalid_argument("Invalid shared memory field: " + field);
+            }
+        }
+
+    m_log_writer = pybind11::none();
+    }
+
+SharedMemoryWriter::~SharedMemoryWriter()
+    {
+    m_exec_conf->msg->notice(5) << "Destroying SharedMemoryWriter" << endl;
+    destroySegment();
+    }
+
+/*! The per-particle arrays follow the frame header and the log quantities, each aligned to
+    SHARED_MEMORY_ALIGNMENT.
+*/
+void SharedMemoryWriter::computeLayout()
+    {
+    m_layout.clear();
+    uint64_t offset = align_shared_memory(sizeof(SharedMemoryFrameHeader) + m_log_names.size() * sizeof(double));
+    for (const auto& field : m_fields)
+        {
+        for (const auto& spec : shared_memory_field_specs)
+            {
+            if (field != spec.name)
+                continue;
+
+            SharedMemoryField f;
+            memset(&f, 0, sizeof(f));
+            strncpy(f.name, spec.name, SHARED_MEMORY_NAME_LENGTH - 1);
+            strncpy(f.dtype, spec.dtype, sizeof(f.dtype) - 1);
+            f.width = spec.width;
+            f.item_size = spec.item_size;
+            f.offset = offset;
+            m_layout.push_back(f);
+
+            offset = align_shared_memory(offset + m_N * spec.width * spec.item_size);
+            }
+        }
+    m_frame_size = offset;
+    }
+
+/*! An existing segment with the same name may belong to another running simulation, so it is only replaced (e.g.
+    when a simulation that crashed left it behind) when m_replace is set.
+*/
+void SharedMemoryWriter::createSegment()
+    {
+    const uint64_t frame_offset = align_shared_memory(sizeof(SharedMemoryHeader)
+                                                      + m_layout.size() * sizeof(SharedMemoryField)
+                                                      + m_log_names.size() * SHARED_MEMORY_NAME_LENGTH);
+    m_segment_size = frame_offset + m_n_frames * m_frame_size;
+
+    const string path = "/" + m_name;
+    if (m_replace)
+        shm_unlink(path.c_str());
+    int fd = shm_open(path.c_str(), O_CREAT | O_EXCL | O_RDWR, 0644);
+    if (fd == -1 && errno == EEXIST)
+        {
+        m_exec_conf->msg->error() << "write.SharedMemory: " << path << " already exists and may be in use by another "
+                                  << "simulation. Choose a different name or set replace=True." << endl;
+        throw runtime_error("Error creating shared memory");
+        }
+    if (fd == -1)
+        {
+        m_exec_conf->msg->error() << "write.SharedMemory: unable to create " << path << ": " << strerror(errno) << endl;
+        throw runtime_error("Error creating shared memory");
+        }
+    if (ftruncate(fd, m_segment_size) == -1)
+        {
+        m_exec_conf->msg->error() << "write.SharedMemory: unable to resize " << path << ": " << strerror(errno) << endl;
+        close(fd);
+        shm_unlink(path.c_str());
+        throw runtime_error("Error creating shared memory");
+        }
+    // remember which segment is ours, another writer may replace it under the same name
+    struct stat st;
+    fstat(fd, &st);
+    m_segment_dev = st.st_dev;
+    m_segment_ino = st.st_ino;
+
+    void* ptr = mmap(nullptr, m_segment_size, PROT_READ | PROT_WRITE, MAP_SHARED, fd, 0);
+    close(fd);
+    if (ptr == MAP_FAILED)
+        {
+        m_exec_conf->msg->error() << "write.SharedMemory: unable to map " << path << ": " << strerror(errno) << endl;
+        shm_unlink(path.c_str());
+        throw runtime_error("Error creating shared memory");
+        }
+    m_segment = static_cast<char*>(ptr);
+
+    // ftruncate fills the segment with zeros, so the magic does not match until the header is complete
+    SharedMemoryHeader* header = reinterpret_cast<SharedMemoryHeader*>(m_segment);
+    header->version = SHARED_MEMORY_VERSION;
+    header->n_frames = m_n_frames;
+    header->N = m_N;
+    header->frame_offset = frame_offset;
+    header->frame_size = m_frame_size;
+    header->n_fields = (uint32_t)m_layout.size();
+    header->n_log = (uint32_t)m_log_names.size();
+    header->n_written.store(0, std::memory_order_relaxed);
+
+    char* cur = m_segment + sizeof(SharedMemoryHeader);
+    memcpy(cur, m_layout.data(), m_layout.size() * sizeof(SharedMemoryField));
+    cur += m_layout.size() * sizeof(SharedMemoryField);
+    for (const auto& log_name : m_log_names)
+        {
+        strncpy(cur, log_name.c_str(), SHARED_MEMORY_NAME_LENGTH - 1);
+        cur += SHARED_MEMORY_NAME_LENGTH;
+        }
+
+    std::atomic_thread_fence(std::memory_order_release);
+    memcpy(header->magic, SHARED_MEMORY_MAGIC, sizeof(header->magic));
+
+    m_exec_conf->msg->notice(3) << "write.SharedMemory: created " << path << " with " << m_n_frames << " frames of "
+                                << m_frame_size << " bytes" << endl;
+    }
+
+void SharedMemoryWriter::destroySegment()
+    {
+    if (m_segment)
+        {
+        munmap(m_segment, m_segment_size);
+        m_segment = nullptr;
+
+        // only unlink the segment when it is still ours
+        const string path = "/" + m_name;
+        int fd = shm_open(path.c_str(), O_RDONLY, 0);
+        if (fd != -1)
+            {
+            struct stat st;
+            bool ours = fstat(fd, &st) == 0 && st.st_dev == m_segment_dev && st.st_ino == m_segment_ino;
+            close(fd);
+            if (ours)
+                shm_unlink(path.c_str());
+            }
+        }
+    }
+
+/*! The log quantities are computed on all ranks because they may require collective communication.
+*/
+pybind11::dict SharedMemoryWriter::getLogQuantities()
+    {
+    if (m_log_writer.is_none())
+        return pybind11::dict();
+    return m_log_writer.attr("log")();
+    }
+
+/*! \param frame Start of the frame to write
+    \param timestep Current time step of the simulation
+    \param snapshot Particle data snapshot
+    \param map Map from particle tags to snapshot indices
+    \param log Values of the log quantities
+
+    The sequence counter of the frame is odd while the frame is written, so readers can detect frames that change
+    while they read them.
+*/
+void SharedMemoryWriter::writeFrame(char* frame,
+                                    uint64_t timestep,
+                                    const SnapshotParticleData<float>& snapshot,
+                                    const std::map<unsigned int, unsigned int>& map,
+                                    pybind11::dict log)
+    {
+    SharedMemoryFrameHeader* frame_header = reinterpret_cast<SharedMemoryFrameHeader*>(frame);
+    const uint64_t sequence = frame_header->sequence.load(std::memory_order_relaxed);
+    frame_header->sequence.store(sequence + 1, std::memory_order_relaxed);
+    std::atomic_thread_fence(std::memory_order_release);
+
+    frame_header->timestep = timestep;
+    const BoxDim& box = m_pdata->getGlobalBox();
+    const Scalar3 L = box.getL();
+    frame_header->box[0] = L.x;
+    frame_header->box[1] = L.y;
+    frame_header->box[2] = L.z;
+    frame_header->box[3] = box.getTiltFactorXY();
+    frame_header->box[4] = box.getTiltFactorXZ();
+    frame_header->box[5] = box.getTiltFactorYZ();
+
+    double* log_values = reinterpret_cast<double*>(frame + sizeof(SharedMemoryFrameHeader));
+    for (unsigned int i = 0; i < m_log_names.size(); ++i)
+        {
+        py::str key(m_log_names[i]);
+        if (log.contains(key))
+            log_values[i] = log[key].cast<double>();
+        else
+            log_values[i] = std::numeric_limits<double>::quiet_NaN();
+        }
+
+    // look up the snapshot indices of the group members once for all arrays
+    std::vector<unsigned int> index(m_N);
+    for (unsigned int group_idx = 0; group_idx < m_N; group_idx++)
+        {
+        unsigned int t = m_group->getMemberTag(group_idx);
+
+        // look up tag in snapshot
+        auto it = map.find(t);
+        assert(it != map.end());
+        index[group_idx] = it->second;
+        }
+
+    for (const auto& field : m_layout)
+        {
+        const string name(field.name);
+        char* data = frame + field.offset;
+        if (name == "position" || name == "velocity")
+            {
+            const std::vector< vec3<float> >& src = (name == "position") ? snapshot.pos : snapshot.vel;
+            float* out = reinterpret_cast<float*>(data);
+            for (unsigned int group_idx = 0; group_idx < m_N; group_idx++)
+                {
+                const vec3<float>& v = src[index[group_idx]];
+                out[group_idx*3+0] = v.x;
+                out[group_idx*3+1] = v.y;
+                out[group_idx*3+2] = v.z;
+                }
+            }
+        else if (name == "orientation" || name == "angmom")
+            {
+            const std::vector< quat<float> >& src = (name == "orientation") ? snapshot.orientation : snapshot.angmom;
+            float* out = reinterpret_cast<float*>(data);
+            for (unsigned int group_idx = 0; group_idx < m_N; group_idx++)
+                {
+                const quat<float>& q = src[index[group_idx]];
+                out[group_idx*4+0] = q.s;
+                out[group_idx*4+1] = q.v.x;
+                out[group_idx*4+2] = q.v.y;
+                out[group_idx*4+3] = q.v.z;
+                }
+            }
+        else if (name == "image")
+            {
+            int32_t* out = reinterpret_cast<int32_t*>(data);
+            for (unsigned int group_idx = 0; group_idx < m_N; group_idx++)
+                {
+                const int3& image = snapshot.image[index[group_idx]];
+                out[group_idx*3+0] = image.x;
+                out[group_idx*3+1] = image.y;
+                out[group_idx*3+2] = image.z;
+                }
+            }
+        else if (name == "typeid")
+            {
+            uint32_t* out = reinterpret_cast<uint32_t*>(data);
+            for (unsigned int group_idx = 0; group_idx < m_N; group_idx++)
+                out[group_idx] = snapshot.type[index[group_idx]];
+            }
+        }
+
+    frame_header->sequence.store(sequence + 2, std::memory_order_release);
+    }
+
+/*! \param timestep Current time step of the simulation
+
+    The first call to analyze() creates the segment. The names of the log quantities in the first frame are fixed for
+    the lifetime of the segment: quantities that are added later are not written, and quantities that are removed
+    are written as NaN.
+*/
+void SharedMemoryWriter::analyze(uint64_t timestep)
+    {
+    Analyzer::analyze(timestep);
+    bool root = true;
+
+    if (m_prof)
+        m_prof->push("Shared memory");
+
+    // take particle data snapshot
+    std::shared_ptr< const SharedParticleSnapshot<float> > particles = m_sysdef->getParticleSnapshot<float>();
+    const SnapshotParticleData<float>& snapshot = particles->snapshot;
+    const std::map<unsigned int, unsigned int>& map = particles->map;
+    py::dict log = getLogQuantities();
+
+#ifdef ENABLE_MPI
+    root = m_exec_conf->isRoot();
+#endif
+
+    const uint64_t N = m_group->getNumMembersGlobal();
+    if (!m_is_initialized)
+        {
+        m_N = N;
+        m_log_names.clear();
+        for (auto item : log)
+            m_log_names.push_back(item.first.cast<string>());
+        computeLayout();
+
+        // fail on all ranks together when the root rank cannot create the segment
+        bool created = true;
+        if (root)
+            {
+            try
+                {
+                createSegment();
+                }
+            catch (const std::exception&)
+                {
+                created = false;
+                }
+            }
+#ifdef ENABLE_MPI
+        bcast(created, 0, m_exec_conf->getMPICommunicator());
+#endif
+        if (!created)
+            throw runtime_error("Error creating shared memory");
+        m_is_initialized = true;
+        }
+    else if (N != m_N)
+        {
+        m_exec_conf->msg->error() << "write.SharedMemory: Change in number of particles unsupported by the shared "
+                                  << "memory layout." << endl;
+        throw runtime_error("Error writing shared memory");
+        }
+
+    if (root)
+        {
+        SharedMemoryHeader* header = reinterpret_cast<SharedMemoryHeader*>(m_segment);
+        char* frame = m_segment + header->frame_offset + (m_n_written % m_n_frames) * m_frame_size;
+        writeFrame(frame, timestep, snapshot, map, log);
+        header->n_written.store(m_n_written + 1, std::memory_order_release);
+        }
+    m_n_written++;
+
+    if (m_prof)
+        m_prof->pop();
+    }
+
+void export_SharedMemoryWriter(py::module& m)
+    {
+    py::class_<SharedMemoryWriter, Analyzer, std::shared_ptr<SharedMemoryWriter> >(m, "SharedMemoryWriter")
+    .def(py::init< std::shared_ptr<SystemDefinition>,
+                   std::string,
+                   std::shared_ptr<ParticleGroup>,
+                   std::vector<std::string>,
+                   unsigned int,
+                   bool >())
+    .def_property_readonly("name", &SharedMemoryWriter::getName)
+    .def_property_readonly("dynamic", &SharedMemoryWriter::getDynamic)
+    .def_property_readonly("n_frames", &SharedMemoryWriter::getNFrames)
+    .def_property_readonly("replace", &SharedMemoryWriter::getReplace)
+    .def_property_readonly("n_written", &SharedMemoryWriter::getNWritten)
+    .def_property("log_writer", &SharedMemoryWriter::getLogWriter, &SharedMemoryWriter::setLogWriter)
+    ;
+    }
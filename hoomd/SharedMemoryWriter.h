@@ -0,0 +1,137 @@
+// Copyright (c) 2009-2021 The Regents of the University of Michigan
+// This file is part of the HOOMD-blue project, released under the BSD 3-Clause License.
+
+#pragma once
+
+#include "Analyzer.h"
+#include "ParticleGroup.h"
+#include "SharedMemoryFrame.h"
+
+#include <string>
+#include <memory>
+#include <sys/types.h>
+#include <vector>
+
+/*! \file SharedMemoryWriter.h
+    \brief Declares the SharedMemoryWriter class
+*/
+
+#ifdef __HIPCC__
+#error This header cannot be compiled by nvcc
+#endif
+
+#include <pybind11/pybind11.h>
+
+//! Analyzer for publishing frames in a POSIX shared memory ring buffer
+/*! SharedMemoryWriter copies the selected per-particle arrays of the particles in the group, the box, and scalar
+    log quantities into the next frame of a ring buffer in a POSIX shared memory segment every time analyze() is
+    called. Other processes on the same node map the segment and read the latest frame without copying it and without
+    blocking the writer. See SharedMemoryFrame.h for the layout of the segment.
+
+    The segment is created on the root rank by the first call to analyze(), when the number of particles and the
+    names of the log quantities are known, and it is unlinked when the writer is destroyed. An existing segment with
+    the same name is an error unless the writer is constructed with replace set. Readers that still map the segment
+    keep it alive until they unmap it.
+
+    \ingroup analyzers
+*/
+class PYBIND11_EXPORT SharedMemoryWriter : public Analyzer
+    {
+    public:
+        //! Construct the writer
+        SharedMemoryWriter(std::shared_ptr<SystemDefinition> sysdef,
+                           const std::string& name,
+                           std::shared_ptr<ParticleGroup> group,
+                           const std::vector<std::string>& fields,
+                           unsigned int n_frames,
+                           bool replace);
+
+        //! Destructor
+        ~SharedMemoryWriter();
+
+        //! Publish the data for the current timestep
+        void analyze(uint64_t timestep);
+
+        //! Get the name of the shared memory segment
+        std::string getName() const
+            {
+            return m_name;
+            }
+
+        //! Get the per-particle arrays in each frame
+        std::vector<std::string> getDynamic() const
+            {
+            return m_fields;
+            }
+
+        //! Get the number of frames in the ring buffer
+        unsigned int getNFrames() const
+            {
+            return m_n_frames;
+            }
+
+        //! Get whether an existing segment with the same name is replaced
+        bool getReplace() const
+            {
+            return m_replace;
+            }
+
+        //! Get the number of frames written so far
+        uint64_t getNWritten() const
+            {
+            return m_n_written;
+            }
+
+        //! Set the python object that provides the log quantities
+        void setLogWriter(pybind11::object log_writer)
+            {
+            m_log_writer = log_writer;
+            }
+
+        //! Get the python object that provides the log quantities
+        pybind11::object getLogWriter() const
+            {
+            return m_log_writer;
+            }
+
+    private:
+        std::string m_name;                             //!< Name of the shared memory segment
+        std::shared_ptr<ParticleGroup> m_group;         //!< Group of particles to write
+        std::vector<std::string> m_fields;              //!< Per-particle arrays to write
+        unsigned int m_n_frames;                        //!< Number of frames in the ring buffer
+        bool m_replace;                                 //!< Replace an existing segment with the same name
+        pybind11::object m_log_writer;                  //!< Python object that provides the log quantities
+
+        bool m_is_initialized;                          //!< True once the segment is created
+        uint64_t m_N;                                   //!< Number of particles in each frame
+        uint64_t m_n_written;                           //!< Number of frames written
+        std::vector<std::string> m_log_names;           //!< Names of the log quantities in each frame
+        std::vector<SharedMemoryField> m_layout;        //!< Descriptors of the per-particle arrays
+        uint64_t m_frame_size;                          //!< Distance between two frames
+        char* m_segment;                                //!< Start of the mapped segment (root rank only)
+        uint64_t m_segment_size;                        //!< Size of the mapped segment
+        dev_t m_segment_dev;                            //!< Device of the segment created by this writer
+        ino_t m_segment_ino;                            //!< Inode of the segment created by this writer
+
+        //! Compute the layout of the frames
+        void computeLayout();
+
+        //! Create and map the shared memory segment
+        void createSegment();
+
+        //! Unmap and unlink the shared memory segment
+        void destroySegment();
+
+        //! Get the values of the log quantities from python
+        pybind11::dict getLogQuantities();
+
+        //! Write one frame into the ring buffer
+        void writeFrame(char* frame,
+                        uint64_t timestep,
+                        const SnapshotParticleData<float>& snapshot,
+                        const std::map<unsigned int, unsigned int>& map,
+                        pybind11::dict log);
+    };
+
+//! Exports the SharedMemoryWriter class to python
+void export_SharedMemoryWriter(pybind11::module& m);
@@ -34,6 +34,29 @@ namespace py = pybind11;
 
 PyObject* walltimeLimitExceptionTypeObj = 0;
 
+//! Shares the particle data snapshots between the analyzers of a time step while in scope
+/*! The snapshots are released when the analyzers finish, also when one of them throws.
+*/
+class SnapshotCacheScope
+    {
+    public:
+        //! Open the snapshot cache of \a sysdef for \a timestep
+        SnapshotCacheScope(std::shared_ptr<SystemDefinition> sysdef, uint64_t timestep)
+            : m_sysdef(sysdef)
+            {
+            m_sysdef->openSnapshotCache(timestep);
+            }
+
+        //! Release the snapshot cache
+        ~SnapshotCacheScope()
+            {
+            m_sysdef->releaseSnapshotCache();
+            }
+
+    private:
+        std::shared_ptr<SystemDefinition> m_sysdef; //!< System definition that holds the cache
+    };
+
 /*! \param sysdef SystemDefinition for the system to be simulated
     \param initial_tstep Initial time step of the simulation
 
@@ -121,6 +144,7 @@ void System::run(uint64_t nsteps, bool write_at_start)
     // execute analyzers on initial step if requested
     if (write_at_start)
         {
+        SnapshotCacheScope snapshot_cache(m_sysdef, m_cur_tstep);
         for (auto &analyzer_trigger_pair: m_analyzers)
             {
             if ((*analyzer_trigger_pair.second)(m_cur_tstep))
@@ -154,11 +178,15 @@ void System::run(uint64_t nsteps, bool write_at_start)
 
         m_cur_tstep++;
 
-        // execute analyzers after incrementing the step counter
-        for (auto &analyzer_trigger_pair: m_analyzers)
+        // execute analyzers after incrementing the step counter, sharing one particle data snapshot between the
+        // writers of this step
             {
-            if ((*analyzer_trigger_pair.second)(m_cur_tstep))
-                analyzer_trigger_pair.first->analyze(m_cur_tstep);
+            SnapshotCacheScope snapshot_cache(m_sysdef, m_cur_tstep);
+            for (auto &analyzer_trigger_pair: m_analyzers)
+                {
+                if ((*analyzer_trigger_pair.second)(m_cur_tstep))
+                    analyzer_trigger_pair.first->analyze(m_cur_tstep);
+                }
             }
 
         updateTPS();
@@ -11,6 +11,10 @@
 #include "SystemDefinition.h"
 
 #include "SnapshotSystemData.h"
+#include "CellList.h"
+
+#include <algorithm>
+#include <pybind11/stl.h>
 
 #ifdef ENABLE_MPI
 #include "Communicator.h"
@@ -80,6 +84,40 @@ SystemDefinition::SystemDefinition(std::shared_ptr< SnapshotSystemData<Real> > s
                  exec_conf,
                  decomposition));
 
+    initializeTopology(snapshot, exec_conf);
+    }
+
+/*! \param snapshot Snapshot with the box, the dimensions, and the bonded data. Its particle data is ignored.
+    \param particles View of the particle data arrays
+    \param exec_conf Execution configuration to run on
+    \param decomposition (optional) The domain decomposition layout
+
+    The particle data is initialized directly from the arrays of the view, without an intermediate
+    SnapshotParticleData.
+*/
+SystemDefinition::SystemDefinition(std::shared_ptr< SnapshotSystemData<double> > snapshot,
+                                   std::shared_ptr<SnapshotParticleDataView> particles,
+                                   std::shared_ptr<ExecutionConfiguration> exec_conf,
+                                   std::shared_ptr<DomainDecomposition> decomposition)
+    {
+    setNDimensions(snapshot->dimensions);
+
+    m_particle_data = std::shared_ptr<ParticleData>(new ParticleData(*particles,
+                 snapshot->global_box,
+                 exec_conf,
+                 decomposition));
+
+    initializeTopology(snapshot, exec_conf);
+    }
+
+/*! \param snapshot Snapshot with the dimensions and the bonded data
+    \param exec_conf Execution configuration to run on
+    \pre m_particle_data is initialized
+*/
+template <class Real>
+void SystemDefinition::initializeTopology(std::shared_ptr< SnapshotSystemData<Real> > snapshot,
+                                          std::shared_ptr<ExecutionConfiguration> exec_conf)
+    {
     #ifdef ENABLE_MPI
     // in MPI simulations, broadcast dimensionality from rank zero
     if (m_particle_data->getDomainDecomposition())
@@ -132,7 +170,17 @@ std::shared_ptr< SnapshotSystemData<Real> > SystemDefinition::takeSnapshot()
     snap->dimensions = m_n_dimensions;
     snap->global_box = m_particle_data->getGlobalBox();
 
-    snap->map = m_particle_data->takeSnapshot(snap->particle_data);
+    if (m_snapshot_cache_open)
+        {
+        // copy the particle data shared with the analyzers of this step instead of gathering it again
+        std::shared_ptr< const SharedParticleSnapshot<Real> > particles = getParticleSnapshot<Real>();
+        snap->particle_data = particles->snapshot;
+        snap->map = particles->map;
+        }
+    else
+        {
+        snap->map = m_particle_data->takeSnapshot(snap->particle_data);
+        }
     m_bond_data->takeSnapshot(snap->bond_data);
     m_angle_data->takeSnapshot(snap->angle_data);
     m_dihedral_data->takeSnapshot(snap->dihedral_data);
@@ -149,6 +197,10 @@ void SystemDefinition::initializeFromSnapshot(std::shared_ptr< SnapshotSystemDat
     {
     std::shared_ptr<const ExecutionConfiguration> exec_conf = m_particle_data->getExecConf();
 
+    // the shared snapshots no longer match the particle data
+    m_snapshot_float.reset();
+    m_snapshot_double.reset();
+
     m_n_dimensions = snapshot->dimensions;
 
     #ifdef ENABLE_MPI
@@ -167,18 +219,127 @@ void SystemDefinition::initializeFromSnapshot(std::shared_ptr< SnapshotSystemDat
     m_pair_data->initializeFromSnapshot(snapshot->pair_data);
     }
 
+/*! \param snapshot Snapshot with the new values
+    \param fields Names of the per-particle fields to update (see ParticleData::updateFromSnapshot())
+
+    Only the given per-particle fields change. The box, the bonded groups, and the particle types remain as they are.
+    In MPI simulations, when particles move to other domains, their bonded groups follow them in one all-to-all
+    exchange per group type instead of following each particle separately.
+*/
+template <class Real>
+void SystemDefinition::updateFromSnapshot(std::shared_ptr< SnapshotSystemData<Real> > snapshot,
+                                          const std::vector<std::string>& fields)
+    {
+    // the shared snapshots no longer match the particle data
+    m_snapshot_float.reset();
+    m_snapshot_double.reset();
+
+    std::vector<uint2> departures;
+    bool moved = m_particle_data->updateFromSnapshot(snapshot->particle_data, fields, departures);
+
+    #ifdef ENABLE_MPI
+    if (moved)
+        {
+        m_bond_data->migrateParticleGroups(departures);
+        m_angle_data->migrateParticleGroups(departures);
+        m_dihedral_data->migrateParticleGroups(departures);
+        m_improper_data->migrateParticleGroups(departures);
+        m_constraint_data->migrateParticleGroups(departures);
+        m_pair_data->migrateParticleGroups(departures);
+        }
+    #endif
+    }
+
+/*! \returns A snapshot of the particle data and the map from tags to snapshot indices
+
+    Taking a snapshot gathers the particle data on the root rank, which is expensive. While the cache is open (see
+    openSnapshotCache()), the first caller of each precision takes the snapshot and later callers get the same one.
+    Otherwise, every call takes a new snapshot. Like ParticleData::takeSnapshot(), this method must be called
+    collectively on all ranks. Callers must not keep the snapshot beyond the current time step.
+*/
+template <class Real>
+std::shared_ptr< const SharedParticleSnapshot<Real> > SystemDefinition::getParticleSnapshot()
+    {
+    std::shared_ptr< SharedParticleSnapshot<Real> >& slot = getSnapshotSlot(Real(0));
+    if (m_snapshot_cache_open && slot)
+        return slot;
+
+    std::shared_ptr< SharedParticleSnapshot<Real> > snapshot(new SharedParticleSnapshot<Real>);
+    snapshot->map = m_particle_data->takeSnapshot(snapshot->snapshot);
+    if (m_snapshot_cache_open)
+        slot = snapshot;
+    return snapshot;
+    }
+
+/*! \param timestep Current time step
+
+    System opens the cache before it calls the analyzers of a time step and releases it after they finish. The
+    particle data must not change while the cache is open.
+*/
+void SystemDefinition::openSnapshotCache(uint64_t timestep)
+    {
+    releaseSnapshotCache();
+    m_snapshot_cache_open = true;
+    m_particle_data->getExecConf()->msg->notice(10) << "Sharing particle data snapshots at step " << timestep
+                                                    << std::endl;
+    }
+
+void SystemDefinition::releaseSnapshotCache()
+    {
+    m_snapshot_cache_open = false;
+    m_snapshot_float.reset();
+    m_snapshot_double.reset();
+    }
+
+/*! \param request Cell list configured as the caller needs it
+    \param width_tolerance Relative amount by which the cells of a shared list may be wider than requested
+
+    \returns A live cell list compatible with \a request (see CellList::isCompatible()), or \a request itself when
+    there is none. In the latter case, \a request becomes available to later callers.
+
+    Operations that bin particles the same way (e.g. several neighbor lists with the same cutoff, or analysis that
+    needs the same cells as the pair forces) then share one cell list, which computes only once per time step.
+    SystemDefinition holds only weak references: a shared cell list lives as long as one of its users does. Callers
+    must not change the parameters of the returned cell list; request a new one instead.
+*/
+std::shared_ptr<CellList> SystemDefinition::getSharedCellList(std::shared_ptr<CellList> request,
+                                                              Scalar width_tolerance)
+    {
+    // forget about cell lists that are no longer in use
+    m_cell_lists.erase(std::remove_if(m_cell_lists.begin(),
+                                      m_cell_lists.end(),
+                                      [](const std::weak_ptr<CellList>& cl) { return cl.expired(); }),
+                       m_cell_lists.end());
+
+    for (auto& weak_cl : m_cell_lists)
+        {
+        std::shared_ptr<CellList> cl = weak_cl.lock();
+        if (cl->isCompatible(*request, width_tolerance))
+            return cl;
+        }
+
+    m_cell_lists.push_back(request);
+    return request;
+    }
+
 // instantiate both float and double methods
 template SystemDefinition::SystemDefinition(std::shared_ptr< SnapshotSystemData<float> > snapshot,
                                                    std::shared_ptr<ExecutionConfiguration> exec_conf,
                                                    std::shared_ptr<DomainDecomposition> decomposition);
 template std::shared_ptr< SnapshotSystemData<float> > SystemDefinition::takeSnapshot<float>();
+template std::shared_ptr< const SharedParticleSnapshot<float> > SystemDefinition::getParticleSnapshot<float>();
 template void SystemDefinition::initializeFromSnapshot<float>(std::shared_ptr< SnapshotSystemData<float> > snapshot);
+template void SystemDefinition::updateFromSnapshot<float>(std::shared_ptr< SnapshotSystemData<float> > snapshot,
+                                                         const std::vector<std::string>& fields);
 
 template SystemDefinition::SystemDefinition(std::shared_ptr< SnapshotSystemData<double> > snapshot,
                                                    std::shared_ptr<ExecutionConfiguration> exec_conf,
                                                    std::shared_ptr<DomainDecomposition> decomposition);
 template std::shared_ptr< SnapshotSystemData<double> > SystemDefinition::takeSnapshot<double>();
+template std::shared_ptr< const SharedParticleSnapshot<double> > SystemDefinition::getParticleSnapshot<double>();
 template void SystemDefinition::initializeFromSnapshot<double>(std::shared_ptr< SnapshotSystemData<double> > snapshot);
+template void SystemDefinition::updateFromSnapshot<double>(std::shared_ptr< SnapshotSystemData<double> > snapshot,
+                                                         const std::vector<std::string>& fields);
 
 void export_SystemDefinition(py::module& m)
     {
@@ -190,6 +351,8 @@ void export_SystemDefinition(py::module& m)
     .def(py::init<std::shared_ptr< SnapshotSystemData<float> >, std::shared_ptr<ExecutionConfiguration> >())
     .def(py::init<std::shared_ptr< SnapshotSystemData<double> >, std::shared_ptr<ExecutionConfiguration>, std::shared_ptr<DomainDecomposition> >())
     .def(py::init<std::shared_ptr< SnapshotSystemData<double> >, std::shared_ptr<ExecutionConfiguration> >())
+    .def(py::init<std::shared_ptr< SnapshotSystemData<double> >, std::shared_ptr<SnapshotParticleDataView>, std::shared_ptr<ExecutionConfiguration>, std::shared_ptr<DomainDecomposition> >())
+    .def(py::init<std::shared_ptr< SnapshotSystemData<double> >, std::shared_ptr<SnapshotParticleDataView>, std::shared_ptr<ExecutionConfiguration> >())
     .def("setNDimensions", &SystemDefinition::setNDimensions)
     .def("getNDimensions", &SystemDefinition::getNDimensions)
     .def("getParticleData", &SystemDefinition::getParticleData)
@@ -200,10 +363,13 @@ void export_SystemDefinition(py::module& m)
     .def("getConstraintData", &SystemDefinition::getConstraintData)
     .def("getIntegratorData", &SystemDefinition::getIntegratorData)
     .def("getPairData", &SystemDefinition::getPairData)
+    .def("getSharedCellList", &SystemDefinition::getSharedCellList)
     .def("takeSnapshot_float", &SystemDefinition::takeSnapshot<float>)
     .def("takeSnapshot_double", &SystemDefinition::takeSnapshot<double>)
     .def("initializeFromSnapshot", &SystemDefinition::initializeFromSnapshot<float>)
     .def("initializeFromSnapshot", &SystemDefinition::initializeFromSnapshot<double>)
+    .def("updateFromSnapshot", &SystemDefinition::updateFromSnapshot<float>)
+    .def("updateFromSnapshot", &SystemDefinition::updateFromSnapshot<double>)
     .def("getSeed", &SystemDefinition::getSeed)
     .def("setSeed", &SystemDefinition::setSeed)
     ;
@@ -16,7 +16,9 @@
 #include "IntegratorData.h"
 #include "BondedGroupData.h"
 
+#include <map>
 #include <memory>
+#include <vector>
 #include <pybind11/pybind11.h>
 
 
@@ -32,6 +34,19 @@ class Communicator;
 //! Forward declaration of SnapshotSystemData
 template <class Real> struct SnapshotSystemData;
 
+//! Forward declaration of CellList
+class CellList;
+
+//! Particle data snapshot shared between the analyzers of one time step
+/*! \sa SystemDefinition::getParticleSnapshot()
+*/
+template <class Real>
+struct SharedParticleSnapshot
+    {
+    SnapshotParticleData<Real> snapshot;        //!< Snapshot of the particle data (on the root rank)
+    std::map<unsigned int, unsigned int> map;   //!< Map from particle tags to snapshot indices
+    };
+
 //! Container class for all data needed to define the MD system
 /*! SystemDefinition is a big bucket where all of the data defining the MD system goes.
     Everything is stored as a shared pointer for quick and easy access from within C++
@@ -91,6 +106,12 @@ class PYBIND11_EXPORT SystemDefinition
                          std::shared_ptr<ExecutionConfiguration> exec_conf=std::shared_ptr<ExecutionConfiguration>(new ExecutionConfiguration()),
                          std::shared_ptr<DomainDecomposition> decomposition=std::shared_ptr<DomainDecomposition>());
 
+        //! Construct from a snapshot of the box and topology and a view of the particle data
+        SystemDefinition(std::shared_ptr<SnapshotSystemData<double> > snapshot,
+                         std::shared_ptr<SnapshotParticleDataView> particles,
+                         std::shared_ptr<ExecutionConfiguration> exec_conf,
+                         std::shared_ptr<DomainDecomposition> decomposition=std::shared_ptr<DomainDecomposition>());
+
         //! Set the dimensionality of the system
         void setNDimensions(unsigned int);
 
@@ -167,14 +188,33 @@ class PYBIND11_EXPORT SystemDefinition
             return m_pair_data;
             }
 
+        //! Get a cell list shared with other operations that bin particles the same way
+        std::shared_ptr<CellList> getSharedCellList(std::shared_ptr<CellList> request,
+                                                    Scalar width_tolerance=Scalar(0.0));
+
         //! Return a snapshot of the current system data
         template <class Real>
         std::shared_ptr< SnapshotSystemData<Real> > takeSnapshot();
 
+        //! Get a snapshot of the particle data, shared with other callers in the same time step
+        template <class Real>
+        std::shared_ptr< const SharedParticleSnapshot<Real> > getParticleSnapshot();
+
+        //! Share the particle data snapshots taken until releaseSnapshotCache() between the callers
+        void openSnapshotCache(uint64_t timestep);
+
+        //! Release the shared particle data snapshots and stop sharing them
+        void releaseSnapshotCache();
+
         //! Re-initialize the system from a snapshot
         template <class Real>
         void initializeFromSnapshot(std::shared_ptr< SnapshotSystemData<Real> > snapshot);
 
+        //! Update the given per-particle fields from a snapshot and keep everything else
+        template <class Real>
+        void updateFromSnapshot(std::shared_ptr< SnapshotSystemData<Real> > snapshot,
+                                const std::vector<std::string>& fields);
+
     private:
         unsigned int m_n_dimensions;                        //!< Dimensionality of the system
         uint16_t m_seed=0;                                  //!< Random number seed
@@ -186,6 +226,28 @@ class PYBIND11_EXPORT SystemDefinition
         std::shared_ptr<ConstraintData> m_constraint_data;//!< Improper data for the system
         std::shared_ptr<IntegratorData> m_integrator_data;    //!< Integrator data for the system
         std::shared_ptr<PairData> m_pair_data;            //!< Special pairs data for the system
+        std::vector< std::weak_ptr<CellList> > m_cell_lists; //!< Cell lists shared between operations
+
+        bool m_snapshot_cache_open=false;                   //!< True while snapshots are shared
+        std::shared_ptr< SharedParticleSnapshot<float> > m_snapshot_float;   //!< Shared single precision snapshot
+        std::shared_ptr< SharedParticleSnapshot<double> > m_snapshot_double; //!< Shared double precision snapshot
+
+        //! Get the shared snapshot slot of a precision
+        std::shared_ptr< SharedParticleSnapshot<float> >& getSnapshotSlot(float)
+            {
+            return m_snapshot_float;
+            }
+
+        //! Get the shared snapshot slot of a precision
+        std::shared_ptr< SharedParticleSnapshot<double> >& getSnapshotSlot(double)
+            {
+            return m_snapshot_double;
+            }
+
+        //! Initialize the dimensions, the bonded data, and the integrator data after the particle data
+        template <class Real>
+        void initializeTopology(std::shared_ptr< SnapshotSystemData<Real> > snapshot,
+                                std::shared_ptr<ExecutionConfiguration> exec_conf);
     };
 
 //! Exports SystemDefinition to python
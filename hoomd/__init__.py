@@ -34,16 +34,15 @@ try:
     from hoomd import dem
 except ImportError:
     pass
-# TODO: enable this import after updating MPCD to the new API
-# try:
-#     from hoomd import mpcd
-# except ImportError:
-#     pass
+try:
+    from hoomd import mpcd
+except ImportError:
+    pass
 
 from hoomd.simulation import Simulation
 from hoomd.state import State
 from hoomd.operations import Operations
-from hoomd.snapshot import Snapshot
+from hoomd.snapshot import Snapshot, LazySnapshot
 from hoomd import tune
 from hoomd import logging
 from hoomd import custom
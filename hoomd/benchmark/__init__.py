@@ -0,0 +1,45 @@
+# Copyright (c) 2009-2021 The Regents of the University of Michigan
+# This file is part of the HOOMD-blue project, released under the BSD 3-Clause
+# License.
+
+"""Benchmark HOOMD-blue performance.
+
+`hoomd.benchmark` provides canonical workloads that measure the performance
+of HOOMD-blue with the `hoomd.Simulation` API. Each workload is parameterized
+by the number of particles and the device, which also sets the number of CPU
+threads. Use the results to compare the performance of builds, releases, or
+hardware::
+
+    device = hoomd.device.CPU(num_cpu_threads=4)
+    benchmark = hoomd.benchmark.LJLiquid(device, N=32000)
+    result = benchmark.execute()
+    print(result['tps_mean'])
+
+The benchmarks also run from the command line. The following executes the LJ
+liquid and hard sphere benchmarks on the GPU and writes the results to
+``results.json``::
+
+    python3 -m hoomd.benchmark --device GPU --N 64000 \\
+        --output results.json LJLiquid HardSpheres
+
+The workloads that require an optional component are available only when the
+component is built.
+"""
+
+from hoomd.benchmark.common import (Benchmark, write_results,
+                                    lattice_snapshot, thermalize_velocities)
+
+try:
+    from hoomd.benchmark.md import LJLiquid, PolymerMelt
+except ImportError:
+    pass
+
+try:
+    from hoomd.benchmark.hpmc import HardSpheres, HardPolyhedra
+except ImportError:
+    pass
+
+try:
+    from hoomd.benchmark.mpcd import SRDFluid
+except ImportError:
+    pass
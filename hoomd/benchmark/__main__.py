@@ -0,0 +1,78 @@
+# Copyright (c) 2009-2021 The Regents of the University of Michigan
+# This file is part of the HOOMD-blue project, released under the BSD 3-Clause
+# License.
+
+"""Execute benchmarks from the command line."""
+
+import argparse
+
+import hoomd
+import hoomd.benchmark
+
+
+def _available_benchmarks():
+    return {
+        name: cls
+        for name, cls in vars(hoomd.benchmark).items()
+        if isinstance(cls, type) and issubclass(cls, hoomd.benchmark.Benchmark)
+        and cls is not hoomd.benchmark.Benchmark
+    }
+
+
+def main(args=None):
+    """Parse the arguments, execute the benchmarks, and write the results."""
+    benchmarks = _available_benchmarks()
+
+    parser = argparse.ArgumentParser(
+        prog='python3 -m hoomd.benchmark',
+        description='Measure the performance of HOOMD-blue.')
+    parser.add_argument('benchmarks',
+                        nargs='*',
+                        help='Benchmarks to execute (default: all). '
+                        'Available: ' + ', '.join(sorted(benchmarks)))
+    parser.add_argument('--device', choices=['CPU', 'GPU'], default='CPU')
+    parser.add_argument('--num-cpu-threads',
+                        type=int,
+                        default=None,
+                        help='Number of TBB threads (default: automatic).')
+    parser.add_argument('--N', type=int, default=64000)
+    parser.add_argument('--warmup-steps', type=int, default=1000)
+    parser.add_argument('--benchmark-steps', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--output',
+                        default='benchmarks.json',
+                        help='Name of the JSON file to write.')
+    args = parser.parse_args(args)
+
+    for name in args.benchmarks:
+        if name not in benchmarks:
+            parser.error(f"unknown benchmark {name}")
+    if len(args.benchmarks) == 0:
+        args.benchmarks = sorted(benchmarks)
+
+    if args.device == 'GPU':
+        device = hoomd.device.GPU(num_cpu_threads=args.num_cpu_threads)
+    else:
+        device = hoomd.device.CPU(num_cpu_threads=args.num_cpu_threads)
+
+    results = []
+    for name in args.benchmarks:
+        benchmark = benchmarks[name](device,
+                                     N=args.N,
+                                     warmup_steps=args.warmup_steps,
+                                     benchmark_steps=args.benchmark_steps,
+                                     repeat=args.repeat,
+                                     seed=args.seed)
+        result = benchmark.execute()
+        if device.communicator.rank == 0:
+            print(f"{name}: {result['tps_mean']:.6g} +- "
+                  f"{result['tps_std']:.6g} TPS")
+        results.append(result)
+
+    if device.communicator.rank == 0:
+        hoomd.benchmark.write_results(results, args.output)
+
+
+if __name__ == '__main__':
+    main()
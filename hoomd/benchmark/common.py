@@ -0,0 +1,188 @@
+# Copyright (c) 2009-2021 The Regents of the University of Michigan
+# This file is part of the HOOMD-blue project, released under the BSD 3-Clause
+# License.
+
+"""Common benchmark infrastructure."""
+
+import json
+import math
+
+import numpy
+
+import hoomd
+
+
+class Benchmark:
+    """Base class for benchmark workloads.
+
+    Args:
+        device (`hoomd.device.Device`): Device to execute the benchmark on.
+        N (int): Approximate number of particles. Workloads round *N* to fill
+            their initial lattice.
+        warmup_steps (int): Number of time steps to run before measuring.
+        benchmark_steps (int): Number of time steps in each measured run.
+        repeat (int): Number of measured runs.
+        seed (int): Random number seed.
+
+    Subclasses implement `make_simulation` to build the workload. `execute`
+    runs *warmup_steps* time steps so that autotuners and neighbor list
+    buffers settle, then calls `hoomd.Simulation.run` *repeat* times with
+    *benchmark_steps* and records `hoomd.Simulation.tps` after each run.
+
+    The workloads place the particles on a lattice and use fixed random number
+    seeds, so repeated executions of the same benchmark with the same
+    parameters perform the same work.
+    """
+
+    def __init__(self,
+                 device,
+                 N=64000,
+                 warmup_steps=1000,
+                 benchmark_steps=1000,
+                 repeat=5,
+                 seed=1):
+        self.device = device
+        self.N = int(N)
+        self.warmup_steps = int(warmup_steps)
+        self.benchmark_steps = int(benchmark_steps)
+        self.repeat = int(repeat)
+        self.seed = int(seed)
+
+    @property
+    def name(self):
+        """str: Name of the benchmark."""
+        return type(self).__name__
+
+    def make_simulation(self):
+        """Build the simulation to benchmark.
+
+        Returns:
+            hoomd.Simulation: The simulation with its state and operations set.
+        """
+        raise NotImplementedError
+
+    def execute(self):
+        """Execute the benchmark.
+
+        Returns:
+            dict: The benchmark results, see `make_result`.
+        """
+        sim = self.make_simulation()
+
+        if self.warmup_steps > 0:
+            sim.run(self.warmup_steps)
+
+        tps = []
+        for i in range(self.repeat):
+            sim.run(self.benchmark_steps)
+            tps.append(sim.tps)
+
+        return self.make_result(sim, tps)
+
+    def make_result(self, sim, tps):
+        """Describe the benchmark and its measured performance.
+
+        Args:
+            sim (hoomd.Simulation): The benchmarked simulation.
+            tps (list[float]): Time steps per second of each measured run.
+
+        Returns:
+            dict: JSON serializable results with the keys:
+
+            * ``benchmark`` - name of the benchmark
+            * ``N`` - number of particles in the simulation
+            * ``device`` - ``'CPU'`` or ``'GPU'``
+            * ``num_cpu_threads`` - number of TBB threads
+            * ``num_ranks`` - number of MPI ranks
+            * ``warmup_steps``, ``benchmark_steps``, ``repeat``, ``seed`` -
+              the benchmark parameters
+            * ``tps`` - time steps per second of each measured run
+            * ``tps_mean``, ``tps_median``, ``tps_std`` - statistics of
+              ``tps``
+            * ``version``, ``git_sha1``, ``compile_flags`` - build information
+        """
+        tps = numpy.array(tps, dtype=numpy.float64)
+        if isinstance(self.device, hoomd.device.GPU):
+            device = 'GPU'
+        else:
+            device = 'CPU'
+
+        return dict(benchmark=self.name,
+                    N=sim.state.N_particles,
+                    device=device,
+                    num_cpu_threads=self.device.num_cpu_threads,
+                    num_ranks=self.device.communicator.num_ranks,
+                    warmup_steps=self.warmup_steps,
+                    benchmark_steps=self.benchmark_steps,
+                    repeat=self.repeat,
+                    seed=self.seed,
+                    tps=tps.tolist(),
+                    tps_mean=float(numpy.mean(tps)),
+                    tps_median=float(numpy.median(tps)),
+                    tps_std=float(numpy.std(tps)),
+                    version=hoomd.version.version,
+                    git_sha1=hoomd.version.git_sha1,
+                    compile_flags=hoomd.version.compile_flags)
+
+
+def write_results(results, filename):
+    """Write benchmark results to a JSON file.
+
+    Args:
+        results (list[dict]): Results returned by `Benchmark.execute`.
+        filename (str): Name of the file to write.
+
+    Note:
+        In MPI simulations, call `write_results` on one rank only.
+    """
+    with open(filename, 'w') as f:
+        json.dump(results, f, indent=2)
+
+
+def lattice_snapshot(device, N, spacing):
+    """Make a snapshot with particles on a simple cubic lattice.
+
+    Args:
+        device (`hoomd.device.Device`): Device that will use the snapshot.
+        N (int): Approximate number of particles. The lattice has
+            ``ceil(N**(1/3))`` sites in each direction.
+        spacing (float): Lattice spacing.
+
+    Returns:
+        tuple[hoomd.Snapshot, int]: The snapshot and the number of lattice sites
+        *n* in each direction. Particle *i* is at the site ``(i % n, (i // n) %
+        n, i // n**2)``.
+    """
+    n = int(math.ceil(N**(1 / 3) - 1e-6))
+    snap = hoomd.Snapshot(device.communicator)
+    if snap.exists:
+        L = n * spacing
+        sites = numpy.arange(n**3)
+        position = numpy.zeros((n**3, 3))
+        position[:, 0] = sites % n
+        position[:, 1] = (sites // n) % n
+        position[:, 2] = sites // (n * n)
+
+        snap.configuration.box = [L, L, L, 0, 0, 0]
+        snap.particles.N = n**3
+        snap.particles.position[:] = (position + 0.5) * spacing - L / 2
+        snap.particles.types = ['A']
+    return snap, n
+
+
+def thermalize_velocities(snap, kT, seed):
+    """Draw particle velocities from the Maxwell-Boltzmann distribution.
+
+    Args:
+        snap (hoomd.Snapshot): Snapshot to modify.
+        kT (float): Temperature (in energy units).
+        seed (int): Random number seed.
+
+    The total momentum is set to zero.
+    """
+    if snap.exists:
+        rng = numpy.random.default_rng(seed)
+        velocity = rng.normal(scale=math.sqrt(kT),
+                              size=(snap.particles.N, 3))
+        velocity -= numpy.mean(velocity, axis=0)
+        snap.particles.velocity[:] = velocity
@@ -0,0 +1,100 @@
+# Copyright (c) 2009-2021 The Regents of the University of Michigan
+# This file is part of the HOOMD-blue project, released under the BSD 3-Clause
+# License.
+
+"""Hard particle Monte Carlo benchmarks."""
+
+import math
+
+import hoomd
+from hoomd.benchmark.common import Benchmark, lattice_snapshot
+
+
+class HardSpheres(Benchmark):
+    """Hard sphere fluid.
+
+    Args:
+        device (`hoomd.device.Device`): Device to execute the benchmark on.
+        N (int): Approximate number of particles.
+        packing_fraction (float): Volume fraction of the spheres, at most
+            :math:`\\pi / 6`.
+        d (float): Maximum displacement of trial moves.
+        **kwargs: Additional arguments for `Benchmark`.
+
+    `HardSpheres` performs trial moves on unit diameter spheres that start
+    on a simple cubic lattice. The performance is reported in sweeps per
+    second: `hoomd.Simulation.tps` counts HPMC sweeps.
+    """
+
+    def __init__(self,
+                 device,
+                 N=64000,
+                 packing_fraction=0.5,
+                 d=0.1,
+                 **kwargs):
+        super().__init__(device, N, **kwargs)
+        if packing_fraction > math.pi / 6:
+            raise ValueError("packing_fraction must be at most pi / 6")
+        self.packing_fraction = packing_fraction
+        self.d = d
+
+    def make_simulation(self):
+        """Build the simulation to benchmark."""
+        spacing = (math.pi / 6 / self.packing_fraction)**(1 / 3)
+        snap, n = lattice_snapshot(self.device, self.N, spacing)
+
+        sim = hoomd.Simulation(device=self.device, seed=self.seed)
+        sim.create_state_from_snapshot(snap)
+
+        mc = hoomd.hpmc.integrate.Sphere(d=self.d)
+        mc.shape['A'] = dict(diameter=1.0)
+        sim.operations.integrator = mc
+        return sim
+
+
+class HardPolyhedra(Benchmark):
+    """Fluid of hard cubes.
+
+    Args:
+        device (`hoomd.device.Device`): Device to execute the benchmark on.
+        N (int): Approximate number of particles.
+        packing_fraction (float): Volume fraction of the cubes, less than 1.
+        d (float): Maximum displacement of trial moves.
+        a (float): Maximum size of rotation trial moves.
+        **kwargs: Additional arguments for `Benchmark`.
+
+    `HardPolyhedra` performs translation and rotation trial moves on unit
+    cubes, which start aligned on a simple cubic lattice, with the convex
+    polyhedron overlap check. The performance is reported in sweeps per
+    second.
+    """
+
+    def __init__(self,
+                 device,
+                 N=64000,
+                 packing_fraction=0.5,
+                 d=0.1,
+                 a=0.1,
+                 **kwargs):
+        super().__init__(device, N, **kwargs)
+        if packing_fraction >= 1:
+            raise ValueError("packing_fraction must be less than 1")
+        self.packing_fraction = packing_fraction
+        self.d = d
+        self.a = a
+
+    def make_simulation(self):
+        """Build the simulation to benchmark."""
+        spacing = (1 / self.packing_fraction)**(1 / 3)
+        snap, n = lattice_snapshot(self.device, self.N, spacing)
+
+        sim = hoomd.Simulation(device=self.device, seed=self.seed)
+        sim.create_state_from_snapshot(snap)
+
+        mc = hoomd.hpmc.integrate.ConvexPolyhedron(d=self.d, a=self.a)
+        mc.shape['A'] = dict(vertices=[(x, y, z)
+                                       for x in (-0.5, 0.5)
+                                       for y in (-0.5, 0.5)
+                                       for z in (-0.5, 0.5)])
+        sim.operations.integrator = mc
+        return sim
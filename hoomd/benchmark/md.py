@@ -0,0 +1,131 @@
+# Copyright (c) 2009-2021 The Regents of the University of Michigan
+# This file is part of the HOOMD-blue project, released under the BSD 3-Clause
+# License.
+
+"""Molecular dynamics benchmarks."""
+
+import numpy
+
+import hoomd
+from hoomd.benchmark.common import (Benchmark, lattice_snapshot,
+                                    thermalize_velocities)
+
+
+class LJLiquid(Benchmark):
+    """Lennard-Jones liquid.
+
+    Args:
+        device (`hoomd.device.Device`): Device to execute the benchmark on.
+        N (int): Approximate number of particles.
+        density (float): Number density.
+        kT (float): Temperature of the NVT thermostat.
+        r_cut (float): Cutoff radius of the pair potential.
+        buffer (float): Neighbor list buffer distance.
+        **kwargs: Additional arguments for `Benchmark`.
+
+    `LJLiquid` integrates a single component Lennard-Jones fluid
+    (:math:`\\varepsilon = \\sigma = 1`) in the NVT ensemble with a cell list
+    based neighbor list. The default state point is a dense liquid.
+    """
+
+    def __init__(self,
+                 device,
+                 N=64000,
+                 density=0.8442,
+                 kT=1.2,
+                 r_cut=2.5,
+                 buffer=0.4,
+                 **kwargs):
+        super().__init__(device, N, **kwargs)
+        self.density = density
+        self.kT = kT
+        self.r_cut = r_cut
+        self.buffer = buffer
+
+    def make_simulation(self):
+        """Build the simulation to benchmark."""
+        snap, n = lattice_snapshot(self.device, self.N,
+                                   (1 / self.density)**(1 / 3))
+        thermalize_velocities(snap, self.kT, self.seed)
+
+        sim = hoomd.Simulation(device=self.device, seed=self.seed)
+        sim.create_state_from_snapshot(snap)
+
+        nlist = hoomd.md.nlist.Cell(buffer=self.buffer)
+        lj = hoomd.md.pair.LJ(nlist=nlist, r_cut=self.r_cut)
+        lj.params[('A', 'A')] = dict(epsilon=1, sigma=1)
+
+        integrator = hoomd.md.Integrator(dt=0.005)
+        integrator.forces.append(lj)
+        integrator.methods.append(
+            hoomd.md.methods.NVT(filter=hoomd.filter.All(), kT=self.kT,
+                                 tau=0.5))
+        sim.operations.integrator = integrator
+        return sim
+
+
+class PolymerMelt(Benchmark):
+    """Melt of bead-spring polymers.
+
+    Args:
+        device (`hoomd.device.Device`): Device to execute the benchmark on.
+        N (int): Approximate number of particles.
+        chain_length (int): Number of monomers in each polymer.
+        density (float): Monomer number density.
+        kT (float): Temperature of the NVT thermostat.
+        buffer (float): Neighbor list buffer distance.
+        **kwargs: Additional arguments for `Benchmark`.
+
+    `PolymerMelt` integrates linear chains of monomers that repel each other
+    with the Weeks-Chandler-Andersen potential and are bonded to their
+    neighbors in the chain with harmonic bonds. Bonded monomers are excluded
+    from the pair interaction. The chains start as straight lines along the x
+    axis of the initial lattice.
+    """
+
+    def __init__(self,
+                 device,
+                 N=64000,
+                 chain_length=10,
+                 density=0.85,
+                 kT=1.0,
+                 buffer=0.4,
+                 **kwargs):
+        super().__init__(device, N, **kwargs)
+        self.chain_length = chain_length
+        self.density = density
+        self.kT = kT
+        self.buffer = buffer
+
+    def make_simulation(self):
+        """Build the simulation to benchmark."""
+        spacing = (1 / self.density)**(1 / 3)
+        snap, n = lattice_snapshot(self.device, self.N, spacing)
+        thermalize_velocities(snap, self.kT, self.seed)
+
+        if snap.exists:
+            # bond each monomer to the next one along x in the same chain
+            sites = numpy.arange(snap.particles.N)
+            x = sites % n
+            first = sites[(x < n - 1) & ((x + 1) % self.chain_length != 0)]
+            snap.bonds.types = ['backbone']
+            snap.bonds.N = len(first)
+            snap.bonds.group[:] = numpy.column_stack([first, first + 1])
+
+        sim = hoomd.Simulation(device=self.device, seed=self.seed)
+        sim.create_state_from_snapshot(snap)
+
+        nlist = hoomd.md.nlist.Cell(buffer=self.buffer, exclusions=('bond',))
+        wca = hoomd.md.pair.LJ(nlist=nlist, r_cut=2**(1 / 6), mode='shift')
+        wca.params[('A', 'A')] = dict(epsilon=1, sigma=1)
+        harmonic = hoomd.md.bond.Harmonic()
+        harmonic.params['backbone'] = dict(k=100, r0=spacing)
+
+        integrator = hoomd.md.Integrator(dt=0.005)
+        integrator.forces.append(wca)
+        integrator.forces.append(harmonic)
+        integrator.methods.append(
+            hoomd.md.methods.NVT(filter=hoomd.filter.All(), kT=self.kT,
+                                 tau=0.5))
+        sim.operations.integrator = integrator
+        return sim
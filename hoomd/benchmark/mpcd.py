@@ -0,0 +1,90 @@
+# Copyright (c) 2009-2021 The Regents of the University of Michigan
+# This file is part of the HOOMD-blue project, released under the BSD 3-Clause
+# License.
+
+"""Multiparticle collision dynamics benchmarks."""
+
+import math
+
+import hoomd
+from hoomd import mpcd
+from hoomd.benchmark.common import Benchmark
+
+
+class SRDFluid(Benchmark):
+    """Bulk stochastic rotation dynamics fluid.
+
+    Args:
+        device (`hoomd.device.Device`): Device to execute the benchmark on.
+        N (int): Approximate number of MPCD particles.
+        density (int): Number of MPCD particles per collision cell.
+        kT (float): Temperature of the MPCD particles.
+        angle (float): SRD rotation angle in degrees.
+        dt (float): Time step size.
+        sort_period (int): Number of time steps between sorts of the MPCD
+            particles.
+        fused (bool): Set `hoomd.mpcd.Integrator.fused`.
+        compact (bool): Set `hoomd.mpcd.Solvent.compact`.
+        **kwargs: Additional arguments for `Benchmark`.
+
+    `SRDFluid` streams and collides a solvent of MPCD particles in a cubic box
+    of unit collision cells with no solute particles. The box has
+    ``ceil((N / density)**(1/3))`` cells in each direction, each holding
+    *density* particles on average. The reported *N* is the number of MPCD
+    particles.
+    """
+
+    def __init__(self,
+                 device,
+                 N=640000,
+                 density=10,
+                 kT=1.0,
+                 angle=130,
+                 dt=0.1,
+                 sort_period=25,
+                 fused=False,
+                 compact=False,
+                 **kwargs):
+        super().__init__(device, N, **kwargs)
+        self.density = int(density)
+        self.kT = kT
+        self.angle = angle
+        self.dt = dt
+        self.sort_period = int(sort_period)
+        self.fused = bool(fused)
+        self.compact = bool(compact)
+
+    def make_simulation(self):
+        """Build the simulation to benchmark."""
+        n = int(math.ceil((self.N / self.density)**(1 / 3) - 1e-6))
+        snap = hoomd.Snapshot(self.device.communicator)
+        if snap.exists:
+            snap.configuration.box = [n, n, n, 0, 0, 0]
+            snap.particles.types = ['A']
+
+        sim = hoomd.Simulation(device=self.device, seed=self.seed)
+        sim.create_state_from_snapshot(snap)
+
+        solvent = mpcd.Solvent(N=self.density * n**3,
+                               kT=self.kT,
+                               compact=self.compact)
+        integrator = mpcd.Integrator(
+            dt=self.dt,
+            solvent=solvent,
+            streaming_method=mpcd.stream.Bulk(period=1),
+            collision_method=mpcd.collide.SRD(period=1,
+                                              angle=self.angle,
+                                              kT=self.kT),
+            sorter=mpcd.update.Sorter(period=self.sort_period),
+            fused=self.fused)
+        sim.operations.integrator = integrator
+        return sim
+
+    def make_result(self, sim, tps):
+        """Describe the benchmark and its measured performance.
+
+        The result reports the number of MPCD particles as ``N``.
+        """
+        result = super().make_result(sim, tps)
+        result['N'] = sim.operations.integrator.solvent.N
+        return result
@@ -391,6 +391,7 @@ class _LocalSnapshot:
 
     def __exit__(self, type, value, traceback):
         self._state._in_context_manager = False
+        self._state._modification_count += 1
         self._particles._exit()
         self._bonds._exit()
         self._angles._exit()
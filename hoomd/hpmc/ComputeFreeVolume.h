@@ -13,6 +13,13 @@
 #include "IntegratorHPMCMono.h"
 #include "hoomd/RNGIdentifiers.h"
 
+#include <algorithm>
+#include <vector>
+
+#ifdef ENABLE_TBB
+#include <tbb/blocked_range.h>
+#include <tbb/parallel_reduce.h>
+#endif
 
 /*! \file ComputeFreeVolume.h
     \brief Defines the template class for an approximate free volume integration
@@ -30,7 +37,15 @@ namespace hpmc
 {
 
 //! Template class for a free volume integration analyzer
-/*!
+/*! Test particle i is placed with the random number stream (rank, i) of the current timestep, so the number of
+    overlapping test particles does not depend on the number of threads or the batch size.
+
+    With a batch size of 1, each test particle traverses the AABB tree and stops at the first overlap. Larger batches
+    first collect the (leaf, test particle, image) candidates of all test particles in the batch from the AABB tree,
+    then visit each leaf once and test all of its candidates against the particles in the leaf.
+
+    Each call to compute() at a new timestep also adds the samples to a running estimate of the free volume.
+
     \ingroup hpmc_integrators
 */
 template< class Shape >
@@ -70,9 +85,32 @@ class ComputeFreeVolume : public Compute
         void setTestParticleType(std::string type)
             {
             unsigned int type_int = m_sysdef->getParticleData()->getTypeByName(type);
+            if (type_int != m_type)
+                reset();
             m_type = type_int;
             }
 
+        //! Get the number of test particles tested together
+        unsigned int getBatchSize()
+            {
+            return m_batch_size;
+            }
+
+        //! Set the number of test particles tested together
+        void setBatchSize(unsigned int batch_size)
+            {
+            if (batch_size == 0)
+                throw std::runtime_error("batch_size must be positive");
+            m_batch_size = batch_size;
+            }
+
+        //! Clear the running estimate
+        void reset()
+            {
+            m_n_sample_total = 0;
+            m_free_volume_sum = 0.0;
+            }
+
 #ifdef ENABLE_MPI
         virtual void setCommunicator(std::shared_ptr<Communicator> comm)
             {
@@ -103,6 +141,20 @@ class ComputeFreeVolume : public Compute
         //! Return an estimate of the overlap volume
         virtual Scalar getFreeVolume();
 
+        //! Return the running estimate of the free volume over all computed timesteps
+        Scalar getRunningFreeVolume()
+            {
+            if (m_n_sample_total == 0)
+                return Scalar(0.0);
+            return Scalar(m_free_volume_sum / double(m_n_sample_total));
+            }
+
+        //! Get the number of samples in the running estimate
+        uint64_t getRunningNumSamples()
+            {
+            return m_n_sample_total;
+            }
+
     protected:
         std::shared_ptr<IntegratorHPMCMono<Shape> > m_mc;              //!< The parent integrator
         std::shared_ptr<CellList> m_cl;                        //!< The cell list
@@ -110,11 +162,51 @@ class ComputeFreeVolume : public Compute
         unsigned int m_type;                                     //!< Type of depletant particle to generate
         unsigned int m_n_sample;                                 //!< Number of sampling depletants to generate
         const std::string m_suffix;                              //!< Log suffix
+        unsigned int m_batch_size;                               //!< Number of test particles tested together
 
         GPUArray<unsigned int> m_n_overlap_all;                  //!< Number of overlap volume particles in box
 
+        uint64_t m_n_sample_total;                               //!< Number of samples in the running estimate
+        double m_free_volume_sum;                                //!< Sum of the free sample count times the volume
+
         //! Return an estimate of the overlap volume
         virtual void computeFreeVolume(uint64_t timestep);
+
+        //! Get the number of samples taken over all ranks
+        unsigned int getNumSamplesAllRanks()
+            {
+            unsigned int n_sample = m_n_sample;
+
+            #ifdef ENABLE_MPI
+            // in MPI, for small n_sample we can encounter round-off issues
+            unsigned int n_ranks = this->m_exec_conf->getNRanks();
+            n_sample = (n_sample/n_ranks)*n_ranks;
+            #endif
+
+            return n_sample;
+            }
+
+        //! Place test particle i at a random position and orientation
+        Shape generateTestParticle(uint64_t timestep, unsigned int i, vec3<Scalar>& pos);
+
+        //! Count the overlapping test particles in [begin, end)
+        unsigned int countOverlaps(uint64_t timestep,
+                                   unsigned int begin,
+                                   unsigned int end,
+                                   const detail::AABBTree& aabb_tree,
+                                   const std::vector<vec3<Scalar> >& image_list,
+                                   const Scalar4 *postype,
+                                   const Scalar4 *orientation,
+                                   const unsigned int *overlaps);
+
+        //! Test a test particle against the particles of one AABB tree leaf
+        bool overlapLeaf(const Shape& shape_i,
+                         const vec3<Scalar>& pos_i_image,
+                         unsigned int node,
+                         const detail::AABBTree& aabb_tree,
+                         const Scalar4 *postype,
+                         const Scalar4 *orientation,
+                         const unsigned int *overlaps);
     };
 
 
@@ -123,7 +215,8 @@ ComputeFreeVolume< Shape >::ComputeFreeVolume(std::shared_ptr<SystemDefinition>
                                                     std::shared_ptr<IntegratorHPMCMono<Shape> > mc,
                                                     std::shared_ptr<CellList> cl,
                                                     std::string suffix)
-    : Compute(sysdef), m_mc(mc), m_cl(cl), m_type(0), m_n_sample(0), m_suffix(suffix)
+    : Compute(sysdef), m_mc(mc), m_cl(cl), m_type(0), m_n_sample(0), m_suffix(suffix), m_batch_size(1),
+      m_n_sample_total(0), m_free_volume_sum(0.0)
     {
     this->m_exec_conf->msg->notice(5) << "Constructing ComputeFreeVolume" << std::endl;
 
@@ -148,6 +241,210 @@ void ComputeFreeVolume<Shape>::compute(uint64_t timestep)
     m_mc->communicate(false);
 
     this->computeFreeVolume(timestep);
+
+    // add the samples to the running estimate
+    ArrayHandle<unsigned int> h_n_overlap_all(m_n_overlap_all, access_location::host, access_mode::read);
+    unsigned int n_sample = getNumSamplesAllRanks();
+    const BoxDim& global_box = this->m_pdata->getGlobalBox();
+    m_n_sample_total += n_sample;
+    m_free_volume_sum += double(n_sample - *h_n_overlap_all.data)*double(global_box.getVolume());
+    }
+
+/*! \param timestep Current time step
+    \param i Index of the test particle on this rank
+    \param pos Set to the position of the test particle
+    \returns The test particle shape
+*/
+template<class Shape>
+Shape ComputeFreeVolume<Shape>::generateTestParticle(uint64_t timestep, unsigned int i, vec3<Scalar>& pos)
+    {
+    // select a random particle coordinate in the box
+    hoomd::RandomGenerator rng_i(hoomd::Seed(hoomd::RNGIdentifier::ComputeFreeVolume, timestep, m_sysdef->getSeed()),
+                                 hoomd::Counter(m_exec_conf->getRank(), i));
+
+    Scalar xrand = hoomd::detail::generate_canonical<Scalar>(rng_i);
+    Scalar yrand = hoomd::detail::generate_canonical<Scalar>(rng_i);
+    Scalar zrand = hoomd::detail::generate_canonical<Scalar>(rng_i);
+
+    Scalar3 f = make_scalar3(xrand, yrand, zrand);
+    pos = vec3<Scalar>(m_pdata->getBox().makeCoordinates(f));
+
+    Shape shape_i(quat<Scalar>(), m_mc->getParams()[m_type]);
+    if (shape_i.hasOrientation())
+        {
+        shape_i.orientation = generateRandomOrientation(rng_i, m_sysdef->getNDimensions());
+        }
+    return shape_i;
+    }
+
+/*! \param shape_i Test particle shape
+    \param pos_i_image Position of the test particle image
+    \param node Index of the leaf node
+    \param aabb_tree The AABB tree
+    \param postype Particle positions and types
+    \param orientation Particle orientations
+    \param overlaps Interaction matrix
+    \returns true when the test particle overlaps a particle in the leaf
+*/
+template<class Shape>
+bool ComputeFreeVolume<Shape>::overlapLeaf(const Shape& shape_i,
+                                           const vec3<Scalar>& pos_i_image,
+                                           unsigned int node,
+                                           const detail::AABBTree& aabb_tree,
+                                           const Scalar4 *postype,
+                                           const Scalar4 *orientation,
+                                           const unsigned int *overlaps)
+    {
+    const std::vector<typename Shape::param_type, managed_allocator<typename Shape::param_type> > & params = m_mc->getParams();
+    const Index2D& overlap_idx = m_mc->getOverlapIndexer();
+    unsigned int err_count = 0;
+
+    for (unsigned int cur_p = 0; cur_p < aabb_tree.getNodeNumParticles(node); cur_p++)
+        {
+        // read in its position and orientation
+        unsigned int j = aabb_tree.getNodeParticle(node, cur_p);
+
+        // load the position and orientation of the j particle
+        Scalar4 postype_j = postype[j];
+        Scalar4 orientation_j = orientation[j];
+
+        // put particles in coordinate system of particle i
+        vec3<Scalar> r_ij = vec3<Scalar>(postype_j) - pos_i_image;
+
+        unsigned int typ_j = __scalar_as_int(postype_j.w);
+        Shape shape_j(quat<Scalar>(orientation_j), params[typ_j]);
+
+        if (overlaps[overlap_idx(m_type, typ_j)]
+            && check_circumsphere_overlap(r_ij, shape_i, shape_j)
+            && test_overlap(r_ij, shape_i, shape_j, err_count))
+            {
+            return true;
+            }
+        }
+
+    return false;
+    }
+
+/*! \param timestep Current time step
+    \param begin First test particle
+    \param end One past the last test particle
+    \param aabb_tree The AABB tree
+    \param image_list The image list
+    \param postype Particle positions and types
+    \param orientation Particle orientations
+    \param overlaps Interaction matrix
+    \returns The number of test particles in [begin, end) that overlap a particle
+*/
+template<class Shape>
+unsigned int ComputeFreeVolume<Shape>::countOverlaps(uint64_t timestep,
+                                                     unsigned int begin,
+                                                     unsigned int end,
+                                                     const detail::AABBTree& aabb_tree,
+                                                     const std::vector<vec3<Scalar> >& image_list,
+                                                     const Scalar4 *postype,
+                                                     const Scalar4 *orientation,
+                                                     const unsigned int *overlaps)
+    {
+    const unsigned int n_images = (unsigned int)image_list.size();
+    unsigned int overlap_count = 0;
+
+    if (end - begin == 1)
+        {
+        vec3<Scalar> pos_i;
+        Shape shape_i = generateTestParticle(timestep, begin, pos_i);
+
+        // check for overlaps with neighboring particle's positions
+        bool overlap=false;
+        detail::AABB aabb_i_local = shape_i.getAABB(vec3<Scalar>(0,0,0));
+
+        // All image boxes (including the primary)
+        for (unsigned int cur_image = 0; cur_image < n_images && !overlap; cur_image++)
+            {
+            vec3<Scalar> pos_i_image = pos_i + image_list[cur_image];
+            detail::AABB aabb = aabb_i_local;
+            aabb.translate(pos_i_image);
+
+            // stackless search
+            for (unsigned int cur_node_idx = 0; cur_node_idx < aabb_tree.getNumNodes(); cur_node_idx++)
+                {
+                if (detail::overlap(aabb_tree.getNodeAABB(cur_node_idx), aabb))
+                    {
+                    if (aabb_tree.isNodeLeaf(cur_node_idx)
+                        && overlapLeaf(shape_i, pos_i_image, cur_node_idx, aabb_tree, postype, orientation, overlaps))
+                        {
+                        overlap = true;
+                        break;
+                        }
+                    }
+                else
+                    {
+                    // skip ahead
+                    cur_node_idx += aabb_tree.getNodeSkip(cur_node_idx);
+                    }
+                }  // end loop over AABB nodes
+            } // end loop over images
+
+        return overlap ? 1 : 0;
+        }
+
+    // generate the test particles of the batch
+    std::vector<Shape> shapes;
+    std::vector<vec3<Scalar> > positions(end - begin);
+    shapes.reserve(end - begin);
+    for (unsigned int i = begin; i < end; i++)
+        {
+        shapes.push_back(generateTestParticle(timestep, i, positions[i - begin]));
+        }
+
+    // collect the leaves each test particle image overlaps as (leaf, test particle, image)
+    std::vector<uint3> candidates;
+    for (unsigned int k = 0; k < end - begin; k++)
+        {
+        detail::AABB aabb_i_local = shapes[k].getAABB(vec3<Scalar>(0,0,0));
+        for (unsigned int cur_image = 0; cur_image < n_images; cur_image++)
+            {
+            detail::AABB aabb = aabb_i_local;
+            aabb.translate(positions[k] + image_list[cur_image]);
+
+            // stackless search
+            for (unsigned int cur_node_idx = 0; cur_node_idx < aabb_tree.getNumNodes(); cur_node_idx++)
+                {
+                if (detail::overlap(aabb_tree.getNodeAABB(cur_node_idx), aabb))
+                    {
+                    if (aabb_tree.isNodeLeaf(cur_node_idx))
+                        candidates.push_back(make_uint3(cur_node_idx, k, cur_image));
+                    }
+                else
+                    {
+                    // skip ahead
+                    cur_node_idx += aabb_tree.getNodeSkip(cur_node_idx);
+                    }
+                }
+            }
+        }
+
+    // visit each leaf once and test all of its candidates against the particles in it
+    std::sort(candidates.begin(), candidates.end(), [](const uint3& a, const uint3& b)
+        {
+        return a.x < b.x || (a.x == b.x && a.y < b.y);
+        });
+
+    std::vector<char> overlap(end - begin, 0);
+    for (const uint3& candidate : candidates)
+        {
+        const unsigned int k = candidate.y;
+        if (overlap[k])
+            continue;
+
+        if (overlapLeaf(shapes[k], positions[k] + image_list[candidate.z], candidate.x, aabb_tree, postype,
+                        orientation, overlaps))
+            {
+            overlap[k] = 1;
+            overlap_count++;
+            }
+        }
+
+    return overlap_count;
     }
 
 /*! \return the current free volume estimate by MC integration
@@ -156,8 +453,6 @@ template<class Shape>
 void ComputeFreeVolume<Shape>::computeFreeVolume(uint64_t timestep)
     {
     unsigned int overlap_count = 0;
-    unsigned int err_count = 0;
-    unsigned int ndim = this->m_sysdef->getNDimensions();
 
     this->m_exec_conf->msg->notice(5) << "HPMC computing free volume " << timestep << std::endl;
 
@@ -167,23 +462,17 @@ void ComputeFreeVolume<Shape>::computeFreeVolume(uint64_t timestep)
     // update the image list
     std::vector<vec3<Scalar> > image_list = this->m_mc->updateImageList();
 
-    uint16_t seed = m_sysdef->getSeed();
-
     if (m_prof) m_prof->push("Free volume");
 
     // only check if AABB tree is populated
     if (m_pdata->getN() + m_pdata->getNGhosts())
         {
-        // access particle data and system box
+        // access particle data
         ArrayHandle<Scalar4> h_postype(m_pdata->getPositions(), access_location::host, access_mode::read);
         ArrayHandle<Scalar4> h_orientation(m_pdata->getOrientationArray(), access_location::host, access_mode::read);
-        const BoxDim& box = m_pdata->getBox();
-
-        // access parameters and interaction matrix
-        const std::vector<typename Shape::param_type, managed_allocator<typename Shape::param_type> > & params = m_mc->getParams();
 
+        // access the interaction matrix
         ArrayHandle<unsigned int> h_overlaps(m_mc->getInteractionMatrix(), access_location::host, access_mode::read);
-        const Index2D& overlap_idx = m_mc->getOverlapIndexer();
 
         // generate n_sample random test depletants in the global box
         unsigned int n_sample = m_n_sample;
@@ -192,92 +481,35 @@ void ComputeFreeVolume<Shape>::computeFreeVolume(uint64_t timestep)
         n_sample /= this->m_exec_conf->getNRanks();
         #endif
 
-        for (unsigned int i = 0; i < n_sample; i++)
+        const unsigned int n_batches = (n_sample + m_batch_size - 1)/m_batch_size;
+
+        #ifdef ENABLE_TBB
+        m_exec_conf->getTaskArena()->execute([&]{
+        overlap_count = tbb::parallel_reduce(tbb::blocked_range<unsigned int>(0, n_batches),
+            0u,
+            [&](const tbb::blocked_range<unsigned int>& r, unsigned int count)->unsigned int {
+            for (unsigned int batch = r.begin(); batch != r.end(); ++batch)
+        #else
+        unsigned int& count = overlap_count;
+        for (unsigned int batch = 0; batch < n_batches; batch++)
+        #endif
             {
-            // select a random particle coordinate in the box
-            hoomd::RandomGenerator rng_i(hoomd::Seed(hoomd::RNGIdentifier::ComputeFreeVolume, timestep, seed),
-                                         hoomd::Counter(m_exec_conf->getRank(), i));
-
-            Scalar xrand = hoomd::detail::generate_canonical<Scalar>(rng_i);
-            Scalar yrand = hoomd::detail::generate_canonical<Scalar>(rng_i);
-            Scalar zrand = hoomd::detail::generate_canonical<Scalar>(rng_i);
-
-            Scalar3 f = make_scalar3(xrand, yrand, zrand);
-            vec3<Scalar> pos_i = vec3<Scalar>(box.makeCoordinates(f));
-
-            Shape shape_i(quat<Scalar>(), params[m_type]);
-            if (shape_i.hasOrientation())
-                {
-                shape_i.orientation = generateRandomOrientation(rng_i, ndim);
-                }
-
-            // check for overlaps with neighboring particle's positions
-            bool overlap=false;
-            detail::AABB aabb_i_local = shape_i.getAABB(vec3<Scalar>(0,0,0));
-
-            // All image boxes (including the primary)
-            const unsigned int n_images = (unsigned int)image_list.size();
-            for (unsigned int cur_image = 0; cur_image < n_images; cur_image++)
-                {
-                vec3<Scalar> pos_i_image = pos_i + image_list[cur_image];
-                detail::AABB aabb = aabb_i_local;
-                aabb.translate(pos_i_image);
-
-                // stackless search
-                for (unsigned int cur_node_idx = 0; cur_node_idx < aabb_tree.getNumNodes(); cur_node_idx++)
-                    {
-                    if (detail::overlap(aabb_tree.getNodeAABB(cur_node_idx), aabb))
-                        {
-                        if (aabb_tree.isNodeLeaf(cur_node_idx))
-                            {
-                            for (unsigned int cur_p = 0; cur_p < aabb_tree.getNodeNumParticles(cur_node_idx); cur_p++)
-                                {
-                                // read in its position and orientation
-                                unsigned int j = aabb_tree.getNodeParticle(cur_node_idx, cur_p);
-
-                                Scalar4 postype_j;
-                                Scalar4 orientation_j;
-
-                                // load the position and orientation of the j particle
-                                postype_j = h_postype.data[j];
-                                orientation_j = h_orientation.data[j];
-
-                                // put particles in coordinate system of particle i
-                                vec3<Scalar> r_ij = vec3<Scalar>(postype_j) - pos_i_image;
-
-                                unsigned int typ_j = __scalar_as_int(postype_j.w);
-                                Shape shape_j(quat<Scalar>(orientation_j), params[typ_j]);
-
-                                if (h_overlaps.data[overlap_idx(m_type, typ_j)]
-                                    && check_circumsphere_overlap(r_ij, shape_i, shape_j)
-                                    && test_overlap(r_ij, shape_i, shape_j, err_count))
-                                    {
-                                    overlap = true;
-                                    break;
-                                    }
-                                }
-                            }
-                        }
-                    else
-                        {
-                        // skip ahead
-                        cur_node_idx += aabb_tree.getNodeSkip(cur_node_idx);
-                        }
-
-                    if (overlap)
-                        break;
-                    }  // end loop over AABB nodes
-
-                if (overlap)
-                    break;
-                } // end loop over images
-
-            if (overlap)
-                {
-                overlap_count++;
-                }
-            } // end loop through all particles
-
+            const unsigned int begin = batch*m_batch_size;
+            const unsigned int end = std::min(begin + m_batch_size, n_sample);
+            count += countOverlaps(timestep,
+                                   begin,
+                                   end,
+                                   aabb_tree,
+                                   image_list,
+                                   h_postype.data,
+                                   h_orientation.data,
+                                   h_overlaps.data);
+            } // end loop through all batches
+        #ifdef ENABLE_TBB
+            return count;
+            }, std::plus<unsigned int>());
+        });
+        #endif
         } // end lexical scope
 
     #ifdef ENABLE_MPI
@@ -304,25 +536,7 @@ Scalar ComputeFreeVolume<Shape>::getLogValue(const std::string& quantity, uint64
         {
         // perform MC integration
         compute(timestep);
-
-        // access counters
-        ArrayHandle<unsigned int> h_n_overlap_all(m_n_overlap_all, access_location::host, access_mode::read);
-
-        // generate n_sample random test depletants in the global box
-        unsigned int n_sample = m_n_sample;
-
-        #ifdef ENABLE_MPI
-        // in MPI, for small n_sample we can encounter round-off issues
-        unsigned int n_ranks = this->m_exec_conf->getNRanks();
-        n_sample = (n_sample/n_ranks)*n_ranks;
-        #endif
-
-
-        // total free volume
-        const BoxDim& global_box = this->m_pdata->getGlobalBox();
-        Scalar V_free = (Scalar)(n_sample-*h_n_overlap_all.data)/(Scalar)n_sample*global_box.getVolume();
-
-        return V_free;
+        return getFreeVolume();
         }
     throw std::runtime_error("Undefined log quantity");
     }
@@ -334,15 +548,8 @@ Scalar ComputeFreeVolume<Shape>::getFreeVolume()
     // access counters
     ArrayHandle<unsigned int> h_n_overlap_all(m_n_overlap_all, access_location::host, access_mode::read);
 
-    // generate n_sample random test depletants in the global box
-    unsigned int n_sample = m_n_sample;
-
-    #ifdef ENABLE_MPI
-    // in MPI, for small n_sample we can encounter round-off issues
-    unsigned int n_ranks = this->m_exec_conf->getNRanks();
-    n_sample = (n_sample/n_ranks)*n_ranks;
-    #endif
-
+    // the number of random test depletants in the global box
+    unsigned int n_sample = getNumSamplesAllRanks();
 
     // total free volume
     const BoxDim& global_box = this->m_pdata->getGlobalBox();
@@ -364,7 +571,11 @@ template < class Shape > void export_ComputeFreeVolume(pybind11::module& m, cons
                 std::string >())
         .def_property("num_samples", &ComputeFreeVolume<Shape>::getNumSamples, &ComputeFreeVolume<Shape>::setNumSamples)
         .def_property("test_particle_type", &ComputeFreeVolume<Shape>::getTestParticleType, &ComputeFreeVolume<Shape>::setTestParticleType)
+        .def_property("batch_size", &ComputeFreeVolume<Shape>::getBatchSize, &ComputeFreeVolume<Shape>::setBatchSize)
         .def_property_readonly("free_volume", &ComputeFreeVolume<Shape>::getFreeVolume)
+        .def_property_readonly("running_free_volume", &ComputeFreeVolume<Shape>::getRunningFreeVolume)
+        .def_property_readonly("running_num_samples", &ComputeFreeVolume<Shape>::getRunningNumSamples)
+        .def("reset", &ComputeFreeVolume<Shape>::reset)
         ;
     }
 
@@ -0,0 +1,465 @@
+// Copyright (c) 2009-2021 The Regents of the University of Michigan
+// This file is part of the HOOMD-blue project, released under the BSD 3-Clause License.
+
+#ifndef _COMPUTE_SDF_H_
+#define _COMPUTE_SDF_H_
+
+/*! \file ComputeSDF.h
+    \brief Declaration of ComputeSDF
+*/
+
+
+#include "hoomd/Compute.h"
+#include "IntegratorHPMCMono.h"
+
+#include <algorithm>
+#include <vector>
+
+#ifdef ENABLE_MPI
+#include "hoomd/Communicator.h"
+#include "hoomd/HOOMDMPI.h"
+#endif
+
+#ifdef ENABLE_TBB
+#include <tbb/blocked_range.h>
+#include <tbb/enumerable_thread_specific.h>
+#include <tbb/parallel_for.h>
+#endif
+
+#ifndef __HIPCC__
+#include <pybind11/pybind11.h>
+#include <pybind11/stl.h>
+#endif
+
+namespace hpmc
+{
+
+namespace detail
+{
+
+//! Local helper function to test overlap of two particles with scale
+template < class Shape >
+bool test_scaled_overlap(const vec3<Scalar>& r_ij,
+                         const quat<Scalar>& orientation_i,
+                         const quat<Scalar>& orientation_j,
+                         const typename Shape::param_type& params_i,
+                         const typename Shape::param_type& params_j,
+                         Scalar lambda)
+    {
+    // need a dummy error counter
+    unsigned int dummy = 0;
+
+    // instantiate the shapes
+    Shape shape_i(orientation_i, params_i);
+    Shape shape_j(orientation_j, params_j);
+
+    vec3<Scalar> r_ij_scaled = r_ij * (Scalar(1.0) - lambda);
+    return check_circumsphere_overlap(r_ij_scaled, shape_i, shape_j) && test_overlap(r_ij_scaled, shape_i, shape_j, dummy);
+    }
+
+}
+
+//! SDF computation
+/*! **Overview** <br>
+
+    ComputeSDF computes \f$ s(\lambda)/N \f$ of the current configuration and keeps it in memory.
+    \f$ s(\lambda) \f$ is a distribution function like *g(r)*, except that \f$\lambda\f$ is the smallest scale factor
+    that causes a particle to just just touch the closest of its neighbors. \f$ s(\lambda)/N \f$ is normalized by the
+    number of particles and the bin width, so that it is a probability density of the \f$\lambda\f$ value of a
+    particle.
+
+    \f$ s(\lambda)/N \f$ extrapolated out to \f$ \lambda=0 \f$ is directly related by a scale factor to the pressure in
+    an NVT system of hard particles. Performing this extrapolation only needs data very near zero
+    (e.g. up to 0.02 for disks).
+
+    ComputeSDF is implemented in HPMC (and not in freud) due to the need for high performance evaluation
+    at very small periods. A future module from freud does not conflict with this code, as that would be more general
+    and extend to larger values of \f$\lambda\f$, whereas this code is optimized only for small values.
+
+    \b Computing \f$ \lambda \f$ <br>
+
+    In the initial version of the code, a completely general way of computing *\f$ \lambda \f$* is implemented.
+    It uses a binary search tree and the existing test_overlap code to find which bin a given pair of particles sits in.
+    Future versions of the code may use shape specific data to compute *\f$ \lambda \f$* directly.
+
+    The particles are histogrammed in parallel with TBB, each thread filling its own histogram. In MPI simulations,
+    each rank histograms its local particles and the histograms are summed over all ranks, so every rank holds the
+    full \f$ s(\lambda) \f$.
+
+    \b Storage <br>
+
+    Bin counts are stored in a basic std::vector<unsigned int>. Bin 0 counts \f$ \lambda \f$ values from
+    \f$ \lambda [0,d\lambda) \f$, bin n counts from \f$ [d\lambda \cdot n,d\lambda \cdot (n+1)) \f$. Up to a value of
+    *xmax* for the right hand side of the last bin (a total of *xmax/dx* bins)
+
+    \b Connection to an integrator <br>
+
+    In MPI, the ghost layer width needs to be increased slightly. This is done by passing the MC integrator into the
+    compute which then calls a method to set up the extra ghost width. This connection is also used to get the maximum
+    particle diameter for an input into the cell list size.
+
+    \ingroup hpmc_computes
+*/
+template < class Shape >
+class ComputeSDF : public Compute
+    {
+    public:
+        //! Shape parameter time (shorthand)
+        typedef typename Shape::param_type param_type;
+
+        //! Constructor
+        ComputeSDF(std::shared_ptr<SystemDefinition> sysdef,
+                   std::shared_ptr< IntegratorHPMCMono<Shape> > mc,
+                   double xmax,
+                   double dx);
+
+        //! Destructor
+        virtual ~ComputeSDF()
+            {
+            m_exec_conf->msg->notice(5) << "Destroying ComputeSDF" << std::endl;
+            m_mc->setExtraGhostWidth(0);
+            }
+
+        //! Compute the SDF of the configuration on the given time step
+        virtual void compute(uint64_t timestep);
+
+        //! Get the maximum x value
+        double getXMax()
+            {
+            return m_xmax;
+            }
+
+        //! Set the maximum x value
+        void setXMax(double xmax)
+            {
+            checkParameters(xmax, m_dx);
+            m_xmax = xmax;
+            resizeHistogram();
+            }
+
+        //! Get the bin width
+        double getDx()
+            {
+            return m_dx;
+            }
+
+        //! Set the bin width
+        void setDx(double dx)
+            {
+            checkParameters(m_xmax, dx);
+            m_dx = dx;
+            resizeHistogram();
+            }
+
+        //! Get the SDF of the last computed configuration
+        std::vector<double> getSDF();
+
+    protected:
+        std::shared_ptr< IntegratorHPMCMono<Shape> > m_mc; //!< The integrator
+        double m_xmax;                          //!< Maximum lambda value
+        double m_dx;                            //!< Histogram step size
+
+        std::vector<unsigned int> m_hist;       //!< Raw histogram data, summed over all ranks
+        Scalar m_last_max_diam;                 //!< Last recorded maximum diameter
+
+        //! Throw when the histogram parameters are invalid
+        static void checkParameters(double xmax, double dx);
+
+        //! Allocate the histogram
+        void resizeHistogram();
+
+        //! Set the extra ghost width needed to find the neighbors at xmax
+        void updateGhostWidth();
+
+        //! Count the local particles in the histogram
+        void countHistogram(uint64_t timestep);
+
+        //! Determine the s bin of a given particle pair
+        size_t computeBin(const vec3<Scalar>& r_ij,
+                          const quat<Scalar>& orientation_i,
+                          const quat<Scalar>& orientation_j,
+                          const typename Shape::param_type& params_i,
+                          const typename Shape::param_type& params_j);
+    };
+
+
+/*! \param sysdef System definition
+    \param mc The MC integrator
+    \param xmax Right hand side of the last histogram bin
+    \param dx Bin size
+
+    Construct the SDF compute and initialize histogram memory to 0
+*/
+template < class Shape >
+ComputeSDF<Shape>::ComputeSDF(std::shared_ptr<SystemDefinition> sysdef,
+                              std::shared_ptr< IntegratorHPMCMono<Shape> > mc,
+                              double xmax,
+                              double dx)
+    : Compute(sysdef), m_mc(mc), m_xmax(xmax), m_dx(dx), m_last_max_diam(mc->getMaxCoreDiameter())
+    {
+    m_exec_conf->msg->notice(5) << "Constructing ComputeSDF: " << xmax << " " << dx << std::endl;
+
+    checkParameters(m_xmax, m_dx);
+    resizeHistogram();
+    }
+
+template < class Shape >
+void ComputeSDF<Shape>::checkParameters(double xmax, double dx)
+    {
+    if (dx <= 0.0)
+        throw std::runtime_error("dx must be positive");
+    if (xmax < dx || xmax >= 1.0)
+        throw std::runtime_error("xmax must be in the range [dx, 1)");
+    }
+
+template < class Shape >
+void ComputeSDF<Shape>::resizeHistogram()
+    {
+    m_hist.assign((size_t)(m_xmax / m_dx), 0);
+    updateGhostWidth();
+
+    // the histogram no longer matches the last computed configuration
+    m_first_compute = true;
+    }
+
+template < class Shape >
+void ComputeSDF<Shape>::updateGhostWidth()
+    {
+    m_mc->setExtraGhostWidth(m_xmax * m_last_max_diam);
+    }
+
+/*! \param timestep Current time step
+
+    Main driver. Histograms the local particles and sums the histograms over all ranks.
+*/
+template < class Shape >
+void ComputeSDF<Shape>::compute(uint64_t timestep)
+    {
+    Compute::compute(timestep);
+    if (!shouldCompute(timestep))
+        return;
+
+    m_exec_conf->msg->notice(8) << "Computing sdf at step " << timestep << std::endl;
+
+    // kludge to update the max diameter dynamically if it changes
+    Scalar max_diam = m_mc->getMaxCoreDiameter();
+    if (max_diam != m_last_max_diam)
+        {
+        m_last_max_diam = max_diam;
+        updateGhostWidth();
+        }
+
+    // update ghost layers
+    m_mc->communicate(false);
+
+    if (this->m_prof) this->m_prof->push(this->m_exec_conf, "SDF");
+
+    countHistogram(timestep);
+
+    // total up all of the histogram bins from all ranks
+#ifdef ENABLE_MPI
+    if (m_comm)
+        {
+        MPI_Allreduce(MPI_IN_PLACE, m_hist.data(), (int)m_hist.size(), MPI_UNSIGNED, MPI_SUM,
+                      m_exec_conf->getMPICommunicator());
+        }
+#endif
+
+    if (this->m_prof) this->m_prof->pop();
+    }
+
+/*! \returns The histogram of the last computed configuration normalized by the number of particles and the bin width
+*/
+template < class Shape >
+std::vector<double> ComputeSDF<Shape>::getSDF()
+    {
+    std::vector<double> sdf(m_hist.size());
+    const double norm = double(m_pdata->getNGlobal())*m_dx;
+    for (size_t i = 0; i < m_hist.size(); i++)
+        {
+        sdf[i] = norm > 0 ? double(m_hist[i]) / norm : 0.0;
+        }
+    return sdf;
+    }
+
+/*! \param timestep current timestep
+
+    countHistogram() loops through all particle pairs *i,j* where *i* is on the local rank, computes the bin in which
+    that pair should be and adds 1 to the bin of the closest pair. It operates without any communication: the
+    integrator performs the ghost exchange (with the ghost width extra that we add).
+*/
+template < class Shape >
+void ComputeSDF<Shape>::countHistogram(uint64_t timestep)
+    {
+    // update the aabb tree
+    const detail::AABBTree& aabb_tree = m_mc->buildAABBTree();
+    // update the image list
+    const std::vector<vec3<Scalar> >&image_list = m_mc->updateImageList();
+
+    Scalar extra_width = m_xmax / (1 - m_xmax) * m_mc->getMaxCoreDiameter();
+
+    // access particle data and system box
+    ArrayHandle<Scalar4> h_postype(m_pdata->getPositions(), access_location::host, access_mode::read);
+    ArrayHandle<Scalar4> h_orientation(m_pdata->getOrientationArray(), access_location::host, access_mode::read);
+
+    const std::vector<param_type, managed_allocator<param_type> > & params = m_mc->getParams();
+
+    const size_t n_bins = m_hist.size();
+
+    #ifdef ENABLE_TBB
+    tbb::enumerable_thread_specific< std::vector<unsigned int> > thread_hist(std::vector<unsigned int>(n_bins, 0));
+
+    m_exec_conf->getTaskArena()->execute([&]{
+    tbb::parallel_for(tbb::blocked_range<unsigned int>(0, m_pdata->getN()),
+        [&](const tbb::blocked_range<unsigned int>& r) {
+    std::vector<unsigned int>& hist = thread_hist.local();
+    for (unsigned int i = r.begin(); i != r.end(); ++i)
+    #else
+    std::vector<unsigned int>& hist = m_hist;
+    std::fill(hist.begin(), hist.end(), 0);
+    for (unsigned int i = 0; i < m_pdata->getN(); i++)
+    #endif
+        {
+        size_t min_bin = n_bins;
+
+        // read in the current position and orientation
+        Scalar4 postype_i = h_postype.data[i];
+        Scalar4 orientation_i = h_orientation.data[i];
+        Shape shape_i(quat<Scalar>(orientation_i), params[__scalar_as_int(postype_i.w)]);
+        vec3<Scalar> pos_i = vec3<Scalar>(postype_i);
+
+        // construct the AABB around the particle's circumsphere
+        // pad with enough extra width so that when scaled by xmax, found particles might touch
+        detail::AABB aabb_i_local(vec3<Scalar>(0,0,0), shape_i.getCircumsphereDiameter()/Scalar(2) + extra_width);
+
+        size_t n_images = image_list.size();
+        for (unsigned int cur_image = 0; cur_image < n_images; cur_image++)
+            {
+            vec3<Scalar> pos_i_image = pos_i + image_list[cur_image];
+            detail::AABB aabb = aabb_i_local;
+            aabb.translate(pos_i_image);
+
+            // stackless search
+            for (unsigned int cur_node_idx = 0; cur_node_idx < aabb_tree.getNumNodes(); cur_node_idx++)
+                {
+                if (detail::overlap(aabb_tree.getNodeAABB(cur_node_idx), aabb))
+                    {
+                    if (aabb_tree.isNodeLeaf(cur_node_idx))
+                        {
+                        for (unsigned int cur_p = 0; cur_p < aabb_tree.getNodeNumParticles(cur_node_idx); cur_p++)
+                            {
+                            // read in its position and orientation
+                            unsigned int j = aabb_tree.getNodeParticle(cur_node_idx, cur_p);
+
+                            // skip i==j in the 0 image
+                            if (cur_image == 0 && i == j)
+                                continue;
+
+                            Scalar4 postype_j = h_postype.data[j];
+                            Scalar4 orientation_j = h_orientation.data[j];
+
+                            // put particles in coordinate system of particle i
+                            vec3<Scalar> r_ij = vec3<Scalar>(postype_j) - pos_i_image;
+
+                            size_t bin = computeBin(r_ij,
+                                                    quat<Scalar>(orientation_i),
+                                                    quat<Scalar>(orientation_j),
+                                                    params[__scalar_as_int(postype_i.w)],
+                                                    params[__scalar_as_int(postype_j.w)]);
+
+                            min_bin = std::min(min_bin, bin);
+                            }
+                        }
+                    }
+                else
+                    {
+                    // skip ahead
+                    cur_node_idx += aabb_tree.getNodeSkip(cur_node_idx);
+                    }
+                } // end loop over AABB nodes
+            } // end loop over images
+
+        // record the minimum bin
+        if (min_bin < n_bins)
+            hist[min_bin]++;
+
+        } // end loop over all particles
+    #ifdef ENABLE_TBB
+        });
+    });
+
+    // sum the per-thread histograms
+    std::fill(m_hist.begin(), m_hist.end(), 0);
+    for (const std::vector<unsigned int>& hist : thread_hist)
+        {
+        for (size_t bin = 0; bin < n_bins; bin++)
+            m_hist[bin] += hist[bin];
+        }
+    #endif
+    }
+
+/*! \param r_ij Vector pointing from particle i to j (already wrapped into the box)
+    \param orientation_i Orientation of the particle i
+    \param orientation_j Orientation of particle j
+    \param params_i Parameters for particle i
+    \param params_j Parameters for particle j
+
+    \returns s bin index, or the number of bins when the pair overlaps at the left boundary or does not overlap at
+             the right boundary
+
+    In the first general version, computeBin uses a binary search tree to determine
+    the bin. In this way, only a test_overlap method is needed, no extra math. The
+    binary search works by first ensuring that the particle does not overlap at the
+    left boundary and does overlap a the right. Then it picks a new point halfway between
+    the left and right, ensuring that the same assumption holds. Once right=left+1, the
+    correct bin has been found.
+*/
+template < class Shape >
+size_t ComputeSDF<Shape>::computeBin(const vec3<Scalar>& r_ij,
+                                     const quat<Scalar>& orientation_i,
+                                     const quat<Scalar>& orientation_j,
+                                     const typename Shape::param_type& params_i,
+                                     const typename Shape::param_type& params_j)
+    {
+    size_t L=0;
+    size_t R=m_hist.size();
+
+    // if the particles already overlap a the left boundary, return an out of range value
+    if (detail::test_scaled_overlap<Shape>(r_ij, orientation_i, orientation_j, params_i, params_j, double(L)*m_dx))
+        return m_hist.size();
+
+    // if the particles do not overlap a the right boundary, return an out of range value
+    if (!detail::test_scaled_overlap<Shape>(r_ij, orientation_i, orientation_j, params_i, params_j, double(R)*m_dx))
+        return m_hist.size();
+
+    // progressively narrow the search window by halves
+    do
+        {
+        size_t m = (L+R)/2;
+
+        if (detail::test_scaled_overlap<Shape>(r_ij, orientation_i, orientation_j, params_i, params_j, double(m)*m_dx))
+            R = m;
+        else
+            L = m;
+        } while ((R-L) > 1);
+
+    return L;
+    }
+
+//! Export the ComputeSDF class to python
+/*! \param name Name of the class in the exported python module
+    \tparam Shape An instantiation of ComputeSDF<Shape> will be exported
+*/
+template < class Shape > void export_ComputeSDF(pybind11::module& m, const std::string& name)
+    {
+    pybind11::class_< ComputeSDF<Shape>, Compute, std::shared_ptr< ComputeSDF<Shape> > >(m, name.c_str())
+          .def(pybind11::init< std::shared_ptr<SystemDefinition>, std::shared_ptr< IntegratorHPMCMono<Shape> >, double, double >())
+          .def_property("xmax", &ComputeSDF<Shape>::getXMax, &ComputeSDF<Shape>::setXMax)
+          .def_property("dx", &ComputeSDF<Shape>::getDx, &ComputeSDF<Shape>::setDx)
+          .def_property_readonly("sdf", &ComputeSDF<Shape>::getSDF)
+          ;
+    }
+
+} // end namespace hpmc
+
+#endif // _COMPUTE_SDF_H_
@@ -6,6 +6,7 @@
 
 
 #include "hoomd/HOOMDMath.h"
+#include <vector>
 
 namespace hpmc
 {
@@ -32,6 +33,10 @@ struct hpmc_counters_t
     unsigned long long int rotate_reject_count;         //!< Count of rejected rotation moves
     unsigned long long int overlap_checks;              //!< Count of the number of overlap checks
     unsigned int overlap_err_count;                     //!< Count of the number of times overlap checks encounter errors
+    unsigned long long int circumsphere_reject_count;   //!< Count of overlap checks settled by the circumspheres
+    unsigned long long int insphere_overlap_count;      //!< Count of overlap checks settled by the in-spheres
+    unsigned long long int obb_reject_count;            //!< Count of overlap checks settled by the OBBs
+    unsigned long long int exact_check_count;           //!< Count of exact overlap checks after the fast tiers
 
     //! Construct a zero set of counters
     DEVICE hpmc_counters_t()
@@ -42,6 +47,10 @@ struct hpmc_counters_t
         rotate_reject_count = 0;
         overlap_checks = 0;
         overlap_err_count = 0;
+        circumsphere_reject_count = 0;
+        insphere_overlap_count = 0;
+        obb_reject_count = 0;
+        exact_check_count = 0;
         }
 
     # ifndef NVCC
@@ -61,6 +70,14 @@ struct hpmc_counters_t
         return std::make_pair(rotate_accept_count, rotate_reject_count);
         }
 
+    //! Get the number of overlap checks settled by each tier of the narrow phase
+    /*! \returns The number of checks settled by the circumspheres, the in-spheres, the OBBs, and the exact test.
+    */
+    std::vector<unsigned long long int> getNarrowPhaseCounts()
+        {
+        return {circumsphere_reject_count, insphere_overlap_count, obb_reject_count, exact_check_count};
+        }
+
     //! Get the number of moves
     /*! \return The total number of moves
     */
@@ -81,6 +98,10 @@ DEVICE inline hpmc_counters_t operator-(const hpmc_counters_t& a, const hpmc_cou
     result.rotate_reject_count = a.rotate_reject_count - b.rotate_reject_count;
     result.overlap_checks = a.overlap_checks - b.overlap_checks;
     result.overlap_err_count = a.overlap_err_count - b.overlap_err_count;
+    result.circumsphere_reject_count = a.circumsphere_reject_count - b.circumsphere_reject_count;
+    result.insphere_overlap_count = a.insphere_overlap_count - b.insphere_overlap_count;
+    result.obb_reject_count = a.obb_reject_count - b.obb_reject_count;
+    result.exact_check_count = a.exact_check_count - b.exact_check_count;
     return result;
     }
 
@@ -94,6 +115,10 @@ DEVICE inline hpmc_counters_t operator+(const hpmc_counters_t& a, const hpmc_cou
     result.rotate_reject_count = a.rotate_reject_count + b.rotate_reject_count;
     result.overlap_checks = a.overlap_checks + b.overlap_checks;
     result.overlap_err_count = a.overlap_err_count + b.overlap_err_count;
+    result.circumsphere_reject_count = a.circumsphere_reject_count + b.circumsphere_reject_count;
+    result.insphere_overlap_count = a.insphere_overlap_count + b.insphere_overlap_count;
+    result.obb_reject_count = a.obb_reject_count + b.obb_reject_count;
+    result.exact_check_count = a.exact_check_count + b.exact_check_count;
     return result;
     }
 
@@ -9,6 +9,7 @@
     \brief Declaration of IntegratorHPMC
 */
 
+#include <deque>
 #include <iostream>
 #include <iomanip>
 #include <sstream>
@@ -115,8 +116,67 @@ class UpdateOrder
         std::vector<unsigned int> m_update_order; //!< Update order
     };
 
+//! A depletant that overlaps the particle in whose excluded volume it was inserted
+struct CachedDepletant
+    {
+    vec3<Scalar> r;                 //!< Position of the depletant relative to the particle
+    quat<Scalar> orientation;       //!< Orientation of the depletant
+    bool overlap_a;                 //!< True if a depletant of the first type overlaps the particle
+    bool overlap_b;                 //!< True if a depletant of the second type overlaps the particle
+    };
+
+//! Depletants inserted in the excluded volume of one particle for one pair of depletant types
+/*! The depletants that a particle inserts in its own excluded volume are a function of its seed, orientation and
+    type alone: they are placed relative to the particle with random numbers drawn from its seed. An entry stores,
+    for each reinsertion attempt, the number of inserted depletants and those that overlap the particle, together
+    with the results of those overlap checks. It remains valid as long as the seed, orientation and type match.
+
+    \ingroup hpmc_data_structs
+*/
+struct DepletantCacheEntry
+    {
+    bool valid = false;                         //!< True if the entry has been assigned to a particle
+    unsigned int seed = 0;                      //!< Seed of the particle
+    quat<Scalar> orientation;                   //!< Orientation of the particle
+    unsigned int type = 0;                      //!< Type of the particle
+
+    std::vector<unsigned int> n_insert;                     //!< Number of inserted depletants, per trial
+    std::vector< std::vector<CachedDepletant> > depletants; //!< Depletants overlapping the particle, per trial
+
+    unsigned long long int overlap_checks = 0;  //!< Number of overlap checks performed to fill the entry
+    unsigned int overlap_err_count = 0;         //!< Number of overlap check errors while filling the entry
+
+    //! Test if the entry holds the depletants of a particle
+    /*! \param _seed Seed of the particle
+        \param _orientation Orientation of the particle
+        \param _type Type of the particle
+        \param has_orientation True if the orientation of the particle matters
+    */
+    bool matches(unsigned int _seed, const quat<Scalar>& _orientation, unsigned int _type,
+        bool has_orientation) const
+        {
+        return valid && seed == _seed && type == _type
+            && (!has_orientation || (orientation.s == _orientation.s && orientation.v.x == _orientation.v.x
+                && orientation.v.y == _orientation.v.y && orientation.v.z == _orientation.v.z));
+        }
+    };
+
 }; // end namespace detail
 
+//! Get the sum of the in-sphere radii of two shapes
+/*! \param a First shape
+    \param b Second shape
+    \returns The distance between the centers below which the shapes are guaranteed to overlap
+
+    Shapes whose in-spheres alone do not guarantee an overlap (such as unions with overlap masks) overload this
+    function.
+*/
+template<class Shape>
+inline OverlapReal getPairInsphereRadius(const Shape& a, const Shape& b)
+    {
+    return a.getInsphereRadius() + b.getInsphereRadius();
+    }
+
 //! HPMC on systems of mono-disperse shapes
 /*! Implement hard particle monte carlo for a single type of shape on the CPU.
 
@@ -161,6 +221,7 @@ class IntegratorHPMCMono : public IntegratorHPMC
 
             m_ntrial[m_depletant_idx(type_a,type_b)] = ntrial;
             m_ntrial[m_depletant_idx(type_b,type_a)] = ntrial;
+            m_depletant_cache_valid = false;
             }
 
         //! Set the depletant density in the free volume
@@ -170,6 +231,7 @@ class IntegratorHPMCMono : public IntegratorHPMC
             unsigned int type_b = this->m_pdata->getTypeByName(types.second);
             m_fugacity[m_depletant_idx(type_a,type_b)] = fugacity;
             m_fugacity[m_depletant_idx(type_b,type_a)] = fugacity;
+            m_depletant_cache_valid = false;
             }
 
         //! Returns the depletant fugacity
@@ -204,6 +266,7 @@ class IntegratorHPMCMono : public IntegratorHPMC
                 throw std::runtime_error("Unknown type.");
             m_fugacity[m_depletant_idx(type_a,type_b)] = fugacity;
             m_fugacity[m_depletant_idx(type_b,type_a)] = fugacity;
+            m_depletant_cache_valid = false;
             }
 
         //! Returns the depletant fugacity
@@ -224,6 +287,32 @@ class IntegratorHPMCMono : public IntegratorHPMC
             return m_ntrial;
             }
 
+        //! Enable or disable the cache of the depletants in the excluded volume of each particle
+        void setDepletantCache(bool depletant_cache)
+            {
+            m_depletant_cache = depletant_cache;
+            m_depletant_cache_valid = false;
+            }
+
+        //! Returns true if the depletants in the excluded volume of each particle are cached
+        bool getDepletantCache()
+            {
+            return m_depletant_cache;
+            }
+
+        //! Enable or disable the fast tiers of the narrow phase overlap check
+        void setNarrowPhaseTiers(bool narrow_phase_tiers)
+            {
+            m_narrow_phase_tiers = narrow_phase_tiers;
+            m_narrow_phase_valid = false;
+            }
+
+        //! Returns true if the fast tiers of the narrow phase overlap check are enabled
+        bool getNarrowPhaseTiers()
+            {
+            return m_narrow_phase_tiers;
+            }
+
         //! Get the current counter values
         virtual std::vector<hpmc_implicit_counters_t> getImplicitCounters(unsigned int mode=0);
 
@@ -472,9 +561,17 @@ class IntegratorHPMCMono : public IntegratorHPMC
             return type_shape_mapping;
             }
 
+        //! Get the shape specifications of all types, generated once after the parameters change
+        const std::vector<std::string>& getTypeShapes() const
+            {
+            if (m_type_shapes.size() != m_params.size())
+                m_type_shapes = getTypeShapeMapping(m_params);
+            return m_type_shapes;
+            }
+
         pybind11::list getTypeShapesPy()
             {
-            std::vector<std::string> type_shape_mapping = this->getTypeShapeMapping(this->m_params);
+            const std::vector<std::string>& type_shape_mapping = this->getTypeShapes();
             pybind11::list type_shapes;
             for (unsigned int i = 0; i < type_shape_mapping.size(); i++)
                 type_shapes.append(type_shape_mapping[i]);
@@ -483,6 +580,8 @@ class IntegratorHPMCMono : public IntegratorHPMC
 
     protected:
         std::vector<param_type, managed_allocator<param_type> > m_params;   //!< Parameters for each particle type on GPU
+        std::vector<std::string> m_shape_keys;      //!< Python representation of the shape set for each type
+        mutable std::vector<std::string> m_type_shapes; //!< Cached shape specifications, empty when invalid
         GlobalArray<unsigned int> m_overlaps;          //!< Interaction matrix (0/1) for overlap checks
         detail::UpdateOrder m_update_order;         //!< Update order
         bool m_image_list_is_initialized;                    //!< true if image list has been used
@@ -514,6 +613,24 @@ class IntegratorHPMCMono : public IntegratorHPMC
         std::vector<hpmc_implicit_counters_t> m_implicit_count_run_start;     //!< Counter of depletant insertions at run start
         std::vector<hpmc_implicit_counters_t> m_implicit_count_step_start;    //!< Counter of depletant insertions at step start
 
+        bool m_depletant_cache;                     //!< True if the depletants of unchanged particles are reused
+        bool m_depletant_cache_valid;               //!< False if the cached depletants need to be discarded
+        std::vector< std::vector<detail::DepletantCacheEntry> > m_depletant_cache_entries; //!< Cached depletants per type pair, indexed by tag (empty for pairs without depletants)
+        std::vector<detail::DepletantCacheEntry> m_depletant_cache_trial; //!< Depletants of the trial move per type pair
+
+        bool m_narrow_phase_tiers;                  //!< True if the narrow phase tries the fast tiers before the exact test
+        bool m_narrow_phase_valid;                  //!< False if the per type pair narrow phase data needs to be rebuilt
+        std::vector<OverlapReal> m_circumsphere_sq; //!< Squared sum of the circumsphere radii, per type pair
+        std::vector<OverlapReal> m_insphere_sq;     //!< Squared sum of the in-sphere radii, per type pair
+        std::vector<unsigned int> m_narrow_phase_obb; //!< Nonzero if the OBB tier can reject overlaps, per type pair
+
+        //! Rebuild the per type pair narrow phase data
+        void updateNarrowPhase();
+
+        //! Test for overlap with the circumsphere, in-sphere, OBB, and exact tiers
+        inline bool testOverlapTiered(const vec3<Scalar>& r_ij, const Shape& shape_i, const Shape& shape_j,
+            unsigned int typ_i, unsigned int typ_j, unsigned int ndim, hpmc_counters_t& counters);
+
         //! Test whether to reject the current particle move based on depletants
         inline bool checkDepletantOverlap(unsigned int i, vec3<Scalar> pos_i, Shape shape_i, unsigned int typ_i,
             Scalar4 *h_postype, Scalar4 *h_orientation, const unsigned int *h_tag, const Scalar4 *h_vel,
@@ -521,6 +638,13 @@ class IntegratorHPMCMono : public IntegratorHPMC
             uint64_t timestep, hoomd::RandomGenerator& rng_depletants,
             unsigned int seed_i_old, unsigned int seed_i_new);
 
+        //! Insert the depletants in the excluded volume of a particle
+        void fillDepletantCacheEntry(detail::DepletantCacheEntry& entry, unsigned int type_a, unsigned int type_b,
+            unsigned int ntrial, Scalar fugacity, const unsigned int *h_overlaps);
+
+        //! Keep the depletants of an accepted trial move in the cache
+        void acceptDepletantCacheEntries(unsigned int tag);
+
         //! Set the nominal width appropriate for looped moves
         virtual void updateCellWidth();
 
@@ -556,12 +680,17 @@ IntegratorHPMCMono<Shape>::IntegratorHPMCMono(std::shared_ptr<SystemDefinition>
               m_hasOrientation(true),
               m_extra_image_width(0.0),
               m_fugacity(m_exec_conf),
-              m_ntrial(m_exec_conf)
+              m_ntrial(m_exec_conf),
+              m_depletant_cache(false),
+              m_depletant_cache_valid(false),
+              m_narrow_phase_tiers(false),
+              m_narrow_phase_valid(false)
     {
     // allocate the parameter storage, setting the managed flag
     m_params = std::vector<param_type, managed_allocator<param_type> >(m_pdata->getNTypes(),
                                                                        param_type(),
                                                                        managed_allocator<param_type>(m_exec_conf->isCUDAEnabled()));
+    m_shape_keys.resize(m_pdata->getNTypes());
 
     m_overlap_idx = Index2D(m_pdata->getNTypes());
     GlobalArray<unsigned int> overlaps(m_overlap_idx.getNumElements(), m_exec_conf);
@@ -804,6 +933,10 @@ void IntegratorHPMCMono<Shape>::slotNumTypesChange()
     {
     // re-allocate the parameter storage, setting the managed flag on new members
     m_params.resize(m_pdata->getNTypes(), param_type());
+    m_shape_keys.resize(m_pdata->getNTypes());
+    m_type_shapes.clear();
+    m_depletant_cache_valid = false;
+    m_narrow_phase_valid = false;
 
     // skip the reallocation if the number of types does not change
     // this keeps old potential coefficients when restoring a snapshot
@@ -925,6 +1058,30 @@ void IntegratorHPMCMono<Shape>::update(uint64_t timestep)
             }
         }
 
+    // the cached depletants are indexed by tag and depletant type pair, only the pairs (type_a <= type_b) with a
+    // nonzero fugacity insert depletants and need entries
+    if (!m_depletant_cache_valid || !m_depletant_cache)
+        {
+        m_depletant_cache_entries.clear();
+        m_depletant_cache_trial.clear();
+        m_depletant_cache_valid = true;
+        }
+    if (m_depletant_cache && has_depletants)
+        {
+        m_depletant_cache_entries.resize(m_depletant_idx.getNumElements());
+        m_depletant_cache_trial.resize(m_depletant_idx.getNumElements());
+        for (unsigned int type_a = 0; type_a < this->m_pdata->getNTypes(); ++type_a)
+            for (unsigned int type_b = type_a; type_b < this->m_pdata->getNTypes(); ++type_b)
+                {
+                unsigned int pair_idx = m_depletant_idx(type_a,type_b);
+                if (m_fugacity[pair_idx] != 0.0)
+                    m_depletant_cache_entries[pair_idx].resize(m_pdata->getMaximumTag()+1);
+                }
+        }
+
+    if (m_narrow_phase_tiers && !m_narrow_phase_valid)
+        updateNarrowPhase();
+
     // Combine the three seeds to generate RNG for poisson distribution
     hoomd::RandomGenerator rng_depletants(hoomd::Seed(hoomd::RNGIdentifier::HPMCDepletants,
                                                       timestep,
@@ -1099,8 +1256,10 @@ void IntegratorHPMCMono<Shape>::update(uint64_t timestep)
 
                                 counters.overlap_checks++;
                                 if (h_overlaps.data[m_overlap_idx(typ_i, typ_j)]
-                                    && check_circumsphere_overlap(r_ij, shape_i, shape_j)
-                                    && test_overlap(r_ij, shape_i, shape_j, counters.overlap_err_count))
+                                    && (m_narrow_phase_tiers
+                                        ? testOverlapTiered(r_ij, shape_i, shape_j, typ_i, typ_j, ndim, counters)
+                                        : (check_circumsphere_overlap(r_ij, shape_i, shape_j)
+                                           && test_overlap(r_ij, shape_i, shape_j, counters.overlap_err_count))))
                                     {
                                     overlap = true;
                                     break;
@@ -1258,7 +1417,12 @@ void IntegratorHPMCMono<Shape>::update(uint64_t timestep)
 
                 // store new seed
                 if (has_depletants)
+                    {
                     h_vel.data[i].x = __int_as_scalar(seed_i_new);
+
+                    if (m_depletant_cache)
+                        acceptDepletantCacheEntries(h_tag.data[i]);
+                    }
                 }
             else
                 {
@@ -1654,7 +1818,26 @@ template <class Shape> inline
 void IntegratorHPMCMono<Shape>::setShape(std::string typ, pybind11::dict v)
     {
     unsigned int id = this->m_pdata->getTypeByName(typ);
+
+    // building the shape data (convex hulls, OBB trees) is expensive, so compile each distinct set of
+    // parameters only once: setting an unchanged shape is a no-op and types with identical shapes share the
+    // compiled data
+    std::string key = pybind11::repr(v).cast<std::string>();
+    if (m_shape_keys[id] == key)
+        return;
+
+    for (unsigned int other = 0; other < m_shape_keys.size(); ++other)
+        {
+        if (other != id && m_shape_keys[other] == key)
+            {
+            setParam(id, m_params[other]);
+            m_shape_keys[id] = key;
+            return;
+            }
+        }
+
     setParam(id, typename Shape::param_type(v, m_exec_conf->isCUDAEnabled()));
+    m_shape_keys[id] = key;
     }
 
 /*! \param typ type name to get
@@ -1684,6 +1867,11 @@ void IntegratorHPMCMono<Shape>::setParam(unsigned int typ,  const param_type& pa
         m_params[typ] = param;
         }
 
+    // the parameters may not come from setShape
+    m_shape_keys[typ].clear();
+    m_type_shapes.clear();
+    m_depletant_cache_valid = false;
+    m_narrow_phase_valid = false;
     updateCellWidth();
     }
 
@@ -1700,6 +1888,7 @@ void IntegratorHPMCMono<Shape>::setInteractionMatrix(std::pair<std::string, std:
     h_overlaps.data[m_overlap_idx(typj,typi)] = check_overlaps;
 
     m_image_list_valid = false;
+    m_depletant_cache_valid = false;
     }
 
 template <class Shape>
@@ -2367,7 +2556,7 @@ int IntegratorHPMCMono<Shape>::slotWriteGSDShapeSpec(gsd_handle& handle) const
     {
     GSDShapeSpecWriter shapespec(m_exec_conf);
     m_exec_conf->msg->notice(10) << "IntegratorHPMCMono writing to GSD File to name: " << shapespec.getName() << std::endl;
-    int retval = shapespec.write(handle, this->getTypeShapeMapping(m_params));
+    int retval = shapespec.write(handle, this->getTypeShapes());
     return retval;
     }
 
@@ -2495,6 +2684,10 @@ inline bool IntegratorHPMCMono<Shape>::checkDepletantOverlap(unsigned int i, vec
     Scalar ln_numerator_tot(0.0);
     Scalar ln_denominator_tot(0.0);
 
+    // discard the depletants of the previous trial move
+    for (auto& entry : m_depletant_cache_trial)
+        entry.valid = false;
+
     #ifdef ENABLE_TBB
     m_exec_conf->getTaskArena()->execute([&]{
     try {
@@ -2729,12 +2922,90 @@ inline bool IntegratorHPMCMono<Shape>::checkDepletantOverlap(unsigned int i, vec
                     }  // end loop over AABB nodes
                 } // end loop over images
 
+            // the depletants in the excluded volume of a particle depend only on its seed, orientation and type,
+            // look them up in the cache or schedule them to be inserted
+            unsigned int pair_idx = m_depletant_idx(type_a,type_b);
+            unsigned int tag_i = h_tag[i];
+            std::deque<detail::DepletantCacheEntry> local_entries;
+            std::vector<unsigned int> local_tags;
+            std::vector<detail::DepletantCacheEntry *> insert;
+
+            auto lookup = [&](unsigned int tag, unsigned int seed, const Shape& shape, unsigned int type,
+                bool shared) -> detail::DepletantCacheEntry *
+                {
+                detail::DepletantCacheEntry *entry = nullptr;
+                if (m_depletant_cache && shared && pair_idx < m_depletant_cache_entries.size()
+                    && tag < m_depletant_cache_entries[pair_idx].size())
+                    {
+                    entry = &m_depletant_cache_entries[pair_idx][tag];
+                    if (entry->matches(seed, shape.orientation, type, shape.hasOrientation()))
+                        return entry;
+                    }
+                else
+                    {
+                    for (unsigned int m = 0; m < local_tags.size(); ++m)
+                        {
+                        if (local_tags[m] == tag
+                            && local_entries[m].matches(seed, shape.orientation, type, shape.hasOrientation()))
+                            return &local_entries[m];
+                        }
+                    local_entries.emplace_back();
+                    local_tags.push_back(tag);
+                    entry = &local_entries.back();
+                    }
+
+                entry->valid = true;
+                entry->seed = seed;
+                entry->orientation = shape.orientation;
+                entry->type = type;
+                insert.push_back(entry);
+                return entry;
+                };
+
+            // the trial configuration of particle i is not shared until the move is accepted
+            const detail::DepletantCacheEntry *entry_i_old = lookup(tag_i, seed_i_old, shape_old, typ_i, true);
+            detail::DepletantCacheEntry *entry_i_new = lookup(tag_i, seed_i_new, shape_i, typ_i, false);
+
+            std::vector<const detail::DepletantCacheEntry *> entry_j_old(pos_j_old.size());
+            for (unsigned int k = 0; k < pos_j_old.size(); ++k)
+                {
+                Shape shape_k(orientation_j_old[k], this->m_params[type_j_old[k]]);
+                entry_j_old[k] = lookup(tag_j_old[k], seed_j_old[k], shape_k, type_j_old[k], true);
+                }
+
+            std::vector<const detail::DepletantCacheEntry *> entry_j_new(pos_j_new.size());
+            for (unsigned int k = 0; k < pos_j_new.size(); ++k)
+                {
+                Shape shape_k(orientation_j_new[k], this->m_params[type_j_new[k]]);
+                entry_j_new[k] = lookup(tag_j_new[k], seed_j_new[k], shape_k, type_j_new[k], tag_j_new[k] != tag_i);
+                }
+
+            #ifdef ENABLE_TBB
+            tbb::parallel_for(tbb::blocked_range<size_t>(0, insert.size()),
+                [=, &insert](const tbb::blocked_range<size_t>& r) {
+            for (size_t m = r.begin(); m != r.end(); ++m)
+            #else
+            for (size_t m = 0; m < insert.size(); ++m)
+            #endif
+                {
+                fillDepletantCacheEntry(*insert[m], type_a, type_b, ntrial, fugacity, h_overlaps);
+                }
+            #ifdef ENABLE_TBB
+                });
+            #endif
+
+            for (auto entry : insert)
+                {
+                counters.overlap_checks += entry->overlap_checks;
+                counters.overlap_err_count += entry->overlap_err_count;
+                }
+
             // insert into particle OBBs
             #ifdef ENABLE_TBB
             tbb::parallel_for(tbb::blocked_range<unsigned int>(0, 2),
                 [=, &shape_old, &shape_i,
-                    &pos_j_new, &orientation_j_new, &type_j_new,
-                    &pos_j_old, &orientation_j_old, &type_j_old,
+                    &pos_j_new, &orientation_j_new, &type_j_new, &entry_j_new,
+                    &pos_j_old, &orientation_j_old, &type_j_old, &entry_j_old,
                     &thread_ln_denominator, &thread_ln_numerator,
                     &thread_counters, &thread_implicit_counters](const tbb::blocked_range<unsigned int>& v) {
             for (unsigned int new_config = v.begin(); new_config != v.end(); ++new_config)
@@ -2742,14 +3013,14 @@ inline bool IntegratorHPMCMono<Shape>::checkDepletantOverlap(unsigned int i, vec
             for (unsigned int new_config = 0; new_config < 2; ++new_config)
             #endif
                 {
-                detail::OBB obb_i = new_config ? obb_i_new : obb_i_old;
-                Scalar V_i = obb_i.getVolume(ndim);
+                // the depletants in the excluded volume of particle i
+                const detail::DepletantCacheEntry *entry_i = new_config ? entry_i_new : entry_i_old;
 
                 #ifdef ENABLE_TBB
                 tbb::parallel_for(tbb::blocked_range<unsigned int>(0, ntrial),
                     [=, &shape_old, &shape_i,
-                        &pos_j_new, &orientation_j_new, &type_j_new,
-                        &pos_j_old, &orientation_j_old, &type_j_old,
+                        &pos_j_new, &orientation_j_new, &type_j_new, &entry_j_new,
+                        &pos_j_old, &orientation_j_old, &type_j_old, &entry_j_old,
                         &thread_ln_denominator, &thread_ln_numerator,
                         &thread_counters, &thread_implicit_counters]
                         (const tbb::blocked_range<unsigned int>& u) {
@@ -2758,29 +3029,29 @@ inline bool IntegratorHPMCMono<Shape>::checkDepletantOverlap(unsigned int i, vec
                 for (unsigned int i_trial = 0; i_trial < ntrial; ++i_trial)
                 #endif
                     {
-                    // chooose the number of depletants in the insertion OBB
-                    Scalar lambda = std::abs(fugacity)*V_i;
-                    hoomd::PoissonDistribution<Scalar> poisson(lambda);
-                    unsigned int ntypes = this->m_pdata->getNTypes();
-                    hoomd::RandomGenerator rng_num(hoomd::Seed(hoomd::RNGIdentifier::HPMCDepletantNum,
-                                                               0,
-                                                               0),
-                                                   hoomd::Counter(type_a*ntypes+type_b,
-                                                                  new_config ? seed_i_new : seed_i_old,
-                                                                  i_trial)
-                                                   );
-
-                    unsigned int n = poisson(rng_num);
+                    if (! shape_i.ignoreStatistics())
+                        {
+                        #ifdef ENABLE_TBB
+                        thread_implicit_counters[m_depletant_idx(type_a,type_b)].local().insert_count +=
+                            entry_i->n_insert[i_trial];
+                        #else
+                        implicit_counters[m_depletant_idx(type_a,type_b)].insert_count += entry_i->n_insert[i_trial];
+                        #endif
+                        }
+
+                    // only the depletants that overlap particle i contribute
+                    const std::vector<detail::CachedDepletant> *depletants_i = &entry_i->depletants[i_trial];
+                    unsigned int n = (unsigned int) depletants_i->size();
 
                     // try inserting in the overlap volume
                     size_t n_intersect = new_config ? pos_j_new.size() : pos_j_old.size();
 
                     // for every depletant
                     #ifdef ENABLE_TBB
-                    tbb::parallel_for(tbb::blocked_range<unsigned int>(0, (unsigned int)n),
+                    tbb::parallel_for(tbb::blocked_range<unsigned int>(0, n),
                         [=, &shape_old, &shape_i,
-                            &pos_j_new, &orientation_j_new, &type_j_new,
-                            &pos_j_old, &orientation_j_old, &type_j_old,
+                            &pos_j_new, &orientation_j_new, &type_j_new, &entry_j_new,
+                            &pos_j_old, &orientation_j_old, &type_j_old, &entry_j_old,
                             &thread_ln_denominator, &thread_ln_numerator,
                             &thread_counters, &thread_implicit_counters](const tbb::blocked_range<unsigned int>& t) {
                     for (unsigned int l = t.begin(); l != t.end(); ++l)
@@ -2788,115 +3059,19 @@ inline bool IntegratorHPMCMono<Shape>::checkDepletantOverlap(unsigned int i, vec
                     for (unsigned int l = 0; l < n; ++l)
                     #endif
                         {
-                        hoomd::RandomGenerator my_rng(hoomd::Seed(hoomd::RNGIdentifier::HPMCDepletants,
-                                                                  0,
-                                                                  0),
-                                                      hoomd::Counter(new_config ? seed_i_new : seed_i_old,
-                                                                     l,
-                                                                     i_trial,
-                                                                     static_cast<uint16_t>(type_a+type_b*ntypes))
-                                                      );
-
-                        if (! shape_i.ignoreStatistics())
-                            {
-                            #ifdef ENABLE_TBB
-                            thread_implicit_counters[m_depletant_idx(type_a,type_b)].local().insert_count++;
-                            #else
-                            implicit_counters[m_depletant_idx(type_a,type_b)].insert_count++;
-                            #endif
-                            }
-
-                        // rejection-free sampling
-                        vec3<Scalar> pos_test(generatePositionInOBB(my_rng, obb_i, ndim));
+                        const detail::CachedDepletant& depletant = (*depletants_i)[l];
+                        vec3<Scalar> pos_test = (new_config ? pos_i : pos_i_old) + depletant.r;
 
                         Shape shape_test_a(quat<Scalar>(), this->m_params[type_a]);
                         Shape shape_test_b(quat<Scalar>(), this->m_params[type_b]);
-                        quat<Scalar> o;
-                        if (shape_test_a.hasOrientation() || shape_test_b.hasOrientation())
-                            {
-                            o = generateRandomOrientation(my_rng, ndim);
-                            }
                         if (shape_test_a.hasOrientation())
-                            shape_test_a.orientation = o;
+                            shape_test_a.orientation = depletant.orientation;
                         if (shape_test_b.hasOrientation())
-                            shape_test_b.orientation = o;
-
-                        // Check if the new (old) configuration of particle i generates an overlap
-                        bool overlap_i_a = false;
-                        bool overlap_i_b = false;
-
-                        vec3<Scalar> r_i_test = pos_test - (new_config ? pos_i : pos_i_old);
-                            {
-                            const Shape& shape = !new_config ? shape_old : shape_i;
+                            shape_test_b.orientation = depletant.orientation;
 
-                            OverlapReal rsq = (OverlapReal) dot(r_i_test,r_i_test);
-                            OverlapReal DaDb = shape_test_a.getCircumsphereDiameter() + shape.getCircumsphereDiameter();
-                            bool circumsphere_overlap = (rsq*OverlapReal(4.0) <= DaDb * DaDb);
-
-                            if (h_overlaps[this->m_overlap_idx(type_a, typ_i)])
-
-                            if (h_overlaps[this->m_overlap_idx(type_a, typ_i)])
-                                {
-                                #ifdef ENABLE_TBB
-                                thread_counters.local().overlap_checks++;
-                                #else
-                                counters.overlap_checks++;
-                                #endif
-
-                                unsigned int err = 0;
-                                if (circumsphere_overlap &&
-                                    test_overlap(r_i_test, shape, shape_test_a, err))
-                                    {
-                                    overlap_i_a = true;
-                                    }
-                                if (err)
-                                #ifdef ENABLE_TBB
-                                    thread_counters.local().overlap_err_count++;
-                                #else
-                                    counters.overlap_err_count++;
-                                #endif
-                                }
-                            }
-
-                        if (type_b == type_a)
-                            {
-                            overlap_i_b = overlap_i_a;
-                            }
-                        else
-                            {
-                            const Shape& shape = !new_config ? shape_old : shape_i;
-
-                            OverlapReal rsq = (OverlapReal) dot(r_i_test,r_i_test);
-                            OverlapReal DaDb = shape_test_b.getCircumsphereDiameter() + shape.getCircumsphereDiameter();
-                            bool circumsphere_overlap = (rsq*OverlapReal(4.0) <= DaDb * DaDb);
-
-                            if (h_overlaps[this->m_overlap_idx(type_b, typ_i)])
-                                {
-                                #ifdef ENABLE_TBB
-                                thread_counters.local().overlap_checks++;
-                                #else
-                                counters.overlap_checks++;
-                                #endif
-
-                                unsigned int err = 0;
-                                if (circumsphere_overlap &&
-                                    test_overlap(r_i_test, shape, shape_test_b, err))
-                                    {
-                                    overlap_i_b = true;
-                                    }
-                                if (err)
-                                #ifdef ENABLE_TBB
-                                    thread_counters.local().overlap_err_count++;
-                                #else
-                                    counters.overlap_err_count++;
-                                #endif
-                                }
-                            }
-                        if (!overlap_i_a && !overlap_i_b)
-                            {
-                            // reject because we can't insert in overlap volume
-                            continue;
-                            }
+                        // the new (old) configuration of particle i overlaps the depletant
+                        bool overlap_i_a = depletant.overlap_a;
+                        bool overlap_i_b = depletant.overlap_b;
 
                         unsigned int n_overlap = 0;
                         unsigned int tag_i = h_tag[i];
@@ -2986,8 +3161,8 @@ inline bool IntegratorHPMCMono<Shape>::checkDepletantOverlap(unsigned int i, vec
                     #ifdef ENABLE_TBB
                     tbb::parallel_for(tbb::blocked_range<size_t>(0, n_intersect),
                         [=, &shape_old, &shape_i,
-                            &pos_j_new, &orientation_j_new, &type_j_new,
-                            &pos_j_old, &orientation_j_old, &type_j_old,
+                            &pos_j_new, &orientation_j_new, &type_j_new, &entry_j_new,
+                            &pos_j_old, &orientation_j_old, &type_j_old, &entry_j_old,
                             &thread_ln_denominator, &thread_ln_numerator,
                             &thread_counters, &thread_implicit_counters](const tbb::blocked_range<size_t>& y) {
                     for (size_t k = y.begin(); k != y.end(); ++k)
@@ -2995,49 +3170,31 @@ inline bool IntegratorHPMCMono<Shape>::checkDepletantOverlap(unsigned int i, vec
                     for (size_t k = 0; k < n_intersect; ++k)
                     #endif
                         {
-                        detail::OBB obb_k;
-                        Scalar V_k;
-                        Shape shape_k(new_config ? orientation_j_new[k] : orientation_j_old[k],
-                            this->m_params[new_config ? type_j_new[k] : type_j_old[k]]);
+                        // the depletants in the excluded volume of particle k
+                        const detail::DepletantCacheEntry *entry_k = new_config ? entry_j_new[k] : entry_j_old[k];
+                        vec3<Scalar> pos_k = new_config ? pos_j_new[k] : pos_j_old[k];
 
+                        if (! shape_i.ignoreStatistics())
                             {
-                            // get shape OBB
-                            obb_k = shape_k.getOBB(new_config ? pos_j_new[k] : pos_j_old[k]);
-
-                            // extend by depletant radius
-                            Shape shape_test_a(quat<Scalar>(), m_params[type_a]);
-                            Shape shape_test_b(quat<Scalar>(), m_params[type_b]);
-
-                            OverlapReal r = 0.5f*detail::max(shape_test_a.getCircumsphereDiameter(),
-                                shape_test_b.getCircumsphereDiameter());
-                            obb_k.lengths.x += r;
-                            obb_k.lengths.y += r;
-                            obb_k.lengths.z += r;
-
-                            V_k = obb_k.getVolume(ndim);
+                            #ifdef ENABLE_TBB
+                            thread_implicit_counters[m_depletant_idx(type_a,type_b)].local().insert_count +=
+                                entry_k->n_insert[i_trial];
+                            #else
+                            implicit_counters[m_depletant_idx(type_a,type_b)].insert_count +=
+                                entry_k->n_insert[i_trial];
+                            #endif
                             }
 
-                        // random number of depletants uniquely for this volume
-                        Scalar lambda = std::abs(fugacity)*V_k;
-                        hoomd::PoissonDistribution<Scalar> poisson(lambda);
-                        unsigned int ntypes = this->m_pdata->getNTypes();
-                        unsigned int seed_j = new_config ? seed_j_new[k] : seed_j_old[k];
-                        hoomd::RandomGenerator rng_num(hoomd::Seed(hoomd::RNGIdentifier::HPMCDepletantNum,
-                                                                   0,
-                                                                   0),
-                                                       hoomd::Counter(type_a*ntypes+type_b,
-                                                                      seed_j,
-                                                                      i_trial)
-                                                        );
-
-                        unsigned int n = poisson(rng_num);
+                        // only the depletants that overlap particle k contribute
+                        const std::vector<detail::CachedDepletant> *depletants_k = &entry_k->depletants[i_trial];
+                        unsigned int n = (unsigned int) depletants_k->size();
 
                         // for every depletant
                         #ifdef ENABLE_TBB
-                        tbb::parallel_for(tbb::blocked_range<unsigned int>(0, (unsigned int)n),
+                        tbb::parallel_for(tbb::blocked_range<unsigned int>(0, n),
                             [=, &shape_old, &shape_i,
-                                &pos_j_new, &orientation_j_new, &type_j_new,
-                                &pos_j_old, &orientation_j_old, &type_j_old,
+                                &pos_j_new, &orientation_j_new, &type_j_new, &entry_j_new,
+                                &pos_j_old, &orientation_j_old, &type_j_old, &entry_j_old,
                                 &thread_ln_denominator, &thread_ln_numerator,
                                 &thread_counters, &thread_implicit_counters](const tbb::blocked_range<unsigned int>& t) {
                         for (unsigned int l = t.begin(); l != t.end(); ++l)
@@ -3045,110 +3202,19 @@ inline bool IntegratorHPMCMono<Shape>::checkDepletantOverlap(unsigned int i, vec
                         for (unsigned int l = 0; l < n; ++l)
                         #endif
                             {
-                            hoomd::RandomGenerator my_rng(hoomd::Seed(hoomd::RNGIdentifier::HPMCDepletants,
-                                                                      0,
-                                                                      0),
-                                                          hoomd::Counter(seed_j,
-                                                                         l,
-                                                                         i_trial,
-                                                                         static_cast<uint16_t>(type_a+type_b*ntypes))
-                                                        );
-
-                            if (! shape_i.ignoreStatistics())
-                                {
-                                #ifdef ENABLE_TBB
-                                thread_implicit_counters[m_depletant_idx(type_a,type_b)].local().insert_count++;
-                                #else
-                                implicit_counters[m_depletant_idx(type_a,type_b)].insert_count++;
-                                #endif
-                                }
-
-                            // rejection-free sampling
-                            vec3<Scalar> pos_test(generatePositionInOBB(my_rng, obb_k, ndim));
+                            const detail::CachedDepletant& depletant = (*depletants_k)[l];
+                            vec3<Scalar> pos_test = pos_k + depletant.r;
 
                             Shape shape_test_a(quat<Scalar>(), this->m_params[type_a]);
                             Shape shape_test_b(quat<Scalar>(), this->m_params[type_b]);
-                            quat<Scalar> o;
-                            if (shape_test_a.hasOrientation() || shape_test_b.hasOrientation())
-                                {
-                                o = generateRandomOrientation(my_rng, ndim);
-                                }
                             if (shape_test_a.hasOrientation())
-                                shape_test_a.orientation = o;
+                                shape_test_a.orientation = depletant.orientation;
                             if (shape_test_b.hasOrientation())
-                                shape_test_b.orientation = o;
-
-                            // Check if the particle j overlaps
-                            bool overlap_k_a = false;
-                            bool overlap_k_b = false;
-
-                            vec3<Scalar> r_k_test = pos_test - (new_config ? pos_j_new[k] : pos_j_old[k]);
-
-                                {
-                                OverlapReal rsq = (OverlapReal) dot(r_k_test,r_k_test);
-                                OverlapReal DaDb = shape_test_a.getCircumsphereDiameter() + shape_k.getCircumsphereDiameter();
-                                bool circumsphere_overlap = (rsq*OverlapReal(4.0) <= DaDb * DaDb);
-
-                                if (h_overlaps[this->m_overlap_idx(type_a, new_config ? type_j_new[k] : type_j_old[k])])
-                                    {
-                                    #ifdef ENABLE_TBB
-                                    thread_counters.local().overlap_checks++;
-                                    #else
-                                    counters.overlap_checks++;
-                                    #endif
-
-                                    unsigned int err = 0;
-                                    if (circumsphere_overlap &&
-                                        test_overlap(r_k_test, shape_k, shape_test_a, err))
-                                        {
-                                        overlap_k_a = true;
-                                        }
-                                    if (err)
-                                    #ifdef ENABLE_TBB
-                                        thread_counters.local().overlap_err_count++;
-                                    #else
-                                        counters.overlap_err_count++;
-                                    #endif
-                                    }
-                                }
-
-                            if (type_b == type_a)
-                                {
-                                overlap_k_b = overlap_k_a;
-                                }
-                            else
-                                {
-                                OverlapReal rsq = (OverlapReal) dot(r_k_test,r_k_test);
-                                OverlapReal DaDb = shape_test_b.getCircumsphereDiameter() + shape_k.getCircumsphereDiameter();
-                                bool circumsphere_overlap = (rsq*OverlapReal(4.0) <= DaDb * DaDb);
-
-                                if (h_overlaps[this->m_overlap_idx(type_a, new_config ? type_j_new[k] : type_j_old[k])])
-                                    {
-                                    #ifdef ENABLE_TBB
-                                    thread_counters.local().overlap_checks++;
-                                    #else
-                                    counters.overlap_checks++;
-                                    #endif
+                                shape_test_b.orientation = depletant.orientation;
 
-                                    unsigned int err = 0;
-                                    if (circumsphere_overlap &&
-                                        test_overlap(r_k_test, shape_k, shape_test_b, err))
-                                        {
-                                        overlap_k_b = true;
-                                        }
-                                    if (err)
-                                    #ifdef ENABLE_TBB
-                                        thread_counters.local().overlap_err_count++;
-                                    #else
-                                        counters.overlap_err_count++;
-                                    #endif
-                                    }
-                                }
-                            if (!overlap_k_a && !overlap_k_b)
-                                {
-                                // not in j's excluded volume
-                                continue;
-                                }
+                            // particle k overlaps the depletant
+                            bool overlap_k_a = depletant.overlap_a;
+                            bool overlap_k_b = depletant.overlap_b;
 
                             // does particle i overlap in current configuration?
                             bool overlap_i_a = false;
@@ -3415,6 +3481,10 @@ inline bool IntegratorHPMCMono<Shape>::checkDepletantOverlap(unsigned int i, vec
             #endif
             for (auto term_itrial : ln_numerator)
                 ln_numerator_tot += term_itrial;
+
+            // keep the depletants of the trial configuration in case the move is accepted
+            if (m_depletant_cache && pair_idx < m_depletant_cache_trial.size())
+                std::swap(m_depletant_cache_trial[pair_idx], *entry_i_new);
             } // end loop over type_b
         } // end loop over type_a
 
@@ -3443,6 +3513,225 @@ inline bool IntegratorHPMCMono<Shape>::checkDepletantOverlap(unsigned int i, vec
     return accept;
     }
 
+/*! \param entry The entry to fill, with the seed, orientation and type of the particle set
+    \param type_a First type of depletant
+    \param type_b Second type of depletant
+    \param ntrial Number of reinsertion attempts
+    \param fugacity Fugacity of the depletants
+    \param h_overlaps Interaction matrix
+
+    Insert depletants in the OBB of the particle, extended by the radius of the larger depletant, with the same random
+    numbers as a particle at the origin and keep those that overlap the particle.
+*/
+template<class Shape>
+void IntegratorHPMCMono<Shape>::fillDepletantCacheEntry(detail::DepletantCacheEntry& entry,
+    unsigned int type_a, unsigned int type_b, unsigned int ntrial, Scalar fugacity, const unsigned int *h_overlaps)
+    {
+    unsigned int ndim = this->m_sysdef->getNDimensions();
+    unsigned int ntypes = this->m_pdata->getNTypes();
+
+    Shape shape(entry.orientation, this->m_params[entry.type]);
+    Shape tmp_a(quat<Scalar>(), this->m_params[type_a]);
+    Shape tmp_b(quat<Scalar>(), this->m_params[type_b]);
+
+    // extend the OBB by the radius of the larger depletant
+    OverlapReal r_dep_sample = 0.5f*detail::max(tmp_a.getCircumsphereDiameter(), tmp_b.getCircumsphereDiameter());
+    detail::OBB obb = shape.getOBB(vec3<Scalar>(0,0,0));
+    obb.lengths.x += r_dep_sample;
+    obb.lengths.y += r_dep_sample;
+    obb.lengths.z += r_dep_sample;
+    Scalar lambda = std::abs(fugacity)*obb.getVolume(ndim);
+
+    unsigned int seed = entry.seed;
+    bool check_a = h_overlaps[this->m_overlap_idx(type_a, entry.type)];
+    bool check_b = h_overlaps[this->m_overlap_idx(type_b, entry.type)];
+
+    entry.n_insert.assign(ntrial, 0);
+    entry.depletants.assign(ntrial, std::vector<detail::CachedDepletant>());
+    entry.overlap_checks = 0;
+    entry.overlap_err_count = 0;
+
+    for (unsigned int i_trial = 0; i_trial < ntrial; ++i_trial)
+        {
+        // choose the number of depletants in the insertion OBB
+        hoomd::PoissonDistribution<Scalar> poisson(lambda);
+        hoomd::RandomGenerator rng_num(hoomd::Seed(hoomd::RNGIdentifier::HPMCDepletantNum, 0, 0),
+                                       hoomd::Counter(type_a*ntypes+type_b, seed, i_trial));
+        unsigned int n = poisson(rng_num);
+        entry.n_insert[i_trial] = n;
+
+        std::vector<detail::CachedDepletant> depletants(n);
+        std::vector<unsigned int> overlap_err(n, 0);
+
+        // for every depletant
+        #ifdef ENABLE_TBB
+        tbb::parallel_for(tbb::blocked_range<unsigned int>(0, n),
+            [=, &shape, &depletants, &overlap_err](const tbb::blocked_range<unsigned int>& t) {
+        for (unsigned int l = t.begin(); l != t.end(); ++l)
+        #else
+        for (unsigned int l = 0; l < n; ++l)
+        #endif
+            {
+            hoomd::RandomGenerator my_rng(hoomd::Seed(hoomd::RNGIdentifier::HPMCDepletants, 0, 0),
+                                          hoomd::Counter(seed,
+                                                         l,
+                                                         i_trial,
+                                                         static_cast<uint16_t>(type_a+type_b*ntypes)));
+
+            // rejection-free sampling
+            vec3<Scalar> r_test(generatePositionInOBB(my_rng, obb, ndim));
+
+            Shape shape_test_a(quat<Scalar>(), this->m_params[type_a]);
+            Shape shape_test_b(quat<Scalar>(), this->m_params[type_b]);
+            quat<Scalar> o;
+            if (shape_test_a.hasOrientation() || shape_test_b.hasOrientation())
+                {
+                o = generateRandomOrientation(my_rng, ndim);
+                }
+            if (shape_test_a.hasOrientation())
+                shape_test_a.orientation = o;
+            if (shape_test_b.hasOrientation())
+                shape_test_b.orientation = o;
+
+            // check if the particle overlaps the depletant
+            OverlapReal rsq = (OverlapReal) dot(r_test,r_test);
+            unsigned int err = 0;
+
+            OverlapReal DaDb = shape_test_a.getCircumsphereDiameter() + shape.getCircumsphereDiameter();
+            bool overlap_a = check_a && rsq*OverlapReal(4.0) <= DaDb * DaDb
+                && test_overlap(r_test, shape, shape_test_a, err);
+
+            bool overlap_b = overlap_a;
+            if (type_a != type_b)
+                {
+                DaDb = shape_test_b.getCircumsphereDiameter() + shape.getCircumsphereDiameter();
+                overlap_b = check_b && rsq*OverlapReal(4.0) <= DaDb * DaDb
+                    && test_overlap(r_test, shape, shape_test_b, err);
+                }
+
+            depletants[l].r = r_test;
+            depletants[l].orientation = o;
+            depletants[l].overlap_a = overlap_a;
+            depletants[l].overlap_b = overlap_b;
+            overlap_err[l] = err;
+            } // end loop over depletants
+        #ifdef ENABLE_TBB
+            });
+        #endif
+
+        // keep the depletants in the excluded volume, in order
+        for (unsigned int l = 0; l < n; ++l)
+            {
+            if (depletants[l].overlap_a || depletants[l].overlap_b)
+                entry.depletants[i_trial].push_back(depletants[l]);
+            if (overlap_err[l])
+                entry.overlap_err_count++;
+            }
+
+        entry.overlap_checks += (unsigned long long int) n * (check_a + (type_a != type_b && check_b));
+        } // end loop over i_trial
+    }
+
+/*! \param tag Tag of the particle whose trial move was accepted
+
+    The depletants in the excluded volume of the trial configuration of the particle become the depletants of its
+    current configuration.
+*/
+template<class Shape>
+void IntegratorHPMCMono<Shape>::acceptDepletantCacheEntries(unsigned int tag)
+    {
+    for (unsigned int pair_idx = 0; pair_idx < m_depletant_cache_trial.size(); ++pair_idx)
+        {
+        detail::DepletantCacheEntry& trial = m_depletant_cache_trial[pair_idx];
+        if (trial.valid && tag < m_depletant_cache_entries[pair_idx].size())
+            std::swap(m_depletant_cache_entries[pair_idx][tag], trial);
+        trial.valid = false;
+        }
+    }
+
+/*! The circumsphere and in-sphere radii of a shape depend only on its parameters, so the per type pair thresholds
+    are computed once whenever the parameters change.
+*/
+template<class Shape>
+void IntegratorHPMCMono<Shape>::updateNarrowPhase()
+    {
+    const unsigned int n_types = m_pdata->getNTypes();
+    std::vector<OverlapReal> circumsphere_radius(n_types);
+    std::vector<bool> has_orientation(n_types);
+
+    for (unsigned int typ = 0; typ < n_types; ++typ)
+        {
+        Shape shape(quat<Scalar>(), m_params[typ]);
+        circumsphere_radius[typ] = shape.getCircumsphereDiameter() / OverlapReal(2.0);
+        has_orientation[typ] = shape.hasOrientation();
+        }
+
+    m_circumsphere_sq.resize(m_overlap_idx.getNumElements());
+    m_insphere_sq.resize(m_overlap_idx.getNumElements());
+    m_narrow_phase_obb.resize(m_overlap_idx.getNumElements());
+    for (unsigned int typ_i = 0; typ_i < n_types; ++typ_i)
+        for (unsigned int typ_j = 0; typ_j < n_types; ++typ_j)
+            {
+            unsigned int idx = m_overlap_idx(typ_i, typ_j);
+            Shape shape_i(quat<Scalar>(), m_params[typ_i]);
+            Shape shape_j(quat<Scalar>(), m_params[typ_j]);
+            OverlapReal R = circumsphere_radius[typ_i] + circumsphere_radius[typ_j];
+            OverlapReal r = getPairInsphereRadius(shape_i, shape_j);
+            m_circumsphere_sq[idx] = R*R;
+            m_insphere_sq[idx] = r*r;
+
+            // the OBBs of two spheres add nothing to the circumsphere test
+            m_narrow_phase_obb[idx] = has_orientation[typ_i] || has_orientation[typ_j];
+            }
+
+    m_narrow_phase_valid = true;
+    }
+
+/*! \param r_ij Vector from the center of particle i to the center of particle j
+    \param shape_i Shape of particle i
+    \param shape_j Shape of particle j
+    \param typ_i Type of particle i
+    \param typ_j Type of particle j
+    \param ndim Dimensionality of the system
+    \param counters Counters to record which tier settles the check
+
+    \returns true when the shapes overlap
+
+    The tiers are tried from the cheapest to the most expensive, and each one either settles the check or passes it
+    on: disjoint circumspheres reject the overlap, intersecting in-spheres prove it, disjoint OBBs reject it, and the
+    exact test decides the rest.
+*/
+template<class Shape>
+inline bool IntegratorHPMCMono<Shape>::testOverlapTiered(const vec3<Scalar>& r_ij, const Shape& shape_i,
+    const Shape& shape_j, unsigned int typ_i, unsigned int typ_j, unsigned int ndim, hpmc_counters_t& counters)
+    {
+    unsigned int idx = m_overlap_idx(typ_i, typ_j);
+    vec3<OverlapReal> dr(r_ij);
+    OverlapReal rsq = dot(dr,dr);
+
+    if (rsq > m_circumsphere_sq[idx])
+        {
+        counters.circumsphere_reject_count++;
+        return false;
+        }
+
+    if (rsq < m_insphere_sq[idx])
+        {
+        counters.insphere_overlap_count++;
+        return true;
+        }
+
+    if (ndim == 3 && m_narrow_phase_obb[idx]
+        && !detail::overlap(shape_i.getOBB(vec3<Scalar>(0,0,0)), shape_j.getOBB(r_ij)))
+        {
+        counters.obb_reject_count++;
+        return false;
+        }
+
+    counters.exact_check_count++;
+    return test_overlap(r_ij, shape_i, shape_j, counters.overlap_err_count);
+    }
+
 template<class Shape>
 bool IntegratorHPMCMono<Shape>::attemptBoxResize(uint64_t timestep, const BoxDim& new_box)
     {
@@ -3491,6 +3780,10 @@ template < class Shape > void export_IntegratorHPMCMono(pybind11::module& m, con
           .def("getTypeShapesPy", &IntegratorHPMCMono<Shape>::getTypeShapesPy)
           .def("getShape", &IntegratorHPMCMono<Shape>::getShape)
           .def("setShape", &IntegratorHPMCMono<Shape>::setShape)
+          .def_property("depletant_cache", &IntegratorHPMCMono<Shape>::getDepletantCache,
+                        &IntegratorHPMCMono<Shape>::setDepletantCache)
+          .def_property("narrow_phase_tiers", &IntegratorHPMCMono<Shape>::getNarrowPhaseTiers,
+                        &IntegratorHPMCMono<Shape>::setNarrowPhaseTiers)
           ;
     }
 
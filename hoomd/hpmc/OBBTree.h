@@ -8,6 +8,7 @@
 #include "hoomd/VectorMath.h"
 #include <vector>
 #include <stack>
+#include <algorithm>
 
 #include "HPMCPrecisionSetup.h"
 
@@ -325,6 +326,41 @@ inline unsigned int OBBTree::buildNode(OBB *obbs,
                 }
             }
 
+        // vertices shared by several OBBs (e.g. the corners of adjacent mesh triangles) need to enter the hull
+        // computation only once, keep the largest radius of every distinct vertex
+        std::vector<unsigned int> order(merge_internal_coordinates.size());
+        for (unsigned int i = 0; i < order.size(); ++i)
+            order[i] = i;
+        std::sort(order.begin(), order.end(), [&](unsigned int a, unsigned int b)
+            {
+            const vec3<OverlapReal>& p = merge_internal_coordinates[a];
+            const vec3<OverlapReal>& q = merge_internal_coordinates[b];
+            return p.x < q.x || (p.x == q.x && (p.y < q.y || (p.y == q.y && p.z < q.z)));
+            });
+
+        std::vector<vec3<OverlapReal> > unique_coordinates;
+        std::vector<OverlapReal> unique_radii;
+        for (unsigned int i = 0; i < order.size(); ++i)
+            {
+            const vec3<OverlapReal>& p = merge_internal_coordinates[order[i]];
+            OverlapReal radius = merge_vertex_radii[order[i]];
+            if (unique_coordinates.size() > 0 && unique_coordinates.back().x == p.x
+                && unique_coordinates.back().y == p.y && unique_coordinates.back().z == p.z)
+                unique_radii.back() = std::max(unique_radii.back(), radius);
+            else
+                {
+                unique_coordinates.push_back(p);
+                unique_radii.push_back(radius);
+                }
+            }
+
+        // fewer than three points use a different (covariance) fit, keep the original points in that case
+        if (unique_coordinates.size() >= 3)
+            {
+            merge_internal_coordinates.swap(unique_coordinates);
+            merge_vertex_radii.swap(unique_radii);
+            }
+
         // combine masks
         unsigned int mask = 0;
 
@@ -47,6 +47,7 @@ struct PolyhedronVertices : ShapeParams
         : n_hull_verts(0),
           N(0),
           diameter(OverlapReal(0)),
+          insphere_radius(OverlapReal(0)),
           sweep_radius(OverlapReal(0)),
           ignore(0)
         { }
@@ -74,6 +75,7 @@ struct PolyhedronVertices : ShapeParams
           n_hull_verts(0),
           N((unsigned int)verts.size()),
           diameter(0.0),
+          insphere_radius(0.0),
           sweep_radius(sweep_radius_),
           ignore(ignore_)
         {
@@ -92,6 +94,7 @@ struct PolyhedronVertices : ShapeParams
         {
         N = (unsigned int)verts.size();
         diameter = 0;
+        insphere_radius = 0;
         sweep_radius = sweep_radius_;
         bool managed = x.isManaged();
 
@@ -142,6 +145,40 @@ struct PolyhedronVertices : ShapeParams
 
             for (unsigned int i = 0; i < indexBuffer.size(); i++)
                  hull_verts[i] = (unsigned int)indexBuffer[i];
+
+            // the in-sphere radius is the smallest distance of the origin to the plane of a hull triangle,
+            // the centroid of the vertices is inside the hull and determines the inner side of each plane
+            vec3<OverlapReal> centroid(0,0,0);
+            for (unsigned int i = 0; i < N; i++)
+                centroid += vec3<OverlapReal>(x[i], y[i], z[i]);
+            centroid /= OverlapReal(N);
+
+            OverlapReal min_distance = OverlapReal(-1.0);
+            for (unsigned int i = 0; i + 2 < n_hull_verts; i += 3)
+                {
+                vec3<OverlapReal> a(x[hull_verts[i]], y[hull_verts[i]], z[hull_verts[i]]);
+                vec3<OverlapReal> b(x[hull_verts[i+1]], y[hull_verts[i+1]], z[hull_verts[i+1]]);
+                vec3<OverlapReal> c(x[hull_verts[i+2]], y[hull_verts[i+2]], z[hull_verts[i+2]]);
+                vec3<OverlapReal> n = cross(b - a, c - a);
+                OverlapReal n_norm = fast::sqrt(dot(n, n));
+                if (n_norm == OverlapReal(0.0))
+                    continue;
+
+                OverlapReal side_centroid = dot(n, centroid - a);
+                OverlapReal side_origin = -dot(n, a);
+                if (side_centroid * side_origin < OverlapReal(0.0) || side_centroid == OverlapReal(0.0))
+                    {
+                    // the origin is outside of the hull or the hull is flat
+                    min_distance = OverlapReal(0.0);
+                    break;
+                    }
+
+                OverlapReal distance = fabs(side_origin) / n_norm;
+                if (min_distance < OverlapReal(0.0) || distance < min_distance)
+                    min_distance = distance;
+                }
+
+            insphere_radius = max(min_distance, OverlapReal(0.0));
             }
 
         if (N >= 1)
@@ -254,6 +291,9 @@ struct PolyhedronVertices : ShapeParams
     /// Circumsphere diameter
     OverlapReal diameter;
 
+    /// Radius of the largest sphere centered at the origin inside the convex hull (excluding the sweep)
+    OverlapReal insphere_radius;
+
     /// Radius of the sphere sweep (used for spheropolyhedra)
     OverlapReal sweep_radius;
 
@@ -727,8 +767,7 @@ struct ShapeConvexPolyhedron
     /// Get the in-sphere radius of the shape
     DEVICE OverlapReal getInsphereRadius() const
         {
-        // not implemented
-        return OverlapReal(0.0);
+        return verts.insphere_radius;
         }
 
     /// Return the bounding box of the shape in world coordinates
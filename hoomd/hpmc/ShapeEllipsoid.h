@@ -118,8 +118,8 @@ struct ShapeEllipsoid
     /// Get the in-sphere radius of the shape
     DEVICE OverlapReal getInsphereRadius() const
         {
-        // not implemented
-        return OverlapReal(0.0);
+        // return the minimum of the 3 axes
+        return detail::min(axes.x, detail::min(axes.y, axes.z));
         }
 
     /** Support function of the shape (in local coordinates), used in getAABB
@@ -90,8 +90,17 @@ struct ShapeSpheropolyhedron
     //! Get the in-sphere radius
     DEVICE OverlapReal getInsphereRadius() const
         {
-        // not implemented
-        return OverlapReal(0.0);
+        if (verts.insphere_radius > OverlapReal(0.0))
+            return verts.insphere_radius + verts.sweep_radius;
+
+        // the origin is not inside the hull, use the sphere swept around the closest vertex
+        OverlapReal insphere_radius(0.0);
+        for (unsigned int i = 0; i < verts.N; i++)
+            {
+            vec3<OverlapReal> v(verts.x[i], verts.y[i], verts.z[i]);
+            insphere_radius = detail::max(insphere_radius, verts.sweep_radius - fast::sqrt(dot(v,v)));
+            }
+        return insphere_radius;
         }
 
     //! Return the bounding box of the shape in world coordinates
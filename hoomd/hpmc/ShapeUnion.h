@@ -20,6 +20,8 @@
 #define DEVICE
 #define HOSTDEVICE
 #include <iostream>
+#include <map>
+#include <vector>
 #endif
 
 namespace hpmc
@@ -204,9 +206,23 @@ struct ShapeUnionParams : ShapeParams
         // compute a tight fitting AABB in the body frame
         detail::AABB local_aabb(vec3<OverlapReal>(0,0,0),OverlapReal(0.0));
 
+        // members often repeat the same shape, compile each distinct member shape only once
+        std::map<std::string, unsigned int> member_index;
+
         for (unsigned int i = 0; i < N; i++)
             {
-            typename Shape::param_type param(shapes[i], managed);
+            std::string key = pybind11::repr(shapes[i]).cast<std::string>();
+            auto it = member_index.find(key);
+            if (it == member_index.end())
+                {
+                mparams[i] = typename Shape::param_type(shapes[i], managed);
+                member_index[key] = i;
+                }
+            else
+                {
+                mparams[i] = mparams[it->second];
+                }
+            const typename Shape::param_type& param = mparams[i];
 
             pybind11::list position = positions[i];
             if (len(position) != 3)
@@ -218,7 +234,6 @@ struct ShapeUnionParams : ShapeParams
                                                       pybind11::cast<OverlapReal>(position[1]),
                                                       pybind11::cast<OverlapReal>(position[2]));
 
-            mparams[i] = param;
             mpos[i] = pos;
 
             // set default orientation of (1,0,0,0) when orienations is None
@@ -405,13 +420,6 @@ struct ShapeUnion
         return members.diameter;
         }
 
-    /// Get the in-sphere radius of the shape
-    DEVICE OverlapReal getInsphereRadius() const
-        {
-        // not implemented
-        return OverlapReal(0.0);
-        }
-
     /// Return the bounding box of the shape in world coordinates
     DEVICE detail::AABB getAABB(const vec3<Scalar>& pos) const
         {
@@ -563,6 +571,49 @@ DEVICE inline bool test_overlap(const vec3<Scalar>& r_ab,
     return false;
     }
 
+#ifndef __HIPCC__
+/** Get the sum of the in-sphere radii of two unions
+
+    The unions overlap when their centers are closer than the returned radius. Only pairs of members whose in-spheres
+    contain the center of their union and whose overlap masks intersect contribute, so that the exact test also
+    reports the overlap.
+
+    @param a First union
+    @param b Second union
+    @returns The largest sum of the reduced in-sphere radii of two members, or 0 when no pair of members qualifies
+*/
+template<class Shape>
+inline OverlapReal getPairInsphereRadius(const ShapeUnion<Shape>& a, const ShapeUnion<Shape>& b)
+    {
+    // radius of the largest sphere centered at the union's origin inside each member, negative when the member
+    // does not contain the origin
+    std::vector<OverlapReal> radius_b(b.members.N);
+    for (unsigned int j = 0; j < b.members.N; j++)
+        {
+        Shape s(quat<Scalar>(), b.members.mparams[j]);
+        vec3<OverlapReal> r(b.members.mpos[j]);
+        radius_b[j] = s.getInsphereRadius() - fast::sqrt(dot(r,r));
+        }
+
+    OverlapReal insphere_radius(0.0);
+    for (unsigned int i = 0; i < a.members.N; i++)
+        {
+        Shape s(quat<Scalar>(), a.members.mparams[i]);
+        vec3<OverlapReal> r(a.members.mpos[i]);
+        OverlapReal radius_i = s.getInsphereRadius() - fast::sqrt(dot(r,r));
+        if (radius_i < OverlapReal(0.0))
+            continue;
+
+        for (unsigned int j = 0; j < b.members.N; j++)
+            {
+            if (radius_b[j] >= OverlapReal(0.0) && (a.members.moverlap[i] & b.members.moverlap[j]))
+                insphere_radius = detail::max(insphere_radius, radius_i + radius_b[j]);
+            }
+        }
+    return insphere_radius;
+    }
+#endif
+
 template<class Shape>
 DEVICE inline bool test_narrow_phase_excluded_volume_overlap(vec3<OverlapReal> dr,
                                              const ShapeUnion<Shape>& a,
@@ -10,8 +10,9 @@
 #include "hoomd/RandomNumbers.h"
 #include "hoomd/RNGIdentifiers.h"
 
-#include <set>
-#include <list>
+#include <atomic>
+#include <memory>
+#include <map>
 
 #include "Moves.h"
 #include "HPMCCounters.h"
@@ -19,16 +20,7 @@
 
 #ifdef ENABLE_TBB
 #include <tbb/concurrent_unordered_map.h>
-#include <tbb/concurrent_unordered_set.h>
-#include <tbb/concurrent_vector.h>
 #include <tbb/parallel_for.h>
-#include <tbb/task.h>
-#include <atomic>
-
-#if TBB_VERSION_MAJOR < 2021
-#define ENABLE_TBB_TASK
-#endif
-
 #endif
 
 namespace hpmc
@@ -37,232 +29,106 @@ namespace hpmc
 namespace detail
 {
 
-#ifdef ENABLE_TBB_TASK
-//! Wrapper around std::atomic_flag to allow use in a std::vector
-class my_atomic_flag
+//! Disjoint set forest with concurrent union and find
+/*! DisjointSets partitions the elements 0 .. N-1 into sets, the connected components of the graph formed by the
+    edges passed to unite(). Each set is a tree of parent links. unite() links the root with the larger index below the
+    root with the smaller one with a compare-and-swap, so the root of each set is its smallest element independent of
+    the order of the unions, and parent[v] <= v at all times. find() halves the paths it follows, which only moves
+    links closer to the root and is therefore safe to run concurrently with unite() from many threads.
+*/
+class DisjointSets
     {
     public:
         //! Default constructor
-        my_atomic_flag()
-            {
-            f.clear();
-            }
-
-        //! Copy constructor
-        /*! \note this constructor doesn't really copy the value of its argument,
-            it just reset's the flag to zero
-         */
-        my_atomic_flag(const my_atomic_flag& other)
-            {
-            f.clear();
-            }
-
-        //! Assignment operator (non-atomic)
-        /*! \note this assignment operator doesn't really copy the value of its argument,
-            it just reset's the flag to zero
-         */
-        my_atomic_flag& operator =( const my_atomic_flag& other)
-            {
-            f.clear();
-            return *this;
-            }
-
-        //! Sets flag and returns old value
-        bool test_and_set()
-            {
-            return f.test_and_set();
-            }
-
-    private:
-        std::atomic_flag f;
-    };
-#endif
-
-// Graph class represents a undirected graph
-// using adjacency list representation
-class Graph
-    {
-    public:
-        Graph()
+        DisjointSets()
+            : m_size(0), m_capacity(0)
             {
             }
 
-        inline Graph(unsigned int V);   // Constructor
+        //! Reset to n singleton sets
+        inline void resize(unsigned int n);
 
-        inline void resize(unsigned int V);
+        //! Get the root (smallest element) of the set containing v
+        inline unsigned int find(unsigned int v);
 
-        inline void addEdge(unsigned int v, unsigned int w);
+        //! Merge the sets containing v and w
+        inline void unite(unsigned int v, unsigned int w);
 
-        #ifdef ENABLE_TBB_TASK
-        inline void connectedComponents(std::vector<tbb::concurrent_vector<unsigned int> >& cc);
-        #else
-        inline void connectedComponents(std::vector<std::vector<unsigned int> >& cc);
-        #endif
-
-        #ifdef ENABLE_TBB_TASK
-        void setTaskArena(std::shared_ptr<tbb::task_arena> task_arena)
+        //! Get the number of elements
+        unsigned int size() const
             {
-            m_task_arena = task_arena;
+            return m_size;
             }
-        #endif
 
     private:
-        #ifndef ENABLE_TBB_TASK
-        std::multimap<unsigned int,unsigned int> adj;
-        #else
-        tbb::concurrent_unordered_multimap<unsigned int, unsigned int> adj;
-        #endif
-
-        #ifndef ENABLE_TBB_TASK
-        std::vector<unsigned int> visited;
-        #else
-        std::vector<my_atomic_flag> visited;
-        #endif
-
-        #ifdef ENABLE_TBB_TASK
-        /// The TBB task arena
-        std::shared_ptr<tbb::task_arena> m_task_arena;
-        #endif
-
-        #ifndef ENABLE_TBB_TASK
-        // A function used by DFS
-        inline void DFSUtil(unsigned int v, std::vector<unsigned int>& visited, std::vector<unsigned int>& cur_cc);
-        #endif
-
-        #ifdef ENABLE_TBB_TASK
-        class DFSTask : public tbb::task
-            {
-            public:
-                DFSTask(unsigned int _root, std::vector<my_atomic_flag>& _visited,
-                    tbb::concurrent_vector<unsigned int>& _cc,
-                    const tbb::concurrent_unordered_multimap<unsigned int, unsigned int>& _adj)
-                    : root(_root), visited(_visited), cc(_cc), adj(_adj)
-                    { }
-
-                tbb::task* execute()
-                    {
-                    cc.push_back(root);
-
-                    unsigned int count = 0;
-                    tbb::task_list list;
-
-                    auto begin = adj.equal_range(root).first;
-                    auto end = adj.equal_range(root).second;
-
-                    for (auto it = begin; it != end; ++it)
-                        {
-                        unsigned int neighbor = it->second;
-                        if (!visited[neighbor].test_and_set())
-                            {
-                            if (count++ == 0)
-                                {
-                                root = neighbor; // for task recycling
-                                continue;
-                                }
-                            list.push_back(*new(allocate_child()) DFSTask(neighbor, visited, cc, adj));
-                            }
-                        }
-
-                    if (count)
-                        {
-                        set_ref_count(count);
-                        spawn(list);
-
-                        recycle_as_safe_continuation();
-                        }
-
-                    return NULL;
-                    }
-
-            private:
-                unsigned int root;
-                std::vector<my_atomic_flag> & visited;
-                tbb::concurrent_vector<unsigned int>& cc;
-                const tbb::concurrent_unordered_multimap<unsigned int, unsigned int>& adj;
-            };
-        #endif // ENABLE_TBB_TASK
-
+        std::unique_ptr<std::atomic<unsigned int>[]> m_parent; //!< Parent of each element
+        unsigned int m_size;                                    //!< Number of elements
+        unsigned int m_capacity;                                //!< Allocated number of elements
     };
 
-// Gather connected components in an undirected graph
-#ifdef ENABLE_TBB_TASK
-void Graph::connectedComponents(std::vector<tbb::concurrent_vector<unsigned int> >& cc)
-#else
-void Graph::connectedComponents(std::vector<std::vector<unsigned int> >& cc)
-#endif
+void DisjointSets::resize(unsigned int n)
     {
-    #ifdef ENABLE_TBB_TASK
-    this->m_task_arena->execute([&]{
-    for (unsigned int v = 0; v < visited.size(); ++v)
+    if (n > m_capacity)
         {
-        if (! visited[v].test_and_set())
-            {
-            tbb::concurrent_vector<unsigned int> component;
-            DFSTask& a = *new(tbb::task::allocate_root()) DFSTask(v, visited, component, adj);
-            tbb::task::spawn_root_and_wait(a);
-            cc.push_back(component);
-            }
+        m_parent.reset(new std::atomic<unsigned int>[n]);
+        m_capacity = n;
         }
-    }); // end task arena execute()
-    #else
-    std::fill(visited.begin(), visited.end(), 0);
+    m_size = n;
 
-    // Depth first search
-    for (unsigned int v=0; v<visited.size(); v++)
+    for (unsigned int v = 0; v < n; ++v)
+        m_parent[v].store(v, std::memory_order_relaxed);
+    }
+
+unsigned int DisjointSets::find(unsigned int v)
+    {
+    while (true)
         {
-        if (visited[v] == false)
+        unsigned int p = m_parent[v].load();
+        if (p == v)
+            return v;
+
+        unsigned int gp = m_parent[p].load();
+        if (gp != p)
             {
-            std::vector<unsigned int> cur_cc;
-            DFSUtil(v, visited, cur_cc);
-            cc.push_back(cur_cc);
+            // path halving, failure means another thread moved the link even closer to the root
+            m_parent[v].compare_exchange_weak(p, gp);
             }
+        v = gp;
         }
-    #endif
     }
 
-#ifndef ENABLE_TBB_TASK
-void Graph::DFSUtil(unsigned int v, std::vector<unsigned int>& visited, std::vector<unsigned int>& cur_cc)
+void DisjointSets::unite(unsigned int v, unsigned int w)
     {
-    visited[v] = 1;
-    cur_cc.push_back(v);
-
-    // Recur for all the vertices
-    // adjacent to this vertex
-    auto begin = adj.equal_range(v).first;
-    auto end = adj.equal_range(v).second;
-    for(auto i = begin; i != end; ++i)
+    while (true)
         {
-        if(!visited[i->second])
-            DFSUtil(i->second, visited, cur_cc);
-        }
-    }
-#endif
-Graph::Graph(unsigned int V)
-    {
-    #ifndef ENABLE_TBB_TASK
-    visited.resize(V, 0);
-    #else
-    visited.resize(V);
-    #endif
-    }
+        v = find(v);
+        w = find(w);
+        if (v == w)
+            return;
 
-void Graph::resize(unsigned int V)
-    {
-    #ifndef ENABLE_TBB_TASK
-    visited.resize(V, 0);
-    #else
-    visited.clear();
-    visited.resize(V);
-    #endif
+        // link the larger root below the smaller one
+        if (v < w)
+            std::swap(v, w);
+
+        unsigned int expected = v;
+        if (m_parent[v].compare_exchange_strong(expected, w))
+            return;
 
-    adj.clear();
+        // v is no longer a root, retry
+        }
     }
 
-// method to add a directed edge
-void Graph::addEdge(unsigned int v, unsigned int w)
+#ifdef ENABLE_TBB
+//! Hash function for pairs of particle indices in concurrent maps
+struct PairHash
     {
-    adj.insert(std::make_pair(v,w));
-    }
+    size_t operator()(const std::pair<unsigned int, unsigned int>& p) const
+        {
+        return std::hash<uint64_t>()((uint64_t(p.first) << 32) | uint64_t(p.second));
+        }
+    };
+#endif
+
 } // end namespace detail
 
 /*! A generic cluster move for attractive interactions.
@@ -274,6 +140,11 @@ void Graph::addEdge(unsigned int v, unsigned int w)
 
     In order to support anisotropic particles, we allow line reflections orthogonal
     to the PBC axes only, as described in Sinkovits et al.
+
+    On the CPU, the overlap checks against the AABB tree of the old configuration run in parallel over the particles
+    with TBB. Overlapping and bonded pairs are merged immediately in a concurrent disjoint set forest (union-find), so
+    the connected components are available as soon as all pairs are found, without building an adjacency list. The root
+    of each cluster is its smallest particle index, which makes the flip decisions independent of the thread schedule.
 */
 
 template< class Shape >
@@ -384,13 +255,8 @@ class UpdaterClusters : public Updater
 
         unsigned int m_instance=0;                  //!< Unique ID for RNG seeding
 
-        #ifdef ENABLE_TBB_TASK
-        std::vector<tbb::concurrent_vector<unsigned int> > m_clusters; //!< Cluster components
-        #else
-        std::vector<std::vector<unsigned int> > m_clusters; //!< Cluster components
-        #endif
-
-        detail::Graph m_G; //!< The graph
+        detail::DisjointSets m_sets;                //!< Clusters formed by the interactions
+        std::vector<unsigned int> m_cluster_root;   //!< Smallest particle index in the cluster of each particle
 
         detail::AABBTree m_aabb_tree_old;              //!< Locality lookup for old configuration
 
@@ -398,14 +264,12 @@ class UpdaterClusters : public Updater
         GlobalVector<Scalar4> m_orientation_backup;    //!< Old local orientations
         GlobalVector<int3> m_image_backup;             //!< Old local images
 
-        #ifndef ENABLE_TBB_TASK
-        std::set<std::pair<unsigned int, unsigned int> > m_overlap;   //!< A local vector of particle pairs due to overlap
+        #ifndef ENABLE_TBB
         std::map<std::pair<unsigned int, unsigned int>,float > m_energy_old_old;    //!< Energy of interaction old-old
         std::map<std::pair<unsigned int, unsigned int>,float > m_energy_new_old;    //!< Energy of interaction old-old
         #else
-        tbb::concurrent_unordered_set<std::pair<unsigned int, unsigned int> > m_overlap;
-        tbb::concurrent_unordered_map<std::pair<unsigned int, unsigned int>,float > m_energy_old_old;
-        tbb::concurrent_unordered_map<std::pair<unsigned int, unsigned int>,float > m_energy_new_old;
+        tbb::concurrent_unordered_map<std::pair<unsigned int, unsigned int>,float,detail::PairHash > m_energy_old_old;
+        tbb::concurrent_unordered_map<std::pair<unsigned int, unsigned int>,float,detail::PairHash > m_energy_new_old;
         #endif
 
         hpmc_clusters_counters_t m_count_total;                 //!< Total count since initialization
@@ -444,10 +308,6 @@ UpdaterClusters<Shape>::UpdaterClusters(std::shared_ptr<SystemDefinition> sysdef
     {
     m_exec_conf->msg->notice(5) << "Constructing UpdaterClusters" << std::endl;
 
-    #ifdef ENABLE_TBB_TASK
-    m_G.setTaskArena(sysdef->getParticleData()->getExecConf()->getTaskArena());
-    #endif
-
     // initialize logger and stats
     resetStats();
 
@@ -512,7 +372,7 @@ inline void UpdaterClusters<Shape>::checkDepletantOverlap(unsigned int i, vec3<S
         }
     img_i = box.getImage(pos_i_transf);
 
-    #ifdef ENABLE_TBB_TASK
+    #ifdef ENABLE_TBB
     this->m_exec_conf->getTaskArena()->execute([&]{
     tbb::parallel_for(tbb::blocked_range<unsigned int>(0, this->m_pdata->getNTypes()),
         [=, &shape_i](const tbb::blocked_range<unsigned int>& x) {
@@ -521,7 +381,7 @@ inline void UpdaterClusters<Shape>::checkDepletantOverlap(unsigned int i, vec3<S
     for (unsigned int type_a = 0; type_a < this->m_pdata->getNTypes(); ++type_a)
     #endif
         {
-        #ifdef ENABLE_TBB_TASK
+        #ifdef ENABLE_TBB
         tbb::parallel_for(tbb::blocked_range<unsigned int>(type_a, this->m_pdata->getNTypes()),
             [=, &shape_i](const tbb::blocked_range<unsigned int>& w) {
         for (unsigned int type_b = w.begin(); type_b != w.end(); ++type_b)
@@ -671,7 +531,7 @@ inline void UpdaterClusters<Shape>::checkDepletantOverlap(unsigned int i, vec3<S
                 }
 
             // for every depletant
-            #ifdef ENABLE_TBB_TASK
+            #ifdef ENABLE_TBB
             tbb::parallel_for(tbb::blocked_range<unsigned int>(0, (unsigned int)n),
                 [=, &shape_i,
                     &pos_j, &orientation_j, &type_j, &V_all,
@@ -1059,23 +919,20 @@ inline void UpdaterClusters<Shape>::checkDepletantOverlap(unsigned int i, vec3<S
                         if ((overlap_i_a && !overlap_transf_a && overlap_j_b) || (overlap_i_b && !overlap_transf_b & overlap_j_a))
                             {
                             // add bond
-                            this->m_overlap.insert(std::make_pair(i,idx_j[m]));
-
-                            // since i<=j by construction, make matrix symmetric explicitly
-                            this->m_overlap.insert(std::make_pair(idx_j[m],i));
+                            this->m_sets.unite(i,idx_j[m]);
                             }
                         }
                     } // end loop over intersections
                 } // end loop over depletants
-            #ifdef ENABLE_TBB_TASK
+            #ifdef ENABLE_TBB
                 });
             #endif
             } // end loop over type_b
-        #ifdef ENABLE_TBB_TASK
+        #ifdef ENABLE_TBB
             });
         #endif
         } // end loop over type_a
-    #ifdef ENABLE_TBB_TASK
+    #ifdef ENABLE_TBB
         });
     }); // end task arena execute()
     #endif
@@ -1097,10 +954,17 @@ void UpdaterClusters<Shape>::transform(const quat<Scalar>& q, const vec3<Scalar>
         ArrayHandle<int3> h_image(this->m_pdata->getImages(), access_location::host, access_mode::readwrite);
 
         // access parameters
-        auto params = m_mc->getParams();
+        auto& params = m_mc->getParams();
         unsigned int nptl = this->m_pdata->getN();
 
+        #ifdef ENABLE_TBB
+        m_exec_conf->getTaskArena()->execute([&]{
+        tbb::parallel_for(tbb::blocked_range<unsigned int>(0, nptl),
+            [&](const tbb::blocked_range<unsigned int>& r) {
+        for (unsigned int i = r.begin(); i != r.end(); ++i)
+        #else
         for (unsigned int i = 0; i < nptl; ++i)
+        #endif
             {
             vec3<Scalar> new_pos(h_pos.data[i]);
             if (!line)
@@ -1122,6 +986,10 @@ void UpdaterClusters<Shape>::transform(const quat<Scalar>& q, const vec3<Scalar>
             h_pos.data[i] = make_scalar4(new_pos.x, new_pos.y, new_pos.z, h_pos.data[i].w);
             h_image.data[i] = h_image.data[i] + img;
             }
+        #ifdef ENABLE_TBB
+            });
+        }); // end task arena execute()
+        #endif
         }
 
     if (m_prof) m_prof->pop(m_exec_conf);
@@ -1132,8 +1000,18 @@ void UpdaterClusters<Shape>::flip(uint64_t timestep)
     {
     if (this->m_prof) this->m_prof->push("flip");
 
-    // move every cluster independently
-    m_count_total.n_clusters += m_clusters.size();
+    unsigned int nptl = m_pdata->getN();
+
+    // every particle is in exactly one cluster, identified by its root
+    unsigned int n_clusters = 0;
+    for (unsigned int i = 0; i < nptl; ++i)
+        {
+        if (m_cluster_root[i] == i)
+            n_clusters++;
+        }
+
+    m_count_total.n_clusters += n_clusters;
+    m_count_total.n_particles_in_clusters += nptl;
 
         {
         ArrayHandle<Scalar4> h_pos(this->m_pdata->getPositions(), access_location::host, access_mode::readwrite);
@@ -1146,30 +1024,34 @@ void UpdaterClusters<Shape>::flip(uint64_t timestep)
 
         uint16_t seed = this->m_sysdef->getSeed();
 
-        for (unsigned int icluster = 0; icluster < m_clusters.size(); icluster++)
+        // move every cluster independently, all particles in a cluster make the same decision
+        #ifdef ENABLE_TBB
+        m_exec_conf->getTaskArena()->execute([&]{
+        tbb::parallel_for(tbb::blocked_range<unsigned int>(0, nptl),
+            [&](const tbb::blocked_range<unsigned int>& r) {
+        for (unsigned int i = r.begin(); i != r.end(); ++i)
+        #else
+        for (unsigned int i = 0; i < nptl; ++i)
+        #endif
             {
-            m_count_total.n_particles_in_clusters += m_clusters[icluster].size();
-
             // seed by id of first particle in cluster to make independent of cluster labeling
             hoomd::RandomGenerator rng_i(hoomd::Seed(hoomd::RNGIdentifier::UpdaterClusters2, timestep, seed),
-                                         hoomd::Counter(m_clusters[icluster][0]));
+                                         hoomd::Counter(m_cluster_root[i]));
 
             bool flip = hoomd::detail::generate_canonical<float>(rng_i) <= m_flip_probability;
 
             if (!flip)
                 {
-                // revert cluster
-                for (auto it = m_clusters[icluster].begin(); it != m_clusters[icluster].end(); ++it)
-                    {
-                    // particle index
-                    unsigned int i = *it;
-
-                    h_pos.data[i] = h_pos_backup.data[i];
-                    h_orientation.data[i] = h_orientation_backup.data[i];
-                    h_image.data[i] = h_image_backup.data[i];
-                    }
+                // revert particle
+                h_pos.data[i] = h_pos_backup.data[i];
+                h_orientation.data[i] = h_orientation_backup.data[i];
+                h_image.data[i] = h_image_backup.data[i];
                 }
-            } // end loop over clusters
+            } // end loop over particles
+        #ifdef ENABLE_TBB
+            });
+        }); // end task arena execute()
+        #endif
         }
 
     if (this->m_prof) this->m_prof->pop();
@@ -1193,9 +1075,6 @@ void UpdaterClusters<Shape>::findInteractions(uint64_t timestep, const quat<Scal
     Index2D overlap_idx = m_mc->getOverlapIndexer();
     ArrayHandle<unsigned int> h_overlaps(m_mc->getInteractionMatrix(), access_location::host, access_mode::read);
 
-    // clear the local bond and rejection lists
-    m_overlap.clear();
-
     auto patch = m_mc->getPatchInteraction();
 
     Scalar r_cut_patch(0.0);
@@ -1222,7 +1101,7 @@ void UpdaterClusters<Shape>::findInteractions(uint64_t timestep, const quat<Scal
     if (patch)
         {
         // test old configuration against itself
-        #ifdef ENABLE_TBB_TASK
+        #ifdef ENABLE_TBB
         this->m_exec_conf->getTaskArena()->execute([&]{
         tbb::parallel_for((unsigned int)0,this->m_pdata->getN(), [&](unsigned int i)
         #else
@@ -1315,14 +1194,14 @@ void UpdaterClusters<Shape>::findInteractions(uint64_t timestep, const quat<Scal
                 } // end loop over images
 
             } // end loop over old configuration
-        #ifdef ENABLE_TBB_TASK
+        #ifdef ENABLE_TBB
             );
         }); // end task arena execute()
         #endif
         }
 
     // loop over new configuration
-    #ifdef ENABLE_TBB_TASK
+    #ifdef ENABLE_TBB
     this->m_exec_conf->getTaskArena()->execute([&]{
     tbb::parallel_for((unsigned int)0,nptl, [&](unsigned int i)
     #else
@@ -1385,7 +1264,7 @@ void UpdaterClusters<Shape>::findInteractions(uint64_t timestep, const quat<Scal
                                     && test_overlap(r_ij, shape_i, shape_j, err))
                                     {
                                     // add connection
-                                    m_overlap.insert(std::make_pair(i,j));
+                                    m_sets.unite(i,j);
                                     } // end if overlap
                                 }
 
@@ -1480,7 +1359,7 @@ void UpdaterClusters<Shape>::findInteractions(uint64_t timestep, const quat<Scal
                 } // end loop over images
             } // end if patch
         } // end loop over local particles
-    #ifdef ENABLE_TBB_TASK
+    #ifdef ENABLE_TBB
         );
     }); // end task arena execute()
     #endif
@@ -1507,7 +1386,7 @@ void UpdaterClusters<Shape>::findInteractions(uint64_t timestep, const quat<Scal
         return;
 
     // test old configuration against itself
-    #ifdef ENABLE_TBB_TASK
+    #ifdef ENABLE_TBB
     this->m_exec_conf->getTaskArena()->execute([&]{
     tbb::parallel_for((unsigned int)0,this->m_pdata->getN(), [&](unsigned int i) {
     #else
@@ -1525,7 +1404,7 @@ void UpdaterClusters<Shape>::findInteractions(uint64_t timestep, const quat<Scal
             h_overlaps.data, h_fugacity.data,
             timestep, q, pivot, line);
         }
-    #ifdef ENABLE_TBB_TASK
+    #ifdef ENABLE_TBB
         });
     }); // end task arena execute()
     #endif
@@ -1568,9 +1447,26 @@ void UpdaterClusters<Shape>::connectedComponents()
     {
     if (this->m_prof) this->m_prof->push("connected components");
 
-    // compute connected components
-    m_clusters.clear();
-    m_G.connectedComponents(m_clusters);
+    // label every particle with the root of its cluster, the smallest particle index in the cluster
+    unsigned int nptl = m_pdata->getN();
+    m_cluster_root.resize(nptl);
+
+    #ifdef ENABLE_TBB
+    m_exec_conf->getTaskArena()->execute([&]{
+    tbb::parallel_for(tbb::blocked_range<unsigned int>(0, nptl),
+        [&](const tbb::blocked_range<unsigned int>& r) {
+    for (unsigned int i = r.begin(); i != r.end(); ++i)
+    #else
+    for (unsigned int i = 0; i < nptl; ++i)
+    #endif
+        {
+        m_cluster_root[i] = m_sets.find(i);
+        }
+    #ifdef ENABLE_TBB
+        });
+    }); // end task arena execute()
+    #endif
+
     if (this->m_prof) this->m_prof->pop();
     }
 
@@ -1662,7 +1558,10 @@ void UpdaterClusters<Shape>::update(uint64_t timestep)
     // signal that AABB tree is invalid
     m_mc->invalidateAABBTree();
 
-    // determine which particles interact
+    // start with every particle in its own cluster
+    m_sets.resize(this->m_pdata->getN());
+
+    // determine which particles interact, overlapping particles join the same cluster
     findInteractions(timestep, q, pivot, line);
 
     if (this->m_prof)
@@ -1670,49 +1569,11 @@ void UpdaterClusters<Shape>::update(uint64_t timestep)
 
     // fill in the cluster bonds, using bond formation probability defined in Liu and Luijten
 
-    if (m_prof)
-        m_prof->push("realloc");
-
-    // resize the number of graph nodes in place
-    m_G.resize(this->m_pdata->getN());
-
-    if (m_prof)
-        m_prof->pop();
-
-    if (m_prof)
-        m_prof->push("overlap");
-
-    #ifdef ENABLE_TBB_TASK
-    this->m_exec_conf->getTaskArena()->execute([&]{
-    tbb::parallel_for(m_overlap.range(), [&] (decltype(m_overlap.range()) r)
-    #else
-    auto &r = m_overlap;
-    #endif
-        {
-        for (auto it = r.begin(); it != r.end(); ++it)
-            {
-            unsigned int i = it->first;
-            unsigned int j = it->second;
-
-            // we're adding a directed edge, but the actual graph will be undirected
-            // if the symmetry operation is self-inverse
-            m_G.addEdge(i,j);
-            }
-        }
-    #ifdef ENABLE_TBB_TASK
-        );
-    }); // end task arena execute()
-    #endif
-
-    if (m_prof)
-        m_prof->pop();
-
-
     if (m_mc->getPatchInteraction())
         {
         // sum up interaction energies
-        #ifdef ENABLE_TBB_TASK
-        tbb::concurrent_unordered_map< std::pair<unsigned int, unsigned int>, float> delta_U;
+        #ifdef ENABLE_TBB
+        tbb::concurrent_unordered_map< std::pair<unsigned int, unsigned int>, float, detail::PairHash> delta_U;
         #else
         std::map< std::pair<unsigned int, unsigned int>, float> delta_U;
         #endif
@@ -1751,7 +1612,7 @@ void UpdaterClusters<Shape>::update(uint64_t timestep)
             delta_U[p] = delU;
             }
 
-        #ifdef ENABLE_TBB_TASK
+        #ifdef ENABLE_TBB
         this->m_exec_conf->getTaskArena()->execute([&]{
         tbb::parallel_for(delta_U.range(), [&] (decltype(delta_U.range()) r)
         #else
@@ -1772,11 +1633,11 @@ void UpdaterClusters<Shape>::update(uint64_t timestep)
                 if (hoomd::detail::generate_canonical<float>(rng_ij) <= pij) // GCA
                     {
                     // add bond
-                    m_G.addEdge(i,j);
+                    m_sets.unite(i,j);
                     }
                 }
             }
-        #ifdef ENABLE_TBB_TASK
+        #ifdef ENABLE_TBB
             );
         }); // end task arena execute()
         #endif
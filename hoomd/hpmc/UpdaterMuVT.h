@@ -11,6 +11,11 @@
 #include "IntegratorHPMCMono.h"
 #include "hoomd/RandomNumbers.h"
 
+#ifdef ENABLE_TBB
+#include <tbb/blocked_range.h>
+#include <tbb/parallel_for.h>
+#endif
+
 #ifndef __HIPCC__
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
@@ -23,6 +28,12 @@ namespace hpmc
  * This class implements an Updater for simulations in the grand-canonical ensemble (mu-V-T).
  *
  * Gibbs ensemble integration between two MPI partitions is also supported.
+ *
+ * In the multi-insertion mode, each step divides the box into a randomly shifted grid of regions that are at
+ * least as wide as the largest particle and attempts one insertion or removal in every region of one randomly
+ * chosen checkerboard color. Regions of the same color are separated by at least one region, so the trial moves
+ * do not interact: they are checked concurrently and each one is accepted with the grand-canonical acceptance
+ * rule of its region.
  */
 template<class Shape>
 class UpdaterMuVT : public Updater
@@ -143,6 +154,18 @@ class UpdaterMuVT : public Updater
             return m_n_trial;
             }
 
+        //! Set whether to attempt many insertions and removals per step in separated regions
+        void setMultiInsert(bool multi_insert)
+            {
+            m_multi_insert = multi_insert;
+            }
+
+        //! Get whether many insertions and removals are attempted per step
+        bool getMultiInsert()
+            {
+            return m_multi_insert;
+            }
+
         //! Get the current counter values
         hpmc_muvt_counters_t getCounters(unsigned int mode=0);
 
@@ -158,6 +181,7 @@ class UpdaterMuVT : public Updater
         Scalar m_volume_move_probability;                                  //!< Ratio between exchange/transfer and volume moves
 
         unsigned int m_gibbs_other;                           //!< The root-rank of the other partition
+        bool m_multi_insert;                                  //!< True to attempt one move per separated region
 
         hpmc_muvt_counters_t m_count_total;          //!< Accept/reject total count
         hpmc_muvt_counters_t m_count_run_start;      //!< Count saved at run() start
@@ -281,6 +305,19 @@ class UpdaterMuVT : public Updater
         //! Get the random number of depletants
         virtual unsigned int getNumDepletants(uint64_t timestep, Scalar V, bool local, unsigned int type_d);
 
+        //! Attempt one insertion or removal in each active region of a checkerboard
+        void updateMultiInsert(uint64_t timestep);
+
+        //! Test whether a particle inserted at the given position overlaps with any other particle
+        bool checkInsertOverlap(unsigned int type,
+                                const vec3<Scalar>& pos,
+                                const quat<Scalar>& orientation,
+                                const detail::AABBTree& aabb_tree,
+                                const std::vector<vec3<Scalar> >& image_list,
+                                const Scalar4 *postype,
+                                const Scalar4 *orientation_data,
+                                const unsigned int *overlaps);
+
     private:
         //! Handle MaxParticleNumberChange signal
         /*! Resize the m_pos_backup array
@@ -304,7 +341,7 @@ UpdaterMuVT<Shape>::UpdaterMuVT(std::shared_ptr<SystemDefinition> sysdef,
     unsigned int npartition)
     : Updater(sysdef), m_mc(mc), m_npartition(npartition), m_gibbs(false),
       m_max_vol_rescale(0.1), m_volume_move_probability(0.5), m_gibbs_other(0),
-      m_n_trial(1)
+      m_multi_insert(false), m_n_trial(1)
     {
     m_fugacity.resize(m_pdata->getNTypes(), std::shared_ptr<Variant>(new VariantConstant(0.0)));
     m_type_map.resize(m_pdata->getNTypes());
@@ -813,6 +850,14 @@ void UpdaterMuVT<Shape>::update(uint64_t timestep)
 
     m_exec_conf->msg->notice(10) << "UpdaterMuVT update: " << timestep << std::endl;
 
+    if (m_multi_insert)
+        {
+        updateMultiInsert(timestep);
+
+        if (m_prof) m_prof->pop();
+        return;
+        }
+
     // initialize random number generator
     unsigned int group = (m_exec_conf->getPartition()/m_npartition);
 
@@ -1401,6 +1446,351 @@ void UpdaterMuVT<Shape>::update(uint64_t timestep)
     if (m_prof) m_prof->pop();
     }
 
+/*! \param type Type of the inserted particle
+    \param pos Position of the inserted particle
+    \param orientation Orientation of the inserted particle
+    \param aabb_tree AABB tree of the current configuration
+    \param image_list Image list of the current box
+    \param postype Particle positions and types
+    \param orientation_data Particle orientations
+    \param overlaps Interaction matrix
+    \returns true if the particle overlaps with a periodic image of itself or with another particle
+
+    This method only reads the configuration, so it may be called from several threads at once.
+*/
+template<class Shape>
+bool UpdaterMuVT<Shape>::checkInsertOverlap(unsigned int type,
+                                            const vec3<Scalar>& pos,
+                                            const quat<Scalar>& orientation,
+                                            const detail::AABBTree& aabb_tree,
+                                            const std::vector<vec3<Scalar> >& image_list,
+                                            const Scalar4 *postype,
+                                            const Scalar4 *orientation_data,
+                                            const unsigned int *overlaps)
+    {
+    auto& params = m_mc->getParams();
+    const Index2D& overlap_idx = m_mc->getOverlapIndexer();
+    unsigned int err_count = 0;
+
+    Shape shape(orientation, params[type]);
+    detail::AABB aabb_local = shape.getAABB(vec3<Scalar>(0,0,0));
+
+    const unsigned int n_images = (unsigned int)image_list.size();
+    const unsigned int n_nodes = m_pdata->getN() > 0 ? aabb_tree.getNumNodes() : 0;
+    for (unsigned int cur_image = 0; cur_image < n_images; cur_image++)
+        {
+        vec3<Scalar> pos_image = pos + image_list[cur_image];
+
+        if (cur_image != 0)
+            {
+            // check for self-overlap with all images except the original
+            vec3<Scalar> r_ij = pos - pos_image;
+            if (overlaps[overlap_idx(type, type)]
+                && check_circumsphere_overlap(r_ij, shape, shape)
+                && test_overlap(r_ij, shape, shape, err_count))
+                {
+                return true;
+                }
+            }
+
+        detail::AABB aabb = aabb_local;
+        aabb.translate(pos_image);
+
+        // stackless search
+        for (unsigned int cur_node_idx = 0; cur_node_idx < n_nodes; cur_node_idx++)
+            {
+            if (detail::overlap(aabb_tree.getNodeAABB(cur_node_idx), aabb))
+                {
+                if (aabb_tree.isNodeLeaf(cur_node_idx))
+                    {
+                    for (unsigned int cur_p = 0; cur_p < aabb_tree.getNodeNumParticles(cur_node_idx); cur_p++)
+                        {
+                        // read in its position and orientation
+                        unsigned int j = aabb_tree.getNodeParticle(cur_node_idx, cur_p);
+
+                        Scalar4 postype_j = postype[j];
+                        Scalar4 orientation_j = orientation_data[j];
+
+                        // put particles in coordinate system of particle i
+                        vec3<Scalar> r_ij = vec3<Scalar>(postype_j) - pos_image;
+
+                        unsigned int typ_j = __scalar_as_int(postype_j.w);
+                        Shape shape_j(quat<Scalar>(orientation_j), params[typ_j]);
+
+                        if (overlaps[overlap_idx(type, typ_j)]
+                            && check_circumsphere_overlap(r_ij, shape, shape_j)
+                            && test_overlap(r_ij, shape, shape_j, err_count))
+                            {
+                            return true;
+                            }
+                        }
+                    }
+                }
+            else
+                {
+                // skip ahead
+                cur_node_idx += aabb_tree.getNodeSkip(cur_node_idx);
+                }
+            } // end loop over AABB nodes
+        } // end loop over images
+
+    return false;
+    }
+
+/*! \param timestep Current time step
+
+    Divide the box into n_x * n_y * n_z regions, with each n even (or 1) and each region at least as wide as the
+    largest particle, shifted by a random offset. Choose one of the 2^d checkerboard colors at random and attempt one
+    insertion or removal in every region of that color. Two regions of the same color are separated by a region of
+    another color, so a particle inserted or removed in one region cannot interact with a particle inserted or removed
+    in another one. Each trial move is a grand-canonical move restricted to its region with volume V_r and N_r
+    particles of the chosen type in it, accepted with probability min(1, z V_r / (N_r + 1)) for insertions and
+    min(1, N_r / (z V_r)) for removals. The grid and color are chosen independently of the configuration, so the
+    composite move satisfies detailed balance.
+*/
+template<class Shape>
+void UpdaterMuVT<Shape>::updateMultiInsert(uint64_t timestep)
+    {
+    if (m_gibbs)
+        throw std::runtime_error("Multi-insertion moves are not supported in the Gibbs ensemble.");
+
+    #ifdef ENABLE_MPI
+    if (m_pdata->getDomainDecomposition())
+        throw std::runtime_error("Multi-insertion moves are not supported with domain decomposition.");
+    #endif
+
+    if (m_mc->getPatchInteraction())
+        throw std::runtime_error("Multi-insertion moves are not supported with patch interactions.");
+
+    for (unsigned int type_i = 0; type_i < m_pdata->getNTypes(); ++type_i)
+        {
+        for (unsigned int type_j = 0; type_j < m_pdata->getNTypes(); ++type_j)
+            {
+            if (m_mc->getDepletantFugacity(type_i, type_j) != 0.0)
+                throw std::runtime_error("Multi-insertion moves are not supported with depletants.");
+            }
+        }
+
+    assert(m_transfer_types.size() > 0);
+
+    // sanity check
+    for (unsigned int type : m_transfer_types)
+        {
+        if ((*m_fugacity[type])(timestep) <= Scalar(0.0))
+            {
+            m_exec_conf->msg->error() << "Fugacity has to be greater than zero." << std::endl;
+            throw std::runtime_error("Error in UpdaterMuVT");
+            }
+        }
+
+    const unsigned int ndim = m_sysdef->getNDimensions();
+    const BoxDim global_box = m_pdata->getGlobalBox();
+
+    hoomd::RandomGenerator rng(hoomd::Seed(hoomd::RNGIdentifier::UpdaterMuVT, timestep, this->m_sysdef->getSeed()),
+                               hoomd::Counter());
+
+    // choose the grid of regions, each wider than the largest particle
+    const Scalar width = m_mc->getMaxCoreDiameter();
+    const Scalar3 plane_distance = global_box.getNearestPlaneDistance();
+    Scalar plane_distances[3] = {plane_distance.x, plane_distance.y, plane_distance.z};
+
+    unsigned int n_regions[3] = {1, 1, 1};
+    Scalar offset[3] = {0, 0, 0};
+    unsigned int color[3] = {0, 0, 0};
+    for (unsigned int d = 0; d < ndim; d++)
+        {
+        // limit the number of regions to bound the memory used by the trial moves
+        unsigned int n = (unsigned int)std::min(plane_distances[d] / width, Scalar(128));
+        if (n >= 2)
+            {
+            // an even number of regions alternates colors across the periodic boundary
+            n_regions[d] = n - n % 2;
+            color[d] = hoomd::UniformIntDistribution(1)(rng);
+            }
+        offset[d] = hoomd::detail::generate_canonical<Scalar>(rng);
+        }
+
+    const Index3D region_idx(n_regions[0], n_regions[1], n_regions[2]);
+    const Scalar V_region = global_box.getVolume(ndim == 2) / Scalar(region_idx.getNumElements());
+
+    // the active regions have the chosen color
+    std::vector<uint3> active_regions;
+    for (unsigned int k = color[2]; k < n_regions[2]; k += (n_regions[2] > 1 ? 2 : 1))
+        for (unsigned int j = color[1]; j < n_regions[1]; j += (n_regions[1] > 1 ? 2 : 1))
+            for (unsigned int i = color[0]; i < n_regions[0]; i += (n_regions[0] > 1 ? 2 : 1))
+                active_regions.push_back(make_uint3(i, j, k));
+
+    // list the tags of each type in each active region
+    const unsigned int n_types = m_pdata->getNTypes();
+    std::vector<int> active_index(region_idx.getNumElements(), -1);
+    for (unsigned int r = 0; r < active_regions.size(); r++)
+        active_index[region_idx(active_regions[r].x, active_regions[r].y, active_regions[r].z)] = r;
+
+    std::vector< std::vector<unsigned int> > region_tags(active_regions.size()*n_types);
+        {
+        ArrayHandle<Scalar4> h_postype(m_pdata->getPositions(), access_location::host, access_mode::read);
+        ArrayHandle<unsigned int> h_tag(m_pdata->getTags(), access_location::host, access_mode::read);
+
+        for (unsigned int idx = 0; idx < m_pdata->getN(); idx++)
+            {
+            Scalar3 f = global_box.makeFraction(make_scalar3(h_postype.data[idx].x,
+                                                             h_postype.data[idx].y,
+                                                             h_postype.data[idx].z));
+            Scalar fractions[3] = {f.x, f.y, f.z};
+            unsigned int cell[3] = {0, 0, 0};
+            for (unsigned int d = 0; d < ndim; d++)
+                {
+                int c = (int)slow::floor(fractions[d]*n_regions[d] + offset[d]);
+                cell[d] = (unsigned int)(((c % (int)n_regions[d]) + (int)n_regions[d]) % (int)n_regions[d]);
+                }
+
+            int r = active_index[region_idx(cell[0], cell[1], cell[2])];
+            if (r >= 0)
+                {
+                unsigned int type = __scalar_as_int(h_postype.data[idx].w);
+                region_tags[r*n_types + type].push_back(h_tag.data[idx]);
+                }
+            }
+        }
+
+    // the outcome of the trial move in each region
+    struct TrialMove
+        {
+        bool insert;
+        bool accept;
+        unsigned int type;
+        unsigned int tag;
+        vec3<Scalar> pos;
+        quat<Scalar> orientation;
+        };
+    std::vector<TrialMove> moves(active_regions.size());
+
+    // the trial moves only read the configuration
+    const detail::AABBTree& aabb_tree = m_mc->buildAABBTree();
+    const std::vector<vec3<Scalar> > image_list = m_mc->updateImageList();
+
+        {
+        ArrayHandle<Scalar4> h_postype(m_pdata->getPositions(), access_location::host, access_mode::read);
+        ArrayHandle<Scalar4> h_orientation(m_pdata->getOrientationArray(), access_location::host, access_mode::read);
+        ArrayHandle<unsigned int> h_overlaps(m_mc->getInteractionMatrix(), access_location::host, access_mode::read);
+        auto& params = m_mc->getParams();
+
+        #ifdef ENABLE_TBB
+        m_exec_conf->getTaskArena()->execute([&]{
+        tbb::parallel_for(tbb::blocked_range<unsigned int>(0, (unsigned int)active_regions.size()),
+            [&](const tbb::blocked_range<unsigned int>& range) {
+        for (unsigned int r = range.begin(); r != range.end(); ++r)
+        #else
+        for (unsigned int r = 0; r < active_regions.size(); r++)
+        #endif
+            {
+            hoomd::RandomGenerator rng_r(hoomd::Seed(hoomd::RNGIdentifier::UpdaterMuVT, timestep, this->m_sysdef->getSeed()),
+                                         hoomd::Counter(0, r, 1));
+
+            TrialMove& move = moves[r];
+            move.insert = hoomd::UniformIntDistribution(1)(rng_r);
+            move.accept = false;
+            move.type = m_transfer_types[hoomd::UniformIntDistribution((unsigned int)(m_transfer_types.size()-1))(rng_r)];
+            move.tag = UINT_MAX;
+
+            Scalar fugacity = (*m_fugacity[move.type])(timestep);
+            const std::vector<unsigned int>& tags = region_tags[r*n_types + move.type];
+            const unsigned int nptl_type = (unsigned int)tags.size();
+
+            if (move.insert)
+                {
+                // propose a random position uniformly in the region
+                const unsigned int cell[3] = {active_regions[r].x, active_regions[r].y, active_regions[r].z};
+                Scalar fractions[3] = {0.5, 0.5, 0.5};
+                for (unsigned int d = 0; d < ndim; d++)
+                    {
+                    Scalar f = (Scalar(cell[d]) + hoomd::detail::generate_canonical<Scalar>(rng_r) - offset[d])
+                        / Scalar(n_regions[d]);
+                    fractions[d] = f - slow::floor(f);
+                    }
+                move.pos = vec3<Scalar>(global_box.makeCoordinates(make_scalar3(fractions[0],
+                                                                                fractions[1],
+                                                                                fractions[2])));
+
+                Shape shape_test(quat<Scalar>(), params[move.type]);
+                move.orientation = quat<Scalar>();
+                if (shape_test.hasOrientation())
+                    {
+                    move.orientation = generateRandomOrientation(rng_r, ndim);
+                    }
+
+                Scalar lnboltzmann = log(fugacity*V_region/(Scalar)(nptl_type+1));
+                bool overlap = checkInsertOverlap(move.type,
+                                                  move.pos,
+                                                  move.orientation,
+                                                  aabb_tree,
+                                                  image_list,
+                                                  h_postype.data,
+                                                  h_orientation.data,
+                                                  h_overlaps.data);
+
+                move.accept = !overlap && hoomd::detail::generate_canonical<double>(rng_r) < exp(lnboltzmann);
+                }
+            else if (nptl_type > 0)
+                {
+                // choose a random particle of that type in the region
+                move.tag = tags[hoomd::UniformIntDistribution(nptl_type-1)(rng_r)];
+
+                Scalar lnboltzmann = log((Scalar)nptl_type/(fugacity*V_region));
+                move.accept = hoomd::detail::generate_canonical<double>(rng_r) < exp(lnboltzmann);
+                }
+            }
+        #ifdef ENABLE_TBB
+            });
+        });
+        #endif
+        }
+
+    // apply the accepted moves
+    for (const TrialMove& move : moves)
+        {
+        if (move.insert)
+            {
+            if (move.accept)
+                {
+                unsigned int tag = m_pdata->addParticle(move.type);
+
+                // setPosition() takes into account the grid shift, so subtract that one
+                Scalar3 p = vec_to_scalar3(move.pos)-m_pdata->getOrigin();
+                int3 tmp = make_int3(0,0,0);
+                global_box.wrap(p,tmp);
+                m_pdata->setPosition(tag, p);
+                m_pdata->setOrientation(tag, quat_to_scalar4(move.orientation));
+                m_count_total.insert_accept_count++;
+                }
+            else
+                {
+                m_count_total.insert_reject_count++;
+                }
+            }
+        else
+            {
+            if (move.accept)
+                {
+                m_pdata->removeParticle(move.tag);
+                m_count_total.remove_accept_count++;
+                }
+            else
+                {
+                m_count_total.remove_reject_count++;
+                }
+            }
+        }
+
+    #ifdef ENABLE_MPI
+    if (m_comm)
+        {
+        // We have inserted or removed particles, so update ghosts
+        m_mc->communicate(false);
+        }
+    #endif
+    }
+
 template<class Shape>
 bool UpdaterMuVT<Shape>::tryRemoveParticle(uint64_t timestep, unsigned int tag, Scalar &lnboltzmann)
     {
@@ -2618,6 +3008,7 @@ template < class Shape > void export_UpdaterMuVT(pybind11::module& m, const std:
           .def_property("volume_move_probability", &UpdaterMuVT<Shape>::getVolumeMoveProbability, &UpdaterMuVT<Shape>::setVolumeMoveProbability)
           .def_property("transfer_types", &UpdaterMuVT<Shape>::getTransferTypes, &UpdaterMuVT<Shape>::setTransferTypes)
           .def_property("ntrial", &UpdaterMuVT<Shape>::getNTrial, &UpdaterMuVT<Shape>::setNTrial)
+          .def_property("multi_insert", &UpdaterMuVT<Shape>::getMultiInsert, &UpdaterMuVT<Shape>::setMultiInsert)
           .def_property_readonly("N", &UpdaterMuVT<Shape>::getN)
           .def("getCounters", &UpdaterMuVT<Shape>::getCounters)
           ;
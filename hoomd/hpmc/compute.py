@@ -13,6 +13,7 @@ from hoomd.hpmc import integrate
 from hoomd.data.parameterdicts import ParameterDict
 from hoomd.logging import log
 import hoomd
+import numpy
 
 
 class FreeVolume(Compute):
@@ -21,6 +22,7 @@ class FreeVolume(Compute):
     Args:
         test_particle_type (str): Test particle type.
         num_samples (int): Number of samples to evaluate.
+        batch_size (int): Number of test particles to check together.
 
     `FreeVolume` computes the free volume in the simulation state available to a
     given test particle using Monte Carlo integration. It must be used in
@@ -52,6 +54,26 @@ class FreeVolume(Compute):
         `FreeVolume` respects the ``interaction_matrix`` set in the HPMC
         integrator.
 
+    On the CPU, `FreeVolume` checks the test particles in parallel threads.
+    Each test particle draws its position and orientation from its own random
+    number stream, so `free_volume` does not depend on the number of threads
+    or on `batch_size`. With a `batch_size` of 1, each test particle searches
+    the particles for an overlap and stops at the first one it finds. Larger
+    batches first find the neighboring particles of all test particles in the
+    batch, then check all the test particles near each group of neighboring
+    particles together, which accesses memory more efficiently when there are
+    many test particles per particle. The GPU implementation ignores
+    `batch_size`.
+
+    Every evaluation of `free_volume` at a new timestep also adds its samples
+    to a running estimate, `running_free_volume`, which pools the samples of
+    all evaluations since the last call to `reset`:
+
+    .. math::
+        \langle V_\mathrm{free} \rangle = \frac{\sum_k (n_{\mathrm{samples},k}
+        - n_{\mathrm{overlaps},k}) V_{\mathrm{box},k}}
+        {\sum_k n_{\mathrm{samples},k}}
+
     Examples::
 
         fv = hoomd.hpmc.compute.FreeVolume(test_particle_type='B',
@@ -63,16 +85,20 @@ class FreeVolume(Compute):
 
         num_samples (int): Number of samples to evaluate.
 
+        batch_size (int): Number of test particles to check together.
+
     """
-    def __init__(self, test_particle_type, num_samples):
+    def __init__(self, test_particle_type, num_samples, batch_size=1):
         # store metadata
         param_dict = ParameterDict(
             test_particle_type=str,
-            num_samples=int
+            num_samples=int,
+            batch_size=int
         )
         param_dict.update(
             dict(test_particle_type=test_particle_type,
-                 num_samples=num_samples))
+                 num_samples=num_samples,
+                 batch_size=batch_size))
         self._param_dict.update(param_dict)
 
     def _attach(self):
@@ -107,3 +133,142 @@ class FreeVolume(Compute):
             return self._cpp_obj.free_volume
         else:
             return None
+
+    @log
+    def running_free_volume(self):
+        """Running estimate of the free volume over all evaluations."""
+        if self._attached:
+            self._cpp_obj.compute(self._simulation.timestep)
+            return self._cpp_obj.running_free_volume
+        else:
+            return None
+
+    @property
+    def running_num_samples(self):
+        """int: Number of samples in `running_free_volume`."""
+        if self._attached:
+            return self._cpp_obj.running_num_samples
+        else:
+            return None
+
+    def reset(self):
+        """Clear the running estimate of the free volume."""
+        if self._attached:
+            self._cpp_obj.reset()
+
+
+class SDF(Compute):
+    r"""Compute the scale distribution function.
+
+    Args:
+        xmax (float): Maximum *x* value at the right hand side of the rightmost
+            bin (distance units).
+        dx (float): Bin width (distance units).
+
+    `SDF` computes a distribution function of scale parameters :math:`x`. For
+    each particle, it finds the smallest scale factor :math:`1+x` that would
+    cause the particle to touch one of its neighbors and records that in the
+    histogram :math:`s(x)`. The histogram is discrete and :math:`s(x_i) = s[i]`
+    where :math:`x_i = i \cdot dx + dx/2`. :math:`s` is normalized by the number
+    of particles and the bin width.
+
+    In an NVT simulation, the extrapolation of :math:`s(x)` to :math:`x = 0`,
+    :math:`s(0+)` is related to the pressure.
+
+    .. math::
+        \frac{P}{kT} = \rho \left(1 + \frac{s(0+)}{2d} \right)
+
+    where :math:`d` is the dimensionality of the system and :math:`\rho` is the
+    number density. `betaP` performs this extrapolation with a polynomial fit
+    of degree 5 to all bins of :math:`s(x)`.
+
+    Extrapolating :math:`s(0+)` is not trivial. Here are some suggested
+    parameters, but they may not work in all cases.
+
+      * *xmax* = 0.02
+      * *dx* = 1e-4
+
+    In systems near densest packings, ``dx=1e-5`` may be needed along with
+    either a smaller xmax or a smaller region to fit. A good rule of thumb
+    might be to fit a region where ``numpy.sum(s[0:n]*dx)`` ~ 0.5 - but this
+    needs further testing to confirm.
+
+    `SDF` histograms the particles in parallel threads on the CPU and sums the
+    histograms over all MPI ranks. It keeps the histogram of the last computed
+    timestep in memory. Log `sdf` or `betaP` with a `hoomd.logging.Logger` to
+    record them, or average `betaP` over many timesteps with
+    `hoomd.write.BlockAverage`.
+
+    Warning:
+        `SDF` does not compute correct pressures for simulations with concave
+        particles.
+
+    Examples::
+
+        sdf = hoomd.hpmc.compute.SDF(xmax=0.02, dx=1e-4)
+        sim.operations.computes.append(sdf)
+        logger = hoomd.logging.Logger()
+        logger.add(sdf, quantities=['betaP'])
+
+    Attributes:
+        xmax (float): Maximum *x* value at the right hand side of the rightmost
+            bin (distance units).
+
+        dx (float): Bin width (distance units).
+    """
+
+    def __init__(self, xmax, dx):
+        # store metadata
+        param_dict = ParameterDict(xmax=float, dx=float)
+        param_dict.update(dict(xmax=xmax, dx=dx))
+        self._param_dict.update(param_dict)
+
+    def _attach(self):
+        integrator = self._simulation.operations.integrator
+        if not isinstance(integrator, integrate.HPMCIntegrator):
+            raise RuntimeError("The integrator must be an HPMC integrator.")
+
+        cpp_cls = getattr(
+            _hpmc, integrator._cpp_cls.replace('IntegratorHPMCMono',
+                                               'ComputeSDF'), None)
+        if cpp_cls is None:
+            raise RuntimeError("Unsupported integrator.")
+
+        self._cpp_obj = cpp_cls(self._simulation.state._cpp_sys_def,
+                                integrator._cpp_obj, self.xmax, self.dx)
+
+        super()._attach()
+
+    @log(category='sequence')
+    def sdf(self):
+        """(*N_bins*,) `numpy.ndarray` of `float`: :math:`s[i]` - The SDF."""
+        if self._attached:
+            self._cpp_obj.compute(self._simulation.timestep)
+            return numpy.array(self._cpp_obj.sdf)
+        else:
+            return None
+
+    @log
+    def betaP(self):  # noqa: N802 - allow function name
+        r"""float: Beta times pressure in NVT simulations.
+
+        Uses a polynomial curve fit of degree 5 to estimate :math:`s(0+)` and
+        computes the pressure via:
+
+        .. math::
+            \beta P = \rho \left(1 + \frac{s(0+)}{2d} \right)
+
+        where :math:`d` is the dimensionality of the system and :math:`\rho` is
+        the number density.
+        """
+        if not self._attached:
+            return None
+
+        sdf = self.sdf
+        x = numpy.arange(len(sdf)) * self.dx + self.dx / 2
+        degree = min(5, len(sdf) - 1)
+        s0 = numpy.polyval(numpy.polyfit(x, sdf, degree), 0.0)
+
+        box = self._simulation.state.box
+        rho = self._simulation.state.N_particles / box.volume
+        return rho * (1 + s0 / (2 * box.dimensions))
@@ -84,6 +84,21 @@ class HPMCIntegrator(BaseIntegrator):
             Maximum size of displacement trial moves
             (distance units).
 
+        depletant_cache (bool): Set to `True` to keep the depletants that each
+            particle inserts in its excluded volume between trial moves
+            (**default:** `False`).
+
+            The depletants in the excluded volume of a particle, and whether
+            they overlap it, depend only on the particle's type, orientation
+            and a random number seed that changes when the particle moves.
+            With the cache, the trial moves reuse them while the particle and
+            its neighbors keep their seeds and orientations instead of
+            inserting them again, which saves work in quiescent regions at
+            the cost of memory that grows with the number of particles and
+            the depletant fugacity. The sampled trajectory is the same with
+            and without the cache. Only the CPU implementation uses the
+            cache.
+
         depletant_fugacity (`TypeParameter` [\
                             `tuple` [``particle type``, ``particle type``],\
                             `float`]):
@@ -107,6 +122,20 @@ class HPMCIntegrator(BaseIntegrator):
             overlap checks between particles of those types (**default:**
             `True`).
 
+        narrow_phase_tiers (bool): Set to `True` to try cheaper tests before
+            the exact overlap check of each pair of particles (**default:**
+            `False`).
+
+            The tiers, in order, reject the overlap when the circumspheres are
+            disjoint, prove it when the in-spheres intersect, and reject it
+            when the oriented bounding boxes are disjoint (in 3D only). The
+            exact overlap check decides the remaining pairs. The integrator
+            precomputes the circumsphere and in-sphere thresholds for each
+            pair of particle types. The tiers do not change the result of the
+            overlap checks, and `narrow_phase_counts` reports how many checks
+            each tier settles. Only the CPU implementation uses the tiers in
+            the trial moves.
+
         translation_move_probability (float): Fraction of moves to be selected
             as translation moves.
 
@@ -124,7 +153,9 @@ class HPMCIntegrator(BaseIntegrator):
         # Set base parameter dict for hpmc integrators
         param_dict = ParameterDict(
             translation_move_probability=float(translation_move_probability),
-            nselect=int(nselect))
+            nselect=int(nselect),
+            depletant_cache=False,
+            narrow_phase_tiers=False)
         self._param_dict.update(param_dict)
 
         # Set standard typeparameters for hpmc integrators
@@ -338,6 +369,24 @@ class HPMCIntegrator(BaseIntegrator):
         else:
             return None
 
+    @log(category='sequence')
+    def narrow_phase_counts(self):
+        """tuple[int, int, int, int]: Overlap checks settled by each tier.
+
+        The counts are the number of checks rejected by the circumspheres,
+        proven by the in-spheres, rejected by the oriented bounding boxes, and
+        decided by the exact overlap check, in that order. The counts are zero
+        when `narrow_phase_tiers` is `False`.
+
+        Note:
+            The counts are reset to 0 at the start of each
+            `hoomd.Simulation.run`.
+        """
+        if self._attached:
+            return tuple(self._cpp_obj.getCounters(1).narrow_phase)
+        else:
+            return None
+
     @log
     def mps(self):
         """float: Number of trial moves performed per second.
@@ -363,6 +412,8 @@ class HPMCIntegrator(BaseIntegrator):
         * ``overlap_checks``: `int` - Number of overlap checks performed.
         * ``overlap_errors``: `int` - Number of overlap checks that were too
           close to resolve.
+        * ``narrow_phase``: `list` [`int`] - Number of overlap checks settled
+          by each tier of the narrow phase (see `narrow_phase_counts`).
 
         Note:
             The counts are reset to 0 at the start of each
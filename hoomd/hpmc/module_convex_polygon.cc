@@ -7,7 +7,7 @@
 #include "ComputeFreeVolume.h"
 
 #include "ShapeConvexPolygon.h"
-#include "AnalyzerSDF.h"
+#include "ComputeSDF.h"
 #include "ShapeUnion.h"
 
 #include "ExternalField.h"
@@ -43,7 +43,7 @@ void export_convex_polygon(py::module& m)
     {
     export_IntegratorHPMCMono< ShapeConvexPolygon >(m, "IntegratorHPMCMonoConvexPolygon");
     export_ComputeFreeVolume< ShapeConvexPolygon >(m, "ComputeFreeVolumeConvexPolygon");
-    export_AnalyzerSDF< ShapeConvexPolygon >(m, "AnalyzerSDFConvexPolygon");
+    export_ComputeSDF< ShapeConvexPolygon >(m, "ComputeSDFConvexPolygon");
     export_UpdaterMuVT< ShapeConvexPolygon >(m, "UpdaterMuVTConvexPolygon");
     export_UpdaterClusters< ShapeConvexPolygon >(m, "UpdaterClustersConvexPolygon");
 
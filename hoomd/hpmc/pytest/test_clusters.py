@@ -152,3 +152,36 @@ def test_pivot_moves(device, simulation_factory,
 
     avg = cl.avg_cluster_size
     assert avg > 0
+
+
+@pytest.mark.serial
+@pytest.mark.parametrize("flip_probability", [0, 1])
+def test_cluster_flips(device, simulation_factory, lattice_snapshot_factory,
+                       flip_probability):
+    """Test that Clusters transforms whole clusters without overlaps."""
+    snap = lattice_snapshot_factory(dimensions=3, a=1.2, n=8, r=0.05)
+    sim = simulation_factory(snap)
+
+    # no local moves, only the cluster moves change the configuration
+    mc = hoomd.hpmc.integrate.Sphere(d=0, a=0)
+    mc.shape['A'] = dict(diameter=1.0)
+    sim.operations.integrator = mc
+
+    cl = hoomd.hpmc.update.Clusters(trigger=hoomd.trigger.Periodic(1),
+                                    flip_probability=flip_probability)
+    sim.operations.updaters.append(cl)
+
+    initial_snap = sim.state.snapshot
+    sim.run(10)
+
+    assert mc.overlaps == 0
+    avg = cl.avg_cluster_size
+    assert 1 <= avg <= 512
+
+    snap = sim.state.snapshot
+    if snap.exists and flip_probability == 0:
+        # every cluster is reverted
+        np.testing.assert_allclose(snap.particles.position,
+                                   initial_snap.particles.position)
+        np.testing.assert_array_equal(snap.particles.image,
+                                      initial_snap.particles.image)
@@ -68,3 +68,69 @@ def test_validation_systems(simulation_factory, two_particle_snapshot_factory,
     np.testing.assert_allclose(free_volume,
                                free_volume_compute.free_volume,
                                rtol=2e-2)
+
+
+@pytest.mark.parametrize("batch_size", [2, 7, 64])
+def test_batch_size(simulation_factory, lattice_snapshot_factory, batch_size):
+    sim = simulation_factory(
+        lattice_snapshot_factory(particle_types=['A', 'B'], n=5, a=1))
+
+    mc = hoomd.hpmc.integrate.Sphere()
+    mc.shape["A"] = {'diameter': 0.8}
+    mc.shape["B"] = {'diameter': 0.3}
+    sim.operations.add(mc)
+
+    serial = hoomd.hpmc.compute.FreeVolume(test_particle_type='B',
+                                           num_samples=5000)
+    batched = hoomd.hpmc.compute.FreeVolume(test_particle_type='B',
+                                            num_samples=5000,
+                                            batch_size=batch_size)
+    assert batched.batch_size == batch_size
+    sim.operations.add(serial)
+    sim.operations.add(batched)
+    sim.run(0)
+
+    # the test particles are the same for any batch size
+    assert batched.batch_size == batch_size
+    assert batched.free_volume == serial.free_volume
+
+    with pytest.raises(RuntimeError):
+        batched.batch_size = 0
+
+
+def test_running_free_volume(simulation_factory, lattice_snapshot_factory):
+    sim = simulation_factory(
+        lattice_snapshot_factory(particle_types=['A', 'B'], n=7, a=1))
+
+    mc = hoomd.hpmc.integrate.Sphere(d=0)
+    mc.shape["A"] = {'diameter': 0.5}
+    mc.shape["B"] = {'diameter': 0.1}
+    sim.operations.add(mc)
+
+    free_volume = hoomd.hpmc.compute.FreeVolume(test_particle_type='B',
+                                                num_samples=10000)
+    assert free_volume.running_free_volume is None
+    sim.operations.add(free_volume)
+    sim.run(0)
+
+    estimates = [free_volume.free_volume]
+    assert free_volume.running_free_volume == pytest.approx(estimates[0])
+    assert free_volume.running_num_samples == 10000
+
+    # the samples of each timestep are added once
+    for i in range(4):
+        sim.run(1)
+        estimates.append(free_volume.free_volume)
+        # a second evaluation at the same timestep adds no samples
+        free_volume.running_free_volume
+    assert free_volume.running_num_samples == 50000
+    assert free_volume.running_free_volume == pytest.approx(
+        np.mean(estimates))
+
+    expected = (7**3) * (1 - (4 / 3) * np.pi * 0.3**3)
+    np.testing.assert_allclose(free_volume.running_free_volume,
+                               expected,
+                               rtol=1e-2)
+
+    free_volume.reset()
+    assert free_volume.running_num_samples == 0
@@ -0,0 +1,102 @@
+import hoomd
+import pytest
+import numpy as np
+
+
+def test_before_attaching():
+    sdf = hoomd.hpmc.compute.SDF(xmax=0.02, dx=1e-4)
+
+    assert sdf.xmax == 0.02
+    assert sdf.dx == 1e-4
+    assert sdf.sdf is None
+    assert sdf.betaP is None
+
+
+def test_lattice(simulation_factory, lattice_snapshot_factory):
+    sim = simulation_factory(lattice_snapshot_factory(n=4, a=1.02))
+    mc = hoomd.hpmc.integrate.Sphere(d=0)
+    mc.shape["A"] = {'diameter': 1.0}
+    sim.operations.add(mc)
+
+    sdf = hoomd.hpmc.compute.SDF(xmax=0.02, dx=1e-4)
+    sim.operations.add(sdf)
+    sim.run(0)
+
+    # every particle touches its neighbors when scaled by 1 - 1/1.02
+    s = sdf.sdf
+    assert s.shape == (200,)
+    assert np.argmax(s) == 196
+    np.testing.assert_allclose(s[196] * sdf.dx, 1)
+    np.testing.assert_allclose(np.delete(s, 196), 0)
+
+    # changing the histogram recomputes the sdf
+    sdf.dx = 2e-4
+    s = sdf.sdf
+    assert s.shape == (100,)
+    assert np.argmax(s) == 98
+
+
+def test_dilute(simulation_factory, lattice_snapshot_factory):
+    sim = simulation_factory(lattice_snapshot_factory(n=4, a=2))
+    mc = hoomd.hpmc.integrate.Sphere(d=0)
+    mc.shape["A"] = {'diameter': 1.0}
+    sim.operations.add(mc)
+
+    sdf = hoomd.hpmc.compute.SDF(xmax=0.02, dx=1e-4)
+    sim.operations.add(sdf)
+    sim.run(0)
+
+    # no particle touches a neighbor, the pressure is that of an ideal gas
+    np.testing.assert_allclose(sdf.sdf, 0)
+    assert sdf.betaP == pytest.approx(1 / 8)
+
+
+def test_loggable(simulation_factory, lattice_snapshot_factory):
+    sim = simulation_factory(lattice_snapshot_factory(n=4, a=1.1))
+    mc = hoomd.hpmc.integrate.Sphere()
+    mc.shape["A"] = {'diameter': 1.0}
+    sim.operations.add(mc)
+
+    sdf = hoomd.hpmc.compute.SDF(xmax=0.02, dx=1e-3)
+    sim.operations.add(sdf)
+    logger = hoomd.logging.Logger(categories=['scalar', 'sequence'])
+    logger.add(sdf, quantities=['sdf', 'betaP'])
+    sim.run(10)
+
+    namespace = logger.log()['hpmc']['compute']['SDF']
+    assert namespace['sdf'][0].shape == (20,)
+    assert namespace['sdf'][1] == 'sequence'
+    assert namespace['betaP'][0] > 0
+    assert namespace['betaP'][1] == 'scalar'
+
+
+def test_invalid_xmax(simulation_factory, lattice_snapshot_factory):
+    sim = simulation_factory(lattice_snapshot_factory(n=4, a=2))
+    mc = hoomd.hpmc.integrate.Sphere()
+    mc.shape["A"] = {'diameter': 1.0}
+    sim.operations.add(mc)
+
+    sdf = hoomd.hpmc.compute.SDF(xmax=1.0, dx=1e-4)
+    sim.operations.add(sdf)
+    with pytest.raises(RuntimeError):
+        sim.run(0)
+
+
+def test_invalid_parameters_after_attaching(simulation_factory,
+                                            lattice_snapshot_factory):
+    sim = simulation_factory(lattice_snapshot_factory(n=4, a=2))
+    mc = hoomd.hpmc.integrate.Sphere()
+    mc.shape["A"] = {'diameter': 1.0}
+    sim.operations.add(mc)
+
+    sdf = hoomd.hpmc.compute.SDF(xmax=0.02, dx=1e-3)
+    sim.operations.add(sdf)
+    sim.run(0)
+
+    with pytest.raises(RuntimeError):
+        sdf.dx = -1e-3
+    assert sdf.dx == 1e-3
+
+    with pytest.raises(RuntimeError):
+        sdf.xmax = 1.0
+    assert sdf.xmax == 0.02
@@ -0,0 +1,59 @@
+import hoomd
+import numpy as np
+import pytest
+
+
+def _run_depletants(simulation_factory, lattice_snapshot_factory,
+                    depletant_cache, steps):
+    snap = lattice_snapshot_factory(particle_types=['A', 'B'],
+                                    dimensions=3,
+                                    a=1.3,
+                                    n=4,
+                                    r=0.1)
+    sim = simulation_factory(snap)
+    sim.seed = 10
+
+    mc = hoomd.hpmc.integrate.Sphere(d=0.1, a=0)
+    mc.shape['A'] = dict(diameter=1.0)
+    mc.shape['B'] = dict(diameter=0.5)
+    mc.depletant_fugacity[('B', 'B')] = 2.0
+    mc.depletant_cache = depletant_cache
+    sim.operations.integrator = mc
+
+    sim.run(steps)
+    return sim, mc
+
+
+def test_depletant_cache_attribute(simulation_factory,
+                                   lattice_snapshot_factory):
+    mc = hoomd.hpmc.integrate.Sphere()
+    assert not mc.depletant_cache
+
+    sim, mc = _run_depletants(simulation_factory, lattice_snapshot_factory,
+                              True, 0)
+    assert mc.depletant_cache
+    mc.depletant_cache = False
+    assert not mc.depletant_cache
+
+
+def test_depletant_cache_trajectory(device, simulation_factory,
+                                    lattice_snapshot_factory):
+    """Test that the cache does not change the sampled trajectory."""
+    if isinstance(device, hoomd.device.GPU):
+        pytest.skip("The depletant cache is only used on the CPU")
+
+    sim_ref, mc_ref = _run_depletants(simulation_factory,
+                                      lattice_snapshot_factory, False, 20)
+    sim, mc = _run_depletants(simulation_factory, lattice_snapshot_factory,
+                              True, 20)
+
+    assert mc.overlaps == 0
+    assert mc.translate_moves == mc_ref.translate_moves
+
+    # the cache only changes the trajectory by round-off
+    snap_ref = sim_ref.state.snapshot
+    snap = sim.state.snapshot
+    if snap.exists:
+        np.testing.assert_allclose(snap.particles.position,
+                                   snap_ref.particles.position,
+                                   atol=1e-6)
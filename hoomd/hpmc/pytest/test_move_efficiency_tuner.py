@@ -0,0 +1,115 @@
+import pytest
+
+from hoomd import hpmc
+from hoomd.tune import ScaleOptimizer
+from hoomd.hpmc.tune.move_efficiency import (
+    _EfficiencyTuneDefinition, MoveEfficiency)
+
+
+@pytest.fixture
+def simulation(simulation_factory, lattice_snapshot_factory):
+    snap = lattice_snapshot_factory(dimensions=2, r=1e-3, n=20)  # 400 particles
+    sim = simulation_factory(snap)
+    integrator = hpmc.integrate.Sphere(d=0.01)
+    integrator.shape['A'] = dict(diameter=0.9)
+    sim.operations.integrator = integrator
+    return sim
+
+
+class Test_EfficiencyTuneDefinition:
+    def test_invalid_attr(self):
+        with pytest.raises(ValueError):
+            _EfficiencyTuneDefinition('f', 'A')
+
+    def test_getting_setting_x(self, simulation):
+        integrator = simulation.operations.integrator
+        d_definition = _EfficiencyTuneDefinition('d', 'A', types=['A'])
+        d_definition.integrator = integrator
+        assert d_definition.x == integrator.d['A']
+        d_definition.x = 0.02
+        assert integrator.d['A'] == 0.02
+
+        nselect_definition = _EfficiencyTuneDefinition('nselect', None,
+                                                       types=['A'])
+        nselect_definition.integrator = integrator
+        nselect_definition.x = 5.4
+        assert integrator.nselect == 5
+
+    def test_getting_efficiency(self, simulation):
+        integrator = simulation.operations.integrator
+        definition = _EfficiencyTuneDefinition('d', 'A', types=['A'])
+        definition.integrator = integrator
+        simulation.operations._schedule()
+        # the first measurement only records the counters
+        assert definition.y is None
+        simulation.run(100)
+        efficiency = definition.y
+        assert efficiency > 0
+        # without new trial moves the efficiency does not change
+        assert definition.y == efficiency
+        definition.reset()
+        assert definition.y is None
+
+    def test_hash(self):
+        definition = _EfficiencyTuneDefinition('d', 'A', (1e-7, None))
+        assert hash(definition) == hash(
+            _EfficiencyTuneDefinition('d', 'A', (1e-7, None)))
+        assert definition == _EfficiencyTuneDefinition('d', 'A', (1e-7, None))
+        assert definition != _EfficiencyTuneDefinition('d', 'B', (1e-7, None))
+
+
+class TestMoveEfficiency:
+    def test_construction(self):
+        tuner = MoveEfficiency(trigger=100,
+                               moves=['d', 'nselect'],
+                               types=['A'],
+                               max_translation_move=0.5,
+                               max_nselect=16)
+        assert tuner.trigger.period == 100
+        assert tuner.moves == ['d', 'nselect']
+        assert tuner.types == ['A']
+        assert tuner.max_translation_move == 0.5
+        assert tuner.max_nselect == 16
+        assert tuner.length_scale == 1.
+        assert isinstance(tuner.solver, ScaleOptimizer)
+
+        with pytest.raises(ValueError):
+            tuner.moves = ['f', 'a']
+        tuner.moves = ['translation_move_probability']
+
+    def test_attach_detach(self, simulation):
+        tuner = MoveEfficiency(trigger=100, moves=['d', 'nselect'])
+        simulation.operations.tuners.append(tuner)
+        simulation.operations._schedule()
+        assert tuner._attached
+        assert tuner.types == ['A']
+        assert [t.attr for t in tuner._tunables] == ['d', 'nselect']
+        assert all(t.integrator is simulation.operations.integrator
+                   for t in tuner._tunables)
+
+        simulation.operations._unschedule()
+        assert not tuner._attached
+        assert all(t.integrator is None for t in tuner._tunables)
+
+    def test_act(self, simulation):
+        integrator = simulation.operations.integrator
+        tuner = MoveEfficiency(trigger=100,
+                               moves=['d', 'nselect'],
+                               max_nselect=16)
+        simulation.operations.tuners.append(tuner)
+        simulation.run(1000)
+        # the tuner starts with d and increases it from the small initial value
+        assert integrator.d['A'] > 0.01
+
+    @pytest.mark.validate
+    def test_tuned(self, simulation):
+        integrator = simulation.operations.integrator
+        tuner = MoveEfficiency(trigger=200, moves=['d', 'nselect'],
+                               max_nselect=16)
+        simulation.operations.tuners.append(tuner)
+        cnt = 0
+        while not tuner.tuned and cnt < 10:
+            simulation.run(4000)
+            cnt += 1
+        assert tuner.tuned
+        assert 1 <= integrator.nselect <= 16
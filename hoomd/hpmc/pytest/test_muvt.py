@@ -19,6 +19,9 @@ valid_constructor_args = [
          volume_move_probability=0.5),
     dict(trigger=hoomd.trigger.After(100),
          transfer_types=['A','B']),
+    dict(trigger=hoomd.trigger.Periodic(10),
+         transfer_types=['A'],
+         multi_insert=True),
 ]
 
 valid_attrs = [
@@ -29,7 +32,8 @@ valid_attrs = [
     ('max_volume_rescale', 0.42),
     ('transfer_types', ['A']),
     ('transfer_types', ['B']),
-    ('transfer_types', ['A','B'])
+    ('transfer_types', ['A','B']),
+    ('multi_insert', True)
 ]
 
 @pytest.mark.serial
@@ -160,3 +164,62 @@ def test_insertion_removal(device, simulation_factory,
 
     # make a wild guess: there be B particles
     assert(muvt.N['B'] > 0)
+
+
+def test_multi_insert(device, simulation_factory, lattice_snapshot_factory):
+    """Test that MuVT attempts one move per active region."""
+    sim = simulation_factory(
+        lattice_snapshot_factory(particle_types=['A', 'B'],
+                                 dimensions=3,
+                                 a=4,
+                                 n=7,
+                                 r=0.1))
+
+    mc = hoomd.hpmc.integrate.Sphere(d=0.1, a=0.1)
+    mc.shape['A'] = dict(diameter=1.1)
+    mc.shape['B'] = dict(diameter=1.3)
+    sim.operations.integrator = mc
+
+    muvt = hoomd.hpmc.update.MuVT(trigger=hoomd.trigger.Periodic(1),
+                                  transfer_types=['B'],
+                                  multi_insert=True)
+    muvt.fugacity['B'] = 1
+    sim.operations.updaters.append(muvt)
+
+    sim.run(10)
+
+    # the 28 wide box holds 20 regions along each direction, one in 8 is active
+    n_moves = sum(muvt.insert_moves) + sum(muvt.remove_moves)
+    assert n_moves > 0
+    assert n_moves % 1000 == 0
+    assert muvt.insert_moves[0] > 0
+    assert muvt.remove_moves[0] > 0
+    assert muvt.N['B'] > 0
+
+
+def test_multi_insert_ideal_gas(device, simulation_factory,
+                                lattice_snapshot_factory):
+    """Test that multi-insertion moves sample the ideal gas density."""
+    sim = simulation_factory(lattice_snapshot_factory(particle_types=['A', 'B'],
+                                                      dimensions=3, a=10, n=1))
+
+    mc = hoomd.hpmc.integrate.Sphere(d=0.1, a=0.1)
+    mc.shape['A'] = dict(diameter=0.1)
+    mc.shape['B'] = dict(diameter=0.1)
+    sim.operations.integrator = mc
+
+    muvt = hoomd.hpmc.update.MuVT(trigger=hoomd.trigger.Periodic(1),
+                                  transfer_types=['B'],
+                                  multi_insert=True)
+    muvt.fugacity['B'] = 0.1
+    sim.operations.updaters.append(muvt)
+
+    sim.run(50)
+
+    n = []
+    for i in range(50):
+        sim.run(1)
+        n.append(muvt.N['B'])
+
+    # <N> = z V for an ideal gas
+    assert abs(np.mean(n) - 100) < 10
@@ -0,0 +1,116 @@
+import hoomd
+import numpy as np
+import pytest
+
+cube_vertices = [(-0.5, -0.5, -0.5), (-0.5, -0.5, 0.5), (-0.5, 0.5, -0.5),
+                 (-0.5, 0.5, 0.5), (0.5, -0.5, -0.5), (0.5, -0.5, 0.5),
+                 (0.5, 0.5, -0.5), (0.5, 0.5, 0.5)]
+
+
+def _run_cubes(simulation_factory, lattice_snapshot_factory,
+               narrow_phase_tiers, steps):
+    snap = lattice_snapshot_factory(dimensions=3, a=1.1, n=4, r=0.05)
+    sim = simulation_factory(snap)
+    sim.seed = 4
+
+    mc = hoomd.hpmc.integrate.ConvexPolyhedron(d=0.1, a=0.1)
+    mc.shape['A'] = dict(vertices=cube_vertices)
+    mc.narrow_phase_tiers = narrow_phase_tiers
+    sim.operations.integrator = mc
+
+    sim.run(steps)
+    return sim, mc
+
+
+def test_narrow_phase_tiers_attribute(simulation_factory,
+                                      lattice_snapshot_factory):
+    mc = hoomd.hpmc.integrate.ConvexPolyhedron()
+    assert not mc.narrow_phase_tiers
+    assert mc.narrow_phase_counts is None
+
+    sim, mc = _run_cubes(simulation_factory, lattice_snapshot_factory, True,
+                         0)
+    assert mc.narrow_phase_tiers
+    assert mc.narrow_phase_counts == (0, 0, 0, 0)
+    mc.narrow_phase_tiers = False
+    assert not mc.narrow_phase_tiers
+
+
+def test_narrow_phase_tiers_trajectory(device, simulation_factory,
+                                       lattice_snapshot_factory):
+    """Test that the tiers do not change the sampled trajectory."""
+    if isinstance(device, hoomd.device.GPU):
+        pytest.skip("The narrow phase tiers are only used on the CPU")
+
+    sim_ref, mc_ref = _run_cubes(simulation_factory, lattice_snapshot_factory,
+                                 False, 20)
+    sim, mc = _run_cubes(simulation_factory, lattice_snapshot_factory, True,
+                         20)
+
+    assert mc.overlaps == 0
+    assert mc.translate_moves == mc_ref.translate_moves
+    assert mc.rotate_moves == mc_ref.rotate_moves
+    assert mc_ref.narrow_phase_counts == (0, 0, 0, 0)
+
+    # every overlap check of the trial moves is settled by exactly one tier
+    counts = mc.narrow_phase_counts
+    assert sum(counts) <= mc.counters.overlap_checks
+    assert counts[0] > 0
+    assert counts[2] + counts[3] > 0
+
+    snap_ref = sim_ref.state.snapshot
+    snap = sim.state.snapshot
+    if snap.exists:
+        np.testing.assert_allclose(snap.particles.position,
+                                   snap_ref.particles.position)
+        np.testing.assert_allclose(snap.particles.orientation,
+                                   snap_ref.particles.orientation)
+
+
+def _run_masked_unions(simulation_factory, lattice_snapshot_factory,
+                       narrow_phase_tiers, steps):
+    # the large central spheres have an empty overlap mask, so only the small
+    # off-center spheres can overlap
+    snap = lattice_snapshot_factory(dimensions=3, a=0.6, n=4)
+    sim = simulation_factory(snap)
+    sim.seed = 4
+
+    mc = hoomd.hpmc.integrate.SphereUnion(d=0.1, a=0.1)
+    mc.shape['A'] = dict(shapes=[dict(diameter=1.0),
+                                 dict(diameter=0.3)],
+                         positions=[(0, 0, 0), (0, 0, 0.4)],
+                         overlap=[0, 1])
+    mc.narrow_phase_tiers = narrow_phase_tiers
+    sim.operations.integrator = mc
+
+    sim.run(steps)
+    return sim, mc
+
+
+def test_narrow_phase_tiers_overlap_mask(device, simulation_factory,
+                                         lattice_snapshot_factory):
+    """Test that the in-sphere tier respects the overlap masks of unions."""
+    if isinstance(device, hoomd.device.GPU):
+        pytest.skip("The narrow phase tiers are only used on the CPU")
+
+    sim_ref, mc_ref = _run_masked_unions(simulation_factory,
+                                         lattice_snapshot_factory, False, 20)
+    sim, mc = _run_masked_unions(simulation_factory, lattice_snapshot_factory,
+                                 True, 20)
+
+    assert mc.overlaps == 0
+    assert mc.translate_moves == mc_ref.translate_moves
+    assert mc.rotate_moves == mc_ref.rotate_moves
+
+    # no pair of members both overlaps and contains the center of its union
+    counts = mc.narrow_phase_counts
+    assert counts[1] == 0
+    assert counts[0] + counts[2] + counts[3] > 0
+
+    snap_ref = sim_ref.state.snapshot
+    snap = sim.state.snapshot
+    if snap.exists:
+        np.testing.assert_allclose(snap.particles.position,
+                                   snap_ref.particles.position)
+        np.testing.assert_allclose(snap.particles.orientation,
+                                   snap_ref.particles.orientation)
@@ -628,3 +628,37 @@ def test_overlaps_sphinx(device, simulation_factory,
         s.particles.position[1] = (0.76, 0, 0)
     sim.state.snapshot = s
     assert mc.overlaps == 0
+
+
+def test_shared_shape_data(device, simulation_factory,
+                           two_particle_snapshot_factory):
+    """Types with identical shapes share the compiled shape data."""
+    mc = hoomd.hpmc.integrate.Polyhedron()
+    mc.shape['A'] = dict(vertices=_cube_verts, faces=_cube_faces)
+    mc.shape['B'] = dict(vertices=_cube_verts, faces=_cube_faces)
+
+    snap = two_particle_snapshot_factory(particle_types=['A', 'B'],
+                                         dimensions=3,
+                                         d=0.9)
+    if snap.exists:
+        snap.particles.typeid[:] = [0, 1]
+    sim = simulation_factory(snap)
+    sim.operations.add(mc)
+    sim.operations._schedule()
+
+    assert mc.overlaps > 0
+    assert mc.type_shapes[0] == mc.type_shapes[1]
+    check_dict(mc.shape['B'], mc.shape['A'])
+
+    # changing the shape of one type leaves the other one unchanged
+    small_cube_verts = [tuple(0.5 * x for x in v) for v in _cube_verts]
+    mc.shape['B'] = dict(vertices=small_cube_verts, faces=_cube_faces)
+    assert mc.overlaps == 0
+    assert mc.type_shapes[0] != mc.type_shapes[1]
+    np.testing.assert_allclose(mc.shape['A']['vertices'], _cube_verts)
+    np.testing.assert_allclose(mc.shape['B']['vertices'], small_cube_verts)
+
+    # restoring the shape
+    mc.shape['B'] = dict(vertices=_cube_verts, faces=_cube_faces)
+    assert mc.overlaps > 0
+    assert mc.type_shapes[0] == mc.type_shapes[1]
@@ -1 +1,2 @@
 from hoomd.hpmc.tune.move_size import MoveSize
+from hoomd.hpmc.tune.move_efficiency import MoveEfficiency
@@ -0,0 +1,346 @@
+import time
+
+from hoomd.custom import _InternalAction
+from hoomd.data.parameterdicts import ParameterDict
+from hoomd.data.typeconverter import (
+    OnlyFrom, OnlyTypes, OnlyIf, to_type_converter)
+from hoomd.tune import _InternalCustomTuner
+from hoomd.tune.attr_tuner import _TuneDefinition, SolverStep, ScaleOptimizer
+from hoomd.hpmc.integrate import HPMCIntegrator
+
+
+class _EfficiencyTuneDefinition(_TuneDefinition):
+    """Encapsulates measuring the efficiency and getting/setting parameters.
+
+    This class should only be used for the _InternalMoveEfficiency class to tune
+    HPMC move parameters. For this class 'x' is the move parameter and 'y' is
+    the efficiency of the trial moves per wall clock second since the last time
+    'y' was evaluated.
+
+    The efficiency of the translation moves is the number of accepted
+    translation moves multiplied by the square of the move size ``d``, which is
+    proportional to the mean square displacement of the particles. Likewise,
+    the efficiency of the rotation moves uses the accepted rotation moves and
+    ``a``. ``nselect`` and ``translation_move_probability`` set the balance
+    between the moves, so their efficiency is the smaller of the translational
+    efficiency in units of ``length_scale`` squared and the rotational
+    efficiency: the slowest decorrelating degree of freedom.
+    """
+    _per_type_attrs = ('a', 'd')
+
+    def __init__(self, attr, type, domain=None, length_scale=1., types=()):
+        if attr not in _InternalMoveEfficiency._available_moves:
+            raise ValueError("Only {} are allowed as tunable "
+                             "attributes.".format(
+                                 _InternalMoveEfficiency._available_moves))
+        self.attr = attr
+        self.type = type
+        self.length_scale = length_scale
+        self.types = tuple(types)
+        self.integrator = None
+        self.previous_counters = None
+        self.previous_time = None
+        self.previous_efficiency = None
+        super().__init__(None, domain)
+
+    def reset(self):
+        """Discard the measurement in progress."""
+        self.previous_counters = None
+        self.previous_time = None
+        self.previous_efficiency = None
+
+    def _mean_square(self, attr):
+        values = getattr(self.integrator, attr)
+        return sum(values[t]**2 for t in self.types) / len(self.types)
+
+    def _get_y(self):
+        counters = (tuple(self.integrator.translate_moves)
+                    + tuple(self.integrator.rotate_moves))
+        now = time.perf_counter()
+
+        # We return None when there is no previous measurement, when a new run
+        # has reset the counters, or when there have been no trial moves since
+        # the last measurement. None informs the `SolverStep` object to skip
+        # tuning this attribute for now.
+        previous_counters, previous_time = (self.previous_counters,
+                                            self.previous_time)
+        if previous_counters is None or any(
+                c < p for c, p in zip(counters, previous_counters)):
+            self.previous_counters = counters
+            self.previous_time = now
+            return None
+
+        delta = [c - p for c, p in zip(counters, previous_counters)]
+        if sum(delta) == 0 or now <= previous_time:
+            return self.previous_efficiency
+
+        elapsed = now - previous_time
+        if self.attr == 'd':
+            efficiency = delta[0] * self._get_x()**2 / elapsed
+        elif self.attr == 'a':
+            efficiency = delta[2] * self._get_x()**2 / elapsed
+        else:
+            efficiencies = []
+            if delta[0] + delta[1] > 0:
+                efficiencies.append(delta[0] * self._mean_square('d') / elapsed
+                                    / self.length_scale**2)
+            if delta[2] + delta[3] > 0:
+                efficiencies.append(delta[2] * self._mean_square('a')
+                                    / elapsed)
+            efficiency = min(efficiencies)
+
+        self.previous_counters = counters
+        self.previous_time = now
+        self.previous_efficiency = efficiency
+        return efficiency
+
+    def _get_x(self):
+        if self.attr in self._per_type_attrs:
+            return getattr(self.integrator, self.attr)[self.type]
+        return getattr(self.integrator, self.attr)
+
+    def _set_x(self, value):
+        if self.attr in self._per_type_attrs:
+            getattr(self.integrator, self.attr)[self.type] = value
+        elif self.attr == 'nselect':
+            self.integrator.nselect = max(int(round(value)), 1)
+        else:
+            setattr(self.integrator, self.attr, value)
+
+    def __hash__(self):
+        return hash((self.attr, self.type, self._domain))
+
+    def __eq__(self, other):
+        return (self.attr == other.attr
+                and self.type == other.type
+                and self._domain == other._domain)
+
+
+class _InternalMoveEfficiency(_InternalAction):
+    """Internal class for the MoveEfficiency tuner."""
+    _min_move_size = 1e-7
+    _available_moves = ('d', 'a', 'nselect', 'translation_move_probability')
+    _translation_move_probability_domain = (0.01, 0.99)
+
+    def __init__(self, moves, solver=None, types=None, length_scale=1.,
+                 max_translation_move=None, max_rotation_move=None,
+                 max_nselect=64):
+        # A flag for knowing when to rebuild the tunables. The postprocessing
+        # runs before the new value is stored, so the tunables are rebuilt
+        # the next time they are needed.
+        def flag_tunables_update(value):
+            self._update_tunables = True
+            return value
+
+        self._tunables = []
+        self._update_tunables = True
+        self._is_attached = False
+        self._integrator = None
+        self._current = 0
+        self._converged = set()
+
+        if solver is None:
+            solver = ScaleOptimizer()
+
+        param_dict = ParameterDict(
+            moves=OnlyIf(to_type_converter([OnlyFrom(self._available_moves)]),
+                         postprocess=flag_tunables_update),
+            types=OnlyIf(to_type_converter([str]),
+                         postprocess=flag_tunables_update,
+                         allow_none=True),
+            solver=SolverStep,
+            length_scale=OnlyTypes(float, postprocess=flag_tunables_update),
+            max_translation_move=OnlyTypes(float,
+                                           postprocess=flag_tunables_update,
+                                           allow_none=True),
+            max_rotation_move=OnlyTypes(float,
+                                        postprocess=flag_tunables_update,
+                                        allow_none=True),
+            max_nselect=OnlyTypes(int, postprocess=flag_tunables_update)
+            )
+
+        self._param_dict.update(param_dict)
+        self.moves = moves
+        self.types = types
+        self.solver = solver
+        self.length_scale = length_scale
+        self.max_translation_move = max_translation_move
+        self.max_rotation_move = max_rotation_move
+        self.max_nselect = max_nselect
+
+    def attach(self, simulation):
+        if not isinstance(simulation.operations.integrator, HPMCIntegrator):
+            raise RuntimeError(
+                "MoveEfficiency can only be used in HPMC simulations.")
+        particle_types = simulation.state.particle_types
+        if self.types is None:
+            self.types = particle_types
+        if not all(t in particle_types for t in self.types):
+            raise RuntimeError(
+                "Invalid particle type found specified types for tuning.")
+        self._integrator = simulation.operations.integrator
+        self._rebuild_tunables()
+        self._is_attached = True
+
+    @property
+    def _attached(self):
+        """bool: Whether or not the tuner is attached to a simulation."""
+        return self._is_attached
+
+    @property
+    def tuned(self):
+        """bool: Whether or not all move parameters have converged."""
+        return (len(self._tunables) > 0
+                and len(self._converged) == len(self._tunables))
+
+    def detach(self):
+        self._integrator = None
+        for tunable in self._tunables:
+            tunable.integrator = None
+            tunable.reset()
+        self._is_attached = False
+
+    def act(self, timestep=None):
+        """Tune the move parameters.
+
+        The tuner optimizes one parameter at a time so that the change in the
+        efficiency between consecutive calls is caused by that parameter
+        alone. When the solver reports that the current parameter converged,
+        the tuner moves on to the next one.
+
+        Args:
+            timestep (:obj:`int`, optional): Current simulation timestep. Is
+                currently ignored.
+        """
+        if not self._is_attached:
+            return
+
+        # changing the attributes restarts the tuning of unconverged parameters
+        if self._update_tunables:
+            self._rebuild_tunables()
+
+        if self.tuned:
+            return
+
+        tunable = self._tunables[self._current]
+        if self.solver.solve([tunable]):
+            self._converged.add(self._current)
+            tunable.reset()
+            remaining = [i for i in range(len(self._tunables))
+                         if i not in self._converged]
+            if len(remaining) > 0:
+                self._current = remaining[0]
+                # start measuring the efficiency of the next parameter now
+                self._tunables[self._current].reset()
+                self._tunables[self._current].y
+
+    def _domain(self, move):
+        if move == 'd':
+            return (self._min_move_size, self.max_translation_move)
+        elif move == 'a':
+            return (self._min_move_size, self.max_rotation_move)
+        elif move == 'nselect':
+            return (1, self.max_nselect)
+        else:
+            return self._translation_move_probability_domain
+
+    def _rebuild_tunables(self):
+        types = self.types if self.types is not None else []
+        tunables = []
+        for move in self.moves:
+            if move in _EfficiencyTuneDefinition._per_type_attrs:
+                move_types = types
+            else:
+                move_types = [None]
+            for move_type in move_types:
+                tunable = _EfficiencyTuneDefinition(move, move_type,
+                                                    self._domain(move),
+                                                    self.length_scale, types)
+                tunable.integrator = self._integrator
+                tunables.append(tunable)
+
+        self._tunables = tunables
+        self._update_tunables = False
+        self._current = 0
+        self._converged = set()
+
+
+class MoveEfficiency(_InternalCustomTuner):
+    """Tunes HPMCIntegrator move parameters to maximize sampling efficiency.
+
+    Args:
+        trigger (hoomd.trigger.Trigger): ``Trigger`` to determine when to run
+            the tuner.
+        moves (list[str]): A list of move parameters to tune. Available
+            options are 'd', 'a', 'nselect', and
+            'translation_move_probability'.
+        solver (`hoomd.tune.SolverStep`): A solver that maximizes the
+            efficiency, defaults to ``None`` which uses a
+            `hoomd.tune.ScaleOptimizer` with the default parameters.
+        types (list[str]): A list of string particle types to tune the move
+            sizes for, defaults to None which upon attaching will tune all types
+            in the system currently.
+        length_scale (float): The distance a particle must move to decorrelate
+            its position, typically the particle diameter, defaults to 1.
+        max_translation_move (float): The maximum value of a translational move
+            size to attempt.
+        max_rotation_move (float): The maximum value of a rotational move size
+            to attempt.
+        max_nselect (int): The maximum value of ``nselect`` to attempt.
+
+    `MoveSize` tunes the move sizes to a target acceptance rate, which is often
+    far from the fastest sampling. `MoveEfficiency` measures the efficiency of
+    the trial moves per wall clock second between consecutive calls and adjusts
+    the move parameters to maximize it:
+
+    * ``d``: The number of accepted translation moves times :math:`d^2`, which
+      is proportional to the mean square displacement of the particles.
+    * ``a``: The number of accepted rotation moves times :math:`a^2`.
+    * ``nselect`` and ``translation_move_probability``: The smaller of the
+      translational efficiency divided by :math:`\\ell^2` (``length_scale``
+      squared) and the rotational efficiency, which is the rate at which the
+      slowest degree of freedom decorrelates.
+
+    Larger ``nselect`` amortizes the cost of each time step over more trial
+    moves and increases the number of moves per second (see
+    `HPMCIntegrator.mps`) until the cost of the trial moves dominates.
+
+    The tuner adjusts one parameter at a time, in the order given by *moves*
+    and *types*, so that each change in efficiency is caused by the parameter
+    under consideration. When the solver reports that the parameter converged,
+    the tuner moves on to the next one. The efficiency is measured in wall
+    clock time, so a trigger period of at least a few hundred steps gives
+    measurements with less noise.
+
+    Attributes:
+        trigger (hoomd.trigger.Trigger): ``Trigger`` to determine when to run
+            the tuner.
+        moves (list[str]): A list of move parameters to tune. Available
+            options are 'd', 'a', 'nselect', and
+            'translation_move_probability'.
+        solver (hoomd.tune.SolverStep): A solver that maximizes the
+            efficiency.
+        types (list[str]): A list of string particle types to tune the move
+            sizes for.
+        length_scale (float): The distance a particle must move to decorrelate
+            its position.
+        max_translation_move (float): The maximum value of a translational move
+            size to attempt.
+        max_rotation_move (float): The maximum value of a rotational move size
+            to attempt.
+        max_nselect (int): The maximum value of ``nselect`` to attempt.
+
+    Note:
+        Changing an attribute restarts the tuning of the parameters that the
+        solver has not converged. Assign a new solver to tune all parameters
+        again. The tuner keeps
+        ``translation_move_probability`` between 0.01 and 0.99 so that both
+        kinds of moves are measured. Only tune it for shapes with orientation
+        degrees of freedom.
+
+    Note:
+        The HPMC move counters are not resolved by particle type, so the
+        efficiency of ``d`` and ``a`` for each type includes the moves of all
+        particles.
+    """
+    _internal_class = _InternalMoveEfficiency
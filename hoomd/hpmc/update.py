@@ -303,9 +303,22 @@ class MuVT(Updater):
         ngibbs (int): The number of partitions to use in Gibbs ensemble simulations (if == 1, perform grand canonical muVT)
         max_volume_rescale (float): maximum step size in ln(V) (applies to Gibbs ensemble)
         move_ratio (float): (if set) Set the ratio between volume and exchange/transfer moves (applies to Gibbs ensemble)
+        multi_insert (bool): Attempt many insertions and removals per step
+            (grand canonical only).
 
     The muVT (or grand-canonical) ensemble simulates a system at constant fugacity.
 
+    By default, `MuVT` attempts one insertion or removal each time it is
+    triggered. When *multi_insert* is `True`, `MuVT` divides the box into a
+    randomly shifted grid of regions at least as wide as the largest particle
+    and attempts one insertion or removal in every other region along each
+    direction (one color of a checkerboard). The particles inserted or removed
+    in different regions cannot interact, so `MuVT` checks the trial moves in
+    parallel threads and accepts each one with the grand-canonical acceptance
+    criterion of its region. This mode is much more efficient in large and
+    dense systems. It does not support the Gibbs ensemble, MPI domain
+    decomposition, patch interactions, or depletants.
+
     Gibbs ensemble simulations are also supported, where particles and volume are swapped between two or more
     boxes.  Every box correspond to one MPI partition, and can therefore run on multiple ranks.
     See ``hoomd.comm`` and the --nrank command line option for how to split a MPI task into partitions.
@@ -320,14 +333,21 @@ class MuVT(Updater):
         max_volume_rescale (float): Maximum step size in ln(V) (applies to Gibbs ensemble)
         move_ratio (float): The ratio between volume and exchange/transfer moves (applies to Gibbs ensemble)
         ntrial (float): (**default**: 1) Number of configurational bias attempts to swap depletants
+        multi_insert (bool): Attempt many insertions and removals per step
+            (grand canonical only).
 
     Example::
 
         TODO: link to example notebooks
 
     """
-    def __init__(self, transfer_types, ngibbs=1, max_volume_rescale=0.1,
-        volume_move_probability=0.5, trigger=1):
+    def __init__(self,
+                 transfer_types,
+                 ngibbs=1,
+                 max_volume_rescale=0.1,
+                 volume_move_probability=0.5,
+                 trigger=1,
+                 multi_insert=False):
         super().__init__(trigger)
 
         self.ngibbs = int(ngibbs)
@@ -336,6 +356,7 @@ class MuVT(Updater):
         param_dict = ParameterDict(transfer_types=list(transfer_types),
                                    max_volume_rescale=float(max_volume_rescale),
                                    volume_move_probability=float(volume_move_probability),
+                                   multi_insert=bool(multi_insert),
                                    **_default_dict)
         self._param_dict.update(param_dict)
 
@@ -525,6 +546,9 @@ class Clusters(Updater):
     .. rubric:: Threading
 
     The `Clusters` updater support threaded execution on multiple CPU cores.
+    The threads check the overlaps of the transformed particles in parallel and
+    merge the overlapping pairs into clusters with a concurrent union-find, so
+    both steps scale with `hoomd.device.Device.num_cpu_threads`.
 
     Attributes:
         pivot_move_ratio (float): Set the ratio between pivot and reflection moves.
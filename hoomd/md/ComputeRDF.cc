@@ -0,0 +1,254 @@
+// Copyright (c) 2009-2021 The Regents of the University of Michigan
+// This file is part of the HOOMD-blue project, released under the BSD 3-Clause License.
+
+
+// Maintainer: joaander
+
+/*! \file ComputeRDF.cc
+    \brief Contains code for the ComputeRDF class
+*/
+
+#include "ComputeRDF.h"
+
+#ifdef ENABLE_MPI
+#include "hoomd/HOOMDMPI.h"
+#endif
+
+#include <pybind11/stl.h>
+
+#include <stdexcept>
+
+using namespace std;
+namespace py = pybind11;
+
+/*! \param sysdef System for which to compute the RDF
+    \param nlist Neighbor list providing the pairs
+    \param r_max Maximum pair distance
+    \param bins Number of histogram bins
+*/
+ComputeRDF::ComputeRDF(std::shared_ptr<SystemDefinition> sysdef,
+                       std::shared_ptr<NeighborList> nlist,
+                       Scalar r_max,
+                       unsigned int bins)
+    : Compute(sysdef), m_nlist(nlist), m_r_max(r_max), m_bins(bins), m_num_frames(0)
+    {
+    m_exec_conf->msg->notice(5) << "Constructing ComputeRDF" << endl;
+
+    assert(m_pdata);
+    assert(m_nlist);
+
+    if (r_max <= Scalar(0.0))
+        throw runtime_error("r_max must be positive");
+    if (bins == 0)
+        throw runtime_error("bins must be positive");
+
+    Index2D type_pair_idx(m_pdata->getNTypes());
+    m_r_cut_nlist = std::make_shared<GlobalArray<Scalar>>(type_pair_idx.getNumElements(), m_exec_conf);
+    updateRCutMatrix();
+    m_nlist->addRCutMatrix(m_r_cut_nlist);
+
+    reset();
+
+    m_pdata->getNumTypesChangeSignal().connect<ComputeRDF, &ComputeRDF::slotNumTypesChange>(this);
+    }
+
+ComputeRDF::~ComputeRDF()
+    {
+    m_exec_conf->msg->notice(5) << "Destroying ComputeRDF" << endl;
+
+    m_pdata->getNumTypesChangeSignal().disconnect<ComputeRDF, &ComputeRDF::slotNumTypesChange>(this);
+    if (m_attached)
+        {
+        m_nlist->removeRCutMatrix(m_r_cut_nlist);
+        }
+    }
+
+void ComputeRDF::updateRCutMatrix()
+    {
+    ArrayHandle<Scalar> h_r_cut_nlist(*m_r_cut_nlist, access_location::host, access_mode::overwrite);
+    for (unsigned int i = 0; i < m_r_cut_nlist->getNumElements(); i++)
+        h_r_cut_nlist.data[i] = m_r_max;
+    }
+
+void ComputeRDF::slotNumTypesChange()
+    {
+    Index2D type_pair_idx(m_pdata->getNTypes());
+    GlobalArray<Scalar> r_cut_nlist(type_pair_idx.getNumElements(), m_exec_conf);
+
+    // the nlist refers to m_r_cut_nlist, copy the new array over
+    *m_r_cut_nlist = r_cut_nlist;
+    updateRCutMatrix();
+
+    reset();
+    }
+
+/*! \param r_max Maximum pair distance
+
+    Changing the range of the histogram clears the accumulated average.
+*/
+void ComputeRDF::setRMax(Scalar r_max)
+    {
+    if (r_max <= Scalar(0.0))
+        throw runtime_error("r_max must be positive");
+
+    m_r_max = r_max;
+    updateRCutMatrix();
+    m_nlist->notifyRCutMatrixChange();
+    reset();
+    }
+
+/*! \param bins Number of histogram bins
+
+    Changing the number of bins clears the accumulated average.
+*/
+void ComputeRDF::setBins(unsigned int bins)
+    {
+    if (bins == 0)
+        throw runtime_error("bins must be positive");
+
+    m_bins = bins;
+    reset();
+    }
+
+void ComputeRDF::reset()
+    {
+    const unsigned int n_types = m_pdata->getNTypes();
+    m_rdf_sum.assign(n_types*n_types*m_bins, 0.0);
+    m_num_frames = 0;
+    }
+
+/*! \param timestep Current time step of the simulation
+
+    Histograms the distances of all ordered pairs (i, j) closer than r_max and normalizes each type pair by the number
+    of pairs an ideal gas of the same density would place in each spherical shell (annulus in 2D).
+*/
+void ComputeRDF::compute(uint64_t timestep)
+    {
+    if (!shouldCompute(timestep))
+        return;
+
+    m_nlist->compute(timestep);
+
+    if (m_prof) m_prof->push("RDF");
+
+    const unsigned int n_types = m_pdata->getNTypes();
+    const unsigned int N = m_pdata->getN();
+    const BoxDim& box = m_pdata->getBox();
+    const Scalar r_max_sq = m_r_max*m_r_max;
+    const Scalar dr = m_r_max / Scalar(m_bins);
+
+    // pair counts by type of i, type of j, and bin, followed by the number of particles of each type
+    std::vector<double> counts(n_types*n_types*m_bins + n_types, 0.0);
+    double* type_counts = &counts[n_types*n_types*m_bins];
+
+        {
+        ArrayHandle<Scalar4> h_pos(m_pdata->getPositions(), access_location::host, access_mode::read);
+        ArrayHandle<unsigned int> h_n_neigh(m_nlist->getNNeighArray(), access_location::host, access_mode::read);
+        ArrayHandle<unsigned int> h_nlist(m_nlist->getNListArray(), access_location::host, access_mode::read);
+        ArrayHandle<unsigned int> h_head_list(m_nlist->getHeadList(), access_location::host, access_mode::read);
+
+        const bool half_nlist = m_nlist->getStorageMode() == NeighborList::half;
+
+        for (unsigned int i = 0; i < N; i++)
+            {
+            const Scalar3 pos_i = make_scalar3(h_pos.data[i].x, h_pos.data[i].y, h_pos.data[i].z);
+            const unsigned int type_i = __scalar_as_int(h_pos.data[i].w);
+            type_counts[type_i] += 1.0;
+
+            const unsigned int head = h_head_list.data[i];
+            const unsigned int n_neigh = h_n_neigh.data[i];
+            for (unsigned int k = 0; k < n_neigh; k++)
+                {
+                const unsigned int j = h_nlist.data[head + k];
+                const Scalar3 pos_j = make_scalar3(h_pos.data[j].x, h_pos.data[j].y, h_pos.data[j].z);
+                const Scalar3 dx = box.minImage(pos_i - pos_j);
+                const Scalar rsq = dot(dx, dx);
+                if (rsq >= r_max_sq)
+                    continue;
+
+                const unsigned int bin = min((unsigned int)(slow::sqrt(rsq) / dr), m_bins - 1);
+                const unsigned int type_j = __scalar_as_int(h_pos.data[j].w);
+                counts[(type_i*n_types + type_j)*m_bins + bin] += 1.0;
+
+                // a half neighbor list stores pairs of local particles only once, count (j, i) as well
+                // pairs with ghost particles are stored and counted on both ranks
+                if (half_nlist && j < N)
+                    counts[(type_j*n_types + type_i)*m_bins + bin] += 1.0;
+                }
+            }
+        }
+
+    #ifdef ENABLE_MPI
+    if (m_pdata->getDomainDecomposition())
+        {
+        MPI_Allreduce(MPI_IN_PLACE, counts.data(), (int)counts.size(), MPI_DOUBLE, MPI_SUM,
+                      m_exec_conf->getMPICommunicator());
+        }
+    #endif
+
+    const bool two_d = m_sysdef->getNDimensions() == 2;
+    const double volume = m_pdata->getGlobalBox().getVolume(two_d);
+
+    for (unsigned int bin = 0; bin < m_bins; bin++)
+        {
+        const double r_lo = bin*dr;
+        const double r_hi = (bin + 1)*dr;
+        double shell_volume;
+        if (two_d)
+            shell_volume = M_PI*(r_hi*r_hi - r_lo*r_lo);
+        else
+            shell_volume = 4.0/3.0*M_PI*(r_hi*r_hi*r_hi - r_lo*r_lo*r_lo);
+
+        for (unsigned int type_a = 0; type_a < n_types; type_a++)
+            {
+            for (unsigned int type_b = 0; type_b < n_types; type_b++)
+                {
+                const double n_pairs = type_counts[type_a]*(type_counts[type_b] - (type_a == type_b ? 1.0 : 0.0));
+                if (n_pairs <= 0.0)
+                    continue;
+
+                const unsigned int idx = (type_a*n_types + type_b)*m_bins + bin;
+                m_rdf_sum[idx] += counts[idx]*volume / (n_pairs*shell_volume);
+                }
+            }
+        }
+
+    m_num_frames++;
+
+    if (m_prof) m_prof->pop();
+    }
+
+/*! \returns The RDF of every ordered type pair averaged over all frames, zero when no frames have been computed.
+*/
+std::vector<Scalar> ComputeRDF::getRDF()
+    {
+    std::vector<Scalar> rdf(m_rdf_sum.size(), Scalar(0.0));
+    if (m_num_frames > 0)
+        {
+        for (unsigned int i = 0; i < m_rdf_sum.size(); i++)
+            rdf[i] = Scalar(m_rdf_sum[i] / m_num_frames);
+        }
+    return rdf;
+    }
+
+std::vector<Scalar> ComputeRDF::getBinCenters()
+    {
+    std::vector<Scalar> centers(m_bins);
+    const Scalar dr = m_r_max / Scalar(m_bins);
+    for (unsigned int bin = 0; bin < m_bins; bin++)
+        centers[bin] = (Scalar(bin) + Scalar(0.5))*dr;
+    return centers;
+    }
+
+void export_ComputeRDF(py::module& m)
+    {
+    py::class_<ComputeRDF, Compute, std::shared_ptr<ComputeRDF> >(m, "ComputeRDF")
+    .def(py::init< std::shared_ptr<SystemDefinition>, std::shared_ptr<NeighborList>, Scalar, unsigned int >())
+    .def_property("r_max", &ComputeRDF::getRMax, &ComputeRDF::setRMax)
+    .def_property("bins", &ComputeRDF::getBins, &ComputeRDF::setBins)
+    .def_property_readonly("rdf", &ComputeRDF::getRDF)
+    .def_property_readonly("bin_centers", &ComputeRDF::getBinCenters)
+    .def_property_readonly("num_frames", &ComputeRDF::getNumFrames)
+    .def("reset", &ComputeRDF::reset)
+    ;
+    }
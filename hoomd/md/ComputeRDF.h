@@ -0,0 +1,115 @@
+// Copyright (c) 2009-2021 The Regents of the University of Michigan
+// This file is part of the HOOMD-blue project, released under the BSD 3-Clause License.
+
+
+// Maintainer: joaander
+
+/*! \file ComputeRDF.h
+    \brief Declares a class for computing radial distribution functions
+*/
+
+#ifdef __HIPCC__
+#error This header cannot be compiled by nvcc
+#endif
+
+#include "hoomd/Compute.h"
+#include "NeighborList.h"
+
+#include <memory>
+#include <vector>
+#include <pybind11/pybind11.h>
+
+#ifndef __COMPUTE_RDF_H__
+#define __COMPUTE_RDF_H__
+
+//! Accumulates the radial distribution function of each pair of particle types
+/*! ComputeRDF histograms the pair distances found in a NeighborList. It registers \a r_max as the cutoff for every
+    type pair with the neighbor list, so sharing the neighbor list with a pair force costs no additional neighbor
+    search when \a r_max is no larger than the force cutoff. Pairs excluded from the neighbor list (e.g. bonded
+    particles) are excluded from the histogram.
+
+    Each call to compute() at a new timestep adds the RDF of the current configuration to a running average. The
+    histogram is normalized per frame (so the box may change between frames) and is summed over all ranks.
+
+    The RDF of types a and b is stored at index (a * n_types + b) * bins + bin of the array returned by getRDF().
+
+    \ingroup computes
+*/
+class PYBIND11_EXPORT ComputeRDF : public Compute
+    {
+    public:
+        //! Constructs the compute
+        ComputeRDF(std::shared_ptr<SystemDefinition> sysdef,
+                   std::shared_ptr<NeighborList> nlist,
+                   Scalar r_max,
+                   unsigned int bins);
+
+        //! Destructor
+        virtual ~ComputeRDF();
+
+        //! Add the RDF at the given timestep to the average
+        virtual void compute(uint64_t timestep);
+
+        //! Get the RDF averaged over all frames
+        std::vector<Scalar> getRDF();
+
+        //! Get the centers of the histogram bins
+        std::vector<Scalar> getBinCenters();
+
+        //! Get the number of frames in the average
+        unsigned int getNumFrames()
+            {
+            return m_num_frames;
+            }
+
+        //! Get the maximum pair distance
+        Scalar getRMax()
+            {
+            return m_r_max;
+            }
+
+        //! Set the maximum pair distance
+        void setRMax(Scalar r_max);
+
+        //! Get the number of bins
+        unsigned int getBins()
+            {
+            return m_bins;
+            }
+
+        //! Set the number of bins
+        void setBins(unsigned int bins);
+
+        //! Clear the accumulated average
+        void reset();
+
+        virtual void notifyDetach()
+            {
+            if (m_attached)
+                {
+                m_nlist->removeRCutMatrix(m_r_cut_nlist);
+                }
+            m_attached = false;
+            }
+
+    protected:
+        std::shared_ptr<NeighborList> m_nlist;  //!< Neighbor list providing the pairs
+        Scalar m_r_max;                         //!< Maximum pair distance
+        unsigned int m_bins;                    //!< Number of histogram bins
+        unsigned int m_num_frames;              //!< Number of frames in the average
+        std::vector<double> m_rdf_sum;          //!< Sum of the RDF over all frames
+
+        std::shared_ptr<GlobalArray<Scalar>> m_r_cut_nlist; //!< Cutoff registered with the neighbor list
+        bool m_attached = true;                 //!< True when the r_cut matrix is registered with the neighbor list
+
+        //! Set all elements of the r_cut matrix to m_r_max
+        void updateRCutMatrix();
+
+        //! Resize the arrays when the number of types changes
+        void slotNumTypesChange();
+    };
+
+//! Exports the ComputeRDF class to python
+void export_ComputeRDF(pybind11::module& m);
+
+#endif
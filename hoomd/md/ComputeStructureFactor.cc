@@ -0,0 +1,336 @@
+// Copyright (c) 2009-2021 The Regents of the University of Michigan
+// This file is part of the HOOMD-blue project, released under the BSD 3-Clause License.
+
+
+// Maintainer: joaander
+
+/*! \file ComputeStructureFactor.cc
+    \brief Contains code for the ComputeStructureFactor class
+*/
+
+#include "ComputeStructureFactor.h"
+#include "hoomd/VectorMath.h"
+
+#ifdef ENABLE_MPI
+#include "hoomd/HOOMDMPI.h"
+#endif
+
+#include <pybind11/stl.h>
+
+#include <cmath>
+#include <cstring>
+#include <stdexcept>
+
+using namespace std;
+namespace py = pybind11;
+
+/*! \param sysdef System for which to compute S(q)
+    \param resolution Number of mesh points in each direction
+    \param q_max Maximum wave number
+    \param bins Number of histogram bins
+*/
+ComputeStructureFactor::ComputeStructureFactor(std::shared_ptr<SystemDefinition> sysdef,
+                                               std::tuple<unsigned int, unsigned int, unsigned int> resolution,
+                                               Scalar q_max,
+                                               unsigned int bins)
+    : Compute(sysdef), m_q_max(q_max), m_bins(bins), m_num_frames(0)
+    {
+    m_exec_conf->msg->notice(5) << "Constructing ComputeStructureFactor" << endl;
+
+    if (q_max <= Scalar(0.0))
+        throw runtime_error("q_max must be positive");
+    if (bins == 0)
+        throw runtime_error("bins must be positive");
+
+    setResolution(resolution);
+    }
+
+ComputeStructureFactor::~ComputeStructureFactor()
+    {
+    m_exec_conf->msg->notice(5) << "Destroying ComputeStructureFactor" << endl;
+
+    if (m_kiss_fft)
+        {
+        kiss_fft_free(m_kiss_fft);
+        kiss_fft_cleanup();
+        }
+    }
+
+/*! \param resolution Number of mesh points in each direction
+
+    Changing the mesh clears the accumulated average.
+*/
+void ComputeStructureFactor::setResolution(std::tuple<unsigned int, unsigned int, unsigned int> resolution)
+    {
+    uint3 mesh_points = make_uint3(std::get<0>(resolution), std::get<1>(resolution), std::get<2>(resolution));
+    if (mesh_points.x == 0 || mesh_points.y == 0 || mesh_points.z == 0)
+        throw runtime_error("The mesh resolution must be positive");
+    if (m_sysdef->getNDimensions() == 2 && mesh_points.z != 1)
+        throw runtime_error("The mesh resolution in z must be 1 in 2D simulations");
+
+    m_mesh_points = mesh_points;
+    initializeFFT();
+    reset();
+    }
+
+/*! \param q_max Maximum wave number
+
+    Changing the range of the histogram clears the accumulated average.
+*/
+void ComputeStructureFactor::setQMax(Scalar q_max)
+    {
+    if (q_max <= Scalar(0.0))
+        throw runtime_error("q_max must be positive");
+
+    m_q_max = q_max;
+    reset();
+    }
+
+/*! \param bins Number of histogram bins
+
+    Changing the number of bins clears the accumulated average.
+*/
+void ComputeStructureFactor::setBins(unsigned int bins)
+    {
+    if (bins == 0)
+        throw runtime_error("bins must be positive");
+
+    m_bins = bins;
+    reset();
+    }
+
+void ComputeStructureFactor::reset()
+    {
+    m_sq_sum.assign(m_bins, 0.0);
+    m_num_frames = 0;
+    }
+
+void ComputeStructureFactor::initializeFFT()
+    {
+    unsigned int n_cells = m_mesh_points.x*m_mesh_points.y*m_mesh_points.z;
+
+    GlobalArray<kiss_fft_cpx> mesh(n_cells, m_exec_conf);
+    m_mesh.swap(mesh);
+
+    GlobalArray<kiss_fft_cpx> fourier_mesh(n_cells, m_exec_conf);
+    m_fourier_mesh.swap(fourier_mesh);
+
+    if (m_kiss_fft)
+        kiss_fft_free(m_kiss_fft);
+
+    int dims[3];
+    dims[0] = m_mesh_points.z;
+    dims[1] = m_mesh_points.y;
+    dims[2] = m_mesh_points.x;
+    m_kiss_fft = kiss_fftnd_alloc(dims, 3, 0, NULL, NULL);
+    }
+
+void ComputeStructureFactor::assignParticles()
+    {
+    ArrayHandle<Scalar4> h_postype(m_pdata->getPositions(), access_location::host, access_mode::read);
+    ArrayHandle<kiss_fft_cpx> h_mesh(m_mesh, access_location::host, access_mode::overwrite);
+
+    const BoxDim& global_box = m_pdata->getGlobalBox();
+    Index3D mesh_idx(m_mesh_points.x, m_mesh_points.y, m_mesh_points.z);
+
+    // set mesh to zero
+    memset(h_mesh.data, 0, sizeof(kiss_fft_cpx)*m_mesh.getNumElements());
+
+    for (unsigned int idx = 0; idx < m_pdata->getN(); idx++)
+        {
+        Scalar4 postype = h_postype.data[idx];
+        Scalar3 pos = make_scalar3(postype.x, postype.y, postype.z);
+
+        // compute coordinates in units of the mesh size
+        Scalar3 f = global_box.makeFraction(pos);
+        Scalar3 reduced_pos = make_scalar3(f.x * (Scalar) m_mesh_points.x,
+                                           f.y * (Scalar) m_mesh_points.y,
+                                           f.z * (Scalar) m_mesh_points.z);
+
+        // cloud-in-cell weights of the two nearest mesh points in each direction
+        int i0[3];
+        Scalar w1[3];
+        Scalar r[3] = {reduced_pos.x, reduced_pos.y, reduced_pos.z};
+        for (unsigned int d = 0; d < 3; d++)
+            {
+            Scalar cell = floor(r[d]);
+            i0[d] = int(cell);
+            w1[d] = r[d] - cell;
+            }
+
+        for (unsigned int k = 0; k < 2; k++)
+            {
+            unsigned int iz = (i0[2] + k + m_mesh_points.z) % m_mesh_points.z;
+            Scalar wz = k ? w1[2] : Scalar(1.0) - w1[2];
+            for (unsigned int j = 0; j < 2; j++)
+                {
+                unsigned int iy = (i0[1] + j + m_mesh_points.y) % m_mesh_points.y;
+                Scalar wy = j ? w1[1] : Scalar(1.0) - w1[1];
+                for (unsigned int i = 0; i < 2; i++)
+                    {
+                    unsigned int ix = (i0[0] + i + m_mesh_points.x) % m_mesh_points.x;
+                    Scalar wx = i ? w1[0] : Scalar(1.0) - w1[0];
+                    h_mesh.data[mesh_idx(ix, iy, iz)].r += kiss_fft_scalar(wx*wy*wz);
+                    }
+                }
+            }
+        }
+    }
+
+/*! \param sq Receives S(q) averaged over the wave vectors in each bin (0 in bins without any wave vector)
+*/
+void ComputeStructureFactor::computeStructureFactor(std::vector<double>& sq)
+    {
+    ArrayHandle<kiss_fft_cpx> h_mesh(m_mesh, access_location::host, access_mode::read);
+    ArrayHandle<kiss_fft_cpx> h_fourier_mesh(m_fourier_mesh, access_location::host, access_mode::overwrite);
+
+    kiss_fftnd(m_kiss_fft, h_mesh.data, h_fourier_mesh.data);
+
+    // reciprocal lattice vectors of the global box
+    const BoxDim& global_box = m_pdata->getGlobalBox();
+    vec3<Scalar> a1(global_box.getLatticeVector(0));
+    vec3<Scalar> a2(global_box.getLatticeVector(1));
+    vec3<Scalar> a3(global_box.getLatticeVector(2));
+    Scalar V_box = dot(a1, cross(a2, a3));
+    vec3<Scalar> b1 = Scalar(2.0*M_PI)/V_box*cross(a2, a3);
+    vec3<Scalar> b2 = Scalar(2.0*M_PI)/V_box*cross(a3, a1);
+    vec3<Scalar> b3 = Scalar(2.0*M_PI)/V_box*cross(a1, a2);
+
+    Index3D mesh_idx(m_mesh_points.x, m_mesh_points.y, m_mesh_points.z);
+    const Scalar dq = m_q_max / Scalar(m_bins);
+    const double N_global = double(m_pdata->getNGlobal());
+
+    std::vector<unsigned int> n_modes(m_bins, 0);
+    sq.assign(m_bins, 0.0);
+
+    for (unsigned int iz = 0; iz < m_mesh_points.z; iz++)
+        {
+        int n3 = (iz > m_mesh_points.z/2) ? int(iz) - int(m_mesh_points.z) : int(iz);
+        for (unsigned int iy = 0; iy < m_mesh_points.y; iy++)
+            {
+            int n2 = (iy > m_mesh_points.y/2) ? int(iy) - int(m_mesh_points.y) : int(iy);
+            for (unsigned int ix = 0; ix < m_mesh_points.x; ix++)
+                {
+                int n1 = (ix > m_mesh_points.x/2) ? int(ix) - int(m_mesh_points.x) : int(ix);
+                if (n1 == 0 && n2 == 0 && n3 == 0)
+                    continue;
+
+                vec3<Scalar> q = Scalar(n1)*b1 + Scalar(n2)*b2 + Scalar(n3)*b3;
+                Scalar q_len = slow::sqrt(dot(q, q));
+                if (q_len >= m_q_max)
+                    continue;
+
+                // square of the cloud-in-cell assignment window
+                double window = 1.0;
+                int n[3] = {n1, n2, n3};
+                unsigned int points[3] = {m_mesh_points.x, m_mesh_points.y, m_mesh_points.z};
+                for (unsigned int d = 0; d < 3; d++)
+                    {
+                    if (n[d] != 0)
+                        {
+                        double arg = M_PI*n[d]/points[d];
+                        double sinc = sin(arg)/arg;
+                        window *= sinc*sinc;
+                        }
+                    }
+
+                kiss_fft_cpx rho = h_fourier_mesh.data[mesh_idx(ix, iy, iz)];
+                double power = (double(rho.r)*rho.r + double(rho.i)*rho.i) / (window*window);
+
+                unsigned int bin = min((unsigned int)(q_len / dq), m_bins - 1);
+                sq[bin] += power / N_global;
+                n_modes[bin]++;
+                }
+            }
+        }
+
+    for (unsigned int bin = 0; bin < m_bins; bin++)
+        {
+        if (n_modes[bin] > 0)
+            sq[bin] /= n_modes[bin];
+        }
+    }
+
+/*! \param timestep Current time step of the simulation
+*/
+void ComputeStructureFactor::compute(uint64_t timestep)
+    {
+    if (!shouldCompute(timestep))
+        return;
+
+    if (m_prof) m_prof->push("Structure factor");
+
+    assignParticles();
+
+    std::vector<double> sq(m_bins, 0.0);
+
+    #ifdef ENABLE_MPI
+    if (m_pdata->getDomainDecomposition())
+        {
+            {
+            ArrayHandle<kiss_fft_cpx> h_mesh(m_mesh, access_location::host, access_mode::readwrite);
+            int n_values = int(2*m_mesh.getNumElements());
+            if (m_exec_conf->isRoot())
+                MPI_Reduce(MPI_IN_PLACE, h_mesh.data, n_values, MPI_FLOAT, MPI_SUM, 0,
+                           m_exec_conf->getMPICommunicator());
+            else
+                MPI_Reduce(h_mesh.data, NULL, n_values, MPI_FLOAT, MPI_SUM, 0,
+                           m_exec_conf->getMPICommunicator());
+            }
+
+        if (m_exec_conf->isRoot())
+            computeStructureFactor(sq);
+
+        MPI_Bcast(sq.data(), int(m_bins), MPI_DOUBLE, 0, m_exec_conf->getMPICommunicator());
+        }
+    else
+    #endif
+        {
+        computeStructureFactor(sq);
+        }
+
+    for (unsigned int bin = 0; bin < m_bins; bin++)
+        m_sq_sum[bin] += sq[bin];
+    m_num_frames++;
+
+    if (m_prof) m_prof->pop();
+    }
+
+/*! \returns S(q) averaged over all frames, zero when no frames have been computed.
+*/
+std::vector<Scalar> ComputeStructureFactor::getStructureFactor()
+    {
+    std::vector<Scalar> sq(m_bins, Scalar(0.0));
+    if (m_num_frames > 0)
+        {
+        for (unsigned int bin = 0; bin < m_bins; bin++)
+            sq[bin] = Scalar(m_sq_sum[bin] / m_num_frames);
+        }
+    return sq;
+    }
+
+std::vector<Scalar> ComputeStructureFactor::getBinCenters()
+    {
+    std::vector<Scalar> centers(m_bins);
+    const Scalar dq = m_q_max / Scalar(m_bins);
+    for (unsigned int bin = 0; bin < m_bins; bin++)
+        centers[bin] = (Scalar(bin) + Scalar(0.5))*dq;
+    return centers;
+    }
+
+void export_ComputeStructureFactor(py::module& m)
+    {
+    py::class_<ComputeStructureFactor, Compute, std::shared_ptr<ComputeStructureFactor> >(m, "ComputeStructureFactor")
+    .def(py::init< std::shared_ptr<SystemDefinition>,
+                   std::tuple<unsigned int, unsigned int, unsigned int>,
+                   Scalar,
+                   unsigned int >())
+    .def_property("resolution", &ComputeStructureFactor::getResolution, &ComputeStructureFactor::setResolution)
+    .def_property("q_max", &ComputeStructureFactor::getQMax, &ComputeStructureFactor::setQMax)
+    .def_property("bins", &ComputeStructureFactor::getBins, &ComputeStructureFactor::setBins)
+    .def_property_readonly("structure_factor", &ComputeStructureFactor::getStructureFactor)
+    .def_property_readonly("bin_centers", &ComputeStructureFactor::getBinCenters)
+    .def_property_readonly("num_frames", &ComputeStructureFactor::getNumFrames)
+    .def("reset", &ComputeStructureFactor::reset)
+    ;
+    }
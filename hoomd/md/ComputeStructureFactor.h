@@ -0,0 +1,118 @@
+// Copyright (c) 2009-2021 The Regents of the University of Michigan
+// This file is part of the HOOMD-blue project, released under the BSD 3-Clause License.
+
+
+// Maintainer: joaander
+
+/*! \file ComputeStructureFactor.h
+    \brief Declares a class for computing the static structure factor
+*/
+
+#ifdef __HIPCC__
+#error This header cannot be compiled by nvcc
+#endif
+
+#include "hoomd/Compute.h"
+#include "hoomd/extern/kiss_fftnd.h"
+
+#include <memory>
+#include <tuple>
+#include <vector>
+#include <pybind11/pybind11.h>
+
+#ifndef __COMPUTE_STRUCTURE_FACTOR_H__
+#define __COMPUTE_STRUCTURE_FACTOR_H__
+
+//! Accumulates the static structure factor S(q) of all particles
+/*! ComputeStructureFactor assigns the particles to a mesh spanning the global box with cloud-in-cell weights, takes
+    the FFT of the density with KISS FFT (as PPPMForceCompute does), and averages |rho(q)|^2 / N over all reciprocal
+    lattice vectors in each bin of |q| < q_max. The power is divided by the square of the assignment window, which
+    makes the result accurate for q well below the Nyquist wave number of the mesh.
+
+    With domain decomposition, the ranks reduce their meshes to the root rank, which performs the FFT and broadcasts
+    S(q). Each call to compute() at a new timestep adds S(q) of the current configuration to a running average.
+
+    \ingroup computes
+*/
+class PYBIND11_EXPORT ComputeStructureFactor : public Compute
+    {
+    public:
+        //! Constructs the compute
+        ComputeStructureFactor(std::shared_ptr<SystemDefinition> sysdef,
+                               std::tuple<unsigned int, unsigned int, unsigned int> resolution,
+                               Scalar q_max,
+                               unsigned int bins);
+
+        //! Destructor
+        virtual ~ComputeStructureFactor();
+
+        //! Add S(q) at the given timestep to the average
+        virtual void compute(uint64_t timestep);
+
+        //! Get S(q) averaged over all frames
+        std::vector<Scalar> getStructureFactor();
+
+        //! Get the centers of the histogram bins
+        std::vector<Scalar> getBinCenters();
+
+        //! Get the number of frames in the average
+        unsigned int getNumFrames()
+            {
+            return m_num_frames;
+            }
+
+        //! Get the number of mesh points in each direction
+        std::tuple<unsigned int, unsigned int, unsigned int> getResolution()
+            {
+            return std::make_tuple(m_mesh_points.x, m_mesh_points.y, m_mesh_points.z);
+            }
+
+        //! Set the number of mesh points in each direction
+        void setResolution(std::tuple<unsigned int, unsigned int, unsigned int> resolution);
+
+        //! Get the maximum wave number
+        Scalar getQMax()
+            {
+            return m_q_max;
+            }
+
+        //! Set the maximum wave number
+        void setQMax(Scalar q_max);
+
+        //! Get the number of bins
+        unsigned int getBins()
+            {
+            return m_bins;
+            }
+
+        //! Set the number of bins
+        void setBins(unsigned int bins);
+
+        //! Clear the accumulated average
+        void reset();
+
+    protected:
+        uint3 m_mesh_points;                    //!< Number of mesh points in each direction
+        Scalar m_q_max;                         //!< Maximum wave number
+        unsigned int m_bins;                    //!< Number of histogram bins
+        unsigned int m_num_frames;              //!< Number of frames in the average
+        std::vector<double> m_sq_sum;           //!< Sum of S(q) over all frames
+
+        kiss_fftnd_cfg m_kiss_fft=NULL;         //!< The FFT configuration
+        GlobalArray<kiss_fft_cpx> m_mesh;           //!< The particle density mesh
+        GlobalArray<kiss_fft_cpx> m_fourier_mesh;   //!< The Fourier transformed mesh
+
+        //! Allocate the meshes and set up the FFT
+        void initializeFFT();
+
+        //! Assign the local particles to the mesh
+        void assignParticles();
+
+        //! Compute S(q) of the current configuration from the density mesh
+        void computeStructureFactor(std::vector<double>& sq);
+    };
+
+//! Exports the ComputeStructureFactor class to python
+void export_ComputeStructureFactor(pybind11::module& m);
+
+#endif
@@ -18,6 +18,7 @@
 
 namespace py = pybind11;
 
+#include <algorithm>
 #include <iostream>
 using namespace std;
 
@@ -66,10 +67,7 @@ ComputeThermo::ComputeThermo(std::shared_ptr<SystemDefinition> sysdef,
     m_logname_list.push_back(string("pressure_zz") + suffix);
 
     m_computed_flags.reset();
-
-    #ifdef ENABLE_MPI
-    m_properties_reduced = true;
-    #endif
+    m_computed_quantities = 0;
     }
 
 ComputeThermo::~ComputeThermo()
@@ -77,7 +75,9 @@ ComputeThermo::~ComputeThermo()
     m_exec_conf->msg->notice(5) << "Destroying ComputeThermo" << endl;
     }
 
-/*! Calls computeProperties if the properties need updating
+/*! Marks the computed properties as stale if the timestep changed. The properties themselves are computed on demand
+    by the accessors.
+
     \param timestep Current time step of the simulation
 */
 void ComputeThermo::compute(uint64_t timestep)
@@ -85,11 +85,44 @@ void ComputeThermo::compute(uint64_t timestep)
     Compute::compute(timestep);
     if (shouldCompute(timestep))
         {
-        computeProperties();
+        m_computed_quantities = 0;
         m_computed_flags = m_pdata->getFlags();
         }
     }
 
+/*! \param other Compute to fuse with this one
+
+    Both computes must act on the same system. Fusing is one-directional: call addFusedCompute() on \a other as well
+    so that it also computes the quantities of this compute.
+*/
+void ComputeThermo::addFusedCompute(std::shared_ptr<ComputeThermo> other)
+    {
+    if (other.get() == this)
+        return;
+
+    if (other->m_sysdef != m_sysdef)
+        {
+        throw std::runtime_error("Cannot fuse thermodynamic computes that act on different systems.");
+        }
+
+    removeFusedCompute(other);
+    m_fused_computes.push_back(other);
+    }
+
+/*! \param other Compute to remove from the fused set
+*/
+void ComputeThermo::removeFusedCompute(std::shared_ptr<ComputeThermo> other)
+    {
+    m_fused_computes.erase(std::remove_if(m_fused_computes.begin(),
+                                          m_fused_computes.end(),
+                                          [other](const std::weak_ptr<ComputeThermo>& weak)
+                                              {
+                                              auto compute = weak.lock();
+                                              return !compute || compute == other;
+                                              }),
+                           m_fused_computes.end());
+    }
+
 std::vector< std::string > ComputeThermo::getProvidedLogQuantities()
     {
     if (m_logging_enabled)
@@ -184,230 +217,291 @@ Scalar ComputeThermo::getLogValue(const std::string& quantity, uint64_t timestep
         }
     }
 
-/*! Computes all thermodynamic properties of the system in one fell swoop.
+namespace
+    {
+//! Partial sums accumulated for a single ComputeThermo
+struct ThermoSums
+    {
+    double ke_trans;        //!< Translational kinetic energy (times 2)
+    double ke_rot;          //!< Rotational kinetic energy (times 2)
+    double pe;              //!< Potential energy
+    double pressure_kinetic[6]; //!< Kinetic part of the pressure tensor
+    double virial[6];       //!< Virial tensor
+
+    //! Number of values in the struct, for MPI reductions
+    static const unsigned int size = 15;
+    };
+    }
+
+/*! \param quantities Bitwise or of the thermo_quantity flags to compute
+    \returns The quantities that were computed
+
+    Computes the requested quantities for this compute and for every fused compute that has been computed at a
+    different timestep or is missing any of them. All computes share one pass over the particle data and one MPI
+    reduction.
 */
-void ComputeThermo::computeProperties()
+unsigned int ComputeThermo::computeProperties(unsigned int quantities)
     {
-    // just drop out if the group is an empty group
-    if (m_group->getNumMembersGlobal() == 0)
-        return;
+    // the pressure tensor is only available when the particle data flags are set
+    if (!m_computed_flags[pdata_flag::pressure_tensor])
+        quantities &= ~thermo_quantity::pressure_tensor;
+    // rotational kinetic energy is zero unless the particle data flags are set
+    const bool compute_rot = m_computed_flags[pdata_flag::rotational_kinetic_energy];
+
+    // collect the computes that take part in this pass
+    std::vector<ComputeThermo*> computes(1, this);
+    for (auto& weak : m_fused_computes)
+        {
+        auto other = weak.lock();
+        if (!other)
+            continue;
 
-    unsigned int group_size = m_group->getNumMembers();
+        other->compute(m_last_computed);
+        if ((other->m_computed_quantities & quantities) != quantities
+            && other->m_computed_flags == m_computed_flags)
+            {
+            computes.push_back(other.get());
+            }
+        }
+
+    const unsigned int n_computes = (unsigned int)computes.size();
+    std::vector<ThermoSums> sums(n_computes, ThermoSums());
 
     if (m_prof) m_prof->push("Thermo");
 
     assert(m_pdata);
 
+    // the group accessors may rebuild the groups, which accesses the tag array, so call them before the particle
+    // data is accessed below
+    unsigned int group_size = 0;
+    const GlobalArray<unsigned int>* index_array = nullptr;
+    std::vector< const GlobalArray<unsigned int>* > member_flag_arrays;
+    if (n_computes == 1)
+        {
+        group_size = m_group->getNumMembers();
+        index_array = &m_group->getIndexArray();
+        }
+    else
+        {
+        for (auto compute : computes)
+            member_flag_arrays.push_back(&compute->m_group->getMemberFlagArray());
+        }
+
+    {
     // access the particle data
     ArrayHandle<Scalar4> h_vel(m_pdata->getVelocities(), access_location::host, access_mode::read);
     ArrayHandle<unsigned int> h_body(m_pdata->getBodies(), access_location::host, access_mode::read);
     ArrayHandle<unsigned int> h_tag(m_pdata->getTags(), access_location::host, access_mode::read);
+    ArrayHandle<Scalar4> h_orientation(m_pdata->getOrientationArray(), access_location::host, access_mode::read);
+    ArrayHandle<Scalar4> h_angmom(m_pdata->getAngularMomentumArray(), access_location::host, access_mode::read);
+    ArrayHandle<Scalar3> h_inertia(m_pdata->getMomentsOfInertiaArray(), access_location::host, access_mode::read);
 
     // access the net force, pe, and virial
-    const GlobalArray< Scalar4 >& net_force = m_pdata->getNetForce();
     const GlobalArray< Scalar >& net_virial = m_pdata->getNetVirial();
-    ArrayHandle<Scalar4> h_net_force(net_force, access_location::host, access_mode::read);
+    ArrayHandle<Scalar4> h_net_force(m_pdata->getNetForce(), access_location::host, access_mode::read);
     ArrayHandle<Scalar> h_net_virial(net_virial, access_location::host, access_mode::read);
+    size_t virial_pitch = net_virial.getPitch();
 
-    // total kinetic energy
-    double ke_trans_total = 0.0;
+    // compute the contributions of particle j once and add them to the given partial sums
+    auto accumulate = [&](unsigned int j, ThermoSums& s)
+        {
+        // ignore rigid body constituent particles in the sum
+        if (!(h_body.data[j] >= MIN_FLOPPY || h_body.data[j] == h_tag.data[j]))
+            return;
 
-    PDataFlags flags = m_pdata->getFlags();
+        const Scalar4 vel = h_vel.data[j];
+        const double mass = vel.w;
 
-    double pressure_kinetic_xx = 0.0;
-    double pressure_kinetic_xy = 0.0;
-    double pressure_kinetic_xz = 0.0;
-    double pressure_kinetic_yy = 0.0;
-    double pressure_kinetic_yz = 0.0;
-    double pressure_kinetic_zz = 0.0;
+        if (quantities & thermo_quantity::pressure_tensor)
+            {
+            s.pressure_kinetic[0] += mass*((double)vel.x * (double)vel.x);
+            s.pressure_kinetic[1] += mass*((double)vel.x * (double)vel.y);
+            s.pressure_kinetic[2] += mass*((double)vel.x * (double)vel.z);
+            s.pressure_kinetic[3] += mass*((double)vel.y * (double)vel.y);
+            s.pressure_kinetic[4] += mass*((double)vel.y * (double)vel.z);
+            s.pressure_kinetic[5] += mass*((double)vel.z * (double)vel.z);
+
+            for (unsigned int k = 0; k < 6; k++)
+                s.virial[k] += (double)h_net_virial.data[j+k*virial_pitch];
+            }
+        else if (quantities & thermo_quantity::translational_kinetic_energy)
+            {
+            s.ke_trans += mass*((double)vel.x * (double)vel.x
+                                + (double)vel.y * (double)vel.y
+                                + (double)vel.z * (double)vel.z);
+            }
 
-    if (flags[pdata_flag::pressure_tensor])
-        {
-        // Calculate kinetic part of pressure tensor
-        for (unsigned int group_idx = 0; group_idx < group_size; group_idx++)
+        if ((quantities & thermo_quantity::rotational_kinetic_energy) && compute_rot)
             {
-            unsigned int j = m_group->getMemberIndex(group_idx);
-            // ignore rigid body constituent particles in the sum
-            if (h_body.data[j] >= MIN_FLOPPY || h_body.data[j] == h_tag.data[j])
+            Scalar3 I = h_inertia.data[j];
+            quat<Scalar> q(h_orientation.data[j]);
+            quat<Scalar> p(h_angmom.data[j]);
+            quat<Scalar> spin(Scalar(0.5)*conj(q)*p);
+
+            // only if the moment of inertia along one principal axis is non-zero, that axis carries angular momentum
+            if (I.x >= EPSILON)
+                {
+                s.ke_rot += spin.v.x*spin.v.x/I.x;
+                }
+            if (I.y >= EPSILON)
                 {
-                double mass = h_vel.data[j].w;
-                pressure_kinetic_xx += mass*(  (double)h_vel.data[j].x * (double)h_vel.data[j].x );
-                pressure_kinetic_xy += mass*(  (double)h_vel.data[j].x * (double)h_vel.data[j].y );
-                pressure_kinetic_xz += mass*(  (double)h_vel.data[j].x * (double)h_vel.data[j].z );
-                pressure_kinetic_yy += mass*(  (double)h_vel.data[j].y * (double)h_vel.data[j].y );
-                pressure_kinetic_yz += mass*(  (double)h_vel.data[j].y * (double)h_vel.data[j].z );
-                pressure_kinetic_zz += mass*(  (double)h_vel.data[j].z * (double)h_vel.data[j].z );
+                s.ke_rot += spin.v.y*spin.v.y/I.y;
+                }
+            if (I.z >= EPSILON)
+                {
+                s.ke_rot += spin.v.z*spin.v.z/I.z;
                 }
             }
-        // kinetic energy = 1/2 trace of kinetic part of pressure tensor
-        ke_trans_total = Scalar(0.5)*(pressure_kinetic_xx + pressure_kinetic_yy + pressure_kinetic_zz);
-        }
-    else
+
+        if (quantities & thermo_quantity::potential_energy)
+            {
+            s.pe += (double)h_net_force.data[j].w;
+            }
+        };
+
+    if (n_computes == 1)
         {
-        // total kinetic energy
+        // a single group only needs to visit its own members
+        ArrayHandle<unsigned int> h_index(*index_array, access_location::host, access_mode::read);
         for (unsigned int group_idx = 0; group_idx < group_size; group_idx++)
             {
-            unsigned int j = m_group->getMemberIndex(group_idx);
-            // ignore rigid body constituent particles in the sum
-            if (h_body.data[j] >= MIN_FLOPPY || h_body.data[j] == h_tag.data[j])
-                {
-                ke_trans_total += (double)h_vel.data[j].w*( (double)h_vel.data[j].x * (double)h_vel.data[j].x
-                                                    + (double)h_vel.data[j].y * (double)h_vel.data[j].y
-                                                    + (double)h_vel.data[j].z * (double)h_vel.data[j].z);
-                }
+            accumulate(h_index.data[group_idx], sums[0]);
             }
-
-        ke_trans_total *= Scalar(0.5);
         }
-
-    // total rotational kinetic energy
-    double ke_rot_total = 0.0;
-
-    if (flags[pdata_flag::rotational_kinetic_energy])
+    else
         {
-        // Calculate rotational part of kinetic energy
-        ArrayHandle<Scalar4> h_orientation(m_pdata->getOrientationArray(), access_location::host, access_mode::read);
-        ArrayHandle<Scalar4> h_angmom(m_pdata->getAngularMomentumArray(), access_location::host, access_mode::read);
-        ArrayHandle<Scalar3> h_inertia(m_pdata->getMomentsOfInertiaArray(), access_location::host, access_mode::read);
+        // visit each particle once and add its contribution to every group it is a member of
+        std::vector< std::unique_ptr< ArrayHandle<unsigned int> > > h_is_member;
+        for (auto member_flags : member_flag_arrays)
+            {
+            h_is_member.emplace_back(new ArrayHandle<unsigned int>(*member_flags,
+                                                                   access_location::host,
+                                                                   access_mode::read));
+            }
 
-        for (unsigned int group_idx = 0; group_idx < group_size; group_idx++)
+        for (unsigned int j = 0; j < m_pdata->getN(); j++)
             {
-            unsigned int j = m_group->getMemberIndex(group_idx);
-            // ignore rigid body constituent particles in the sum
-            if (h_body.data[j] >= MIN_FLOPPY || h_body.data[j] == h_tag.data[j])
+            ThermoSums particle = ThermoSums();
+            bool evaluated = false;
+            for (unsigned int c = 0; c < n_computes; c++)
                 {
-                Scalar3 I = h_inertia.data[j];
-                quat<Scalar> q(h_orientation.data[j]);
-                quat<Scalar> p(h_angmom.data[j]);
-                quat<Scalar> s(Scalar(0.5)*conj(q)*p);
+                if (!h_is_member[c]->data[j])
+                    continue;
 
-                // only if the moment of inertia along one principal axis is non-zero, that axis carries angular momentum
-                if (I.x >= EPSILON)
-                    {
-                    ke_rot_total += s.v.x*s.v.x/I.x;
-                    }
-                if (I.y >= EPSILON)
+                if (!evaluated)
                     {
-                    ke_rot_total += s.v.y*s.v.y/I.y;
+                    accumulate(j, particle);
+                    evaluated = true;
                     }
-                if (I.z >= EPSILON)
+
+                sums[c].ke_trans += particle.ke_trans;
+                sums[c].ke_rot += particle.ke_rot;
+                sums[c].pe += particle.pe;
+                for (unsigned int k = 0; k < 6; k++)
                     {
-                    ke_rot_total += s.v.z*s.v.z/I.z;
+                    sums[c].pressure_kinetic[k] += particle.pressure_kinetic[k];
+                    sums[c].virial[k] += particle.virial[k];
                     }
                 }
             }
-
-        ke_rot_total /= Scalar(2.0);
         }
+    }
 
-    // total potential energy
-    double pe_total = 0.0;
-    for (unsigned int group_idx = 0; group_idx < group_size; group_idx++)
+    // terms that are not attributed to individual particles
+    for (unsigned int c = 0; c < n_computes; c++)
         {
-        unsigned int j = m_group->getMemberIndex(group_idx);
-
-        // ignore rigid body constituent particles in the sum
-        if (h_body.data[j] >= MIN_FLOPPY || h_body.data[j] == h_tag.data[j])
+        if (quantities & thermo_quantity::potential_energy)
+            sums[c].pe += m_pdata->getExternalEnergy();
+        if (quantities & thermo_quantity::pressure_tensor)
             {
-            pe_total += (double)h_net_force.data[j].w;
+            for (unsigned int k = 0; k < 6; k++)
+                sums[c].virial[k] += m_pdata->getExternalVirial(k);
             }
         }
 
-    pe_total += m_pdata->getExternalEnergy();
+    #ifdef ENABLE_MPI
+    if (m_pdata->getDomainDecomposition())
+        {
+        // ThermoSums is a plain struct of doubles, reduce all computes at once
+        MPI_Allreduce(MPI_IN_PLACE, &sums[0], n_computes*ThermoSums::size, MPI_DOUBLE, MPI_SUM,
+            m_exec_conf->getMPICommunicator());
+        }
+    #endif
 
-    double W = 0.0;
-    double virial_xx = m_pdata->getExternalVirial(0);
-    double virial_xy = m_pdata->getExternalVirial(1);
-    double virial_xz = m_pdata->getExternalVirial(2);
-    double virial_yy = m_pdata->getExternalVirial(3);
-    double virial_yz = m_pdata->getExternalVirial(4);
-    double virial_zz = m_pdata->getExternalVirial(5);
+    // volume/area & other 2D stuff needed
+    BoxDim global_box = m_pdata->getGlobalBox();
+    Scalar3 L = global_box.getL();
+    unsigned int D = m_sysdef->getNDimensions();
+    // "volume" is area in 2D
+    Scalar volume = (D == 2) ? L.x * L.y : L.x * L.y * L.z;
 
-    if (flags[pdata_flag::pressure_tensor])
+    for (unsigned int c = 0; c < n_computes; c++)
         {
-        // Calculate upper triangular virial tensor
-        size_t virial_pitch = net_virial.getPitch();
-        for (unsigned int group_idx = 0; group_idx < group_size; group_idx++)
+        ComputeThermo* compute = computes[c];
+        const ThermoSums& s = sums[c];
+
+        // an empty group keeps its previous values
+        if (compute->m_group->getNumMembersGlobal() != 0)
             {
-            unsigned int j = m_group->getMemberIndex(group_idx);
-            // ignore rigid body constituent particles in the sum
-            if (h_body.data[j] >= MIN_FLOPPY || h_body.data[j] == h_tag.data[j])
+            ArrayHandle<Scalar> h_properties(compute->m_properties, access_location::host, access_mode::readwrite);
+
+            if (quantities & thermo_quantity::pressure_tensor)
                 {
-                virial_xx += (double)h_net_virial.data[j+0*virial_pitch];
-                virial_xy += (double)h_net_virial.data[j+1*virial_pitch];
-                virial_xz += (double)h_net_virial.data[j+2*virial_pitch];
-                virial_yy += (double)h_net_virial.data[j+3*virial_pitch];
-                virial_yz += (double)h_net_virial.data[j+4*virial_pitch];
-                virial_zz += (double)h_net_virial.data[j+5*virial_pitch];
+                // kinetic energy = 1/2 trace of kinetic part of pressure tensor
+                double ke_trans_total = 0.5*(s.pressure_kinetic[0] + s.pressure_kinetic[3] + s.pressure_kinetic[5]);
+
+                // isotropic virial = 1/3 trace of virial tensor
+                double W = 1./3. * (s.virial[0] + s.virial[3] + s.virial[5]);
+                // W needs to be corrected in 2D since the 1/3 factor is built in
+                if (D == 2)
+                    W *= 3.0/2.0;
+
+                // pressure: P = (N * K_B * T + W)/V
+                h_properties.data[thermo_index::pressure] = Scalar((2.0 * ke_trans_total / Scalar(D) + W) / volume);
+
+                // pressure tensor = (kinetic part + virial) / V
+                h_properties.data[thermo_index::pressure_xx] = Scalar((s.pressure_kinetic[0] + s.virial[0]) / volume);
+                h_properties.data[thermo_index::pressure_xy] = Scalar((s.pressure_kinetic[1] + s.virial[1]) / volume);
+                h_properties.data[thermo_index::pressure_xz] = Scalar((s.pressure_kinetic[2] + s.virial[2]) / volume);
+                h_properties.data[thermo_index::pressure_yy] = Scalar((s.pressure_kinetic[3] + s.virial[3]) / volume);
+                h_properties.data[thermo_index::pressure_yz] = Scalar((s.pressure_kinetic[4] + s.virial[4]) / volume);
+                h_properties.data[thermo_index::pressure_zz] = Scalar((s.pressure_kinetic[5] + s.virial[5]) / volume);
+                h_properties.data[thermo_index::translational_kinetic_energy] = Scalar(ke_trans_total);
+                }
+            else if (quantities & thermo_quantity::translational_kinetic_energy)
+                {
+                h_properties.data[thermo_index::translational_kinetic_energy] = Scalar(0.5*s.ke_trans);
                 }
-            }
 
-        // isotropic virial = 1/3 trace of virial tensor
-        W = Scalar(1./3.) * (virial_xx + virial_yy + virial_zz);
-        }
+            if (quantities & thermo_quantity::rotational_kinetic_energy)
+                h_properties.data[thermo_index::rotational_kinetic_energy] = Scalar(0.5*s.ke_rot);
 
-    // compute the pressure
-    // volume/area & other 2D stuff needed
-    BoxDim global_box = m_pdata->getGlobalBox();
+            if (quantities & thermo_quantity::potential_energy)
+                h_properties.data[thermo_index::potential_energy] = Scalar(s.pe);
+            }
 
-    Scalar3 L = global_box.getL();
-    Scalar volume;
-    unsigned int D = m_sysdef->getNDimensions();
-    if (D == 2)
-        {
-        // "volume" is area in 2D
-        volume = L.x * L.y;
-        // W needs to be corrected since the 1/3 factor is built in
-        W *= Scalar(3.0/2.0);
-        }
-    else
-        {
-        volume = L.x * L.y * L.z;
-        }
-
-    // pressure: P = (N * K_B * T + W)/V
-    Scalar pressure =  (2.0 * ke_trans_total / Scalar(D) + W) / volume;
-
-    // pressure tensor = (kinetic part + virial) / V
-    Scalar pressure_xx = (pressure_kinetic_xx + virial_xx) / volume;
-    Scalar pressure_xy = (pressure_kinetic_xy + virial_xy) / volume;
-    Scalar pressure_xz = (pressure_kinetic_xz + virial_xz) / volume;
-    Scalar pressure_yy = (pressure_kinetic_yy + virial_yy) / volume;
-    Scalar pressure_yz = (pressure_kinetic_yz + virial_yz) / volume;
-    Scalar pressure_zz = (pressure_kinetic_zz + virial_zz) / volume;
-
-    // fill out the GlobalArray
-    ArrayHandle<Scalar> h_properties(m_properties, access_location::host, access_mode::overwrite);
-    h_properties.data[thermo_index::translational_kinetic_energy] = Scalar(ke_trans_total);
-    h_properties.data[thermo_index::rotational_kinetic_energy] = Scalar(ke_rot_total);
-    h_properties.data[thermo_index::potential_energy] = Scalar(pe_total);
-    h_properties.data[thermo_index::pressure] = pressure;
-    h_properties.data[thermo_index::pressure_xx] = pressure_xx;
-    h_properties.data[thermo_index::pressure_xy] = pressure_xy;
-    h_properties.data[thermo_index::pressure_xz] = pressure_xz;
-    h_properties.data[thermo_index::pressure_yy] = pressure_yy;
-    h_properties.data[thermo_index::pressure_yz] = pressure_yz;
-    h_properties.data[thermo_index::pressure_zz] = pressure_zz;
+        unsigned int computed = quantities;
+        if (quantities & thermo_quantity::pressure_tensor)
+            computed |= thermo_quantity::translational_kinetic_energy;
 
-    #ifdef ENABLE_MPI
-    // in MPI, reduce extensive quantities only when they're needed
-    m_properties_reduced = !m_pdata->getDomainDecomposition();
-    #endif // ENABLE_MPI
+        if (compute != this)
+            compute->m_computed_quantities |= computed;
+        else
+            quantities = computed;
+        }
 
     if (m_prof) m_prof->pop();
+
+    return quantities;
     }
 
 #ifdef ENABLE_MPI
 void ComputeThermo::reduceProperties()
     {
-    if (m_properties_reduced) return;
-
     // reduce properties
     ArrayHandle<Scalar> h_properties(m_properties, access_location::host, access_mode::readwrite);
     MPI_Allreduce(MPI_IN_PLACE, h_properties.data, thermo_index::num_quantities, MPI_HOOMD_SCALAR,
             MPI_SUM, m_exec_conf->getMPICommunicator());
-
-    m_properties_reduced = true;
     }
 #endif
 
@@ -427,5 +521,7 @@ void export_ComputeThermo(py::module& m)
     .def_property_readonly("rotational_kinetic_energy", &ComputeThermo::getRotationalKineticEnergy)
     .def_property_readonly("potential_energy", &ComputeThermo::getPotentialEnergy)
     .def("setLoggingEnabled", &ComputeThermo::setLoggingEnabled)
+    .def("addFusedCompute", &ComputeThermo::addFusedCompute)
+    .def("removeFusedCompute", &ComputeThermo::removeFusedCompute)
     ;
     }
@@ -44,6 +44,14 @@
      - number of degrees of freedom (ndof)
      - number of particles in the group
 
+    Reductions are performed lazily. compute() marks the stored values as stale, and each accessor reduces only the
+    quantities it needs (see thermo_quantity) the first time it is called on a given timestep. Temperature, for
+    example, does not trigger the pressure tensor reduction.
+
+    Several ComputeThermo instances acting on the same system can be fused with addFusedCompute(). When one of them
+    needs a reduction, it computes the same quantities for all fused computes in a single pass over the particle
+    data and a single MPI reduction.
+
     ndof is utilized in calculating the temperature from the kinetic energy. setNDOF() changes it to any value
     the user desires (the default is one!). In standard usage, the python interface queries the number of degrees
     of freedom from the integrators and sets that value for each ComputeThermo so that it is always correct.
@@ -73,9 +81,7 @@ class PYBIND11_EXPORT ComputeThermo : public Compute
          */
         Scalar getTemperature()
         {
-            #ifdef ENABLE_MPI
-            if (!m_properties_reduced) reduceProperties();
-            #endif
+            requireQuantities(thermo_quantity::translational_kinetic_energy | thermo_quantity::rotational_kinetic_energy);
             ArrayHandle<Scalar> h_properties(m_properties, access_location::host, access_mode::read);
             if (m_group->getTranslationalDOF() + m_group->getRotationalDOF() > 0)
                 {
@@ -94,9 +100,7 @@ class PYBIND11_EXPORT ComputeThermo : public Compute
         */
         Scalar getTranslationalTemperature()
             {
-            #ifdef ENABLE_MPI
-            if (!m_properties_reduced) reduceProperties();
-            #endif
+            requireQuantities(thermo_quantity::translational_kinetic_energy);
             ArrayHandle<Scalar> h_properties(m_properties, access_location::host, access_mode::read);
             if (m_group->getTranslationalDOF() > 0)
                 {
@@ -113,13 +117,11 @@ class PYBIND11_EXPORT ComputeThermo : public Compute
         */
         Scalar getRotationalTemperature()
             {
-            #ifdef ENABLE_MPI
-            if (!m_properties_reduced) reduceProperties();
-            #endif
             // return 0.0 if the flags are not valid or we have no rotational DOF
             if (m_computed_flags[pdata_flag::rotational_kinetic_energy] &&
                 m_group->getRotationalDOF() > 0)
                 {
+                requireQuantities(thermo_quantity::rotational_kinetic_energy);
                 ArrayHandle<Scalar> h_properties(m_properties, access_location::host, access_mode::read);
                 return Scalar(2.0)/m_group->getRotationalDOF()*h_properties.data[thermo_index::rotational_kinetic_energy];
                 }
@@ -138,9 +140,7 @@ class PYBIND11_EXPORT ComputeThermo : public Compute
             if (m_computed_flags[pdata_flag::pressure_tensor])
                 {
                 // return the pressure
-                #ifdef ENABLE_MPI
-                if (!m_properties_reduced) reduceProperties();
-                #endif
+                requireQuantities(thermo_quantity::pressure_tensor);
 
                 ArrayHandle<Scalar> h_properties(m_properties, access_location::host, access_mode::read);
                 return h_properties.data[thermo_index::pressure];
@@ -156,9 +156,7 @@ class PYBIND11_EXPORT ComputeThermo : public Compute
         */
         Scalar getTranslationalKineticEnergy()
             {
-            #ifdef ENABLE_MPI
-            if (!m_properties_reduced) reduceProperties();
-            #endif
+            requireQuantities(thermo_quantity::translational_kinetic_energy);
 
             ArrayHandle<Scalar> h_properties(m_properties, access_location::host, access_mode::read);
             return h_properties.data[thermo_index::translational_kinetic_energy];
@@ -169,13 +167,10 @@ class PYBIND11_EXPORT ComputeThermo : public Compute
         */
         Scalar getRotationalKineticEnergy()
             {
-            #ifdef ENABLE_MPI
-            if (!m_properties_reduced) reduceProperties();
-            #endif
-
             // return 0.0 if the flags are not valid
             if (m_computed_flags[pdata_flag::rotational_kinetic_energy])
                 {
+                requireQuantities(thermo_quantity::rotational_kinetic_energy);
                 ArrayHandle<Scalar> h_properties(m_properties, access_location::host, access_mode::read);
                 return h_properties.data[thermo_index::rotational_kinetic_energy];
                 }
@@ -190,9 +185,7 @@ class PYBIND11_EXPORT ComputeThermo : public Compute
         */
         Scalar getKineticEnergy()
             {
-            #ifdef ENABLE_MPI
-            if (!m_properties_reduced) reduceProperties();
-            #endif
+            requireQuantities(thermo_quantity::translational_kinetic_energy | thermo_quantity::rotational_kinetic_energy);
 
             // return only translational component if the flags are not valid
             ArrayHandle<Scalar> h_properties(m_properties, access_location::host, access_mode::read);
@@ -212,9 +205,7 @@ class PYBIND11_EXPORT ComputeThermo : public Compute
         */
         Scalar getPotentialEnergy()
             {
-            #ifdef ENABLE_MPI
-            if (!m_properties_reduced) reduceProperties();
-            #endif
+            requireQuantities(thermo_quantity::potential_energy);
 
             ArrayHandle<Scalar> h_properties(m_properties, access_location::host, access_mode::read);
             return h_properties.data[thermo_index::potential_energy];
@@ -230,9 +221,7 @@ class PYBIND11_EXPORT ComputeThermo : public Compute
             PressureTensor p;
             if (m_computed_flags[pdata_flag::pressure_tensor])
                 {
-                #ifdef ENABLE_MPI
-                if (!m_properties_reduced) reduceProperties();
-                #endif
+                requireQuantities(thermo_quantity::pressure_tensor);
 
                 ArrayHandle<Scalar> h_properties(m_properties, access_location::host, access_mode::read);
 
@@ -296,9 +285,7 @@ class PYBIND11_EXPORT ComputeThermo : public Compute
         //! Get the gpu array of properties
         const GlobalArray<Scalar>& getProperties()
             {
-            #ifdef ENABLE_MPI
-            if (!m_properties_reduced) reduceProperties();
-            #endif
+            requireQuantities(thermo_quantity::all);
 
             return m_properties;
             }
@@ -320,6 +307,12 @@ class PYBIND11_EXPORT ComputeThermo : public Compute
             m_logging_enabled = enable;
             }
 
+        //! Share reductions with another compute
+        void addFusedCompute(std::shared_ptr<ComputeThermo> other);
+
+        //! Stop sharing reductions with another compute
+        void removeFusedCompute(std::shared_ptr<ComputeThermo> other);
+
     protected:
         std::shared_ptr<ParticleGroup> m_group;     //!< Group to compute properties for
         GlobalArray<Scalar> m_properties;  //!< Stores the computed properties
@@ -329,14 +322,30 @@ class PYBIND11_EXPORT ComputeThermo : public Compute
         /// Store the particle data flags used during the last computation
         PDataFlags m_computed_flags;
 
+        /// Quantities (thermo_quantity bit flags) that are up to date for the last computed timestep
+        unsigned int m_computed_quantities;
+
+        /// Other computes that share reductions with this one
+        std::vector< std::weak_ptr<ComputeThermo> > m_fused_computes;
+
+        //! Compute the given quantities if they are not up to date
+        /*! \param quantities Bitwise or of thermo_quantity flags
+        */
+        void requireQuantities(unsigned int quantities)
+            {
+            unsigned int missing = quantities & ~m_computed_quantities;
+            if (missing)
+                {
+                m_computed_quantities |= computeProperties(missing);
+                }
+            }
+
         //! Does the actual computation
-        virtual void computeProperties();
+        virtual unsigned int computeProperties(unsigned int quantities);
 
         #ifdef ENABLE_MPI
-        bool m_properties_reduced;      //!< True if properties have been reduced across MPI
-
-        //! Reduce properties over MPI
-        virtual void reduceProperties();
+        //! Reduce all properties over MPI
+        void reduceProperties();
         #endif
     };
 
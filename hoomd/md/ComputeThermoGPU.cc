@@ -51,12 +51,14 @@ ComputeThermoGPU::~ComputeThermoGPU()
     }
 
 /*! Computes all thermodynamic properties of the system in one fell swoop, on the GPU.
+    \param quantities Requested quantities (ignored, all quantities are computed)
+    \returns All quantities
  */
-void ComputeThermoGPU::computeProperties()
+unsigned int ComputeThermoGPU::computeProperties(unsigned int quantities)
     {
     // just drop out if the group is an empty group
     if (m_group->getNumMembersGlobal() == 0)
-        return;
+        return thermo_quantity::all;
 
     unsigned int group_size = m_group->getNumMembers();
 
@@ -188,11 +190,13 @@ void ComputeThermoGPU::computeProperties()
     }
 
     #ifdef ENABLE_MPI
-    // in MPI, reduce extensive quantities only when they're needed
-    m_properties_reduced = !m_pdata->getDomainDecomposition();
+    if (m_pdata->getDomainDecomposition())
+        reduceProperties();
     #endif // ENABLE_MPI
 
     if (m_prof) m_prof->pop(m_exec_conf);
+
+    return thermo_quantity::all;
     }
 
 void export_ComputeThermoGPU(py::module& m)
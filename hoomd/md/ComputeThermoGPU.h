@@ -40,7 +40,7 @@ class PYBIND11_EXPORT ComputeThermoGPU : public ComputeThermo
         hipEvent_t m_event;         //!< CUDA event for synchronization
 
         //! Does the actual computation
-        virtual void computeProperties();
+        virtual unsigned int computeProperties(unsigned int quantities);
     };
 
 //! Exports the ComputeThermoGPU class to python
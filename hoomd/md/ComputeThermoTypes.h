@@ -32,6 +32,20 @@ struct thermo_index
         };
     };
 
+//! Bit flags that select the quantities reduced by ComputeThermo
+struct thermo_quantity
+    {
+    //! The enum
+    enum Enum
+        {
+        translational_kinetic_energy=1,   //!< Translational kinetic energy
+        rotational_kinetic_energy=2,      //!< Rotational kinetic energy
+        potential_energy=4,               //!< Potential energy
+        pressure_tensor=8,                //!< Pressure and pressure tensor
+        all=15                            //!< All quantities
+        };
+    };
+
 //! structure for storing the components of the pressure tensor
 struct PressureTensor
     {
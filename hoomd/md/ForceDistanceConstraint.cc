@@ -6,6 +6,15 @@
 
 #include "ForceDistanceConstraint.h"
 
+#include <Eigen/IterativeLinearSolvers>
+#include <Eigen/SparseCore>
+
+#ifdef ENABLE_TBB
+#include <tbb/parallel_for.h>
+#endif
+
+#include <algorithm>
+#include <atomic>
 #include <string.h>
 using namespace Eigen;
 namespace py = pybind11;
@@ -18,9 +27,9 @@ namespace py = pybind11;
 */
 ForceDistanceConstraint::ForceDistanceConstraint(std::shared_ptr<SystemDefinition> sysdef)
         : MolecularForceCompute(sysdef), m_cdata(m_sysdef->getConstraintData()),
-          m_cmatrix(m_exec_conf), m_cvec(m_exec_conf), m_lagrange(m_exec_conf),
-          m_rel_tol(1e-3), m_constraint_violated(m_exec_conf), m_condition(m_exec_conf),
-          m_sparse_idxlookup(m_exec_conf), m_constraint_reorder(true), m_constraints_added_removed(true),
+          m_cvec(m_exec_conf), m_lagrange(m_exec_conf),
+          m_rel_tol(1e-3), m_constraint_violated(m_exec_conf), m_solver_tol(1e-10), m_max_iterations(1000),
+          m_n_block_constraints(0), m_constraint_reorder(true), m_constraints_added_removed(true),
           m_d_max(0.0)
     {
     m_constraint_violated.resetFlags(0);
@@ -30,9 +39,6 @@ ForceDistanceConstraint::ForceDistanceConstraint(std::shared_ptr<SystemDefinitio
 
     // connect to ConstraintData to receive notifications when global constraint topology changes
     m_cdata->getGroupNumChangeSignal().connect<ForceDistanceConstraint, &ForceDistanceConstraint::slotConstraintsAddedRemoved>(this);
-
-    // reset condition
-    m_condition.resetFlags(0);
     }
 
 //! Destructor
@@ -94,9 +100,16 @@ void ForceDistanceConstraint::computeForces(uint64_t timestep)
         throw std::runtime_error("Error computing constraints.\n");
         }
 
+    // label the molecules when the global constraint topology has changed
+    if (m_constraints_added_removed)
+        {
+        assignMoleculeTags();
+        m_constraints_added_removed = false;
+        m_constraint_reorder = true;
+        }
+
     // reallocate through amortized resizin
     unsigned int n_constraint = m_cdata->getN()+m_cdata->getNGhosts();
-    m_cmatrix.resize(n_constraint*n_constraint);
     m_cvec.resize(n_constraint);
 
     // populate the terms in the matrix vector equation
@@ -117,24 +130,15 @@ void ForceDistanceConstraint::computeForces(uint64_t timestep)
 
 void ForceDistanceConstraint::fillMatrixVector(uint64_t timestep)
     {
-    // fill the matrix in column-major order
     unsigned int n_constraint = m_cdata->getN()+m_cdata->getNGhosts();
 
-    if (m_constraint_reorder)
+    // group the constraints by molecule when they have changed order in memory
+    if (m_constraint_reorder || n_constraint != m_n_block_constraints)
         {
         // reset flag
         m_constraint_reorder = false;
 
-        // resize lookup matrix
-        m_sparse_idxlookup.resize(n_constraint*n_constraint);
-
-        ArrayHandle<int> h_sparse_idxlookup(m_sparse_idxlookup, access_location::host, access_mode::overwrite);
-
-        // reset lookup matrix values to -1
-        for (unsigned int i = 0; i < n_constraint*n_constraint; ++i)
-            {
-            h_sparse_idxlookup.data[i] = -1;
-            }
+        buildConstraintBlocks();
         }
 
     // access particle data
@@ -143,13 +147,9 @@ void ForceDistanceConstraint::fillMatrixVector(uint64_t timestep)
     ArrayHandle<unsigned int> h_rtag(m_pdata->getRTags(), access_location::host, access_mode::read);
     ArrayHandle<Scalar4> h_netforce(m_pdata->getNetForce(), access_location::host, access_mode::read);
 
-    // access matrix elements
-    ArrayHandle<double> h_cmatrix(m_cmatrix, access_location::host, access_mode::overwrite);
+    // access the RHS vector, the matrix is assembled per molecule in solveConstraints()
     ArrayHandle<double> h_cvec(m_cvec, access_location::host, access_mode::overwrite);
 
-    // clear matrix
-    memset(h_cmatrix.data, 0, sizeof(double)*m_cmatrix.size());
-
     const BoxDim& box = m_pdata->getBox();
 
     unsigned int max_local = m_pdata->getN() + m_pdata->getNGhosts();
@@ -172,7 +172,6 @@ void ForceDistanceConstraint::fillMatrixVector(uint64_t timestep)
             throw std::runtime_error("Error in constraint calculation");
             }
 
-
         vec3<Scalar> ra(h_pos.data[idx_a]);
         vec3<Scalar> rb(h_pos.data[idx_b]);
         vec3<Scalar> rn(ra-rb);
@@ -188,71 +187,6 @@ void ForceDistanceConstraint::fillMatrixVector(uint64_t timestep)
         vec3<Scalar> rndot(va-vb);
         vec3<Scalar> qn(rn+rndot*m_deltaT);
 
-        // fill matrix row
-        for (unsigned int m = 0; m < n_constraint; ++m)
-            {
-            // lookup the tag of each of the particles participating in the constraint
-            const ConstraintData::members_t constraint_m = m_cdata->getMembersByIndex(m);
-            assert(constraint_m.tag[0] <= m_pdata->getMaximumTag());
-            assert(constraint_m.tag[1] <= m_pdata->getMaximumTag());
-
-            // transform a and b into indices into the particle data arrays
-            // (MEM TRANSFER: 4 integers)
-            unsigned int idx_m_a = h_rtag.data[constraint_m.tag[0]];
-            unsigned int idx_m_b = h_rtag.data[constraint_m.tag[1]];
-            assert(idx_m_a <= m_pdata->getN()+m_pdata->getNGhosts());
-            assert(idx_m_b <= m_pdata->getN()+m_pdata->getNGhosts());
-
-            if (idx_m_a >= max_local || idx_m_b >= max_local)
-                {
-                this->m_exec_conf->msg->error() << "constrain.distance(): constraint " <<
-                    constraint_m.tag[0] << " " << constraint_m.tag[1] << " incomplete." << std::endl << std::endl;
-                throw std::runtime_error("Error in constraint calculation");
-                }
-
-            vec3<Scalar> rm_a(h_pos.data[idx_m_a]);
-            vec3<Scalar> rm_b(h_pos.data[idx_m_b]);
-            vec3<Scalar> rm(rm_a-rm_b);
-
-            // apply minimum image
-            rm = box.minImage(rm);
-
-            double delta(0.0);
-            if (idx_m_a == idx_a)
-                {
-                delta += double(4.0)*dot(qn,rm)/ma;
-                }
-            if (idx_m_b == idx_a)
-                {
-                delta -= double(4.0)*dot(qn,rm)/ma;
-                }
-            if (idx_m_a == idx_b)
-                {
-                delta -= double(4.0)*dot(qn,rm)/mb;
-                }
-            if (idx_m_b == idx_b)
-                {
-                delta += double(4.0)*dot(qn,rm)/mb;
-                }
-
-            h_cmatrix.data[m*n_constraint+n] += delta;
-
-            // update sparse matrix
-            int k = m_sparse_idxlookup[m*n_constraint+n];
-
-            if ( (k == -1 && delta != double(0.0))
-                || (k != -1 && delta == double(0.0)))
-                {
-                m_condition.resetFlags(1);
-                }
-
-            if (k != -1)
-                {
-                // update sparse matrix value directly
-                m_sparse.valuePtr()[k] = delta;
-                }
-            }
-
         // get constraint distance
         Scalar d = m_cdata->getValueByIndex(n);
 
@@ -269,6 +203,41 @@ void ForceDistanceConstraint::fillMatrixVector(uint64_t timestep)
         }
     }
 
+/*! Sorts the local and ghost constraint indices by the molecule tag of their first particle. Constraints of
+    different molecules are not coupled, so every molecule forms an independent block of the constraint matrix.
+*/
+void ForceDistanceConstraint::buildConstraintBlocks()
+    {
+    unsigned int n_constraint = m_cdata->getN()+m_cdata->getNGhosts();
+    m_n_block_constraints = n_constraint;
+
+    ArrayHandle<unsigned int> h_molecule_tag(m_molecule_tag, access_location::host, access_mode::read);
+
+    std::vector<unsigned int> molecule(n_constraint);
+    m_block_constraint.resize(n_constraint);
+    for (unsigned int n = 0; n < n_constraint; ++n)
+        {
+        const ConstraintData::members_t constraint = m_cdata->getMembersByIndex(n);
+        assert(constraint.tag[0] < m_molecule_tag.getNumElements());
+        molecule[n] = h_molecule_tag.data[constraint.tag[0]];
+        m_block_constraint[n] = n;
+        }
+
+    std::stable_sort(m_block_constraint.begin(), m_block_constraint.end(),
+        [&molecule](unsigned int i, unsigned int j) { return molecule[i] < molecule[j]; });
+
+    // record where each molecule starts
+    m_block_offset.clear();
+    for (unsigned int k = 0; k < n_constraint; ++k)
+        {
+        if (k == 0 || molecule[m_block_constraint[k]] != molecule[m_block_constraint[k-1]])
+            {
+            m_block_offset.push_back(k);
+            }
+        }
+    m_block_offset.push_back(n_constraint);
+    }
+
 void ForceDistanceConstraint::checkConstraints(uint64_t timestep)
     {
     unsigned int n = m_constraint_violated.readFlags();
@@ -295,13 +264,16 @@ void ForceDistanceConstraint::checkConstraints(uint64_t timestep)
         }
     }
 
+/*! The matrix element of constraint equation n and Lagrange multiplier m is a sum over the particles p that both
+    constraints share, 4 s_n(p) s_m(p) (q_n . r_m) / m_p, where s(p) is +1 (-1) when p is the first (second)
+    particle of the constraint. Each molecule is assembled from the particles of its constraints and solved
+    independently of the others.
+*/
 void ForceDistanceConstraint::solveConstraints(uint64_t timestep)
     {
-    // use Eigen dense matrix algebra (slow for large matrices)
     typedef Matrix<double, Dynamic, Dynamic, ColMajor> matrix_t;
     typedef Matrix<double, Dynamic, 1> vec_t;
-    typedef Map<matrix_t> matrix_map_t;
-    typedef Map<vec_t> vec_map_t;
+    typedef SparseMatrix<double, ColMajor> sparse_matrix_t;
 
     unsigned int n_constraint = m_cdata->getN()+m_cdata->getNGhosts();
 
@@ -314,92 +286,147 @@ void ForceDistanceConstraint::solveConstraints(uint64_t timestep)
     // reallocate array of constraint forces
     m_lagrange.resize(n_constraint);
 
-    unsigned int sparsity_pattern_changed = m_condition.readFlags();
+    // access particle data
+    ArrayHandle<Scalar4> h_pos(m_pdata->getPositions(), access_location::host, access_mode::read);
+    ArrayHandle<Scalar4> h_vel(m_pdata->getVelocities(), access_location::host, access_mode::read);
+    ArrayHandle<unsigned int> h_rtag(m_pdata->getRTags(), access_location::host, access_mode::read);
+    ArrayHandle<ConstraintData::members_t> h_groups(m_cdata->getMembersArray(), access_location::host,
+        access_mode::read);
 
-    if (sparsity_pattern_changed)
-        {
-        m_exec_conf->msg->notice(6) << "ForceDistanceConstraint: sparsity pattern changed. Solving on CPU" << std::endl;
+    // access RHS and solution vector
+    ArrayHandle<double> h_cvec(m_cvec, access_location::host, access_mode::read);
+    ArrayHandle<double> h_lagrange(m_lagrange, access_location::host, access_mode::overwrite);
 
-        // reset flags
-        m_condition.resetFlags(0);
+    const BoxDim& box = m_pdata->getBox();
+    const unsigned int n_blocks = (unsigned int)m_block_offset.size() - 1;
 
-        if (m_prof)
-            m_prof->push("LU");
+    std::atomic<bool> singular(false);
+    std::atomic<unsigned int> n_not_converged(0);
 
-        // access matrix
-        ArrayHandle<double> h_cmatrix(m_cmatrix, access_location::host, access_mode::read);
+    // one end of a constraint
+    struct constraint_end
+        {
+        unsigned int idx;   //!< Particle index
+        unsigned int row;   //!< Constraint index in the block
+        double sign;        //!< +1 for the first particle, -1 for the second
+        };
 
-        // wrap array
-        matrix_map_t map_matrix(h_cmatrix.data, n_constraint,n_constraint);
+    auto solve_block = [&](unsigned int block)
+        {
+        const unsigned int offset = m_block_offset[block];
+        const unsigned int n = m_block_offset[block+1] - offset;
 
-        // sparsity pattern changed
-        m_sparse = map_matrix.sparseView();
+        // separation vectors at t and projected to t + dt
+        std::vector< vec3<Scalar> > r(n);
+        std::vector< vec3<Scalar> > q(n);
+        std::vector<constraint_end> ends(2*n);
+        vec_t rhs(n);
 
+        for (unsigned int i = 0; i < n; ++i)
             {
-            ArrayHandle<int> h_sparse_idxlookup(m_sparse_idxlookup, access_location::host, access_mode::overwrite);
+            const unsigned int c = m_block_constraint[offset + i];
+            const ConstraintData::members_t constraint = h_groups.data[c];
+            unsigned int idx_a = h_rtag.data[constraint.tag[0]];
+            unsigned int idx_b = h_rtag.data[constraint.tag[1]];
+
+            vec3<Scalar> ra(h_pos.data[idx_a]);
+            vec3<Scalar> rb(h_pos.data[idx_b]);
+            r[i] = box.minImage(ra-rb);
+            q[i] = r[i] + (vec3<Scalar>(h_vel.data[idx_a]) - vec3<Scalar>(h_vel.data[idx_b]))*m_deltaT;
+
+            ends[2*i] = constraint_end{idx_a, i, 1.0};
+            ends[2*i+1] = constraint_end{idx_b, i, -1.0};
+            rhs(i) = h_cvec.data[c];
+            }
 
-            // reset lookup matrix values to -1
-            for (unsigned int i = 0; i < n_constraint*n_constraint; ++i)
+        // constraints that share a particle are adjacent after sorting the ends by particle
+        std::sort(ends.begin(), ends.end(),
+            [](const constraint_end& e, const constraint_end& f) { return e.idx < f.idx; });
+
+        std::vector< Triplet<double> > elements;
+        for (unsigned int first = 0; first < 2*n;)
+            {
+            unsigned int last = first;
+            while (last < 2*n && ends[last].idx == ends[first].idx)
+                ++last;
+
+            double inv_mass = double(1.0)/h_vel.data[ends[first].idx].w;
+            for (unsigned int k = first; k < last; ++k)
                 {
-                h_sparse_idxlookup.data[i] = -1;
+                for (unsigned int l = first; l < last; ++l)
+                    {
+                    double value = double(4.0)*ends[k].sign*ends[l].sign*inv_mass
+                        *dot(q[ends[k].row], r[ends[l].row]);
+                    elements.push_back(Triplet<double>(ends[k].row, ends[l].row, value));
+                    }
                 }
+            first = last;
+            }
 
-            // construct lookup table
-            int *inner_non_zeros = m_sparse.innerNonZeroPtr();
-            int *outer = m_sparse.outerIndexPtr();
-            int *inner = m_sparse.innerIndexPtr();
-            for (int i = 0; i < m_sparse.outerSize(); ++i)
+        vec_t lagrange;
+        if (n <= max_direct_constraints)
+            {
+            matrix_t matrix = matrix_t::Zero(n, n);
+            for (const auto& element : elements)
                 {
-                int id = outer[i];
-                int end;
+                matrix(element.row(), element.col()) += element.value();
+                }
 
-                if(m_sparse.isCompressed())
-                    end = outer[i+1];
-                else
-                    end = id + inner_non_zeros[i];
+            lagrange = matrix.partialPivLu().solve(rhs);
+            }
+        else
+            {
+            sparse_matrix_t matrix(n, n);
+            matrix.setFromTriplets(elements.begin(), elements.end());
 
-                for (; id < end; ++id)
-                    {
-                    unsigned int col = i;
-                    unsigned int row = inner[id];
+            BiCGSTAB<sparse_matrix_t> solver;
+            solver.setTolerance(m_solver_tol);
+            solver.setMaxIterations(m_max_iterations);
+            solver.compute(matrix);
+            lagrange = solver.solve(rhs);
 
-                    // set pointer to index in sparse_val
-                    h_sparse_idxlookup.data[col*n_constraint+row] = id;
-                    }
+            if (solver.info() == NoConvergence)
+                {
+                n_not_converged++;
                 }
             }
 
-        // Compute the ordering permutation vector from the structural pattern of A
-        m_sparse_solver.analyzePattern(m_sparse);
-
-        if (m_prof)
-            m_prof->pop();
-        }
-
+        if (!lagrange.allFinite())
+            {
+            singular = true;
+            }
 
-    if (m_prof)
-        m_prof->push("refactor/solve");
+        for (unsigned int i = 0; i < n; ++i)
+            {
+            h_lagrange.data[m_block_constraint[offset + i]] = lagrange(i);
+            }
+        };
 
-    // Compute the numerical factorization
-    m_sparse_solver.factorize(m_sparse);
+    #ifdef ENABLE_TBB
+    m_exec_conf->getTaskArena()->execute([&]{
+    tbb::parallel_for(tbb::blocked_range<unsigned int>(0, n_blocks),
+        [&](const tbb::blocked_range<unsigned int>& range)
+            {
+            for (unsigned int block = range.begin(); block != range.end(); ++block)
+                solve_block(block);
+            });
+    }); // end task arena execute()
+    #else
+    for (unsigned int block = 0; block < n_blocks; ++block)
+        solve_block(block);
+    #endif
 
-    if (m_sparse_solver.info())
+    if (singular)
         {
         m_exec_conf->msg->error() << "Could not solve linear system of constraint equations." << std::endl;
         throw std::runtime_error("Error evaluating constraint forces.\n");
         }
 
-    // access RHS and solution vector
-    ArrayHandle<double> h_cvec(m_cvec, access_location::host, access_mode::read);
-    ArrayHandle<double> h_lagrange(m_lagrange, access_location::host, access_mode::overwrite);
-    vec_map_t map_vec(h_cvec.data, n_constraint, 1);
-    vec_map_t map_lagrange(h_lagrange.data,n_constraint, 1);
-
-    //Use the factors to solve the linear system
-    map_lagrange = m_sparse_solver.solve(map_vec);
-
-    if (m_prof)
-        m_prof->pop();
+    if (n_not_converged > 0)
+        {
+        m_exec_conf->msg->warning() << "constrain.distance(): the constraint equations of " << n_not_converged
+            << " molecule(s) did not converge within " << m_max_iterations << " iterations." << std::endl;
+        }
 
     if (m_prof)
         m_prof->pop();
@@ -507,50 +534,6 @@ CommFlags ForceDistanceConstraint::getRequestedCommFlags(uint64_t timestep)
     }
 #endif
 
-//! Return maximum extent of molecule
-Scalar ForceDistanceConstraint::dfs(unsigned int iconstraint, unsigned int molecule, std::vector<int>& visited,
-    unsigned int *label, std::vector<ConstraintData::members_t>& groups, std::vector<Scalar>& length)
-    {
-    assert(iconstraint < groups.size());
-
-    // don't mark constraints already visited
-    assert(visited.size() > iconstraint);
-    if (visited[iconstraint])
-        {
-        return Scalar(0.0);
-        }
-
-    // mark this constraint as visited
-    visited[iconstraint] = 1;
-
-    const ConstraintData::members_t constraint = groups[iconstraint];
-    assert(constraint.tag[0] <= m_pdata->getMaximumTag());
-    assert(constraint.tag[1] <= m_pdata->getMaximumTag());
-
-    label[constraint.tag[0]] = molecule;
-    label[constraint.tag[1]] = molecule;
-
-    // NOTE: this loop could be optimized with a reverse-lookup table ptl idx -> constraint
-    assert(iconstraint < length.size());
-    Scalar dmax = length[iconstraint];
-
-    for (unsigned int jconstraint = 0; jconstraint < groups.size(); ++jconstraint)
-        {
-        ConstraintData::members_t tags_j = groups[jconstraint];
-
-        if (iconstraint == jconstraint) continue;
-
-        if (tags_j.tag[0] == constraint.tag[0] || tags_j.tag[1] == constraint.tag[0] ||
-            tags_j.tag[0] == constraint.tag[1] || tags_j.tag[1] == constraint.tag[1])
-            {
-            // recursively mark connected constraint with current label
-            dmax += dfs(jconstraint, molecule, visited, label, groups, length);
-            }
-        }
-
-    return dmax;
-    }
-
 Scalar ForceDistanceConstraint::askGhostLayerWidth(unsigned int type)
     {
     // only rebuild global tag list if necessary
@@ -582,41 +565,76 @@ void ForceDistanceConstraint::assignMoleculeTags()
         }
     #endif
 
-    // walk through the global constraints and connect molecules
+    // connect the particles of each constraint with a union-find over particle tags
+    unsigned int nconstraint_global = (unsigned int)groups.size();
+    unsigned int nptl = m_pdata->getNGlobal();
+    std::vector<unsigned int> parent(nptl);
+    for (unsigned int i = 0; i < nptl; ++i)
+        {
+        parent[i] = i;
+        }
 
-    unsigned int nconstraint_global = snap.size;
-    std::vector<int> visited(nconstraint_global,0);
+    auto find_root = [&parent](unsigned int i)
+        {
+        while (parent[i] != i)
+            {
+            // path halving
+            parent[i] = parent[parent[i]];
+            i = parent[i];
+            }
+        return i;
+        };
+
+    for (unsigned int iconstraint = 0; iconstraint < nconstraint_global; ++iconstraint)
+        {
+        assert(groups[iconstraint].tag[0] < nptl);
+        assert(groups[iconstraint].tag[1] < nptl);
+        unsigned int root_a = find_root(groups[iconstraint].tag[0]);
+        unsigned int root_b = find_root(groups[iconstraint].tag[1]);
+        if (root_a != root_b)
+            {
+            parent[root_b] = root_a;
+            }
+        }
 
     // label per ptl (-1 == no label)
-    m_molecule_tag.resize(m_pdata->getNGlobal());
+    m_molecule_tag.resize(nptl);
 
     ArrayHandle<unsigned int> h_molecule_tag(m_molecule_tag, access_location::host, access_mode::overwrite);
 
     // reset labels
-    unsigned int nptl = m_pdata->getNGlobal();
     for (unsigned int i = 0; i < nptl; ++i)
         {
         h_molecule_tag.data[i] = NO_MOLECULE;
         }
 
-    int molecule = 0;
+    // label ptls by connected component index in order of the first constraint of each component, and sum
+    // up the constraint lengths of each component as an upper bound of its extent
+    unsigned int molecule = 0;
+    std::vector<unsigned int> root_molecule(nptl, NO_MOLECULE);
+    std::vector<Scalar> extent;
+    for (unsigned int iconstraint = 0; iconstraint < nconstraint_global; ++iconstraint)
+        {
+        unsigned int root = find_root(groups[iconstraint].tag[0]);
+        if (root_molecule[root] == NO_MOLECULE)
+            {
+            root_molecule[root] = molecule++;
+            extent.push_back(Scalar(0.0));
+            }
+
+        unsigned int label = root_molecule[root];
+        h_molecule_tag.data[groups[iconstraint].tag[0]] = label;
+        h_molecule_tag.data[groups[iconstraint].tag[1]] = label;
+        extent[label] += length[iconstraint];
+        }
 
     // maximum molecule diameter
     m_d_max = Scalar(0.0);
-
+    for (Scalar d : extent)
         {
-        // label ptls by connected component index
-        for (unsigned int iconstraint = 0; iconstraint < nconstraint_global; ++iconstraint)
+        if (d > m_d_max)
             {
-            if (! visited[iconstraint])
-                {
-                // depth first search
-                Scalar d = dfs(iconstraint, molecule++, visited, h_molecule_tag.data, groups, length);
-                if (d > m_d_max)
-                    {
-                    m_d_max = d;
-                    }
-                }
+            m_d_max = d;
             }
         }
 
@@ -629,5 +647,7 @@ void export_ForceDistanceConstraint(py::module& m)
     py::class_< ForceDistanceConstraint, MolecularForceCompute, std::shared_ptr<ForceDistanceConstraint> >(m, "ForceDistanceConstraint")
         .def(py::init< std::shared_ptr<SystemDefinition> >())
         .def("setRelativeTolerance", &ForceDistanceConstraint::setRelativeTolerance)
+        .def("setSolverTolerance", &ForceDistanceConstraint::setSolverTolerance)
+        .def("setMaxIterations", &ForceDistanceConstraint::setMaxIterations)
     ;
     }
@@ -23,13 +23,20 @@
 #include "hoomd/GPUFlags.h"
 
 #include <Eigen/Dense>
-#include <Eigen/SparseLU>
+
+#include <vector>
 
 /*! Implements a pairwise distance constraint using the algorithm of
 
     [1] M. Yoneya, H. J. C. Berendsen, and K. Hirasawa, “A Non-Iterative Matrix Method for Constraint Molecular Dynamics Simulations,” Mol. Simul., vol. 13, no. 6, pp. 395–405, 1994.
     [2] M. Yoneya, “A Generalized Non-iterative Matrix Method for Constraint Molecular Dynamics Simulations,” J. Comput. Phys., vol. 172, no. 1, pp. 188–197, Sep. 2001.
 
+    Constraints of different molecules do not couple, so the constraint matrix is block diagonal with one block per
+    molecule (as labeled by assignMoleculeTags()). The blocks are assembled and solved independently, and in parallel
+    when TBB is enabled. Blocks with up to max_direct_constraints constraints are solved with a dense LU decomposition,
+    larger blocks (e.g. long chains) with the iterative BiCGSTAB method up to a given tolerance and number of
+    iterations.
+
     See Integrator for detailed documentation on constraint force implementation.
     \ingroup computes
 */
@@ -54,6 +61,25 @@ class PYBIND11_EXPORT ForceDistanceConstraint : public MolecularForceCompute
             m_rel_tol = rel_tol;
             }
 
+        //! Set the tolerance of the iterative solver for large molecules
+        void setSolverTolerance(Scalar solver_tol)
+            {
+            if (solver_tol <= Scalar(0.0))
+                throw std::invalid_argument("solver_tol must be positive");
+            m_solver_tol = solver_tol;
+            }
+
+        //! Set the maximum number of iterations of the iterative solver for large molecules
+        void setMaxIterations(unsigned int max_iterations)
+            {
+            if (max_iterations == 0)
+                throw std::invalid_argument("max_iterations must be positive");
+            m_max_iterations = max_iterations;
+            }
+
+        //! Maximum number of constraints in a molecule that is solved with a dense LU decomposition
+        static const unsigned int max_direct_constraints = 64;
+
         #ifdef ENABLE_MPI
         //! Get ghost particle fields requested by this pair potential
         virtual CommFlags getRequestedCommFlags(uint64_t timestep);
@@ -65,18 +91,18 @@ class PYBIND11_EXPORT ForceDistanceConstraint : public MolecularForceCompute
     protected:
         std::shared_ptr<ConstraintData> m_cdata; //! The constraint data
 
-        GPUVector<double> m_cmatrix;                //!< The matrix for the constraint force equation (column-major)
         GPUVector<double> m_cvec;                   //!< The vector on the RHS of the constraint equation
         GPUVector<double> m_lagrange;               //!< The solution for the lagrange multipliers
 
         Scalar m_rel_tol;                           //!< Rel. tolerance for constraint violation warning
         GPUFlags<unsigned int> m_constraint_violated; //!< The id of the violated constraint + 1
 
-        GPUFlags<unsigned int> m_condition; //!< ==1 if sparsity pattern has changed
-        Eigen::SparseMatrix<double, Eigen::ColMajor> m_sparse;    //!< The sparse constraint matrix representation
-        Eigen::SparseLU<Eigen::SparseMatrix<double, Eigen::ColMajor>, Eigen::COLAMDOrdering<int> > m_sparse_solver;
-            //!< The persistent state of the sparse matrix solver
-        GPUVector<int> m_sparse_idxlookup;          //!< Reverse lookup from column-major to sparse matrix element
+        Scalar m_solver_tol;                        //!< Tolerance of the iterative solver
+        unsigned int m_max_iterations;              //!< Maximum number of iterations of the iterative solver
+
+        std::vector<unsigned int> m_block_offset;   //!< Offset of each molecule into m_block_constraint
+        std::vector<unsigned int> m_block_constraint; //!< Constraint indices grouped by molecule
+        unsigned int m_n_block_constraints;         //!< Number of constraints when the blocks were built
 
         bool m_constraint_reorder;         //!< True if groups have changed
         bool m_constraints_added_removed;  //!< True if global constraint topology has changed
@@ -92,7 +118,10 @@ class PYBIND11_EXPORT ForceDistanceConstraint : public MolecularForceCompute
         //! Check violation of constraints
         virtual void checkConstraints(uint64_t timestep);
 
-        //! Solve the constraint matrix equation
+        //! Group the constraints by molecule
+        void buildConstraintBlocks();
+
+        //! Assemble and solve the constraint matrix equation of each molecule
         virtual void solveConstraints(uint64_t timestep);
 
         //! Solve the linear matrix-vector equation
@@ -132,10 +161,6 @@ class PYBIND11_EXPORT ForceDistanceConstraint : public MolecularForceCompute
         #endif
 
     private:
-        //! Helper function to perform a depth-first search
-        Scalar dfs(unsigned int iconstraint, unsigned int molecule, std::vector<int>& visited,
-            unsigned int *label, std::vector<ConstraintData::members_t>& groups, std::vector<Scalar>& length);
-
         #ifdef ENABLE_MPI
         bool m_comm_ghost_layer_connected = false; //!< Track if we have already connected to ghost layer width requests
         #endif
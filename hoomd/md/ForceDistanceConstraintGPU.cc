@@ -19,7 +19,8 @@ namespace py = pybind11;
 /*! \param sysdef SystemDefinition containing the ParticleData to compute forces on
 */
 ForceDistanceConstraintGPU::ForceDistanceConstraintGPU(std::shared_ptr<SystemDefinition> sysdef)
-       : ForceDistanceConstraint(sysdef)
+       : ForceDistanceConstraint(sysdef), m_cmatrix(m_exec_conf), m_condition(m_exec_conf),
+         m_sparse_idxlookup(m_exec_conf)
 #ifdef CUSOLVER_AVAILABLE
         , m_cusolver_rf_initialized(false),
         m_nnz_L_tot(0), m_nnz_U_tot(0),
@@ -33,6 +34,9 @@ ForceDistanceConstraintGPU::ForceDistanceConstraintGPU(std::shared_ptr<SystemDef
     m_tuner_fill.reset(new Autotuner(warp_size, 1024, warp_size, 5, 100000, "dist_constraint_fill_matrix_vec", this->m_exec_conf));
     m_tuner_force.reset(new Autotuner(warp_size, 1024, warp_size, 5, 100000, "dist_constraint_force", this->m_exec_conf));
 
+    // reset condition
+    m_condition.resetFlags(0);
+
     #ifdef CUSOLVER_AVAILABLE
     // initialize cuSPARSE
     cusparseCreate(&m_cusparse_handle);
@@ -64,10 +68,6 @@ ForceDistanceConstraintGPU::ForceDistanceConstraintGPU(std::shared_ptr<SystemDef
 
     GPUVector<double> sparse_val(m_exec_conf);
     m_sparse_val.swap(sparse_val);
-
-    // reallocate base class array
-    GPUVector<int> sparse_idxlookup(m_exec_conf);
-    m_sparse_idxlookup.swap(sparse_idxlookup);
     }
 
 //! Destructor
@@ -96,6 +96,9 @@ void ForceDistanceConstraintGPU::fillMatrixVector(uint64_t timestep)
     // fill the matrix in row-major order
     unsigned int n_constraint = m_cdata->getN() + m_cdata->getNGhosts();
 
+    // reallocate through amortized resizing
+    m_cmatrix.resize(n_constraint*n_constraint);
+
     if (m_constraint_reorder)
         {
         // reset flag
@@ -194,7 +197,105 @@ void ForceDistanceConstraintGPU::solveConstraints(uint64_t timestep)
         }
 
     // solve on CPU
-    ForceDistanceConstraint::solveConstraints(timestep);
+    unsigned int n_constraint = m_cdata->getN() + m_cdata->getNGhosts();
+
+    // skip if zero constraints
+    if (n_constraint == 0) return;
+
+    if (m_prof)
+        m_prof->push("solve");
+
+    // reallocate array of constraint forces
+    m_lagrange.resize(n_constraint);
+
+    if (sparsity_pattern_changed)
+        {
+        m_exec_conf->msg->notice(6) << "ForceDistanceConstraintGPU: sparsity pattern changed. Solving on CPU" << std::endl;
+
+        // reset flags
+        m_condition.resetFlags(0);
+
+        if (m_prof)
+            m_prof->push("LU");
+
+        // access matrix
+        ArrayHandle<double> h_cmatrix(m_cmatrix, access_location::host, access_mode::read);
+
+        // wrap array
+        Eigen::Map<Eigen::MatrixXd> map_matrix(h_cmatrix.data, n_constraint, n_constraint);
+
+        // sparsity pattern changed
+        m_sparse = map_matrix.sparseView();
+
+            {
+            ArrayHandle<int> h_sparse_idxlookup(m_sparse_idxlookup, access_location::host, access_mode::overwrite);
+
+            // reset lookup matrix values to -1
+            for (unsigned int i = 0; i < n_constraint*n_constraint; ++i)
+                {
+                h_sparse_idxlookup.data[i] = -1;
+                }
+
+            // construct lookup table
+            int *inner_non_zeros = m_sparse.innerNonZeroPtr();
+            int *outer = m_sparse.outerIndexPtr();
+            int *inner = m_sparse.innerIndexPtr();
+            for (int i = 0; i < m_sparse.outerSize(); ++i)
+                {
+                int id = outer[i];
+                int end;
+
+                if(m_sparse.isCompressed())
+                    end = outer[i+1];
+                else
+                    end = id + inner_non_zeros[i];
+
+                for (; id < end; ++id)
+                    {
+                    unsigned int col = i;
+                    unsigned int row = inner[id];
+
+                    // set pointer to index in sparse_val
+                    h_sparse_idxlookup.data[col*n_constraint+row] = id;
+                    }
+                }
+            }
+
+        // Compute the ordering permutation vector from the structural pattern of A
+        m_sparse_solver.analyzePattern(m_sparse);
+
+        if (m_prof)
+            m_prof->pop();
+        }
+
+    if (m_prof)
+        m_prof->push("refactor/solve");
+
+    // Compute the numerical factorization
+    m_sparse_solver.factorize(m_sparse);
+
+    if (m_sparse_solver.info())
+        {
+        m_exec_conf->msg->error() << "Could not solve linear system of constraint equations." << std::endl;
+        throw std::runtime_error("Error evaluating constraint forces.\n");
+        }
+
+        {
+        // access RHS and solution vector
+        ArrayHandle<double> h_cvec(m_cvec, access_location::host, access_mode::read);
+        ArrayHandle<double> h_lagrange(m_lagrange, access_location::host, access_mode::overwrite);
+        Eigen::Map<Eigen::VectorXd> map_vec(h_cvec.data, n_constraint);
+        Eigen::Map<Eigen::VectorXd> map_lagrange(h_lagrange.data, n_constraint);
+
+        //Use the factors to solve the linear system
+        map_lagrange = m_sparse_solver.solve(map_vec);
+        }
+
+    if (m_prof)
+        m_prof->pop();
+
+    if (m_prof)
+        m_prof->pop();
 
     // a sparse matrix should have been constructed, resize values array
     m_sparse_val.resize(m_sparse.data().size());
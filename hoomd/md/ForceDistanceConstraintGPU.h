@@ -11,6 +11,8 @@
 
 #include <hoomd/extern/nano-signal-slot/nano_signal_slot.hpp>
 
+#include <Eigen/SparseLU>
+
 #ifdef CUSOLVER_AVAILABLE
 #include <cusparse.h>
 
@@ -39,6 +41,9 @@
 
 /*! Implements a pairwise distance constraint on the GPU
 
+    The GPU implementation fills the full constraint matrix and factorizes it with cuSOLVER, or with Eigen's
+    SparseLU on the host when cuSOLVER is not available.
+
     See Integrator for detailed documentation on constraint force implementation.
     \ingroup computes
 */
@@ -68,6 +73,10 @@ class ForceDistanceConstraintGPU : public ForceDistanceConstraint
         std::unique_ptr<Autotuner> m_tuner_fill;  //!< Autotuner for filling the constraint matrix
         std::unique_ptr<Autotuner> m_tuner_force; //!< Autotuner for populating the force array
 
+        GPUVector<double> m_cmatrix;                //!< The matrix for the constraint force equation (column-major)
+        GPUFlags<unsigned int> m_condition;         //!< ==1 if sparsity pattern has changed
+        GPUVector<int> m_sparse_idxlookup;          //!< Reverse lookup from column-major to sparse matrix element
+
         #ifdef CUSOLVER_AVAILABLE
         cusparseHandle_t m_cusparse_handle;                //!< cuSPARSE handle
         cusparseMatDescr_t m_cusparse_mat_descr;           //!< Persistent matrix descriptor
@@ -109,6 +118,10 @@ class ForceDistanceConstraintGPU : public ForceDistanceConstraint
         int m_nnz_tot;                     //!< Total number of non-zero elements
         GPUVector<int> m_csr_rowptr;       //!< Row offset for CSR
         GPUVector<int> m_csr_colind;       //!< Column index for CSR
+        #else
+        Eigen::SparseMatrix<double, Eigen::ColMajor> m_sparse;    //!< The sparse constraint matrix representation
+        Eigen::SparseLU<Eigen::SparseMatrix<double, Eigen::ColMajor>, Eigen::COLAMDOrdering<int> > m_sparse_solver;
+            //!< The persistent state of the sparse matrix solver
         #endif
 
         GPUVector<double> m_sparse_val;    //!< Sparse matrix value list
@@ -28,6 +28,12 @@ class Communicator;
 
 #include <pybind11/pybind11.h>
 
+#ifdef ENABLE_TBB
+#include <tbb/blocked_range.h>
+#include <tbb/parallel_for.h>
+#include <tbb/parallel_reduce.h>
+#endif
+
 //! Integrates part of the system forward in two steps
 /*! \b Overview
     A large class of integrators can be implemented in two steps:
@@ -258,6 +264,14 @@ class PYBIND11_EXPORT IntegrationMethodTwoStep
         //! Set whether this restart is valid
         void setValidRestart(bool b) { m_valid_restart = b; }
 
+        //! Apply a kernel to every local member of the group
+        template<class Kernel>
+        void forEachMember(const Kernel& kernel) const;
+
+        //! Sum the values returned by a kernel over every local member of the group
+        template<class Kernel>
+        Scalar sumOverMembers(const Kernel& kernel) const;
+
 #ifdef ENABLE_MPI
         std::shared_ptr<Communicator> m_comm;             //!< The communicator to use for MPI
 #endif
@@ -266,6 +280,103 @@ class PYBIND11_EXPORT IntegrationMethodTwoStep
         bool m_valid_restart;                               //!< True if the restart info was valid when loading
     };
 
+/*! \param kernel Callable with the signature void(unsigned int j), called once with the particle index \a j of each
+           local member of the group
+
+    The kernel must only modify the data of particle \a j. When TBB is enabled, the members are distributed over the
+    threads of the task arena. The group index list is sorted, so when it spans a contiguous range of particle indices
+    the loop runs over that range directly. This avoids the indirection through the index list and allows the
+    compiler to vectorize the kernel.
+*/
+template<class Kernel>
+void IntegrationMethodTwoStep::forEachMember(const Kernel& kernel) const
+    {
+    const unsigned int group_size = m_group->getNumMembers();
+    if (group_size == 0)
+        return;
+
+    ArrayHandle<unsigned int> h_index(m_group->getIndexArray(), access_location::host, access_mode::read);
+    const unsigned int *index = h_index.data;
+    const unsigned int first = index[0];
+    const bool contiguous = (index[group_size-1] - first + 1 == group_size);
+
+    auto process = [&](unsigned int begin, unsigned int end)
+        {
+        if (contiguous)
+            {
+            for (unsigned int j = first + begin; j < first + end; j++)
+                kernel(j);
+            }
+        else
+            {
+            for (unsigned int group_idx = begin; group_idx < end; group_idx++)
+                kernel(index[group_idx]);
+            }
+        };
+
+    #ifdef ENABLE_TBB
+    m_exec_conf->getTaskArena()->execute([&]{
+    tbb::parallel_for(tbb::blocked_range<unsigned int>(0, group_size),
+        [&](const tbb::blocked_range<unsigned int>& r)
+            {
+            process(r.begin(), r.end());
+            });
+    }); // end task arena execute()
+    #else
+    process(0, group_size);
+    #endif
+    }
+
+/*! \param kernel Callable with the signature Scalar(unsigned int j), called once with the particle index \a j of each
+           local member of the group
+    \returns The sum of the kernel values over the local members
+
+    The same rules apply to \a kernel as in forEachMember().
+*/
+template<class Kernel>
+Scalar IntegrationMethodTwoStep::sumOverMembers(const Kernel& kernel) const
+    {
+    const unsigned int group_size = m_group->getNumMembers();
+    if (group_size == 0)
+        return Scalar(0.0);
+
+    ArrayHandle<unsigned int> h_index(m_group->getIndexArray(), access_location::host, access_mode::read);
+    const unsigned int *index = h_index.data;
+    const unsigned int first = index[0];
+    const bool contiguous = (index[group_size-1] - first + 1 == group_size);
+
+    auto process = [&](unsigned int begin, unsigned int end, Scalar sum)
+        {
+        if (contiguous)
+            {
+            for (unsigned int j = first + begin; j < first + end; j++)
+                sum += kernel(j);
+            }
+        else
+            {
+            for (unsigned int group_idx = begin; group_idx < end; group_idx++)
+                sum += kernel(index[group_idx]);
+            }
+        return sum;
+        };
+
+    #ifdef ENABLE_TBB
+    Scalar sum(0.0);
+    m_exec_conf->getTaskArena()->execute([&]{
+    sum = tbb::parallel_reduce(tbb::blocked_range<unsigned int>(0, group_size),
+        Scalar(0.0),
+        [&](const tbb::blocked_range<unsigned int>& r, Scalar partial_sum)->Scalar
+            {
+            return process(r.begin(), r.end(), partial_sum);
+            },
+        [](Scalar x, Scalar y)->Scalar { return x+y; });
+    }); // end task arena execute()
+    return sum;
+    #else
+    return process(0, group_size, Scalar(0.0));
+    #endif
+    }
+
 //! Exports the IntegrationMethodTwoStep class to python
 void export_IntegrationMethodTwoStep(pybind11::module& m);
 
@@ -20,14 +20,11 @@ namespace py = pybind11;
 
 NeighborListBinned::NeighborListBinned(std::shared_ptr<SystemDefinition> sysdef,
                                        Scalar r_buff)
-    : NeighborList(sysdef, r_buff), m_cl(std::make_shared<CellList>(sysdef))
+    : NeighborList(sysdef, r_buff)
     {
     m_exec_conf->msg->notice(5) << "Constructing NeighborListBinned" << endl;
 
-    m_cl->setRadius(1);
-    m_cl->setComputeXYZF(true);
-    m_cl->setComputeTDB(false);
-    m_cl->setFlagIndex();
+    requestCellList(Scalar(1.0));
     }
 
 NeighborListBinned::~NeighborListBinned()
@@ -35,6 +32,29 @@ NeighborListBinned::~NeighborListBinned()
     m_exec_conf->msg->notice(5) << "Destroying NeighborListBinned" << endl;
     }
 
+/*! \param nominal_width Minimum width of the cells
+
+    Neighbor lists with the same cutoff (and other operations that bin particles the same way) share one cell list
+    through SystemDefinition::getSharedCellList().
+*/
+void NeighborListBinned::requestCellList(Scalar nominal_width)
+    {
+    auto cl = std::make_shared<CellList>(m_sysdef);
+    cl->setRadius(1);
+    cl->setComputeXYZF(true);
+    cl->setComputeTDB(false);
+    cl->setFlagIndex();
+    cl->setSortCellList(m_deterministic);
+    cl->setNominalWidth(nominal_width);
+
+    #ifdef ENABLE_MPI
+    if (m_comm)
+        cl->setCommunicator(m_comm);
+    #endif
+
+    m_cl = m_sysdef->getSharedCellList(cl);
+    }
+
 void NeighborListBinned::buildNlist(uint64_t timestep)
     {
     // update the cell list size if needed
@@ -44,7 +64,7 @@ void NeighborListBinned::buildNlist(uint64_t timestep)
         if (m_diameter_shift)
             rmax += m_d_max - Scalar(1.0);
 
-        m_cl->setNominalWidth(rmax);
+        requestCellList(rmax);
         m_update_cell_size = false;
         }
 
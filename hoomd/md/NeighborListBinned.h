@@ -45,13 +45,20 @@ class PYBIND11_EXPORT NeighborListBinned : public NeighborList
         /// Make the neighborlist deterministic
         void setDeterministic(bool deterministic)
             {
-            m_cl->setSortCellList(deterministic);
+            m_deterministic = deterministic;
+            m_update_cell_size = true;
             }
 
         /// Get the deterministic flag
         bool getDeterministic()
             {
-            return m_cl->getSortCellList();
+            return m_deterministic;
+            }
+
+        /// Get the cell list used to build the neighbor list
+        std::shared_ptr<CellList> getCellList() const
+            {
+            return m_cl;
             }
 
         #ifdef ENABLE_MPI
@@ -73,6 +80,12 @@ class PYBIND11_EXPORT NeighborListBinned : public NeighborList
         /// Track when the cell size needs to be updated
         bool m_update_cell_size = true;
 
+        /// Sort the cell list to make the neighbor list deterministic
+        bool m_deterministic = false;
+
+        /// Get a cell list with the given nominal width, shared with other operations when possible
+        void requestCellList(Scalar nominal_width);
+
         //! Builds the neighbor list
         virtual void buildNlist(uint64_t timestep);
     };
@@ -19,20 +19,12 @@ namespace py = pybind11;
 
 NeighborListGPUBinned::NeighborListGPUBinned(std::shared_ptr<SystemDefinition> sysdef,
                                              Scalar r_buff)
-    : NeighborListGPU(sysdef, r_buff), m_cl(std::make_shared<CellListGPU>(sysdef)), m_param(0)
+    : NeighborListGPU(sysdef, r_buff), m_param(0)
     {
     // with multiple GPUs, use indirect access via particle data arrays
     m_use_index = m_exec_conf->allConcurrentManagedAccess();
 
-    // with multiple GPUs, request a cell list per device
-    m_cl->setPerDevice(m_exec_conf->allConcurrentManagedAccess());
-
-    m_cl->setComputeXYZF(! m_use_index);
-    m_cl->setComputeIdx(m_use_index);
-
-    m_cl->setRadius(1);
-    m_cl->setComputeTDB(!m_use_index);
-    m_cl->setFlagIndex();
+    requestCellList(Scalar(1.0));
 
     CHECK_CUDA_ERROR();
 
@@ -60,6 +52,35 @@ NeighborListGPUBinned::~NeighborListGPUBinned()
     {
     }
 
+/*! \param nominal_width Minimum width of the cells
+
+    Neighbor lists with the same cutoff (and other operations that bin particles the same way) share one cell list
+    through SystemDefinition::getSharedCellList().
+*/
+void NeighborListGPUBinned::requestCellList(Scalar nominal_width)
+    {
+    auto cl = std::make_shared<CellListGPU>(m_sysdef);
+
+    // with multiple GPUs, request a cell list per device
+    cl->setPerDevice(m_exec_conf->allConcurrentManagedAccess());
+
+    cl->setComputeXYZF(! m_use_index);
+    cl->setComputeIdx(m_use_index);
+
+    cl->setRadius(1);
+    cl->setComputeTDB(!m_use_index);
+    cl->setFlagIndex();
+    cl->setSortCellList(m_deterministic);
+    cl->setNominalWidth(nominal_width);
+
+    #ifdef ENABLE_MPI
+    if (m_comm)
+        cl->setCommunicator(m_comm);
+    #endif
+
+    m_cl = m_sysdef->getSharedCellList(cl);
+    }
+
 void NeighborListGPUBinned::buildNlist(uint64_t timestep)
     {
     if (m_storage_mode != full)
@@ -75,7 +96,7 @@ void NeighborListGPUBinned::buildNlist(uint64_t timestep)
         if (m_diameter_shift)
             rmax += m_d_max - Scalar(1.0);
 
-        m_cl->setNominalWidth(rmax);
+        requestCellList(rmax);
         m_update_cell_size = false;
         }
 
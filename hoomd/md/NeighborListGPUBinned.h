@@ -65,13 +65,14 @@ class PYBIND11_EXPORT NeighborListGPUBinned : public NeighborListGPU
         /// Make the neighborlist deterministic
         void setDeterministic(bool deterministic)
             {
-            m_cl->setSortCellList(deterministic);
+            m_deterministic = deterministic;
+            m_update_cell_size = true;
             }
 
         /// Get the deterministic flag
         bool getDeterministic()
             {
-            return m_cl->getSortCellList();
+            return m_deterministic;
             }
 
         #ifdef ENABLE_MPI
@@ -96,6 +97,12 @@ class PYBIND11_EXPORT NeighborListGPUBinned : public NeighborListGPU
         /// Track when the cell size needs to be updated
         bool m_update_cell_size = true;
 
+        /// Sort the cell list to make the neighbor list deterministic
+        bool m_deterministic = false;
+
+        /// Get a cell list with the given nominal width, shared with other operations when possible
+        void requestCellList(Scalar nominal_width);
+
         std::unique_ptr<Autotuner> m_tuner;   //!< Autotuner for block size and threads per particle
 
         //! Builds the neighbor list
@@ -7,6 +7,9 @@
 
 namespace py = pybind11;
 
+#include <pybind11/numpy.h>
+
+#include <algorithm>
 #include <stdexcept>
 
 /*! \file TablePotential.cc
@@ -17,14 +20,12 @@ using namespace std;
 
 /*! \param sysdef System to compute forces on
     \param nlist Neighborlist to use for computing the forces
-    \param table_width Width the tables will be in memory
     \param log_suffix Name given to this instance of the table potential
 */
 TablePotential::TablePotential(std::shared_ptr<SystemDefinition> sysdef,
                                std::shared_ptr<NeighborList> nlist,
-                               unsigned int table_width,
                                const std::string& log_suffix)
-        : ForceCompute(sysdef), m_nlist(nlist), m_table_width(table_width)
+        : ForceCompute(sysdef), m_nlist(nlist)
     {
     m_exec_conf->msg->notice(5) << "Constructing TablePotential" << endl;
 
@@ -32,52 +33,23 @@ TablePotential::TablePotential(std::shared_ptr<SystemDefinition> sysdef,
     assert(m_pdata);
     assert(m_nlist);
 
-    if (table_width == 0)
-        {
-        m_exec_conf->msg->error() << "pair.table: Table width of 0 is invalid" << endl;
-        throw runtime_error("Error initializing TablePotential");
-        }
-
     // initialize the number of types value
     m_ntypes = m_pdata->getNTypes();
     assert(m_ntypes > 0);
 
-    // allocate storage for the tables and parameters
+    // no type pair has a table yet
     m_type_pair_idx = Index2DUpperTriangular(m_ntypes);
-    GlobalArray<Scalar2> tables(m_table_width, m_type_pair_idx.getNumElements(), m_exec_conf);
-    m_tables.swap(tables);
-    TAG_ALLOCATION(m_tables);
-
-    GlobalArray<Scalar4> params(m_type_pair_idx.getNumElements(), m_exec_conf);
-    m_params.swap(params);
-    TAG_ALLOCATION(m_params);
+    m_V.resize(m_type_pair_idx.getNumElements());
+    m_F.resize(m_type_pair_idx.getNumElements());
+    m_r_range.resize(m_type_pair_idx.getNumElements(), make_scalar2(0, 0));
 
     Index2D full_type_pair_idx(m_pdata->getNTypes());
     m_r_cut_nlist = std::make_shared<GlobalArray<Scalar>>(full_type_pair_idx.getNumElements(),
                                                           m_exec_conf);
     nlist->addRCutMatrix(m_r_cut_nlist);
 
-    #if defined(ENABLE_HIP) && defined(__HIP_PLATFORM_NVCC__)
-    if (m_exec_conf->isCUDAEnabled() && m_exec_conf->allConcurrentManagedAccess())
-        {
-        cudaMemAdvise(m_tables.get(), m_tables.getNumElements()*sizeof(Scalar2), cudaMemAdviseSetReadMostly, 0);
-        cudaMemAdvise(m_params.get(), m_params.getNumElements()*sizeof(Scalar4), cudaMemAdviseSetReadMostly, 0);
-
-        // prefetch
-        auto& gpu_map = m_exec_conf->getGPUIds();
-
-        for (unsigned int idev = 0; idev < m_exec_conf->getNumActiveGPUs(); ++idev)
-            {
-            // prefetch data on all GPUs
-            cudaMemPrefetchAsync(m_tables.get(), sizeof(Scalar2)*m_tables.getNumElements(), gpu_map[idev]);
-            cudaMemPrefetchAsync(m_params.get(), sizeof(Scalar4)*m_params.getNumElements(), gpu_map[idev]);
-            }
-        CHECK_CUDA_ERROR();
-        }
-    #endif
-
-    assert(!m_tables.isNull());
-    assert(!m_params.isNull());
+    // allocate storage for the tables and parameters
+    packTables();
 
     m_log_name = std::string("pair_table_energy") + log_suffix;
 
@@ -103,49 +75,46 @@ void TablePotential::slotNumTypesChange()
     m_ntypes = m_pdata->getNTypes();
     assert(m_ntypes > 0);
 
-    // resize the table array
     Index2DUpperTriangular new_type_pair_idx(m_ntypes);
     Index2D old_full_type_pair_idx(m_type_pair_idx.getW());
     Index2D new_full_type_pair_idx(m_ntypes);
-    m_tables.resize(m_table_width, new_type_pair_idx.getNumElements());
+    const unsigned int n_common_types = std::min(m_ntypes, m_type_pair_idx.getW());
 
-    // allocate new parameter arrays
-    GlobalArray<Scalar4> new_params(new_type_pair_idx.getNumElements(), m_exec_conf);
+    // move the tables of the existing type pairs to their new index
+    std::vector< std::vector<Scalar> > new_V(new_type_pair_idx.getNumElements());
+    std::vector< std::vector<Scalar> > new_F(new_type_pair_idx.getNumElements());
+    std::vector<Scalar2> new_r_range(new_type_pair_idx.getNumElements(), make_scalar2(0, 0));
     GlobalArray<Scalar> new_r_cut_nlist(new_full_type_pair_idx.getNumElements(), m_exec_conf);
 
         {
-        // copy existing data into them
         ArrayHandle<Scalar> h_new_r_cut_nlist(new_r_cut_nlist,
                                                 access_location::host,
                                                 access_mode::overwrite);
         ArrayHandle<Scalar> h_r_cut_nlist(*m_r_cut_nlist,
                                             access_location::host,
-                                            access_mode::overwrite);
-        ArrayHandle<Scalar4> h_new_params(new_params,
-                                          access_location::host,
-                                          access_mode::overwrite);
-        ArrayHandle<Scalar4> h_params(m_params,
-                                      access_location::host,
-                                      access_mode::overwrite);
-
-        for (unsigned int i = 0; i < new_type_pair_idx.getW(); i++)
+                                            access_mode::read);
+
+        for (unsigned int i = 0; i < n_common_types; i++)
             {
-            for (unsigned int j = 0; j < new_type_pair_idx.getW(); j++)
+            for (unsigned int j = 0; j < n_common_types; j++)
                 {
                 h_new_r_cut_nlist.data[new_full_type_pair_idx(i,j)] =
                     h_r_cut_nlist.data[old_full_type_pair_idx(i,j)];
-                if (i < j)
+                if (i <= j)
                     {
-                    h_new_params.data[new_type_pair_idx(i,j)] =
-                        h_params.data[m_type_pair_idx(i,j)];
+                    const unsigned int old_idx = m_type_pair_idx(i,j);
+                    const unsigned int new_idx = new_type_pair_idx(i,j);
+                    new_V[new_idx].swap(m_V[old_idx]);
+                    new_F[new_idx].swap(m_F[old_idx]);
+                    new_r_range[new_idx] = m_r_range[old_idx];
                     }
                 }
             }
         }
 
-    // swap the new arrays in
-    m_params.swap(new_params);
-    TAG_ALLOCATION(m_params);
+    m_V.swap(new_V);
+    m_F.swap(new_F);
+    m_r_range.swap(new_r_range);
 
     // except for the r_cut_nlist which the nlist also refers to, copy the new data over
     *m_r_cut_nlist = new_r_cut_nlist;
@@ -153,10 +122,80 @@ void TablePotential::slotNumTypesChange()
     // set the new type pair indexer
     m_type_pair_idx = new_type_pair_idx;
 
+    packTables();
+    }
+
+/*! Computes the cubic Hermite coefficients of every table given so far and packs them, together with the per type
+    pair parameters, into m_tables and m_params. See TablePotential for the layout.
+*/
+void TablePotential::packTables()
+    {
+    // start each table on a new cache line
+    const unsigned int entries_per_line = std::max((unsigned int)(64 / sizeof(Scalar4)), 1u);
+
+    const unsigned int n_pairs = m_type_pair_idx.getNumElements();
+    std::vector<unsigned int> offsets(n_pairs);
+    unsigned int total_size = 0;
+    for (unsigned int cur_pair = 0; cur_pair < n_pairs; cur_pair++)
+        {
+        offsets[cur_pair] = total_size;
+        const unsigned int width = (unsigned int)m_V[cur_pair].size();
+        total_size += (width + entries_per_line - 1) / entries_per_line * entries_per_line;
+        }
+
+    // always allocate at least one cache line
+    GlobalArray<Scalar4> tables(std::max(total_size, entries_per_line), m_exec_conf);
+    m_tables.swap(tables);
+    TAG_ALLOCATION(m_tables);
+
+    GlobalArray<Scalar4> params(n_pairs, m_exec_conf);
+    m_params.swap(params);
+    TAG_ALLOCATION(m_params);
+
+        {
+        ArrayHandle<Scalar4> h_tables(m_tables, access_location::host, access_mode::overwrite);
+        ArrayHandle<Scalar4> h_params(m_params, access_location::host, access_mode::overwrite);
+        memset((void*)h_tables.data, 0, sizeof(Scalar4)*m_tables.getNumElements());
+
+        for (unsigned int cur_pair = 0; cur_pair < n_pairs; cur_pair++)
+            {
+            const std::vector<Scalar>& V = m_V[cur_pair];
+            const std::vector<Scalar>& F = m_F[cur_pair];
+            const unsigned int width = (unsigned int)V.size();
+
+            if (width < 2)
+                {
+                // no table for this pair, r < rmax is never true
+                h_params.data[cur_pair] = make_scalar4(0, 0, 0, __int_as_scalar(0));
+                continue;
+                }
+
+            const Scalar rmin = m_r_range[cur_pair].x;
+            const Scalar rmax = m_r_range[cur_pair].y;
+            const Scalar dr = (rmax - rmin) / Scalar(width - 1);
+            h_params.data[cur_pair] = make_scalar4(rmin, rmax, Scalar(1.0) / dr, __int_as_scalar(offsets[cur_pair]));
+
+            Scalar4 *coeffs = h_tables.data + offsets[cur_pair];
+            for (unsigned int i = 0; i < width - 1; i++)
+                {
+                // slopes dV/dt at both ends of the interval, in units of the table spacing
+                const Scalar m0 = -F[i]*dr;
+                const Scalar m1 = -F[i+1]*dr;
+                coeffs[i] = make_scalar4(V[i],
+                                         m0,
+                                         Scalar(3.0)*(V[i+1] - V[i]) - Scalar(2.0)*m0 - m1,
+                                         Scalar(2.0)*(V[i] - V[i+1]) + m0 + m1);
+                }
+
+            // the last point evaluates to V and F at rmax
+            coeffs[width - 1] = make_scalar4(V[width - 1], -F[width - 1]*dr, 0, 0);
+            }
+        }
+
     #if defined(ENABLE_HIP) && defined(__HIP_PLATFORM_NVCC__)
     if (m_exec_conf->isCUDAEnabled() && m_exec_conf->allConcurrentManagedAccess())
         {
-        cudaMemAdvise(m_tables.get(), m_tables.getNumElements()*sizeof(Scalar2), cudaMemAdviseSetReadMostly, 0);
+        cudaMemAdvise(m_tables.get(), m_tables.getNumElements()*sizeof(Scalar4), cudaMemAdviseSetReadMostly, 0);
         cudaMemAdvise(m_params.get(), m_params.getNumElements()*sizeof(Scalar4), cudaMemAdviseSetReadMostly, 0);
 
         // prefetch
@@ -165,7 +204,7 @@ void TablePotential::slotNumTypesChange()
         for (unsigned int idev = 0; idev < m_exec_conf->getNumActiveGPUs(); ++idev)
             {
             // prefetch data on all GPUs
-            cudaMemPrefetchAsync(m_tables.get(), sizeof(Scalar2)*m_tables.getNumElements(), gpu_map[idev]);
+            cudaMemPrefetchAsync(m_tables.get(), sizeof(Scalar4)*m_tables.getNumElements(), gpu_map[idev]);
             cudaMemPrefetchAsync(m_params.get(), sizeof(Scalar4)*m_params.getNumElements(), gpu_map[idev]);
             }
         CHECK_CUDA_ERROR();
@@ -182,7 +221,7 @@ void TablePotential::slotNumTypesChange()
     \param F Table for the potential F (must be - dV / dr)
     \param rmin Minimum r in the potential
     \param rmax Maximum r in the potential
-    \post Values from \a V and \a F are copied into the internal storage for type pair (typ1, typ2)
+    \post The spline coefficients computed from \a V and \a F are stored for type pair (typ1, typ2)
     \note There is no need to call this again for typ2,typ1
     \note See TablePotential for a detailed definition of rmin and rmax
 */
@@ -193,39 +232,33 @@ void TablePotential::setTable(unsigned int typ1,
                               Scalar rmin,
                               Scalar rmax)
     {
-    // helpers to compute indices
-    unsigned int cur_table_index = Index2DUpperTriangular(m_ntypes)(typ1, typ2);
-    Index2D table_value(m_table_width);
-
-    // access the arrays
-    ArrayHandle<Scalar2> h_tables(m_tables, access_location::host, access_mode::readwrite);
-    ArrayHandle<Scalar4> h_params(m_params, access_location::host, access_mode::readwrite);
+    if (typ1 >= m_ntypes || typ2 >= m_ntypes)
+        {
+        m_exec_conf->msg->error() << "pair.table: Trying to set table for a non existent type! "
+                  << typ1 << "," << typ2 << endl;
+        throw runtime_error("Error setting table in TablePotential");
+        }
 
     // range check on the parameters
     if (rmin < 0 || rmax < 0 || rmax <= rmin)
         {
         m_exec_conf->msg->error() << "pair.table rmin, rmax (" << rmin << "," << rmax
              << ") is invalid" << endl;
-        throw runtime_error("Error initializing TablePotential");
+        throw runtime_error("Error setting table in TablePotential");
         }
 
-    if (V.size() != m_table_width || F.size() != m_table_width)
+    if (V.size() != F.size() || V.size() < 2)
         {
-        m_exec_conf->msg->error() << "pair.table: table provided to setTable is not of the correct size" << endl;
-        throw runtime_error("Error initializing TablePotential");
+        m_exec_conf->msg->error() << "pair.table: V and F must have the same length of at least 2" << endl;
+        throw runtime_error("Error setting table in TablePotential");
         }
 
-    // fill out the parameters
-    h_params.data[cur_table_index].x = rmin;
-    h_params.data[cur_table_index].y = rmax;
-    h_params.data[cur_table_index].z = (rmax - rmin) / Scalar(m_table_width - 1);
+    const unsigned int cur_table_index = m_type_pair_idx(typ1, typ2);
+    m_V[cur_table_index] = V;
+    m_F[cur_table_index] = F;
+    m_r_range[cur_table_index] = make_scalar2(rmin, rmax);
 
-    // fill out the table
-    for (unsigned int i = 0; i < m_table_width; i++)
-        {
-        h_tables.data[table_value(i, cur_table_index)].x = V[i];
-        h_tables.data[table_value(i, cur_table_index)].y = F[i];
-        }
+    packTables();
 
     // update the r_cut_nlist value
         {
@@ -239,6 +272,45 @@ void TablePotential::setTable(unsigned int typ1,
     m_nlist->notifyRCutMatrixChange();
     }
 
+/*! \param typ Tuple of the names of the two particle types
+    \param params Dictionary with the keys r_min, r_max, V and F
+*/
+void TablePotential::setParamsPython(pybind11::tuple typ, pybind11::dict params)
+    {
+    auto typ1 = m_pdata->getTypeByName(typ[0].cast<std::string>());
+    auto typ2 = m_pdata->getTypeByName(typ[1].cast<std::string>());
+
+    typedef py::array_t<Scalar, py::array::c_style | py::array::forcecast> table_array;
+    table_array V = params["V"].cast<table_array>();
+    table_array F = params["F"].cast<table_array>();
+    if (V.ndim() != 1 || F.ndim() != 1)
+        throw runtime_error("V and F must be one dimensional arrays");
+
+    setTable(typ1,
+             typ2,
+             std::vector<Scalar>(V.data(), V.data() + V.size()),
+             std::vector<Scalar>(F.data(), F.data() + F.size()),
+             params["r_min"].cast<Scalar>(),
+             params["r_max"].cast<Scalar>());
+    }
+
+/*! \param typ Tuple of the names of the two particle types
+    \returns Dictionary with the keys r_min, r_max, V and F
+*/
+pybind11::dict TablePotential::getParams(pybind11::tuple typ)
+    {
+    auto typ1 = m_pdata->getTypeByName(typ[0].cast<std::string>());
+    auto typ2 = m_pdata->getTypeByName(typ[1].cast<std::string>());
+    const unsigned int cur_table_index = m_type_pair_idx(typ1, typ2);
+
+    py::dict params;
+    params["r_min"] = m_r_range[cur_table_index].x;
+    params["r_max"] = m_r_range[cur_table_index].y;
+    params["V"] = py::array_t<Scalar>(m_V[cur_table_index].size(), m_V[cur_table_index].data());
+    params["F"] = py::array_t<Scalar>(m_F[cur_table_index].size(), m_F[cur_table_index].data());
+    return params;
+    }
+
 /*! TablePotential provides
     - \c pair_table_energy
 */
@@ -304,12 +376,11 @@ void TablePotential::computeForces(uint64_t timestep)
     const BoxDim& box = m_pdata->getBox();
 
     // access the table data
-    ArrayHandle<Scalar2> h_tables(m_tables, access_location::host, access_mode::read);
+    ArrayHandle<Scalar4> h_tables(m_tables, access_location::host, access_mode::read);
     ArrayHandle<Scalar4> h_params(m_params, access_location::host, access_mode::read);
 
     // index calculation helpers
     Index2DUpperTriangular table_index(m_ntypes);
-    Index2D table_value(m_table_width);
 
     // for each particle
     for (int i = 0; i < (int) m_pdata->getN(); i++)
@@ -357,7 +428,8 @@ void TablePotential::computeForces(uint64_t timestep)
             Scalar4 params = h_params.data[cur_table_index];
             Scalar rmin = params.x;
             Scalar rmax = params.y;
-            Scalar delta_r = params.z;
+            Scalar inv_dr = params.z;
+            const Scalar4 *coeffs = h_tables.data + __scalar_as_int(params.w);
 
             // start computing the force
             Scalar rsq = dot(dx, dx);
@@ -367,24 +439,18 @@ void TablePotential::computeForces(uint64_t timestep)
             if (r < rmax && r >= rmin)
                 {
                 // precomputed term
-                Scalar value_f = (r - rmin) / delta_r;
+                Scalar value_f = (r - rmin) * inv_dr;
 
-                // compute index into the table and read in values
+                // compute index into the table and read in the spline coefficients
                 unsigned int value_i = (unsigned int)floor(value_f);
-                Scalar2 VF0 = h_tables.data[table_value(value_i, cur_table_index)];
-                Scalar2 VF1 = h_tables.data[table_value(value_i+1, cur_table_index)];
-                // unpack the data
-                Scalar V0 = VF0.x;
-                Scalar V1 = VF1.x;
-                Scalar F0 = VF0.y;
-                Scalar F1 = VF1.y;
+                Scalar4 c = coeffs[value_i];
 
-                // compute the linear interpolation coefficient
-                Scalar f = value_f - Scalar(value_i);
+                // fraction of the way between the two table points
+                Scalar t = value_f - Scalar(value_i);
 
-                // interpolate to get V and F;
-                Scalar V = V0 + f * (V1 - V0);
-                Scalar F = F0 + f * (F1 - F0);
+                // evaluate the spline and its derivative to get V and F
+                Scalar V = c.x + t * (c.y + t * (c.z + t * c.w));
+                Scalar F = -(c.y + t * (Scalar(2.0) * c.z + Scalar(3.0) * t * c.w)) * inv_dr;
 
                 // convert to standard variables used by the other pair computes in HOOMD-blue
                 Scalar forcemag_divr = Scalar(0.0);
@@ -445,7 +511,9 @@ void TablePotential::computeForces(uint64_t timestep)
 void export_TablePotential(py::module& m)
     {
     py::class_<TablePotential, ForceCompute, std::shared_ptr<TablePotential> >(m, "TablePotential")
-    .def(py::init< std::shared_ptr<SystemDefinition>, std::shared_ptr<NeighborList>, unsigned int, const std::string& >())
+    .def(py::init< std::shared_ptr<SystemDefinition>, std::shared_ptr<NeighborList>, const std::string& >())
     .def("setTable", &TablePotential::setTable)
+    .def("setParams", &TablePotential::setParamsPython)
+    .def("getParams", &TablePotential::getParams)
     ;
     }
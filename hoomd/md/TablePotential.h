@@ -27,35 +27,34 @@
 //! Computes the potential and force on each particle based on values given in a table
 /*! \b Overview
     Pair potentials and forces are evaluated for all particle pairs in the system within the given cutoff distances.
-    Both the potentials and forces** are provided the tables V(r) and F(r) at discreet \a r values between \a rmin and
-    \a rmax. Evaluations are performed by simple linear interpolation, thus why F(r) must be explicitly specified to
-    avoid large errors resulting from the numerical derivative. Note that F(r) should store - dV/dr.
+    Both the potentials and forces are provided the tables V(r) and F(r) at discreet \a r values between \a rmin and
+    \a rmax. Note that F(r) should store - dV/dr.
 
-    \b Table memory layout
+    V(0) is the value of V at r=rmin. V(i) is the value of V at r=rmin + dr * i where i is chosen such that r >= rmin
+    and r <= rmax. V(r) for r < rmin and >= rmax is 0. The same goes for F. Each type pair may use a different number
+    of points.
 
-    V(r) and F(r) are specified for each unique particle type pair. They will be indexed so that values of increasing r
-    go along the rows in memory for cache efficiency when reading values. The row index to put the potential at can be
-    determined using an Index2DUpperTriangular (typei, typej), as it will uniquely index each unique pair.
+    \b Interpolation
+    Between two points, V is interpolated by the cubic Hermite polynomial that matches V and its derivative -F at both
+    ends of the interval, and F is the negative derivative of this polynomial. The interpolated force is therefore
+    exactly consistent with the interpolated energy and both are continuous at the table points. For a given r, the
+    first point needed, i can be calculated via i = floorf((r - rmin) / dr) and the fraction between ri and ri+1 via
+    t = (r - rmin) / dr - Scalar(i). Then
 
-    To improve cache coherency even further, values for V and F will be interleaved like so: V1 F1 V2 F2 V3 F3 ... To
-    accomplish this, tables are stored with a value type of Scalar2, elem.x will be V and elem.y will be F. Since Fn,
-    Vn+1 and Fn+1 are read right after Vn, these are likely to be cache hits. Furthermore, on the GPU a single Scalar2
-    texture read can be used to access Vn and Fn.
+    V(r) = a_i + t * (b_i + t * (c_i + t * d_i))
+    F(r) = - (b_i + t * (2 c_i + 3 t d_i)) / dr
 
-    Three parameters need to be stored for each potential: rmin, rmax, and dr, the minimum r, maximum r, and spacing
-    between r values in the table respectively. For simple access on the GPU, these will be stored in a Scalar4 where
-    x is rmin, y is rmax, and z is dr. They are indexed with the same Index2DUpperTriangular as the tables themselves.
+    \b Table memory layout
 
-    V(0) is the value of V at r=rmin. V(i) is the value of V at r=rmin + dr * i where i is chosen such that r >= rmin
-    and r <= rmax. V(r) for r < rmin and > rmax is 0. The same goes for F. Thus V and F are defined between the region
-    [rmin,rmax], inclusive.
+    The polynomial coefficients are computed once in setTable() and stored as a Scalar4 (a, b, c, d) per table point,
+    so the evaluation of a pair needs a single aligned vector load, on the CPU and the GPU. The last point of each table
+    stores the constant extrapolation of V and F (c = d = 0), so r values that round to the last point need no special
+    case. The tables of all unique type pairs are packed one after another in a single array. Each table starts at a
+    multiple of the cache line size.
 
-    For ease of storing the data, all tables must be of the same number of points for all type pairs.
+    Four parameters are stored for each type pair in a Scalar4: x is rmin, y is rmax, z is 1/dr and w is the offset of
+    the table in the packed array (stored with __int_as_scalar). They are indexed by an Index2DUpperTriangular.
 
-    \b Interpolation
-    Values are interpolated linearly between two points straddling the given r. For a given r, the first point needed, i
-    can be calculated via i = floorf((r - rmin) / dr). The fraction between ri and ri+1 can be calculated via
-    f = (r - rmin) / dr - Scalar(i). And the linear interpolation can then be performed via V(r) ~= Vi + f * (Vi+1 - Vi)
     \ingroup computes
 */
 class PYBIND11_EXPORT TablePotential : public ForceCompute
@@ -64,7 +63,6 @@ class PYBIND11_EXPORT TablePotential : public ForceCompute
         //! Constructs the compute
         TablePotential(std::shared_ptr<SystemDefinition> sysdef,
                        std::shared_ptr<NeighborList> nlist,
-                       unsigned int table_width,
                        const std::string& log_suffix="");
 
         //! Destructor
@@ -78,6 +76,12 @@ class PYBIND11_EXPORT TablePotential : public ForceCompute
                               Scalar rmin,
                               Scalar rmax);
 
+        /// Set the table for a single type pair using a tuple of strings
+        virtual void setParamsPython(pybind11::tuple typ, pybind11::dict params);
+
+        /// Get the table for a single type pair using a tuple of strings
+        virtual pybind11::dict getParams(pybind11::tuple typ);
+
         //! Returns a list of log quantities this compute calculates
         virtual std::vector< std::string > getProvidedLogQuantities();
 
@@ -95,12 +99,20 @@ class PYBIND11_EXPORT TablePotential : public ForceCompute
 
     protected:
         std::shared_ptr<NeighborList> m_nlist;    //!< The neighborlist to use for the computation
-        unsigned int m_table_width;                 //!< Width of the tables in memory
         unsigned int m_ntypes;                      //!< Store the number of particle types
-        GlobalArray<Scalar2> m_tables;                  //!< Stored V and F tables
+        GlobalArray<Scalar4> m_tables;                  //!< Packed spline coefficients of all tables
         GlobalArray<Scalar4> m_params;                 //!< Parameters stored for each table
         std::string m_log_name;                     //!< Cached log name
 
+        /// Tables of V given for each type pair
+        std::vector< std::vector<Scalar> > m_V;
+
+        /// Tables of F given for each type pair
+        std::vector< std::vector<Scalar> > m_F;
+
+        /// rmin and rmax given for each type pair
+        std::vector<Scalar2> m_r_range;
+
         /// Indexer into the tables
         Index2DUpperTriangular m_type_pair_idx;
 
@@ -115,6 +127,9 @@ class PYBIND11_EXPORT TablePotential : public ForceCompute
 
         //! Method to be called when number of types changes
         virtual void slotNumTypesChange();
+
+        //! Compute the spline coefficients of all tables and pack them into m_tables
+        void packTables();
     };
 
 //! Exports the TablePotential class to python
@@ -18,14 +18,12 @@ using namespace std;
 
 /*! \param sysdef System to compute forces on
     \param nlist Neighborlist to use for computing the forces
-    \param table_width Width the tables will be in memory
     \param log_suffix Name given to this instance of the table potential
 */
 TablePotentialGPU::TablePotentialGPU(std::shared_ptr<SystemDefinition> sysdef,
                                      std::shared_ptr<NeighborList> nlist,
-                                     unsigned int table_width,
                                      const std::string& log_suffix)
-    : TablePotential(sysdef, nlist, table_width, log_suffix)
+    : TablePotential(sysdef, nlist, log_suffix)
     {
     // can't run on the GPU if there aren't any GPUs in the execution configuration
     if (!m_exec_conf->isCUDAEnabled())
@@ -71,7 +69,7 @@ void TablePotentialGPU::computeForces(uint64_t timestep)
     BoxDim box = m_pdata->getBox();
 
     // access the table data
-    ArrayHandle<Scalar2> d_tables(m_tables, access_location::device, access_mode::read);
+    ArrayHandle<Scalar4> d_tables(m_tables, access_location::device, access_mode::read);
     ArrayHandle<Scalar4> d_params(m_params, access_location::device, access_mode::read);
 
     ArrayHandle<Scalar4> d_force(m_force,access_location::device,access_mode::overwrite);
@@ -95,7 +93,6 @@ void TablePotentialGPU::computeForces(uint64_t timestep)
                              d_params.data,
                              this->m_nlist->getNListArray().getPitch(),
                              m_ntypes,
-                             m_table_width,
                              m_tuner->getParam(),
                              m_pdata->getGPUPartition());
 
@@ -113,7 +110,6 @@ void export_TablePotentialGPU(py::module& m)
     py::class_<TablePotentialGPU, TablePotential, std::shared_ptr<TablePotentialGPU> >(m, "TablePotentialGPU")
         .def(py::init< std::shared_ptr<SystemDefinition>,
                                 std::shared_ptr<NeighborList>,
-                                unsigned int,
                                 const std::string& >())
                                 ;
     }
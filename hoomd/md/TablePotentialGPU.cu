@@ -27,9 +27,9 @@
     \param d_n_neigh Device memory array listing the number of neighbors for each particle
     \param d_nlist Device memory array containing the neighbor list contents
     \param d_head_list Indexer for reading \a d_nlist
+    \param d_tables Packed spline coefficients of all tables
     \param d_params Parameters for each table associated with a type pair
     \param ntypes Number of particle types in the system
-    \param table_width Number of points in each table
     \param offset Offset in number of particles for this kernel
 
     See TablePotential for information on the memory layout.
@@ -46,16 +46,14 @@ __global__ void gpu_compute_table_forces_kernel(Scalar4* d_force,
                                                 const unsigned int *d_n_neigh,
                                                 const unsigned int *d_nlist,
                                                 const unsigned int *d_head_list,
-                                                const Scalar2 *d_tables,
+                                                const Scalar4 *d_tables,
                                                 const Scalar4 *d_params,
                                                 const unsigned int ntypes,
-                                                const unsigned int table_width,
                                                 const unsigned int offset
                                                 )
     {
     // index calculation helpers
     Index2DUpperTriangular table_index(ntypes);
-    Index2D table_value(table_width);
 
     // read in params for easy and fast access in the kernel
     HIP_DYNAMIC_SHARED( Scalar4, s_params)
@@ -121,7 +119,8 @@ __global__ void gpu_compute_table_forces_kernel(Scalar4* d_force,
         Scalar4 params = s_params[cur_table_index];
         Scalar rmin = params.x;
         Scalar rmax = params.y;
-        Scalar delta_r = params.z;
+        Scalar inv_dr = params.z;
+        unsigned int table_offset = __scalar_as_int(params.w);
 
         // calculate r
         Scalar rsq = dot(dx, dx);
@@ -130,25 +129,18 @@ __global__ void gpu_compute_table_forces_kernel(Scalar4* d_force,
         if (r < rmax && r >= rmin)
             {
             // precomputed term
-            Scalar value_f = (r - rmin) / delta_r;
+            Scalar value_f = (r - rmin) * inv_dr;
 
-            // compute index into the table and read in values
+            // compute index into the table and read in the spline coefficients
             unsigned int value_i = floor(value_f);
-            Scalar2 VF0 = __ldg(d_tables + table_value(value_i, cur_table_index));
-            Scalar2 VF1 = __ldg(d_tables + table_value(value_i+1, cur_table_index));
+            Scalar4 c = __ldg(d_tables + table_offset + value_i);
 
-            // unpack the data
-            Scalar V0 = VF0.x;
-            Scalar V1 = VF1.x;
-            Scalar F0 = VF0.y;
-            Scalar F1 = VF1.y;
+            // fraction of the way between the two table points
+            Scalar t = value_f - Scalar(value_i);
 
-            // compute the linear interpolation coefficient
-            Scalar f = value_f - Scalar(value_i);
-
-            // interpolate to get V and F;
-            Scalar V = V0 + f * (V1 - V0);
-            Scalar F = F0 + f * (F1 - F0);
+            // evaluate the spline and its derivative to get V and F
+            Scalar V = c.x + t * (c.y + t * (c.z + t * c.w));
+            Scalar F = -(c.y + t * (Scalar(2.0) * c.z + Scalar(3.0) * t * c.w)) * inv_dr;
 
             // convert to standard variables used by the other pair computes in HOOMD-blue
             Scalar forcemag_divr = Scalar(0.0);
@@ -194,11 +186,10 @@ __global__ void gpu_compute_table_forces_kernel(Scalar4* d_force,
     \param d_n_neigh Device memory array listing the number of neighbors for each particle
     \param d_nlist Device memory array containing the neighbor list contents
     \param d_head_list Indexer for reading \a d_nlist
-    \param d_tables Tables of the potential and force
+    \param d_tables Packed spline coefficients of all tables
     \param d_params Parameters for each table associated with a type pair
     \param size_nlist Total length of the neighborlist
     \param ntypes Number of particle types in the system
-    \param table_width Number of points in each table
     \param block_size Block size at which to run the kernel
 
     \note This is just a kernel driver. See gpu_compute_table_forces_kernel for full documentation.
@@ -213,18 +204,16 @@ hipError_t gpu_compute_table_forces(Scalar4* d_force,
                                      const unsigned int *d_n_neigh,
                                      const unsigned int *d_nlist,
                                      const unsigned int *d_head_list,
-                                     const Scalar2 *d_tables,
+                                     const Scalar4 *d_tables,
                                      const Scalar4 *d_params,
                                      const size_t size_nlist,
                                      const unsigned int ntypes,
-                                     const unsigned int table_width,
                                      const unsigned int block_size,
                                      const GPUPartition& gpu_partition)
     {
     assert(d_params);
     assert(d_tables);
     assert(ntypes > 0);
-    assert(table_width > 1);
 
     // index calculation helper
     Index2DUpperTriangular table_index(ntypes);
@@ -263,7 +252,6 @@ hipError_t gpu_compute_table_forces(Scalar4* d_force,
                                                                                                            d_tables,
                                                                                                            d_params,
                                                                                                            ntypes,
-                                                                                                           table_width,
                                                                                                            range.first);
         }
     return hipSuccess;
@@ -27,11 +27,10 @@ hipError_t gpu_compute_table_forces(Scalar4* d_force,
                                      const unsigned int *d_n_neigh,
                                      const unsigned int *d_nlist,
                                      const unsigned int *d_head_list,
-                                     const Scalar2 *d_tables,
+                                     const Scalar4 *d_tables,
                                      const Scalar4 *d_params,
                                      const size_t size_nlist,
                                      const unsigned int ntypes,
-                                     const unsigned int table_width,
                                      const unsigned int block_size,
                                      const GPUPartition& gpu_partition);
 
@@ -33,7 +33,6 @@ class PYBIND11_EXPORT TablePotentialGPU : public TablePotential
         //! Constructs the compute
         TablePotentialGPU(std::shared_ptr<SystemDefinition> sysdef,
                           std::shared_ptr<NeighborList> nlist,
-                          unsigned int table_width,
                           const std::string& log_suffix="");
 
         //! Destructor
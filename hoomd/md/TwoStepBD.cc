@@ -44,8 +44,6 @@ TwoStepBD::~TwoStepBD()
 */
 void TwoStepBD::integrateStepOne(uint64_t timestep)
     {
-    unsigned int group_size = m_group->getNumMembers();
-
     // profile this step
     if (m_prof)
         m_prof->push("BD step 1");
@@ -78,9 +76,8 @@ void TwoStepBD::integrateStepOne(uint64_t timestep)
     // perform the first half step
     // r(t+deltaT) = r(t) + (Fc(t) + Fr)*deltaT/gamma
     // v(t+deltaT) = random distribution consistent with T
-    for (unsigned int group_idx = 0; group_idx < group_size; group_idx++)
+    forEachMember([&](unsigned int j)
         {
-        unsigned int j = m_group->getMemberIndex(group_idx);
         unsigned int ptag = h_tag.data[j];
 
         // Initialize the RNG
@@ -199,7 +196,7 @@ void TwoStepBD::integrateStepOne(uint64_t timestep)
                 h_angmom.data[j] = quat_to_scalar4(p);
                 }
             }
-        }
+        });
 
     // done profiling
     if (m_prof)
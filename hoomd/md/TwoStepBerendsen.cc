@@ -49,8 +49,6 @@ TwoStepBerendsen::~TwoStepBerendsen()
 */
 void TwoStepBerendsen::integrateStepOne(uint64_t timestep)
     {
-    unsigned int group_size = m_group->getNumMembers();
-
     if (m_aniso && !m_warned_aniso)
         {
         m_exec_conf->msg->warning() << "integrate.berendsen: this integrator "
@@ -76,10 +74,8 @@ void TwoStepBerendsen::integrateStepOne(uint64_t timestep)
     ArrayHandle<Scalar4> h_pos(m_pdata->getPositions(), access_location::host, access_mode::readwrite);
 
 
-    for (unsigned int group_idx = 0; group_idx < group_size; group_idx++)
+    forEachMember([&](unsigned int j)
         {
-        unsigned int j = m_group->getMemberIndex(group_idx);
-
         // advance velocity forward by half a timestep and position forward by a full timestep
         h_vel.data[j].x = lambda * (h_vel.data[j].x + h_accel.data[j].x * m_deltaT * Scalar(1.0 / 2.0));
         h_pos.data[j].x += h_vel.data[j].x * m_deltaT;
@@ -89,7 +85,7 @@ void TwoStepBerendsen::integrateStepOne(uint64_t timestep)
 
         h_vel.data[j].z = lambda * (h_vel.data[j].z + h_accel.data[j].z * m_deltaT * Scalar(1.0 / 2.0));
         h_pos.data[j].z += h_vel.data[j].z * m_deltaT;
-        }
+        });
 
     /* particles may have been moved slightly outside the box by the above steps so we should wrap
         them back into place */
@@ -97,11 +93,10 @@ void TwoStepBerendsen::integrateStepOne(uint64_t timestep)
 
     ArrayHandle<int3> h_image(m_pdata->getImages(), access_location::host, access_mode::readwrite);
 
-    for (unsigned int group_idx = 0; group_idx < group_size; group_idx++)
+    forEachMember([&](unsigned int j)
         {
-        unsigned int j = m_group->getMemberIndex(group_idx);
         box.wrap(h_pos.data[j], h_image.data[j]);
-        }
+        });
 
     if (m_prof)
         m_prof->pop();
@@ -112,8 +107,6 @@ void TwoStepBerendsen::integrateStepOne(uint64_t timestep)
 */
 void TwoStepBerendsen::integrateStepTwo(uint64_t timestep)
     {
-    unsigned int group_size = m_group->getNumMembers();
-
     // access the particle data for writing on the CPU
     assert(m_pdata);
     ArrayHandle<Scalar4> h_vel(m_pdata->getVelocities(), access_location::host, access_mode::readwrite);
@@ -128,10 +121,8 @@ void TwoStepBerendsen::integrateStepTwo(uint64_t timestep)
         m_prof->push("Berendsen step 2");
 
     // integrate the particle velocities to timestep+1
-    for (unsigned int group_idx = 0; group_idx < group_size; group_idx++)
+    forEachMember([&](unsigned int j)
         {
-        unsigned int j = m_group->getMemberIndex(group_idx);
-
         // calculate the acceleration from the net force
         Scalar minv = Scalar(1.0) / h_vel.data[j].w;
         h_accel.data[j].x = h_net_force.data[j].x * minv;
@@ -142,7 +133,7 @@ void TwoStepBerendsen::integrateStepTwo(uint64_t timestep)
         h_vel.data[j].x += h_accel.data[j].x * m_deltaT / Scalar(2.0);
         h_vel.data[j].y += h_accel.data[j].y * m_deltaT / Scalar(2.0);
         h_vel.data[j].z += h_accel.data[j].z * m_deltaT / Scalar(2.0);
-        }
+        });
 
     }
 
@@ -62,8 +62,6 @@ Scalar TwoStepLangevin::getLogValue(const std::string& quantity, uint64_t timest
 */
 void TwoStepLangevin::integrateStepOne(uint64_t timestep)
     {
-    unsigned int group_size = m_group->getNumMembers();
-
     // profile this step
     if (m_prof)
         m_prof->push("Langevin step 1");
@@ -80,10 +78,8 @@ void TwoStepLangevin::integrateStepOne(uint64_t timestep)
     // perform the first half step of velocity verlet
     // r(t+deltaT) = r(t) + v(t)*deltaT + (1/2)a(t)*deltaT^2
     // v(t+deltaT/2) = v(t) + (1/2)a*deltaT
-    for (unsigned int group_idx = 0; group_idx < group_size; group_idx++)
+    forEachMember([&](unsigned int j)
         {
-        unsigned int j = m_group->getMemberIndex(group_idx);
-
         Scalar dx = h_vel.data[j].x*m_deltaT + Scalar(1.0/2.0)*h_accel.data[j].x*m_deltaT*m_deltaT;
         Scalar dy = h_vel.data[j].y*m_deltaT + Scalar(1.0/2.0)*h_accel.data[j].y*m_deltaT*m_deltaT;
         Scalar dz = h_vel.data[j].z*m_deltaT + Scalar(1.0/2.0)*h_accel.data[j].z*m_deltaT*m_deltaT;
@@ -97,7 +93,7 @@ void TwoStepLangevin::integrateStepOne(uint64_t timestep)
         h_vel.data[j].x += Scalar(1.0/2.0)*h_accel.data[j].x*m_deltaT;
         h_vel.data[j].y += Scalar(1.0/2.0)*h_accel.data[j].y*m_deltaT;
         h_vel.data[j].z += Scalar(1.0/2.0)*h_accel.data[j].z*m_deltaT;
-        }
+        });
 
     if (m_aniso)
         {
@@ -106,10 +102,8 @@ void TwoStepLangevin::integrateStepOne(uint64_t timestep)
         ArrayHandle<Scalar4> h_net_torque(m_pdata->getNetTorqueArray(), access_location::host, access_mode::read);
         ArrayHandle<Scalar3> h_inertia(m_pdata->getMomentsOfInertiaArray(), access_location::host, access_mode::read);
 
-        for (unsigned int group_idx = 0; group_idx < group_size; group_idx++)
+        forEachMember([&](unsigned int j)
             {
-            unsigned int j = m_group->getMemberIndex(group_idx);
-
             quat<Scalar> q(h_orientation.data[j]);
             quat<Scalar> p(h_angmom.data[j]);
             vec3<Scalar> t(h_net_torque.data[j]);
@@ -202,7 +196,7 @@ void TwoStepLangevin::integrateStepOne(uint64_t timestep)
 
             h_orientation.data[j] = quat_to_scalar4(q);
             h_angmom.data[j] = quat_to_scalar4(p);
-            }
+            });
         }
 
     // done profiling
@@ -215,8 +209,6 @@ void TwoStepLangevin::integrateStepOne(uint64_t timestep)
 */
 void TwoStepLangevin::integrateStepTwo(uint64_t timestep)
     {
-    unsigned int group_size = m_group->getNumMembers();
-
     const GlobalArray< Scalar4 >& net_force = m_pdata->getNetForce();
 
     // profile this step
@@ -241,16 +233,13 @@ void TwoStepLangevin::integrateStepTwo(uint64_t timestep)
     const Scalar currentTemp = (*m_T)(timestep);
     const unsigned int D = m_sysdef->getNDimensions();
 
-    // energy transferred over this time step
-    Scalar bd_energy_transfer = 0;
-
     // a(t+deltaT) gets modified with the bd forces
     // v(t+deltaT) = v(t+deltaT/2) + 1/2 * a(t+deltaT)*deltaT
     uint16_t seed = m_sysdef->getSeed();
 
-    for (unsigned int group_idx = 0; group_idx < group_size; group_idx++)
+    // energy transferred over this time step
+    Scalar bd_energy_transfer = sumOverMembers([&](unsigned int j)->Scalar
         {
-        unsigned int j = m_group->getMemberIndex(group_idx);
         unsigned int ptag = h_tag.data[j];
 
         // Initialize the RNG
@@ -296,7 +285,8 @@ void TwoStepLangevin::integrateStepTwo(uint64_t timestep)
         h_vel.data[j].z += Scalar(1.0/2.0)*h_accel.data[j].z*m_deltaT;
 
         // tally the energy transfer from the bd thermal reservoir to the particles
-        if (m_tally) bd_energy_transfer += bd_fx * h_vel.data[j].x + bd_fy * h_vel.data[j].y + bd_fz * h_vel.data[j].z;
+        Scalar energy_transfer(0.0);
+        if (m_tally) energy_transfer = bd_fx * h_vel.data[j].x + bd_fy * h_vel.data[j].y + bd_fz * h_vel.data[j].z;
 
         // rotational updates
         if (m_aniso)
@@ -351,17 +341,17 @@ void TwoStepLangevin::integrateStepTwo(uint64_t timestep)
                 if (D < 3) h_net_torque.data[j].y = 0;
                 }
             }
-        }
+
+        return energy_transfer;
+        });
 
 
     // then, update the angular velocity
     if (m_aniso)
         {
         // angular degrees of freedom
-        for (unsigned int group_idx = 0; group_idx < group_size; group_idx++)
+        forEachMember([&](unsigned int j)
             {
-            unsigned int j = m_group->getMemberIndex(group_idx);
-
             quat<Scalar> q(h_orientation.data[j]);
             quat<Scalar> p(h_angmom.data[j]);
             vec3<Scalar> t(h_net_torque.data[j]);
@@ -382,7 +372,7 @@ void TwoStepLangevin::integrateStepTwo(uint64_t timestep)
             // advance p(t+deltaT/2)->p(t+deltaT)
             p += m_deltaT*q*t;
             h_angmom.data[j] = quat_to_scalar4(p);
-            }
+            });
         }
 
 
@@ -115,8 +115,6 @@ void TwoStepNPTMTK::integrateStepOne(uint64_t timestep)
 
     m_V = m_pdata->getGlobalBox().getVolume(is_two_dimensions);  // current volume
 
-    unsigned int group_size = m_group->getNumMembers();
-
     // profile this step
     if (m_prof)
         m_prof->push("NPT step 1");
@@ -204,10 +202,8 @@ void TwoStepNPTMTK::integrateStepOne(uint64_t timestep)
         Scalar xi_trans = v.variable[1];
         Scalar exp_thermo_fac = exp(-Scalar(1.0/2.0)*(xi_trans+mtk)*m_deltaT);
 
-        for (unsigned int group_idx = 0; group_idx < group_size; group_idx++)
+        forEachMember([&](unsigned int j)
             {
-            unsigned int j = m_group->getMemberIndex(group_idx);
-
             Scalar3 v = make_scalar3(h_vel.data[j].x, h_vel.data[j].y, h_vel.data[j].z);
             Scalar3 accel = h_accel.data[j];
             Scalar3 r = make_scalar3(h_pos.data[j].x, h_pos.data[j].y, h_pos.data[j].z);
@@ -243,7 +239,7 @@ void TwoStepNPTMTK::integrateStepOne(uint64_t timestep)
             h_pos.data[j].x = r.x;
             h_pos.data[j].y = r.y;
             h_pos.data[j].z = r.z;
-            }
+            });
         } // end of GPUArray scope
 
     // Get new local box
@@ -271,10 +267,8 @@ void TwoStepNPTMTK::integrateStepOne(uint64_t timestep)
         ArrayHandle<Scalar4> h_net_torque(m_pdata->getNetTorqueArray(), access_location::host, access_mode::read);
         ArrayHandle<Scalar3> h_inertia(m_pdata->getMomentsOfInertiaArray(), access_location::host, access_mode::read);
 
-        for (unsigned int group_idx = 0; group_idx < group_size; group_idx++)
+        forEachMember([&](unsigned int j)
             {
-            unsigned int j = m_group->getMemberIndex(group_idx);
-
             quat<Scalar> q(h_orientation.data[j]);
             quat<Scalar> p(h_angmom.data[j]);
             vec3<Scalar> t(h_net_torque.data[j]);
@@ -369,7 +363,7 @@ void TwoStepNPTMTK::integrateStepOne(uint64_t timestep)
 
             h_orientation.data[j] = quat_to_scalar4(q);
             h_angmom.data[j] = quat_to_scalar4(p);
-            }
+            });
         }
 
     if (! m_nph)
@@ -398,8 +392,6 @@ void TwoStepNPTMTK::integrateStepOne(uint64_t timestep)
 */
 void TwoStepNPTMTK::integrateStepTwo(uint64_t timestep)
     {
-    unsigned int group_size = m_group->getNumMembers();
-
     const GlobalArray< Scalar4 >& net_force = m_pdata->getNetForce();
 
    // profile this step
@@ -422,10 +414,8 @@ void TwoStepNPTMTK::integrateStepTwo(uint64_t timestep)
     Scalar exp_thermo_fac = exp(-Scalar(1.0/2.0)*(xi_trans+mtk)*m_deltaT);
 
     // perform second half step of NPT integration
-    for (unsigned int group_idx = 0; group_idx < group_size; group_idx++)
+    forEachMember([&](unsigned int j)
         {
-        unsigned int j = m_group->getMemberIndex(group_idx);
-
         // first, calculate acceleration from the net force
         Scalar m = h_vel.data[j].w;
         Scalar minv = Scalar(1.0) / m;
@@ -451,7 +441,7 @@ void TwoStepNPTMTK::integrateStepTwo(uint64_t timestep)
 
         // store velocity
         h_vel.data[j].x = v.x; h_vel.data[j].y = v.y; h_vel.data[j].z = v.z;
-        }
+        });
 
     if (m_aniso)
         {
@@ -466,10 +456,8 @@ void TwoStepNPTMTK::integrateStepTwo(uint64_t timestep)
         Scalar exp_thermo_fac_rot = exp(-(xi_rot+mtk)*m_deltaT/Scalar(2.0));
 
         // apply rotational (NO_SQUISH) equations of motion
-        for (unsigned int group_idx = 0; group_idx < group_size; group_idx++)
+        forEachMember([&](unsigned int j)
             {
-            unsigned int j = m_group->getMemberIndex(group_idx);
-
             quat<Scalar> q(h_orientation.data[j]);
             quat<Scalar> p(h_angmom.data[j]);
             vec3<Scalar> t(h_net_torque.data[j]);
@@ -494,7 +482,7 @@ void TwoStepNPTMTK::integrateStepTwo(uint64_t timestep)
             p += m_deltaT*q*t;
 
             h_angmom.data[j] = quat_to_scalar4(p);
-            }
+            });
         }
     } // end GPUArray scope
 
@@ -105,8 +105,6 @@ void TwoStepNVE::setZeroForce(pybind11::object zero_force)
 */
 void TwoStepNVE::integrateStepOne(uint64_t timestep)
     {
-    unsigned int group_size = m_group->getNumMembers();
-
     // profile this step
     if (m_prof)
         m_prof->push("NVE step 1");
@@ -118,9 +116,8 @@ void TwoStepNVE::integrateStepOne(uint64_t timestep)
     // perform the first half step of velocity verlet
     // r(t+deltaT) = r(t) + v(t)*deltaT + (1/2)a(t)*deltaT^2
     // v(t+deltaT/2) = v(t) + (1/2)a*deltaT
-    for (unsigned int group_idx = 0; group_idx < group_size; group_idx++)
+    forEachMember([&](unsigned int j)
         {
-        unsigned int j = m_group->getMemberIndex(group_idx);
         if (m_zero_force)
             h_accel.data[j].x = h_accel.data[j].y = h_accel.data[j].z = 0.0;
 
@@ -147,18 +144,17 @@ void TwoStepNVE::integrateStepOne(uint64_t timestep)
         h_vel.data[j].x += Scalar(1.0/2.0)*h_accel.data[j].x*m_deltaT;
         h_vel.data[j].y += Scalar(1.0/2.0)*h_accel.data[j].y*m_deltaT;
         h_vel.data[j].z += Scalar(1.0/2.0)*h_accel.data[j].z*m_deltaT;
-        }
+        });
 
     // particles may have been moved slightly outside the box by the above steps, wrap them back into place
     const BoxDim& box = m_pdata->getBox();
 
     ArrayHandle<int3> h_image(m_pdata->getImages(), access_location::host, access_mode::readwrite);
 
-    for (unsigned int group_idx = 0; group_idx < group_size; group_idx++)
+    forEachMember([&](unsigned int j)
         {
-        unsigned int j = m_group->getMemberIndex(group_idx);
         box.wrap(h_pos.data[j], h_image.data[j]);
-        }
+        });
 
     // Integration of angular degrees of freedom using symplectic and
     // time-reversal symmetric integration scheme of Miller et al.
@@ -169,10 +165,8 @@ void TwoStepNVE::integrateStepOne(uint64_t timestep)
         ArrayHandle<Scalar4> h_net_torque(m_pdata->getNetTorqueArray(), access_location::host, access_mode::read);
         ArrayHandle<Scalar3> h_inertia(m_pdata->getMomentsOfInertiaArray(), access_location::host, access_mode::read);
 
-        for (unsigned int group_idx = 0; group_idx < group_size; group_idx++)
+        forEachMember([&](unsigned int j)
             {
-            unsigned int j = m_group->getMemberIndex(group_idx);
-
             quat<Scalar> q(h_orientation.data[j]);
             quat<Scalar> p(h_angmom.data[j]);
             vec3<Scalar> t(h_net_torque.data[j]);
@@ -265,7 +259,7 @@ void TwoStepNVE::integrateStepOne(uint64_t timestep)
 
             h_orientation.data[j] = quat_to_scalar4(q);
             h_angmom.data[j] = quat_to_scalar4(p);
-            }
+            });
         }
 
     // done profiling
@@ -278,8 +272,6 @@ void TwoStepNVE::integrateStepOne(uint64_t timestep)
 */
 void TwoStepNVE::integrateStepTwo(uint64_t timestep)
     {
-    unsigned int group_size = m_group->getNumMembers();
-
     const GlobalArray< Scalar4 >& net_force = m_pdata->getNetForce();
 
     // profile this step
@@ -292,10 +284,8 @@ void TwoStepNVE::integrateStepTwo(uint64_t timestep)
     ArrayHandle<Scalar4> h_net_force(net_force, access_location::host, access_mode::read);
 
     // v(t+deltaT) = v(t+deltaT/2) + 1/2 * a(t+deltaT)*deltaT
-    for (unsigned int group_idx = 0; group_idx < group_size; group_idx++)
+    forEachMember([&](unsigned int j)
         {
-        unsigned int j = m_group->getMemberIndex(group_idx);
-
         if (m_zero_force)
             {
             h_accel.data[j].x = h_accel.data[j].y = h_accel.data[j].z = 0.0;
@@ -325,7 +315,7 @@ void TwoStepNVE::integrateStepTwo(uint64_t timestep)
                 h_vel.data[j].z = h_vel.data[j].z / vel * m_limit_val / m_deltaT;
                 }
             }
-        }
+        });
 
     if (m_aniso)
         {
@@ -335,10 +325,8 @@ void TwoStepNVE::integrateStepTwo(uint64_t timestep)
         ArrayHandle<Scalar4> h_net_torque(m_pdata->getNetTorqueArray(), access_location::host, access_mode::read);
         ArrayHandle<Scalar3> h_inertia(m_pdata->getMomentsOfInertiaArray(), access_location::host, access_mode::read);
 
-        for (unsigned int group_idx = 0; group_idx < group_size; group_idx++)
+        forEachMember([&](unsigned int j)
             {
-            unsigned int j = m_group->getMemberIndex(group_idx);
-
             quat<Scalar> q(h_orientation.data[j]);
             quat<Scalar> p(h_angmom.data[j]);
             vec3<Scalar> t(h_net_torque.data[j]);
@@ -360,7 +348,7 @@ void TwoStepNVE::integrateStepTwo(uint64_t timestep)
             p += m_deltaT*q*t;
 
             h_angmom.data[j] = quat_to_scalar4(p);
-            }
+            });
         }
 
     // done profiling
@@ -110,8 +110,6 @@ void TwoStepNVTMTK::integrateStepOne(uint64_t timestep)
         throw std::runtime_error("Error during NVT integration.");
         }
 
-    unsigned int group_size = m_group->getNumMembers();
-
     // profile this step
     if (m_prof)
         m_prof->push("NVT step 1");
@@ -122,10 +120,8 @@ void TwoStepNVTMTK::integrateStepOne(uint64_t timestep)
     ArrayHandle<Scalar3> h_accel(m_pdata->getAccelerations(), access_location::host, access_mode::readwrite);
     ArrayHandle<Scalar4> h_pos(m_pdata->getPositions(), access_location::host, access_mode::readwrite);
 
-    for (unsigned int group_idx = 0; group_idx < group_size; group_idx++)
+    forEachMember([&](unsigned int j)
         {
-        unsigned int j = m_group->getMemberIndex(group_idx);
-
         // load variables
         Scalar3 v = make_scalar3(h_vel.data[j].x, h_vel.data[j].y, h_vel.data[j].z);
         Scalar3 pos = make_scalar3(h_pos.data[j].x, h_pos.data[j].y, h_pos.data[j].z);
@@ -147,19 +143,18 @@ void TwoStepNVTMTK::integrateStepOne(uint64_t timestep)
         h_pos.data[j].x = pos.x;
         h_pos.data[j].y = pos.y;
         h_pos.data[j].z = pos.z;
-        }
+        });
 
     // particles may have been moved slightly outside the box by the above steps, wrap them back into place
     const BoxDim& box = m_pdata->getBox();
 
     ArrayHandle<int3> h_image(m_pdata->getImages(), access_location::host, access_mode::readwrite);
 
-    for (unsigned int group_idx = 0; group_idx < group_size; group_idx++)
+    forEachMember([&](unsigned int j)
         {
-        unsigned int j = m_group->getMemberIndex(group_idx);
         // wrap the particles around the box
         box.wrap(h_pos.data[j], h_image.data[j]);
-        }
+        });
     }
 
     // Integration of angular degrees of freedom using symplectic and
@@ -176,10 +171,8 @@ void TwoStepNVTMTK::integrateStepOne(uint64_t timestep)
         ArrayHandle<Scalar4> h_net_torque(m_pdata->getNetTorqueArray(), access_location::host, access_mode::read);
         ArrayHandle<Scalar3> h_inertia(m_pdata->getMomentsOfInertiaArray(), access_location::host, access_mode::read);
 
-        for (unsigned int group_idx = 0; group_idx < group_size; group_idx++)
+        forEachMember([&](unsigned int j)
             {
-            unsigned int j = m_group->getMemberIndex(group_idx);
-
             quat<Scalar> q(h_orientation.data[j]);
             quat<Scalar> p(h_angmom.data[j]);
             vec3<Scalar> t(h_net_torque.data[j]);
@@ -275,7 +268,7 @@ void TwoStepNVTMTK::integrateStepOne(uint64_t timestep)
 
             h_orientation.data[j] = quat_to_scalar4(q);
             h_angmom.data[j] = quat_to_scalar4(p);
-            }
+            });
         }
 
     // get temperature and advance thermostat
@@ -291,8 +284,6 @@ void TwoStepNVTMTK::integrateStepOne(uint64_t timestep)
 */
 void TwoStepNVTMTK::integrateStepTwo(uint64_t timestep)
     {
-    unsigned int group_size = m_group->getNumMembers();
-
     const GlobalArray< Scalar4 >& net_force = m_pdata->getNetForce();
 
     // profile this step
@@ -306,10 +297,8 @@ void TwoStepNVTMTK::integrateStepTwo(uint64_t timestep)
 
     // perform second half step of Nose-Hoover integration
 
-    for (unsigned int group_idx = 0; group_idx < group_size; group_idx++)
+    forEachMember([&](unsigned int j)
         {
-        unsigned int j = m_group->getMemberIndex(group_idx);
-
         // load velocity
         Scalar3 v = make_scalar3(h_vel.data[j].x, h_vel.data[j].y, h_vel.data[j].z);
         Scalar3 accel = h_accel.data[j];
@@ -333,7 +322,7 @@ void TwoStepNVTMTK::integrateStepTwo(uint64_t timestep)
 
         // store acceleration
         h_accel.data[j] = accel;
-        }
+        });
 
     if (m_aniso)
         {
@@ -347,10 +336,8 @@ void TwoStepNVTMTK::integrateStepTwo(uint64_t timestep)
         ArrayHandle<Scalar4> h_net_torque(m_pdata->getNetTorqueArray(), access_location::host, access_mode::read);
         ArrayHandle<Scalar3> h_inertia(m_pdata->getMomentsOfInertiaArray(), access_location::host, access_mode::read);
 
-        for (unsigned int group_idx = 0; group_idx < group_size; group_idx++)
+        forEachMember([&](unsigned int j)
             {
-            unsigned int j = m_group->getMemberIndex(group_idx);
-
             quat<Scalar> q(h_orientation.data[j]);
             quat<Scalar> p(h_angmom.data[j]);
             vec3<Scalar> t(h_net_torque.data[j]);
@@ -375,7 +362,7 @@ void TwoStepNVTMTK::integrateStepTwo(uint64_t timestep)
             p += m_deltaT*q*t;
 
             h_angmom.data[j] = quat_to_scalar4(p);
-            }
+            });
         }
 
     // done profiling
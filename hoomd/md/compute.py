@@ -7,9 +7,13 @@
 
 from hoomd import _hoomd
 from hoomd.md import _md
+from hoomd.md.nlist import NList
 from hoomd.operation import Compute
 from hoomd.logging import log
+from hoomd.data.parameterdicts import ParameterDict
+from hoomd.data.typeconverter import OnlyTypes, positive_real
 import hoomd
+import numpy
 
 
 class _Thermo(Compute):
@@ -31,6 +35,12 @@ class ThermodynamicQuantities(_Thermo):
     logger for logging during a simulation, see :py:class:`hoomd.logging.Logger`
     for more details.
 
+    Each quantity is computed on demand: querying `kinetic_temperature` does not
+    compute the pressure tensor. On the CPU, all
+    :py:class:`ThermodynamicQuantities` objects in the same simulation share
+    their reductions. The first query on a given timestep computes the
+    requested quantities for every filter in a single pass over the particles.
+
     Examples::
 
         f = filter.Type('A')
@@ -49,6 +59,25 @@ class ThermodynamicQuantities(_Thermo):
         self._cpp_obj = thermo_cls(self._simulation.state._cpp_sys_def, group, "")
         super()._attach()
 
+        if isinstance(self._simulation.device, hoomd.device.CPU):
+            for other in self._fused_peers():
+                self._cpp_obj.addFusedCompute(other._cpp_obj)
+                other._cpp_obj.addFusedCompute(self._cpp_obj)
+
+    def _detach(self):
+        if self._attached:
+            for other in self._fused_peers():
+                other._cpp_obj.removeFusedCompute(self._cpp_obj)
+        return super()._detach()
+
+    def _fused_peers(self):
+        """Other attached ThermodynamicQuantities in the same simulation."""
+        return [
+            op for op in self._simulation.operations.computes
+            if isinstance(op, ThermodynamicQuantities) and op is not self
+            and op._attached
+        ]
+
     @log
     def kinetic_temperature(self):
         """:math:`kT_k`, instantaneous thermal energy of the group (in energy
@@ -282,6 +311,213 @@ class ThermodynamicQuantities(_Thermo):
             return None
 
 
+class RDF(Compute):
+    """Radial distribution function of each pair of particle types.
+
+    Args:
+        nlist (`hoomd.md.nlist.NList`): Neighbor list that provides the pairs.
+        r_max (float): Maximum pair distance (in distance units).
+        bins (int): Number of histogram bins.
+
+    :py:class:`RDF` histograms the distances between the pairs of particles in
+    the neighbor list and normalizes them by the number of pairs an ideal gas
+    at the same density would have in each spherical shell (or annulus in 2D):
+
+    .. math::
+
+        g_{ab}(r) = \\frac{V \\, n_{ab}(r)}{N_a (N_b - \\delta_{ab})
+        \\, V_{\\mathrm{shell}}(r)}
+
+    where :math:`n_{ab}(r)` is the number of ordered pairs of particles of
+    types :math:`a` and :math:`b` in the shell at :math:`r`.
+
+    Each query of `rdf` at a new timestep adds the RDF of the current
+    configuration to a running average. Log `rdf` with a writer to sample it
+    periodically. Call `reset` to clear the average.
+
+    Use the same neighbor list as the pair force in the simulation and set
+    *r_max* no larger than its cutoff to compute the RDF without any additional
+    neighbor search.
+
+    Note:
+        Pairs excluded from the neighbor list (such as bonded particles) are
+        excluded from the RDF.
+
+    Attributes:
+        r_max (float): Maximum pair distance (in distance units).
+        bins (int): Number of histogram bins.
+
+    Examples::
+
+        nl = hoomd.md.nlist.Cell()
+        rdf = hoomd.md.compute.RDF(nlist=nl, r_max=3.0, bins=100)
+    """
+
+    def __init__(self, nlist, r_max, bins):
+        self._nlist = OnlyTypes(NList)(nlist)
+        param_dict = ParameterDict(r_max=positive_real, bins=int)
+        param_dict.update(dict(r_max=r_max, bins=bins))
+        self._param_dict.update(param_dict)
+
+    def _attach(self):
+        if not self._nlist._added:
+            self._nlist._add(self._simulation)
+        else:
+            if self._simulation != self._nlist._simulation:
+                raise RuntimeError("{} object's neighbor list is used in a "
+                                   "different simulation.".format(type(self)))
+        if not self._nlist._attached:
+            self._nlist._attach()
+        if isinstance(self._simulation.device, hoomd.device.CPU):
+            self._nlist._cpp_obj.setStorageMode(
+                _md.NeighborList.storageMode.half)
+        else:
+            self._nlist._cpp_obj.setStorageMode(
+                _md.NeighborList.storageMode.full)
+        self._cpp_obj = _md.ComputeRDF(self._simulation.state._cpp_sys_def,
+                                       self._nlist._cpp_obj, self.r_max,
+                                       self.bins)
+        super()._attach()
+
+    @property
+    def nlist(self):
+        """`hoomd.md.nlist.NList`: Neighbor list that provides the pairs."""
+        return self._nlist
+
+    @nlist.setter
+    def nlist(self, value):
+        if self._attached:
+            raise RuntimeError("nlist cannot be set after scheduling.")
+        else:
+            self._nlist = OnlyTypes(NList)(value)
+
+    @property
+    def _children(self):
+        return [self._nlist]
+
+    @log(category='sequence')
+    def rdf(self):
+        """:math:`g_{ab}(r)`, averaged over all sampled timesteps.
+
+        The array has the shape ``(N_types, N_types, bins)`` and is indexed by
+        the type ids of :math:`a` and :math:`b` and the bin.
+        """
+        if self._attached:
+            self._cpp_obj.compute(self._simulation.timestep)
+            n_types = len(self._simulation.state.particle_types)
+            return numpy.array(self._cpp_obj.rdf).reshape(
+                (n_types, n_types, self.bins))
+        else:
+            return None
+
+    @log(category='sequence')
+    def bin_centers(self):
+        """Distance at the center of each bin (in distance units)."""
+        if self._attached:
+            return numpy.array(self._cpp_obj.bin_centers)
+        else:
+            return None
+
+    @log
+    def num_frames(self):
+        """Number of timesteps sampled in `rdf`."""
+        if self._attached:
+            return self._cpp_obj.num_frames
+        else:
+            return None
+
+    def reset(self):
+        """Clear the running average."""
+        if self._attached:
+            self._cpp_obj.reset()
+
+
+class StructureFactor(Compute):
+    """Static structure factor of all particles.
+
+    Args:
+        resolution (tuple[int, int, int]): Number of mesh points in the x, y,
+            and z directions. Set the z resolution to 1 in 2D simulations.
+        q_max (float): Maximum wave number (in inverse distance units).
+        bins (int): Number of histogram bins.
+
+    :py:class:`StructureFactor` computes
+
+    .. math::
+
+        S(q) = \\frac{1}{N} \\left\\langle \\left| \\sum_{j=1}^N
+        e^{i \\vec{q} \\cdot \\vec{r}_j} \\right|^2 \\right\\rangle
+
+    averaged over the wave vectors :math:`\\vec{q}` of the periodic box in
+    each bin of :math:`|\\vec{q}| < q_{\\mathrm{max}}`. It assigns the
+    particles to a mesh and computes :math:`\\sum_j e^{i \\vec{q} \\cdot
+    \\vec{r}_j}` with a fast Fourier transform, as the PPPM long range
+    electrostatics do. The mesh limits the accuracy of :math:`S(q)` for wave
+    numbers that approach its Nyquist wave number :math:`\\pi M / L`, where
+    :math:`M` is the number of mesh points along the box length :math:`L`.
+
+    Each query of `structure_factor` at a new timestep adds :math:`S(q)` of the
+    current configuration to a running average. Log `structure_factor` with a
+    writer to sample it periodically. Call `reset` to clear the average.
+
+    Attributes:
+        resolution (tuple[int, int, int]): Number of mesh points in the x, y,
+            and z directions.
+        q_max (float): Maximum wave number (in inverse distance units).
+        bins (int): Number of histogram bins.
+
+    Examples::
+
+        sq = hoomd.md.compute.StructureFactor(resolution=(64, 64, 64),
+                                              q_max=20.0,
+                                              bins=100)
+    """
+
+    def __init__(self, resolution, q_max, bins):
+        param_dict = ParameterDict(resolution=(int, int, int),
+                                   q_max=positive_real,
+                                   bins=int)
+        param_dict.update(dict(resolution=resolution, q_max=q_max, bins=bins))
+        self._param_dict.update(param_dict)
+
+    def _attach(self):
+        self._cpp_obj = _md.ComputeStructureFactor(
+            self._simulation.state._cpp_sys_def, self.resolution, self.q_max,
+            self.bins)
+        super()._attach()
+
+    @log(category='sequence')
+    def structure_factor(self):
+        """:math:`S(q)` in each bin, averaged over all sampled timesteps."""
+        if self._attached:
+            self._cpp_obj.compute(self._simulation.timestep)
+            return numpy.array(self._cpp_obj.structure_factor)
+        else:
+            return None
+
+    @log(category='sequence')
+    def bin_centers(self):
+        """Wave number at the center of each bin (in inverse distance units).
+        """
+        if self._attached:
+            return numpy.array(self._cpp_obj.bin_centers)
+        else:
+            return None
+
+    @log
+    def num_frames(self):
+        """Number of timesteps sampled in `structure_factor`."""
+        if self._attached:
+            return self._cpp_obj.num_frames
+        else:
+            return None
+
+    def reset(self):
+        """Clear the running average."""
+        if self._attached:
+            self._cpp_obj.reset()
+
+
 class thermoHMA(Compute):
     R""" Compute HMA thermodynamic properties of a group of particles.
 
@@ -215,6 +215,13 @@ class distance(ConstraintForce):
     is solved. Because constraints are satisfied at :math:`t + 2 \Delta t`, the
     scheme is self-correcting and drifts are avoided.
 
+    Constraints of different molecules (particles connected through
+    constraints) are independent. On the CPU, the equations of each molecule
+    are solved separately and in parallel over molecules when HOOMD-blue is
+    built with TBB. Molecules with up to 64 constraints are solved exactly with
+    a dense LU decomposition, larger molecules iteratively with BiCGSTAB (see
+    :py:meth:`set_params`).
+
     Warning:
         In MPI simulations, all particles connected through constraints will be
         communicated between processors as ghost particles. Therefore, it is an
@@ -248,20 +255,33 @@ class distance(ConstraintForce):
 
         hoomd.context.current.system.addCompute(self.cpp_force, self.force_name)
 
-    def set_params(self, rel_tol=None):
+    def set_params(self, rel_tol=None, solver_tol=None, max_iterations=None):
         R"""Set parameters for constraint computation.
 
         Args:
             rel_tol (float): The relative tolerance with which constraint
                 violations are detected (**optional**).
+            solver_tol (float): The relative residual at which the iterative
+                solver for molecules with more than 64 constraints stops
+                (**optional**, defaults to 1e-10).
+            max_iterations (int): The maximum number of iterations of the
+                iterative solver. A warning is issued for molecules that do
+                not converge (**optional**, defaults to 1000).
+
+        *solver_tol* and *max_iterations* have no effect on the GPU.
 
         Example::
 
             dist = constrain.distance()
             dist.set_params(rel_tol=0.0001)
+            dist.set_params(solver_tol=1e-8, max_iterations=100)
         """
         if rel_tol is not None:
             self.cpp_force.setRelativeTolerance(float(rel_tol))
+        if solver_tol is not None:
+            self.cpp_force.setSolverTolerance(float(solver_tol))
+        if max_iterations is not None:
+            self.cpp_force.setMaxIterations(int(max_iterations))
 
 
 class rigid(ConstraintForce):
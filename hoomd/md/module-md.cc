@@ -13,6 +13,8 @@
 #include "AllSpecialPairPotentials.h"
 #include "AnisoPotentialPair.h"
 #include "BondTablePotential.h"
+#include "ComputeRDF.h"
+#include "ComputeStructureFactor.h"
 #include "ComputeThermo.h"
 #include "ComputeThermoHMA.h"
 #include "ConstExternalFieldDipoleForceCompute.h"
@@ -217,6 +219,8 @@ PYBIND11_MODULE(_md, m)
     export_ActiveForceCompute(m);
     export_ConstExternalFieldDipoleForceCompute(m);
     export_ComputeThermo(m);
+    export_ComputeRDF(m);
+    export_ComputeStructureFactor(m);
     export_ComputeThermoHMA(m);
     export_HarmonicAngleForceCompute(m);
     export_CosineSqAngleForceCompute(m);
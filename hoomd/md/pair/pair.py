@@ -12,7 +12,7 @@ from hoomd.data.typeparam import TypeParameter
 from hoomd.data.typeconverter import (
     OnlyFrom, OnlyTypes, positive_real, nonnegative_real)
 
-import math
+import numpy
 
 
 validate_nlist = OnlyTypes(NList)
@@ -518,271 +518,139 @@ class Ewald(Pair):
         self._add_typeparam(params)
 
 
-def _table_eval(r, rmin, rmax, V, F, width):
-    dr = (rmax - rmin) / float(width-1);
-    i = int(round((r - rmin)/dr))
-    return (V[i], F[i])
-
-
-class table(force._force):
-    R""" Tabulated pair potential.
+class Table(force.Force):
+    """Tabulated pair potential.
 
     Args:
-        width (int): Number of points to use to interpolate V and F.
-        nlist (`hoomd.md.nlist.NList`): Neighbor list (default of None automatically creates a global cell-list based neighbor list)
-        name (str): Name of the force instance
+        nlist (`hoomd.md.nlist.NList`): Neighbor list
 
-    :py:class:`table` specifies that a tabulated pair potential should be applied between every
-    non-excluded particle pair in the simulation.
+    `Table` specifies that a tabulated pair potential should be applied between
+    every non-excluded particle pair in the simulation.
 
-    The force :math:`\vec{F}` is (in force units):
+    The force :math:`\\vec{F}` is (in force units):
 
     .. math::
         :nowrap:
 
-        \begin{eqnarray*}
-        \vec{F}(\vec{r})     = & 0                           & r < r_{\mathrm{min}} \\
-                             = & F_{\mathrm{user}}(r)\hat{r} & r_{\mathrm{min}} \le r < r_{\mathrm{max}} \\
-                             = & 0                           & r \ge r_{\mathrm{max}} \\
-        \end{eqnarray*}
+        \\begin{eqnarray*}
+        \\vec{F}(\\vec{r}) = & 0 & r < r_{\\mathrm{min}} \\\\
+                           = & F_{\\mathrm{table}}(r)\\hat{r}
+                           & r_{\\mathrm{min}} \\le r < r_{\\mathrm{max}} \\\\
+                           = & 0 & r \\ge r_{\\mathrm{max}} \\\\
+        \\end{eqnarray*}
 
     and the potential :math:`V(r)` is (in energy units)
 
     .. math::
         :nowrap:
 
-        \begin{eqnarray*}
-        V(r)       = & 0                    & r < r_{\mathrm{min}} \\
-                   = & V_{\mathrm{user}}(r) & r_{\mathrm{min}} \le r < r_{\mathrm{max}} \\
-                   = & 0                    & r \ge r_{\mathrm{max}} \\
-        \end{eqnarray*}
+        \\begin{eqnarray*}
+        V(r) = & 0 & r < r_{\\mathrm{min}} \\\\
+             = & V_{\\mathrm{table}}(r)
+             & r_{\\mathrm{min}} \\le r < r_{\\mathrm{max}} \\\\
+             = & 0 & r \\ge r_{\\mathrm{max}} \\\\
+        \\end{eqnarray*}
 
-    where :math:`\vec{r}` is the vector pointing from one particle to the other in the pair.
+    where :math:`\\vec{r}` is the vector pointing from one particle to the
+    other in the pair.
 
-    :math:`F_{\mathrm{user}}(r)` and :math:`V_{\mathrm{user}}(r)` are evaluated on *width* grid points between
-    :math:`r_{\mathrm{min}}` and :math:`r_{\mathrm{max}}`. Values are interpolated linearly between grid points.
-    For correctness, you must specify the force defined by: :math:`F = -\frac{\partial V}{\partial r}`.
+    ``V`` and ``F`` give :math:`V_{\\mathrm{table}}(r)` and
+    :math:`F_{\\mathrm{table}}(r)` at equally spaced points from
+    :math:`r_{\\mathrm{min}}` to :math:`r_{\\mathrm{max}}` inclusive. The
+    arrays may have a different length for each type pair. Between two points,
+    :math:`V_{\\mathrm{table}}(r)` is the cubic polynomial that matches
+    :math:`V` and :math:`-F` at both points, and
+    :math:`F_{\\mathrm{table}}(r)` is its negative derivative. For
+    correctness, you must specify the force defined by: :math:`F =
+    -\\frac{\\partial V}{\\partial r}`.
 
-    The following coefficients must be set per unique pair of particle types:
+    The polynomial coefficients are computed once when the table is set, so
+    large tables (for example from iterative Boltzmann inversion) cost no more
+    per pair to evaluate than small ones.
 
-    - :math:`V_{\mathrm{user}}(r)` and :math:`F_{\mathrm{user}}(r)` - evaluated by ``func`` (see example)
-    - coefficients passed to ``func`` - *coeff* (see example)
-    - :math:`_{\mathrm{min}}` - *rmin* (in distance units)
-    - :math:`_{\mathrm{max}}` - *rmax* (in distance units)
+    Attributes:
+        params (`TypeParameter` [\
+            `tuple` [``particle_type``, ``particle_type``],\
+            `dict`]):
+            The potential parameters. The dictionary has the following keys:
 
-    .. rubric:: Set table from a given function
+            * ``r_min`` (`float`, **required**) - the distance of the first
+              point in the table (in distance units)
 
-    When you have a functional form for V and F, you can enter that
-    directly into python. :py:class:`table` will evaluate the given function over *width* points between
-    *rmin* and *rmax* and use the resulting values in the table::
+            * ``r_max`` (`float`, **required**) - the distance of the last
+              point in the table, also the cutoff (in distance units)
 
-        def lj(r, rmin, rmax, epsilon, sigma):
-            V = 4 * epsilon * ( (sigma / r)**12 - (sigma / r)**6);
-            F = 4 * epsilon / r * ( 12 * (sigma / r)**12 - 6 * (sigma / r)**6);
-            return (V, F)
+            * ``V`` (`numpy.ndarray` [`float`], **required**) - the potential
+              energy at each point (in energy units)
 
-        nl = nlist.cell()
-        table = pair.table(width=1000, nlist=nl)
-        table.pair_coeff.set('A', 'A', func=lj, rmin=0.8, rmax=3.0, coeff=dict(epsilon=1.5, sigma=1.0))
-        table.pair_coeff.set('A', 'B', func=lj, rmin=0.8, rmax=3.0, coeff=dict(epsilon=2.0, sigma=1.2))
-        table.pair_coeff.set('B', 'B', func=lj, rmin=0.8, rmax=3.0, coeff=dict(epsilon=0.5, sigma=1.0))
+            * ``F`` (`numpy.ndarray` [`float`], **required**) - the force at
+              each point (in force units)
 
-    .. rubric:: Set a table from a file
-
-    When you have no function for for *V* or *F*, or you otherwise have the data listed in a file,
-    :py:class:`table` can use the given values directly. You must first specify the number of rows
-    in your tables when initializing pair.table. Then use :py:meth:`set_from_file()` to read the file::
+    Example::
 
-        nl = nlist.cell()
-        table = pair.table(width=1000, nlist=nl)
-        table.set_from_file('A', 'A', filename='table_AA.dat')
-        table.set_from_file('A', 'B', filename='table_AB.dat')
-        table.set_from_file('B', 'B', filename='table_BB.dat')
+        nl = nlist.Cell()
+        r = numpy.linspace(0.8, 3.0, 1000)
+        V = 4 * ((1 / r)**12 - (1 / r)**6)
+        F = 4 / r * (12 * (1 / r)**12 - 6 * (1 / r)**6)
+        table = pair.Table(nlist=nl)
+        table.params[('A', 'A')] = dict(r_min=0.8, r_max=3.0, V=V, F=F)
 
     Note:
-        For potentials that diverge near r=0, make sure to set *rmin* to a reasonable value. If a potential does
-        not diverge near r=0, then a setting of *rmin=0* is valid.
-
+        For potentials that diverge near r=0, make sure to set ``r_min`` to a
+        reasonable value. If a potential does not diverge near r=0, then a
+        setting of ``r_min=0`` is valid.
     """
-    def __init__(self, width, nlist, name=None):
-
-        # initialize the base class
-        force._force.__init__(self, name);
+    _cpp_class_name = "TablePotential"
 
-        # setup the coefficient matrix
-        self.pair_coeff = coeff();
-
-        self.nlist = nlist
-        self.nlist.subscribe(lambda:self.get_rcut())
-        self.nlist.update_rcut()
+    def __init__(self, nlist):
+        self._nlist = validate_nlist(nlist)
+        params = TypeParameter(
+            'params', 'particle_types',
+            TypeParameterDict(r_min=float,
+                              r_max=float,
+                              V=numpy.ndarray,
+                              F=numpy.ndarray,
+                              len_keys=2))
+        self._add_typeparam(params)
 
+    def _attach(self):
         # create the c++ mirror class
-        if not hoomd.context.current.device.cpp_exec_conf.isCUDAEnabled():
-            self.cpp_force = _md.TablePotential(hoomd.context.current.system_definition, self.nlist.cpp_nlist, int(width), self.name);
+        if not self._nlist._added:
+            self._nlist._add(self._simulation)
         else:
-            self.nlist.cpp_nlist.setStorageMode(_md.NeighborList.storageMode.full);
-            self.cpp_force = _md.TablePotentialGPU(hoomd.context.current.system_definition, self.nlist.cpp_nlist, int(width), self.name);
-
-        hoomd.context.current.system.addCompute(self.cpp_force, self.force_name);
-
-        # stash the width for later use
-        self.width = width;
-
-    def update_pair_table(self, typei, typej, func, rmin, rmax, coeff):
-        # allocate arrays to store V and F
-        Vtable = _hoomd.std_vector_scalar();
-        Ftable = _hoomd.std_vector_scalar();
-
-        # calculate dr
-        dr = (rmax - rmin) / float(self.width-1);
-
-        # evaluate each point of the function
-        for i in range(0, self.width):
-            r = rmin + dr * i;
-            (V,F) = func(r, rmin, rmax, **coeff);
-
-            # fill out the tables
-            Vtable.append(V);
-            Ftable.append(F);
-
-        # pass the tables on to the underlying cpp compute
-        self.cpp_force.setTable(typei, typej, Vtable, Ftable, rmin, rmax);
-
-    ## \internal
-    # \brief Get the r_cut pair dictionary
-    # \returns rcut(i,j) dict if logging is on, and None otherwise
-    def get_rcut(self):
-        if not self.log:
-            return None
-
-        # go through the list of only the active particle types in the sim
-        ntypes = hoomd.context.current.system_definition.getParticleData().getNTypes();
-        type_list = [];
-        for i in range(0,ntypes):
-            type_list.append(hoomd.context.current.system_definition.getParticleData().getNameByType(i));
-
-        # update the rcut by pair type
-        r_cut_dict = nl.rcut();
-        for i in range(0,ntypes):
-            for j in range(i,ntypes):
-                # get the r_cut value
-                rmax = self.pair_coeff.get(type_list[i], type_list[j], 'rmax');
-                r_cut_dict.set_pair(type_list[i],type_list[j], rmax);
-
-        return r_cut_dict;
-
-    def get_max_rcut(self):
-        # loop only over current particle types
-        ntypes = hoomd.context.current.system_definition.getParticleData().getNTypes();
-        type_list = [];
-        for i in range(0,ntypes):
-            type_list.append(hoomd.context.current.system_definition.getParticleData().getNameByType(i));
-
-        # find the maximum rmax to update the neighbor list with
-        maxrmax = 0.0;
-
-        # loop through all of the unique type pairs and find the maximum rmax
-        for i in range(0,ntypes):
-            for j in range(i,ntypes):
-                rmax = self.pair_coeff.get(type_list[i], type_list[j], "rmax");
-                maxrmax = max(maxrmax, rmax);
-
-        return maxrmax;
-
-    def update_coeffs(self):
-        # check that the pair coefficients are valid
-        if not self.pair_coeff.verify(["func", "rmin", "rmax", "coeff"]):
-            hoomd.context.current.device.cpp_msg.error("Not all pair coefficients are set for pair.table\n");
-            raise RuntimeError("Error updating pair coefficients");
-
-        # set all the params
-        ntypes = hoomd.context.current.system_definition.getParticleData().getNTypes();
-        type_list = [];
-        for i in range(0,ntypes):
-            type_list.append(hoomd.context.current.system_definition.getParticleData().getNameByType(i));
-
-        # loop through all of the unique type pairs and evaluate the table
-        for i in range(0,ntypes):
-            for j in range(i,ntypes):
-                func = self.pair_coeff.get(type_list[i], type_list[j], "func");
-                rmin = self.pair_coeff.get(type_list[i], type_list[j], "rmin");
-                rmax = self.pair_coeff.get(type_list[i], type_list[j], "rmax");
-                coeff = self.pair_coeff.get(type_list[i], type_list[j], "coeff");
-
-                self.update_pair_table(i, j, func, rmin, rmax, coeff);
-
-    def set_from_file(self, a, b, filename):
-        R""" Set a pair interaction from a file.
-
-        Args:
-            a (str): Name of type A in pair
-            b (str): Name of type B in pair
-            filename (str): Name of the file to read
-
-        The provided file specifies V and F at equally spaced r values.
+            if self._simulation != self._nlist._simulation:
+                raise RuntimeError("{} object's neighbor list is used in a "
+                                   "different simulation.".format(type(self)))
+        if not self.nlist._attached:
+            self.nlist._attach()
+        if isinstance(self._simulation.device, hoomd.device.CPU):
+            cls = getattr(_md, self._cpp_class_name)
+            self.nlist._cpp_obj.setStorageMode(
+                _md.NeighborList.storageMode.half)
+        else:
+            cls = getattr(_md, self._cpp_class_name + "GPU")
+            self.nlist._cpp_obj.setStorageMode(
+                _md.NeighborList.storageMode.full)
+        self._cpp_obj = cls(self._simulation.state._cpp_sys_def,
+                            self.nlist._cpp_obj, '')
 
-        Example::
+        super()._attach()
 
-            #r  V    F
-            1.0 2.0 -3.0
-            1.1 3.0 -4.0
-            1.2 2.0 -3.0
-            1.3 1.0 -2.0
-            1.4 0.0 -1.0
-            1.5 -1.0 0.0
+    @property
+    def nlist(self):
+        """`hoomd.md.nlist.NList`: Neighbor list used by the table."""
+        return self._nlist
 
-        The first r value sets *rmin*, the last sets *rmax*. Any line with # as the first non-whitespace character is
-        is treated as a comment. The *r* values must monotonically increase and be equally spaced. The table is read
-        directly into the grid points used to evaluate :math:`F_{\mathrm{user}}(r)` and :math:`_{\mathrm{user}}(r)`.
-        """
+    @nlist.setter
+    def nlist(self, value):
+        if self._attached:
+            raise RuntimeError("nlist cannot be set after scheduling.")
+        else:
+            self._nlist = validate_nlist(value)
 
-        # open the file
-        f = open(filename);
-
-        r_table = [];
-        V_table = [];
-        F_table = [];
-
-        # read in lines from the file
-        for line in f.readlines():
-            line = line.strip();
-
-            # skip comment lines
-            if line[0] == '#':
-                continue;
-
-            # split out the columns
-            cols = line.split();
-            values = [float(f) for f in cols];
-
-            # validate the input
-            if len(values) != 3:
-                hoomd.context.current.device.cpp_msg.error("pair.table: file must have exactly 3 columns\n");
-                raise RuntimeError("Error reading table file");
-
-            # append to the tables
-            r_table.append(values[0]);
-            V_table.append(values[1]);
-            F_table.append(values[2]);
-
-        # validate input
-        if self.width != len(r_table):
-            hoomd.context.current.device.cpp_msg.error("pair.table: file must have exactly " + str(self.width) + " rows\n");
-            raise RuntimeError("Error reading table file");
-
-        # extract rmin and rmax
-        rmin_table = r_table[0];
-        rmax_table = r_table[-1];
-
-        # check for even spacing
-        dr = (rmax_table - rmin_table) / float(self.width-1);
-        for i in range(0,self.width):
-            r = rmin_table + dr * i;
-            if math.fabs(r - r_table[i]) > 1e-3:
-                hoomd.context.current.device.cpp_msg.error("pair.table: r must be monotonically increasing and evenly spaced\n");
-                raise RuntimeError("Error reading table file");
-
-        self.pair_coeff.set(a, b, func=_table_eval, rmin=rmin_table, rmax=rmax_table, coeff=dict(V=V_table, F=F_table, width=self.width))
+    @property
+    def _children(self):
+        return [self.nlist]
 
 
 class Morse(Pair):
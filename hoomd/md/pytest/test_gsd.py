@@ -367,3 +367,38 @@ def test_write_gsd_log(create_md_sim, tmp_path):
             for s in range(5):
                 e = traj[s].log['md/compute/ThermodynamicQuantities/kinetic_energy']
                 assert e == kinetic_energy_list[s]
+
+
+class _SnapshotRecorder(hoomd.custom.Action):
+
+    def __init__(self):
+        self.positions = []
+
+    def act(self, timestep):
+        snap = self._state.snapshot
+        if snap.exists:
+            self.positions.append(np.array(snap.particles.position))
+
+
+def test_write_gsd_shared_snapshot(create_md_sim, tmp_path):
+    """GSD, DCD, and custom writers triggered on the same steps agree."""
+    filename = tmp_path / "temporary_test_file.gsd"
+
+    sim = create_md_sim
+    recorder = _SnapshotRecorder()
+    trigger = hoomd.trigger.Periodic(1)
+    sim.operations.writers.append(
+        hoomd.write.GSD(filename=filename, trigger=trigger, mode='wb'))
+    sim.operations.writers.append(
+        hoomd.write.DCD(str(tmp_path / "temporary_test_file.dcd"), trigger))
+    sim.operations.writers.append(
+        hoomd.write.CustomWriter(action=recorder, trigger=trigger))
+    sim.run(3)
+
+    if sim.device.communicator.rank == 0:
+        with gsd.hoomd.open(name=filename, mode='rb') as traj:
+            assert len(traj) == len(recorder.positions) == 3
+            for frame, position in zip(traj, recorder.positions):
+                np.testing.assert_allclose(frame.particles.position,
+                                           position,
+                                           rtol=1e-6)
@@ -0,0 +1,114 @@
+import hoomd
+import numpy as np
+import pytest
+
+
+def _make_simulation(simulation_factory, lattice_snapshot_factory):
+    snap = lattice_snapshot_factory(particle_types=['A', 'B'], a=1, n=4)
+    sim = simulation_factory(snap)
+    integrator = hoomd.md.Integrator(dt=0.005)
+    integrator.methods.append(hoomd.md.methods.NVE(hoomd.filter.All()))
+    sim.operations.integrator = integrator
+    return sim
+
+
+def test_rdf_attach_detach(simulation_factory, lattice_snapshot_factory):
+    rdf = hoomd.md.compute.RDF(nlist=hoomd.md.nlist.Cell(), r_max=1.2, bins=4)
+    assert rdf.rdf is None
+    assert rdf.bin_centers is None
+    assert rdf.r_max == 1.2
+    assert rdf.bins == 4
+
+    sim = _make_simulation(simulation_factory, lattice_snapshot_factory)
+    sim.operations.computes.append(rdf)
+    sim.run(0)
+
+    assert rdf.rdf.shape == (2, 2, 4)
+    np.testing.assert_allclose(rdf.bin_centers, [0.15, 0.45, 0.75, 1.05])
+
+    sim.operations.computes.remove(rdf)
+    assert rdf.rdf is None
+
+
+def test_rdf_lattice(simulation_factory, lattice_snapshot_factory):
+    rdf = hoomd.md.compute.RDF(nlist=hoomd.md.nlist.Cell(), r_max=1.2, bins=4)
+    sim = _make_simulation(simulation_factory, lattice_snapshot_factory)
+    sim.operations.computes.append(rdf)
+    sim.run(0)
+
+    # each of the 64 particles has 6 neighbors at r = 1, in the last bin
+    shell_volume = 4 / 3 * np.pi * (1.2**3 - 0.9**3)
+    expected = 64 * 6 * 64 / (64 * 63 * shell_volume)
+    g = rdf.rdf
+    np.testing.assert_allclose(g[0, 0], [0, 0, 0, expected], rtol=1e-5)
+    np.testing.assert_allclose(g[0, 1], 0)
+    np.testing.assert_allclose(g[1, 1], 0)
+    assert rdf.num_frames == 1
+
+    # the same timestep is sampled once
+    g = rdf.rdf
+    assert rdf.num_frames == 1
+
+    sim.run(1)
+    np.testing.assert_allclose(rdf.rdf[0, 0], [0, 0, 0, expected], rtol=1e-5)
+    assert rdf.num_frames == 2
+
+    rdf.reset()
+    assert rdf.num_frames == 0
+
+    # changing the histogram clears the average
+    rdf.rdf
+    rdf.bins = 8
+    assert rdf.num_frames == 0
+    assert rdf.rdf.shape == (2, 2, 8)
+
+
+def test_structure_factor_attach_detach(simulation_factory,
+                                        lattice_snapshot_factory):
+    sq = hoomd.md.compute.StructureFactor(resolution=(16, 16, 16),
+                                          q_max=7.0,
+                                          bins=7)
+    assert sq.structure_factor is None
+    assert sq.resolution == (16, 16, 16)
+
+    sim = _make_simulation(simulation_factory, lattice_snapshot_factory)
+    sim.operations.computes.append(sq)
+    sim.run(0)
+
+    assert len(sq.structure_factor) == 7
+    np.testing.assert_allclose(sq.bin_centers, np.arange(7) + 0.5)
+    assert sq.resolution == (16, 16, 16)
+
+    sim.operations.computes.remove(sq)
+    assert sq.structure_factor is None
+
+
+def test_structure_factor_lattice(simulation_factory, lattice_snapshot_factory):
+    sq = hoomd.md.compute.StructureFactor(resolution=(16, 16, 16),
+                                          q_max=7.0,
+                                          bins=7)
+    sim = _make_simulation(simulation_factory, lattice_snapshot_factory)
+    sim.operations.computes.append(sq)
+    sim.run(0)
+
+    # a simple cubic lattice only scatters at the Bragg peak |q| = 2 pi / a
+    s = sq.structure_factor
+    np.testing.assert_allclose(s[:6], 0, atol=1e-3)
+    assert s[6] > 1
+    assert sq.num_frames == 1
+
+    sim.run(1)
+    np.testing.assert_allclose(sq.structure_factor, s, rtol=1e-4, atol=1e-3)
+    assert sq.num_frames == 2
+
+
+def test_structure_factor_2d_resolution(simulation_factory,
+                                        lattice_snapshot_factory):
+    snap = lattice_snapshot_factory(dimensions=2, a=1, n=4)
+    sim = simulation_factory(snap)
+    sq = hoomd.md.compute.StructureFactor(resolution=(16, 16, 16),
+                                          q_max=7.0,
+                                          bins=7)
+    sim.operations.computes.append(sq)
+    with pytest.raises(RuntimeError):
+        sim.run(0)
@@ -0,0 +1,97 @@
+import hoomd
+import numpy as np
+import pytest
+
+
+def _make_simulation(simulation_factory, two_particle_snapshot_factory, d):
+    snap = two_particle_snapshot_factory(particle_types=['A', 'B'], d=d)
+    if snap.exists:
+        snap.particles.typeid[:] = [0, 1]
+    sim = simulation_factory(snap)
+    integrator = hoomd.md.Integrator(dt=0.005)
+    integrator.methods.append(hoomd.md.methods.NVE(hoomd.filter.All()))
+    sim.operations.integrator = integrator
+    return sim
+
+
+def _lj_table(r):
+    V = 4 * ((1 / r)**12 - (1 / r)**6)
+    F = 4 / r * (12 * (1 / r)**12 - 6 * (1 / r)**6)
+    return V, F
+
+
+def _set_tables(table, r_min, r_max, width):
+    r = np.linspace(r_min, r_max, width)
+    V, F = _lj_table(r)
+    for pair in [('A', 'A'), ('A', 'B'), ('B', 'B')]:
+        table.params[pair] = dict(r_min=r_min, r_max=r_max, V=V, F=F)
+
+
+def test_attach_detach(simulation_factory, two_particle_snapshot_factory):
+    table = hoomd.md.pair.Table(nlist=hoomd.md.nlist.Cell())
+    _set_tables(table, 0.8, 3.0, 100)
+
+    sim = _make_simulation(simulation_factory, two_particle_snapshot_factory,
+                           1.5)
+    sim.operations.integrator.forces.append(table)
+    sim.run(0)
+
+    params = table.params[('A', 'B')]
+    assert params['r_min'] == pytest.approx(0.8)
+    assert params['r_max'] == pytest.approx(3.0)
+    assert len(params['V']) == 100
+    np.testing.assert_allclose(params['F'],
+                               _lj_table(np.linspace(0.8, 3.0, 100))[1],
+                               rtol=1e-5)
+
+    sim.operations.integrator.forces.remove(table)
+    assert table.params[('A', 'B')]['r_max'] == pytest.approx(3.0)
+
+
+@pytest.mark.parametrize('d', [0.9, 1.05, 1.5, 2.2])
+def test_spline_accuracy(simulation_factory, two_particle_snapshot_factory, d):
+    table = hoomd.md.pair.Table(nlist=hoomd.md.nlist.Cell())
+    _set_tables(table, 0.8, 3.0, 2000)
+
+    sim = _make_simulation(simulation_factory, two_particle_snapshot_factory,
+                           d)
+    sim.operations.integrator.forces.append(table)
+    sim.run(0)
+
+    V, F = _lj_table(d)
+    energies = table.energies
+    forces = table.forces
+    if energies is not None:
+        assert sum(energies) == pytest.approx(V, rel=1e-4, abs=1e-6)
+        np.testing.assert_allclose(np.linalg.norm(forces, axis=1), abs(F),
+                                   rtol=1e-3,
+                                   atol=1e-5)
+
+
+def test_different_widths(simulation_factory, two_particle_snapshot_factory):
+    table = hoomd.md.pair.Table(nlist=hoomd.md.nlist.Cell())
+    r_short = np.linspace(1.0, 2.0, 3)
+    table.params[('A', 'A')] = dict(r_min=1.0,
+                                    r_max=2.0,
+                                    V=np.array([10.0, 20.0, 5.0]),
+                                    F=np.array([1.0, 6.0, 2.0]))
+    table.params[('A', 'B')] = dict(r_min=0.0,
+                                    r_max=2.0,
+                                    V=[20.0, 40.0, 10.0],
+                                    F=[2.0, 12.0, 4.0])
+    table.params[('B', 'B')] = dict(r_min=1.0,
+                                    r_max=4.0,
+                                    V=np.zeros(50),
+                                    F=np.zeros(50))
+
+    sim = _make_simulation(simulation_factory, two_particle_snapshot_factory,
+                           1.5)
+    sim.operations.integrator.forces.append(table)
+    sim.run(0)
+
+    # the spline through V = 40, 10 with slopes -F = -12, -4 at r = 1, 2
+    energies = table.energies
+    if energies is not None:
+        assert sum(energies) == pytest.approx(24.0)
+    assert len(table.params[('B', 'B')]['V']) == 50
+    assert len(table.params[('A', 'A')]['V']) == len(r_short)
@@ -111,6 +111,77 @@ def test_basic_system_2d(simulation_factory, lattice_snapshot_factory):
                               (8.0/2.0**2, 0., 0., 0., 0., 0.))
 
 
+def test_fused_filters(simulation_factory, lattice_snapshot_factory):
+    filterA = hoomd.filter.Type(['A'])
+    filterB = hoomd.filter.Type(['B'])
+    thermoA = hoomd.md.compute.ThermodynamicQuantities(filterA)
+    thermoB = hoomd.md.compute.ThermodynamicQuantities(filterB)
+    thermo_all = hoomd.md.compute.ThermodynamicQuantities(hoomd.filter.All())
+    snap = lattice_snapshot_factory(particle_types=['A', 'B'], n=2)
+    if snap.exists:
+        snap.particles.velocity[:] = [[-1, 0, 0], [2, 0, 0]] * 4
+        snap.particles.typeid[:] = [0, 1] * 4
+    sim = simulation_factory(snap)
+    sim.always_compute_pressure = True
+    sim.operations.computes.extend([thermoA, thermoB, thermo_all])
+
+    integrator = hoomd.md.Integrator(dt=0.0001)
+    integrator.methods.append(hoomd.md.methods.NVE(hoomd.filter.All()))
+    sim.operations.integrator = integrator
+
+    sim.run(1)
+    volume = sim.state.box.volume
+
+    # query the quantities in a different order for each filter
+    np.testing.assert_allclose(thermoB.pressure_tensor[0], 16.0 / volume,
+                               rtol=1e-4)
+    np.testing.assert_allclose(thermoA.translational_kinetic_energy, 2.0,
+                               rtol=1e-4)
+    np.testing.assert_allclose(thermo_all.kinetic_energy, 10.0, rtol=1e-4)
+    np.testing.assert_allclose(thermoB.translational_kinetic_energy, 8.0,
+                               rtol=1e-4)
+    np.testing.assert_allclose(thermoA.pressure_tensor[0], 4.0 / volume,
+                               rtol=1e-4)
+    np.testing.assert_allclose(thermo_all.pressure,
+                               thermoA.pressure + thermoB.pressure,
+                               rtol=1e-4)
+
+    # removing one compute leaves the others functional
+    sim.operations.computes.remove(thermoB)
+    sim.run(1)
+    np.testing.assert_allclose(thermo_all.translational_kinetic_energy, 10.0,
+                               rtol=1e-4)
+    np.testing.assert_allclose(thermoA.translational_kinetic_energy, 2.0,
+                               rtol=1e-4)
+
+
+def test_fused_filters_after_sort(simulation_factory, lattice_snapshot_factory):
+    thermoA = hoomd.md.compute.ThermodynamicQuantities(hoomd.filter.Type(['A']))
+    thermo_all = hoomd.md.compute.ThermodynamicQuantities(hoomd.filter.All())
+    snap = lattice_snapshot_factory(particle_types=['A', 'B'], n=2)
+    if snap.exists:
+        snap.particles.velocity[:] = [[-1, 0, 0], [2, 0, 0]] * 4
+        snap.particles.typeid[:] = [0, 1] * 4
+    sim = simulation_factory(snap)
+    sim.operations.computes.extend([thermoA, thermo_all])
+    sim.operations.tuners.append(
+        hoomd.tune.ParticleSorter(trigger=hoomd.trigger.Periodic(1)))
+
+    integrator = hoomd.md.Integrator(dt=0.0001)
+    integrator.methods.append(hoomd.md.methods.NVE(hoomd.filter.All()))
+    sim.operations.integrator = integrator
+
+    # the groups are rebuilt after every sort
+    for i in range(3):
+        sim.run(1)
+        np.testing.assert_allclose(thermoA.translational_kinetic_energy,
+                                   2.0,
+                                   rtol=1e-4)
+        np.testing.assert_allclose(thermo_all.translational_kinetic_energy,
+                                   10.0,
+                                   rtol=1e-4)
+
+
 def test_system_rotational_dof(simulation_factory, device):
 
     snap = hoomd.Snapshot(device.communicator)
@@ -0,0 +1,230 @@
+// Copyright (c) 2009-2021 The Regents of the University of Michigan
+// This file is part of the HOOMD-blue project, released under the BSD 3-Clause License.
+
+
+// this include is necessary to get MPI included before anything else to support intel MPI
+#include "hoomd/ExecutionConfiguration.h"
+
+#include <functional>
+#include <iostream>
+#include <sstream>
+#include <stdexcept>
+#include <vector>
+
+#include "hoomd/md/ForceDistanceConstraint.h"
+#include "hoomd/RandomNumbers.h"
+
+using namespace std;
+
+/*! \file test_force_distance_constraint.cc
+    \brief Implements unit tests for ForceDistanceConstraint
+    \ingroup unit_tests
+*/
+
+#include "hoomd/test/upp11_config.h"
+
+HOOMD_UP_MAIN();
+
+//! Number of constraints in the chain, which is solved iteratively
+const unsigned int n_chain_constraints = ForceDistanceConstraint::max_direct_constraints + 6;
+
+//! Time step used in the tests
+const Scalar deltaT = Scalar(0.005);
+
+//! Build a system with a dimer, a triangle, and a chain longer than max_direct_constraints
+/*! Every constraint has a length of 1. The particles have random masses, velocities, and net forces.
+*/
+std::shared_ptr<SystemDefinition> build_molecules(std::shared_ptr<ExecutionConfiguration> exec_conf)
+    {
+    const unsigned int n_chain = n_chain_constraints + 1;
+    const unsigned int N = 2 + 3 + n_chain;
+    std::shared_ptr<SystemDefinition> sysdef(new SystemDefinition(N, BoxDim(1000.0), 1, 0, 0, 0, 0, exec_conf));
+    std::shared_ptr<ParticleData> pdata = sysdef->getParticleData();
+    std::shared_ptr<ConstraintData> cdata = sysdef->getConstraintData();
+
+    hoomd::RandomGenerator rng(hoomd::Seed(0, 1, 2), hoomd::Counter());
+    hoomd::UniformDistribution<Scalar> uniform(Scalar(-1.0), Scalar(1.0));
+    auto random_unit_vector = [&]()
+        {
+        vec3<Scalar> v(uniform(rng), uniform(rng), uniform(rng));
+        return v / sqrt(dot(v, v));
+        };
+
+    // dimer
+    pdata->setPosition(0, make_scalar3(0.0, 0.0, 0.0));
+    pdata->setPosition(1, make_scalar3(1.0, 0.0, 0.0));
+    cdata->addBondedGroup(Constraint(1.0, 0, 1));
+
+    // triangle, in which every particle belongs to two constraints
+    pdata->setPosition(2, make_scalar3(10.0, 0.0, 0.0));
+    pdata->setPosition(3, make_scalar3(11.0, 0.0, 0.0));
+    pdata->setPosition(4, make_scalar3(10.5, sqrt(3.0)/2.0, 0.0));
+    cdata->addBondedGroup(Constraint(1.0, 2, 3));
+    cdata->addBondedGroup(Constraint(1.0, 3, 4));
+    cdata->addBondedGroup(Constraint(1.0, 4, 2));
+
+    // chain as a random walk
+    vec3<Scalar> r(-100.0, 0.0, 0.0);
+    for (unsigned int i = 0; i < n_chain; ++i)
+        {
+        unsigned int tag = 5 + i;
+        pdata->setPosition(tag, vec_to_scalar3(r));
+        if (i > 0)
+            cdata->addBondedGroup(Constraint(1.0, tag - 1, tag));
+        r += random_unit_vector();
+        }
+
+    for (unsigned int tag = 0; tag < N; ++tag)
+        {
+        pdata->setMass(tag, Scalar(1.0) + Scalar(0.5)*(uniform(rng) + Scalar(1.0)));
+        pdata->setVelocity(tag, vec_to_scalar3(Scalar(0.1)*vec3<Scalar>(uniform(rng), uniform(rng), uniform(rng))));
+        }
+
+        {
+        ArrayHandle<Scalar4> h_net_force(pdata->getNetForce(), access_location::host, access_mode::overwrite);
+        ArrayHandle<unsigned int> h_rtag(pdata->getRTags(), access_location::host, access_mode::read);
+        for (unsigned int tag = 0; tag < N; ++tag)
+            h_net_force.data[h_rtag.data[tag]] = make_scalar4(uniform(rng), uniform(rng), uniform(rng), 0.0);
+        }
+
+    return sysdef;
+    }
+
+//! Compute the constraint forces with a dense solve of all constraint equations at once
+/*! The matrix element of constraint equation n and Lagrange multiplier m sums 4 s_n(p) s_m(p) (q_n . r_m) / m_p over
+    the particles p of both constraints, where s(p) is +1 (-1) for the first (second) particle of a constraint.
+*/
+std::vector< vec3<Scalar> > reference_forces(std::shared_ptr<SystemDefinition> sysdef)
+    {
+    std::shared_ptr<ParticleData> pdata = sysdef->getParticleData();
+    std::shared_ptr<ConstraintData> cdata = sysdef->getConstraintData();
+    const unsigned int n_constraint = cdata->getN();
+    const BoxDim& box = pdata->getBox();
+
+    ArrayHandle<Scalar4> h_pos(pdata->getPositions(), access_location::host, access_mode::read);
+    ArrayHandle<Scalar4> h_vel(pdata->getVelocities(), access_location::host, access_mode::read);
+    ArrayHandle<Scalar4> h_net_force(pdata->getNetForce(), access_location::host, access_mode::read);
+    ArrayHandle<unsigned int> h_rtag(pdata->getRTags(), access_location::host, access_mode::read);
+
+    std::vector<unsigned int> idx_a(n_constraint), idx_b(n_constraint);
+    std::vector< vec3<Scalar> > r(n_constraint), q(n_constraint);
+    Eigen::VectorXd rhs(n_constraint);
+    for (unsigned int n = 0; n < n_constraint; ++n)
+        {
+        const ConstraintData::members_t constraint = cdata->getMembersByIndex(n);
+        idx_a[n] = h_rtag.data[constraint.tag[0]];
+        idx_b[n] = h_rtag.data[constraint.tag[1]];
+        r[n] = box.minImage(vec3<Scalar>(h_pos.data[idx_a[n]]) - vec3<Scalar>(h_pos.data[idx_b[n]]));
+        q[n] = r[n] + (vec3<Scalar>(h_vel.data[idx_a[n]]) - vec3<Scalar>(h_vel.data[idx_b[n]]))*deltaT;
+
+        Scalar d = cdata->getValueByIndex(n);
+        rhs(n) = (dot(q[n], q[n]) - d*d)/deltaT/deltaT
+            + 2.0*dot(q[n], vec3<Scalar>(h_net_force.data[idx_a[n]])/h_vel.data[idx_a[n]].w
+                - vec3<Scalar>(h_net_force.data[idx_b[n]])/h_vel.data[idx_b[n]].w);
+        }
+
+    Eigen::MatrixXd matrix = Eigen::MatrixXd::Zero(n_constraint, n_constraint);
+    for (unsigned int n = 0; n < n_constraint; ++n)
+        {
+        unsigned int particles_n[2] = {idx_a[n], idx_b[n]};
+        for (unsigned int m = 0; m < n_constraint; ++m)
+            {
+            unsigned int particles_m[2] = {idx_a[m], idx_b[m]};
+            for (unsigned int i = 0; i < 2; ++i)
+                for (unsigned int j = 0; j < 2; ++j)
+                    {
+                    if (particles_n[i] != particles_m[j])
+                        continue;
+                    double sign = (i == j) ? 1.0 : -1.0;
+                    matrix(n, m) += 4.0*sign*dot(q[n], r[m])/h_vel.data[particles_n[i]].w;
+                    }
+            }
+        }
+
+    Eigen::VectorXd lagrange = matrix.fullPivLu().solve(rhs);
+
+    std::vector< vec3<Scalar> > force(pdata->getN(), vec3<Scalar>(0.0, 0.0, 0.0));
+    for (unsigned int n = 0; n < n_constraint; ++n)
+        {
+        force[idx_a[n]] -= Scalar(2.0*lagrange(n))*r[n];
+        force[idx_b[n]] += Scalar(2.0*lagrange(n))*r[n];
+        }
+    return force;
+    }
+
+//! Constraint forces of molecules of all sizes match a direct solve of the whole system
+UP_TEST( ForceDistanceConstraint_molecules )
+    {
+    std::shared_ptr<ExecutionConfiguration> exec_conf(new ExecutionConfiguration(ExecutionConfiguration::CPU));
+    std::shared_ptr<SystemDefinition> sysdef = build_molecules(exec_conf);
+    std::shared_ptr<ParticleData> pdata = sysdef->getParticleData();
+
+    std::shared_ptr<ForceDistanceConstraint> fdc(new ForceDistanceConstraint(sysdef));
+    fdc->setDeltaT(deltaT);
+    fdc->compute(0);
+
+    // the dimer, triangle, and chain are separate molecules
+    UP_ASSERT_EQUAL(fdc->getMoleculeIndexer().getH(), (unsigned int)3);
+    UP_ASSERT_EQUAL(fdc->getMoleculeIndexer().getW(), n_chain_constraints + 1);
+
+    std::vector< vec3<Scalar> > reference = reference_forces(sysdef);
+
+    ArrayHandle<Scalar4> h_force(fdc->getForceArray(), access_location::host, access_mode::read);
+    for (unsigned int i = 0; i < pdata->getN(); ++i)
+        {
+        MY_CHECK_CLOSE(h_force.data[i].x, reference[i].x, tol);
+        MY_CHECK_CLOSE(h_force.data[i].y, reference[i].y, tol);
+        MY_CHECK_CLOSE(h_force.data[i].z, reference[i].z, tol);
+        }
+    }
+
+//! The solver parameters must be positive
+UP_TEST( ForceDistanceConstraint_solver_parameters )
+    {
+    std::shared_ptr<ExecutionConfiguration> exec_conf(new ExecutionConfiguration(ExecutionConfiguration::CPU));
+    std::shared_ptr<SystemDefinition> sysdef = build_molecules(exec_conf);
+    std::shared_ptr<ForceDistanceConstraint> fdc(new ForceDistanceConstraint(sysdef));
+
+    auto throws_invalid_argument = [](std::function<void ()> f)
+        {
+        try
+            {
+            f();
+            }
+        catch (const std::invalid_argument&)
+            {
+            return true;
+            }
+        return false;
+        };
+
+    UP_ASSERT(throws_invalid_argument([&]{ fdc->setSolverTolerance(0.0); }));
+    UP_ASSERT(throws_invalid_argument([&]{ fdc->setSolverTolerance(-1e-6); }));
+    UP_ASSERT(throws_invalid_argument([&]{ fdc->setMaxIterations(0); }));
+    UP_ASSERT(!throws_invalid_argument([&]{ fdc->setSolverTolerance(1e-6); }));
+    UP_ASSERT(!throws_invalid_argument([&]{ fdc->setMaxIterations(10); }));
+    }
+
+//! The iterative solver warns when a molecule does not converge
+UP_TEST( ForceDistanceConstraint_not_converged )
+    {
+    std::shared_ptr<ExecutionConfiguration> exec_conf(new ExecutionConfiguration(ExecutionConfiguration::CPU));
+    std::shared_ptr<SystemDefinition> sysdef = build_molecules(exec_conf);
+    std::shared_ptr<ForceDistanceConstraint> fdc(new ForceDistanceConstraint(sysdef));
+    fdc->setDeltaT(deltaT);
+
+    std::ostringstream warnings;
+    exec_conf->msg->setWarningStream(warnings);
+
+    // the chain converges with the default settings
+    fdc->compute(0);
+    UP_ASSERT(warnings.str().find("did not converge") == std::string::npos);
+
+    // but not in a single iteration
+    fdc->setSolverTolerance(1e-14);
+    fdc->setMaxIterations(1);
+    fdc->compute(1);
+    UP_ASSERT(warnings.str().find("1 molecule(s) did not converge within 1 iterations") != std::string::npos);
+
+    exec_conf->msg->setWarningStream(std::cerr);
+    }
@@ -16,6 +16,11 @@
 #include "hoomd/md/NeighborListTree.h"
 #include "hoomd/Initializers.h"
 
+#ifdef ENABLE_MPI
+#include "hoomd/Communicator.h"
+#include "hoomd/DomainDecomposition.h"
+#endif
+
 #ifdef ENABLE_HIP
 #include "hoomd/md/NeighborListGPU.h"
 #include "hoomd/md/NeighborListGPUBinned.h"
@@ -1431,6 +1436,53 @@ void neighborlist_2d_tests(std::shared_ptr<ExecutionConfiguration> exec_conf)
         }
     }
 
+#ifdef ENABLE_MPI
+//! Test that binned neighbor lists share a cell list when the communicator is set after construction
+UP_TEST( NeighborListBinned_shared_cell_list_mpi )
+    {
+    std::shared_ptr<ExecutionConfiguration> exec_conf(new ExecutionConfiguration(ExecutionConfiguration::CPU));
+    std::shared_ptr<SystemDefinition> sysdef(new SystemDefinition(2, BoxDim(25.0), 1, 0, 0, 0, 0, exec_conf));
+    std::shared_ptr<ParticleData> pdata = sysdef->getParticleData();
+
+    SnapshotParticleData<Scalar> snap(2);
+    pdata->takeSnapshot(snap);
+    snap.pos[0] = vec3<Scalar>(0.0, 0.0, 0.0);
+    snap.pos[1] = vec3<Scalar>(1.0, 1.0, 1.0);
+
+    std::shared_ptr<DomainDecomposition> decomposition(new DomainDecomposition(exec_conf, pdata->getBox().getL()));
+    pdata->setDomainDecomposition(decomposition);
+    pdata->initializeFromSnapshot(snap);
+    std::shared_ptr<Communicator> comm(new Communicator(sysdef, decomposition));
+
+    // the neighbor lists request their cell lists on construction, before they know the communicator
+    std::shared_ptr<NeighborListBinned> nlist_a(new NeighborListBinned(sysdef, 0.25));
+    nlist_a->setCommunicator(comm);
+    std::shared_ptr<NeighborListBinned> nlist_b(new NeighborListBinned(sysdef, 0.25));
+    nlist_b->setCommunicator(comm);
+    UP_ASSERT(nlist_a->getCellList() == nlist_b->getCellList());
+
+    auto r_cut = std::make_shared<GlobalArray<Scalar>>(nlist_a->getTypePairIndexer().getNumElements(), exec_conf);
+        {
+        ArrayHandle<Scalar> h_r_cut(*r_cut, access_location::host, access_mode::overwrite);
+        h_r_cut.data[0] = 3.0;
+        }
+    nlist_a->addRCutMatrix(r_cut);
+    nlist_b->addRCutMatrix(r_cut);
+
+    // the lists with the same cutoff still share after sizing the cells for it
+    comm->communicate(0);
+    nlist_a->compute(0);
+    nlist_b->compute(0);
+    UP_ASSERT(nlist_a->getCellList() == nlist_b->getCellList());
+
+    // and both find the same neighbors
+    ArrayHandle<unsigned int> h_n_neigh_a(nlist_a->getNNeighArray(), access_location::host, access_mode::read);
+    ArrayHandle<unsigned int> h_n_neigh_b(nlist_b->getNNeighArray(), access_location::host, access_mode::read);
+    for (unsigned int i = 0; i < pdata->getN(); ++i)
+        UP_ASSERT_EQUAL(h_n_neigh_a.data[i], h_n_neigh_b.data[i]);
+    }
+#endif
+
 ///////////////
 // BINNED CPU
 ///////////////
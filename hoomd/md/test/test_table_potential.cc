@@ -28,8 +28,7 @@ HOOMD_UP_MAIN();
 
 //! Typedef'd TablePotential factory
 typedef std::function<std::shared_ptr<TablePotential> (std::shared_ptr<SystemDefinition> sysdef,
-                                                    std::shared_ptr<NeighborList> nlist,
-                                                    unsigned int width)> table_potential_creator;
+                                                    std::shared_ptr<NeighborList> nlist)> table_potential_creator;
 
 //! performs some really basic checks on the TablePotential class
 void table_potential_basic_test(table_potential_creator table_creator, std::shared_ptr<ExecutionConfiguration> exec_conf)
@@ -49,7 +48,7 @@ void table_potential_basic_test(table_potential_creator table_creator, std::shar
     ArrayHandle<Scalar> h_r_cut(*r_cut, access_location::host, access_mode::overwrite);
     h_r_cut.data[0] = 7.0;
     nlist_2->addRCutMatrix(r_cut);
-    std::shared_ptr<TablePotential> fc_2 = table_creator(sysdef_2, nlist_2, 3);
+    std::shared_ptr<TablePotential> fc_2 = table_creator(sysdef_2, nlist_2);
 
     // first check for proper initialization by seeing if the force and potential come out to be 0
     fc_2->compute(0);
@@ -154,7 +153,8 @@ void table_potential_basic_test(table_potential_creator table_creator, std::shar
                                        +h_virial_3.data[5*pitch+1]), (1.0 / 6.0) * 2.0, tol);
     }
 
-    // go halfway in-between two points
+    // go halfway in-between two points, where the spline through V = 21, 5 with slopes -F = -6, -2 gives
+    // V = 12.5 and F = 22
     {
     ArrayHandle<Scalar4> h_pos(pdata_2->getPositions(), access_location::host, access_mode::readwrite);
     h_pos.data[1].y = Scalar(3.5);
@@ -170,21 +170,21 @@ void table_potential_basic_test(table_potential_creator table_creator, std::shar
     size_t pitch = virial_array_4.getPitch();
     ArrayHandle<Scalar4> h_force_4(force_array_4,access_location::host,access_mode::read);
     ArrayHandle<Scalar> h_virial_4(virial_array_4,access_location::host,access_mode::read);
-    MY_CHECK_CLOSE(h_force_4.data[0].y, -4.0, tol);
+    MY_CHECK_CLOSE(h_force_4.data[0].y, -22.0, tol);
     MY_CHECK_SMALL(h_force_4.data[0].x, tol_small);
     MY_CHECK_SMALL(h_force_4.data[0].z, tol_small);
-    MY_CHECK_CLOSE(h_force_4.data[0].w, 13.0/2.0, tol);
+    MY_CHECK_CLOSE(h_force_4.data[0].w, 12.5/2.0, tol);
     MY_CHECK_CLOSE(Scalar(1./3.)*(h_virial_4.data[0*pitch+0]
                                        +h_virial_4.data[3*pitch+0]
-                                       +h_virial_4.data[5*pitch+0]), (1.0 / 6.0) * 4.0 * 3.5, tol);
+                                       +h_virial_4.data[5*pitch+0]), (1.0 / 6.0) * 22.0 * 3.5, tol);
 
-    MY_CHECK_CLOSE(h_force_4.data[1].y, 4.0, tol);
+    MY_CHECK_CLOSE(h_force_4.data[1].y, 22.0, tol);
     MY_CHECK_SMALL(h_force_4.data[1].x, tol_small);
     MY_CHECK_SMALL(h_force_4.data[1].z, tol_small);
-    MY_CHECK_CLOSE(h_force_4.data[1].w, 13.0 / 2.0, tol);
+    MY_CHECK_CLOSE(h_force_4.data[1].w, 12.5 / 2.0, tol);
     MY_CHECK_CLOSE(Scalar(1./3.)*(h_virial_4.data[0*pitch+1]
                                        +h_virial_4.data[3*pitch+1]
-                                       +h_virial_4.data[5*pitch+1]), (1.0 / 6.0) * 4.0 * 3.5, tol);
+                                       +h_virial_4.data[5*pitch+1]), (1.0 / 6.0) * 22.0 * 3.5, tol);
     }
 
     // and now check for when r > rmax
@@ -246,7 +246,7 @@ void table_potential_type_test(table_potential_creator table_creator, std::share
     ArrayHandle<Scalar> h_r_cut(*r_cut, access_location::host, access_mode::overwrite);
     h_r_cut.data[0] = 2.0;
     nlist->addRCutMatrix(r_cut);
-    std::shared_ptr<TablePotential> fc = table_creator(sysdef, nlist, 3);
+    std::shared_ptr<TablePotential> fc = table_creator(sysdef, nlist);
 
     // specify a table to interpolate
     vector<Scalar> V, F;
@@ -269,7 +269,8 @@ void table_potential_type_test(table_potential_creator table_creator, std::share
     V.push_back(2.5);   F.push_back(2.0);
     fc->setTable(1, 1, V, F, 1.0, 2.0);
 
-    // compute and check
+    // compute and check, the A-B pairs are halfway in-between two points where the spline through V = 40, 10 with
+    // slopes -F = -12, -4 gives V = 24 and F = 41
     fc->compute(0);
 
     {
@@ -278,56 +279,54 @@ void table_potential_type_test(table_potential_creator table_creator, std::share
     size_t pitch = virial_array_6.getPitch();
     ArrayHandle<Scalar4> h_force_6(force_array_6,access_location::host,access_mode::read);
     ArrayHandle<Scalar> h_virial_6(virial_array_6,access_location::host,access_mode::read);
-    MY_CHECK_CLOSE(h_force_6.data[0].x, -8.0, tol);
+    MY_CHECK_CLOSE(h_force_6.data[0].x, -41.0, tol);
     MY_CHECK_CLOSE(h_force_6.data[0].y, -6.0, tol);
     MY_CHECK_SMALL(h_force_6.data[0].z, tol_small);
-    MY_CHECK_SMALL(h_force_6.data[0].w, 10.0+25.0);
+    MY_CHECK_CLOSE(h_force_6.data[0].w, 10.0 + 12.0, tol);
     MY_CHECK_CLOSE(Scalar(1./3.)*(h_virial_6.data[0*pitch+0]
                                        +h_virial_6.data[3*pitch+0]
-                                       +h_virial_6.data[5*pitch+0]), (8*1.5+6*1.5)*1.0/6.0, tol);
+                                       +h_virial_6.data[5*pitch+0]), (41*1.5+6*1.5)*1.0/6.0, tol);
 
-    MY_CHECK_CLOSE(h_force_6.data[1].x, 8.0, tol);
+    MY_CHECK_CLOSE(h_force_6.data[1].x, 41.0, tol);
     MY_CHECK_CLOSE(h_force_6.data[1].y, -3.0, tol);
     MY_CHECK_SMALL(h_force_6.data[1].z, tol_small);
-    MY_CHECK_CLOSE(h_force_6.data[1].w, 25.0/2.0 + 5.0, tol);
+    MY_CHECK_CLOSE(h_force_6.data[1].w, 24.0/2.0 + 5.0, tol);
     MY_CHECK_CLOSE(Scalar(1./3.)*(h_virial_6.data[0*pitch+1]
                                        +h_virial_6.data[3*pitch+1]
-                                       +h_virial_6.data[5*pitch+1]), (8*1.5 + 3.0 * 1.5)*1.0/6.0, tol);
+                                       +h_virial_6.data[5*pitch+1]), (41*1.5 + 3.0 * 1.5)*1.0/6.0, tol);
 
-    MY_CHECK_CLOSE(h_force_6.data[2].x, -8.0, tol);
+    MY_CHECK_CLOSE(h_force_6.data[2].x, -41.0, tol);
     MY_CHECK_CLOSE(h_force_6.data[2].y, 6.0, tol);
     MY_CHECK_SMALL(h_force_6.data[2].z, tol_small);
-    MY_CHECK_SMALL(h_force_6.data[2].w, 10.0+25.0);
+    MY_CHECK_CLOSE(h_force_6.data[2].w, 10.0 + 12.0, tol);
     MY_CHECK_CLOSE(Scalar(1./3.)*(h_virial_6.data[0*pitch+2]
                                        +h_virial_6.data[3*pitch+2]
-                                       +h_virial_6.data[5*pitch+2]), (8*1.5+6*1.5)*1.0/6.0, tol);
+                                       +h_virial_6.data[5*pitch+2]), (41*1.5+6*1.5)*1.0/6.0, tol);
 
-    MY_CHECK_CLOSE(h_force_6.data[3].x, 8.0, tol);
+    MY_CHECK_CLOSE(h_force_6.data[3].x, 41.0, tol);
     MY_CHECK_CLOSE(h_force_6.data[3].y, 3.0, tol);
     MY_CHECK_SMALL(h_force_6.data[3].z, tol_small);
-    MY_CHECK_CLOSE(h_force_6.data[3].w, 25.0/2.0 + 5.0, tol);
+    MY_CHECK_CLOSE(h_force_6.data[3].w, 24.0/2.0 + 5.0, tol);
     MY_CHECK_CLOSE(Scalar(1./3.)*(h_virial_6.data[0*pitch+3]
                                        +h_virial_6.data[3*pitch+3]
-                                       +h_virial_6.data[5*pitch+3]), (8*1.5 + 3.0*1.5)*1.0/6.0, tol);
+                                       +h_virial_6.data[5*pitch+3]), (41*1.5 + 3.0*1.5)*1.0/6.0, tol);
     }
     }
 
 //! TablePotential creator for unit tests
 std::shared_ptr<TablePotential> base_class_table_creator(std::shared_ptr<SystemDefinition> sysdef,
-                                                    std::shared_ptr<NeighborList> nlist,
-                                                    unsigned int width)
+                                                    std::shared_ptr<NeighborList> nlist)
     {
-    return std::shared_ptr<TablePotential>(new TablePotential(sysdef, nlist, width));
+    return std::shared_ptr<TablePotential>(new TablePotential(sysdef, nlist));
     }
 
 #ifdef ENABLE_HIP
 //! TablePotentialGPU creator for unit tests
 std::shared_ptr<TablePotential> gpu_table_creator(std::shared_ptr<SystemDefinition> sysdef,
-                                             std::shared_ptr<NeighborList> nlist,
-                                             unsigned int width)
+                                             std::shared_ptr<NeighborList> nlist)
     {
     nlist->setStorageMode(NeighborList::full);
-    std::shared_ptr<TablePotentialGPU> table(new TablePotentialGPU(sysdef, nlist, width));
+    std::shared_ptr<TablePotentialGPU> table(new TablePotentialGPU(sysdef, nlist));
     return table;
     }
 #endif
@@ -336,14 +335,14 @@ std::shared_ptr<TablePotential> gpu_table_creator(std::shared_ptr<SystemDefiniti
 //! test case for basic test on CPU
 UP_TEST( TablePotential_basic )
     {
-    table_potential_creator table_creator_base = bind(base_class_table_creator, _1, _2, _3);
+    table_potential_creator table_creator_base = bind(base_class_table_creator, _1, _2);
     table_potential_basic_test(table_creator_base, std::shared_ptr<ExecutionConfiguration>(new ExecutionConfiguration(ExecutionConfiguration::CPU)));
     }
 
 //! test case for type test on CPU
 UP_TEST( TablePotential_type )
     {
-    table_potential_creator table_creator_base = bind(base_class_table_creator, _1, _2, _3);
+    table_potential_creator table_creator_base = bind(base_class_table_creator, _1, _2);
     table_potential_type_test(table_creator_base, std::shared_ptr<ExecutionConfiguration>(new ExecutionConfiguration(ExecutionConfiguration::CPU)));
     }
 
@@ -351,14 +350,14 @@ UP_TEST( TablePotential_type )
 //! test case for basic test on GPU
 UP_TEST( TablePotentialGPU_basic )
     {
-    table_potential_creator table_creator_gpu = bind(gpu_table_creator, _1, _2, _3);
+    table_potential_creator table_creator_gpu = bind(gpu_table_creator, _1, _2);
     table_potential_basic_test(table_creator_gpu, std::shared_ptr<ExecutionConfiguration>(new ExecutionConfiguration(ExecutionConfiguration::GPU)));
     }
 
 //! test case for type test on GPU
 UP_TEST( TablePotentialGPU_type )
     {
-    table_potential_creator table_creator_gpu = bind(gpu_table_creator, _1, _2, _3);
+    table_potential_creator table_creator_gpu = bind(gpu_table_creator, _1, _2);
     table_potential_type_test(table_creator_gpu, std::shared_ptr<ExecutionConfiguration>(new ExecutionConfiguration(ExecutionConfiguration::GPU)));
     }
 #endif
@@ -6,6 +6,13 @@
 
 #include "EAMForceCompute.h"
 
+#ifdef ENABLE_MPI
+#include "hoomd/Communicator.h"
+#endif
+
+#include <pybind11/numpy.h>
+
+#include <algorithm>
 #include <vector>
 
 using namespace std;
@@ -19,23 +26,36 @@ namespace py = pybind11;
  */
 
 /*! \param sysdef System to compute forces on
- \param filename Name of EAM potential file to load
- \param type_of_file EAM/Alloy=0, EAM/FS=1
+ \param nlist Neighborlist to use for computing the forces
  */
-EAMForceCompute::EAMForceCompute(std::shared_ptr<SystemDefinition> sysdef, char *filename, int type_of_file) :
-        ForceCompute(sysdef)
+EAMForceCompute::EAMForceCompute(std::shared_ptr<SystemDefinition> sysdef, std::shared_ptr<NeighborList> nlist) :
+        ForceCompute(sysdef), m_nlist(nlist), m_r_cut(0.0), nrho(0), drho(1.0), rdrho(1.0), nr(0), dr(1.0), rdr(1.0),
+        m_tables_changed(true)
     {
 
     m_exec_conf->msg->notice(5) << "Constructing EAMForceCompute" << endl;
 
     assert(m_pdata);
-
-    loadFile(filename, type_of_file);
+    assert(m_nlist);
 
     // initialize the number of types value
     m_ntypes = m_pdata->getNTypes();
     assert(m_ntypes > 0);
 
+    // no type has a table yet
+    m_type_pair_idx = Index2DUpperTriangular(m_ntypes);
+    m_F_table.resize(m_ntypes);
+    m_rho_table.resize(m_ntypes);
+    m_rho_per_type.resize(m_ntypes, false);
+    m_rphi_table.resize(m_type_pair_idx.getNumElements());
+
+    Index2D full_type_pair_idx(m_ntypes);
+    m_r_cut_nlist = std::make_shared<GlobalArray<Scalar>>(full_type_pair_idx.getNumElements(), m_exec_conf);
+    nlist->addRCutMatrix(m_r_cut_nlist);
+
+    GlobalArray<Scalar> dFdP(m_pdata->getMaxN(), m_exec_conf);
+    m_dFdP.swap(dFdP);
+
     // connect to the ParticleData to receive notifications when the number of particle types changes
     m_pdata->getNumTypesChangeSignal().connect<EAMForceCompute, &EAMForceCompute::slotNumTypesChange>(this);
     }
@@ -44,199 +64,254 @@ EAMForceCompute::~EAMForceCompute()
     {
     m_exec_conf->msg->notice(5) << "Destroying EAMForceCompute" << endl;
     m_pdata->getNumTypesChangeSignal().disconnect<EAMForceCompute, &EAMForceCompute::slotNumTypesChange>(this);
+
+    if (m_attached)
+        {
+        m_nlist->removeRCutMatrix(m_r_cut_nlist);
+        }
     }
 
-void EAMForceCompute::loadFile(char *filename, int type_of_file)
+void EAMForceCompute::slotNumTypesChange()
     {
-    unsigned int tmp_int, type, i, j, k;
-    double tmp_mass, tmp;
-    char tmp_str[5];
-
-    const int MAX_TYPE_NUMBER = 10;
-    const int MAX_POINT_NUMBER = 1000000;
+    unsigned int old_ntypes = m_ntypes;
+    m_ntypes = m_pdata->getNTypes();
+    assert(m_ntypes > 0);
 
-    // Open potential file
-    FILE *fp;
-    fp = fopen(filename, "r");
-    if (fp == NULL)
+    // move the pair tables of the existing type pairs to their new index
+    Index2DUpperTriangular new_type_pair_idx(m_ntypes);
+    std::vector< std::vector<Scalar> > new_rphi_table(new_type_pair_idx.getNumElements());
+    const unsigned int n_common_types = std::min(m_ntypes, old_ntypes);
+    for (unsigned int i = 0; i < n_common_types; i++)
         {
-        m_exec_conf->msg->error() << "pair.eam: Can not load EAM file" << endl;
-        throw runtime_error("Error loading file");
+        for (unsigned int j = i; j < n_common_types; j++)
+            {
+            new_rphi_table[new_type_pair_idx(i, j)].swap(m_rphi_table[m_type_pair_idx(i, j)]);
+            }
         }
-    for (i = 0; i < 3; i++)
-        while (fgetc(fp) != '\n')
-            ;
-    m_ntypes = 0;
-    int n = fscanf(fp, "%d", &m_ntypes);
-    if (n != 1)
-        throw runtime_error("Error parsing eam file");
+    m_rphi_table.swap(new_rphi_table);
+    m_type_pair_idx = new_type_pair_idx;
+    m_F_table.resize(m_ntypes);
+    m_rho_table.resize(m_ntypes);
+    m_rho_per_type.resize(m_ntypes, false);
+
+    // all type pairs share the same cut-off radius, except for the r_cut_nlist which the nlist also refers to
+    Index2D full_type_pair_idx(m_ntypes);
+    GlobalArray<Scalar> new_r_cut_nlist(full_type_pair_idx.getNumElements(), m_exec_conf);
+    *m_r_cut_nlist = new_r_cut_nlist;
+    setRCut(m_r_cut);
+
+    m_tables_changed = true;
+    }
 
-    if (m_ntypes < 1 || m_ntypes > MAX_TYPE_NUMBER)
-        {
-        m_exec_conf->msg->error() << "pair.eam: Invalid EAM file format: Type number is greater than "
-                << MAX_TYPE_NUMBER << endl;
-        throw runtime_error("Error loading file");
-        }
+/*! \param type_name Name of the particle type
+ \param params Dictionary with the keys F and rho
+ */
+void EAMForceCompute::setEmbedding(const std::string& type_name, py::dict params)
+    {
+    unsigned int typ = m_pdata->getTypeByName(type_name);
+
+    typedef py::array_t<Scalar, py::array::c_style | py::array::forcecast> table_array;
+    table_array F = params["F"].cast<table_array>();
+    table_array rho = params["rho"].cast<table_array>();
+    if (F.ndim() != 1)
+        throw runtime_error("F must be a one dimensional array");
+    if (rho.ndim() != 1 && !(rho.ndim() == 2 && rho.shape(0) == (py::ssize_t) m_ntypes))
+        throw runtime_error("rho must be a one dimensional array or have one row per particle type");
+
+    m_F_table[typ].assign(F.data(), F.data() + F.size());
+    m_rho_table[typ].assign(rho.data(), rho.data() + rho.size());
+    m_rho_per_type[typ] = rho.ndim() == 2;
+    m_tables_changed = true;
+    }
+
+/*! \param type_name Name of the particle type
+ \returns Dictionary with the keys F and rho
+ */
+py::dict EAMForceCompute::getEmbedding(const std::string& type_name)
+    {
+    unsigned int typ = m_pdata->getTypeByName(type_name);
+    const std::vector<Scalar>& F = m_F_table[typ];
+    const std::vector<Scalar>& rho = m_rho_table[typ];
+
+    py::dict params;
+    params["F"] = py::array_t<Scalar>(F.size(), F.data());
+    if (m_rho_per_type[typ])
+        params["rho"] = py::array_t<Scalar>(
+            std::vector<py::ssize_t>({(py::ssize_t) m_ntypes, (py::ssize_t) (rho.size() / m_ntypes)}),
+            rho.data());
+    else
+        params["rho"] = py::array_t<Scalar>(rho.size(), rho.data());
+    return params;
+    }
+
+/*! \param types Tuple of the names of the two particle types
+ \param params Dictionary with the key rphi
+ */
+void EAMForceCompute::setPair(py::tuple types, py::dict params)
+    {
+    unsigned int typ1 = m_pdata->getTypeByName(types[0].cast<std::string>());
+    unsigned int typ2 = m_pdata->getTypeByName(types[1].cast<std::string>());
+
+    typedef py::array_t<Scalar, py::array::c_style | py::array::forcecast> table_array;
+    table_array rphi = params["rphi"].cast<table_array>();
+    if (rphi.ndim() != 1)
+        throw runtime_error("rphi must be a one dimensional array");
+
+    m_rphi_table[m_type_pair_idx(typ1, typ2)].assign(rphi.data(), rphi.data() + rphi.size());
+    m_tables_changed = true;
+    }
+
+/*! \param types Tuple of the names of the two particle types
+ \returns Dictionary with the key rphi
+ */
+py::dict EAMForceCompute::getPair(py::tuple types)
+    {
+    unsigned int typ1 = m_pdata->getTypeByName(types[0].cast<std::string>());
+    unsigned int typ2 = m_pdata->getTypeByName(types[1].cast<std::string>());
+    const std::vector<Scalar>& rphi = m_rphi_table[m_type_pair_idx(typ1, typ2)];
+
+    py::dict params;
+    params["rphi"] = py::array_t<Scalar>(rphi.size(), rphi.data());
+    return params;
+    }
+
+/*! \param r_cut Cut-off radius of all type pairs
+ */
+void EAMForceCompute::setRCut(Scalar r_cut)
+    {
+    if (r_cut < Scalar(0.0))
+        throw std::invalid_argument("r_cut must be non-negative");
+    m_r_cut = r_cut;
+    m_tables_changed = true;
 
-    // temporary array to count used types
-    std::vector<bool> types_set(m_pdata->getNTypes(), false);
-    //Load names of types.
-    for (i = 0; i < m_ntypes; i++)
         {
-        n = fscanf(fp, "%2s", tmp_str);
-        if (n != 1)
-            throw runtime_error("Error parsing eam file");
-        names.push_back(tmp_str);
-        unsigned int tid = m_pdata->getTypeByName(tmp_str);
-        types.push_back(tid);
-        types_set[tid] = true;
+        ArrayHandle<Scalar> h_r_cut_nlist(*m_r_cut_nlist, access_location::host, access_mode::overwrite);
+        for (unsigned int i = 0; i < m_r_cut_nlist->getNumElements(); i++)
+            h_r_cut_nlist.data[i] = m_r_cut;
         }
 
-    //Check that all types of atoms in xml file have description in potential file
-    unsigned int count_types_set = 0;
-    for (i = 0; i < m_pdata->getNTypes(); i++)
+    // notify the neighbor list that we have changed r_cut values
+    m_nlist->notifyRCutMatrixChange();
+    }
+
+/*! Check the tables for consistency and compute the interpolation coefficients. Does nothing when no table has
+ changed since the last call.
+ */
+void EAMForceCompute::updateTables()
+    {
+    if (!m_tables_changed)
+        return;
+
+    // all embedding functions must have the same number of points, likewise for the functions of r
+    nrho = (unsigned int) m_F_table[0].size();
+    nr = (unsigned int) m_rphi_table[0].size();
+    for (unsigned int i = 0; i < m_ntypes; i++)
         {
-        if (types_set[i])
-            count_types_set++;
+        if (m_F_table[i].size() == 0)
+            {
+            throw runtime_error("EAM: no embedding function set for type " + m_pdata->getNameByType(i));
+            }
+        if (m_F_table[i].size() != nrho)
+            {
+            throw runtime_error("EAM: all embedding functions must have the same number of points");
+            }
+        if (m_rho_table[i].size() != (m_rho_per_type[i] ? nr * m_ntypes : nr))
+            {
+            throw runtime_error("EAM: the electron density of type " + m_pdata->getNameByType(i)
+                                + " must have the same number of points as the pair potentials");
+            }
         }
-    if (m_pdata->getNTypes() != count_types_set)
+    for (unsigned int i = 0; i < m_type_pair_idx.getNumElements(); i++)
         {
-        m_exec_conf->msg->error() << "pair.eam: not all atom types are defined in EAM potential file!!!" << endl;
-        throw runtime_error("Error loading file");
+        if (m_rphi_table[i].size() != nr)
+            {
+            throw runtime_error("EAM: all type pairs need pair potentials with the same number of points");
+            }
         }
-
-    //Load parameters.
-    n = fscanf(fp, "%d", &nrho);
-    if (n != 1)
-        throw runtime_error("Error parsing eam file");
-
-    n = fscanf(fp, "%lg", &tmp);
-    if (n != 1)
-        throw runtime_error("Error parsing eam file");
-    drho = (Scalar) tmp;
-    rdrho = (Scalar) (1.0 / drho);
-
-    n = fscanf(fp, "%d", &nr);
-    if (n != 1)
-        throw runtime_error("Error parsing eam file");
-
-    n = fscanf(fp, "%lg", &tmp);
-    if (n != 1)
-        throw runtime_error("Error parsing eam file");
-    dr = (Scalar) tmp;
-    rdr = (Scalar) (1.0 / dr);
-
-    n = fscanf(fp, "%lg", &tmp);
-    if (n != 1)
-        throw runtime_error("Error parsing eam file");
-    m_r_cut = (Scalar) tmp;
-
-    if (nrho < 1 || nr < 1 || nrho > MAX_POINT_NUMBER || nr > MAX_POINT_NUMBER)
+    if (nrho < 4 || nr < 4)
         {
-        m_exec_conf->msg->error() << "pair.eam: Invalid EAM file format: Point number is greater than "
-                << MAX_POINT_NUMBER << endl;
-        throw runtime_error("Error loading file");
+        throw runtime_error("EAM: the tables need at least 4 points");
         }
 
+    rdrho = Scalar(1.0) / drho;
+    rdr = Scalar(1.0) / dr;
+
     //allocate potential data storage
     GPUArray<Scalar4> t_F(nrho * m_ntypes, m_exec_conf);
     m_F.swap(t_F);
-    ArrayHandle<Scalar4> h_F(m_F, access_location::host, access_mode::readwrite);
+    ArrayHandle<Scalar4> h_F(m_F, access_location::host, access_mode::overwrite);
 
     GPUArray<Scalar4> t_rho(nr * m_ntypes * m_ntypes, m_exec_conf);
     m_rho.swap(t_rho);
-    ArrayHandle<Scalar4> h_rho(m_rho, access_location::host, access_mode::readwrite);
+    ArrayHandle<Scalar4> h_rho(m_rho, access_location::host, access_mode::overwrite);
 
-    GPUArray<Scalar4> t_rphi((int) (0.5 * nr * (m_ntypes + 1) * m_ntypes), m_exec_conf);
+    GPUArray<Scalar4> t_rphi(nr * m_type_pair_idx.getNumElements(), m_exec_conf);
     m_rphi.swap(t_rphi);
-    ArrayHandle<Scalar4> h_rphi(m_rphi, access_location::host, access_mode::readwrite);
+    ArrayHandle<Scalar4> h_rphi(m_rphi, access_location::host, access_mode::overwrite);
 
     GPUArray<Scalar4> t_dF(nrho * m_ntypes, m_exec_conf);
     m_dF.swap(t_dF);
-    ArrayHandle<Scalar4> h_dF(m_dF, access_location::host, access_mode::readwrite);
+    ArrayHandle<Scalar4> h_dF(m_dF, access_location::host, access_mode::overwrite);
 
     GPUArray<Scalar4> t_drho(nr * m_ntypes * m_ntypes, m_exec_conf);
     m_drho.swap(t_drho);
-    ArrayHandle<Scalar4> h_drho(m_drho, access_location::host, access_mode::readwrite);
+    ArrayHandle<Scalar4> h_drho(m_drho, access_location::host, access_mode::overwrite);
 
-    GPUArray<Scalar4> t_drphi((int) (0.5 * nr * (m_ntypes + 1) * m_ntypes), m_exec_conf);
+    GPUArray<Scalar4> t_drphi(nr * m_type_pair_idx.getNumElements(), m_exec_conf);
     m_drphi.swap(t_drphi);
-    ArrayHandle<Scalar4> h_drphi(m_drphi, access_location::host, access_mode::readwrite);
+    ArrayHandle<Scalar4> h_drphi(m_drphi, access_location::host, access_mode::overwrite);
 
-    int res = 0;
-    for (type = 0; type < m_ntypes; type++)
+    for (unsigned int type = 0; type < m_ntypes; type++)
         {
-        n = fscanf(fp, "%d %lg %lg %3s ", &tmp_int, &tmp_mass, &tmp, tmp_str);
-        if (n != 4)
-            throw runtime_error("Error parsing eam file");
-
-        nproton.push_back(tmp_int);
-        mass.push_back(tmp_mass);
-        lconst.push_back(tmp);
-        atomcomment.push_back(tmp_str);
+        for (unsigned int i = 0; i < nrho; i++)
+            h_F.data[type * nrho + i] = make_scalar4(0, 0, 0, m_F_table[type][i]);
 
-        //Read F's array
-        for (i = 0; i < nrho; i++)
+        // the density that a particle of this type contributes to a neighbor of type j
+        bool per_type = m_rho_per_type[type];
+        for (unsigned int j = 0; j < m_ntypes; j++)
             {
-            res = fscanf(fp, "%lg", &tmp);
-            h_F.data[types[type] * nrho + i].w = (Scalar) tmp;
-            }
-
-        //Read rho's arrays
-        //If FS we need read N arrays
-        //If Alloy we need read 1 array, and then duplicate N-1 times.
-        if (type_of_file == 1)
-            {
-            for (j = 0; j < m_ntypes; j++)
+            for (unsigned int i = 0; i < nr; i++)
                 {
-                for (i = 0; i < nr; i++)
-                    {
-                    res = fscanf(fp, "%lg", &tmp);
-                    h_rho.data[types[type] * m_ntypes * nr + types[j] * nr + i].w = (Scalar) tmp;
-                    }
-                }
-            }
-        else
-            {
-            for (i = 0; i < nr; i++)
-                {
-                res = fscanf(fp, "%lg", &tmp);
-                h_rho.data[types[type] * m_ntypes * nr + i].w = (Scalar) tmp;
-                for (j = 1; j < m_ntypes; j++)
-                    {
-                    h_rho.data[types[type] * m_ntypes * nr + j * nr + i].w =
-                            h_rho.data[types[type] * m_ntypes * nr + i].w;
-                    }
+                h_rho.data[type * m_ntypes * nr + j * nr + i]
+                    = make_scalar4(0, 0, 0, m_rho_table[type][per_type ? j * nr + i : i]);
                 }
             }
         }
 
-    if (res == EOF || res == 0)
+    for (unsigned int pair = 0; pair < m_type_pair_idx.getNumElements(); pair++)
         {
-        m_exec_conf->msg->error() << "pair.eam: EAM file is truncated " << endl;
-        throw runtime_error("Error loading file");
+        for (unsigned int i = 0; i < nr; i++)
+            h_rphi.data[pair * nr + i] = make_scalar4(0, 0, 0, m_rphi_table[pair][i]);
         }
 
-    //Read r*phi(r)'s arrays
-    for (k = 0; k < m_ntypes; k++)
-        {
-        for (j = 0; j <= k; j++)
-            {
-            for (i = 0; i < nr; i++)
-                {
-                res = fscanf(fp, "%lg", &tmp);
-                h_rphi.data[(int) (0.5 * nr * (types[k] + 1) * types[k]) + types[j] * nr + i].w = (Scalar) tmp;
-                }
-            }
-        }
-
-    fclose(fp);
-
     // Compute interpolation coefficients
     interpolation(nrho * m_ntypes, nrho, drho, &h_F, &h_dF);
     interpolation(nr * m_ntypes * m_ntypes, nr, dr, &h_rho, &h_drho);
-    interpolation((int) (0.5 * nr * (m_ntypes + 1) * m_ntypes), nr, dr, &h_rphi, &h_drphi);
+    interpolation(nr * m_type_pair_idx.getNumElements(), nr, dr, &h_rphi, &h_drphi);
+
+    m_tables_changed = false;
+    }
+
+void EAMForceCompute::resizeDerivativeEmbedding()
+    {
+    unsigned int n = m_pdata->getN() + m_pdata->getNGhosts();
+    if (m_dFdP.getNumElements() < n)
+        {
+        GlobalArray<Scalar> dFdP(m_pdata->getMaxN() > n ? m_pdata->getMaxN() : n, m_exec_conf);
+        m_dFdP.swap(dFdP);
+        }
+    }
 
+/*! \post The elements of m_dFdP that belong to ghost particles hold the values computed by their owners.
+ */
+void EAMForceCompute::communicateDerivativeEmbedding()
+    {
+#ifdef ENABLE_MPI
+    if (m_comm)
+        {
+        m_comm->updateGhostScalars(m_dFdP);
+        }
+#endif
     }
 
 /*! compute cubic interpolation coefficients
@@ -258,8 +333,8 @@ void EAMForceCompute::interpolation(int num_all, int num_per, Scalar delta, Arra
         start = num_per * n;
         end = num_per * (n + 1) - 1;
         f->data[start].z = f->data[start + 1].w - f->data[start].w;
-        f->data[start + 1].z = 0.5 * f->data[start + 2].w - f->data[start].w;
-        f->data[end - 1].z = 0.5 * f->data[end].w - f->data[end - 2].w;
+        f->data[start + 1].z = 0.5 * (f->data[start + 2].w - f->data[start].w);
+        f->data[end - 1].z = 0.5 * (f->data[end].w - f->data[end - 2].w);
         f->data[end].z = f->data[end].w - f->data[end - 1].w;
         for (int m = 2; m < num_per - 2; m++)
             {
@@ -285,27 +360,6 @@ void EAMForceCompute::interpolation(int num_all, int num_per, Scalar delta, Arra
         }
     }
 
-std::vector<std::string> EAMForceCompute::getProvidedLogQuantities()
-    {
-    vector < string > list;
-    list.push_back("pair_eam_energy");
-    return list;
-    }
-
-Scalar EAMForceCompute::getLogValue(const std::string &quantity, uint64_t timestep)
-    {
-    if (quantity == string("pair_eam_energy"))
-        {
-        compute(timestep);
-        return calcEnergySum();
-        }
-    else
-        {
-        m_exec_conf->msg->error() << "pair.eam: " << quantity << " is not a valid log quantity" << endl;
-        throw runtime_error("Error getting log value");
-        }
-    }
-
 /*! \post The EAM forces are computed for the given timestep. The neighborlist's
  compute method is called to ensure that it is up to date.
  \param timestep specifies the current time step of the simulation
@@ -315,6 +369,9 @@ void EAMForceCompute::computeForces(uint64_t timestep)
     // start by updating the neighborlist
     m_nlist->compute(timestep);
 
+    // interpolate the tables if they have changed
+    updateTables();
+
     // start the profile for this compute
     if (m_prof)
         m_prof->push("EAM pair");
@@ -374,13 +431,9 @@ void EAMForceCompute::computeForces(uint64_t timestep)
     // sum up the number of forces calculated
     int64_t n_calc = 0;
 
-    // parameters for each particle
-    vector<Scalar> atomElectronDensity;
-    atomElectronDensity.resize(m_pdata->getN());
-    vector<Scalar> atomDerivativeEmbeddingFunction;
-    atomDerivativeEmbeddingFunction.resize(m_pdata->getN());
-    vector<Scalar> atomEmbeddingFunction;
-    atomEmbeddingFunction.resize(m_pdata->getN());
+    // parameters for each particle, with a third law the neighbors may be ghost particles
+    vector<Scalar> atomElectronDensity(m_pdata->getN() + m_pdata->getNGhosts(), Scalar(0.0));
+    resizeDerivativeEmbedding();
     unsigned int ntypes = m_pdata->getNTypes();
 
     for (unsigned int i = 0; i < m_pdata->getN(); i++)
@@ -404,7 +457,7 @@ void EAMForceCompute::computeForces(uint64_t timestep)
             // access the index of this neighbor
             unsigned int k = h_nlist.data[head_i + j];
             // sanity check
-            assert(k < m_pdata->getN());
+            assert(k < m_pdata->getN() + m_pdata->getNGhosts());
 
             // calculate dr
             Scalar3 pk = make_scalar3(h_pos.data[k].x, h_pos.data[k].y, h_pos.data[k].z);
@@ -447,26 +500,34 @@ void EAMForceCompute::computeForces(uint64_t timestep)
             }
         }
 
-    for (unsigned int i = 0; i < m_pdata->getN(); i++)
         {
-        unsigned int typei = __scalar_as_int(h_pos.data[i].w);
-        // calculate position rho for F(rho)
-        position = atomElectronDensity[i] * rdrho;
-        int_position = (unsigned int) position;
-        int_position = min(int_position, nrho - 1);
-        remainder = position - int_position;
-
-        idxs = int_position + typei * nrho;
-        v = h_F.data[idxs];
-        dv = h_dF.data[idxs];
-        // compute dF / dP
-        atomDerivativeEmbeddingFunction[i] = dv.z + dv.y * remainder + dv.x * remainder * remainder;
-        // compute embedded energy F(P), sum up each particle
-        h_force.data[i].w += v.w + v.z * remainder + v.y * remainder * remainder
-                + v.x * remainder * remainder * remainder;
+        ArrayHandle<Scalar> h_dFdP(m_dFdP, access_location::host, access_mode::overwrite);
+        for (unsigned int i = 0; i < m_pdata->getN(); i++)
+            {
+            unsigned int typei = __scalar_as_int(h_pos.data[i].w);
+            // calculate position rho for F(rho)
+            position = atomElectronDensity[i] * rdrho;
+            int_position = (unsigned int) position;
+            int_position = min(int_position, nrho - 1);
+            remainder = position - int_position;
+
+            idxs = int_position + typei * nrho;
+            v = h_F.data[idxs];
+            dv = h_dF.data[idxs];
+            // compute dF / dP
+            h_dFdP.data[i] = dv.z + dv.y * remainder + dv.x * remainder * remainder;
+            // compute embedded energy F(P), sum up each particle
+            h_force.data[i].w += v.w + v.z * remainder + v.y * remainder * remainder
+                    + v.x * remainder * remainder * remainder;
 
+            }
         }
 
+    // the forces between local and ghost particles need dF / dP of the ghosts
+    communicateDerivativeEmbedding();
+
+    ArrayHandle<Scalar> h_dFdP(m_dFdP, access_location::host, access_mode::read);
+
     for (unsigned int i = 0; i < m_pdata->getN(); i++)
         {
         // access the particle's position and type
@@ -495,7 +556,7 @@ void EAMForceCompute::computeForces(uint64_t timestep)
             // access the index of this neighbor
             unsigned int k = h_nlist.data[head_i + j];
             // sanity check
-            assert(k < m_pdata->getN());
+            assert(k < m_pdata->getN() + m_pdata->getNGhosts());
 
             // calculate \Delta r
             Scalar3 pk = make_scalar3(h_pos.data[k].x, h_pos.data[k].y, h_pos.data[k].z);
@@ -523,10 +584,7 @@ void EAMForceCompute::computeForces(uint64_t timestep)
             int_position = min(int_position, nr - 1);
             remainder = position - int_position;
             // calculate the shift position for type ij
-            int shift =
-                    (typei >= typej) ?
-                            (int) (0.5 * (2 * ntypes - typej - 1) * typej + typei) * nr :
-                            (int) (0.5 * (2 * ntypes - typei - 1) * typei + typej) * nr;
+            unsigned int shift = m_type_pair_idx(typei, typej) * nr;
 
             idxs = int_position + shift;
             v = h_rphi.data[idxs];
@@ -545,16 +603,21 @@ void EAMForceCompute::computeForces(uint64_t timestep)
             dv = h_drho.data[idxs];
             Scalar derivativeRhoJ = dv.z + dv.y * remainder + dv.x * remainder * remainder;
             // fullDerivativePhi = dF/dP * drho / dr for j + dF/dP * drho / dr for j + phi
-            Scalar fullDerivativePhi = atomDerivativeEmbeddingFunction[i] * derivativeRhoJ
-                    + atomDerivativeEmbeddingFunction[k] * derivativeRhoI + derivativePhi;
+            Scalar fullDerivativePhi = h_dFdP.data[i] * derivativeRhoJ
+                    + h_dFdP.data[k] * derivativeRhoI + derivativePhi;
             // compute forces
             Scalar pairForce = -fullDerivativePhi * inverseR;
-            viriali[0] += dx.x * dx.x * pairForce;
-            viriali[1] += dx.x * dx.y * pairForce;
-            viriali[2] += dx.x * dx.z * pairForce;
-            viriali[3] += dx.y * dx.y * pairForce;
-            viriali[4] += dx.y * dx.z * pairForce;
-            viriali[5] += dx.z * dx.z * pairForce;
+            // each particle of the pair gets half of the virial
+            Scalar pairForceover2 = Scalar(0.5) * pairForce;
+            Scalar pair_virial[6];
+            pair_virial[0] = dx.x * dx.x * pairForceover2;
+            pair_virial[1] = dx.x * dx.y * pairForceover2;
+            pair_virial[2] = dx.x * dx.z * pairForceover2;
+            pair_virial[3] = dx.y * dx.y * pairForceover2;
+            pair_virial[4] = dx.y * dx.z * pairForceover2;
+            pair_virial[5] = dx.z * dx.z * pairForceover2;
+            for (int l = 0; l < 6; l++)
+                viriali[l] += pair_virial[l];
             fxi += dx.x * pairForce;
             fyi += dx.y * pairForce;
             fzi += dx.z * pairForce;
@@ -566,6 +629,8 @@ void EAMForceCompute::computeForces(uint64_t timestep)
                 h_force.data[k].y -= dx.y * pairForce;
                 h_force.data[k].z -= dx.z * pairForce;
                 h_force.data[k].w += pair_eng * 0.5;
+                for (int l = 0; l < 6; l++)
+                    h_virial.data[l * virial_pitch + k] += pair_virial[l];
                 }
             }
         h_force.data[i].x += fxi;
@@ -586,20 +651,16 @@ void EAMForceCompute::computeForces(uint64_t timestep)
         m_prof->pop(flops, mem_transfer);
     }
 
-void EAMForceCompute::set_neighbor_list(std::shared_ptr<NeighborList> nlist)
-    {
-    m_nlist = nlist;
-    assert(m_nlist);
-    }
-
-Scalar EAMForceCompute::get_r_cut()
-    {
-    return m_r_cut;
-    }
-
 void export_EAMForceCompute(py::module &m)
     {
-    py::class_<EAMForceCompute, ForceCompute, std::shared_ptr<EAMForceCompute> >(m, "EAMForceCompute").def(
-            py::init<std::shared_ptr<SystemDefinition>, char *, int>()).def("set_neighbor_list",
-            &EAMForceCompute::set_neighbor_list).def("get_r_cut", &EAMForceCompute::get_r_cut);
+    py::class_<EAMForceCompute, ForceCompute, std::shared_ptr<EAMForceCompute> >(m, "EAMForceCompute")
+        .def(py::init<std::shared_ptr<SystemDefinition>, std::shared_ptr<NeighborList> >())
+        .def("setEmbedding", &EAMForceCompute::setEmbedding)
+        .def("getEmbedding", &EAMForceCompute::getEmbedding)
+        .def("setPair", &EAMForceCompute::setPair)
+        .def("getPair", &EAMForceCompute::getPair)
+        .def_property("r_cut", &EAMForceCompute::getRCut, &EAMForceCompute::setRCut)
+        .def_property("dr", &EAMForceCompute::getDr, &EAMForceCompute::setDr)
+        .def_property("drho", &EAMForceCompute::getDrho, &EAMForceCompute::setDrho)
+        ;
     }
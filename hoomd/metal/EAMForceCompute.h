@@ -5,9 +5,12 @@
 // Previous Maintainer: Morozov
 
 #include "hoomd/ForceCompute.h"
+#include "hoomd/Index1D.h"
 #include "hoomd/md/NeighborList.h"
 
 #include <memory>
+#include <string>
+#include <vector>
 
 /*! \file EAMForceCompute.h
  \brief Declares the EAMForceCompute class
@@ -28,6 +31,13 @@
  forces are only computed between neighbouring particles with a separation distance less than
  \c r_cut. A NeighborList must be provided to identify these neighbours.
 
+ \b Tables
+ The tables are given per particle type (the embedding function F(rho) and the electron density rho(r) that a
+ particle of this type contributes to its neighbors) and per type pair (the pair potential r*phi(r)). The electron
+ density is either the same for all neighbor types (eam/alloy) or given separately for each type of the particle that
+ receives it (eam/fs). All embedding functions share nrho points spaced by drho, all other functions share nr points
+ spaced by dr. The tables are interpolated the next time the forces are computed after any of them changes.
+
  \b Interpolation
  The cubic interpolation is used. For each data point, including the value of the point, there are 3
  coefficients.
@@ -40,7 +50,12 @@
  potential function's value read from the 100st position of the potential file,
  h_F.data[100].z, h_F.data[100].y, h_F.data[100*].x, are for interpolating embedded function,
  h_dF.data[100].z, h_dF.data[100].y, h_dF.data[100].x, are for interpolating derivative embedded
- function.
+ function. The pair potential tables are ordered by an Index2DUpperTriangular over the type pairs.
+
+ \b MPI
+ The electron density of a particle depends on all of its neighbors, and the force between two particles on the
+ derivative of the embedding function of both. The density and dF/drho are computed for the local particles only,
+ the latter is then communicated to the ghost particles before the forces are computed.
 
  \ingroup computes
  */
@@ -48,25 +63,70 @@ class EAMForceCompute: public ForceCompute
     {
 public:
     //! Constructs the compute
-    EAMForceCompute(std::shared_ptr<SystemDefinition> sysdef, char *filename, int type_of_file);
+    EAMForceCompute(std::shared_ptr<SystemDefinition> sysdef, std::shared_ptr<NeighborList> nlist);
 
     //! Destructor
     virtual ~EAMForceCompute();
 
-    //! Sets the neighbor list to be used for the EAM force
-    virtual void set_neighbor_list(std::shared_ptr<NeighborList> nlist);
+    //! Set the embedding function and the electron density of a particle type
+    virtual void setEmbedding(const std::string& type_name, pybind11::dict params);
+
+    //! Get the embedding function and the electron density of a particle type
+    virtual pybind11::dict getEmbedding(const std::string& type_name);
+
+    //! Set the pair potential table of a type pair
+    virtual void setPair(pybind11::tuple types, pybind11::dict params);
+
+    //! Get the pair potential table of a type pair
+    virtual pybind11::dict getPair(pybind11::tuple types);
+
+    //! Set the cut-off radius
+    virtual void setRCut(Scalar r_cut);
+
+    //! Get the cut-off radius
+    virtual Scalar getRCut()
+        {
+        return m_r_cut;
+        }
 
-    //! Get the r cut value read from the EAM potential file
-    virtual Scalar get_r_cut();
+    //! Set the interval of r in the tables
+    void setDr(Scalar dr)
+        {
+        if (dr <= Scalar(0.0))
+            throw std::invalid_argument("dr must be positive");
+        this->dr = dr;
+        m_tables_changed = true;
+        }
+
+    //! Get the interval of r in the tables
+    Scalar getDr()
+        {
+        return dr;
+        }
 
-    //! Returns a list of log quantities this compute calculates
-    virtual std::vector<std::string> getProvidedLogQuantities();
+    //! Set the interval of rho in the tables
+    void setDrho(Scalar drho)
+        {
+        if (drho <= Scalar(0.0))
+            throw std::invalid_argument("drho must be positive");
+        this->drho = drho;
+        m_tables_changed = true;
+        }
 
-    //! Calculates the requested log value and returns it
-    virtual Scalar getLogValue(const std::string &quantity, uint64_t timestep);
+    //! Get the interval of rho in the tables
+    Scalar getDrho()
+        {
+        return drho;
+        }
 
-    //! Load EAM potential file
-    virtual void loadFile(char *filename, int type_of_file);
+    virtual void notifyDetach()
+        {
+        if (m_attached)
+            {
+            m_nlist->removeRCutMatrix(m_r_cut_nlist);
+            }
+        m_attached = false;
+        }
 
 protected:
     std::shared_ptr<NeighborList> m_nlist; //!< the neighborlist to use for the computation
@@ -78,12 +138,13 @@ protected:
     unsigned int nr;                       //!< number of tabulated values of interpolated rho(r), r*phi(r)
     Scalar dr;                             //!< interval of r in interpolated table
     Scalar rdr;                            //!< 1.0 / dr
-    std::vector<double> mass;              //!< array mass(type)
-    std::vector<int> types;                //!< array type(id)
-    std::vector<int> nproton;              //!< atomic number
-    std::vector<double> lconst;            //!< lattice constant
-    std::vector<std::string> atomcomment;  //!< atom comment
-    std::vector<std::string> names;        //!< array names(type)
+
+    std::vector< std::vector<Scalar> > m_F_table;    //!< F(rho) given for each type
+    std::vector< std::vector<Scalar> > m_rho_table;  //!< rho(r) given for each type
+    std::vector<bool> m_rho_per_type;                //!< True when rho(r) has one row per neighbor type
+    std::vector< std::vector<Scalar> > m_rphi_table; //!< r*phi(r) given for each type pair
+    Index2DUpperTriangular m_type_pair_idx;          //!< Indexer into the pair potential tables
+    bool m_tables_changed;                           //!< True when the tables need to be interpolated again
 
     GPUArray<Scalar4> m_F;                 //!< embedded function and its coefficients
     GPUArray<Scalar4> m_rho;               //!< electron density and its coefficients
@@ -91,17 +152,28 @@ protected:
     GPUArray<Scalar4> m_dF;                //!< derivative embedded function and its coefficients
     GPUArray<Scalar4> m_drho;              //!< derivative electron density and its coefficients
     GPUArray<Scalar4> m_drphi;             //!< derivative pair wise function and its coefficients
-    GPUArray<Scalar> m_dFdP;               //!< derivative F / derivative P
+    GlobalArray<Scalar> m_dFdP;            //!< derivative F / derivative P of local and ghost particles
+
+    /// Track whether we have attached to the Simulation object
+    bool m_attached = true;
+
+    /// r_cut (not squared) given to the neighbor list
+    std::shared_ptr<GlobalArray<Scalar>> m_r_cut_nlist;
 
     //! Actually compute the forces
     virtual void computeForces(uint64_t timestep);
 
+    //! Interpolate the tables when they have changed
+    void updateTables();
+
+    //! Grow m_dFdP to hold the local and ghost particles
+    void resizeDerivativeEmbedding();
+
+    //! Communicate dF/dP to the ghost particles
+    void communicateDerivativeEmbedding();
+
     //! Method to be called when number of types changes
-    virtual void slotNumTypesChange()
-        {
-        m_exec_conf->msg->error() << "Changing the number of types is unsupported for pair.eam" << std::endl;
-        throw std::runtime_error("Unsupported feature");
-        }
+    virtual void slotNumTypesChange();
 
     //! cubic interpolation
     virtual void interpolation(int num_all, int num_per, Scalar delta, ArrayHandle<Scalar4> *f,
@@ -29,7 +29,7 @@ class EAMForceComputeGPU: public EAMForceCompute
     {
 public:
     //! Constructs the compute
-    EAMForceComputeGPU(std::shared_ptr<SystemDefinition> sysdef, char *filename, int type_of_file);
+    EAMForceComputeGPU(std::shared_ptr<SystemDefinition> sysdef, std::shared_ptr<NeighborList> nlist);
 
     //! Destructor
     virtual ~EAMForceComputeGPU();
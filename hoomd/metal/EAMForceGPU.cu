@@ -13,11 +13,11 @@
  \brief Defines GPU kernel code for calculating the EAM forces. Used by EAMForceComputeGPU.
  */
 
-//! Kernel for computing EAM forces on the GPU
-__global__ void gpu_kernel_1(Scalar4 *d_force, Scalar *d_virial, const size_t virial_pitch, const unsigned int N,
-        const Scalar4 *d_pos, BoxDim box, const unsigned int *d_n_neigh, const unsigned int *d_nlist,
-        const unsigned int *d_head_list, const Scalar4 *d_F, const Scalar4 *d_rho, const Scalar4 *d_rphi,
-        const Scalar4 *d_dF, const Scalar4 *d_drho, const Scalar4 *d_drphi, Scalar *d_dFdP, const EAMTexInterData *d_eam_data)
+//! Kernel for computing the electron densities and the embedding function on the GPU
+__global__ void gpu_kernel_1(Scalar4 *d_force, const unsigned int N, const Scalar4 *d_pos, BoxDim box,
+        const unsigned int *d_n_neigh, const unsigned int *d_nlist, const unsigned int *d_head_list,
+        const Scalar4 *d_F, const Scalar4 *d_rho, const Scalar4 *d_dF, Scalar *d_dFdP,
+        const EAMTexInterData *d_eam_data)
     {
     __shared__ EAMTexInterData eam_data_ti;
 
@@ -33,6 +33,7 @@ __global__ void gpu_kernel_1(Scalar4 *d_force, Scalar *d_virial, const size_t vi
             ((int *)&eam_data_ti)[cur_offset + tidx] = ((int *)d_eam_data)[cur_offset + tidx];
             }
         }
+    __syncthreads();
 
 
     // start by identifying which particle we are to handle
@@ -131,8 +132,8 @@ __global__ void gpu_kernel_1(Scalar4 *d_force, Scalar *d_virial, const size_t vi
 //! Second stage kernel for computing EAM forces on the GPU
 __global__ void gpu_kernel_2(Scalar4 *d_force, Scalar *d_virial, const size_t virial_pitch, const unsigned int N,
         const Scalar4 *d_pos, BoxDim box, const unsigned int *d_n_neigh, const unsigned int *d_nlist,
-        const unsigned int *d_head_list, const Scalar4 *d_F, const Scalar4 *d_rho, const Scalar4 *d_rphi,
-        const Scalar4 *d_dF, const Scalar4 *d_drho, const Scalar4 *d_drphi, Scalar *d_dFdP, const EAMTexInterData *d_eam_data)
+        const unsigned int *d_head_list, const Scalar4 *d_rphi, const Scalar4 *d_drho, const Scalar4 *d_drphi,
+        const Scalar *d_dFdP, const EAMTexInterData *d_eam_data)
     {
     __shared__ EAMTexInterData eam_data_ti;
 
@@ -148,6 +149,7 @@ __global__ void gpu_kernel_2(Scalar4 *d_force, Scalar *d_virial, const size_t vi
             ((int *)&eam_data_ti)[cur_offset + tidx] = ((int *)d_eam_data)[cur_offset + tidx];
             }
         }
+    __syncthreads();
 
     // start by identifying which particle we are to handle
     int idx = blockIdx.x * blockDim.x + threadIdx.x;
@@ -280,41 +282,53 @@ __global__ void gpu_kernel_2(Scalar4 *d_force, Scalar *d_virial, const size_t vi
 
     }
 
-//! compute forces on GPU
-hipError_t gpu_compute_eam_tex_inter_forces(Scalar4 *d_force, Scalar *d_virial, const size_t virial_pitch,
-        const unsigned int N, const Scalar4 *d_pos, const BoxDim &box, const unsigned int *d_n_neigh,
-        const unsigned int *d_nlist, const unsigned int *d_head_list, const size_t size_nlist,
+//! compute the electron densities, the embedding energies and dF / dP on the GPU
+hipError_t gpu_compute_eam_tex_inter_embedding(Scalar4 *d_force, const unsigned int N, const Scalar4 *d_pos,
+        const BoxDim &box, const unsigned int *d_n_neigh, const unsigned int *d_nlist, const unsigned int *d_head_list,
         const EAMTexInterData *d_eam_data, Scalar *d_dFdP, const Scalar4 *d_F, const Scalar4 *d_rho,
-        const Scalar4 *d_rphi, const Scalar4 *d_dF, const Scalar4 *d_drho, const Scalar4 *d_drphi,
-        const unsigned int block_size)
+        const Scalar4 *d_dF, const unsigned int block_size)
     {
     static unsigned int max_block_size_1 = UINT_MAX;
-    static unsigned int max_block_size_2 = UINT_MAX;
 
     hipFuncAttributes attr1;
     hipFuncGetAttributes(&attr1, reinterpret_cast<const void*>(gpu_kernel_1));
 
-    hipFuncAttributes attr2;
-    hipFuncGetAttributes(&attr2, reinterpret_cast<const void*>(gpu_kernel_2));
-
     max_block_size_1 = attr1.maxThreadsPerBlock;
-    max_block_size_2 = attr2.maxThreadsPerBlock;
 
     unsigned int run_block_size_1 = min(block_size, max_block_size_1);
-    unsigned int run_block_size_2 = min(block_size, max_block_size_2);
 
     // setup the grid to run the kernel
-
     dim3 grid_1((int) ceil((double) N / (double) run_block_size_1), 1, 1);
     dim3 threads_1(run_block_size_1, 1, 1);
 
+    hipLaunchKernelGGL(gpu_kernel_1, dim3(grid_1), dim3(threads_1), 0, 0, d_force, N, d_pos, box, d_n_neigh, d_nlist,
+            d_head_list, d_F, d_rho, d_dF, d_dFdP, d_eam_data);
+
+    return hipSuccess;
+    }
+
+//! compute forces on GPU
+hipError_t gpu_compute_eam_tex_inter_forces(Scalar4 *d_force, Scalar *d_virial, const size_t virial_pitch,
+        const unsigned int N, const Scalar4 *d_pos, const BoxDim &box, const unsigned int *d_n_neigh,
+        const unsigned int *d_nlist, const unsigned int *d_head_list, const EAMTexInterData *d_eam_data,
+        const Scalar *d_dFdP, const Scalar4 *d_rphi, const Scalar4 *d_drho, const Scalar4 *d_drphi,
+        const unsigned int block_size)
+    {
+    static unsigned int max_block_size_2 = UINT_MAX;
+
+    hipFuncAttributes attr2;
+    hipFuncGetAttributes(&attr2, reinterpret_cast<const void*>(gpu_kernel_2));
+
+    max_block_size_2 = attr2.maxThreadsPerBlock;
+
+    unsigned int run_block_size_2 = min(block_size, max_block_size_2);
+
+    // setup the grid to run the kernel
     dim3 grid_2((int) ceil((double) N / (double) run_block_size_2), 1, 1);
     dim3 threads_2(run_block_size_2, 1, 1);
 
-    hipLaunchKernelGGL(gpu_kernel_1, dim3(grid_1), dim3(threads_1), 0, 0, d_force, d_virial, virial_pitch, N, d_pos, box, d_n_neigh, d_nlist,
-            d_head_list, d_F, d_rho, d_rphi, d_dF, d_drho, d_drphi, d_dFdP, d_eam_data);
     hipLaunchKernelGGL(gpu_kernel_2, dim3(grid_2), dim3(threads_2), 0, 0, d_force, d_virial, virial_pitch, N, d_pos, box, d_n_neigh, d_nlist,
-            d_head_list, d_F, d_rho, d_rphi, d_dF, d_drho, d_drphi, d_dFdP, d_eam_data);
+            d_head_list, d_rphi, d_drho, d_drphi, d_dFdP, d_eam_data);
 
     return hipSuccess;
     }
@@ -29,12 +29,19 @@ struct EAMTexInterData
     Scalar r_cutsq;         //!< r_cut^2
     };
 
+//! Kernel driver that computes the electron densities and the embedding function for EAMForceComputeGPU
+hipError_t gpu_compute_eam_tex_inter_embedding(Scalar4* d_force, const unsigned int N, const Scalar4 *d_pos,
+        const BoxDim& box, const unsigned int *d_n_neigh, const unsigned int *d_nlist, const unsigned int *d_head_list,
+        const EAMTexInterData *d_eam_data, Scalar *d_dFdP, const Scalar4 *d_F, const Scalar4 *d_rho,
+        const Scalar4 *d_dF, const unsigned int block_size);
+
 //! Kernel driver that computes EAM forces on the GPU for EAMForceComputeGPU
+/*! Needs dF / dP of the local and ghost particles.
+ */
 hipError_t gpu_compute_eam_tex_inter_forces(Scalar4* d_force, Scalar* d_virial, const size_t virial_pitch,
         const unsigned int N, const Scalar4 *d_pos, const BoxDim& box, const unsigned int *d_n_neigh,
-        const unsigned int *d_nlist, const unsigned int *d_head_list, const size_t size_nlist,
-        const EAMTexInterData *d_eam_data, Scalar *d_dFdP, const Scalar4 *d_F, const Scalar4 *d_rho,
-        const Scalar4 *d_rphi, const Scalar4 *d_dF, const Scalar4 *d_drho, const Scalar4 *d_drphi,
+        const unsigned int *d_nlist, const unsigned int *d_head_list, const EAMTexInterData *d_eam_data,
+        const Scalar *d_dFdP, const Scalar4 *d_rphi, const Scalar4 *d_drho, const Scalar4 *d_drphi,
         const unsigned int block_size);
 
 #endif
@@ -1,12 +1,13 @@
 # Copyright (c) 2009-2021 The Regents of the University of Michigan
 # This file is part of the HOOMD-blue project, released under the BSD 3-Clause License.
 
-""" Metal potentials.
+"""Metal potentials.
 
 .. rubric:: Stability
 
-:py:mod:`hoomd.metal` is **unstable**. When upgrading from version 2.x to 2.y (y > x),
-existing job scripts may need to be updated. **Maintainer:** Lin Yang, Alex Travesset, Iowa State University.
+:py:mod:`hoomd.metal` is **unstable**. When upgrading from version 3.x to 3.y
+(y > x), existing job scripts may need to be updated. **Maintainer:** Lin Yang,
+Alex Travesset, Iowa State University.
 """
 
 from hoomd.metal import pair
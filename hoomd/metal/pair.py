@@ -1,102 +1,250 @@
 # Copyright (c) 2009-2021 The Regents of the University of Michigan
 # This file is part of the HOOMD-blue project, released under the BSD 3-Clause License.
 
-R""" Metal pair potentials.
-"""
+"""Metal pair potentials."""
 
-from hoomd.md import force;
-from hoomd.md import nlist as nl # to avoid naming conflicts
-import hoomd;
-from hoomd import _hoomd
+import hoomd
 from hoomd.md import _md
+from hoomd.md import force
+from hoomd.md.nlist import NList
 from hoomd.metal import _metal
+from hoomd.data.parameterdicts import ParameterDict, TypeParameterDict
+from hoomd.data.typeparam import TypeParameter
+from hoomd.data.typeconverter import OnlyFrom, OnlyTypes, positive_real
 
-import math;
-import sys;
+import numpy
 
-class eam(force._force):
-    R""" EAM pair potential.
+validate_nlist = OnlyTypes(NList)
 
-    Args:
-        file (str): File name with potential tables in Alloy or FS format
-        type (str): Type of file potential ('Alloy', 'FS')
-        nlist (:py:mod:`hoomd.md.nlist`): Neighbor list (default of None automatically creates a global cell-list based neighbor list)
-
-    :py:class:`eam` specifies that a EAM (embedded atom method) pair potential should be applied between every
-    non-excluded particle pair in the simulation.
-
-    No coefficients need to be set for :py:class:`eam`. All specifications, including the cutoff radius, form of the
-    potential, etc. are read in from the specified file.
 
-    Particle type names must match those referenced in the EAM potential file.
+def _read_eam_file(filename, format):
+    """Read the tables of an eam/alloy (setfl) or eam/fs file.
 
-    Particle mass (in atomic mass) **must** be set in the input script, users are allowed to set different mass values
-    other than those in the potential file.
-
-    Two file formats are supported: *Alloy* and *FS*. They are described in LAMMPS documentation
-    (commands eam/alloy and eam/fs) here: http://lammps.sandia.gov/doc/pair_eam.html
-    and are also described here: http://enpub.fulton.asu.edu/cms/potentials/submain/format.htm
+    Returns:
+        tuple: The element names, the parameters ``r_cut``, ``dr``, and
+        ``drho``, the embedding functions and electron densities by element,
+        and the pair potentials by pair of elements. For eam/fs files the
+        electron density of each element has one row per element, in the order
+        of the names.
+    """
+    with open(filename) as f:
+        # the first three lines are comments
+        for _ in range(3):
+            f.readline()
+        header = f.readline().split()
+        n_elements = int(header[0])
+        names = header[1:1 + n_elements]
+        if len(names) != n_elements:
+            raise RuntimeError("Invalid EAM file: expected {} element names "
+                               "in {}".format(n_elements, filename))
+        values = f.read().split()
+
+    nrho, drho, nr, dr, r_cut = values[:5]
+    nrho = int(nrho)
+    nr = int(nr)
+    params = dict(r_cut=float(r_cut), dr=float(dr), drho=float(drho))
+    n_density = nr * n_elements if format == 'FS' else nr
+
+    def take(position, n):
+        table = numpy.array(values[position:position + n], dtype=float)
+        if len(table) != n:
+            raise RuntimeError("Invalid EAM file: {} is truncated".format(
+                filename))
+        return table, position + n
+
+    position = 5
+    embedding = {}
+    for name in names:
+        # skip the atomic number, mass, lattice constant and lattice type
+        position += 4
+        F, position = take(position, nrho)
+        rho, position = take(position, n_density)
+        if format == 'FS':
+            rho = rho.reshape(n_elements, nr)
+        embedding[name] = dict(F=F, rho=rho)
+
+    pairs = {}
+    for i in range(n_elements):
+        for j in range(i + 1):
+            rphi, position = take(position, nr)
+            pairs[(names[i], names[j])] = dict(rphi=rphi)
+
+    return names, params, embedding, pairs
+
+
+class EAM(force.Force):
+    """Embedded atom method (EAM) pair potential.
 
-    .. attention::
-        EAM is **NOT** supported in MPI parallel simulations.
+    Args:
+        nlist (`hoomd.md.nlist.NList`): Neighbor list.
+        file (str): File name with the potential tables in the *Alloy* or *FS*
+            format. When `None`, set the tables with `embedding` and `pair`
+            instead.
+        format (str): Format of *file*, either ``'Alloy'`` or ``'FS'``.
+
+    `EAM` specifies that an EAM pair potential should be applied between every
+    non-excluded particle pair in the simulation. The potential energy of
+    particle :math:`i` is
+
+    .. math::
+
+        U_i = F_i(\\rho_i) + \\frac{1}{2} \\sum_{j \\ne i} \\phi_{ij}(r_{ij})
+
+    where :math:`F_i` is the embedding function of the type of particle
+    :math:`i` and :math:`\\rho_i = \\sum_{j \\ne i} \\rho_{ji}(r_{ij})` is the
+    electron density that the neighbors :math:`j` contribute at particle
+    :math:`i`. The interactions are cut off at :math:`r_{\\mathrm{cut}}`.
+
+    All functions are tabulated at equally spaced points starting at 0 and
+    interpolated with cubic polynomials. The tables are either read from a
+    *file* in one of the formats described in the LAMMPS documentation of the
+    commands eam/alloy and eam/fs (https://lammps.sandia.gov/doc/pair_eam.html)
+    or set directly with NumPy arrays. Particle type names must match the
+    element names in the file.
+
+    `EAM` runs in domain decomposition simulations: Every rank computes the
+    electron densities of its local particles, communicates
+    :math:`F'(\\rho)` to the ghost particles, and then computes the forces.
+
+    Attributes:
+        r_cut (float): Cut-off radius of all type pairs
+            :math:`[\\mathrm{length}]`.
+
+        dr (float): Distance between the points of the tables of
+            :math:`\\rho(r)` and :math:`r \\phi(r)`
+            :math:`[\\mathrm{length}]`.
+
+        drho (float): Distance between the points of the tables of
+            :math:`F(\\rho)`.
+
+        embedding (`TypeParameter` [``particle_type``, `dict`]):
+            The tables of each particle type. The dictionary has the following
+            keys:
+
+            * ``F`` (`numpy.ndarray` [`float`], **required**) - the embedding
+              function at the points :math:`\\rho = 0, \\Delta\\rho, \\ldots`
+              :math:`[\\mathrm{energy}]`. All types must have the same number
+              of points.
+
+            * ``rho`` (`numpy.ndarray` [`float`], **required**) - the electron
+              density that a particle of this type contributes to its
+              neighbors at the points :math:`r = 0, \\Delta r, \\ldots`. A one
+              dimensional array gives the same density to all neighbor types
+              (*Alloy*), a two dimensional array gives one row per neighbor
+              type in the order of `hoomd.State.particle_types` (*FS*).
+
+        pair (`TypeParameter` [\
+            `tuple` [``particle_type``, ``particle_type``],\
+            `dict`]):
+            The pair potentials. The dictionary has the following key:
+
+            * ``rphi`` (`numpy.ndarray` [`float`], **required**) - the pair
+              potential times the distance :math:`r \\phi(r)` at the points
+              :math:`r = 0, \\Delta r, \\ldots`
+              :math:`[\\mathrm{energy} \\cdot \\mathrm{length}]`. All type
+              pairs must have the same number of points, which must also match
+              the number of points of the electron densities.
 
     Example::
 
-        nl = nlist.cell()
-        eam = pair.eam(file='name.eam.fs', type='FS', nlist=nl)
-        eam = pair.eam(file='name.eam.alloy', type='Alloy', nlist=nl)
+        nl = hoomd.md.nlist.Cell()
+        eam = hoomd.metal.pair.EAM(nlist=nl, file='name.eam.fs', format='FS')
 
+        eam = hoomd.metal.pair.EAM(nlist=nl)
+        eam.r_cut = 5.0
+        eam.dr = 0.01
+        eam.drho = 0.01
+        eam.embedding['Cu'] = dict(F=F, rho=rho)
+        eam.pair[('Cu', 'Cu')] = dict(rphi=rphi)
     """
-    def __init__(self, file, type, nlist):
-        # Error out in MPI simulations
-        if (hoomd.version.mpi_enabled):
-            if hoomd.context.current.system_definition.getParticleData().getDomainDecomposition():
-                hoomd.context.current.device.cpp_msg.error("pair.eam is not supported in multi-processor simulations.\n\n")
-                raise RuntimeError("Error setting up pair potential.")
-
-        # initialize the base class
-        force._force.__init__(self);
-        # Translate type
-        if(type == 'Alloy'): type_of_file = 0;
-        elif(type == 'FS'): type_of_file = 1;
-        else: raise RuntimeError('Unknown EAM input file type');
-
+    _cpp_class_name = "EAMForceCompute"
+
+    def __init__(self, nlist, file=None, format='Alloy'):
+        self._nlist = validate_nlist(nlist)
+        format = OnlyFrom(['Alloy', 'FS'])(format)
+
+        params = ParameterDict(r_cut=positive_real,
+                               dr=positive_real,
+                               drho=positive_real)
+        self._param_dict.update(params)
+
+        embedding = TypeParameter(
+            'embedding', 'particle_types',
+            TypeParameterDict(F=numpy.ndarray, rho=numpy.ndarray,
+                              len_keys=1))
+        pair = TypeParameter(
+            'pair', 'particle_types',
+            TypeParameterDict(rphi=numpy.ndarray, len_keys=2))
+        self._add_typeparam(embedding)
+        self._add_typeparam(pair)
+
+        # eam/fs densities are ordered by the file's elements until attached
+        self._fs_elements = None
+        if file is not None:
+            names, params, embedding, pairs = _read_eam_file(file, format)
+            self.r_cut = params['r_cut']
+            self.dr = params['dr']
+            self.drho = params['drho']
+            for name, value in embedding.items():
+                self.embedding[name] = value
+            for key, value in pairs.items():
+                self.pair[key] = value
+            if format == 'FS':
+                self._fs_elements = names
+
+    def _attach(self):
         # create the c++ mirror class
-        if not hoomd.context.current.device.cpp_exec_conf.isCUDAEnabled():
-            self.cpp_force = _metal.EAMForceCompute(hoomd.context.current.system_definition, file, type_of_file);
+        if not self._nlist._added:
+            self._nlist._add(self._simulation)
+        else:
+            if self._simulation != self._nlist._simulation:
+                raise RuntimeError("{} object's neighbor list is used in a "
+                                   "different simulation.".format(type(self)))
+        if not self.nlist._attached:
+            self.nlist._attach()
+
+        if self._fs_elements is not None:
+            self._order_fs_densities(self._simulation.state.particle_types)
+
+        if isinstance(self._simulation.device, hoomd.device.CPU):
+            cls = getattr(_metal, self._cpp_class_name)
+            self.nlist._cpp_obj.setStorageMode(
+                _md.NeighborList.storageMode.half)
         else:
-            self.cpp_force = _metal.EAMForceComputeGPU(hoomd.context.current.system_definition, file, type_of_file);
-
-        #After load EAMForceCompute we know r_cut from EAM potential`s file. We need update neighbor list.
-        self.r_cut_new = self.cpp_force.get_r_cut();
-        self.nlist = nlist
-        self.nlist.subscribe(lambda : self.get_rcut())
-        self.nlist.update_rcut()
-
-        #Load neighbor list to compute.
-        self.cpp_force.set_neighbor_list(self.nlist.cpp_nlist);
-        if hoomd.context.current.device.cpp_exec_conf.isCUDAEnabled():
-            self.nlist.cpp_nlist.setStorageMode(_md.NeighborList.storageMode.full);
-
-        hoomd.context.current.device.cpp_msg.notice(2, "Set r_cut = " + str(self.r_cut_new) + " from potential`s file '" +  str(file) + "'.\n");
-
-        hoomd.context.current.system.addCompute(self.cpp_force, self.force_name);
-        self.pair_coeff = hoomd.md.pair.coeff();
-
-    def get_rcut(self):
-        # go through the list of only the active particle types in the simulation
-        ntypes = hoomd.context.current.system_definition.getParticleData().getNTypes()
-        type_list = []
-        for i in range(0, ntypes):
-            type_list.append(hoomd.context.current.system_definition.getParticleData().getNameByType(i))
-        # update the rcut by pair type
-        r_cut_dict = nl.rcut()
-        for i in range(0, ntypes):
-            for j in range(i, ntypes):
-                # get the r_cut value
-                r_cut_dict.set_pair(type_list[i], type_list[j], self.r_cut_new)
-        return r_cut_dict
-
-    def update_coeffs(self):
-        # check that the pair coefficients are valid
-        pass;
+            cls = getattr(_metal, self._cpp_class_name + "GPU")
+            self.nlist._cpp_obj.setStorageMode(
+                _md.NeighborList.storageMode.full)
+        self._cpp_obj = cls(self._simulation.state._cpp_sys_def,
+                            self.nlist._cpp_obj)
+
+        super()._attach()
+
+    def _order_fs_densities(self, particle_types):
+        """Reorder the rows of the eam/fs densities by particle type."""
+        elements = self._fs_elements
+        if set(elements) != set(particle_types):
+            raise RuntimeError("The particle types {} do not match the "
+                               "elements {} of the EAM file.".format(
+                                   particle_types, elements))
+        order = [elements.index(t) for t in particle_types]
+        for name in elements:
+            value = self.embedding[name]
+            self.embedding[name] = dict(F=value['F'],
+                                        rho=value['rho'][order])
+        self._fs_elements = None
+
+    @property
+    def nlist(self):
+        """`hoomd.md.nlist.NList`: Neighbor list used by the potential."""
+        return self._nlist
+
+    @nlist.setter
+    def nlist(self, value):
+        if self._attached:
+            raise RuntimeError("nlist cannot be set after scheduling.")
+        else:
+            self._nlist = validate_nlist(value)
+
+    @property
+    def _children(self):
+        return [self.nlist]
@@ -0,0 +1,127 @@
+import hoomd
+import hoomd.metal
+import numpy as np
+import pytest
+
+r_cut = 3.0
+dr = 0.01
+drho = 0.01
+r = np.arange(0, r_cut + dr / 2, dr)
+
+
+def _make_simulation(simulation_factory, two_particle_snapshot_factory,
+                     particle_types, d):
+    snap = two_particle_snapshot_factory(particle_types=particle_types, d=d)
+    if snap.exists:
+        snap.particles.typeid[:] = [0, len(particle_types) - 1]
+    sim = simulation_factory(snap)
+    integrator = hoomd.md.Integrator(dt=0.005)
+    integrator.methods.append(hoomd.md.methods.NVE(hoomd.filter.All()))
+    sim.operations.integrator = integrator
+    return sim
+
+
+def _write_eam_file(filename, elements, F, rho, rphi, nrho):
+    """Write tables in the eam/alloy or eam/fs format."""
+    with open(filename, 'w') as f:
+        f.write('comment\ncomment\ncomment\n')
+        f.write('{} {}\n'.format(len(elements), ' '.join(elements)))
+        f.write('{} {} {} {} {}\n'.format(nrho, drho, len(r), dr, r_cut))
+        for element in elements:
+            f.write('1 1.0 1.0 fcc\n')
+            f.write(' '.join(str(x) for x in F[element]) + '\n')
+            f.write(' '.join(str(x) for x in np.ravel(rho[element])) + '\n')
+        for i in range(len(elements)):
+            for j in range(i + 1):
+                f.write(' '.join(str(x) for x in rphi) + '\n')
+
+
+def test_attach_detach(simulation_factory, two_particle_snapshot_factory):
+    eam = hoomd.metal.pair.EAM(nlist=hoomd.md.nlist.Cell())
+    eam.r_cut = r_cut
+    eam.dr = dr
+    eam.drho = drho
+    rho_values = np.arange(0, 6 + drho / 2, drho)
+    eam.embedding['A'] = dict(F=2 * rho_values, rho=r_cut - r)
+    eam.pair[('A', 'A')] = dict(rphi=r_cut - r)
+
+    sim = _make_simulation(simulation_factory, two_particle_snapshot_factory,
+                           ['A'], 1.5)
+    sim.operations.integrator.forces.append(eam)
+    sim.run(0)
+
+    assert eam.r_cut == pytest.approx(r_cut)
+    np.testing.assert_allclose(eam.embedding['A']['F'], 2 * rho_values)
+    np.testing.assert_allclose(eam.pair[('A', 'A')]['rphi'], r_cut - r)
+
+    # F(rho) = 2 rho, rho(r) = 3 - r, and r phi(r) = 3 - r are interpolated
+    # exactly
+    d = 1.5
+    energy = 2 * 2 * (r_cut - d) + (r_cut - d) / d
+    force = 2 * 2 + r_cut / d**2
+    energies = eam.energies
+    forces = eam.forces
+    if energies is not None:
+        assert sum(energies) == pytest.approx(energy, rel=1e-5)
+        np.testing.assert_allclose(np.linalg.norm(forces, axis=1),
+                                   [force, force],
+                                   rtol=1e-4)
+
+    sim.operations.integrator.forces.remove(eam)
+    assert eam.r_cut == pytest.approx(r_cut)
+
+
+def test_alloy_file(simulation_factory, two_particle_snapshot_factory,
+                    tmp_path):
+    nrho = 601
+    rho_values = np.arange(nrho) * drho
+    filename = str(tmp_path / 'test.eam.alloy')
+    _write_eam_file(filename, ['A'], dict(A=2 * rho_values),
+                    dict(A=r_cut - r), r_cut - r, nrho)
+
+    eam = hoomd.metal.pair.EAM(nlist=hoomd.md.nlist.Cell(),
+                               file=filename,
+                               format='Alloy')
+    assert eam.r_cut == pytest.approx(r_cut)
+    assert eam.dr == pytest.approx(dr)
+    assert eam.drho == pytest.approx(drho)
+    np.testing.assert_allclose(eam.embedding['A']['rho'], r_cut - r)
+
+    sim = _make_simulation(simulation_factory, two_particle_snapshot_factory,
+                           ['A'], 1.5)
+    sim.operations.integrator.forces.append(eam)
+    sim.run(0)
+
+    energies = eam.energies
+    if energies is not None:
+        assert sum(energies) == pytest.approx(7.0, rel=1e-5)
+
+
+def test_fs_file(simulation_factory, two_particle_snapshot_factory, tmp_path):
+    nrho = 1300
+    rho_values = np.arange(nrho) * drho
+    # the rows of the densities follow the order of the elements in the file
+    F = dict(A=2 * rho_values, B=rho_values)
+    rho = dict(B=[4 * (r_cut - r), 3 * (r_cut - r)],
+               A=[2 * (r_cut - r), 1 * (r_cut - r)])
+    filename = str(tmp_path / 'test.eam.fs')
+    _write_eam_file(filename, ['B', 'A'], F, rho, np.zeros_like(r), nrho)
+
+    eam = hoomd.metal.pair.EAM(nlist=hoomd.md.nlist.Cell(),
+                               file=filename,
+                               format='FS')
+
+    sim = _make_simulation(simulation_factory, two_particle_snapshot_factory,
+                           ['A', 'B'], 1.5)
+    sim.operations.integrator.forces.append(eam)
+    sim.run(0)
+
+    # after attaching, the rows follow the order of the particle types
+    np.testing.assert_allclose(eam.embedding['B']['rho'],
+                               [3 * (r_cut - r), 4 * (r_cut - r)])
+
+    # particle A receives the density 3 (3 - d) from B and F_A = 2 rho,
+    # particle B receives 2 (3 - d) from A and F_B = rho
+    energies = eam.energies
+    if energies is not None:
+        np.testing.assert_allclose(energies, [9.0, 3.0], rtol=1e-5)
@@ -22,10 +22,10 @@
 #include "ConstForceCompute.h"
 #include "Analyzer.h"
 #include "PythonAnalyzer.h"
-#include "IMDInterface.h"
 #include "DCDDumpWriter.h"
 #include "GetarDumpWriter.h"
 #include "GSDDumpWriter.h"
+#include "SharedMemoryWriter.h"
 #include "Logger.h"
 #include "LogPlainTXT.h"
 #include "LogMatrix.h"
@@ -274,10 +274,10 @@ PYBIND11_MODULE(_hoomd, m)
     // analyzers
     export_Analyzer(m);
     export_PythonAnalyzer(m);
-    export_IMDInterface(m);
     export_DCDDumpWriter(m);
     getardump::export_GetarDumpWriter(m);
     export_GSDDumpWriter(m);
+    export_SharedMemoryWriter(m);
     export_Logger(m);
     export_LogPlainTXT(m);
     export_LogMatrix(m);
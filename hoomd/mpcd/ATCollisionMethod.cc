@@ -201,5 +201,6 @@ void mpcd::detail::export_ATCollisionMethod(pybind11::module& m)
                       std::shared_ptr<mpcd::CellThermoCompute>,
                       std::shared_ptr<::Variant>>())
         .def("setTemperature", &mpcd::ATCollisionMethod::setTemperature)
+        .def_property("kT", &mpcd::ATCollisionMethod::getTemperature, &mpcd::ATCollisionMethod::setTemperature)
     ;
     }
@@ -45,6 +45,12 @@ class PYBIND11_EXPORT ATCollisionMethod : public mpcd::CollisionMethod
             m_T = T;
             }
 
+        //! Get the temperature
+        std::shared_ptr<::Variant> getTemperature() const
+            {
+            return m_T;
+            }
+
     protected:
         std::shared_ptr<mpcd::CellThermoCompute> m_thermo;      //!< Cell thermo
         std::shared_ptr<mpcd::CellThermoCompute> m_rand_thermo; //!< Cell thermo for random velocities
@@ -167,6 +167,8 @@ void mpcd::detail::export_CollisionMethod(pybind11::module& m)
         .def("enableGridShifting", &mpcd::CollisionMethod::enableGridShifting)
         .def("setEmbeddedGroup", &mpcd::CollisionMethod::setEmbeddedGroup)
         .def("setPeriod", &mpcd::CollisionMethod::setPeriod)
+        .def_property_readonly("period", &mpcd::CollisionMethod::getPeriod)
+        .def_property("shift", &mpcd::CollisionMethod::getGridShifting, &mpcd::CollisionMethod::enableGridShifting)
         .def_property("instance",
                       &mpcd::CollisionMethod::getInstance,
                       &mpcd::CollisionMethod::setInstance)
@@ -67,6 +67,12 @@ class PYBIND11_EXPORT CollisionMethod
             m_enable_grid_shift = enable_grid_shift;
             }
 
+        //! Check if the grid shifting is on
+        bool getGridShifting() const
+            {
+            return m_enable_grid_shift;
+            }
+
         //! Generates the random grid shift vector
         void drawGridShift(uint64_t timestep);
 
@@ -83,6 +89,12 @@ class PYBIND11_EXPORT CollisionMethod
         //! Set the period of the collision method
         void setPeriod(unsigned int cur_timestep, unsigned int period);
 
+        //! Get the period of the collision method
+        uint64_t getPeriod() const
+            {
+            return m_period;
+            }
+
         /// Set the RNG instance
         void setInstance(unsigned int instance)
             {
@@ -16,8 +16,11 @@
 #endif
 
 #include "StreamingMethod.h"
+#include "BulkGeometry.h"
 #include <pybind11/pybind11.h>
 
+#include <type_traits>
+
 namespace mpcd
 {
 
@@ -63,6 +66,12 @@ class PYBIND11_EXPORT ConfinedStreamingMethod : public mpcd::StreamingMethod
         //! Implementation of the streaming rule
         virtual void stream(uint64_t timestep);
 
+        //! Check if the particles stream freely through the periodic box
+        virtual bool isUnconfined() const
+            {
+            return std::is_same<Geometry, mpcd::detail::BulkGeometry>::value && !m_field;
+            }
+
         //! Get the streaming geometry
         std::shared_ptr<const Geometry> getGeometry() const
             {
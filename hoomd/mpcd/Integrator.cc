@@ -19,7 +19,7 @@
  * \param deltaT Fundamental integration timestep
  */
 mpcd::Integrator::Integrator(std::shared_ptr<mpcd::SystemData> sysdata, Scalar deltaT)
-    : IntegratorTwoStep(sysdata->getSystemDefinition(), deltaT), m_mpcd_sys(sysdata)
+    : IntegratorTwoStep(sysdata->getSystemDefinition(), deltaT), m_mpcd_sys(sysdata), m_fused(false)
     {
     assert(m_mpcd_sys);
     m_exec_conf->msg->notice(5) << "Constructing MPCD Integrator" << std::endl;
@@ -96,7 +96,14 @@ void mpcd::Integrator::update(uint64_t timestep)
         m_sorter->update(timestep);
 
     // call the MPCD collision rule before the first MD step so that any embedded velocities are updated first
-    if (m_collide)
+    // when possible, the particles are streamed in the same pass as the collision instead of at the streaming step
+    auto fused_collide = getFusedCollisionMethod(timestep);
+    if (fused_collide)
+        {
+        m_stream->claimStream(timestep);
+        fused_collide->collideAndStream(timestep, m_stream->getDeltaT());
+        }
+    else if (m_collide)
         m_collide->collide(timestep);
 
     // perform the first MD integration step
@@ -118,7 +125,7 @@ void mpcd::Integrator::update(uint64_t timestep)
         }
 
     // execute the MPCD streaming step now that MD particles are communicated onto their final domains
-    if (m_stream)
+    if (m_stream && !fused_collide)
         {
         m_stream->stream(timestep);
         }
@@ -206,6 +213,30 @@ void mpcd::Integrator::addFiller(std::shared_ptr<mpcd::VirtualParticleFiller> fi
     m_fillers.push_back(filler);
     }
 
+/*!
+ * \param timestep Current timestep
+ * \returns The SRD collision method if it collides and the particles stream at \a timestep and the two can be fused,
+ *          otherwise a null pointer
+ *
+ * The fused path streams the particles ballistically through the periodic box, so the streaming method must be
+ * unconfined and there can be no virtual particle fillers. It runs on the CPU on a single rank only.
+ */
+std::shared_ptr<mpcd::SRDCollisionMethod> mpcd::Integrator::getFusedCollisionMethod(uint64_t timestep) const
+    {
+    if (!m_fused || !m_stream || !m_collide || !m_fillers.empty() || m_exec_conf->isCUDAEnabled())
+        return std::shared_ptr<mpcd::SRDCollisionMethod>();
+
+    #ifdef ENABLE_MPI
+    if (m_mpcd_comm)
+        return std::shared_ptr<mpcd::SRDCollisionMethod>();
+    #endif // ENABLE_MPI
+
+    if (!m_stream->isUnconfined() || !m_stream->peekStream(timestep) || !m_collide->peekCollide(timestep))
+        return std::shared_ptr<mpcd::SRDCollisionMethod>();
+
+    return std::dynamic_pointer_cast<mpcd::SRDCollisionMethod>(m_collide);
+    }
+
 /*!
  * \param m Python module to export to
  */
@@ -222,6 +253,7 @@ void mpcd::detail::export_Integrator(pybind11::module& m)
         .def("removeSorter", &mpcd::Integrator::removeSorter)
         .def("addFiller", &mpcd::Integrator::addFiller)
         .def("removeAllFillers", &mpcd::Integrator::removeAllFillers)
+        .def_property("fused", &mpcd::Integrator::getFused, &mpcd::Integrator::setFused)
         #ifdef ENABLE_MPI
         .def("setMPCDCommunicator", &mpcd::Integrator::setMPCDCommunicator)
         #endif // ENABLE_MPI
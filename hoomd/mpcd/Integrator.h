@@ -17,6 +17,7 @@
 #endif
 
 #include "CollisionMethod.h"
+#include "SRDCollisionMethod.h"
 #include "StreamingMethod.h"
 #include "SystemData.h"
 #include "Sorter.h"
@@ -151,6 +152,18 @@ class PYBIND11_EXPORT Integrator : public ::IntegratorTwoStep
             m_fillers.clear();
             }
 
+        //! Set whether to fuse the SRD collision and the bulk streaming when possible
+        void setFused(bool fused)
+            {
+            m_fused = fused;
+            }
+
+        //! Get whether to fuse the SRD collision and the bulk streaming when possible
+        bool getFused() const
+            {
+            return m_fused;
+            }
+
     protected:
         std::shared_ptr<mpcd::SystemData> m_mpcd_sys;   //!< MPCD system
         std::shared_ptr<mpcd::CollisionMethod> m_collide;   //!< MPCD collision rule
@@ -162,6 +175,10 @@ class PYBIND11_EXPORT Integrator : public ::IntegratorTwoStep
         #endif // ENABLE_MPI
 
         std::vector<std::shared_ptr<mpcd::VirtualParticleFiller>> m_fillers; //!< MPCD virtual particle fillers
+        bool m_fused;   //!< True to fuse the SRD collision and the bulk streaming when possible
+
+        //! Get the SRD collision method when it can be fused with the streaming at a timestep
+        std::shared_ptr<mpcd::SRDCollisionMethod> getFusedCollisionMethod(uint64_t timestep) const;
     private:
         //! Check if a collision will occur at the current timestep
         bool checkCollide(uint64_t timestep)
@@ -11,6 +11,7 @@
 #include "ParticleData.h"
 
 #include "hoomd/CachedAllocator.h"
+#include "hoomd/Index1D.h"
 
 #ifdef ENABLE_MPI
 #include "hoomd/HOOMDMPI.h"
@@ -44,7 +45,9 @@ mpcd::ParticleData::ParticleData(unsigned int N,
                                  unsigned int ndimensions,
                                  std::shared_ptr<ExecutionConfiguration> exec_conf,
                                  std::shared_ptr<DomainDecomposition> decomposition)
-    : m_N(0), m_N_virtual(0), m_N_global(0), m_N_max(0), m_exec_conf(exec_conf), m_mass(1.0), m_valid_cell_cache(false)
+    : m_N(0), m_N_virtual(0), m_N_global(0), m_N_max(0), m_exec_conf(exec_conf), m_mass(1.0), m_compact_storage(false), m_compact(false),
+      m_compact_lo(make_scalar3(0,0,0)), m_compact_cell_size(0), m_compact_dim(make_uint3(0,0,0)),
+      m_valid_cell_cache(false)
     {
     m_exec_conf->msg->notice(5) << "Constructing MPCD ParticleData" << endl;
 
@@ -72,7 +75,9 @@ mpcd::ParticleData::ParticleData(std::shared_ptr<mpcd::ParticleDataSnapshot> sna
                                  const BoxDim& global_box,
                                  std::shared_ptr<const ExecutionConfiguration> exec_conf,
                                  std::shared_ptr<DomainDecomposition> decomposition)
-    : m_N(0), m_N_virtual(0), m_N_global(0), m_N_max(0), m_exec_conf(exec_conf), m_mass(1.0), m_valid_cell_cache(false)
+    : m_N(0), m_N_virtual(0), m_N_global(0), m_N_max(0), m_exec_conf(exec_conf), m_mass(1.0), m_compact_storage(false), m_compact(false),
+      m_compact_lo(make_scalar3(0,0,0)), m_compact_cell_size(0), m_compact_dim(make_uint3(0,0,0)),
+      m_valid_cell_cache(false)
     {
     m_exec_conf->msg->notice(5) << "Constructing MPCD ParticleData" << endl;
 
@@ -421,6 +426,7 @@ void mpcd::ParticleData::takeSnapshot(std::shared_ptr<mpcd::ParticleDataSnapshot
     {
     m_exec_conf->msg->notice(4) << "MPCD ParticleData: taking snapshot" << std::endl;
 
+    expand();
     ArrayHandle<Scalar4> h_pos(m_pos, access_location::host, access_mode::read);
     ArrayHandle<Scalar4> h_vel(m_vel, access_location::host, access_mode::read);
     ArrayHandle<unsigned int> h_tag(m_tag, access_location::host, access_mode::read);
@@ -610,6 +616,15 @@ void mpcd::ParticleData::allocate(unsigned int N_max)
     {
     m_N_max = N_max;
 
+    // a clean allocation discards the data held in the compact layout
+    m_compact = false;
+    GPUArray<unsigned int> compact_cell;
+    m_compact_cell.swap(compact_cell);
+    GPUArray<uint64_t> compact_pos;
+    m_compact_pos.swap(compact_pos);
+    GPUArray<float3> compact_vel;
+    m_compact_vel.swap(compact_vel);
+
     //! Allocate the particle data
     GPUArray<Scalar4> pos(N_max, m_exec_conf);
     m_pos.swap(pos);
@@ -716,11 +731,167 @@ void mpcd::ParticleData::resize(unsigned int N)
             {
             N_max = ((unsigned int) (((float) N_max) * resize_factor)) + 1;
             }
+        expand();
         reallocate(N_max);
         }
     m_N = N;
     }
 
+/*!
+ * \param lo Lower corner of the cell grid
+ * \param cell_size Edge length of the cells
+ * \param dim Number of cells along each edge of the grid
+ * \returns True if the particles are held in the compact layout on the grid
+ *
+ * The cell grid must cover the periodic box exactly. Particles that lie up to one cell outside
+ * the grid are wrapped back through the periodic boundaries. The full arrays are freed once the
+ * particles are converted. The particles are not converted if compact storage is disabled, in
+ * MPI simulations, on the GPU, with virtual particles, or with more types than fit in the layout.
+ *
+ * \throw runtime_error if a particle lies outside the grid
+ */
+bool mpcd::ParticleData::compact(const Scalar3& lo, Scalar cell_size, const uint3& dim)
+    {
+    if (m_compact)
+        {
+        if (lo.x == m_compact_lo.x && lo.y == m_compact_lo.y && lo.z == m_compact_lo.z
+            && cell_size == m_compact_cell_size
+            && dim.x == m_compact_dim.x && dim.y == m_compact_dim.y && dim.z == m_compact_dim.z)
+            return true;
+
+        // the grid has changed, so the particles are converted again
+        expand();
+        }
+
+    if (!m_compact_storage || m_N_virtual > 0 || getNTypes() > mpcd::detail::COMPACT_MAX_TYPES
+        || m_exec_conf->isCUDAEnabled())
+        return false;
+    #ifdef ENABLE_MPI
+    if (m_decomposition)
+        return false;
+    #endif // ENABLE_MPI
+
+    GPUArray<unsigned int> compact_cell(m_N_max, m_exec_conf);
+    GPUArray<uint64_t> compact_pos(m_N_max, m_exec_conf);
+    GPUArray<float3> compact_vel(m_N_max, m_exec_conf);
+        {
+        ArrayHandle<Scalar4> h_pos(m_pos, access_location::host, access_mode::read);
+        ArrayHandle<Scalar4> h_vel(m_vel, access_location::host, access_mode::read);
+        ArrayHandle<unsigned int> h_compact_cell(compact_cell, access_location::host, access_mode::overwrite);
+        ArrayHandle<uint64_t> h_compact_pos(compact_pos, access_location::host, access_mode::overwrite);
+        ArrayHandle<float3> h_compact_vel(compact_vel, access_location::host, access_mode::overwrite);
+
+        const Index3D ci(dim.x, dim.y, dim.z);
+        for (unsigned int idx = 0; idx < m_N; ++idx)
+            {
+            const Scalar4 postype = h_pos.data[idx];
+            const Scalar3 x = (make_scalar3(postype.x, postype.y, postype.z) - lo) / cell_size;
+            int3 bin;
+            uint3 offset;
+            offset.x = mpcd::detail::quantizeCellOffset(x.x, bin.x);
+            offset.y = mpcd::detail::quantizeCellOffset(x.y, bin.y);
+            offset.z = mpcd::detail::quantizeCellOffset(x.z, bin.z);
+
+            if (bin.x == (int)dim.x)
+                bin.x = 0;
+            else if (bin.x == -1)
+                bin.x = dim.x - 1;
+            if (bin.y == (int)dim.y)
+                bin.y = 0;
+            else if (bin.y == -1)
+                bin.y = dim.y - 1;
+            if (bin.z == (int)dim.z)
+                bin.z = 0;
+            else if (bin.z == -1)
+                bin.z = dim.z - 1;
+
+            if ((bin.x < 0 || bin.x >= (int)dim.x) ||
+                (bin.y < 0 || bin.y >= (int)dim.y) ||
+                (bin.z < 0 || bin.z >= (int)dim.z))
+                {
+                m_exec_conf->msg->error() << "mpcd: particle " << idx << " is no longer in the simulation box" << std::endl;
+                throw std::runtime_error("Error compacting MPCD particle data");
+                }
+
+            h_compact_cell.data[idx] = ci(bin.x, bin.y, bin.z);
+            h_compact_pos.data[idx] = mpcd::detail::packCompactPosition(offset, __scalar_as_int(postype.w));
+            const Scalar4 vel = h_vel.data[idx];
+            h_compact_vel.data[idx] = make_float3(float(vel.x), float(vel.y), float(vel.z));
+            }
+        }
+    m_compact_cell.swap(compact_cell);
+    m_compact_pos.swap(compact_pos);
+    m_compact_vel.swap(compact_vel);
+
+    // free the full arrays
+    GPUArray<Scalar4> pos, vel, pos_alt, vel_alt;
+    m_pos.swap(pos);
+    m_vel.swap(vel);
+    m_pos_alt.swap(pos_alt);
+    m_vel_alt.swap(vel_alt);
+
+    m_compact_lo = lo;
+    m_compact_cell_size = cell_size;
+    m_compact_dim = dim;
+    m_compact = true;
+
+    // the cell cache was stored with the full velocities
+    invalidateCellCache();
+    return true;
+    }
+
+/*!
+ * The particle positions are restored at the center of their fixed-point offsets, and the
+ * cached cells are cleared. The compact arrays are freed before the alternate arrays are
+ * allocated, so the conversion does not need more memory than the full arrays.
+ */
+void mpcd::ParticleData::expand() const
+    {
+    if (!m_compact) return;
+
+    GPUArray<Scalar4> pos(m_N_max, m_exec_conf);
+    GPUArray<Scalar4> vel(m_N_max, m_exec_conf);
+        {
+        ArrayHandle<unsigned int> h_compact_cell(m_compact_cell, access_location::host, access_mode::read);
+        ArrayHandle<uint64_t> h_compact_pos(m_compact_pos, access_location::host, access_mode::read);
+        ArrayHandle<float3> h_compact_vel(m_compact_vel, access_location::host, access_mode::read);
+        ArrayHandle<Scalar4> h_pos(pos, access_location::host, access_mode::overwrite);
+        ArrayHandle<Scalar4> h_vel(vel, access_location::host, access_mode::overwrite);
+
+        const Index3D ci(m_compact_dim.x, m_compact_dim.y, m_compact_dim.z);
+        for (unsigned int idx = 0; idx < m_N; ++idx)
+            {
+            const uint3 cell = ci.getTriple(h_compact_cell.data[idx]);
+            const uint64_t compact_pos = h_compact_pos.data[idx];
+            const uint3 offset = mpcd::detail::unpackCompactOffset(compact_pos);
+            const Scalar3 x = make_scalar3(Scalar(cell.x) + mpcd::detail::dequantizeCellOffset(offset.x),
+                                           Scalar(cell.y) + mpcd::detail::dequantizeCellOffset(offset.y),
+                                           Scalar(cell.z) + mpcd::detail::dequantizeCellOffset(offset.z));
+            const Scalar3 r = m_compact_lo + m_compact_cell_size * x;
+            h_pos.data[idx] = make_scalar4(r.x, r.y, r.z,
+                                           __int_as_scalar(mpcd::detail::unpackCompactType(compact_pos)));
+
+            const float3 v = h_compact_vel.data[idx];
+            h_vel.data[idx] = make_scalar4(v.x, v.y, v.z, __int_as_scalar(mpcd::detail::NO_CELL));
+            }
+        }
+    m_pos.swap(pos);
+    m_vel.swap(vel);
+
+    GPUArray<unsigned int> compact_cell;
+    m_compact_cell.swap(compact_cell);
+    GPUArray<uint64_t> compact_pos;
+    m_compact_pos.swap(compact_pos);
+    GPUArray<float3> compact_vel;
+    m_compact_vel.swap(compact_vel);
+    m_compact = false;
+
+    GPUArray<Scalar4> pos_alt(m_N_max, m_exec_conf);
+    m_pos_alt.swap(pos_alt);
+    GPUArray<Scalar4> vel_alt(m_N_max, m_exec_conf);
+    m_vel_alt.swap(vel_alt);
+    }
+
 /*!
  * \param mass New particle mass
  *
@@ -792,6 +963,7 @@ Scalar3 mpcd::ParticleData::getPosition(unsigned int idx) const
         m_exec_conf->msg->error() << "Requested MPCD particle local index " << idx << " is out of range" << endl;
         throw std::runtime_error("Error accessing MPCD particle data.");
         }
+    expand();
     ArrayHandle<Scalar4> h_pos(m_pos, access_location::host, access_mode::read);
     const Scalar4 postype = h_pos.data[idx];
     return make_scalar3(postype.x, postype.y, postype.z);
@@ -809,6 +981,7 @@ unsigned int mpcd::ParticleData::getType(unsigned int idx) const
         m_exec_conf->msg->error() << "Requested MPCD particle local index " << idx << " is out of range" << endl;
         throw std::runtime_error("Error accessing MPCD particle data.");
         }
+    expand();
     ArrayHandle<Scalar4> h_pos(m_pos, access_location::host, access_mode::read);
     const Scalar4 postype = h_pos.data[idx];
     return __scalar_as_int(postype.w);
@@ -826,6 +999,7 @@ Scalar3 mpcd::ParticleData::getVelocity(unsigned int idx) const
         m_exec_conf->msg->error() << "Requested MPCD particle local index " << idx << " is out of range" << endl;
         throw std::runtime_error("Error accessing MPCD particle data.");
         }
+    expand();
     ArrayHandle<Scalar4> h_vel(m_vel, access_location::host, access_mode::read);
     const Scalar4 velcell = h_vel.data[idx];
     return make_scalar3(velcell.x, velcell.y, velcell.z);
@@ -854,6 +1028,9 @@ void mpcd::ParticleData::addVirtualParticles(unsigned int N)
     {
     if (N == 0) return;
 
+    // virtual particles are not held in the compact layout
+    expand();
+
     // increase number of virtual particles
     m_N_virtual += N;
 
@@ -1202,5 +1379,6 @@ void mpcd::detail::export_ParticleData(pybind11::module& m)
     .def("getNameByType", &mpcd::ParticleData::getNameByType)
     .def("getTypeByName", &mpcd::ParticleData::getTypeByName)
     .def_property("mass", &mpcd::ParticleData::getMass, &mpcd::ParticleData::setMass)
+    .def_property("compact_storage", &mpcd::ParticleData::getCompactStorage, &mpcd::ParticleData::setCompactStorage)
     ;
     }
@@ -57,6 +57,21 @@ namespace mpcd
  * are based on around the velocity and cell. For details of what the cell means,
  * refer to the mpcd::CellList.
  *
+ * With compact storage enabled, the data may instead be held in a compact layout:
+ * - cell (unshifted, on a grid set by the caller) in array of unsigned int
+ * - fixed-point offset within the cell + type in array of uint64_t
+ *   (see mpcd::detail::packCompactPosition)
+ * - single-precision velocity in array of float3
+ *
+ * The compact layout takes 24 bytes per particle instead of the 64 bytes of the
+ * positions and velocities in double precision. Methods that operate on the compact
+ * layout (the fused path of mpcd::SRDCollisionMethod) convert the data with compact(),
+ * which also frees the full arrays. The mpcd::Sorter keeps the data in the compact layout
+ * when it is already held that way. All accessors of the full arrays convert the data
+ * back first, so other methods do not need to be aware of the layout. The compact
+ * layout is only used on a single rank, without virtual particles, and with at most
+ * mpcd::detail::COMPACT_MAX_TYPES types.
+ *
  * \todo Because the local cell index changes with position, a signal will be put
  * in place to indicate when the cached cell index is still valid.
  *
@@ -161,12 +176,14 @@ class PYBIND11_EXPORT ParticleData
         //! Get array of MPCD particle positions
         const GPUArray<Scalar4>& getPositions() const
             {
+            expand();
             return m_pos;
             }
 
         //! Get array of MPCD particle velocities
         const GPUArray<Scalar4>& getVelocities() const
             {
+            expand();
             return m_vel;
             }
 
@@ -232,24 +249,28 @@ class PYBIND11_EXPORT ParticleData
         //! Get alternate array of MPCD particle positions
         const GPUArray<Scalar4>& getAltPositions() const
             {
+            expand();
             return m_pos_alt;
             }
 
         //! Swap out alternate MPCD particle position array
         void swapPositions()
             {
+            expand();
             m_pos.swap(m_pos_alt);
             }
 
         //! Get alternate array of MPCD particle velocities
         const GPUArray<Scalar4>& getAltVelocities() const
             {
+            expand();
             return m_vel_alt;
             }
 
         //! Swap out alternate MPCD particle velocity array
         void swapVelocities()
             {
+            expand();
             m_vel.swap(m_vel_alt);
             }
 
@@ -266,6 +287,56 @@ class PYBIND11_EXPORT ParticleData
             }
         //@}
 
+        //! \name compact storage methods
+        //@{
+        //! Set whether the particles may be held in the compact layout
+        void setCompactStorage(bool compact_storage)
+            {
+            if (!compact_storage)
+                expand();
+            m_compact_storage = compact_storage;
+            }
+
+        //! Get whether the particles may be held in the compact layout
+        bool getCompactStorage() const
+            {
+            return m_compact_storage;
+            }
+
+        //! Check if the particles are currently held in the compact layout
+        bool isCompact() const
+            {
+            return m_compact;
+            }
+
+        //! Convert the particles to the compact layout on a cell grid
+        bool compact(const Scalar3& lo, Scalar cell_size, const uint3& dim);
+
+        //! Get the cells of the particles in the compact layout
+        const GPUArray<unsigned int>& getCompactCells() const
+            {
+            return m_compact_cell;
+            }
+
+        //! Get the fixed-point offsets within the cell and the types of the particles in the compact layout
+        const GPUArray<uint64_t>& getCompactPositions() const
+            {
+            return m_compact_pos;
+            }
+
+        //! Get the velocities of the particles in the compact layout
+        const GPUArray<float3>& getCompactVelocities() const
+            {
+            return m_compact_vel;
+            }
+
+        //! Get the dimensions of the cell grid of the compact layout
+        const uint3& getCompactDim() const
+            {
+            return m_compact_dim;
+            }
+        //@}
+
         //! \name signal methods
         //@{
         //! Mark the cell value cached in the last element of the velocity as valid
@@ -417,8 +488,8 @@ class PYBIND11_EXPORT ParticleData
         std::shared_ptr<DomainDecomposition> m_decomposition;       //!< Domain decomposition
         std::shared_ptr<Profiler> m_prof;                           //!< Profiler
 
-        GPUArray<Scalar4> m_pos;    //!< MPCD particle positions plus type
-        GPUArray<Scalar4> m_vel;    //!< MPCD particle velocities plus cell list id
+        mutable GPUArray<Scalar4> m_pos;    //!< MPCD particle positions plus type
+        mutable GPUArray<Scalar4> m_vel;    //!< MPCD particle velocities plus cell list id
         Scalar m_mass;              //!< MPCD particle mass
         GPUArray<unsigned int> m_tag;   //!< MPCD particle tags
         std::vector<std::string> m_type_mapping;  //!< Type name mapping
@@ -426,8 +497,8 @@ class PYBIND11_EXPORT ParticleData
         GPUArray<unsigned int> m_comm_flags;    //!< MPCD particle communication flags
         #endif // ENABLE_MPI
 
-        GPUArray<Scalar4> m_pos_alt;        //!< Alternate position array
-        GPUArray<Scalar4> m_vel_alt;        //!< Alternate velocity array
+        mutable GPUArray<Scalar4> m_pos_alt;    //!< Alternate position array
+        mutable GPUArray<Scalar4> m_vel_alt;    //!< Alternate velocity array
         GPUArray<unsigned int> m_tag_alt;   //!< Alternate tag array
         #ifdef ENABLE_MPI
         GPUArray<unsigned int> m_comm_flags_alt;    //!< Alternate communication flags
@@ -442,6 +513,15 @@ class PYBIND11_EXPORT ParticleData
         #endif // ENABLE_HIP
         #endif // ENABLE_MPI
 
+        bool m_compact_storage;                         //!< True if the compact layout may be used
+        mutable bool m_compact;                         //!< True if the particles are held in the compact layout
+        mutable GPUArray<unsigned int> m_compact_cell;  //!< Cells (compact layout)
+        mutable GPUArray<uint64_t> m_compact_pos;       //!< Fixed-point offsets in the cell plus type (compact layout)
+        mutable GPUArray<float3> m_compact_vel;         //!< Single-precision velocities (compact layout)
+        Scalar3 m_compact_lo;                           //!< Lower corner of the cell grid (compact layout)
+        Scalar m_compact_cell_size;                     //!< Edge length of the cells (compact layout)
+        uint3 m_compact_dim;                            //!< Dimensions of the cell grid (compact layout)
+
         bool m_valid_cell_cache;    //!< Flag for validity of cell cache
         SortSignal m_sort_signal;   //!< Signal triggered when particles are sorted
         Nano::Signal<void ()> m_virtual_signal; //!< Signal for number of virtual particles changing
@@ -455,6 +535,9 @@ class PYBIND11_EXPORT ParticleData
         //! Set the global number of particles (for parallel simulations)
         void setNGlobal(unsigned int nglobal);
 
+        //! Convert the particles from the compact layout back to the full arrays
+        void expand() const;
+
         //! Allocate data arrays
         void allocate(unsigned int N_max);
 
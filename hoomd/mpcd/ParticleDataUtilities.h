@@ -15,10 +15,18 @@
  * organization. To avoid code duplication, this shared code is split out here
  * as utilities.
  *
- * This file should only include common sentinels, structures, etc.
+ * This file should only include common sentinels, structures, and small inline
+ * functions that encode the particle data.
  */
 
 #include "hoomd/HOOMDMath.h"
+
+#ifdef __HIPCC__
+#define HOSTDEVICE __host__ __device__ inline
+#else
+#define HOSTDEVICE inline __attribute__((always_inline))
+#endif // __HIPCC__
+
 namespace mpcd
 {
 namespace detail
@@ -26,6 +34,72 @@ namespace detail
 //! Sentinel value to signify that this particle is not placed in a cell
 const unsigned int NO_CELL = 0xffffffff;
 
+//! Number of bits of each fixed-point offset in a compact position
+const unsigned int COMPACT_OFFSET_BITS = 20;
+
+//! Number of bits of the type in a compact position
+const unsigned int COMPACT_TYPE_BITS = 4;
+
+//! Maximum number of particle types that fit in a compact position
+const unsigned int COMPACT_MAX_TYPES = 1u << COMPACT_TYPE_BITS;
+
+//! Pack the fixed-point offsets of a particle within its cell and its type into one word
+/*!
+ * \param offset Fixed-point offsets along each cell edge
+ * \param type Particle type
+ * \returns The compact position
+ *
+ * The offsets take the lowest 3*COMPACT_OFFSET_BITS bits and the type takes the highest
+ * COMPACT_TYPE_BITS bits.
+ */
+HOSTDEVICE uint64_t packCompactPosition(const uint3& offset, unsigned int type)
+    {
+    return (uint64_t(offset.x)
+            | (uint64_t(offset.y) << COMPACT_OFFSET_BITS)
+            | (uint64_t(offset.z) << (2*COMPACT_OFFSET_BITS))
+            | (uint64_t(type) << (3*COMPACT_OFFSET_BITS)));
+    }
+
+//! Get the fixed-point offsets within the cell from a compact position
+HOSTDEVICE uint3 unpackCompactOffset(uint64_t compact_pos)
+    {
+    const uint64_t mask = (uint64_t(1) << COMPACT_OFFSET_BITS) - 1;
+    return make_uint3((unsigned int)(compact_pos & mask),
+                      (unsigned int)((compact_pos >> COMPACT_OFFSET_BITS) & mask),
+                      (unsigned int)((compact_pos >> (2*COMPACT_OFFSET_BITS)) & mask));
+    }
+
+//! Get the type from a compact position
+HOSTDEVICE unsigned int unpackCompactType(uint64_t compact_pos)
+    {
+    return (unsigned int)(compact_pos >> (3*COMPACT_OFFSET_BITS));
+    }
+
+//! Split a coordinate in units of the cell size into a cell and a fixed-point offset
+/*!
+ * \param x Coordinate in units of the cell size
+ * \param cell Cell that contains the coordinate (output)
+ * \returns The offset from the lower edge of the cell, truncated to COMPACT_OFFSET_BITS bits
+ */
+HOSTDEVICE unsigned int quantizeCellOffset(Scalar x, int& cell)
+    {
+    const Scalar lo = floor(x);
+    cell = (int)lo;
+    const unsigned int max_offset = (1u << COMPACT_OFFSET_BITS) - 1;
+    const unsigned int offset = (unsigned int)((x - lo) * Scalar(1u << COMPACT_OFFSET_BITS));
+    return (offset < max_offset) ? offset : max_offset;
+    }
+
+//! Get the offset from the lower edge of the cell (in units of the cell size) of a fixed-point offset
+/*!
+ * The offset is taken at the center of the fixed-point interval, so truncation in quantizeCellOffset
+ * does not bias the positions.
+ */
+HOSTDEVICE Scalar dequantizeCellOffset(unsigned int offset)
+    {
+    return (Scalar(offset) + Scalar(0.5)) / Scalar(1u << COMPACT_OFFSET_BITS);
+    }
+
 #ifdef ENABLE_MPI
 //! Structure to store packed MPCD particle data
 /*!
@@ -46,4 +120,6 @@ struct pdata_element
 } // end namespace detail
 } // end namespace mpcd
 
+#undef HOSTDEVICE
+
 #endif // MPCD_PARTICLE_DATA_UTILITIES_H_
@@ -12,6 +12,147 @@
 #include "hoomd/RandomNumbers.h"
 #include "hoomd/RNGIdentifiers.h"
 
+#ifdef ENABLE_TBB
+#include <tbb/parallel_for.h>
+#endif
+
+namespace mpcd
+{
+namespace detail
+{
+//! Draw the SRD rotation vector and the thermostat scale factor of a cell
+/*!
+ * \param rng Random number generator of the cell
+ * \param cell_energy Kinetic energy, temperature, and number of particles of the cell
+ * \param use_thermostat If true, also draw the scale factor
+ * \param T_set Temperature set point of the thermostat
+ * \param ndim Number of dimensions
+ * \param factor Scale factor of the velocities (output, only set when \a use_thermostat is true)
+ * \returns The rotation vector
+ */
+inline double3 drawSRDRotation(hoomd::RandomGenerator& rng,
+                               const double3& cell_energy,
+                               const bool use_thermostat,
+                               const Scalar T_set,
+                               const unsigned int ndim,
+                               double& factor)
+    {
+    // draw rotation vector off the surface of the sphere
+    double3 rotvec;
+    hoomd::SpherePointGenerator<double> sphgen;
+    sphgen(rng, rotvec);
+
+    if (use_thermostat)
+        {
+        const unsigned int np = __double_as_int(cell_energy.z);
+        factor = 1.0;
+        if (np > 1)
+            {
+            // the total number of degrees of freedom in the cell divided by 2
+            const double alpha = ndim*(np-1)/(double)2.;
+
+            // draw a random kinetic energy for the cell at the set temperature
+            hoomd::GammaDistribution<double> gamma_gen(alpha,T_set);
+            const double rand_ke = gamma_gen(rng);
+
+            // generate the scale factor from the current temperature
+            // (don't use the kinetic energy of this cell, since this
+            // is total not relative to COM)
+            const double cur_ke = alpha * cell_energy.y;
+            factor = (cur_ke > 0.) ? fast::sqrt(rand_ke/cur_ke) : 1.;
+            }
+        }
+
+    return rotvec;
+    }
+
+//! Rotate a velocity relative to the cell velocity around the rotation vector
+/*!
+ * \param vel Velocity relative to the cell velocity
+ * \param rot_vec Rotation vector of the cell
+ * \param cos_a Cosine of the rotation angle
+ * \param one_minus_cos_a One minus the cosine of the rotation angle
+ * \param sin_a Sine of the rotation angle
+ * \returns The rotated velocity
+ */
+inline double3 rotateSRDVelocity(const double3& vel,
+                                 const double3& rot_vec,
+                                 const double cos_a,
+                                 const double one_minus_cos_a,
+                                 const double sin_a)
+    {
+    // perform the rotation in double precision
+    double3 new_vel;
+    new_vel.x = (cos_a + rot_vec.x*rot_vec.x*one_minus_cos_a) * vel.x;
+    new_vel.x += (rot_vec.x*rot_vec.y*one_minus_cos_a - sin_a*rot_vec.z) * vel.y;
+    new_vel.x += (rot_vec.x*rot_vec.z*one_minus_cos_a + sin_a*rot_vec.y) * vel.z;
+
+    new_vel.y = (cos_a + rot_vec.y*rot_vec.y*one_minus_cos_a) * vel.y;
+    new_vel.y += (rot_vec.x*rot_vec.y*one_minus_cos_a + sin_a*rot_vec.z) * vel.x;
+    new_vel.y += (rot_vec.y*rot_vec.z*one_minus_cos_a - sin_a*rot_vec.x) * vel.z;
+
+    new_vel.z = (cos_a + rot_vec.z*rot_vec.z*one_minus_cos_a) * vel.z;
+    new_vel.z += (rot_vec.x*rot_vec.z*one_minus_cos_a - sin_a*rot_vec.y) * vel.x;
+    new_vel.z += (rot_vec.y*rot_vec.z*one_minus_cos_a + sin_a*rot_vec.x) * vel.y;
+
+    return new_vel;
+    }
+
+//! Add a particle to the sums of its cell (fused path)
+/*!
+ * \param cell_vel Momentum and mass of the cell
+ * \param cell_energy Kinetic energy and number of particles of the cell (nullptr without the thermostat)
+ * \param vel Velocity of the particle
+ * \param mass Mass of the particle
+ */
+inline void accumulateSRDCell(double4& cell_vel, double3* cell_energy, const double3& vel, const double mass)
+    {
+    cell_vel.x += mass * vel.x;
+    cell_vel.y += mass * vel.y;
+    cell_vel.z += mass * vel.z;
+    cell_vel.w += mass;
+    if (cell_energy)
+        {
+        cell_energy->x += 0.5 * mass * (vel.x * vel.x + vel.y * vel.y + vel.z * vel.z);
+        cell_energy->z = __int_as_double(__double_as_int(cell_energy->z) + 1);
+        }
+    }
+
+//! Rotate the velocity of a particle relative to the average velocity of its cell (fused path)
+/*!
+ * \param vel Velocity of the particle
+ * \param avg_vel Average velocity of the cell
+ * \param rot_vec Rotation vector of the cell
+ * \param factor Thermostat scale factor of the cell (nullptr without the thermostat)
+ * \param cos_a Cosine of the rotation angle
+ * \param one_minus_cos_a One minus the cosine of the rotation angle
+ * \param sin_a Sine of the rotation angle
+ * \returns The velocity after the collision
+ */
+inline double3 collideSRDVelocity(double3 vel,
+                                  const double4& avg_vel,
+                                  const double3& rot_vec,
+                                  const double* factor,
+                                  const double cos_a,
+                                  const double one_minus_cos_a,
+                                  const double sin_a)
+    {
+    vel.x -= avg_vel.x;
+    vel.y -= avg_vel.y;
+    vel.z -= avg_vel.z;
+    double3 new_vel = rotateSRDVelocity(vel, rot_vec, cos_a, one_minus_cos_a, sin_a);
+    if (factor)
+        {
+        new_vel.x *= *factor; new_vel.y *= *factor; new_vel.z *= *factor;
+        }
+    new_vel.x += avg_vel.x;
+    new_vel.y += avg_vel.y;
+    new_vel.z += avg_vel.z;
+    return new_vel;
+    }
+} // end namespace detail
+} // end namespace mpcd
+
 mpcd::SRDCollisionMethod::SRDCollisionMethod(std::shared_ptr<mpcd::SystemData> sysdata,
                                              unsigned int cur_timestep,
                                              unsigned int period,
@@ -19,7 +160,8 @@ mpcd::SRDCollisionMethod::SRDCollisionMethod(std::shared_ptr<mpcd::SystemData> s
                                              uint16_t seed,
                                              std::shared_ptr<mpcd::CellThermoCompute> thermo)
     : mpcd::CollisionMethod(sysdata,cur_timestep,period,phase),
-      m_thermo(thermo), m_rotvec(m_exec_conf), m_angle(0.0), m_factors(m_exec_conf)
+      m_thermo(thermo), m_rotvec(m_exec_conf), m_angle(0.0), m_factors(m_exec_conf),
+      m_fused_cell_vel(m_exec_conf), m_fused_cell_energy(m_exec_conf)
     {
     m_exec_conf->msg->notice(5) << "Constructing MPCD SRD collision method" << std::endl;
 
@@ -89,34 +231,16 @@ void mpcd::SRDCollisionMethod::drawRotationVectors(uint64_t timestep)
                 hoomd::RandomGenerator rng(hoomd::Seed(hoomd::RNGIdentifier::SRDCollisionMethod, timestep, seed),
                                            hoomd::Counter(global_idx));
 
-                // draw rotation vector off the surface of the sphere
-                double3 rotvec;
-                hoomd::SpherePointGenerator<double> sphgen;
-                sphgen(rng, rotvec);
-                h_rotvec.data[idx] = rotvec;
-
+                const double3 cell_energy = (use_thermostat) ? h_cell_energy->data[idx] : make_double3(0,0,0);
+                double factor = 1.0;
+                h_rotvec.data[idx] = mpcd::detail::drawSRDRotation(rng,
+                                                                   cell_energy,
+                                                                   use_thermostat,
+                                                                   T_set,
+                                                                   m_sysdef->getNDimensions(),
+                                                                   factor);
                 if (use_thermostat)
-                    {
-                    const double3 cell_energy = h_cell_energy->data[idx];
-                    const unsigned int np = __double_as_int(cell_energy.z);
-                    double factor = 1.0;
-                    if (np > 1)
-                        {
-                        // the total number of degrees of freedom in the cell divided by 2
-                        const double alpha = m_sysdef->getNDimensions()*(np-1)/(double)2.;
-
-                        // draw a random kinetic energy for the cell at the set temperature
-                        hoomd::GammaDistribution<double> gamma_gen(alpha,T_set);
-                        const double rand_ke = gamma_gen(rng);
-
-                        // generate the scale factor from the current temperature
-                        // (don't use the kinetic energy of this cell, since this
-                        // is total not relative to COM)
-                        const double cur_ke = alpha * cell_energy.y;
-                        factor = (cur_ke > 0.) ? fast::sqrt(rand_ke/cur_ke) : 1.;
-                        }
                     h_factors->data[idx] = factor;
-                    }
                 }
             }
         }
@@ -188,21 +312,7 @@ void mpcd::SRDCollisionMethod::rotate(uint64_t timestep)
         // get rotation vector
         double3 rot_vec = h_rotvec.data[cell];
 
-        // perform the rotation in double precision
-        // TODO: should we optimize out the matrix construction for the CPU?
-        //       Or, consider using vectorization and/or Eigen?
-        double3 new_vel;
-        new_vel.x = (cos_a + rot_vec.x*rot_vec.x*one_minus_cos_a) * vel.x;
-        new_vel.x += (rot_vec.x*rot_vec.y*one_minus_cos_a - sin_a*rot_vec.z) * vel.y;
-        new_vel.x += (rot_vec.x*rot_vec.z*one_minus_cos_a + sin_a*rot_vec.y) * vel.z;
-
-        new_vel.y = (cos_a + rot_vec.y*rot_vec.y*one_minus_cos_a) * vel.y;
-        new_vel.y += (rot_vec.x*rot_vec.y*one_minus_cos_a + sin_a*rot_vec.z) * vel.x;
-        new_vel.y += (rot_vec.y*rot_vec.z*one_minus_cos_a - sin_a*rot_vec.x) * vel.z;
-
-        new_vel.z = (cos_a + rot_vec.z*rot_vec.z*one_minus_cos_a) * vel.z;
-        new_vel.z += (rot_vec.x*rot_vec.z*one_minus_cos_a - sin_a*rot_vec.y) * vel.x;
-        new_vel.z += (rot_vec.y*rot_vec.z*one_minus_cos_a + sin_a*rot_vec.x) * vel.y;
+        double3 new_vel = mpcd::detail::rotateSRDVelocity(vel, rot_vec, cos_a, one_minus_cos_a, sin_a);
 
         // rescale the temperature if thermostatting is enabled
         if (use_thermostat)
@@ -227,6 +337,500 @@ void mpcd::SRDCollisionMethod::rotate(uint64_t timestep)
         }
     }
 
+/*!
+ * \param timestep Current timestep
+ * \param stream_dt Time to stream the particles after the collision
+ * \returns True if the particles collided (and streamed) at \a timestep
+ *
+ * The result is the same as collide() followed by ballistic streaming through the periodic box, but the particle data
+ * is traversed twice instead of four times (cell list, cell thermo, rotation, and streaming). The first pass bins the
+ * particles and sums the momenta (and kinetic energies) of the cells. The cells are then averaged and draw their
+ * rotations in parallel, and the second pass rotates the velocities and streams the particles in parallel. The cell
+ * list and the cell thermo compute are not updated.
+ *
+ * When compact storage is enabled, the MPCD particles are converted to the compact layout on the (unshifted) cells
+ * and both passes operate on it directly. The positions then have a resolution of the cell size divided by
+ * 2^mpcd::detail::COMPACT_OFFSET_BITS and the velocities are stored in single precision.
+ *
+ * The caller must ensure that the simulation runs on the CPU on a single rank.
+ */
+bool mpcd::SRDCollisionMethod::collideAndStream(uint64_t timestep, Scalar stream_dt)
+    {
+    if (!shouldCollide(timestep)) return false;
+
+    if (m_prof) m_prof->push(m_exec_conf, "MPCD collide");
+    drawGridShift(timestep);
+    m_cl->computeDimensions();
+
+    const unsigned int n_cells = m_cl->getNCells();
+    const bool use_thermostat = (m_T) ? true : false;
+    m_rotvec.resize(n_cells);
+    m_fused_cell_vel.resize(n_cells);
+    if (use_thermostat)
+        {
+        m_factors.resize(n_cells);
+        m_fused_cell_energy.resize(n_cells);
+        }
+    if (m_embed_group)
+        m_fused_embed_cells.resize(m_embed_group->getNumMembers());
+
+    const bool compact = m_mpcd_pdata->getCompactStorage()
+                         && m_mpcd_pdata->compact(m_pdata->getGlobalBox().getLo(), m_cl->getCellSize(), m_cl->getDim());
+
+    // first pass: bin the particles and sum the cell momenta, masses, and kinetic energies
+        {
+        ArrayHandle<double4> h_cell_vel(m_fused_cell_vel, access_location::host, access_mode::overwrite);
+        memset(h_cell_vel.data, 0, sizeof(double4) * n_cells);
+        std::unique_ptr< ArrayHandle<double3> > h_cell_energy;
+        double3* cell_energy = nullptr;
+        if (use_thermostat)
+            {
+            h_cell_energy.reset(new ArrayHandle<double3>(m_fused_cell_energy, access_location::host, access_mode::overwrite));
+            memset(h_cell_energy->data, 0, sizeof(double3) * n_cells);
+            cell_energy = h_cell_energy->data;
+            }
+
+        if (compact)
+            binFusedCompact(h_cell_vel.data, cell_energy);
+        else
+            binFused(h_cell_vel.data, cell_energy);
+        binFusedEmbedded(h_cell_vel.data, cell_energy);
+        }
+
+    // average the cells and draw their rotations
+    drawFusedRotations(timestep);
+
+    // second pass: rotate the velocities, then stream the MPCD particles
+    if (compact)
+        rotateAndStreamFusedCompact(stream_dt);
+    else
+        rotateAndStreamFused(stream_dt);
+    rotateFusedEmbedded();
+
+    // particles have moved, so the cell cache is no longer valid
+    m_mpcd_pdata->invalidateCellCache();
+    if (m_prof) m_prof->pop(m_exec_conf);
+
+    return true;
+    }
+
+/*!
+ * \param bin Cell of the particle, possibly one cell outside the grid
+ * \param dim Dimensions of the cell grid
+ * \param idx Index of the particle (for the error message)
+ * \returns The cell wrapped back into the grid through the periodic boundaries
+ *
+ * \throw runtime_error if the particle is more than one cell outside the grid
+ */
+int3 mpcd::SRDCollisionMethod::wrapFusedBin(int3 bin, const uint3& dim, unsigned int idx) const
+    {
+    if (bin.x == (int)dim.x)
+        bin.x = 0;
+    else if (bin.x == -1)
+        bin.x = dim.x - 1;
+    if (bin.y == (int)dim.y)
+        bin.y = 0;
+    else if (bin.y == -1)
+        bin.y = dim.y - 1;
+    if (bin.z == (int)dim.z)
+        bin.z = 0;
+    else if (bin.z == -1)
+        bin.z = dim.z - 1;
+
+    if ((bin.x < 0 || bin.x >= (int)dim.x) ||
+        (bin.y < 0 || bin.y >= (int)dim.y) ||
+        (bin.z < 0 || bin.z >= (int)dim.z))
+        {
+        m_exec_conf->msg->error() << "mpcd: particle " << idx << " is no longer in the simulation box" << std::endl;
+        throw std::runtime_error("Error computing MPCD cells");
+        }
+    return bin;
+    }
+
+/*!
+ * \param pos Position of the particle
+ * \param idx Index of the particle (for the error message)
+ * \returns The (shifted) cell of the particle
+ */
+unsigned int mpcd::SRDCollisionMethod::binFusedPosition(const Scalar3& pos, unsigned int idx) const
+    {
+    if (std::isnan(pos.x) || std::isnan(pos.y) || std::isnan(pos.z))
+        {
+        m_exec_conf->msg->error() << "mpcd: particle " << idx << " has position NaN" << std::endl;
+        throw std::runtime_error("Error computing MPCD cells");
+        }
+
+    // bin the particle, wrapping the cells that the grid shift moves through the periodic boundaries
+    const Scalar cell_size = m_cl->getCellSize();
+    const Scalar3 delta = (pos - m_cl->getGridShift()) - m_pdata->getGlobalBox().getLo();
+    const int3 bin = wrapFusedBin(make_int3((int)std::floor(delta.x / cell_size),
+                                            (int)std::floor(delta.y / cell_size),
+                                            (int)std::floor(delta.z / cell_size)),
+                                  m_cl->getDim(),
+                                  idx);
+    return m_cl->getCellIndexer()(bin.x, bin.y, bin.z);
+    }
+
+/*!
+ * \param cell Unshifted cell of the particle in the compact layout
+ * \param compact_pos Compact position of the particle
+ * \param idx Index of the particle (for the error message)
+ * \returns The (shifted) cell of the particle
+ */
+unsigned int mpcd::SRDCollisionMethod::binFusedCompactPosition(unsigned int cell,
+                                                               uint64_t compact_pos,
+                                                               unsigned int idx) const
+    {
+    const Index3D& ci = m_cl->getCellIndexer();
+    const uint3 c = ci.getTriple(cell);
+    const uint3 offset = mpcd::detail::unpackCompactOffset(compact_pos);
+    const Scalar3 shift = m_cl->getGridShift() / m_cl->getCellSize();
+
+    // the grid shift moves the particle by at most one cell
+    const Scalar3 x = make_scalar3(Scalar(c.x) + mpcd::detail::dequantizeCellOffset(offset.x) - shift.x,
+                                   Scalar(c.y) + mpcd::detail::dequantizeCellOffset(offset.y) - shift.y,
+                                   Scalar(c.z) + mpcd::detail::dequantizeCellOffset(offset.z) - shift.z);
+    const int3 bin = wrapFusedBin(make_int3((int)std::floor(x.x), (int)std::floor(x.y), (int)std::floor(x.z)),
+                                  m_cl->getDim(),
+                                  idx);
+    return ci(bin.x, bin.y, bin.z);
+    }
+
+/*!
+ * \param cell_vel Cell momenta and masses to add to
+ * \param cell_energy Cell kinetic energies and sizes to add to (nullptr without the thermostat)
+ *
+ * The cells of the MPCD particles are cached in their velocities for the second pass.
+ */
+void mpcd::SRDCollisionMethod::binFused(double4* cell_vel, double3* cell_energy)
+    {
+    ArrayHandle<Scalar4> h_pos(m_mpcd_pdata->getPositions(), access_location::host, access_mode::read);
+    ArrayHandle<Scalar4> h_vel(m_mpcd_pdata->getVelocities(), access_location::host, access_mode::readwrite);
+    const double mass = m_mpcd_pdata->getMass();
+    const unsigned int N_mpcd = m_mpcd_pdata->getN() + m_mpcd_pdata->getNVirtual();
+
+    for (unsigned int idx = 0; idx < N_mpcd; ++idx)
+        {
+        const Scalar4 postype = h_pos.data[idx];
+        const unsigned int cell = binFusedPosition(make_scalar3(postype.x, postype.y, postype.z), idx);
+        h_vel.data[idx].w = __int_as_scalar(cell);
+
+        const Scalar4 vel_cell = h_vel.data[idx];
+        mpcd::detail::accumulateSRDCell(cell_vel[cell],
+                                        cell_energy ? &cell_energy[cell] : nullptr,
+                                        make_double3(vel_cell.x, vel_cell.y, vel_cell.z),
+                                        mass);
+        }
+    }
+
+/*!
+ * \param cell_vel Cell momenta and masses to add to
+ * \param cell_energy Cell kinetic energies and sizes to add to (nullptr without the thermostat)
+ */
+void mpcd::SRDCollisionMethod::binFusedCompact(double4* cell_vel, double3* cell_energy)
+    {
+    ArrayHandle<unsigned int> h_cell(m_mpcd_pdata->getCompactCells(), access_location::host, access_mode::read);
+    ArrayHandle<uint64_t> h_pos(m_mpcd_pdata->getCompactPositions(), access_location::host, access_mode::read);
+    ArrayHandle<float3> h_vel(m_mpcd_pdata->getCompactVelocities(), access_location::host, access_mode::read);
+    const double mass = m_mpcd_pdata->getMass();
+    const unsigned int N = m_mpcd_pdata->getN();
+
+    for (unsigned int idx = 0; idx < N; ++idx)
+        {
+        const unsigned int cell = binFusedCompactPosition(h_cell.data[idx], h_pos.data[idx], idx);
+        const float3 vel = h_vel.data[idx];
+        mpcd::detail::accumulateSRDCell(cell_vel[cell],
+                                        cell_energy ? &cell_energy[cell] : nullptr,
+                                        make_double3(vel.x, vel.y, vel.z),
+                                        mass);
+        }
+    }
+
+/*!
+ * \param cell_vel Cell momenta and masses to add to
+ * \param cell_energy Cell kinetic energies and sizes to add to (nullptr without the thermostat)
+ */
+void mpcd::SRDCollisionMethod::binFusedEmbedded(double4* cell_vel, double3* cell_energy)
+    {
+    if (!m_embed_group) return;
+
+    ArrayHandle<unsigned int> h_embed_group(m_embed_group->getIndexArray(), access_location::host, access_mode::read);
+    ArrayHandle<Scalar4> h_pos(m_pdata->getPositions(), access_location::host, access_mode::read);
+    ArrayHandle<Scalar4> h_vel(m_pdata->getVelocities(), access_location::host, access_mode::read);
+    const unsigned int N_mpcd = m_mpcd_pdata->getN() + m_mpcd_pdata->getNVirtual();
+
+    const unsigned int N_embed = m_embed_group->getNumMembers();
+    for (unsigned int i = 0; i < N_embed; ++i)
+        {
+        const unsigned int idx = h_embed_group.data[i];
+        const Scalar4 postype = h_pos.data[idx];
+        const unsigned int cell = binFusedPosition(make_scalar3(postype.x, postype.y, postype.z), N_mpcd + i);
+        m_fused_embed_cells[i] = cell;
+
+        const Scalar4 vel_mass = h_vel.data[idx];
+        mpcd::detail::accumulateSRDCell(cell_vel[cell],
+                                        cell_energy ? &cell_energy[cell] : nullptr,
+                                        make_double3(vel_mass.x, vel_mass.y, vel_mass.z),
+                                        vel_mass.w);
+        }
+    }
+
+/*!
+ * \param timestep Current timestep
+ *
+ * The summed momenta are replaced by the average velocities of the cells, and the rotation vectors (and thermostat
+ * factors) are drawn from the same random streams as in drawRotationVectors().
+ */
+void mpcd::SRDCollisionMethod::drawFusedRotations(uint64_t timestep)
+    {
+    const bool use_thermostat = (m_T) ? true : false;
+    ArrayHandle<double4> h_cell_vel(m_fused_cell_vel, access_location::host, access_mode::readwrite);
+    ArrayHandle<double3> h_rotvec(m_rotvec, access_location::host, access_mode::overwrite);
+    std::unique_ptr< ArrayHandle<double3> > h_cell_energy;
+    std::unique_ptr< ArrayHandle<double> > h_factors;
+    Scalar T_set(1.0);
+    if (use_thermostat)
+        {
+        h_cell_energy.reset(new ArrayHandle<double3>(m_fused_cell_energy, access_location::host, access_mode::read));
+        h_factors.reset(new ArrayHandle<double>(m_factors, access_location::host, access_mode::overwrite));
+        T_set = (*m_T)(timestep);
+        }
+    const Index3D& ci = m_cl->getCellIndexer();
+    const Index3D& global_ci = m_cl->getGlobalCellIndexer();
+    const uint16_t seed = m_sysdef->getSeed();
+    const unsigned int ndim = m_sysdef->getNDimensions();
+
+    auto finish_cell = [&](unsigned int idx)
+        {
+        const double4 cell_vel = h_cell_vel.data[idx];
+        double3 vel_cm = make_double3(cell_vel.x, cell_vel.y, cell_vel.z);
+        const double mass = cell_vel.w;
+        if (mass > 0.)
+            {
+            vel_cm.x /= mass; vel_cm.y /= mass; vel_cm.z /= mass;
+            }
+        h_cell_vel.data[idx] = make_double4(vel_cm.x, vel_cm.y, vel_cm.z, mass);
+
+        double3 cell_energy = make_double3(0,0,0);
+        if (use_thermostat)
+            {
+            cell_energy = h_cell_energy->data[idx];
+            const unsigned int np = __double_as_int(cell_energy.z);
+            if (np > 1)
+                {
+                const double ke_cm = 0.5 * mass * (vel_cm.x*vel_cm.x + vel_cm.y*vel_cm.y + vel_cm.z*vel_cm.z);
+                cell_energy.y = 2. * (cell_energy.x - ke_cm) / (ndim * (np-1));
+                }
+            }
+
+        const uint3 local_cell = ci.getTriple(idx);
+        const int3 global_cell = m_cl->getGlobalCell(make_int3(local_cell.x, local_cell.y, local_cell.z));
+        const unsigned int global_idx = global_ci(global_cell.x, global_cell.y, global_cell.z);
+        hoomd::RandomGenerator rng(hoomd::Seed(hoomd::RNGIdentifier::SRDCollisionMethod, timestep, seed),
+                                   hoomd::Counter(global_idx));
+        double factor = 1.0;
+        h_rotvec.data[idx] = mpcd::detail::drawSRDRotation(rng, cell_energy, use_thermostat, T_set, ndim, factor);
+        if (use_thermostat)
+            h_factors->data[idx] = factor;
+        };
+
+    const unsigned int n_cells = m_cl->getNCells();
+    #ifdef ENABLE_TBB
+    m_exec_conf->getTaskArena()->execute([&]{
+    tbb::parallel_for(tbb::blocked_range<unsigned int>(0, n_cells),
+        [&](const tbb::blocked_range<unsigned int>& range)
+            {
+            for (unsigned int idx = range.begin(); idx != range.end(); ++idx)
+                finish_cell(idx);
+            });
+    }); // end task arena execute()
+    #else
+    for (unsigned int idx = 0; idx < n_cells; ++idx)
+        finish_cell(idx);
+    #endif
+    }
+
+/*!
+ * \param stream_dt Time to stream the particles after the collision
+ *
+ * Virtual particles are rotated but not streamed.
+ */
+void mpcd::SRDCollisionMethod::rotateAndStreamFused(Scalar stream_dt)
+    {
+    ArrayHandle<Scalar4> h_pos(m_mpcd_pdata->getPositions(), access_location::host, access_mode::readwrite);
+    ArrayHandle<Scalar4> h_vel(m_mpcd_pdata->getVelocities(), access_location::host, access_mode::readwrite);
+    ArrayHandle<double4> h_cell_vel(m_fused_cell_vel, access_location::host, access_mode::read);
+    ArrayHandle<double3> h_rotvec(m_rotvec, access_location::host, access_mode::read);
+    std::unique_ptr< ArrayHandle<double> > h_factors;
+    if (m_T)
+        h_factors.reset(new ArrayHandle<double>(m_factors, access_location::host, access_mode::read));
+    const double cos_a = slow::cos(m_angle);
+    const double one_minus_cos_a = 1.0 - cos_a;
+    const double sin_a = slow::sin(m_angle);
+    const BoxDim& box = m_cl->getCoverageBox();
+    const unsigned int N = m_mpcd_pdata->getN();
+    const unsigned int N_mpcd = N + m_mpcd_pdata->getNVirtual();
+
+    auto rotate_and_stream = [&](unsigned int idx)
+        {
+        const Scalar4 vel_cell = h_vel.data[idx];
+        const unsigned int cell = __scalar_as_int(vel_cell.w);
+        const double3 new_vel = mpcd::detail::collideSRDVelocity(make_double3(vel_cell.x, vel_cell.y, vel_cell.z),
+                                                                 h_cell_vel.data[cell],
+                                                                 h_rotvec.data[cell],
+                                                                 h_factors ? &h_factors->data[cell] : nullptr,
+                                                                 cos_a,
+                                                                 one_minus_cos_a,
+                                                                 sin_a);
+
+        if (idx < N)
+            {
+            // stream the particle to its new position and wrap it back into the box
+            const Scalar4 postype = h_pos.data[idx];
+            Scalar3 pos = make_scalar3(postype.x, postype.y, postype.z);
+            pos.x += stream_dt * Scalar(new_vel.x);
+            pos.y += stream_dt * Scalar(new_vel.y);
+            pos.z += stream_dt * Scalar(new_vel.z);
+            int3 image = make_int3(0,0,0);
+            box.wrap(pos, image);
+
+            h_pos.data[idx] = make_scalar4(pos.x, pos.y, pos.z, postype.w);
+            h_vel.data[idx] = make_scalar4(new_vel.x, new_vel.y, new_vel.z, __int_as_scalar(mpcd::detail::NO_CELL));
+            }
+        else
+            {
+            // virtual particles are not streamed
+            h_vel.data[idx] = make_scalar4(new_vel.x, new_vel.y, new_vel.z, __int_as_scalar(cell));
+            }
+        };
+
+    #ifdef ENABLE_TBB
+    m_exec_conf->getTaskArena()->execute([&]{
+    tbb::parallel_for(tbb::blocked_range<unsigned int>(0, N_mpcd),
+        [&](const tbb::blocked_range<unsigned int>& range)
+            {
+            for (unsigned int idx = range.begin(); idx != range.end(); ++idx)
+                rotate_and_stream(idx);
+            });
+    }); // end task arena execute()
+    #else
+    for (unsigned int idx = 0; idx < N_mpcd; ++idx)
+        rotate_and_stream(idx);
+    #endif
+    }
+
+/*!
+ * \param stream_dt Time to stream the particles after the collision
+ *
+ * The particles are streamed in units of the cell size and wrapped through the periodic boundaries of the grid, which
+ * covers the box exactly.
+ */
+void mpcd::SRDCollisionMethod::rotateAndStreamFusedCompact(Scalar stream_dt)
+    {
+    ArrayHandle<unsigned int> h_cell(m_mpcd_pdata->getCompactCells(), access_location::host, access_mode::readwrite);
+    ArrayHandle<uint64_t> h_pos(m_mpcd_pdata->getCompactPositions(), access_location::host, access_mode::readwrite);
+    ArrayHandle<float3> h_vel(m_mpcd_pdata->getCompactVelocities(), access_location::host, access_mode::readwrite);
+    ArrayHandle<double4> h_cell_vel(m_fused_cell_vel, access_location::host, access_mode::read);
+    ArrayHandle<double3> h_rotvec(m_rotvec, access_location::host, access_mode::read);
+    std::unique_ptr< ArrayHandle<double> > h_factors;
+    if (m_T)
+        h_factors.reset(new ArrayHandle<double>(m_factors, access_location::host, access_mode::read));
+    const double cos_a = slow::cos(m_angle);
+    const double one_minus_cos_a = 1.0 - cos_a;
+    const double sin_a = slow::sin(m_angle);
+    const Index3D& ci = m_cl->getCellIndexer();
+    const uint3 dim = m_cl->getDim();
+    const Scalar stream_cells = stream_dt / m_cl->getCellSize();
+    const unsigned int N = m_mpcd_pdata->getN();
+
+    auto rotate_and_stream = [&](unsigned int idx)
+        {
+        const unsigned int cell = h_cell.data[idx];
+        const uint64_t compact_pos = h_pos.data[idx];
+        const unsigned int collision_cell = binFusedCompactPosition(cell, compact_pos, idx);
+        const float3 vel = h_vel.data[idx];
+        const double3 new_vel = mpcd::detail::collideSRDVelocity(make_double3(vel.x, vel.y, vel.z),
+                                                                 h_cell_vel.data[collision_cell],
+                                                                 h_rotvec.data[collision_cell],
+                                                                 h_factors ? &h_factors->data[collision_cell] : nullptr,
+                                                                 cos_a,
+                                                                 one_minus_cos_a,
+                                                                 sin_a);
+
+        // stream the particle in units of the cell size
+        const uint3 c = ci.getTriple(cell);
+        const uint3 offset = mpcd::detail::unpackCompactOffset(compact_pos);
+        const Scalar3 x = make_scalar3(
+            Scalar(c.x) + mpcd::detail::dequantizeCellOffset(offset.x) + stream_cells * Scalar(new_vel.x),
+            Scalar(c.y) + mpcd::detail::dequantizeCellOffset(offset.y) + stream_cells * Scalar(new_vel.y),
+            Scalar(c.z) + mpcd::detail::dequantizeCellOffset(offset.z) + stream_cells * Scalar(new_vel.z));
+        int3 bin;
+        uint3 new_offset;
+        new_offset.x = mpcd::detail::quantizeCellOffset(x.x, bin.x);
+        new_offset.y = mpcd::detail::quantizeCellOffset(x.y, bin.y);
+        new_offset.z = mpcd::detail::quantizeCellOffset(x.z, bin.z);
+
+        // wrap the cell through the periodic boundaries
+        bin.x %= (int)dim.x;
+        if (bin.x < 0) bin.x += dim.x;
+        bin.y %= (int)dim.y;
+        if (bin.y < 0) bin.y += dim.y;
+        bin.z %= (int)dim.z;
+        if (bin.z < 0) bin.z += dim.z;
+
+        h_cell.data[idx] = ci(bin.x, bin.y, bin.z);
+        h_pos.data[idx] = mpcd::detail::packCompactPosition(new_offset,
+                                                            mpcd::detail::unpackCompactType(compact_pos));
+        h_vel.data[idx] = make_float3(float(new_vel.x), float(new_vel.y), float(new_vel.z));
+        };
+
+    #ifdef ENABLE_TBB
+    m_exec_conf->getTaskArena()->execute([&]{
+    tbb::parallel_for(tbb::blocked_range<unsigned int>(0, N),
+        [&](const tbb::blocked_range<unsigned int>& range)
+            {
+            for (unsigned int idx = range.begin(); idx != range.end(); ++idx)
+                rotate_and_stream(idx);
+            });
+    }); // end task arena execute()
+    #else
+    for (unsigned int idx = 0; idx < N; ++idx)
+        rotate_and_stream(idx);
+    #endif
+    }
+
+void mpcd::SRDCollisionMethod::rotateFusedEmbedded()
+    {
+    if (!m_embed_group) return;
+
+    ArrayHandle<unsigned int> h_embed_group(m_embed_group->getIndexArray(), access_location::host, access_mode::read);
+    ArrayHandle<Scalar4> h_vel(m_pdata->getVelocities(), access_location::host, access_mode::readwrite);
+    ArrayHandle<double4> h_cell_vel(m_fused_cell_vel, access_location::host, access_mode::read);
+    ArrayHandle<double3> h_rotvec(m_rotvec, access_location::host, access_mode::read);
+    std::unique_ptr< ArrayHandle<double> > h_factors;
+    if (m_T)
+        h_factors.reset(new ArrayHandle<double>(m_factors, access_location::host, access_mode::read));
+    const double cos_a = slow::cos(m_angle);
+    const double one_minus_cos_a = 1.0 - cos_a;
+    const double sin_a = slow::sin(m_angle);
+
+    const unsigned int N_embed = m_embed_group->getNumMembers();
+    for (unsigned int i = 0; i < N_embed; ++i)
+        {
+        const unsigned int idx = h_embed_group.data[i];
+        const unsigned int cell = m_fused_embed_cells[i];
+        const Scalar4 vel_mass = h_vel.data[idx];
+        const double3 new_vel = mpcd::detail::collideSRDVelocity(make_double3(vel_mass.x, vel_mass.y, vel_mass.z),
+                                                                 h_cell_vel.data[cell],
+                                                                 h_rotvec.data[cell],
+                                                                 h_factors ? &h_factors->data[cell] : nullptr,
+                                                                 cos_a,
+                                                                 one_minus_cos_a,
+                                                                 sin_a);
+        h_vel.data[idx] = make_scalar4(new_vel.x, new_vel.y, new_vel.z, vel_mass.w);
+        }
+    }
+
 /*!
  * \param m Python module to export to
  */
@@ -244,5 +848,9 @@ void mpcd::detail::export_SRDCollisionMethod(pybind11::module& m)
         .def("setRotationAngle", &mpcd::SRDCollisionMethod::setRotationAngle)
         .def("setTemperature", &mpcd::SRDCollisionMethod::setTemperature)
         .def("unsetTemperature", &mpcd::SRDCollisionMethod::unsetTemperature)
+        .def_property("angle",
+                      [](const mpcd::SRDCollisionMethod& srd) { return srd.getRotationAngle() * 180.0 / M_PI; },
+                      [](mpcd::SRDCollisionMethod& srd, double angle) { srd.setRotationAngle(angle * M_PI / 180.0); })
+        .def_property("kT", &mpcd::SRDCollisionMethod::getTemperature, &mpcd::SRDCollisionMethod::setTemperature)
     ;
     }
@@ -20,6 +20,8 @@
 
 #include "hoomd/Variant.h"
 
+#include <vector>
+
 namespace mpcd
 {
 
@@ -70,12 +72,21 @@ class PYBIND11_EXPORT SRDCollisionMethod : public mpcd::CollisionMethod
             m_T = T;
             }
 
+        //! Get the temperature (a null pointer when the thermostat is off)
+        std::shared_ptr<::Variant> getTemperature() const
+            {
+            return m_T;
+            }
+
         //! Unset the temperature
         void unsetTemperature()
             {
             m_T = std::shared_ptr<::Variant>();
             }
 
+        //! Collide and then stream the particles ballistically in two fused passes
+        bool collideAndStream(uint64_t timestep, Scalar stream_dt);
+
         //! Get the requested thermo flags
         mpcd::detail::ThermoFlags getRequestedThermoFlags() const
             {
@@ -94,6 +105,10 @@ class PYBIND11_EXPORT SRDCollisionMethod : public mpcd::CollisionMethod
         std::shared_ptr<::Variant> m_T; //!< Temperature for thermostat
         GPUVector<double> m_factors;    //!< Cell-level rescale factors
 
+        GPUVector<double4> m_fused_cell_vel;    //!< Cell momenta and masses, then velocities (fused path)
+        GPUVector<double3> m_fused_cell_energy; //!< Cell kinetic energies, temperatures and sizes (fused path)
+        std::vector<unsigned int> m_fused_embed_cells;  //!< Cells of the embedded particles (fused path)
+
         //! Implementation of the collision rule
         virtual void rule(uint64_t timestep);
 
@@ -102,6 +117,37 @@ class PYBIND11_EXPORT SRDCollisionMethod : public mpcd::CollisionMethod
 
         //! Apply rotation matrix to velocities
         virtual void rotate(uint64_t timestep);
+
+    private:
+        //! Wrap a cell that is at most one cell outside the grid back into it (fused path)
+        int3 wrapFusedBin(int3 bin, const uint3& dim, unsigned int idx) const;
+
+        //! Get the shifted cell of a position (fused path)
+        unsigned int binFusedPosition(const Scalar3& pos, unsigned int idx) const;
+
+        //! Get the shifted cell of a compact position (fused path)
+        unsigned int binFusedCompactPosition(unsigned int cell, uint64_t compact_pos, unsigned int idx) const;
+
+        //! Bin the MPCD particles and sum the cells (fused path)
+        void binFused(double4* cell_vel, double3* cell_energy);
+
+        //! Bin the MPCD particles in the compact layout and sum the cells (fused path)
+        void binFusedCompact(double4* cell_vel, double3* cell_energy);
+
+        //! Bin the embedded particles and sum the cells (fused path)
+        void binFusedEmbedded(double4* cell_vel, double3* cell_energy);
+
+        //! Average the cells and draw their rotations (fused path)
+        void drawFusedRotations(uint64_t timestep);
+
+        //! Rotate the velocities and stream the MPCD particles (fused path)
+        void rotateAndStreamFused(Scalar stream_dt);
+
+        //! Rotate the velocities and stream the MPCD particles in the compact layout (fused path)
+        void rotateAndStreamFusedCompact(Scalar stream_dt);
+
+        //! Rotate the velocities of the embedded particles (fused path)
+        void rotateFusedEmbedded();
     };
 
 namespace detail
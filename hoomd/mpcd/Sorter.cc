@@ -10,6 +10,8 @@
 
 #include "Sorter.h"
 
+#include <vector>
+
 /*!
  * \param sysdata MPCD system data
  */
@@ -24,7 +26,8 @@ mpcd::Sorter::Sorter(std::shared_ptr<mpcd::SystemData> sysdata,
       m_cl(m_mpcd_sys->getCellList()),
       m_order(m_exec_conf),
       m_rorder(m_exec_conf),
-      m_period(period)
+      m_period(period),
+      m_adaptive(false)
     {
     assert(m_mpcd_sys);
     m_exec_conf->msg->notice(5) << "Constructing MPCD Sorter" << std::endl;
@@ -46,20 +49,34 @@ void mpcd::Sorter::update(uint64_t timestep)
     {
     if (!shouldSort(timestep)) return;
 
+    if (m_adaptive)
+        m_schedule.beginSort();
+
     if (m_prof) m_prof->push(m_exec_conf, "MPCD sort");
 
     // resize the sorted order vector to the current number of particles
     m_order.resize(m_mpcd_pdata->getN());
     m_rorder.resize(m_mpcd_pdata->getN());
 
-    // generate and apply the sorted order
-    computeOrder(timestep);
-    applyOrder();
+    // generate and apply the sorted order, keeping the compact layout if the particles are in it
+    if (m_mpcd_pdata->isCompact())
+        {
+        computeCompactOrder();
+        applyCompactOrder();
+        }
+    else
+        {
+        computeOrder(timestep);
+        applyOrder();
+        }
 
     // trigger the sort signal for ParticleData callbacks using the current sortings
     m_mpcd_pdata->notifySort(timestep, m_order, m_rorder);
 
     if (m_prof) m_prof->pop(m_exec_conf);
+
+    if (m_adaptive)
+        m_schedule.endSort();
     }
 
 /*!
@@ -150,6 +167,88 @@ void mpcd::Sorter::applyOrder() const
     m_mpcd_pdata->swapTags();
     }
 
+/*!
+ * The particles are ordered by their cells in the compact layout with a counting sort. These
+ * cells are not shifted like those of the cell list, but they group the particles equally well.
+ * There are no virtual particles in the compact layout.
+ */
+void mpcd::Sorter::computeCompactOrder()
+    {
+    const uint3 dim = m_mpcd_pdata->getCompactDim();
+    const unsigned int n_cells = dim.x * dim.y * dim.z;
+    const unsigned int N_mpcd = m_mpcd_pdata->getN();
+
+    ArrayHandle<unsigned int> h_cell(m_mpcd_pdata->getCompactCells(), access_location::host, access_mode::read);
+    ArrayHandle<unsigned int> h_order(m_order, access_location::host, access_mode::overwrite);
+    ArrayHandle<unsigned int> h_rorder(m_rorder, access_location::host, access_mode::overwrite);
+
+    // first index of each cell in the sorted order
+    std::vector<unsigned int> cell_start(n_cells + 1, 0);
+    for (unsigned int idx=0; idx < N_mpcd; ++idx)
+        ++cell_start[h_cell.data[idx] + 1];
+    for (unsigned int cell=0; cell < n_cells; ++cell)
+        cell_start[cell + 1] += cell_start[cell];
+
+    for (unsigned int idx=0; idx < N_mpcd; ++idx)
+        {
+        const unsigned int cur_p = cell_start[h_cell.data[idx]]++;
+        h_order.data[cur_p] = idx;
+        h_rorder.data[idx] = cur_p;
+        }
+    }
+
+namespace
+{
+//! Reorder a per-particle array in place
+/*!
+ * \param data Array to reorder
+ * \param order Maps new sorted index onto old particle indexes
+ * \param N Number of particles
+ * \param tmp Scratch space for a copy of the array
+ */
+template<typename T>
+void reorderInPlace(T* data, const unsigned int* order, unsigned int N, std::vector<T>& tmp)
+    {
+    tmp.assign(data, data + N);
+    for (unsigned int idx=0; idx < N; ++idx)
+        data[idx] = tmp[order[idx]];
+    }
+} // end namespace
+
+/*!
+ * The compact arrays are reordered in place, one at a time, so that the sort needs less
+ * memory than the alternate arrays of the full layout. The tags are sorted with the
+ * alternate tag array as in applyOrder().
+ */
+void mpcd::Sorter::applyCompactOrder() const
+    {
+    const unsigned int N_mpcd = m_mpcd_pdata->getN();
+    ArrayHandle<unsigned int> h_order(m_order, access_location::host, access_mode::read);
+
+        {
+        ArrayHandle<unsigned int> h_cell(m_mpcd_pdata->getCompactCells(), access_location::host, access_mode::readwrite);
+        std::vector<unsigned int> tmp;
+        reorderInPlace(h_cell.data, h_order.data, N_mpcd, tmp);
+        }
+        {
+        ArrayHandle<uint64_t> h_pos(m_mpcd_pdata->getCompactPositions(), access_location::host, access_mode::readwrite);
+        std::vector<uint64_t> tmp;
+        reorderInPlace(h_pos.data, h_order.data, N_mpcd, tmp);
+        }
+        {
+        ArrayHandle<float3> h_vel(m_mpcd_pdata->getCompactVelocities(), access_location::host, access_mode::readwrite);
+        std::vector<float3> tmp;
+        reorderInPlace(h_vel.data, h_order.data, N_mpcd, tmp);
+        }
+        {
+        ArrayHandle<unsigned int> h_tag(m_mpcd_pdata->getTags(), access_location::host, access_mode::read);
+        ArrayHandle<unsigned int> h_tag_alt(m_mpcd_pdata->getAltTags(), access_location::host, access_mode::overwrite);
+        for (unsigned int idx=0; idx < N_mpcd; ++idx)
+            h_tag_alt.data[idx] = h_tag.data[h_order.data[idx]];
+        }
+    m_mpcd_pdata->swapTags();
+    }
+
 bool mpcd::Sorter::peekSort(uint64_t timestep) const
     {
     if (timestep < m_next_timestep)
@@ -158,12 +257,30 @@ bool mpcd::Sorter::peekSort(uint64_t timestep) const
         return ((timestep - m_next_timestep) % m_period == 0);
     }
 
+/*!
+ * \param timestep Current timestep
+ *
+ * In adaptive mode, the steps selected by the period are candidates, and all ranks sort when the
+ * AdaptiveSortSchedule of any rank decides to.
+ */
 bool mpcd::Sorter::shouldSort(uint64_t timestep)
     {
     if (peekSort(timestep))
         {
         m_next_timestep = timestep + m_period;
-        return true;
+        if (!m_adaptive)
+            return true;
+
+        bool sort = m_schedule.shouldSort(timestep);
+        #ifdef ENABLE_MPI
+        if (m_exec_conf->getNRanks() > 1)
+            {
+            int sort_any = sort;
+            MPI_Allreduce(MPI_IN_PLACE, &sort_any, 1, MPI_INT, MPI_MAX, m_exec_conf->getMPICommunicator());
+            sort = sort_any;
+            }
+        #endif // ENABLE_MPI
+        return sort;
         }
     else
         return false;
@@ -178,5 +295,8 @@ void mpcd::detail::export_Sorter(pybind11::module& m)
     py::class_<mpcd::Sorter, std::shared_ptr<mpcd::Sorter> >(m, "Sorter")
         .def(py::init<std::shared_ptr<mpcd::SystemData>, unsigned int, unsigned int>())
         .def("setPeriod", &mpcd::Sorter::setPeriod)
+        .def_property_readonly("period", &mpcd::Sorter::getPeriod)
+        .def_property("adaptive", &mpcd::Sorter::getAdaptive, &mpcd::Sorter::setAdaptive)
+        .def_property_readonly("sort_interval", &mpcd::Sorter::getSortInterval)
         ;
     }
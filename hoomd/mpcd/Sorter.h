@@ -16,6 +16,7 @@
 #endif
 
 #include "SystemData.h"
+#include "hoomd/AdaptiveSortSchedule.h"
 #include <pybind11/pybind11.h>
 
 namespace mpcd
@@ -35,6 +36,14 @@ namespace mpcd
  * the virtual particles and leave them in place at the end of the arrays. This is
  * because they cannot be removed easily if they are sorted with the rest of the particles,
  * and the performance gains from doing a separate (segmented) sort on them is probably small.
+ *
+ * When the particles are held in the compact layout of the mpcd::ParticleData, the Sorter
+ * orders them by their compact cells and applies the order to the compact arrays. This
+ * does not need the cell list or the full arrays, so the data stays compact across sorts.
+ *
+ * In adaptive mode, the steps selected by the period are only candidates, and an AdaptiveSortSchedule
+ * chooses on which of them to sort from the measured time per step. The period should then be set to the
+ * collision period, so that the sort reuses the cell list of the collision.
  */
 class PYBIND11_EXPORT Sorter
     {
@@ -75,6 +84,32 @@ class PYBIND11_EXPORT Sorter
             m_next_timestep = multiple * m_period;
             }
 
+        //! Get the period
+        unsigned int getPeriod() const
+            {
+            return m_period;
+            }
+
+        //! Set whether the sort steps are chosen adaptively
+        void setAdaptive(bool adaptive)
+            {
+            if (adaptive && !m_adaptive)
+                m_schedule.reset();
+            m_adaptive = adaptive;
+            }
+
+        //! Get whether the sort steps are chosen adaptively
+        bool getAdaptive() const
+            {
+            return m_adaptive;
+            }
+
+        //! Get the number of steps between the last two adaptive sorts
+        uint64_t getSortInterval() const
+            {
+            return m_schedule.getLastInterval();
+            }
+
     protected:
         std::shared_ptr<mpcd::SystemData> m_mpcd_sys;       //!< MPCD system data
         std::shared_ptr<SystemDefinition> m_sysdef;         //!< HOOMD system definition
@@ -91,12 +126,21 @@ class PYBIND11_EXPORT Sorter
         unsigned int m_period;          //!< Sorting period
         uint64_t m_next_timestep;   //!< Next step to apply sorting
 
+        bool m_adaptive;                    //!< True when sorting adaptively
+        AdaptiveSortSchedule m_schedule;    //!< Chooses the sort steps in adaptive mode
+
         //! Compute the sorting order at the current timestep
         virtual void computeOrder(uint64_t timestep);
 
         //! Apply the sorting order
         virtual void applyOrder() const;
 
+        //! Compute the sorting order of the particles in the compact layout
+        void computeCompactOrder();
+
+        //! Apply the sorting order to the particles in the compact layout
+        void applyCompactOrder() const;
+
     private:
         bool shouldSort(uint64_t timestep);
     };
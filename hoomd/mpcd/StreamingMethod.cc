@@ -116,6 +116,7 @@ void mpcd::detail::export_StreamingMethod(pybind11::module& m)
     py::class_<mpcd::StreamingMethod, std::shared_ptr<mpcd::StreamingMethod> >(m, "StreamingMethod")
         .def(py::init<std::shared_ptr<mpcd::SystemData>, unsigned int, unsigned int, int>())
         .def("setPeriod", &mpcd::StreamingMethod::setPeriod)
+        .def_property_readonly("period", &mpcd::StreamingMethod::getPeriod)
         .def("setField", &mpcd::StreamingMethod::setField)
         .def("removeField", &mpcd::StreamingMethod::removeField);
     }
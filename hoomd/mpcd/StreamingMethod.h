@@ -97,6 +97,37 @@ class PYBIND11_EXPORT StreamingMethod
         //! Set the period of the streaming method
         void setPeriod(unsigned int cur_timestep, unsigned int period);
 
+        //! Get the period of the streaming method
+        unsigned int getPeriod() const
+            {
+            return m_period;
+            }
+
+        //! Check if the particles stream freely through the periodic box
+        /*!
+         * \returns True if the particles move ballistically without walls or an external field
+         *
+         * Collision methods can stream such particles themselves in the same pass as the collision (see
+         * mpcd::SRDCollisionMethod::collideAndStream).
+         */
+        virtual bool isUnconfined() const
+            {
+            return false;
+            }
+
+        //! Advance the streaming schedule when another method streams the particles
+        /*!
+         * \param timestep Current timestep
+         * \returns True if the particles should be streamed at \a timestep
+         *
+         * Call this instead of stream() when the particles are streamed by another method, e.g., fused into the
+         * collision.
+         */
+        bool claimStream(uint64_t timestep)
+            {
+            return shouldStream(timestep);
+            }
+
     protected:
         std::shared_ptr<mpcd::SystemData> m_mpcd_sys;                   //!< MPCD system data
         std::shared_ptr<SystemDefinition> m_sysdef;                     //!< HOOMD system definition
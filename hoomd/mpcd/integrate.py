@@ -1,233 +1,209 @@
 # Copyright (c) 2009-2021 The Regents of the University of Michigan
-# This file is part of the HOOMD-blue project, released under the BSD 3-Clause License.
+# This file is part of the HOOMD-blue project, released under the BSD 3-Clause
+# License.
 
 # Maintainer: mphoward
 
-R""" MPCD integration methods
-
-Defines bounce-back methods for integrating solutes (MD particles) embedded in an MPCD
-solvent. The integration scheme is velocity Verlet (NVE) with bounce-back performed at
-the solid boundaries defined by a geometry, as in :py:mod:`.mpcd.stream`. This gives a
-simple approximation of the interactions required to keep a solute bounded in a geometry,
-and more complex interactions can be specified, for example, by writing custom external fields.
-
-Similar caveats apply to these methods as for the :py:mod:`.mpcd.stream` methods. In particular:
-
-    1. The simulation box is periodic, but the geometry imposes inherently non-periodic boundary
-       conditions. You must ensure that the box is sufficiently large to enclose the geometry
-       and that all particles lie inside it, or an error will be raised at runtime.
-    2. You must also ensure that particles do not self-interact through the periodic boundaries.
-       This is usually achieved for simple pair potentials by padding the box size by the largest
-       cutoff radius. Failure to do so may result in unphysical interactions.
-    3. Bounce-back rules do not always enforce no-slip conditions at surfaces properly. It
-       may still be necessary to add additional 'ghost' MD particles in the surface
-       to achieve the right boundary conditions and reduce density fluctuations.
-
-The integration methods defined here are not restricted to only MPCD simulations: they can be
-used with both ``md.integrate.mode_standard`` and :py:class:`.mpcd.integrator`. For
-example, the same integration methods might be used to run DPD simulations with surfaces.
-
-These bounce-back methods do not support anisotropic integration because torques are currently
-not computed for collisions with the boundary. Similarly, rigid bodies will also not be treated
-correctly because the integrators are not aware of the extent of the particles; the surface
-reflections are treated as point particles. An error will be raised if an anisotropic integration
-mode is specified.
-
-"""
+"""MPCD integrator."""
 
 import hoomd
-from hoomd import _hoomd
-
-from . import _mpcd
-
-class _bounce_back(hoomd.integrate._integration_method):
-    """ NVE integration with bounce-back rules.
-
-    Args:
-        group (``hoomd.group``): Group of particles on which to apply this method.
-
-    :py:class:`_bounce_back` is a base class integration method. It must be used with
-    ``md.integrate.mode_standard`` or :py:class:`.mpcd.integrator`.
-    Deriving classes implement the specific geometry and valid parameters for those geometries.
-    Currently, there is no mechanism to share geometries between multiple instances of the same
-    integration method.
-
-    A :py:class:`hoomd.md.compute.ThermodynamicQuantities` is automatically specified and associated with *group*.
-
-    """
-    def __init__(self, group):
-        # initialize base class
-        hoomd.integrate._integration_method.__init__(self)
-
-        # create the compute thermo
-        hoomd.compute._get_unique_thermo(group=group)
-
-        # store metadata
-        self.group = group
-        self.boundary = None
-        self.metadata_fields = ['group','boundary']
-
-    def _process_boundary(self, bc):
-        """ Process boundary condition string into enum
+from hoomd.data.parameterdicts import ParameterDict
+from hoomd.data.typeconverter import OnlyFrom, OnlyTypes
+from hoomd.md.integrate import _DynamicIntegrator, _preprocess_aniso
+from hoomd.mpcd import _mpcd
+from hoomd.mpcd.collide import CollisionMethod
+from hoomd.mpcd.data import Solvent
+from hoomd.mpcd.stream import StreamingMethod
+from hoomd.mpcd.update import Sorter
 
-        Args:
-            bc (str): Boundary condition, either "no_slip" or "slip"
 
-        Returns:
-            A valid boundary condition enum.
-
-        The enum interface is still fairly clunky for the user since the boundary
-        condition is buried too deep in the package structure. This is a convenience
-        method for interpreting.
-
-        """
-        if bc == "no_slip":
-            return _mpcd.boundary.no_slip
-        elif bc == "slip":
-            return _mpcd.boundary.slip
-        else:
-            hoomd.context.current.device.cpp_msg.error("mpcd.integrate: boundary condition " + bc + " not recognized.\n")
-            raise ValueError("Unrecognized streaming boundary condition")
-            return None
-
-class slit(_bounce_back):
-    """ NVE integration with bounce-back rules in a slit channel.
+class Integrator(_DynamicIntegrator):
+    """MPCD integrator.
 
     Args:
-        group (``hoomd.group``): Group of particles on which to apply this method.
-        H (float): channel half-width
-        V (float): wall speed (default: 0)
-        boundary : 'slip' or 'no_slip' boundary condition at wall (default: 'no_slip')
+        dt (float): Integrator time step size :math:`[\\mathrm{time}]`.
 
-    This integration method applies to particles in *group* in the parallel-plate channel geometry.
-    This method is the MD analog of :py:class:`.stream.slit`, which documents additional details
-    about the geometry.
+        solvent (`hoomd.mpcd.Solvent`): MPCD solvent particles.
 
-    Examples::
+        streaming_method (`hoomd.mpcd.stream.StreamingMethod`): Method that
+            streams the MPCD particles.
 
-        all = group.all()
-        slit = mpcd.integrate.slit(group=all, H=5.0)
-        slit = mpcd.integrate.slit(group=all, H=10.0, V=1.0)
+        collision_method (`hoomd.mpcd.collide.CollisionMethod`): Method that
+            collides the MPCD particles.
 
-    .. versionadded:: 2.7
+        sorter (`hoomd.mpcd.update.Sorter`): Sorter for the MPCD particles.
+            When `None`, the MPCD particles are not sorted.
 
-    """
-    def __init__(self, group, H, V=0.0, boundary="no_slip"):
-        # initialize base class
-        _bounce_back.__init__(self,group)
-        self.metadata_fields += ['H','V']
+        aniso (str or bool): Whether to integrate rotational degrees of freedom
+            of the MD particles (bool), default 'auto' (autodetect if there is
+            anisotropic factor from any defined active or constraint forces).
 
-        # initialize the c++ class
-        if not hoomd.context.current.device.mode == 'gpu':
-            cpp_class = _mpcd.BounceBackNVESlit
-        else:
-            cpp_class = _mpcd.BounceBackNVESlitGPU
+        forces (Sequence[hoomd.md.force.Force]): Sequence of forces applied to
+            the MD particles. The default value of ``None`` initializes an
+            empty list.
 
-        self.H = H
-        self.V = V
-        self.boundary = boundary
+        constraints (Sequence[hoomd.md.constrain.ConstraintForce]): Sequence of
+            constraint forces applied to the MD particles. The default value of
+            ``None`` initializes an empty list.
 
-        bc = self._process_boundary(boundary)
-        geom = _mpcd.SlitGeometry(H, V, bc)
+        methods (Sequence[hoomd.md.methods._Method]): Sequence of integration
+            methods of the MD particles. The default value of ``None``
+            initializes an empty list.
 
-        self.cpp_method = cpp_class(hoomd.context.current.system_definition, group.cpp_group, geom)
-        self.cpp_method.validateGroup()
+        fused (bool): When True, stream and collide the MPCD particles in one
+            fused step where possible.
 
-    def set_params(self, H=None, V=None, boundary=None):
-        """ Set parameters for the slit geometry.
+    `Integrator` extends `hoomd.md.Integrator` with an MPCD solvent. At each
+    time step, the MPCD particles are sorted, collided, and streamed as set by
+    the periods of the `sorter`, `collision_method`, and `streaming_method`,
+    and the MD particles are integrated with `methods`. The period of the
+    collision method must be a multiple of the period of the streaming method.
 
-        Args:
-            H (float): channel half-width
-            V (float): wall speed (default: 0)
-            boundary : 'slip' or 'no_slip' boundary condition at wall (default: 'no_slip')
+    The MD particles are updated every step, while the MPCD particles are
+    streamed ahead by the full streaming period at once. For example, when
+    streaming happens every 5 steps, the MPCD particle data at step 3 is
+    already the data of step 5.
 
-        Examples::
+    With *fused*, every step on which the particles both collide and stream is
+    performed in two passes over the MPCD particles: the first bins the
+    particles into cells and sums the cell momenta, the second rotates the
+    velocities and streams the particles, with the cells processed in parallel
+    (with TBB). The fused step skips separate cell list and cell thermodynamics
+    passes, which reduces the memory traffic of solvent dominated simulations.
+    It produces the same trajectory as the unfused steps, and is used when the
+    simulation runs on the CPU with one rank, the collision method is
+    `hoomd.mpcd.collide.SRD`, and the streaming method is
+    `hoomd.mpcd.stream.Bulk`. Other steps run unfused.
+    Set `hoomd.mpcd.Solvent.compact` to further reduce the memory traffic of
+    the fused steps.
 
-            slit.set_params(H=8.)
-            slit.set_params(V=2.0)
-            slit.set_params(boundary='slip')
-            slit.set_params(H=5, V=0., boundary='no_slip')
+    Example::
 
-        """
+        solvent = hoomd.mpcd.Solvent(N=int(5 * box.volume), kT=1.0)
+        integrator = hoomd.mpcd.Integrator(
+            dt=0.1,
+            solvent=solvent,
+            streaming_method=hoomd.mpcd.stream.Bulk(period=1),
+            collision_method=hoomd.mpcd.collide.SRD(period=1, angle=130),
+            sorter=hoomd.mpcd.update.Sorter(period=25),
+            fused=True)
+        sim.operations.integrator = integrator
 
-        if H is not None:
-            self.H = H
+    Attributes:
+        dt (float): Integrator time step size :math:`[\\mathrm{time}]`.
 
-        if V is not None:
-            self.V = V
+        solvent (`hoomd.mpcd.Solvent`): MPCD solvent particles (read only).
 
-        if boundary is not None:
-            self.boundary = boundary
+        streaming_method (`hoomd.mpcd.stream.StreamingMethod`): Method that
+            streams the MPCD particles (read only).
 
-        bc = self._process_boundary(self.boundary)
-        self.cpp_method.geometry = _mpcd.SlitGeometry(self.H,self.V,bc)
+        collision_method (`hoomd.mpcd.collide.CollisionMethod`): Method that
+            collides the MPCD particles (read only).
 
-class slit_pore(_bounce_back):
-    """ NVE integration with bounce-back rules in a slit pore channel.
+        sorter (`hoomd.mpcd.update.Sorter`): Sorter for the MPCD particles
+            (read only).
 
-    Args:
-        group (``hoomd.group``): Group of particles on which to apply this method.
-        H (float): channel half-width.
-        L (float): pore half-length.
-        boundary : 'slip' or 'no_slip' boundary condition at wall (default: 'no_slip')
+        aniso (str): Whether rotational degrees of freedom are integrated.
 
-    This integration method applies to particles in *group* in the parallel-plate (slit) pore geometry.
-    This method is the MD analog of :py:class:`.stream.slit_pore`, which documents additional details
-    about the geometry.
+        forces (List[hoomd.md.force.Force]): List of forces applied to the MD
+            particles.
 
-    Examples::
+        constraints (List[hoomd.md.constrain.ConstraintForce]): List of
+            constraint forces applied to the MD particles.
 
-        all = group.all()
-        slit_pore = mpcd.integrate.slit_pore(group=all, H=10.0, L=10.)
-
-    .. versionadded:: 2.7
+        methods (List[hoomd.md.methods._Method]): List of integration methods
+            of the MD particles.
 
+        fused (bool): When True, stream and collide the MPCD particles in one
+            fused step where possible.
     """
-    def __init__(self, group, H, L, boundary="no_slip"):
-        # initialize base class
-        _bounce_back.__init__(self,group)
-        self.metadata_fields += ['H','L']
-
-        # initialize the c++ class
-        if not hoomd.context.current.device.mode == 'gpu':
-            cpp_class = _mpcd.BounceBackNVESlitPore
-        else:
-            cpp_class = _mpcd.BounceBackNVESlitPoreGPU
-
-        self.H = H
-        self.L = L
-        self.boundary = boundary
-
-        bc = self._process_boundary(boundary)
-        geom = _mpcd.SlitPoreGeometry(H, L, bc)
-
-        self.cpp_method = cpp_class(hoomd.context.current.system_definition, group.cpp_group, geom)
-        self.cpp_method.validateGroup()
-
-    def set_params(self, H=None, L=None, boundary=None):
-        """ Set parameters for the slit pore geometry.
-
-        Args:
-            H (float): channel half-width.
-            L (float): pore half-length.
-            boundary : 'slip' or 'no_slip' boundary condition at wall (default: 'no_slip')
-
-        Examples::
-
-            slit_pore.set_params(H=8.)
-            slit_pore.set_params(L=2.0)
-            slit_pore.set_params(boundary='slip')
-            slit_pore.set_params(H=5, L=4., boundary='no_slip')
-
-        """
-        if H is not None:
-            self.H = H
-
-        if L is not None:
-            self.L = L
-
-        if boundary is not None:
-            self.boundary = boundary
 
-        bc = self._process_boundary(self.boundary)
-        self.cpp_method.geometry = _mpcd.SlitPoreGeometry(self.H,self.L,bc)
+    def __init__(self,
+                 dt,
+                 solvent,
+                 streaming_method=None,
+                 collision_method=None,
+                 sorter=None,
+                 aniso='auto',
+                 forces=None,
+                 constraints=None,
+                 methods=None,
+                 fused=False):
+
+        super().__init__(forces, constraints, methods)
+
+        self._solvent = OnlyTypes(Solvent)(solvent)
+        self._streaming_method = OnlyTypes(StreamingMethod,
+                                           allow_none=True)(streaming_method)
+        self._collision_method = OnlyTypes(CollisionMethod,
+                                           allow_none=True)(collision_method)
+        self._sorter = OnlyTypes(Sorter, allow_none=True)(sorter)
+        self._cpp_sys_data = None
+
+        self._param_dict = ParameterDict(
+            dt=float(dt),
+            aniso=OnlyFrom(['true', 'false', 'auto'],
+                           preprocess=_preprocess_aniso),
+            fused=bool(fused),
+            _defaults=dict(aniso="auto"))
+        if aniso is not None:
+            self.aniso = aniso
+
+    def _attach(self):
+        stream = self._streaming_method
+        collide = self._collision_method
+        if (stream is not None and collide is not None
+                and collide.period % stream.period != 0):
+            raise ValueError("The MPCD collision period ({}) must be a "
+                             "multiple of the streaming period ({}).".format(
+                                 collide.period, stream.period))
+
+        sim = self._simulation
+        self._cpp_sys_data = self._solvent._attach(sim)
+        self._cpp_obj = _mpcd.Integrator(self._cpp_sys_data, self.dt)
+
+        if sim._system_communicator is not None:
+            if isinstance(sim.device, hoomd.device.CPU):
+                comm_cls = _mpcd.Communicator
+            else:
+                comm_cls = _mpcd.CommunicatorGPU
+            self._cpp_obj.setMPCDCommunicator(comm_cls(self._cpp_sys_data))
+
+        for child in (stream, collide, self._sorter):
+            if child is None:
+                continue
+            child._add(sim)
+            child._attach()
+        if stream is not None:
+            self._cpp_obj.setStreamingMethod(stream._cpp_obj)
+        if collide is not None:
+            self._cpp_obj.setCollisionMethod(collide._cpp_obj)
+        if self._sorter is not None:
+            self._cpp_obj.setSorter(self._sorter._cpp_obj)
+
+        super()._attach()
+
+    def _detach(self):
+        for child in (self._streaming_method, self._collision_method,
+                      self._sorter):
+            if child is not None:
+                child._detach()
+        self._solvent._detach()
+        self._cpp_sys_data = None
+        super()._detach()
+
+    @property
+    def solvent(self):
+        return self._solvent
+
+    @property
+    def streaming_method(self):
+        return self._streaming_method
+
+    @property
+    def collision_method(self):
+        return self._collision_method
+
+    @property
+    def sorter(self):
+        return self._sorter
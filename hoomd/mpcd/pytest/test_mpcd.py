@@ -0,0 +1,136 @@
+import hoomd
+import hoomd.mpcd
+import pytest
+
+
+def _make_integrator(fused=False,
+                     kT=None,
+                     stream_period=1,
+                     collide_period=1,
+                     sorter=None):
+    if sorter is None:
+        sorter = hoomd.mpcd.update.Sorter(period=5)
+    return hoomd.mpcd.Integrator(
+        dt=0.1,
+        solvent=hoomd.mpcd.Solvent(N=1000, kT=1.0),
+        streaming_method=hoomd.mpcd.stream.Bulk(period=stream_period),
+        collision_method=hoomd.mpcd.collide.SRD(period=collide_period,
+                                                angle=130,
+                                                kT=kT),
+        sorter=sorter,
+        fused=fused)
+
+
+def test_attributes():
+    integrator = _make_integrator(kT=1.5)
+
+    assert integrator.dt == pytest.approx(0.1)
+    assert integrator.fused is False
+    assert integrator.solvent.N == 1000
+    assert integrator.solvent.mass == pytest.approx(1.0)
+    assert integrator.solvent.cell_size == pytest.approx(1.0)
+    assert integrator.solvent.compact is False
+    assert integrator.streaming_method.period == 1
+    assert integrator.collision_method.period == 1
+    assert integrator.collision_method.angle == pytest.approx(130)
+    assert integrator.collision_method.shift is True
+    assert integrator.collision_method.embed is None
+    assert integrator.collision_method.kT(0) == pytest.approx(1.5)
+    assert integrator.sorter.period == 5
+    assert integrator.sorter.adaptive is False
+
+
+@pytest.mark.parametrize("fused", [False, True])
+def test_attach_detach(simulation_factory, two_particle_snapshot_factory,
+                       fused):
+    sim = simulation_factory(two_particle_snapshot_factory(L=10))
+    integrator = _make_integrator(fused=fused, kT=1.5)
+    integrator.methods.append(hoomd.md.methods.NVE(hoomd.filter.All()))
+    integrator.collision_method.embed = hoomd.filter.All()
+    sim.operations.integrator = integrator
+    sim.run(10)
+
+    assert integrator.fused is fused
+    assert integrator.solvent.N == 1000
+    assert integrator.collision_method.angle == pytest.approx(130)
+    assert integrator.collision_method.kT(0) == pytest.approx(1.5)
+
+    integrator.fused = not fused
+    integrator.collision_method.angle = 90
+    integrator.collision_method.kT = None
+    integrator.solvent.cell_size = 2.0
+    sim.run(10)
+
+    assert integrator.fused is not fused
+    assert integrator.collision_method.angle == pytest.approx(90)
+    assert integrator.collision_method.kT is None
+    assert integrator.solvent.cell_size == pytest.approx(2.0)
+
+    with pytest.raises(AttributeError):
+        integrator.collision_method.period = 2
+
+    sim.operations.integrator = None
+    assert integrator.collision_method.angle == pytest.approx(90)
+    assert integrator.solvent.cell_size == pytest.approx(2.0)
+
+
+def test_at(simulation_factory, two_particle_snapshot_factory):
+    sim = simulation_factory(two_particle_snapshot_factory(L=10))
+    integrator = hoomd.mpcd.Integrator(
+        dt=0.1,
+        solvent=hoomd.mpcd.Solvent(N=1000, kT=1.0),
+        streaming_method=hoomd.mpcd.stream.Bulk(period=1),
+        collision_method=hoomd.mpcd.collide.AT(period=1, kT=1.0),
+        fused=True)
+    sim.operations.integrator = integrator
+    sim.run(10)
+
+    assert integrator.collision_method.kT(0) == pytest.approx(1.0)
+
+
+def test_compact(simulation_factory, two_particle_snapshot_factory):
+    sim = simulation_factory(two_particle_snapshot_factory(L=10))
+    integrator = _make_integrator(fused=True, kT=1.0)
+    integrator.solvent.compact = True
+    sim.operations.integrator = integrator
+    sim.run(10)
+    assert integrator.solvent.compact is True
+
+    integrator.solvent.compact = False
+    sim.run(10)
+    assert integrator.solvent.compact is False
+
+    sim.operations.integrator = None
+    assert integrator.solvent.compact is False
+
+
+def test_period_mismatch(simulation_factory, two_particle_snapshot_factory):
+    sim = simulation_factory(two_particle_snapshot_factory(L=10))
+    sim.operations.integrator = _make_integrator(stream_period=2,
+                                                 collide_period=3)
+    with pytest.raises(ValueError):
+        sim.run(0)
+
+
+def test_adaptive_sorter(simulation_factory, two_particle_snapshot_factory):
+    sim = simulation_factory(two_particle_snapshot_factory(L=10))
+    integrator = _make_integrator(
+        sorter=hoomd.mpcd.update.Sorter(period=2, adaptive=True))
+    sim.operations.integrator = integrator
+    assert integrator.sorter.sort_interval is None
+
+    # the first candidate step sorts and no sort cycle is complete yet
+    sim.run(1)
+    assert integrator.sorter.adaptive is True
+    assert integrator.sorter.sort_interval == 0
+
+    # the sorter only sorts on multiples of the period, and at least every
+    # 1000 candidate steps
+    sim.run(2100)
+    interval = integrator.sorter.sort_interval
+    assert 2 <= interval <= 2000
+    assert interval % 2 == 0
+
+    integrator.sorter.adaptive = False
+    sim.run(2)
+    assert integrator.sorter.adaptive is False
@@ -329,6 +329,71 @@ void sorter_virtual_test(std::shared_ptr<ExecutionConfiguration> exec_conf)
         }
     }
 
+//! Test that the MPCD sorter keeps particles in the compact layout
+void sorter_compact_test(std::shared_ptr<ExecutionConfiguration> exec_conf)
+    {
+    std::shared_ptr< SnapshotSystemData<Scalar> > snap( new SnapshotSystemData<Scalar>() );
+    snap->global_box = BoxDim(2.0);
+    snap->particle_data.type_mapping.push_back("A");
+    std::shared_ptr<SystemDefinition> sysdef(new SystemDefinition(snap, exec_conf));
+
+    // place eight mpcd particles, one per cell, in reverse order
+    auto mpcd_sys_snap = std::make_shared<mpcd::SystemDataSnapshot>(sysdef);
+        {
+        auto mpcd_snap = mpcd_sys_snap->particles;
+        mpcd_snap->type_mapping.push_back("M");
+        mpcd_snap->type_mapping.push_back("P");
+
+        mpcd_snap->resize(8);
+        for (unsigned int i=0; i < 8; ++i)
+            {
+            const unsigned int cell = 7 - i;
+            mpcd_snap->position[i] = vec3<Scalar>(-0.5 + (cell & 1), -0.5 + ((cell >> 1) & 1), -0.5 + ((cell >> 2) & 1));
+            mpcd_snap->velocity[i] = vec3<Scalar>(cell, -0.5*cell, 0.25*cell);
+            mpcd_snap->type[i] = cell % 2;
+            }
+        }
+    auto mpcd_sys = std::make_shared<mpcd::SystemData>(mpcd_sys_snap);
+    std::shared_ptr<mpcd::ParticleData> pdata = mpcd_sys->getParticleData();
+
+    // convert to the compact layout on the cell list grid
+    pdata->setCompactStorage(true);
+    auto cl = mpcd_sys->getCellList();
+    cl->computeDimensions();
+    UP_ASSERT(pdata->compact(sysdef->getParticleData()->getGlobalBox().getLo(), cl->getCellSize(), cl->getDim()));
+
+    // run the sorter
+    std::shared_ptr<mpcd::Sorter> sorter = std::make_shared<mpcd::Sorter>(mpcd_sys,0,1);
+    sorter->update(0);
+    UP_ASSERT(pdata->isCompact());
+
+    // check that all particles are properly ordered
+        {
+        ArrayHandle<unsigned int> h_tag(pdata->getTags(), access_location::host, access_mode::read);
+        ArrayHandle<unsigned int> h_cell(pdata->getCompactCells(), access_location::host, access_mode::read);
+        for (unsigned int i=0; i < 8; ++i)
+            {
+            UP_ASSERT_EQUAL(h_tag.data[i], 7 - i);
+            UP_ASSERT_EQUAL(h_cell.data[i], i);
+            }
+        }
+
+    // the sorted data is unchanged when it is converted back
+    ArrayHandle<Scalar4> h_pos(pdata->getPositions(), access_location::host, access_mode::read);
+    ArrayHandle<Scalar4> h_vel(pdata->getVelocities(), access_location::host, access_mode::read);
+    UP_ASSERT(!pdata->isCompact());
+    for (unsigned int i=0; i < 8; ++i)
+        {
+        CHECK_CLOSE(h_pos.data[i].x, -0.5 + (i & 1), tol);
+        CHECK_CLOSE(h_pos.data[i].y, -0.5 + ((i >> 1) & 1), tol);
+        CHECK_CLOSE(h_pos.data[i].z, -0.5 + ((i >> 2) & 1), tol);
+        UP_ASSERT_EQUAL(__scalar_as_int(h_pos.data[i].w), (int)(i % 2));
+        CHECK_CLOSE(h_vel.data[i].x, Scalar(i), tol);
+        CHECK_CLOSE(h_vel.data[i].y, -0.5*i, tol);
+        CHECK_CLOSE(h_vel.data[i].z, 0.25*i, tol);
+        }
+    }
+
 //! basic test case for MPCD sorter
 UP_TEST( mpcd_sorter_test )
     {
@@ -339,6 +404,11 @@ UP_TEST( mpcd_sorter_virtual_test )
     {
     sorter_virtual_test<mpcd::Sorter>(std::shared_ptr<ExecutionConfiguration>(new ExecutionConfiguration(ExecutionConfiguration::CPU)));
     }
+//! test case for MPCD sorter with the compact layout
+UP_TEST( mpcd_sorter_compact_test )
+    {
+    sorter_compact_test(std::shared_ptr<ExecutionConfiguration>(new ExecutionConfiguration(ExecutionConfiguration::CPU)));
+    }
 #ifdef ENABLE_HIP
 UP_TEST( mpcd_sorter_test_gpu )
     {
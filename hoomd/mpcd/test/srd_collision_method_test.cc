@@ -5,6 +5,7 @@
 
 #include "utils.h"
 #include "hoomd/mpcd/SRDCollisionMethod.h"
+#include "hoomd/mpcd/ConfinedStreamingMethod.h"
 #ifdef ENABLE_HIP
 #include "hoomd/mpcd/SRDCollisionMethodGPU.h"
 #endif // ENABLE_HIP
@@ -368,6 +369,116 @@ void srd_collision_method_thermostat_test(std::shared_ptr<ExecutionConfiguration
         }
     }
 
+//! Test that the fused collision and streaming gives the same result as the separate steps
+void srd_collision_method_fused_test(std::shared_ptr<ExecutionConfiguration> exec_conf)
+    {
+    const BoxDim box(10.0);
+    std::shared_ptr<mpcd::SystemData> mpcd_sys[2];
+    std::shared_ptr<mpcd::SRDCollisionMethod> collide[2];
+    for (unsigned int i=0; i < 2; ++i)
+        {
+        auto sysdef = std::make_shared<::SystemDefinition>(0, box, 1, 0, 0, 0, 0, exec_conf);
+        auto pdata = std::make_shared<mpcd::ParticleData>(5000, box, 1.0, 42, 3, exec_conf);
+        mpcd_sys[i] = std::make_shared<mpcd::SystemData>(sysdef, pdata);
+
+        auto thermo = std::make_shared<mpcd::CellThermoCompute>(mpcd_sys[i]);
+        collide[i] = std::make_shared<mpcd::SRDCollisionMethod>(mpcd_sys[i], 0, 1, -1, 827, thermo);
+        collide[i]->setRotationAngle(2.2689280275926285);
+        collide[i]->setTemperature(std::make_shared<::VariantConstant>(1.5));
+        }
+    typedef mpcd::ConfinedStreamingMethod<mpcd::detail::BulkGeometry> stream_method;
+    auto stream = std::make_shared<stream_method>(mpcd_sys[0], 0, 1, -1, std::make_shared<const mpcd::detail::BulkGeometry>());
+    stream->setDeltaT(0.1);
+    UP_ASSERT(stream->isUnconfined());
+
+    for (uint64_t timestep=0; timestep < 5; ++timestep)
+        {
+        collide[0]->collide(timestep);
+        stream->stream(timestep);
+        UP_ASSERT(collide[1]->collideAndStream(timestep, 0.1));
+        }
+
+    auto pdata_0 = mpcd_sys[0]->getParticleData();
+    auto pdata_1 = mpcd_sys[1]->getParticleData();
+    ArrayHandle<Scalar4> h_pos_0(pdata_0->getPositions(), access_location::host, access_mode::read);
+    ArrayHandle<Scalar4> h_vel_0(pdata_0->getVelocities(), access_location::host, access_mode::read);
+    ArrayHandle<Scalar4> h_pos_1(pdata_1->getPositions(), access_location::host, access_mode::read);
+    ArrayHandle<Scalar4> h_vel_1(pdata_1->getVelocities(), access_location::host, access_mode::read);
+    for (unsigned int i=0; i < pdata_0->getN(); ++i)
+        {
+        CHECK_CLOSE(h_pos_1.data[i].x, h_pos_0.data[i].x, tol_small);
+        CHECK_CLOSE(h_pos_1.data[i].y, h_pos_0.data[i].y, tol_small);
+        CHECK_CLOSE(h_pos_1.data[i].z, h_pos_0.data[i].z, tol_small);
+        CHECK_CLOSE(h_vel_1.data[i].x, h_vel_0.data[i].x, tol_small);
+        CHECK_CLOSE(h_vel_1.data[i].y, h_vel_0.data[i].y, tol_small);
+        CHECK_CLOSE(h_vel_1.data[i].z, h_vel_0.data[i].z, tol_small);
+        }
+    }
+
+//! Test that the fused collision and streaming in the compact layout matches the full layout
+void srd_collision_method_fused_compact_test(std::shared_ptr<ExecutionConfiguration> exec_conf)
+    {
+    const BoxDim box(10.0);
+    std::shared_ptr<mpcd::SystemData> mpcd_sys[2];
+    std::shared_ptr<mpcd::SRDCollisionMethod> collide[2];
+    for (unsigned int i=0; i < 2; ++i)
+        {
+        auto sysdef = std::make_shared<::SystemDefinition>(0, box, 1, 0, 0, 0, 0, exec_conf);
+        auto pdata = std::make_shared<mpcd::ParticleData>(5000, box, 1.0, 42, 3, exec_conf);
+        mpcd_sys[i] = std::make_shared<mpcd::SystemData>(sysdef, pdata);
+
+        auto thermo = std::make_shared<mpcd::CellThermoCompute>(mpcd_sys[i]);
+        collide[i] = std::make_shared<mpcd::SRDCollisionMethod>(mpcd_sys[i], 0, 1, -1, 827, thermo);
+        collide[i]->setRotationAngle(2.2689280275926285);
+        collide[i]->setTemperature(std::make_shared<::VariantConstant>(1.5));
+        }
+    auto pdata_0 = mpcd_sys[0]->getParticleData();
+    auto pdata_1 = mpcd_sys[1]->getParticleData();
+    pdata_1->setCompactStorage(true);
+
+    // converting to the compact layout and back only quantizes the positions and velocities
+        {
+        auto cl = mpcd_sys[1]->getCellList();
+        cl->computeDimensions();
+        UP_ASSERT(pdata_1->compact(box.getLo(), cl->getCellSize(), cl->getDim()));
+        UP_ASSERT(pdata_1->isCompact());
+
+        ArrayHandle<Scalar4> h_pos_0(pdata_0->getPositions(), access_location::host, access_mode::read);
+        ArrayHandle<Scalar4> h_vel_0(pdata_0->getVelocities(), access_location::host, access_mode::read);
+        ArrayHandle<Scalar4> h_pos_1(pdata_1->getPositions(), access_location::host, access_mode::read);
+        ArrayHandle<Scalar4> h_vel_1(pdata_1->getVelocities(), access_location::host, access_mode::read);
+        UP_ASSERT(!pdata_1->isCompact());
+        for (unsigned int i=0; i < pdata_0->getN(); ++i)
+            {
+            CHECK_CLOSE(h_pos_1.data[i].x, h_pos_0.data[i].x, tol);
+            CHECK_CLOSE(h_pos_1.data[i].y, h_pos_0.data[i].y, tol);
+            CHECK_CLOSE(h_pos_1.data[i].z, h_pos_0.data[i].z, tol);
+            UP_ASSERT_EQUAL(__scalar_as_int(h_pos_1.data[i].w), __scalar_as_int(h_pos_0.data[i].w));
+            CHECK_CLOSE(h_vel_1.data[i].x, h_vel_0.data[i].x, tol);
+            CHECK_CLOSE(h_vel_1.data[i].y, h_vel_0.data[i].y, tol);
+            CHECK_CLOSE(h_vel_1.data[i].z, h_vel_0.data[i].z, tol);
+            }
+        }
+
+    UP_ASSERT(collide[0]->collideAndStream(0, 0.1));
+    UP_ASSERT(collide[1]->collideAndStream(0, 0.1));
+    UP_ASSERT(pdata_1->isCompact());
+
+    ArrayHandle<Scalar4> h_pos_0(pdata_0->getPositions(), access_location::host, access_mode::read);
+    ArrayHandle<Scalar4> h_vel_0(pdata_0->getVelocities(), access_location::host, access_mode::read);
+    ArrayHandle<Scalar4> h_pos_1(pdata_1->getPositions(), access_location::host, access_mode::read);
+    ArrayHandle<Scalar4> h_vel_1(pdata_1->getVelocities(), access_location::host, access_mode::read);
+    for (unsigned int i=0; i < pdata_0->getN(); ++i)
+        {
+        CHECK_CLOSE(h_pos_1.data[i].x, h_pos_0.data[i].x, tol);
+        CHECK_CLOSE(h_pos_1.data[i].y, h_pos_0.data[i].y, tol);
+        CHECK_CLOSE(h_pos_1.data[i].z, h_pos_0.data[i].z, tol);
+        CHECK_CLOSE(h_vel_1.data[i].x, h_vel_0.data[i].x, tol);
+        CHECK_CLOSE(h_vel_1.data[i].y, h_vel_0.data[i].y, tol);
+        CHECK_CLOSE(h_vel_1.data[i].z, h_vel_0.data[i].z, tol);
+        }
+    }
+
 //! basic test case for MPCD SRDCollisionMethod class
 UP_TEST( srd_collision_method_basic )
     {
@@ -387,6 +498,16 @@ UP_TEST( srd_collision_method_thermostat )
     {
     srd_collision_method_thermostat_test<mpcd::SRDCollisionMethod>(std::make_shared<ExecutionConfiguration>(ExecutionConfiguration::CPU));
     }
+//! test that the fused collision and streaming matches the separate steps
+UP_TEST( srd_collision_method_fused )
+    {
+    srd_collision_method_fused_test(std::make_shared<ExecutionConfiguration>(ExecutionConfiguration::CPU));
+    }
+//! test that the fused collision and streaming in the compact layout matches the full layout
+UP_TEST( srd_collision_method_fused_compact )
+    {
+    srd_collision_method_fused_compact_test(std::make_shared<ExecutionConfiguration>(ExecutionConfiguration::CPU));
+    }
 #ifdef ENABLE_HIP
 //! basic test case for MPCD SRDCollisionMethodGPU class
 UP_TEST( srd_collision_method_basic_gpu )
@@ -1,156 +1,78 @@
 # Copyright (c) 2009-2021 The Regents of the University of Michigan
-# This file is part of the HOOMD-blue project, released under the BSD 3-Clause License.
+# This file is part of the HOOMD-blue project, released under the BSD 3-Clause
+# License.
 
 # Maintainer: mphoward
 
-R""" MPCD particle updaters
-
-Updates properties of MPCD particles.
-
-"""
+"""MPCD particle updaters."""
 
 import hoomd
-from hoomd.md import _md
+from hoomd.operation import _HOOMDBaseObject
+from hoomd.data.parameterdicts import ParameterDict
+from hoomd.logging import log
+from hoomd.mpcd import _mpcd
 
-from . import _mpcd
 
-class sort():
-    R""" Sorts MPCD particles in memory to improve cache coherency.
+class Sorter(_HOOMDBaseObject):
+    """Sort MPCD particles in memory to improve cache coherency.
 
     Args:
-        system (:py:class:`hoomd.mpcd.data.system`): MPCD system to create sorter for
-        period (int): Sort whenever the timestep is a multiple of *period*.
-            .. versionadded:: 2.6
+        period (int): Sort whenever the time step is a multiple of *period*.
+        adaptive (bool): When True, sort only on the multiples of *period*
+            that minimize the average time per step.
 
-    Warning:
-        Do not create :py:class:`hoomd.mpcd.update.sort` explicitly in your script.
-        HOOMD creates a sorter by default.
+    Every *period* time steps, `Sorter` reorders the MPCD particles in memory
+    based on the cell list of the current time step. Sorting can significantly
+    improve the performance of all other cell-based steps of the MPCD
+    algorithm. The *period* should be no smaller than the MPCD collision
+    period, or unnecessary cell list builds will occur.
 
-    Every *period* time steps, particles are reordered in memory based on
-    the cell list generated at the current timestep. Sorting can significantly improve
-    performance of all other cell-based steps of the MPCD algorithm. The efficiency of
-    the sort operation obviously depends on the number of particles, and so the *period*
-    should be tuned to give the maximum performance.
+    With *adaptive*, the sorter measures the time per step and chooses on which
+    multiples of *period* to sort, instead of sorting on every one of them.
+    Sorting happens when the time per step first exceeds the time per step
+    averaged since the last sort (including the sort itself), which minimizes
+    that average. Set *period* to the collision period in this mode.
 
-    Note:
-        The *period* should be no smaller than the MPCD collision period, or unnecessary
-        cell list builds will occur.
+    Example::
 
-    Essentially all MPCD systems benefit from sorting, and so a sorter is created by
-    default with the MPCD system. To disable it or modify parameters, save the system
-    and access the sorter through it::
+        sorter = hoomd.mpcd.update.Sorter(period=25)
+        sorter = hoomd.mpcd.update.Sorter(period=1, adaptive=True)
 
-        s = mpcd.init.read_snapshot(snap)
-        # the sorter is only available after initialization
-        s.sorter.set_period(period=5)
-        s.sorter.disable()
+    Attributes:
+        period (int): Sort whenever the time step is a multiple of *period*.
+            The period cannot be changed after the simulation is scheduled.
 
+        adaptive (bool): When True, sort only on the multiples of *period*
+            that minimize the average time per step.
     """
 
-    def __init__(self, system, period=50):
+    def __init__(self, period=50, adaptive=False):
+        params = ParameterDict(period=int(period), adaptive=bool(adaptive))
+        self._param_dict.update(params)
 
-        # check for mpcd initialization
-        if system.sorter is not None:
-            hoomd.context.current.device.cpp_msg.error('mpcd.update: system already has a sorter created!\n')
-            raise RuntimeError('MPCD sorter already created')
-
-        # create the c++ mirror class
-        if not hoomd.context.current.device.cpp_exec_conf.isCUDAEnabled():
-            cpp_class = _mpcd.Sorter
+    def _attach(self):
+        sim = self._simulation
+        if isinstance(sim.device, hoomd.device.CPU):
+            cls = _mpcd.Sorter
         else:
-            cpp_class = _mpcd.SorterGPU
-        self._cpp = cpp_class(system.data, hoomd.context.current.system.getCurrentTimeStep(), period)
-
-        self.period = period
-        self.enabled = True
-
-    def disable(self):
-        self.enabled = False
-
-    def enable(self):
-        self.enabled = True
-
-    def set_period(self, period):
-        """ Change the sorting period.
-
-        Args:
-            period (int): New period to set.
-
-        Examples::
-
-            sorter.set_period(100)
-            sorter.set_period(1)
-
-        While the simulation is running, the action of each updater
-        is executed every *period* time steps. Changing the period does
-        not change the phase set when the analyzer was first created.
-
-        """
-
-        self.period = period
-        self._cpp.setPeriod(hoomd.context.current.system.getCurrentTimeStep(), self.period)
-
-    def tune(self, start, stop, step, tsteps, quiet=False):
-        """ Tune the sorting period.
-
-        Args:
-            start (int): Start of tuning interval to scan (inclusive).
-            stop (int): End of tuning interval to scan (inclusive).
-            step (int): Spacing between tuning points.
-            tsteps (int): Number of timesteps to run at each tuning point.
-            quiet (bool): Quiet the individual run calls.
-
-        Returns:
-            int: The optimal sorting period from the scanned range.
-
-        The optimal sorting period for the MPCD particles is determined from
-        a sequence of short runs. The sorting period is first set to *start*.
-        The TPS value is determined for a run of length *tsteps*. This run is
-        repeated 3 times, and the median TPS of the runs is saved. The sorting
-        period is then incremented by *step*, and the process is repeated until
-        *stop* is reached. The period giving the fastest TPS is determined, and
-        the sorter period is updated to this value. The results of the scan
-        are also reported as output, and the fastest sorting period is also
-        returned.
-
-        Note:
-            A short warmup run is **required** before calling :py:meth:`tune()`
-            in order to ensure the runtime autotuners have found optimal
-            kernel launch parameters.
-
-        Examples::
-
-            # warmup run
-            hoomd.run(5000)
-
-            # tune sorting period
-            sorter.tune(start=5, stop=50, step=5, tsteps=1000)
-
-        """
-
-        # scan through range of sorting periods and log TPS
-        periods = range(start, stop+1, step)
-        tps = []
-        for p in periods:
-            cur_tps = []
-            self.set_period(period=p)
-            for i in range(0,3):
-                hoomd.run(tsteps, quiet=quiet)
-                cur_tps.append(hoomd.context.current.system.getLastTPS())
-
-            # save the median tps
-            cur_tps.sort()
-            tps.append(cur_tps[1])
-
-        # determine fastest period and set it on the sorter
-        fastest = tps.index(max(tps))
-        opt_period = periods[fastest]
-        self.set_period(period=opt_period)
-
-        # output results
-        hoomd.context.current.device.cpp_msg.notice(2, '--- sort.tune() statistics\n')
-        hoomd.context.current.device.cpp_msg.notice(2, 'Optimal period = {0}\n'.format(opt_period))
-        hoomd.context.current.device.cpp_msg.notice(2, '        period = ' + str(periods) + '\n')
-        hoomd.context.current.device.cpp_msg.notice(2, '          TPS  = ' + str(tps) + '\n')
-
-        return opt_period
+            cls = _mpcd.SorterGPU
+        self._cpp_obj = cls(sim.operations.integrator._cpp_sys_data,
+                            sim.timestep, self.period)
+        # the sorter is not a compute, so there is no communicator to set and
+        # nothing to notify when detaching
+        self._apply_param_dict()
+
+    def _detach(self):
+        if self._attached:
+            self._update_param_dict()
+            self._cpp_obj = None
+            self._notify_disconnect(self._simulation)
+            return self
+
+    @log(default=False)
+    def sort_interval(self):
+        """int: Number of time steps between the last two adaptive sorts."""
+        if self._attached:
+            return self._cpp_obj.sort_interval
+        else:
+            return None
@@ -1,7 +1,8 @@
+import math
 import pytest
 
 from hoomd.tune.attr_tuner import (
-    ManualTuneDefinition, ScaleSolver, SecantSolver)
+    ManualTuneDefinition, ScaleSolver, SecantSolver, ScaleOptimizer)
 
 
 @pytest.fixture
@@ -127,3 +128,39 @@ class TestSolvers:
         assert abs(err) <= solver.tol
         assert any(abs(equation_definition.x - sol) <= 1e-3
                    for sol in solutions)
+
+
+@pytest.fixture
+def maximum_definition():
+    """-(ln x - ln 2)^2, maximum at x = 2"""
+    equation = dict(x=0.5)
+    return ManualTuneDefinition(
+        get_x=lambda: equation['x'],
+        set_x=lambda x: equation.__setitem__('x', x),
+        get_y=lambda: -(math.log(equation['x']) - math.log(2))**2,
+        target=None,
+        domain=(1e-3, 10)
+        )
+
+
+class TestScaleOptimizer:
+    def test_optimizing(self, maximum_definition):
+        optimizer = ScaleOptimizer()
+        cnt = 0
+        while not optimizer.solve([maximum_definition]):
+            cnt += 1
+            if cnt >= 500:
+                raise RuntimeError("Expected conversion earlier.")
+        assert abs(maximum_definition.x - 2) <= 0.05
+
+    def test_domain(self, maximum_definition):
+        maximum_definition.domain = (1e-3, 1)
+        optimizer = ScaleOptimizer()
+        for i in range(100):
+            optimizer.solve([maximum_definition])
+        assert maximum_definition.x <= 1
+        assert abs(maximum_definition.x - 1) <= 0.05
+
+    def test_invalid_scale(self):
+        with pytest.raises(ValueError):
+            ScaleOptimizer(scale=0.9)
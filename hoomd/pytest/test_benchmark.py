@@ -0,0 +1,77 @@
+import json
+
+import hoomd
+import hoomd.benchmark
+import pytest
+
+_benchmarks = []
+if hasattr(hoomd.benchmark, 'LJLiquid'):
+    _benchmarks += [hoomd.benchmark.LJLiquid, hoomd.benchmark.PolymerMelt]
+if hasattr(hoomd.benchmark, 'HardSpheres'):
+    _benchmarks += [hoomd.benchmark.HardSpheres, hoomd.benchmark.HardPolyhedra]
+
+
+@pytest.mark.parametrize('cls', _benchmarks)
+def test_execute(device, cls):
+    benchmark = cls(device,
+                    N=100,
+                    warmup_steps=10,
+                    benchmark_steps=10,
+                    repeat=3)
+    result = benchmark.execute()
+
+    # the lattice is rounded up to 5**3 sites
+    assert result['benchmark'] == cls.__name__
+    assert result['N'] == 125
+    assert len(result['tps']) == 3
+    assert all(tps > 0 for tps in result['tps'])
+    assert result['tps_mean'] > 0
+    assert result['num_ranks'] == device.communicator.num_ranks
+    assert result['version'] == hoomd.version.version
+
+
+def test_srd_fluid(device):
+    if not hasattr(hoomd.benchmark, 'SRDFluid'):
+        pytest.skip('The MPCD component is not built.')
+
+    benchmark = hoomd.benchmark.SRDFluid(device,
+                                         N=100,
+                                         density=5,
+                                         warmup_steps=10,
+                                         benchmark_steps=10,
+                                         repeat=3)
+    result = benchmark.execute()
+
+    # 100 / 5 cells are rounded up to 3**3 cells with 5 particles each
+    assert result['benchmark'] == 'SRDFluid'
+    assert result['N'] == 135
+    assert len(result['tps']) == 3
+    assert all(tps > 0 for tps in result['tps'])
+
+
+def test_lattice_snapshot(device):
+    snap, n = hoomd.benchmark.lattice_snapshot(device, N=30, spacing=2.0)
+    assert n == 4
+    if snap.exists:
+        assert snap.particles.N == 64
+        assert snap.configuration.box[:3] == (8.0, 8.0, 8.0)
+        assert snap.particles.position.min() == pytest.approx(-3.0)
+        assert snap.particles.position.max() == pytest.approx(3.0)
+
+
+def test_write_results(device, tmp_path):
+    if not hasattr(hoomd.benchmark, 'LJLiquid'):
+        pytest.skip('The MD component is not built.')
+
+    benchmark = hoomd.benchmark.LJLiquid(device,
+                                         N=64,
+                                         warmup_steps=0,
+                                         benchmark_steps=5,
+                                         repeat=2)
+    results = [benchmark.execute()]
+
+    if device.communicator.rank == 0:
+        filename = tmp_path / 'benchmarks.json'
+        hoomd.benchmark.write_results(results, filename)
+        with open(filename) as f:
+            assert json.load(f) == results
@@ -0,0 +1,106 @@
+import math
+
+import numpy as np
+import pytest
+
+import hoomd
+from hoomd.write.block_average import _Blocking
+
+
+def _offline_blocking(data):
+    """Blocking analysis of a stored time series."""
+    block = np.array(data)
+    n = []
+    error = []
+    while len(block) >= 2:
+        n.append(len(block))
+        error.append(math.sqrt(np.var(block) / (len(block) - 1)))
+        block = 0.5 * (block[1:] + block[:-1])[::2]
+    return np.array(n), np.array(error)
+
+
+def test_blocking_matches_offline():
+    rng = np.random.default_rng(3)
+    data = rng.normal(size=1000)
+
+    blocking = _Blocking()
+    for x in data:
+        blocking.add(x)
+
+    n, error, error_error = blocking.levels()
+    n_offline, error_offline = _offline_blocking(data)
+    np.testing.assert_array_equal(n, n_offline)
+    np.testing.assert_allclose(error, error_offline)
+    np.testing.assert_allclose(error_error, error / np.sqrt(2 * (n - 1)))
+
+    assert blocking.num_samples == 1000
+    assert blocking.mean == pytest.approx(np.mean(data))
+    assert blocking.variance == pytest.approx(np.var(data))
+
+    # the memory grows with the logarithm of the number of samples
+    assert len(blocking._n) == 10
+
+
+def test_blocking_correlated():
+    # an AR(1) process with coefficient phi has tau = (1 + phi) / (1 - phi) / 2
+    rng = np.random.default_rng(5)
+    phi = 0.9
+    x = 0
+    blocking = _Blocking()
+    uncorrelated = _Blocking()
+    for i in range(2**17):
+        x = phi * x + rng.normal()
+        blocking.add(x)
+        uncorrelated.add(rng.normal())
+
+    n, error, error_error = blocking.levels()
+    assert blocking.standard_error() > 3 * error[0]
+    assert blocking.autocorrelation_time() == pytest.approx(9.5, rel=0.25)
+    assert uncorrelated.autocorrelation_time() == pytest.approx(0.5, rel=0.25)
+
+
+def test_blocking_constant():
+    blocking = _Blocking()
+    for i in range(100):
+        blocking.add(2.0)
+    assert blocking.mean == 2.0
+    assert blocking.standard_error() == 0
+    assert blocking.autocorrelation_time() == 0.5
+
+
+def test_invalid_logger():
+    logger = hoomd.logging.Logger(categories=['scalar', 'sequence'])
+    with pytest.raises(ValueError):
+        hoomd.write.BlockAverage(1, logger)
+
+
+def test_block_average(simulation_factory, two_particle_snapshot_factory):
+    values = iter(range(1000))
+    logger = hoomd.logging.Logger(categories=['scalar'])
+    logger[('dummy', 'counter')] = (lambda: next(values), 'scalar')
+    logger[('dummy', 'constant')] = (lambda: 3.5, 'scalar')
+
+    block_average = hoomd.write.BlockAverage(1, logger)
+    sim = simulation_factory(two_particle_snapshot_factory())
+    sim.operations.writers.append(block_average)
+    sim.run(100)
+
+    assert block_average.quantities == ['dummy.counter', 'dummy.constant']
+    assert block_average.num_samples == 100
+    np.testing.assert_allclose(block_average.mean, [49.5, 3.5])
+    np.testing.assert_allclose(block_average.variance,
+                               [np.var(np.arange(100)), 0])
+    assert block_average.standard_error[1] == 0
+
+    if sim.device.communicator.rank == 0:
+        n, error, error_error = block_average.blocking('dummy.counter')
+        assert n[0] == 100
+
+    # the estimates are loggable
+    estimate_logger = hoomd.logging.Logger(categories=['sequence', 'strings'])
+    estimate_logger.add(block_average)
+    logged = estimate_logger.log()['hoomd']['write']['BlockAverage']
+    np.testing.assert_allclose(logged['mean'][0], [49.5, 3.5])
+
+    block_average.reset()
+    assert block_average.num_samples == 0
@@ -0,0 +1,131 @@
+import hoomd
+import numpy as np
+import pytest
+import uuid
+
+
+@pytest.fixture
+def shm_name():
+    return 'hoomd-test-' + uuid.uuid4().hex[:8]
+
+
+def test_attributes(shm_name):
+    writer = hoomd.write.SharedMemory(name=shm_name,
+                                      trigger=hoomd.trigger.Periodic(1))
+    assert writer.name == shm_name
+    assert writer.dynamic == ['position']
+    assert writer.n_frames == 4
+    assert writer.log is None
+    assert not writer.replace
+
+    with pytest.raises(ValueError):
+        hoomd.write.SharedMemory(name=shm_name,
+                                 trigger=hoomd.trigger.Periodic(1),
+                                 dynamic=['charge'])
+
+
+def test_read(simulation_factory, two_particle_snapshot_factory, shm_name):
+    sim = simulation_factory(two_particle_snapshot_factory(L=20))
+    logger = hoomd.logging.Logger(categories=['scalar'])
+    logger[('sim', 'timestep')] = (lambda: sim.timestep, 'scalar')
+    writer = hoomd.write.SharedMemory(name=shm_name,
+                                      trigger=hoomd.trigger.Periodic(1),
+                                      dynamic=['position', 'typeid'],
+                                      n_frames=2,
+                                      log=logger)
+    sim.operations.writers.append(writer)
+    sim.run(3)
+
+    snapshot = sim.state.snapshot
+    rank = sim.device.communicator.rank
+    if rank == 0:
+        reader = hoomd.write.SharedMemoryReader(shm_name)
+        assert reader.N == 2
+        assert reader.n_frames == 2
+        assert reader.dynamic == ['position', 'typeid']
+        assert reader.log_names == ['sim/timestep']
+        assert reader.n_written == 3
+
+        frame = reader.read()
+        assert frame.valid
+        assert frame.timestep == sim.timestep
+        assert frame.log['sim/timestep'] == sim.timestep
+        np.testing.assert_allclose(frame.box[:3], [20, 20, 20])
+        np.testing.assert_allclose(frame.particles['position'],
+                                   snapshot.particles.position,
+                                   rtol=1e-6)
+        np.testing.assert_array_equal(frame.particles['typeid'],
+                                      snapshot.particles.typeid)
+        assert not frame.particles['position'].flags.writeable
+
+    # the writer overwrites the frame after n_frames more frames, run is
+    # collective
+    sim.run(2)
+
+    if rank == 0:
+        assert not frame.valid
+        del frame
+        reader.close()
+
+
+def test_incomplete_frame(simulation_factory, two_particle_snapshot_factory,
+                          shm_name):
+    sim = simulation_factory(two_particle_snapshot_factory())
+    writer = hoomd.write.SharedMemory(name=shm_name,
+                                      trigger=hoomd.trigger.Periodic(1),
+                                      n_frames=1)
+    sim.operations.writers.append(writer)
+    sim.run(1)
+
+    if sim.device.communicator.rank == 0:
+        with hoomd.write.SharedMemoryReader(shm_name) as reader:
+            # emulate a writer that stopped in the middle of the frame
+            sequence = np.ndarray((),
+                                  dtype='<u8',
+                                  buffer=reader._shm.buf,
+                                  offset=reader._frame_offset)
+            sequence += 1
+            with pytest.raises(RuntimeError):
+                reader.read(max_attempts=10)
+            sequence -= 1
+            del sequence
+
+
+def test_existing_segment(simulation_factory, two_particle_snapshot_factory,
+                          shm_name):
+    sim = simulation_factory(two_particle_snapshot_factory())
+    sim.operations.writers.append(
+        hoomd.write.SharedMemory(name=shm_name,
+                                 trigger=hoomd.trigger.Periodic(1)))
+    sim.run(1)
+
+    # a second writer must not take over the segment of the first
+    other = hoomd.write.SharedMemory(name=shm_name,
+                                     trigger=hoomd.trigger.Periodic(1))
+    sim.operations.writers.append(other)
+    with pytest.raises(RuntimeError):
+        sim.run(1)
+    sim.operations.writers.remove(other)
+
+    replace = hoomd.write.SharedMemory(name=shm_name,
+                                       trigger=hoomd.trigger.Periodic(1),
+                                       replace=True)
+    assert replace.replace
+    sim.operations.writers.append(replace)
+    sim.run(1)
+
+    if sim.device.communicator.rank == 0:
+        with hoomd.write.SharedMemoryReader(shm_name) as reader:
+            assert reader.n_written == 1
+
+
+def test_detach(simulation_factory, two_particle_snapshot_factory, shm_name):
+    sim = simulation_factory(two_particle_snapshot_factory())
+    writer = hoomd.write.SharedMemory(name=shm_name,
+                                      trigger=hoomd.trigger.Periodic(1))
+    sim.operations.writers.append(writer)
+    sim.run(1)
+
+    sim.operations.writers.remove(writer)
+    assert writer.name == shm_name
+    assert writer.dynamic == ['position']
@@ -208,6 +208,59 @@ def test_state_from_gsd_snapshot(simulation_factory, lattice_snapshot_factory,
         assert_equivalent_snapshots(snap, sim.state.snapshot)
 
 
+@skip_gsd
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_state_from_gsd_snapshot_arrays(device, dtype):
+    """Initialize from NumPy arrays of different dtypes in a gsd snapshot."""
+    N = 1000
+    rng = np.random.default_rng(0)
+    snap = gsd.hoomd.Snapshot()
+    snap.configuration.box = [10, 10, 10, 0, 0, 0]
+    snap.particles.N = N
+    snap.particles.types = ['A', 'B']
+    snap.particles.position = rng.uniform(-5, 5, size=(N, 3)).astype(dtype)
+    snap.particles.velocity = rng.uniform(-1, 1, size=(N, 3)).astype(dtype)
+    snap.particles.mass = rng.uniform(1, 2, size=N).astype(dtype)
+    # int64 arrays are converted
+    snap.particles.typeid = rng.integers(0, 2, size=N)
+    snap.particles.image = rng.integers(-3, 3, size=(N, 3), dtype=np.int32)
+
+    sim = hoomd.Simulation(device)
+    sim.create_state_from_snapshot(snap)
+    assert sim.state.N_particles == N
+    assert sim.state.particle_types == ['A', 'B']
+
+    state_snap = sim.state.snapshot
+    if state_snap.exists:
+        np.testing.assert_array_equal(state_snap.particles.position,
+                                      snap.particles.position)
+        np.testing.assert_array_equal(state_snap.particles.velocity,
+                                      snap.particles.velocity)
+        np.testing.assert_array_equal(state_snap.particles.mass,
+                                      snap.particles.mass)
+        np.testing.assert_array_equal(state_snap.particles.typeid,
+                                      snap.particles.typeid)
+        np.testing.assert_array_equal(state_snap.particles.image,
+                                      snap.particles.image)
+        # arrays that are not given take the default values
+        np.testing.assert_array_equal(state_snap.particles.diameter, 1)
+        np.testing.assert_array_equal(state_snap.particles.orientation,
+                                      [[1, 0, 0, 0]] * N)
+
+
+@skip_gsd
+def test_state_from_gsd_snapshot_wrong_size(device):
+    snap = gsd.hoomd.Snapshot()
+    snap.configuration.box = [10, 10, 10, 0, 0, 0]
+    snap.particles.N = 10
+    snap.particles.types = ['A']
+    snap.particles.position = np.zeros((5, 3))
+
+    sim = hoomd.Simulation(device)
+    with pytest.raises(RuntimeError):
+        sim.create_state_from_snapshot(snap)
+
+
 def test_writer_order(simulation_factory, two_particle_snapshot_factory):
     """Ensure that writers run at the end of the loop step."""
 
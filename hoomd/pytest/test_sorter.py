@@ -31,3 +31,32 @@ def test_default_sorter(simulation_factory, two_particle_snapshot_factory):
 
     assert len(sim.operations.tuners) == 1
     assert isinstance(sim.operations.tuners[0], hoomd.tune.ParticleSorter)
+
+
+def test_adaptive(simulation_factory, two_particle_snapshot_factory):
+    """Test ParticleSorter in adaptive mode."""
+    sorter = hoomd.tune.ParticleSorter(trigger=hoomd.trigger.Periodic(1),
+                                       grid=32,
+                                       adaptive=True)
+    assert sorter.adaptive
+    assert sorter.sort_interval is None
+
+    sim = simulation_factory(two_particle_snapshot_factory())
+    sim.operations.tuners.clear()
+    sim.operations.tuners.append(sorter)
+
+    # the first candidate step sorts and no sort cycle is complete yet
+    sim.run(1)
+    assert sorter.sort_interval == 0
+
+    # the schedule sorts at least every 1000 candidate steps
+    sim.run(2100)
+    assert sorter.adaptive
+    assert 1 <= sorter.sort_interval <= 1000
+
+    # adaptive sorting scans the grids 8, 16, and 32
+    assert sorter.grid in (8, 16, 32)
+
+    sorter.adaptive = False
+    assert not sorter.adaptive
+    sim.run(1)
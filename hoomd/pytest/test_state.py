@@ -160,6 +160,215 @@ def test_modify_snapshot(simulation_factory, snap):
     assert_snapshots_equal(snap, snap2)
 
 
+def test_set_snapshot_fields(simulation_factory, snap):
+    sim = simulation_factory()
+    sim.create_state_from_snapshot(snap)
+
+    new_snap = sim.state.snapshot
+    if new_snap.exists:
+        N = new_snap.particles.N
+        new_snap.particles.position[:] = numpy.random.uniform(-10,
+                                                              10,
+                                                              size=(N, 3))
+        new_snap.particles.orientation[:] = numpy.random.uniform(-1,
+                                                                 1,
+                                                                 size=(N, 4))
+        new_snap.particles.velocity[:] = 0
+        new_snap.bonds.N = 0
+
+    sim.state.set_snapshot(new_snap, fields=['position', 'orientation'])
+
+    snap2 = sim.state.snapshot
+    if snap2.exists:
+        numpy.testing.assert_allclose(snap2.particles.position,
+                                      new_snap.particles.position)
+        numpy.testing.assert_allclose(snap2.particles.orientation,
+                                      new_snap.particles.orientation)
+
+        # other arrays and the topology remain unchanged
+        numpy.testing.assert_allclose(snap2.particles.velocity,
+                                      snap.particles.velocity)
+        numpy.testing.assert_equal(snap2.particles.image,
+                                   snap.particles.image)
+        numpy.testing.assert_equal(snap2.particles.typeid,
+                                   snap.particles.typeid)
+        assert snap2.bonds.N == snap.bonds.N
+        numpy.testing.assert_equal(snap2.bonds.group, snap.bonds.group)
+
+
+def test_set_snapshot_bonds_cross_domains(device, simulation_factory):
+    """Test that bonds follow particles that set_snapshot moves to other
+    domains."""
+    snap = Snapshot(device.communicator)
+    n_dimers = 100
+    if snap.exists:
+        snap.configuration.box = [20, 20, 20, 0, 0, 0]
+        snap.particles.N = 2 * n_dimers
+        snap.particles.types = ['A']
+        first = numpy.random.uniform(-9, 8, size=(n_dimers, 3))
+        snap.particles.position[0::2] = first
+        snap.particles.position[1::2] = first + [1, 0, 0]
+        snap.bonds.N = n_dimers
+        snap.bonds.types = ['bond']
+        snap.bonds.group[:] = [[2 * i, 2 * i + 1] for i in range(n_dimers)]
+    sim = simulation_factory(snap)
+
+    harmonic = hoomd.md.bond.Harmonic()
+    harmonic.params['bond'] = dict(k=10, r0=1)
+    integrator = hoomd.md.Integrator(dt=0.005, forces=[harmonic])
+    sim.operations.integrator = integrator
+    sim.run(0)
+
+    # shifting by half the box along every direction moves every particle to
+    # another domain, whichever way the box is decomposed
+    new_snap = sim.state.snapshot
+    if new_snap.exists:
+        new_snap.particles.position[0::2] = first + 10
+        new_snap.particles.position[1::2] = first + [11.5, 10, 10]
+        new_snap.particles.position[:] = numpy.where(
+            new_snap.particles.position >= 10,
+            new_snap.particles.position - 20, new_snap.particles.position)
+    sim.state.set_snapshot(new_snap, fields=['position'])
+    sim.run(0)
+
+    # every bond is stretched by 0.5
+    energies = harmonic.energies
+    if sim.device.communicator.rank == 0:
+        numpy.testing.assert_allclose(numpy.sum(energies),
+                                      n_dimers * 0.5 * 10 * 0.5**2,
+                                      rtol=1e-5)
+
+    snap2 = sim.state.snapshot
+    if snap2.exists:
+        assert snap2.bonds.N == n_dimers
+        numpy.testing.assert_equal(snap2.bonds.group, snap.bonds.group)
+        numpy.testing.assert_allclose(snap2.particles.position,
+                                      new_snap.particles.position,
+                                      atol=1e-5)
+
+
+def test_set_snapshot_invalid(simulation_factory, snap):
+    sim = simulation_factory()
+    sim.create_state_from_snapshot(snap)
+
+    with pytest.raises(ValueError):
+        sim.state.set_snapshot(sim.state.snapshot, fields=['typeid'])
+
+    small_snap = Snapshot(sim.device.communicator)
+    if small_snap.exists:
+        small_snap.configuration.box = [20, 20, 20, 0, 0, 0]
+        small_snap.particles.N = 10
+        small_snap.particles.types = ['A', 'B', 'C', 'D']
+
+    with pytest.raises(RuntimeError):
+        sim.state.set_snapshot(small_snap, fields=['position'])
+
+
+_lazy_fields = ['position', 'velocity', 'acceleration', 'typeid', 'mass',
+                'charge', 'diameter', 'image', 'body', 'orientation',
+                'moment_inertia', 'angmom']
+
+
+@pytest.mark.parametrize("memory_map", [False, True])
+def test_lazy_snapshot(simulation_factory, snap, tmp_path, memory_map):
+    sim = simulation_factory(snap)
+    snap2 = sim.state.snapshot
+
+    lazy = sim.state.get_lazy_snapshot(chunk_size=64,
+                                       memory_map=memory_map,
+                                       directory=tmp_path)
+    assert lazy.exists == snap2.exists
+    assert lazy.timestep == sim.timestep
+    numpy.testing.assert_allclose(lazy.configuration.box,
+                                  snap2.configuration.box)
+    assert lazy.configuration.dimensions == snap2.configuration.dimensions
+    assert lazy.particles.N == sim.state.N_particles
+    assert lazy.particles.types == sim.state.particle_types
+
+    for name in _lazy_fields:
+        array = getattr(lazy.particles, name)
+        if lazy.exists:
+            reference = getattr(snap2.particles, name)
+            assert array.dtype == reference.dtype
+            numpy.testing.assert_array_equal(array, reference)
+            assert not array.flags.writeable
+        else:
+            assert array is None
+
+    with pytest.raises(AttributeError):
+        lazy.particles.not_a_field
+    lazy.close()
+
+
+def test_lazy_snapshot_chunks(simulation_factory, snap):
+    sim = simulation_factory(snap)
+    snap2 = sim.state.snapshot
+    lazy = sim.state.get_lazy_snapshot()
+
+    # gather one array in full, the chunks slice it
+    lazy.particles.position
+    firsts = []
+    for first, chunk in lazy.particles.chunks(['position', 'typeid'],
+                                              chunk_size=300):
+        firsts.append(first)
+        if lazy.exists:
+            last = first + len(chunk['position'])
+            assert len(chunk['typeid']) == last - first
+            numpy.testing.assert_array_equal(
+                chunk['position'], snap2.particles.position[first:last])
+            numpy.testing.assert_array_equal(
+                chunk['typeid'], snap2.particles.typeid[first:last])
+        else:
+            assert chunk is None
+    assert firsts == [0, 300, 600, 900]
+
+    with pytest.raises(ValueError):
+        list(lazy.particles.chunks(['not_a_field']))
+
+
+def test_lazy_snapshot_stale(simulation_factory, lattice_snapshot_factory):
+    sim = simulation_factory(lattice_snapshot_factory())
+    lazy = sim.state.get_lazy_snapshot()
+    lazy.particles.position
+    sim.run(1)
+
+    # gathered arrays remain available, new arrays cannot be gathered
+    lazy.particles.position
+    with pytest.raises(RuntimeError):
+        lazy.particles.velocity
+
+
+def test_lazy_snapshot_modified(simulation_factory, lattice_snapshot_factory):
+    sim = simulation_factory(lattice_snapshot_factory())
+
+    # modifications at the same time step make the lazy snapshot stale
+    lazy = sim.state.get_lazy_snapshot()
+    sim.state.snapshot = sim.state.snapshot
+    with pytest.raises(RuntimeError):
+        lazy.particles.position
+
+    lazy = sim.state.get_lazy_snapshot()
+    sim.state.set_snapshot(sim.state.snapshot, fields=['velocity'])
+    with pytest.raises(RuntimeError):
+        lazy.particles.position
+
+    lazy = sim.state.get_lazy_snapshot()
+    with sim.state.cpu_local_snapshot:
+        pass
+    with pytest.raises(RuntimeError):
+        lazy.particles.position
+
+    lazy = sim.state.get_lazy_snapshot()
+    sim.state.thermalize_particle_momenta(filter=hoomd.filter.All(), kT=1.0)
+    with pytest.raises(RuntimeError):
+        lazy.particles.velocity
+
+    # reading the state does not
+    lazy = sim.state.get_lazy_snapshot()
+    sim.state.snapshot
+    lazy.particles.position
+
+
 def test_thermalize_particle_velocity(simulation_factory,
                                       lattice_snapshot_factory):
     snap = lattice_snapshot_factory()
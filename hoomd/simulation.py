@@ -183,9 +183,24 @@ class Simulation(metaclass=Loggable):
 
         Args:
             snapshot (Snapshot or gsd.hoomd.Snapshot): Snapshot to initialize
-                the state from. A `gsd.hoomd.Snapshot` will first be
-                converted to a `hoomd.Snapshot`.
+                the state from.
 
+        The per-particle arrays of a `gsd.hoomd.Snapshot` initialize the state
+        directly, without an intermediate `hoomd.Snapshot`. Arrays that are
+        contiguous and have a supported dtype are read in place: float32 or
+        float64 for floating point arrays and int32 or uint32 for ``typeid``,
+        ``image``, and ``body``. Use a `gsd.hoomd.Snapshot` to initialize
+        large systems from NumPy arrays (or other objects that support the
+        buffer protocol) without copies::
+
+            snapshot = gsd.hoomd.Snapshot()
+            snapshot.particles.N = len(position)
+            snapshot.particles.types = ['A']
+            snapshot.particles.position = position
+            snapshot.configuration.box = [L, L, L, 0, 0, 0]
+            sim.create_state_from_snapshot(snapshot)
+
+        The bonded topology of a `gsd.hoomd.Snapshot` is copied.
 
         When `timestep` is `None` before calling, `create_state_from_snapshot`
         sets `timestep` to 0.
@@ -197,11 +212,11 @@ class Simulation(metaclass=Loggable):
             # snapshot is hoomd.Snapshot
             self._state = State(self, snapshot)
         elif _match_class_path(snapshot, 'gsd.hoomd.Snapshot'):
-            # snapshot is gsd.hoomd.Snapshot
-            snapshot = Snapshot.from_gsd_snapshot(
+            # snapshot is gsd.hoomd.Snapshot, read its particle data in place
+            snapshot, particles = Snapshot._view_gsd_snapshot(
                     snapshot, self._device.communicator
                     )
-            self._state = State(self, snapshot)
+            self._state = State(self, snapshot, particles)
         else:
             raise TypeError(
                 "Snapshot must be a hoomd.Snapshot or gsd.hoomd.Snapshot."
@@ -1,3 +1,5 @@
+import tempfile
+
 import numpy as np
 import hoomd
 from hoomd import _hoomd
@@ -126,20 +128,8 @@ class Snapshot:
         gsd_snap.validate()
         snap = cls(communicator=communicator)
 
-        def set_properties(
-                snap_section, gsd_snap_section, properties, array_properties):
-            for prop in properties:
-                gsd_prop = getattr(gsd_snap_section, prop, None)
-                if gsd_prop is not None:
-                    setattr(snap_section, prop, gsd_prop)
-            for prop in array_properties:
-                gsd_prop = getattr(gsd_snap_section, prop, None)
-                if gsd_prop is not None:
-                    getattr(snap_section, prop)[:] = gsd_prop
-
         if communicator.rank == 0:
-
-            set_properties(
+            _set_properties(
                 snap.particles,
                 gsd_snap.particles,
                 ('N', 'types'),
@@ -147,28 +137,345 @@ class Snapshot:
                  'moment_inertia', 'orientation', 'position', 'typeid',
                  'velocity')
             )
+            snap._set_gsd_topology(gsd_snap)
+
+        return snap
+
+    @classmethod
+    def _view_gsd_snapshot(cls, gsd_snap, communicator):
+        """View the particle data of a `gsd.hoomd.Snapshot` in place.
+
+        Returns:
+            tuple[Snapshot, _hoomd.SnapshotParticleDataView]: A snapshot with
+            the box and the bonded topology of *gsd_snap* but no particles, and
+            a view of the per-particle arrays of *gsd_snap*.
+
+        The per-particle arrays are passed to C++ without copies when they are
+        contiguous and have a supported dtype (float32 or float64 for floating
+        point arrays and int32 or uint32 for integer arrays). Other arrays are
+        converted first.
+        """
+        snap = cls(communicator=communicator)
+
+        if communicator.rank == 0:
+            snap._set_gsd_topology(gsd_snap)
+            particles = gsd_snap.particles
+            arrays = {}
+            for name, dtypes in _view_dtypes.items():
+                value = getattr(particles, name, None)
+                if value is not None:
+                    arrays[name] = _as_view_array(value, dtypes)
+            types = [] if particles.types is None else list(particles.types)
+            view = _hoomd.SnapshotParticleDataView(int(particles.N), types,
+                                                   arrays)
+        else:
+            view = _hoomd.SnapshotParticleDataView(0, [], {})
+
+        return snap, view
 
-            for section in (
-                    'angles', 'bonds', 'dihedrals', 'impropers', 'pairs'
-                    ):
-                set_properties(
-                    getattr(snap, section),
-                    getattr(gsd_snap, section),
-                    ('N', 'types'),
-                    ('group', 'typeid')
-                )
-
-            set_properties(
-                snap.constraints,
-                gsd_snap.constraints,
-                ('N',),
-                ('group', 'value')
+    def _set_gsd_topology(self, gsd_snap):
+        """Copy the bonded topology and the box of a gsd snapshot."""
+        for section in ('angles', 'bonds', 'dihedrals', 'impropers', 'pairs'):
+            _set_properties(
+                getattr(self, section),
+                getattr(gsd_snap, section),
+                ('N', 'types'),
+                ('group', 'typeid')
             )
 
-            # Set box attribute
-            if gsd_snap.configuration.box is not None:
-                snap.configuration.box = gsd_snap.configuration.box
-                if gsd_snap.configuration.dimensions == 2:
-                    snap.configuration.box[2] = 0
+        _set_properties(
+            self.constraints,
+            gsd_snap.constraints,
+            ('N',),
+            ('group', 'value')
+        )
 
-        return snap
+        # Set box attribute
+        if gsd_snap.configuration.box is not None:
+            self.configuration.box = gsd_snap.configuration.box
+            if gsd_snap.configuration.dimensions == 2:
+                self.configuration.box[2] = 0
+
+
+def _set_properties(snap_section, gsd_snap_section, properties,
+                    array_properties):
+    """Copy the properties of a section of a gsd snapshot."""
+    for prop in properties:
+        gsd_prop = getattr(gsd_snap_section, prop, None)
+        if gsd_prop is not None:
+            setattr(snap_section, prop, gsd_prop)
+    for prop in array_properties:
+        gsd_prop = getattr(gsd_snap_section, prop, None)
+        if gsd_prop is not None:
+            getattr(snap_section, prop)[:] = gsd_prop
+
+
+# dtypes that SnapshotParticleDataView reads in place, the first is the
+# conversion target of other dtypes
+_view_dtypes = {
+    'position': (np.float64, np.float32),
+    'velocity': (np.float64, np.float32),
+    'typeid': (np.uint32, np.int32),
+    'mass': (np.float64, np.float32),
+    'charge': (np.float64, np.float32),
+    'diameter': (np.float64, np.float32),
+    'image': (np.int32, np.uint32),
+    'body': (np.int32, np.uint32),
+    'orientation': (np.float64, np.float32),
+    'moment_inertia': (np.float64, np.float32),
+    'angmom': (np.float64, np.float32),
+}
+
+
+def _as_view_array(value, dtypes):
+    """Get a contiguous array that SnapshotParticleDataView reads in place.
+
+    Arrays (and other objects that support the buffer protocol) that are
+    contiguous and have one of *dtypes* are returned without a copy.
+    """
+    array = np.asarray(value)
+    if array.dtype not in dtypes:
+        array = array.astype(dtypes[0])
+    return np.ascontiguousarray(array)
+
+
+# dtype and width of each per-particle array in the double precision snapshot
+_particle_fields = {
+    'position': (np.float64, 3),
+    'velocity': (np.float64, 3),
+    'acceleration': (np.float64, 3),
+    'typeid': (np.uint32, 1),
+    'mass': (np.float64, 1),
+    'charge': (np.float64, 1),
+    'diameter': (np.float64, 1),
+    'image': (np.int32, 3),
+    'body': (np.int32, 1),
+    'orientation': (np.float64, 4),
+    'moment_inertia': (np.float64, 3),
+    'angmom': (np.float64, 4),
+}
+
+
+class LazySnapshot:
+    """Particle data of a simulation gathered when it is accessed.
+
+    `LazySnapshot` is a read-only alternative to `hoomd.Snapshot` for systems
+    that are too large to gather at once on the root rank. Create it with
+    `hoomd.State.get_lazy_snapshot`. Each per-particle array in `particles`
+    is gathered the first time it is accessed, *chunk_size* particles at a
+    time, so the root rank never holds more than the requested arrays. With
+    *memory_map*, the arrays are stored in temporary files instead of
+    memory. `LazyParticleData.chunks` streams the particles in chunks without
+    storing the arrays at all.
+
+    The arrays are in the same order and have the same types as the arrays
+    of `hoomd.Snapshot`. `LazySnapshot` only provides the particle data and
+    the configuration. Use `hoomd.State.snapshot` to access the bonded
+    topology.
+
+    Gathering an array is a collective operation: in MPI simulations, all
+    ranks must access the same arrays of `particles` in the same order. The
+    arrays are `None` on ranks other than the root rank.
+
+    Note:
+        The arrays reflect the state of the simulation when they are
+        gathered. `LazySnapshot` raises `RuntimeError` when an array is
+        gathered after the simulation has advanced past the step at which the
+        lazy snapshot was created, or after the state was modified by setting
+        a snapshot, setting the box, or exiting a local snapshot.
+
+    Example::
+
+        snapshot = sim.state.get_lazy_snapshot(memory_map=True)
+        position = snapshot.particles.position
+        if snapshot.exists:
+            com = position.mean(axis=0)
+        snapshot.close()
+
+    Attributes:
+        timestep (int): Time step at which the lazy snapshot was created.
+    """
+
+    def __init__(self, state, chunk_size, memory_map, directory):
+        if int(chunk_size) <= 0:
+            raise ValueError("chunk_size must be positive.")
+
+        self._state = state
+        self._comm = state._simulation.device.communicator
+        self.timestep = state._simulation.timestep
+        self._modification_count = state._modification_count
+        self._configuration = _LazyConfigurationData(state.box)
+        self._particles = LazyParticleData(self, int(chunk_size), memory_map,
+                                           directory)
+
+    @property
+    def exists(self):
+        """bool: True on the root rank, where the arrays are gathered."""
+        return self._comm.rank == 0
+
+    @property
+    def configuration(self):
+        """Box and dimensionality of the simulation.
+
+        Provides ``box`` (``[Lx, Ly, Lz, xy, xz, yz]``) and ``dimensions``.
+        """
+        return self._configuration
+
+    @property
+    def particles(self):
+        """LazyParticleData: Per-particle arrays, gathered on access."""
+        return self._particles
+
+    def close(self):
+        """Release the gathered arrays and their temporary files."""
+        self._particles._release()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _check_state(self):
+        """Ensure that the simulation has the state of the lazy snapshot."""
+        if self._state._in_context_manager:
+            raise RuntimeError(
+                "Cannot gather a lazy snapshot inside local snapshot.")
+        if self._state._simulation.timestep != self.timestep:
+            raise RuntimeError(
+                "The simulation advanced from step {} since the lazy snapshot "
+                "was created.".format(self.timestep))
+        if self._state._modification_count != self._modification_count:
+            raise RuntimeError(
+                "The simulation state was modified since the lazy snapshot "
+                "was created.")
+
+
+class _LazyConfigurationData:
+
+    def __init__(self, box):
+        self.dimensions = box.dimensions
+        self.box = (box.Lx, box.Ly, box.Lz, box.xy, box.xz, box.yz)
+
+
+class LazyParticleData:
+    """Per-particle arrays of a `LazySnapshot`.
+
+    Access the arrays with the same names as in `hoomd.Snapshot.particles`:
+    ``position``, ``velocity``, ``acceleration``, ``typeid``, ``mass``,
+    ``charge``, ``diameter``, ``image``, ``body``, ``orientation``,
+    ``moment_inertia``, and ``angmom``. Each array is gathered on first
+    access and stored until `LazySnapshot.close` is called. The arrays are
+    read-only.
+
+    Attributes:
+        N (int): Number of particles.
+        types (list[str]): Names of the particle types.
+    """
+
+    def __init__(self, snapshot, chunk_size, memory_map, directory):
+        self._snapshot = snapshot
+        self._cpp_obj = snapshot._state._cpp_sys_def.getParticleData()
+        self._chunk_size = chunk_size
+        self._memory_map = memory_map
+        self._directory = directory
+        self._arrays = {}
+        self._files = []
+        self.N = snapshot._state.N_particles
+        self.types = snapshot._state.particle_types
+
+    def __getattr__(self, name):
+        if name not in _particle_fields:
+            raise AttributeError("{} object has no attribute {}".format(
+                type(self).__name__, name))
+        if name not in self._arrays:
+            self._arrays[name] = self._gather(name)
+        return self._arrays[name]
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(_particle_fields))
+
+    def chunks(self, fields=None, chunk_size=None):
+        """Iterate over the particles in chunks.
+
+        Args:
+            fields (list[str]): Names of the arrays to provide. Defaults to
+                all arrays.
+            chunk_size (int): Number of particles in each chunk. Defaults to
+                the *chunk_size* of the lazy snapshot.
+
+        Yields:
+            tuple[int, dict[str, numpy.ndarray]]: The index of the first
+            particle in the chunk and the arrays of the particles in the
+            chunk. The arrays are `None` on ranks other than the root rank.
+
+        Each chunk is gathered when the iteration reaches it, and arrays that
+        were already gathered are sliced instead. All ranks must iterate over
+        the chunks together.
+
+        Example::
+
+            for first, chunk in snapshot.particles.chunks(['position']):
+                if snapshot.exists:
+                    histogram += numpy.histogramdd(chunk['position'], bins)[0]
+        """
+        if fields is None:
+            fields = list(_particle_fields)
+        for name in fields:
+            if name not in _particle_fields:
+                raise ValueError("Unknown particle field {}.".format(name))
+        if chunk_size is None:
+            chunk_size = self._chunk_size
+        elif int(chunk_size) <= 0:
+            raise ValueError("chunk_size must be positive.")
+        chunk_size = int(chunk_size)
+
+        for first in range(0, self.N, chunk_size):
+            last = min(first + chunk_size, self.N)
+            chunk = {}
+            for name in fields:
+                if name in self._arrays:
+                    chunk[name] = (self._arrays[name][first:last]
+                                   if self._snapshot.exists else None)
+                    continue
+
+                self._snapshot._check_state()
+                out = None
+                if self._snapshot.exists:
+                    out = self._allocate(name, last - first, memory_map=False)
+                self._cpp_obj.gatherSnapshotField(name, first, last, out)
+                if out is not None:
+                    out.flags.writeable = False
+                chunk[name] = out
+            yield first, (chunk if self._snapshot.exists else None)
+
+    def _allocate(self, name, N, memory_map):
+        dtype, width = _particle_fields[name]
+        shape = (N, width) if width > 1 else (N,)
+        if memory_map and N > 0:
+            f = tempfile.TemporaryFile(dir=self._directory)
+            self._files.append(f)
+            return np.memmap(f, dtype=dtype, mode='w+', shape=shape)
+        return np.empty(shape, dtype=dtype)
+
+    def _gather(self, name):
+        """Gather one array in chunks of at most chunk_size particles."""
+        self._snapshot._check_state()
+        array = None
+        if self._snapshot.exists:
+            array = self._allocate(name, self.N, self._memory_map)
+
+        for first in range(0, self.N, self._chunk_size):
+            last = min(first + self._chunk_size, self.N)
+            out = array[first:last] if array is not None else None
+            self._cpp_obj.gatherSnapshotField(name, first, last, out)
+
+        if array is not None:
+            array.flags.writeable = False
+        return array
+
+    def _release(self):
+        self._arrays.clear()
+        for f in self._files:
+            f.close()
+        self._files.clear()
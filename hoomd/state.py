@@ -8,7 +8,7 @@ from collections import defaultdict
 
 from . import _hoomd
 from hoomd.box import Box
-from hoomd.snapshot import Snapshot
+from hoomd.snapshot import Snapshot, LazySnapshot
 from hoomd.data import LocalSnapshot, LocalSnapshotGPU
 import hoomd
 
@@ -39,6 +39,12 @@ def _create_domain_decomposition(device, box):
     return result
 
 
+# per-particle arrays that State.set_snapshot sets without reinitializing
+_updatable_particle_fields = ('position', 'image', 'velocity', 'acceleration',
+                              'mass', 'charge', 'diameter', 'orientation',
+                              'angmom', 'moment_inertia')
+
+
 class State:
     """The state of a `hoomd.Simulation` object.
 
@@ -59,25 +65,32 @@ class State:
         `State` object.
     """
 
-    def __init__(self, simulation, snapshot):
+    def __init__(self, simulation, snapshot, particles=None):
         self._simulation = simulation
         snapshot._broadcast_box()
         domain_decomp = _create_domain_decomposition(
             simulation.device,
             snapshot._cpp_obj._global_box)
 
+        # particles is a view of the particle data arrays that replaces the
+        # particle data of snapshot
+        args = [snapshot._cpp_obj]
+        if particles is not None:
+            args.append(particles)
+        args.append(simulation.device._cpp_exec_conf)
         if domain_decomp is not None:
-            self._cpp_sys_def = _hoomd.SystemDefinition(
-                snapshot._cpp_obj, simulation.device._cpp_exec_conf,
-                domain_decomp)
-        else:
-            self._cpp_sys_def = _hoomd.SystemDefinition(
-                snapshot._cpp_obj, simulation.device._cpp_exec_conf)
+            args.append(domain_decomp)
+        self._cpp_sys_def = _hoomd.SystemDefinition(*args)
 
         # Necessary for local snapshot API. This is used to ensure two local
         # snapshots are not contexted at once.
         self._in_context_manager = False
 
+        # Number of times the state has been modified outside of the
+        # simulation's operations. Lazy snapshots use this to detect that the
+        # state changed after they were created.
+        self._modification_count = 0
+
         # self._groups provides a cache of C++ group objects of the form:
         # {type(filter): {filter: C++ group}}
         # The first layer is to prevent user created filters with poorly implemented
@@ -110,6 +123,14 @@ class State:
         Note:
             Setting or getting a snapshot is an order :math:`O(N_{particles}
             + N_{bonds} + \ldots)` operation.
+
+        Tip:
+            Use `get_lazy_snapshot` to read the particle data of systems that
+            are too large to gather at once on the root rank.
+
+        Tip:
+            Use `set_snapshot` to replace only some of the per-particle
+            arrays, such as the positions, and keep the rest of the state.
         """
         cpp_snapshot = self._cpp_sys_def.takeSnapshot_double()
         return Snapshot._from_cpp_snapshot(cpp_snapshot,
@@ -139,6 +160,85 @@ class State:
                 raise RuntimeError("Number of pair types must remain the same")
 
         self._cpp_sys_def.initializeFromSnapshot(snapshot._cpp_obj)
+        self._modification_count += 1
+
+    def set_snapshot(self, snapshot, fields=None):
+        """Set the state from a snapshot.
+
+        Args:
+            snapshot (hoomd.Snapshot): Snapshot to set the state from.
+            fields (list[str]): Names of the per-particle arrays to set.
+                Defaults to `None`, which sets the whole state.
+
+        When *fields* is `None`, `set_snapshot` is equivalent to setting
+        `State.snapshot`. Otherwise, it only sets the given per-particle
+        arrays to the values in *snapshot*: ``'position'``, ``'image'``,
+        ``'velocity'``, ``'acceleration'``, ``'mass'``, ``'charge'``,
+        ``'diameter'``, ``'orientation'``, ``'angmom'``, and
+        ``'moment_inertia'``. The box, the particle types and bodies, the
+        bonds (and other bonded groups), and the particle groups remain as
+        they are, and the simulation does not reinitialize its operations. Use
+        this to swap configurations in Monte Carlo and replica exchange schemes
+        implemented at the Python script level::
+
+            snapshot = sim.state.snapshot
+            # modify snapshot.particles.position
+            sim.state.set_snapshot(snapshot, fields=['position'])
+
+        *snapshot* must have the same number of particles as the state, in the
+        same order. `set_snapshot` wraps the positions into the box and keeps
+        the current image flags unless *fields* also includes ``'image'``.
+
+        Note:
+            Setting a snapshot is an order :math:`O(N_{particles})` operation.
+            In MPI simulations, only the given arrays are scattered from the
+            root rank. When new positions place particles in other domains,
+            the bonded groups of those particles move with them in one
+            exchange per group type, and the bonded group tags do not change.
+        """
+        if fields is None:
+            self.snapshot = snapshot
+            return
+
+        if self._in_context_manager:
+            raise RuntimeError(
+                "Cannot set state to new snapshot inside local snapshot.")
+        fields = [str(field) for field in fields]
+        for field in fields:
+            if field not in _updatable_particle_fields:
+                raise ValueError(
+                    "Cannot set the per-particle array {}.".format(field))
+
+        self._cpp_sys_def.updateFromSnapshot(snapshot._cpp_obj, fields)
+        self._modification_count += 1
+
+    def get_lazy_snapshot(self,
+                          chunk_size=1048576,
+                          memory_map=False,
+                          directory=None):
+        """Get the particle data of the current microstate when it is accessed.
+
+        Args:
+            chunk_size (int): Number of particles gathered at a time.
+            memory_map (bool): When `True`, store the gathered arrays in
+                memory-mapped temporary files instead of memory.
+            directory (str): Directory of the temporary files. Defaults to the
+                system temporary directory.
+
+        Returns:
+            hoomd.LazySnapshot: The lazy snapshot.
+
+        Unlike `snapshot`, `get_lazy_snapshot` gathers nothing up front. Each
+        per-particle array is gathered separately, *chunk_size* particles at a
+        time, the first time it is accessed. See `hoomd.LazySnapshot` for
+        details.
+
+        Note:
+            Getting a lazy snapshot is an order :math:`O(1)` operation and
+            gathering an array is an order :math:`O(N_{particles})`
+            operation.
+        """
+        return LazySnapshot(self, chunk_size, memory_map, directory)
 
     @property
     def particle_types(self):
@@ -246,6 +346,7 @@ class State:
                           value.dimensions))
             self._cpp_sys_def.setNDimensions(value.dimensions)
         self._cpp_sys_def.getParticleData().setGlobalBox(value._cpp_obj)
+        self._modification_count += 1
 
     def replicate(self):  # noqa: D102
         raise NotImplementedError
@@ -413,3 +514,4 @@ class State:
         self._simulation._warn_if_seed_unset()
         group = self._get_group(filter)
         group.thermalizeParticleMomenta(kT, self._simulation.timestep)
+        self._modification_count += 1
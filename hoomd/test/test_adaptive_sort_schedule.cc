@@ -0,0 +1,158 @@
+// Copyright (c) 2009-2021 The Regents of the University of Michigan
+// This file is part of the HOOMD-blue project, released under the BSD 3-Clause License.
+
+
+// this include is necessary to get MPI included before anything else to support intel MPI
+#include "hoomd/ExecutionConfiguration.h"
+
+#include <functional>
+#include <iostream>
+#include <vector>
+
+#include "upp11_config.h"
+
+HOOMD_UP_MAIN();
+
+#include "hoomd/AdaptiveSortSchedule.h"
+
+using namespace std;
+
+/*! \file test_adaptive_sort_schedule.cc
+    \brief Implements unit tests for AdaptiveSortSchedule
+    \ingroup unit_tests
+*/
+
+//! Drive an AdaptiveSortSchedule with controlled step and sort times
+/*! \param schedule Schedule to drive
+    \param n_steps Number of steps to run
+    \param sort_time Time each sort takes (ns)
+    \param step_time Time of a step as a function of the number of steps since the last sort (ns)
+    \param intervals Receives getLastInterval() after each completed sort cycle
+    \returns The steps on which the schedule sorted
+
+    Every step is a candidate step, as in SFCPackTuner with a period of 1.
+*/
+vector<uint64_t> run_schedule(AdaptiveSortSchedule& schedule,
+                              uint64_t n_steps,
+                              int64_t sort_time,
+                              std::function<int64_t (uint64_t)> step_time,
+                              vector<uint64_t>& intervals)
+    {
+    int64_t now = 1000;
+    schedule.setTimeSource([&now]() { return now; });
+
+    vector<uint64_t> sorts;
+    uint64_t last_sort = 0;
+    for (uint64_t timestep = 0; timestep < n_steps; timestep++)
+        {
+        if (timestep > 0)
+            now += step_time(timestep - last_sort);
+
+        if (schedule.shouldSort(timestep))
+            {
+            if (schedule.hasCycleCost())
+                intervals.push_back(schedule.getLastInterval());
+            sorts.push_back(timestep);
+            last_sort = timestep;
+            schedule.beginSort();
+            now += sort_time;
+            schedule.endSort();
+            }
+        }
+
+    schedule.setTimeSource(std::function<int64_t ()>());
+    return sorts;
+    }
+
+//! The first candidate step always sorts
+UP_TEST( first_candidate_sorts )
+    {
+    AdaptiveSortSchedule schedule;
+    int64_t now = 0;
+    schedule.setTimeSource([&now]() { return now; });
+
+    UP_ASSERT(schedule.shouldSort(10));
+    UP_ASSERT(!schedule.hasCycleCost());
+    schedule.beginSort();
+    now += 1000;
+    schedule.endSort();
+
+    // a step that does not advance the time step is not measured
+    now += 1000000;
+    UP_ASSERT(!schedule.shouldSort(10));
+    UP_ASSERT(!schedule.hasCycleCost());
+    }
+
+//! Without any decay of the time per step, the schedule only sorts after max_candidates candidates
+UP_TEST( constant_step_time )
+    {
+    AdaptiveSortSchedule schedule(20);
+    vector<uint64_t> intervals;
+    vector<uint64_t> sorts = run_schedule(schedule, 61, 5000000,
+                                          [](uint64_t) { return int64_t(1000000); },
+                                          intervals);
+
+    vector<uint64_t> expected_sorts = {0, 20, 40, 60};
+    UP_ASSERT(sorts == expected_sorts);
+    UP_ASSERT_EQUAL(intervals.size(), (size_t)3);
+    for (uint64_t interval : intervals)
+        UP_ASSERT_EQUAL(interval, (uint64_t)20);
+
+    // the cycle cost averages the sort over the cycle: (5 ms + 20 * 1 ms) / 20
+    MY_CHECK_CLOSE(schedule.getCycleCost(), 1.25e-3, 1e-6);
+    }
+
+//! The schedule sorts at the first step where the smoothed time per step exceeds the cycle average
+UP_TEST( step_time_jump )
+    {
+    // 1 ms per step for 10 steps after each sort, then 100 ms per step, and 5 ms per sort
+    AdaptiveSortSchedule schedule(1000);
+    vector<uint64_t> intervals;
+    vector<uint64_t> sorts = run_schedule(schedule, 40, 5000000,
+                                          [](uint64_t n) { return int64_t(n <= 10 ? 1000000 : 100000000); },
+                                          intervals);
+
+    // at 11 steps after a sort the smoothed time per step 0.25 * 100 ms + 0.75 * 1 ms = 25.75 ms first exceeds the
+    // average (5 ms + 10 * 1 ms + 100 ms) / 11 = 10.45 ms
+    vector<uint64_t> expected_sorts = {0, 11, 22, 33};
+    UP_ASSERT(sorts == expected_sorts);
+    UP_ASSERT_EQUAL(intervals.size(), (size_t)3);
+    for (uint64_t interval : intervals)
+        UP_ASSERT_EQUAL(interval, (uint64_t)11);
+    MY_CHECK_CLOSE(schedule.getCycleCost(), 115e-3 / 11.0, 1e-6);
+    }
+
+//! A slow decay sorts before max_candidates, and a longer sort spreads the sorts further apart
+UP_TEST( sort_cost_sets_interval )
+    {
+    // the time per step grows linearly with the number of steps since the sort
+    auto step_time = [](uint64_t n) { return int64_t(1000000 + 100000 * n); };
+
+    AdaptiveSortSchedule cheap_schedule(1000);
+    vector<uint64_t> cheap_intervals;
+    run_schedule(cheap_schedule, 500, 1000000, step_time, cheap_intervals);
+
+    AdaptiveSortSchedule expensive_schedule(1000);
+    vector<uint64_t> expensive_intervals;
+    run_schedule(expensive_schedule, 500, 100000000, step_time, expensive_intervals);
+
+    UP_ASSERT(cheap_intervals.size() > 0);
+    UP_ASSERT(expensive_intervals.size() > 0);
+    UP_ASSERT(cheap_intervals.back() < 1000);
+    UP_ASSERT(expensive_intervals.back() > cheap_intervals.back());
+    }
+
+//! reset() forgets the measurements and sorts at the next candidate
+UP_TEST( reset )
+    {
+    AdaptiveSortSchedule schedule(20);
+    vector<uint64_t> intervals;
+    run_schedule(schedule, 5, 1000, [](uint64_t) { return int64_t(1000); }, intervals);
+
+    int64_t now = 1000000;
+    schedule.setTimeSource([&now]() { return now; });
+    UP_ASSERT(!schedule.shouldSort(4));
+    schedule.reset();
+    now += 1000;
+    UP_ASSERT(schedule.shouldSort(5));
+    }
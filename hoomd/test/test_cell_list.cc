@@ -582,3 +582,63 @@ UP_TEST( CellListGPU_large )
     celllist_large_test<CellListGPU>(std::shared_ptr<ExecutionConfiguration>(new ExecutionConfiguration(ExecutionConfiguration::GPU)));
     }
 #endif
+
+//! Validate that compatible cell lists are shared through SystemDefinition
+template <class CL>
+void celllist_shared_test(std::shared_ptr<ExecutionConfiguration> exec_conf)
+    {
+    std::shared_ptr<SystemDefinition> sysdef(new SystemDefinition(3, BoxDim(10.0), 1, 0, 0, 0, 0, exec_conf));
+
+    std::shared_ptr<CellList> cl_a(new CL(sysdef));
+    cl_a->setNominalWidth(Scalar(2.5));
+    cl_a->setFlagIndex();
+    std::shared_ptr<CellList> shared_a = sysdef->getSharedCellList(cl_a);
+    UP_ASSERT(shared_a == cl_a);
+
+    // an identical request reuses the existing cell list
+    std::shared_ptr<CellList> cl_b(new CL(sysdef));
+    cl_b->setNominalWidth(Scalar(2.5));
+    cl_b->setFlagIndex();
+    UP_ASSERT(sysdef->getSharedCellList(cl_b) == cl_a);
+
+    // a narrower request only matches within the tolerance
+    std::shared_ptr<CellList> cl_c(new CL(sysdef));
+    cl_c->setNominalWidth(Scalar(2.0));
+    cl_c->setFlagIndex();
+    UP_ASSERT(sysdef->getSharedCellList(cl_c, Scalar(0.3)) == cl_a);
+    UP_ASSERT(sysdef->getSharedCellList(cl_c, Scalar(0.1)) == cl_c);
+
+    // a wider request never matches
+    std::shared_ptr<CellList> cl_d(new CL(sysdef));
+    cl_d->setNominalWidth(Scalar(3.0));
+    cl_d->setFlagIndex();
+    UP_ASSERT(sysdef->getSharedCellList(cl_d, Scalar(1.0)) == cl_d);
+
+    // different contents never match
+    std::shared_ptr<CellList> cl_e(new CL(sysdef));
+    cl_e->setNominalWidth(Scalar(2.5));
+    cl_e->setFlagType();
+    UP_ASSERT(sysdef->getSharedCellList(cl_e) == cl_e);
+
+    // cell lists no longer in use are not handed out again
+    cl_a.reset();
+    shared_a.reset();
+    std::shared_ptr<CellList> cl_f(new CL(sysdef));
+    cl_f->setNominalWidth(Scalar(2.5));
+    cl_f->setFlagIndex();
+    UP_ASSERT(sysdef->getSharedCellList(cl_f) == cl_f);
+    }
+
+//! test case for celllist_shared_test on the CPU
+UP_TEST( CellList_shared )
+    {
+    celllist_shared_test<CellList>(std::shared_ptr<ExecutionConfiguration>(new ExecutionConfiguration(ExecutionConfiguration::CPU)));
+    }
+
+#ifdef ENABLE_HIP
+//! test case for celllist_shared_test on the GPU
+UP_TEST( CellListGPU_shared )
+    {
+    celllist_shared_test<CellListGPU>(std::shared_ptr<ExecutionConfiguration>(new ExecutionConfiguration(ExecutionConfiguration::GPU)));
+    }
+#endif
@@ -2,4 +2,4 @@ from hoomd.tune.sorter import ParticleSorter
 from hoomd.tune.balance import LoadBalancer
 from hoomd.tune.custom_tuner import CustomTuner, _InternalCustomTuner
 from hoomd.tune.attr_tuner import (
-    ManualTuneDefinition, SolverStep, ScaleSolver, SecantSolver)
+    ManualTuneDefinition, SolverStep, ScaleSolver, SecantSolver, ScaleOptimizer)
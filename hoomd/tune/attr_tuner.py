@@ -422,3 +422,60 @@ class SecantSolver(SolverStep):
         else:
             self._counters[tunable] = counter
             return x
+
+
+class ScaleOptimizer(SolverStep):
+    """
+    Maximizes y = f(x) by scaling x up or down.
+
+    Each step scales x by ``scale`` in the direction that last increased y.
+    When y decreases, the solver reverses the direction and reduces the scale
+    to ``scale ** gamma``. The tunable's target is not used.
+
+    Args:
+        scale (:obj:`float`, optional): The initial factor to scale x by,
+            defaults to 1.5. Must be greater than 1.
+        gamma (:obj:`float`, optional): real number between 0 and 1 used to
+            reduce the scale each time y decreases, defaults to 0.5. Larger
+            values of ``gamma`` reduce the scale more slowly which increases
+            stability when y is noisy while increasing convergence time.
+        tol (:obj:`float`, optional): The relative tolerance for convergence
+            of x, defaults to 1e-2. A tunable is converged when ``scale - 1``
+            is less than ``tol``.
+
+    Note:
+        This solver finds a local maximum and is only usable when x is strictly
+        positive. It compares consecutive measurements of y, so x should not be
+        changed by other means between steps.
+    """
+
+    def __init__(self, scale=1.5, gamma=0.5, tol=1e-2):
+        if scale <= 1:
+            raise ValueError("scale must be greater than 1.")
+        self.scale = scale
+        self.gamma = gamma
+        self.tol = tol
+        self._state = dict()
+
+    def solve_one(self, tunable):
+        x, y = tunable.x, tunable.y
+        if tunable not in self._state:
+            scale, direction = self.scale, 1
+        else:
+            previous_y, scale, direction = self._state[tunable]
+            if scale - 1 < self.tol:
+                return True
+            if y < previous_y:
+                direction = -direction
+                scale = scale**self.gamma
+
+        new_x = tunable.clamp_into_domain(x * scale**direction)
+        if isclose(new_x, x):
+            # x is at the boundary of the domain, search in the other direction
+            direction = -direction
+            scale = scale**self.gamma
+            new_x = tunable.clamp_into_domain(x * scale**direction)
+
+        tunable.x = new_x
+        self._state[tunable] = (y, scale, direction)
+        return scale - 1 < self.tol
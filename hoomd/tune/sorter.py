@@ -4,6 +4,7 @@ from hoomd.data.parameterdicts import ParameterDict
 from hoomd.data.typeconverter import OnlyTypes
 from hoomd.operation import Tuner
 from hoomd.trigger import Trigger
+from hoomd.logging import log
 from hoomd import _hoomd
 import hoomd
 from math import log2, ceil
@@ -20,11 +21,24 @@ class ParticleSorter(Tuner):
             value of `None` sets ``grid=4096`` in 2D simulations and
             ``grid=256`` in 3D simulations.
 
+        adaptive (bool): When `True`, choose the sort steps and the grid
+            resolution from the measured time per step. Defaults to `False`.
+
     `ParticleSorter` improves simulation performance by sorting the particles in
     memory along a space-filling curve. This takes particles that are close in
     space and places them close in memory, leading to a higher rate of
     cache hits when computing pair potentials.
 
+    The best sort period depends on how fast the particles diffuse and on the
+    cost of the sort. With ``adaptive=True``, the steps selected by `trigger`
+    are candidates and `ParticleSorter` sorts at the candidate where the
+    measured time per step first exceeds the time per step averaged since the
+    last sort (including the sort itself), which minimizes that average. Use a
+    trigger with a short period, such as ``hoomd.trigger.Periodic(10)``, with
+    adaptive sorting. After the first sort, `ParticleSorter` also compares the
+    grid resolutions ``grid/4``, ``grid/2``, and `grid` over a few sorts and
+    keeps the fastest one.
+
     Note:
         New `Operations` instances include a `ParticleSorter`
         constructed with default parameters.
@@ -36,19 +50,25 @@ class ParticleSorter(Tuner):
             `grid` rounds up to the nearest power of 2 when set. Larger values
             of `grid` provide more accurate space-filling curves, but consume
             more memory (``grid**D * 4`` bytes, where *D* is the dimensionality
-            of the system).
+            of the system). With adaptive sorting, `grid` is the largest
+            resolution tried and reads the resolution in use while attached.
+
+        adaptive (bool): Choose the sort steps and the grid resolution from
+            the measured time per step.
     """
 
-    def __init__(self, trigger=200, grid=None):
+    def __init__(self, trigger=200, grid=None, adaptive=False):
         self._param_dict = ParameterDict(
             trigger=Trigger,
             grid=OnlyTypes(
                 int,
                 postprocess=lambda x: int(ParticleSorter._to_power_of_two(x)),
                 preprocess=ParticleSorter._natural_number,
-                allow_none=True))
+                allow_none=True),
+            adaptive=bool)
         self.trigger = trigger
         self.grid = grid
+        self.adaptive = adaptive
 
     @staticmethod
     def _to_power_of_two(value):
@@ -72,3 +92,14 @@ class ParticleSorter(Tuner):
         self._cpp_obj = cpp_cls(self._simulation.state._cpp_sys_def,
                                 self.trigger)
         super()._attach()
+
+    @log(default=False)
+    def sort_interval(self):
+        """int: Number of time steps between the last two adaptive sorts.
+
+        `None` when not attached.
+        """
+        if self._attached:
+            return self._cpp_obj.sort_interval
+        else:
+            return None
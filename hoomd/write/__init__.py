@@ -1,4 +1,7 @@
+from hoomd.write.block_average import BlockAverage
 from hoomd.write.custom_writer import CustomWriter
 from hoomd.write.gsd import GSD
 from hoomd.write.dcd import DCD
 from hoomd.write.table import Table
+from hoomd.write.shared_memory import (SharedMemory, SharedMemoryReader,
+                                       SharedMemoryFrame)
@@ -0,0 +1,323 @@
+# Copyright (c) 2009-2021 The Regents of the University of Michigan This file is
+# part of the HOOMD-blue project, released under the BSD 3-Clause License.
+
+"""Estimate the statistical error of logged quantities by block averaging."""
+
+import json
+import math
+
+import numpy
+
+from hoomd import _hoomd
+from hoomd.write.custom_writer import _InternalCustomWriter
+from hoomd.custom.custom_action import _InternalAction
+from hoomd.logging import LoggerCategories, Logger, log
+from hoomd.data.parameterdicts import ParameterDict
+from hoomd.util import dict_flatten
+
+
+class _Blocking:
+    """Online blocking analysis of a time series.
+
+    Implements the method of H. Flyvbjerg and H. G. Petersen (doi:
+    10.1063/1.457480) without storing the time series. Level 0 receives every
+    sample; level k + 1 receives the averages of consecutive pairs of samples in
+    level k. Each level keeps the running mean and sum of squared deviations
+    (Welford's algorithm) and at most one sample waiting for its partner, so the
+    memory grows with the logarithm of the number of samples.
+    """
+
+    def __init__(self):
+        self._n = []
+        self._mean = []
+        self._m2 = []
+        self._pending = []
+
+    def add(self, value):
+        level = 0
+        while value is not None:
+            if level == len(self._n):
+                self._n.append(0)
+                self._mean.append(0.0)
+                self._m2.append(0.0)
+                self._pending.append(None)
+
+            self._n[level] += 1
+            delta = value - self._mean[level]
+            self._mean[level] += delta / self._n[level]
+            self._m2[level] += delta * (value - self._mean[level])
+
+            if self._pending[level] is None:
+                self._pending[level] = value
+                value = None
+            else:
+                value = 0.5 * (self._pending[level] + value)
+                self._pending[level] = None
+                level += 1
+
+    @property
+    def num_samples(self):
+        return self._n[0] if len(self._n) > 0 else 0
+
+    @property
+    def mean(self):
+        return self._mean[0] if len(self._n) > 0 else math.nan
+
+    @property
+    def variance(self):
+        if self.num_samples < 2:
+            return math.nan
+        return self._m2[0] / self._n[0]
+
+    def levels(self, min_blocks=2):
+        """Standard error estimates of each blocking level.
+
+        Returns:
+            tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: The number of
+            blocks, the estimated standard error of the mean, and the error of
+            that estimate for each level with at least *min_blocks* blocks.
+        """
+        n = numpy.array([n for n in self._n if n >= max(min_blocks, 2)],
+                        dtype=numpy.int64)
+        m2 = numpy.array(self._m2[:len(n)])
+        error = numpy.sqrt(m2 / n / (n - 1))
+        return n, error, error / numpy.sqrt(2.0 * (n - 1))
+
+    def standard_error(self, min_blocks=16):
+        r"""Standard error of the mean at the plateau of the blocking levels.
+
+        Selects the first level whose block size :math:`B = 2^k` satisfies
+        :math:`B^3 > 2 N_0 (\sigma_k / \sigma_0)^4` (M. Lee et al., doi:
+        10.1103/PhysRevE.83.066706), or the last level with at least
+        *min_blocks* blocks when none does.
+        """
+        n, error, _ = self.levels(min_blocks)
+        if len(n) == 0:
+            return math.nan
+        if error[0] == 0:
+            return 0.0
+
+        for level in range(len(n)):
+            ratio = error[level] / error[0]
+            if 2.0**(3 * level) > 2.0 * n[0] * ratio**4:
+                return float(error[level])
+
+        return float(error[-1])
+
+    def autocorrelation_time(self, min_blocks=16):
+        """Integrated autocorrelation time in units of the sample interval."""
+        n, error, _ = self.levels(min_blocks)
+        if len(n) == 0:
+            return math.nan
+        if error[0] == 0:
+            return 0.5
+        ratio = self.standard_error(min_blocks) / error[0]
+        return 0.5 * ratio * ratio
+
+
+class _BlockAverageInternal(_InternalAction):
+    """Implements the accumulation for `BlockAverage`."""
+
+    _invalid_logger_categories = LoggerCategories.any([
+        'sequence', 'object', 'particle', 'bond', 'angle', 'dihedral',
+        'improper', 'pair', 'constraint', 'string', 'strings'
+    ])
+
+    def __init__(self, logger, min_blocks=16):
+        param_dict = ParameterDict(logger=Logger, min_blocks=int)
+        param_dict.update(dict(logger=logger, min_blocks=min_blocks))
+        self._param_dict = param_dict
+
+        if (LoggerCategories.scalar not in logger.categories
+                or (logger.categories & self._invalid_logger_categories)
+                != LoggerCategories.NONE):
+            raise ValueError(
+                "Given Logger must have only the scalar categories set.")
+
+        self._blocking = dict()
+        self._comm = None
+        self._exec_conf = None
+
+    def _setattr_param(self, attr, value):
+        """Makes self._param_dict attributes read only."""
+        raise ValueError("Attribute {} is read-only.".format(attr))
+
+    def attach(self, simulation):
+        self._comm = simulation.device._comm
+        self._exec_conf = simulation.device._cpp_exec_conf
+
+    def detach(self):
+        self._comm = None
+        self._exec_conf = None
+
+    def act(self, timestep=None):
+        """Add the current values of the logged quantities to the averages."""
+        # evaluate the loggables on all ranks, some of them communicate
+        values = {
+            '.'.join(key): value[0]
+            for key, value in dict_flatten(self.logger.log()).items()
+        }
+        if self._comm is not None and self._comm.rank != 0:
+            return
+
+        for name, value in values.items():
+            if value is None:
+                continue
+            if name not in self._blocking:
+                self._blocking[name] = _Blocking()
+            self._blocking[name].add(float(value))
+
+    def reset(self):
+        """Clear the accumulated averages."""
+        self._blocking = dict()
+
+    def _estimates(self):
+        """Estimates of all quantities, broadcast from the root rank."""
+        estimates = dict(quantities=[],
+                         num_samples=0,
+                         mean=[],
+                         variance=[],
+                         standard_error=[],
+                         autocorrelation_time=[])
+        for name, blocking in self._blocking.items():
+            estimates['quantities'].append(name)
+            estimates['num_samples'] = max(estimates['num_samples'],
+                                           blocking.num_samples)
+            estimates['mean'].append(blocking.mean)
+            estimates['variance'].append(blocking.variance)
+            estimates['standard_error'].append(
+                blocking.standard_error(self.min_blocks))
+            estimates['autocorrelation_time'].append(
+                blocking.autocorrelation_time(self.min_blocks))
+
+        if self._comm is not None and self._comm.num_ranks > 1:
+            estimates = json.loads(
+                _hoomd.mpi_bcast_str(json.dumps(estimates), self._exec_conf))
+        return estimates
+
+    @log(category='strings')
+    def quantities(self):
+        """list[str]: Names of the averaged quantities.
+
+        The name of each quantity is its namespace in the logger joined by
+        ``'.'``. The other loggable quantities list the estimates in this
+        order.
+        """
+        return self._estimates()['quantities']
+
+    @log
+    def num_samples(self):
+        """int: Number of samples of the quantities."""
+        return self._estimates()['num_samples']
+
+    @log(category='sequence')
+    def mean(self):
+        """numpy.ndarray: Mean of each quantity."""
+        return numpy.array(self._estimates()['mean'])
+
+    @log(category='sequence')
+    def variance(self):
+        """numpy.ndarray: Variance of each quantity."""
+        return numpy.array(self._estimates()['variance'])
+
+    @log(category='sequence')
+    def standard_error(self):
+        """numpy.ndarray: Standard error of the mean of each quantity.
+
+        The error accounts for correlations between the samples. It is the
+        error estimate at the plateau of the blocking levels that have at
+        least ``min_blocks`` blocks.
+        """
+        return numpy.array(self._estimates()['standard_error'])
+
+    @log(category='sequence')
+    def autocorrelation_time(self):
+        r"""numpy.ndarray: Integrated autocorrelation time of each quantity.
+
+        The time is given in units of the interval between samples and is
+        estimated from the ratio of the blocked and unblocked standard
+        errors: :math:`\tau = \frac{1}{2} (\sigma_\mathrm{blocked} /
+        \sigma_0)^2`. Uncorrelated samples have :math:`\tau = 1/2`.
+        """
+        return numpy.array(self._estimates()['autocorrelation_time'])
+
+    def blocking(self, quantity):
+        """Error estimates of each blocking level.
+
+        Args:
+            quantity (str): Name of the quantity (see `quantities`).
+
+        Returns:
+            tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: The number of
+            blocks, the estimated standard error of the mean, and the error of
+            that estimate at each level with at least two blocks.
+
+        Note:
+            In MPI simulations, `blocking` returns `None` on all ranks except
+            the root rank.
+        """
+        if self._comm is not None and self._comm.rank != 0:
+            return None
+        return self._blocking[quantity].levels()
+
+
+class BlockAverage(_InternalCustomWriter):
+    """Accumulate averages and error estimates of logged quantities.
+
+    Args:
+        trigger (hoomd.trigger.Trigger): Select the time steps to sample.
+        logger (hoomd.logging.Logger): The logger to sample. Only the 'scalar'
+            categories may be set.
+        min_blocks (int): Minimum number of blocks in the levels used to
+            estimate the standard error.
+
+    `BlockAverage` samples every scalar quantity in *logger* when *trigger*
+    activates and accumulates its mean, variance, and the blocking analysis of
+    H. Flyvbjerg and H. G. Petersen (doi: 10.1063/1.457480) which estimates
+    the standard error of the mean of correlated samples. The samples are not
+    stored: memory use grows with the logarithm of the number of samples.
+
+    The estimates are loggable, so a `hoomd.write.GSD` writer or a Python
+    script can record them instead of every sample::
+
+        logger = hoomd.logging.Logger(categories=['scalar'])
+        logger.add(thermo, quantities=['pressure', 'potential_energy'])
+        block_average = hoomd.write.BlockAverage(trigger=10, logger=logger)
+        sim.operations.writers.append(block_average)
+        sim.run(1000000)
+        print(block_average.quantities)
+        print(block_average.mean, block_average.standard_error)
+
+    Note:
+        In MPI simulations, the root rank accumulates the samples and
+        broadcasts the estimates to all ranks when they are accessed. Access
+        the estimates on all ranks.
+
+    Attributes:
+        trigger (hoomd.trigger.Trigger): Select the time steps to sample.
+        logger (hoomd.logging.Logger): The logger to sample.
+        min_blocks (int): Minimum number of blocks in the levels used to
+            estimate the standard error.
+    """
+    _internal_class = _BlockAverageInternal
+
+    def reset(self):
+        """Clear the accumulated averages."""
+        self._action.reset()
+
+    def blocking(self, quantity):
+        """Error estimates of each blocking level.
+
+        Args:
+            quantity (str): Name of the quantity (see ``quantities``).
+
+        Returns:
+            tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: The number of
+            blocks, the estimated standard error of the mean, and the error of
+            that estimate at each level with at least two blocks.
+
+        Note:
+            In MPI simulations, `blocking` returns `None` on all ranks except
+            the root rank.
+        """
+        return self._action.blocking(quantity)
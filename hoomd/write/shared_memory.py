@@ -0,0 +1,377 @@
+# Copyright (c) 2009-2021 The Regents of the University of Michigan
+# This file is part of the HOOMD-blue project, released under the BSD 3-Clause
+# License.
+
+"""Publish simulation frames in shared memory for live analysis."""
+
+from multiprocessing import resource_tracker, shared_memory
+import time
+
+import numpy as np
+
+from hoomd import _hoomd
+from hoomd.data.parameterdicts import ParameterDict
+from hoomd.data.typeconverter import OnlyFrom
+from hoomd.filter import ParticleFilter, All
+from hoomd.logging import Logger, LoggerCategories
+from hoomd.operation import Writer
+from hoomd.util import dict_flatten, array_to_strings
+
+# layout of the segment, see SharedMemoryFrame.h
+_MAGIC = b'HOOMDSM'
+_VERSION = 1
+_header_dtype = np.dtype([('magic', 'S8'), ('version', '<u4'),
+                          ('n_frames', '<u4'), ('N', '<u8'),
+                          ('frame_offset', '<u8'), ('frame_size', '<u8'),
+                          ('n_fields', '<u4'), ('n_log', '<u4'),
+                          ('n_written', '<u8')])
+_field_dtype = np.dtype([('name', 'S64'), ('dtype', 'S8'), ('width', '<u4'),
+                         ('item_size', '<u4'), ('offset', '<u8')])
+_frame_header_dtype = np.dtype([('sequence', '<u8'), ('timestep', '<u8'),
+                                ('box', '<f8', (6,))])
+_name_length = 64
+# time to wait before reading a frame again that the writer is overwriting
+_read_retry_delay = 1e-4
+_dynamic_fields = [
+    'position', 'image', 'velocity', 'orientation', 'angmom', 'typeid'
+]
+
+
+class SharedMemory(Writer):
+    """Publish frames in a shared memory ring buffer.
+
+    Args:
+        name (str): Name of the shared memory segment.
+        trigger (hoomd.trigger.Trigger): Select the timesteps to write.
+        filter (hoomd.filter.ParticleFilter): Select the particles to write.
+            Defaults to `hoomd.filter.All`.
+        dynamic (list[str]): Per-particle arrays to write. Defaults to
+            ``['position']``.
+        n_frames (int): Number of frames in the ring buffer.
+        log (hoomd.logging.Logger): Provide log quantities to write. Defaults
+            to `None`.
+        replace (bool): When `True`, replace an existing segment with the
+            same name. Defaults to `False`.
+
+    On each timestep where `SharedMemory` triggers, it copies the selected
+    per-particle arrays, the box, and the scalar log quantities into the next
+    frame of a ring buffer in the POSIX shared memory segment *name* (on Linux,
+    ``/dev/shm/name``). Analysis and visualization processes on the same node
+    open the segment with `SharedMemoryReader` and read the latest frame
+    without copying it. The writer never waits for the readers, and readers
+    can attach and detach at any time.
+
+    The valid per-particle arrays are ``'position'``, ``'image'``,
+    ``'velocity'``, ``'orientation'``, ``'angmom'``, and ``'typeid'``. The
+    arrays are written in single precision, ordered by the tags of the
+    particles selected by *filter*.
+
+    The segment is created when `SharedMemory` first triggers and removed when
+    it is detached from the simulation. `SharedMemory` raises an error when a
+    segment with the same name already exists, since another simulation may
+    still publish to it. Set *replace* to `True` to replace segments left
+    behind by simulations that did not finish. In MPI simulations, the frames
+    are gathered and written on the root rank.
+
+    Note:
+        The number of particles and the names of the log quantities are fixed
+        by the first frame. `SharedMemory` raises an error when the number of
+        selected particles changes. Log quantities that are removed from *log*
+        are written as NaN and log quantities that are added are not written.
+        The names of the log quantities are truncated to 63 characters.
+
+    Examples::
+
+        shm = hoomd.write.SharedMemory(name='hoomd-live',
+                                       trigger=hoomd.trigger.Periodic(100))
+
+        logger = hoomd.logging.Logger(categories=['scalar'])
+        logger.add(thermo, quantities=['kinetic_temperature'])
+        shm = hoomd.write.SharedMemory(name='hoomd-live',
+                                       trigger=hoomd.trigger.Periodic(100),
+                                       dynamic=['position', 'velocity'],
+                                       log=logger)
+
+    Attributes:
+        name (str): Name of the shared memory segment.
+        trigger (hoomd.trigger.Trigger): Select the timesteps to write.
+        filter (hoomd.filter.ParticleFilter): Select the particles to write.
+        dynamic (list[str]): Per-particle arrays to write.
+        n_frames (int): Number of frames in the ring buffer.
+        replace (bool): Replace an existing segment with the same name.
+    """
+
+    def __init__(self,
+                 name,
+                 trigger,
+                 filter=All(),
+                 dynamic=None,
+                 n_frames=4,
+                 log=None,
+                 replace=False):
+
+        super().__init__(trigger)
+
+        dynamic_validation = OnlyFrom(_dynamic_fields,
+                                      preprocess=array_to_strings)
+
+        dynamic = ['position'] if dynamic is None else dynamic
+        self._param_dict.update(
+            ParameterDict(name=str(name),
+                          filter=ParticleFilter,
+                          dynamic=[dynamic_validation],
+                          n_frames=int(n_frames),
+                          replace=bool(replace),
+                          _defaults=dict(filter=filter, dynamic=dynamic)))
+
+        self._log = None if log is None else _SharedMemoryLogWriter(log)
+
+    def _attach(self):
+        self._cpp_obj = _hoomd.SharedMemoryWriter(
+            self._simulation.state._cpp_sys_def, self.name,
+            self._simulation.state._get_group(self.filter), self.dynamic,
+            self.n_frames, self.replace)
+        self._cpp_obj.log_writer = self.log
+        super()._attach()
+
+    def _update_param_dict(self):
+        # the C++ writer does not store the filter
+        if self._attached:
+            for key in self._param_dict:
+                if key in ('trigger', 'filter'):
+                    continue
+                self._param_dict[key] = getattr(self._cpp_obj, key)
+
+    @property
+    def log(self):
+        """hoomd.logging.Logger: Provide log quantities to write.
+
+        May be `None`.
+        """
+        return self._log
+
+    @log.setter
+    def log(self, log):
+        if log is not None:
+            if not isinstance(log, Logger):
+                raise ValueError(
+                    "SharedMemory.log can only be set with a Logger.")
+            log = _SharedMemoryLogWriter(log)
+        if self._attached:
+            self._cpp_obj.log_writer = log
+        self._log = log
+
+
+class _SharedMemoryLogWriter:
+    """Provide the scalar quantities of a `hoomd.logging.Logger`.
+
+    Quantities of other categories cannot be stored in a fixed size frame and
+    are skipped.
+    """
+
+    def __init__(self, logger):
+        self.logger = logger
+
+    def log(self):
+        """Get the flattened dictionary of the scalar log quantities."""
+        log = dict()
+        for key, (value, category) in dict_flatten(self.logger.log()).items():
+            if (LoggerCategories[category] is LoggerCategories.scalar
+                    and value is not None):
+                log['/'.join(key)] = float(value)
+        return log
+
+
+def _open_shared_memory(name):
+    """Attach to an existing shared memory segment.
+
+    The segment belongs to the writer, so the resource tracker of this process
+    must not remove it when the process exits.
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # track was added in Python 3.13
+        shm = shared_memory.SharedMemory(name=name)
+        resource_tracker.unregister(shm._name, 'shared_memory')
+        return shm
+
+
+class SharedMemoryReader:
+    """Read frames published by `SharedMemory`.
+
+    Args:
+        name (str): Name of the shared memory segment.
+
+    `SharedMemoryReader` maps the segment created by a `SharedMemory` writer,
+    typically in another process on the same node. `read` returns the latest
+    complete frame as read-only NumPy arrays that point directly into the
+    shared memory. The writer keeps writing while the frame is in use, and
+    overwrites it once it has written *n_frames* more frames. Check
+    `SharedMemoryFrame.valid` after using the arrays (or copy them first) to
+    detect that.
+
+    `SharedMemoryReader` raises `FileNotFoundError` when the segment does not
+    exist and `RuntimeError` when the writer has not finished creating it.
+    `read` raises `RuntimeError` when the latest frame stays incomplete, for
+    example when the writer stopped while writing it.
+
+    Example::
+
+        with hoomd.write.SharedMemoryReader('hoomd-live') as reader:
+            frame = reader.read()
+            if frame is not None:
+                com = frame.particles['position'].mean(axis=0)
+                if not frame.valid:
+                    # the writer overwrote the frame while it was in use
+                    ...
+                del frame
+
+    Attributes:
+        name (str): Name of the shared memory segment.
+        N (int): Number of particles in each frame.
+        n_frames (int): Number of frames in the ring buffer.
+        dynamic (list[str]): Per-particle arrays in each frame.
+        log_names (list[str]): Names of the log quantities in each frame.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self._shm = _open_shared_memory(name)
+        buf = self._shm.buf
+
+        self._header = np.ndarray((), dtype=_header_dtype, buffer=buf)
+        magic = self._header['magic']
+        version = int(self._header['version'])
+        if magic != _MAGIC or version != _VERSION:
+            self._header = None
+            del buf
+            self._shm.close()
+            if magic != _MAGIC:
+                raise RuntimeError(
+                    "Shared memory {} is not ready to be read.".format(name))
+            raise RuntimeError(
+                "Unsupported shared memory version {}.".format(version))
+
+        self.N = int(self._header['N'])
+        self.n_frames = int(self._header['n_frames'])
+        n_fields = int(self._header['n_fields'])
+        n_log = int(self._header['n_log'])
+
+        offset = _header_dtype.itemsize
+        fields = np.ndarray((n_fields,),
+                            dtype=_field_dtype,
+                            buffer=buf,
+                            offset=offset)
+        self._fields = [(f['name'].decode(), np.dtype(f['dtype'].decode()),
+                         int(f['width']), int(f['offset'])) for f in fields]
+        self.dynamic = [f[0] for f in self._fields]
+        del fields
+
+        offset += n_fields * _field_dtype.itemsize
+        names = np.ndarray((n_log,),
+                           dtype='S{}'.format(_name_length),
+                           buffer=buf,
+                           offset=offset)
+        self.log_names = [n.decode() for n in names]
+        del names
+
+        self._frame_offset = int(self._header['frame_offset'])
+        self._frame_size = int(self._header['frame_size'])
+
+    @property
+    def n_written(self):
+        """int: Number of frames written so far."""
+        return int(self._header['n_written'])
+
+    def read(self, max_attempts=1000):
+        """Read the latest complete frame.
+
+        Args:
+            max_attempts (int): Number of times to try reading the latest
+                frame while the writer overwrites it.
+
+        Returns:
+            SharedMemoryFrame: The latest frame, or `None` when no frame has
+            been written yet.
+        """
+        for _ in range(max_attempts):
+            n_written = self.n_written
+            if n_written == 0:
+                return None
+            frame = SharedMemoryFrame(
+                self, self._frame_offset
+                + ((n_written - 1) % self.n_frames) * self._frame_size)
+            if frame.valid:
+                return frame
+            del frame
+            time.sleep(_read_retry_delay)
+
+        raise RuntimeError(
+            "The latest frame in shared memory {} is incomplete after {} "
+            "attempts. The writer may have stopped while writing it.".format(
+                self.name, max_attempts))
+
+    def close(self):
+        """Detach from the shared memory segment.
+
+        All frames read from the segment must be deleted before.
+        """
+        if self._header is not None:
+            self._header = None
+            self._shm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class SharedMemoryFrame:
+    """Frame read from the shared memory by `SharedMemoryReader.read`.
+
+    Attributes:
+        timestep (int): Time step of the frame.
+        box (list[float]): Box of the frame ``[Lx, Ly, Lz, xy, xz, yz]``.
+        log (dict[str, float]): Log quantities of the frame.
+        particles (dict[str, numpy.ndarray]): Per-particle arrays of the frame.
+            The arrays point into the shared memory and are read-only.
+    """
+
+    def __init__(self, reader, offset):
+        buf = reader._shm.buf
+        self._header = np.ndarray((),
+                                  dtype=_frame_header_dtype,
+                                  buffer=buf,
+                                  offset=offset)
+        self._sequence = int(self._header['sequence'])
+
+        self.timestep = int(self._header['timestep'])
+        self.box = [float(x) for x in self._header['box']]
+        log_values = np.ndarray((len(reader.log_names),),
+                                dtype='<f8',
+                                buffer=buf,
+                                offset=offset + _frame_header_dtype.itemsize)
+        self.log = {
+            name: float(value)
+            for name, value in zip(reader.log_names, log_values)
+        }
+        del log_values
+
+        self.particles = dict()
+        for name, dtype, width, field_offset in reader._fields:
+            shape = (reader.N, width) if width > 1 else (reader.N,)
+            array = np.ndarray(shape,
+                               dtype=dtype,
+                               buffer=buf,
+                               offset=offset + field_offset)
+            array.flags.writeable = False
+            self.particles[name] = array
+
+    @property
+    def valid(self):
+        """bool: True when the frame was complete and has not been \
+        overwritten since it was read."""
+        return (self._sequence % 2 == 0
+                and int(self._header['sequence']) == self._sequence)